@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Validation of every example resource without and with the code checks of
+``fhir.resources.utils.bindings`` (``enum_values`` of every model, plus a
+required binding of ``Observation.category`` to a preloaded expansion), in
+microseconds per resource; and the cost of a single code lookup. Usage::
+
+    python benchmarks/bench_bindings.py [--release R5] [--examples PATH]
+        [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+
+from corpus import iter_example_resources
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.bindings import (
+    CodeIndex,
+    CodeValidator,
+    disable_code_validation,
+    enable_code_validation,
+)
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+CATEGORY = "http://terminology.hl7.org/CodeSystem/observation-category"
+CATEGORY_VS = "http://hl7.org/fhir/ValueSet/observation-category"
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--examples", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    examples = [
+        (get_fhir_model_class(resource_type, args.release), data)
+        for _, resource_type, data in iter_example_resources(
+            args.release, args.examples
+        )
+    ]
+    repeat = args.repeat * max(1, 500 // len(examples))
+    sys.stdout.write(f"{len(examples)} resources\n")
+
+    codes = CodeIndex()
+    codes.add(
+        CATEGORY_VS,
+        [
+            (CATEGORY, code)
+            for code in (
+                "social-history",
+                "vital-signs",
+                "imaging",
+                "laboratory",
+                "procedure",
+                "survey",
+                "exam",
+                "therapy",
+                "activity",
+            )
+        ],
+    )
+    validator = CodeValidator(
+        codes, {"Observation.category": CATEGORY_VS}, fhir_release=args.release
+    )
+
+    for label, enabled in (("no code checks", None), ("code checks", validator)):
+        if enabled is None:
+            disable_code_validation()
+        else:
+            enable_code_validation(enabled)
+        failed = 0
+        for klass, data in examples:
+            try:
+                klass.model_validate_json(data)
+            except ValueError:
+                failed += 1
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for klass, data in examples:
+                try:
+                    klass.model_validate_json(data)
+                except ValueError:
+                    pass
+        elapsed = time.perf_counter() - started
+        per_resource = elapsed / (repeat * len(examples)) * 1e6
+        sys.stdout.write(
+            f"{label:<20}{per_resource:>10.1f} us/resource ({failed} rejected)\n"
+        )
+    disable_code_validation()
+
+    loops = 1_000_000
+    started = time.perf_counter()
+    for _ in range(loops):
+        codes.contains(CATEGORY_VS, "vital-signs", CATEGORY)
+    elapsed = time.perf_counter() - started
+    sys.stdout.write(f"{'code lookup':<20}{elapsed / loops * 1e9:>10.1f} ns\n")
+
+
+if __name__ == "__main__":
+    main()
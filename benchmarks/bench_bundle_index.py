@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Reference resolution in a transaction ``Bundle``: a linear scan of
+``Bundle.entry`` per reference against ``BundleIndex``. Every other entry is
+a ``Patient`` (``urn:uuid`` fullUrl), every other an ``Observation``
+referring to it and to an ``Organization`` by relative URL. Usage::
+
+    python benchmarks/bench_bundle_index.py [--entries 50000] [--scan 2000]
+"""
+
+import argparse
+import sys
+import time
+import uuid
+
+import corpus  # noqa: F401
+
+from fhir.resources.bundle import Bundle
+from fhir.resources.utils.bundle import BundleIndex
+from fhir.resources.utils.construct import construct_trusted
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+BASE = "http://example.org/fhir/"
+
+
+def make_transaction(entries):
+    """ """
+    entry = [
+        {
+            "fullUrl": f"{BASE}Organization/org",
+            "resource": {"resourceType": "Organization", "id": "org"},
+            "request": {"method": "PUT", "url": "Organization/org"},
+        }
+    ]
+    for _ in range(entries // 2):
+        patient_url = f"urn:uuid:{uuid.uuid4()}"
+        entry.append(
+            {
+                "fullUrl": patient_url,
+                "resource": {
+                    "resourceType": "Patient",
+                    "managingOrganization": {"reference": "Organization/org"},
+                },
+                "request": {"method": "POST", "url": "Patient"},
+            }
+        )
+        entry.append(
+            {
+                "fullUrl": f"urn:uuid:{uuid.uuid4()}",
+                "resource": {
+                    "resourceType": "Observation",
+                    "status": "final",
+                    "code": {"text": "x"},
+                    "subject": {"reference": patient_url},
+                    "performer": [{"reference": "Organization/org"}],
+                },
+                "request": {"method": "POST", "url": "Observation"},
+            }
+        )
+    return construct_trusted(
+        Bundle, {"resourceType": "Bundle", "type": "transaction", "entry": entry}
+    )
+
+
+def iter_references(bundle):
+    """``(reference, entry)`` of the references of the generated entries."""
+    for entry in bundle.entry:
+        resource = entry.resource
+        if resource.get_resource_type() == "Patient":
+            yield resource.managingOrganization.reference, entry
+        elif resource.get_resource_type() == "Observation":
+            yield resource.subject.reference, entry
+            yield resource.performer[0].reference, entry
+
+
+def scan_resolve(bundle, reference):
+    """Linear scan, by fullUrl or by ``Type/id``."""
+    for entry in bundle.entry:
+        resource = entry.resource
+        if entry.fullUrl == reference:
+            return resource
+        if (
+            resource.id is not None
+            and f"{resource.get_resource_type()}/{resource.id}" == reference
+        ):
+            return resource
+    return None
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=50000)
+    parser.add_argument("--scan", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    for entries in (args.scan, args.entries):
+        bundle = make_transaction(entries)
+        references = list(iter_references(bundle))
+
+        started = time.perf_counter()
+        index = BundleIndex(bundle)
+        build = time.perf_counter() - started
+        started = time.perf_counter()
+        resolved = [index.resolve(ref, entry) for ref, entry in references]
+        lookups = time.perf_counter() - started
+        if any(resource is None for resource in resolved):
+            sys.stderr.write("unresolved reference\n")
+            sys.exit(1)
+        sys.stdout.write(
+            f"{len(bundle.entry)} entries, {len(references)} references\n"
+            f"{'BundleIndex build':<24}{build * 1e3:>12.1f} ms\n"
+            f"{'BundleIndex resolve':<24}{lookups * 1e3:>12.1f} ms\n"
+        )
+        if entries > args.scan:
+            continue
+        started = time.perf_counter()
+        scanned = [scan_resolve(bundle, ref) for ref, _ in references]
+        scan = time.perf_counter() - started
+        if scanned != resolved:
+            sys.stderr.write("BundleIndex and the scan disagree\n")
+            sys.exit(1)
+        sys.stdout.write(f"{'linear scan':<24}{scan * 1e3:>12.1f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
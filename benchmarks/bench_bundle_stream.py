@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Peak memory and time of ``BundleReader`` against ``Bundle.model_validate_json``
+for growing searchset Bundles. Usage::
+
+    python benchmarks/bench_bundle_stream.py [--sizes 1000 5000 20000]
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import sys
+import tempfile
+import time
+import tracemalloc
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+ROOT_PATH = pathlib.Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, str(ROOT_PATH))
+
+from fhir.resources.bundle import Bundle  # noqa: E402
+from fhir.resources.utils.bundle import BundleReader  # noqa: E402
+
+OBSERVATION = json.loads(
+    (ROOT_PATH / "tests" / "static" / "Observation.json").read_text()
+)
+
+
+def write_bundle(path, count):
+    """Write the Bundle entry by entry, so the benchmark itself stays small."""
+    with open(path, "w") as fp:
+        fp.write('{"resourceType": "Bundle", "type": "searchset", ')
+        fp.write(f'"total": {count}, "entry": [')
+        for idx in range(count):
+            OBSERVATION["id"] = f"obs-{idx}"
+            if idx:
+                fp.write(",")
+            fp.write(
+                json.dumps({"fullUrl": f"urn:uuid:{idx}", "resource": OBSERVATION})
+            )
+        fp.write("]}")
+
+
+def measure(func):
+    """ """
+    tracemalloc.start()
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000])
+    args = parser.parse_args(argv)
+
+    sys.stdout.write(
+        f"{'entries':>8}{'MiB':>8}{'reader s':>10}{'reader peak MiB':>17}"
+        f"{'full s':>9}{'full peak MiB':>15}\n"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.sizes:
+            path = pathlib.Path(tmp) / f"bundle-{count}.json"
+            write_bundle(path, count)
+
+            def stream():
+                with BundleReader(path) as reader:
+                    for _entry in reader:
+                        pass
+
+            def full():
+                Bundle.model_validate_json(path.read_bytes())
+
+            stream_time, stream_peak = measure(stream)
+            full_time, full_peak = measure(full)
+            sys.stdout.write(
+                f"{count:>8}{path.stat().st_size / 2**20:>8.1f}"
+                f"{stream_time:>10.2f}{stream_peak / 2**20:>17.2f}"
+                f"{full_time:>9.2f}{full_peak / 2**20:>15.2f}\n"
+            )
+
+
+if __name__ == "__main__":
+    main()
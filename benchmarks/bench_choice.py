@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Choice (``value[x]``) check and lookup on an extension heavy payload: a
+US Core like ``Patient`` (race, ethnicity, birth sex ... as nested
+extensions), the one-of-many check by a scan of every variant against the
+``choice_index`` single pass, then ``get_choice_value`` against a scan.
+Usage::
+
+    python benchmarks/bench_choice.py [--patients 200]
+"""
+
+import argparse
+import sys
+import time
+
+from fhir.resources.fhirabstractmodel import FHIRAbstractModel, get_choice_value
+from fhir.resources.patient import Patient
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+US_CORE = "http://hl7.org/fhir/us/core/StructureDefinition"
+OMB = "urn:oid:2.16.840.1.113883.6.238"
+
+
+def _omb_extension(name, code, display):
+    """Race and ethnicity are complex extensions, three levels deep."""
+    return {
+        "url": f"{US_CORE}/us-core-{name}",
+        "extension": [
+            {
+                "url": "ombCategory",
+                "valueCoding": {"system": OMB, "code": code, "display": display},
+            },
+            {
+                "url": "detailed",
+                "valueCoding": {"system": OMB, "code": code, "display": display},
+            },
+            {"url": "text", "valueString": display},
+        ],
+    }
+
+
+def make_patient(index):
+    """ """
+    tracking = {"url": "http://example.org/tracking", "valueId": f"t{index}"}
+    return {
+        "resourceType": "Patient",
+        "id": f"p{index}",
+        "extension": [
+            _omb_extension("race", "2106-3", "White"),
+            _omb_extension("ethnicity", "2186-5", "Not Hispanic or Latino"),
+            {"url": f"{US_CORE}/us-core-birthsex", "valueCode": "F"},
+            {
+                "url": f"{US_CORE}/us-core-genderIdentity",
+                "valueCodeableConcept": {"text": "Identifies as female"},
+            },
+            {"url": f"{US_CORE}/us-core-tribal-affiliation", "valueBoolean": False},
+        ],
+        "name": [
+            {
+                "family": "Doe",
+                "_family": {"extension": [tracking]},
+                "given": ["Jane", "Q"],
+                "_given": [{"extension": [tracking]}, {"extension": [tracking]}],
+            }
+        ],
+        "gender": "female",
+        "_gender": {"extension": [tracking]},
+        "birthDate": "1970-01-01",
+        "_birthDate": {
+            "extension": [
+                {
+                    "url": "http://hl7.org/fhir/StructureDefinition/patient-birthTime",
+                    "valueDateTime": "1970-01-01T10:00:00Z",
+                }
+            ]
+        },
+        "address": [
+            {
+                "line": ["1 Main St"],
+                "_line": [{"extension": [tracking]}],
+                "city": "Boston",
+                "state": "MA",
+                "extension": [
+                    {
+                        "url": "http://hl7.org/fhir/StructureDefinition/geolocation",
+                        "extension": [
+                            {"url": "latitude", "valueDecimal": 42.36},
+                            {"url": "longitude", "valueDecimal": -71.06},
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def scan_one_of_many(self):
+    """The one-of-many check before ``choice_index``, every variant of every
+    group is looked at."""
+    values = self.__dict__
+    for fields, required in self.__class__.get_fhir_metadata().one_of_many.values():
+        found = [field for field in fields if values.get(field) is not None]
+        if len(found) > 1:
+            raise ValueError("got multiple!")
+        if required is True and not found:
+            raise ValueError("Expect any of field value.")
+
+
+def scan_choice_value(obj, prefix):
+    """ """
+    fields, _ = obj.__class__.get_fhir_metadata().one_of_many[prefix]
+    for field in fields:
+        value = getattr(obj, field)
+        if value is not None:
+            return value
+    return None
+
+
+def iter_extensions(patient):
+    """Every extension of the patient, nested ones included."""
+    stack = list(patient.extension)
+    for name in patient.name:
+        stack.extend(name.family__ext.extension)
+    stack.extend(patient.birthDate__ext.extension)
+    for address in patient.address:
+        stack.extend(address.extension)
+    while stack:
+        extension = stack.pop()
+        yield extension
+        stack.extend(extension.extension or ())
+
+
+def timed(func, repeat):
+    """Best of ``repeat``, in seconds."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--patients", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    payloads = [make_patient(index) for index in range(args.patients)]
+
+    def validate_all():
+        for obj in payloads:
+            Patient.model_validate(obj)
+
+    # warm up the per class tables
+    validate_all()
+    indexed_validator = FHIRAbstractModel._validate_one_of_many
+    FHIRAbstractModel._validate_one_of_many = scan_one_of_many  # type: ignore
+    try:
+        scan = timed(validate_all, args.repeat)
+    finally:
+        FHIRAbstractModel._validate_one_of_many = indexed_validator  # type: ignore
+    indexed = timed(validate_all, args.repeat)
+    sys.stdout.write(f"{args.patients} patients, model_validate\n")
+    sys.stdout.write(f"{'scan of every variant':<28}{scan * 1e3:>10.1f} ms\n")
+    sys.stdout.write(f"{'choice_index':<28}{indexed * 1e3:>10.1f} ms\n")
+
+    extensions = [
+        extension
+        for obj in payloads
+        for extension in iter_extensions(Patient.model_validate(obj))
+    ]
+    expected = [scan_choice_value(e, "value") for e in extensions]
+    if [get_choice_value(e, "value") for e in extensions] != expected:
+        sys.stderr.write("get_choice_value and the scan disagree\n")
+        sys.exit(1)
+
+    sys.stdout.write(f"{len(extensions)} extensions, value[x] lookup\n")
+    for label, func in (
+        ("getattr scan", scan_choice_value),
+        ("get_choice_value", get_choice_value),
+    ):
+        elapsed = timed(lambda: [func(e, "value") for e in extensions], args.repeat)
+        sys.stdout.write(f"{label:<28}{elapsed * 1e3:>10.1f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""$translate of a batch of lab codings with a generated ``ConceptMap``: a
+walk over the map's groups and elements per coding, against the compiled
+``ConceptMapTranslator`` (``translate`` per coding and ``translate_many``),
+in microseconds per coding. Usage::
+
+    python benchmarks/bench_conceptmap.py [--release R5] [--elements 20000]
+        [--batch 200000]
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.conceptmap import ConceptMapTranslator
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+LAB = "http://example.org/fhir/CodeSystem/lab"
+LOINC = "http://loinc.org"
+
+
+def make_concept_map(release, elements):
+    """ """
+    relationship = "relationship" if release == "R5" else "equivalence"
+    return get_fhir_model_class("ConceptMap", release).model_validate(
+        {
+            "resourceType": "ConceptMap",
+            "url": "http://example.org/fhir/ConceptMap/lab-to-loinc",
+            "status": "active",
+            "group": [
+                {
+                    "source": LAB,
+                    "target": LOINC,
+                    "element": [
+                        {
+                            "code": f"L{number}",
+                            "target": [
+                                {
+                                    "code": f"{number}-{number % 10}",
+                                    relationship: "equivalent",
+                                }
+                            ],
+                        }
+                        for number in range(elements)
+                    ],
+                    "unmapped": {"mode": "fixed", "code": "unknown"},
+                }
+            ],
+        }
+    )
+
+
+def naive_translate(concept_map, system, code):
+    """ """
+    out = []
+    for group in concept_map.group:
+        if group.source != system:
+            continue
+        for element in group.element:
+            if element.code == code:
+                out.extend(target.code for target in element.target)
+    return out
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--elements", type=int, default=20000)
+    parser.add_argument("--batch", type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    concept_map = make_concept_map(args.release, args.elements)
+    coding = get_fhir_model_class("Coding", args.release)
+    rng = random.Random(0)
+    # a few thousand distinct codes, most of them frequent, a few unmapped
+    distinct = [f"L{rng.randrange(int(args.elements * 1.05))}" for _ in range(5000)]
+    batch = [
+        coding.model_construct(
+            system=LAB, code=rng.choice(distinct[: rng.choice((50, 5000))])
+        )
+        for _ in range(args.batch)
+    ]
+    sys.stdout.write(f"{args.elements} elements, {len(batch)} codings\n")
+
+    started = time.perf_counter()
+    translator = ConceptMapTranslator([concept_map])
+    sys.stdout.write(
+        f"{'compile':<24}{(time.perf_counter() - started) * 1e3:>10.1f} ms (once)\n"
+    )
+
+    sample = batch[:200]
+    started = time.perf_counter()
+    for item in sample:
+        naive_translate(concept_map, item.system, item.code)
+    elapsed = (time.perf_counter() - started) / len(sample)
+    sys.stdout.write(f"{'naive walk':<24}{elapsed * 1e6:>10.1f} us/coding\n")
+
+    started = time.perf_counter()
+    for item in batch:
+        translator.translate(item.code, item.system)
+    elapsed = (time.perf_counter() - started) / len(batch)
+    sys.stdout.write(f"{'translate':<24}{elapsed * 1e6:>10.2f} us/coding\n")
+
+    started = time.perf_counter()
+    translator.translate_many(batch)
+    elapsed = (time.perf_counter() - started) / len(batch)
+    sys.stdout.write(f"{'translate_many':<24}{elapsed * 1e6:>10.2f} us/coding\n")
+
+
+if __name__ == "__main__":
+    main()
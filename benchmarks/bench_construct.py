@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""``model_validate`` against ``construct_trusted`` over the example corpus
+(plus a synthetic ``ExplanationOfBenefit`` of the release), the JSON output
+of both is checked to be identical. Usage::
+
+    python benchmarks/bench_construct.py [--release R5] [--examples PATH]
+        [--repeat 5]
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from bench_lazy import make_eob
+from corpus import iter_example_resources
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.construct import construct_trusted
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+
+def release_eob(release, items):
+    """``make_eob`` in the shape of the ``ExplanationOfBenefit`` of
+    ``release``."""
+    obj = make_eob(items)
+    if release == "R5":
+        return obj
+    obj["insurer"] = {"reference": "Organization/1"}
+    obj["provider"] = {"reference": "Practitioner/1"}
+    if release != "STU3":
+        return obj
+    # ``service``, ``Money`` is a ``Quantity``, one ``insurance``, no ``use``
+    del obj["use"]
+    obj["outcome"] = {"coding": [{"code": "complete"}]}
+    obj["insurance"] = {"coverage": {"reference": "Coverage/9"}}
+    money = {"value": 125.5, "system": "urn:iso:std:iso:4217", "code": "USD"}
+    stack = [(line, False) for line in obj["item"]]
+    while stack:
+        line, nested = stack.pop()
+        line["service"] = line.pop("productOrService")
+        if nested:
+            line["type"] = {"coding": [{"code": "service"}]}
+        line["unitPrice"] = line["net"] = money
+        line["adjudication"] = [
+            dict(adjudication, amount=money) for adjudication in line["adjudication"]
+        ]
+        stack.extend((sub, True) for sub in line.get("detail", ()))
+        stack.extend((sub, True) for sub in line.get("subDetail", ()))
+    return obj
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--examples", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    samples = [
+        (get_fhir_model_class(resource_type, args.release), json.loads(data))
+        for _, resource_type, data in iter_example_resources(
+            args.release, args.examples
+        )
+    ]
+    samples.append(
+        (
+            get_fhir_model_class("ExplanationOfBenefit", args.release),
+            release_eob(args.release, 20),
+        )
+    )
+
+    mismatches = 0
+    for klass, obj in samples:
+        validated = klass.model_validate(obj).model_dump_json()
+        if construct_trusted(klass, obj).model_dump_json() != validated:
+            mismatches += 1
+            sys.stdout.write(f"output differs: {klass.__name__} {obj.get('id')}\n")
+    sys.stdout.write(f"{len(samples)} resources, {mismatches} mismatches\n")
+
+    total = len(samples) * args.repeat
+    for label, func in (
+        ("model_validate", lambda klass, obj: klass.model_validate(obj)),
+        ("construct_trusted", construct_trusted),
+    ):
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            for klass, obj in samples:
+                func(klass, obj)
+        elapsed = time.perf_counter() - started
+        sys.stdout.write(f"{label:<20}{total / elapsed:>12.0f} resources/sec\n")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Parse (``model_validate_json``), serialize (``model_dump_json``) and
+round-trip (both) throughput, and peak traced memory of parsing, per resource
+type of the official example corpus, for R5, R4B and STU3.
+
+A run can be saved as baseline and later runs compared against it: any
+resource type slower (or using more memory) than the baseline by more than
+``--tolerance``, missing from the run or with fewer accepted examples is
+reported and the exit status is 1. Skipped examples are listed. Usage::
+
+    python benchmarks/bench_corpus.py [--release R5 --release R4B]
+        [--examples R5=/path/to/5.0.0-examples-json.zip] [--repeat 5]
+        [--save-baseline baseline.json | --baseline baseline.json]
+        [--tolerance 0.25]
+
+Without ``--examples`` the archive downloaded by the test fixtures into
+``.cache`` is used, see ``corpus.py``.
+"""
+
+import argparse
+import collections
+import json
+import sys
+import time
+import tracemalloc
+
+from corpus import find_corpus, iter_example_resources
+
+from fhir.resources.utils import FHIR_RELEASES, get_fhir_model_class
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+# microseconds per resource, except ``peak_kib``; lower is better for all
+METRICS = ("parse_us", "dump_us", "roundtrip_us", "peak_kib")
+# seconds, the shortest a single timed run may be
+MIN_TIME = 0.05
+
+
+def best_per_item(func, items, repeat, min_time=MIN_TIME):
+    """Best of ``repeat`` runs over ``items``, in microseconds per item.
+
+    Every run goes over ``items`` as many times as needed to last at least
+    ``min_time`` seconds, a single small example is too quick to time.
+    """
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            for item in items:
+                func(item)
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            for item in items:
+                func(item)
+        best = min(best, time.perf_counter() - started)
+    return best / (loops * len(items)) * 1e6
+
+
+def peak_memory(func, items):
+    """Peak traced memory of ``func`` over ``items``, in KiB."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        # the results are kept, as an application would do
+        results = [func(item) for item in items]  # noqa: F841
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def measure(release, examples, repeat, resource_types=None, skipped=None):
+    """``{resource type: {metric: value}}`` for one release; the examples the
+    models do not accept are added to ``skipped``."""
+    by_type = collections.defaultdict(list)
+    for _, resource_type, data in iter_example_resources(release, examples, skipped):
+        if resource_types and resource_type not in resource_types:
+            continue
+        by_type[resource_type].append(data)
+
+    results = dict()
+    for resource_type, payloads in sorted(by_type.items()):
+        klass = get_fhir_model_class(resource_type, release)
+        instances = [klass.model_validate_json(data) for data in payloads]
+        results[resource_type] = {
+            "count": len(payloads),
+            "parse_us": best_per_item(klass.model_validate_json, payloads, repeat),
+            "dump_us": best_per_item(
+                lambda obj: obj.model_dump_json(), instances, repeat
+            ),
+            "roundtrip_us": best_per_item(
+                lambda data: klass.model_validate_json(
+                    klass.model_validate_json(data).model_dump_json()
+                ),
+                payloads,
+                repeat,
+            ),
+            "peak_kib": peak_memory(klass.model_validate_json, payloads),
+        }
+    return results
+
+
+def find_regressions(results, baseline, tolerance):
+    """``(release, resource type, metric, baseline value, value)`` of every
+    metric worse than the baseline by more than ``tolerance`` (a ratio).
+
+    A resource type of the baseline that is missing from the results (of a
+    measured release) is a regression of ``count`` to ``0``, as are fewer
+    examples of a type than in the baseline. Types new in the results are
+    not compared."""
+    regressions = list()
+    for release, types in results.items():
+        for resource_type, expected in sorted(baseline.get(release, {}).items()):
+            if resource_type not in types:
+                regressions.append(
+                    (release, resource_type, "count", expected.get("count", 0), 0)
+                )
+        for resource_type, metrics in types.items():
+            expected = baseline.get(release, {}).get(resource_type)
+            if expected is None:
+                continue
+            if metrics["count"] < expected.get("count", 0):
+                regressions.append(
+                    (
+                        release,
+                        resource_type,
+                        "count",
+                        expected["count"],
+                        metrics["count"],
+                    )
+                )
+            for metric in METRICS:
+                if metric not in expected:
+                    continue
+                if metrics[metric] > expected[metric] * (1 + tolerance):
+                    regressions.append(
+                        (
+                            release,
+                            resource_type,
+                            metric,
+                            expected[metric],
+                            metrics[metric],
+                        )
+                    )
+    return regressions
+
+
+def parse_examples(values):
+    """``["R5=path", ...]`` into ``{"R5": "path"}``."""
+    examples = dict()
+    for value in values:
+        release, sep, path = value.partition("=")
+        if not sep or release not in FHIR_RELEASES:
+            raise argparse.ArgumentTypeError(
+                f"--examples expects RELEASE=PATH, RELEASE one of "
+                f"{list(FHIR_RELEASES)}, got ``{value}``"
+            )
+        examples[release] = path
+    return examples
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--release", action="append", choices=list(FHIR_RELEASES), default=None
+    )
+    parser.add_argument("--examples", action="append", default=[])
+    parser.add_argument("--type", dest="resource_types", action="append")
+    parser.add_argument("--repeat", type=int, default=5)
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--save-baseline", default=None)
+    group.add_argument("--baseline", default=None)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+    try:
+        examples = parse_examples(args.examples)
+    except argparse.ArgumentTypeError as exc:
+        parser.error(str(exc))
+
+    results = dict()
+    for release in args.release or list(FHIR_RELEASES):
+        if find_corpus(release, examples.get(release)) is None:
+            if release in examples:
+                parser.error(f"No example corpus for {release} at {examples[release]}")
+            sys.stdout.write(
+                f"{release}: example corpus missing, tests/static examples only\n"
+            )
+        skipped = []
+        results[release] = measure(
+            release, examples.get(release), args.repeat, args.resource_types, skipped
+        )
+        if skipped:
+            sys.stdout.write(
+                f"{release}: {len(skipped)} examples skipped, not accepted by "
+                "the models\n"
+            )
+            for name, error in skipped:
+                sys.stdout.write(f"{'':<6}{name}: {error}\n")
+        sys.stdout.write(
+            f"{release:<6}{'resource type':<32}{'n':>5}{'parse/s':>10}"
+            f"{'dump/s':>10}{'round/s':>10}{'peak KiB':>10}\n"
+        )
+        for resource_type, metrics in results[release].items():
+            sys.stdout.write(
+                f"{'':<6}{resource_type:<32}{metrics['count']:>5}"
+                f"{1e6 / metrics['parse_us']:>10.0f}"
+                f"{1e6 / metrics['dump_us']:>10.0f}"
+                f"{1e6 / metrics['roundtrip_us']:>10.0f}"
+                f"{metrics['peak_kib']:>10.0f}\n"
+            )
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as fp:
+            json.dump(results, fp, indent=2, sort_keys=True)
+        sys.stdout.write(f"Baseline saved to {args.save_baseline}\n")
+        return
+
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+        if args.resource_types:
+            baseline = {
+                release: {
+                    resource_type: metrics
+                    for resource_type, metrics in types.items()
+                    if resource_type in args.resource_types
+                }
+                for release, types in baseline.items()
+            }
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for release, resource_type, metric, expected, value in regressions:
+            if metric == "count":
+                sys.stdout.write(
+                    f"REGRESSION {release} {resource_type}: {expected} examples "
+                    f"in the baseline, {value} measured\n"
+                )
+                continue
+            sys.stdout.write(
+                f"REGRESSION {release} {resource_type} {metric}: "
+                f"{expected:.1f} -> {value:.1f} (+{value / expected - 1:.0%})\n"
+            )
+        if regressions:
+            sys.exit(1)
+        sys.stdout.write(
+            f"No regression beyond {args.tolerance:.0%} of {args.baseline}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
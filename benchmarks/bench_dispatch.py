@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Polymorphic dispatch of raw resource JSON: ``json.loads`` + model lookup +
+``model_validate`` against ``parse_resource`` (sniff + ``model_validate_json``).
+Usage::
+
+    python benchmarks/bench_dispatch.py [--release R5] [--examples PATH]
+        [--repeat 5]
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from corpus import iter_example_resources
+
+from fhir.resources.utils import get_fhir_model_class, parse_resource
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+
+def dict_dispatch(data, release):
+    """The usual two pass way."""
+    obj = json.loads(data)
+    return get_fhir_model_class(obj["resourceType"], release).model_validate(obj)
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--examples", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    payloads = [
+        data for _, _, data in iter_example_resources(args.release, args.examples)
+    ]
+    total = len(payloads) * args.repeat
+    sys.stdout.write(f"{len(payloads)} resources x {args.repeat}\n")
+
+    for label, func in (
+        ("json.loads + model_validate", dict_dispatch),
+        ("parse_resource", parse_resource),
+    ):
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            for data in payloads:
+                func(data, args.release)
+        elapsed = time.perf_counter() - started
+        sys.stdout.write(f"{label:<30}{total / elapsed:>12.0f} resources/sec\n")
+
+
+if __name__ == "__main__":
+    main()
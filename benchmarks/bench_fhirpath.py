@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""FHIRPath over the example corpus: ``compile_fhirpath`` evaluated on the
+models against ``model_dump()`` of every resource, the conversion any
+dict-based engine needs first (and ``fhirpathpy`` on those dicts, when
+installed), in microseconds per resource. Usage::
+
+    python benchmarks/bench_fhirpath.py [--release R5] [--examples PATH]
+        [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+
+from corpus import iter_example_resources
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.fhirpath import compile_fhirpath
+
+try:
+    import fhirpathpy
+except ImportError:  # pragma: no cover
+    fhirpathpy = None
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+EXPRESSIONS = (
+    "id",
+    "meta.lastUpdated",
+    "identifier.where(system.exists()).value",
+    "Observation.value.ofType(Quantity).value",
+    "Patient.name.where(use = 'official').given.first()",
+    "descendants().ofType(Reference).reference",
+    "text.exists() implies text.status.exists()",
+)
+
+
+def timed(func, resources, repeat):
+    """Microseconds per resource."""
+    for resource in resources:
+        func(resource)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for resource in resources:
+            func(resource)
+    return (time.perf_counter() - started) / (repeat * len(resources)) * 1e6
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--examples", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    resources = [
+        get_fhir_model_class(resource_type, args.release).model_validate_json(data)
+        for _, resource_type, data in iter_example_resources(
+            args.release, args.examples
+        )
+    ]
+    # a few more than the static examples have, when no corpus is around
+    repeat = args.repeat * max(1, 2000 // len(resources))
+    sys.stdout.write(f"{len(resources)} resources\n")
+
+    dump = timed(
+        lambda r: r.model_dump(by_alias=True, exclude_none=True), resources, repeat
+    )
+    sys.stdout.write(f"{'model_dump()':<56}{dump:>10.1f} us/resource\n")
+    for expression in EXPRESSIONS:
+        compiled = compile_fhirpath(expression)
+        elapsed = timed(compiled.evaluate, resources, repeat)
+        sys.stdout.write(f"{expression:<56}{elapsed:>10.1f} us/resource\n")
+        if fhirpathpy is not None:
+            dicts = [r.model_dump(mode="json", by_alias=True) for r in resources]
+            evaluator = fhirpathpy.compile(expression)
+            elapsed = timed(evaluator, dicts, repeat)
+            sys.stdout.write(f"{'  fhirpathpy':<56}{elapsed:>10.1f} us/resource\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Cold import cost of ``fhirtypes``, a couple of resource modules and the
+first validation of a wide model (``ExplanationOfBenefit``).
+
+Every measurement runs in a fresh interpreter, so nothing is shared between
+runs. Usage::
+
+    python benchmarks/bench_import.py [--repeat 10]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RELEASES = {
+    "R5": "fhir.resources",
+    "R4B": "fhir.resources.R4B",
+    "STU3": "fhir.resources.STU3",
+}
+
+PROBE = """
+import json, resource, sys, time, tracemalloc
+import fhir_core.types  # shared by every release, not part of the measurement
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if {trace}:
+    tracemalloc.start()
+started = time.perf_counter()
+import {package}.fhirtypes
+fhirtypes = time.perf_counter() - started
+from {package}.patient import Patient
+from {package}.observation import Observation
+Patient.model_validate({{"resourceType": "Patient", "id": "p1"}})
+Observation.model_validate(
+    {{"resourceType": "Observation", "status": "final", "code": {{"text": "x"}}}}
+)
+first_use = time.perf_counter() - started
+from {package} import get_fhir_model_class
+started = time.perf_counter()
+try:
+    # only the cost of getting a validator for a wide model matters here
+    get_fhir_model_class("ExplanationOfBenefit").model_validate({{}})
+except ValueError:
+    pass
+wide_model = time.perf_counter() - started
+json.dump({{
+    "fhirtypes": fhirtypes,
+    "first_use": first_use,
+    "wide_model": wide_model,
+    "traced_peak": tracemalloc.get_traced_memory()[1],
+    "maxrss_delta": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss,
+}}, sys.stdout)
+"""
+
+
+def probe(package, trace=False):
+    """tracemalloc slows the interpreter down, so timings come from untraced runs."""
+    output = subprocess.check_output(
+        [sys.executable, "-c", PROBE.format(package=package, trace=trace)],
+        cwd=ROOT_PATH,
+    )
+    return json.loads(output)
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    sys.stdout.write(
+        f"{'release':<8}{'fhirtypes ms':>14}{'first use ms':>14}{'EOB ms':>10}"
+        f"{'traced KiB':>12}{'maxrss KiB':>12}\n"
+    )
+    for release, package in RELEASES.items():
+        runs = [probe(package) for _ in range(args.repeat)]
+        traced = [probe(package, trace=True) for _ in range(3)]
+        sys.stdout.write(
+            f"{release:<8}"
+            f"{statistics.median(r['fhirtypes'] for r in runs) * 1000:>14.2f}"
+            f"{statistics.median(r['first_use'] for r in runs) * 1000:>14.2f}"
+            f"{statistics.median(r['wide_model'] for r in runs) * 1000:>10.2f}"
+            f"{statistics.median(r['traced_peak'] for r in traced) / 1024:>12.0f}"
+            f"{statistics.median(r['maxrss_delta'] for r in runs):>12.0f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""``model_dump_json`` of a ``Bundle`` of ``Observation`` entries through
+pydantic's serializer (``fhir_core``) against the emit plans of
+``fhir.resources.utils.jsonwriter`` with each backend, in milliseconds per
+Bundle. Every output is checked to be byte for byte the same. Usage::
+
+    python benchmarks/bench_json.py [--release R4B] [--entries 10000]
+        [--repeat 3] [--indent 2]
+"""
+
+import argparse
+import pathlib
+import sys
+import time
+
+from fhir_core import fhirabstractmodel
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.jsonwriter import JSON_BACKENDS, get_json_plan, json_dumps
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+OBSERVATION = (
+    pathlib.Path(__file__).parent.parent / "tests" / "static" / "Observation.json"
+)
+
+
+def make_bundle(release, entries):
+    """ """
+    observation = get_fhir_model_class("Observation", release).model_validate_json(
+        OBSERVATION.read_bytes()
+    )
+    return get_fhir_model_class("Bundle", release).model_validate(
+        {
+            "resourceType": "Bundle",
+            "type": "searchset",
+            "total": entries,
+            "entry": [
+                {
+                    "fullUrl": f"https://example.org/fhir/Observation/{index}",
+                    "resource": observation.model_copy(
+                        update={"id": f"{index}"}, deep=True
+                    ),
+                    "search": {"mode": "match"},
+                }
+                for index in range(entries)
+            ],
+        }
+    )
+
+
+def best(function, repeat):
+    """Best of ``repeat`` runs in milliseconds and the last result."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1e3, result
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R4B")
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--indent", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    bundle = make_bundle(args.release, args.entries)
+    started = time.perf_counter()
+    for klass in (type(bundle), type(bundle.entry[0]), type(bundle.entry[0].resource)):
+        get_json_plan(klass)
+    sys.stdout.write(
+        f"{args.entries} entries, first plans in "
+        f"{(time.perf_counter() - started) * 1e3:.2f} ms\n"
+    )
+
+    reference, expected = best(
+        lambda: fhirabstractmodel.FHIRAbstractModel.model_dump_json(
+            bundle, indent=args.indent
+        ).encode(),
+        args.repeat,
+    )
+    sys.stdout.write(
+        f"{'pydantic':<12}{reference:>10.1f} ms  {len(expected) / 1e6:.1f} MB\n"
+    )
+    problems = 0
+    for backend in sorted(JSON_BACKENDS):
+        elapsed, data = best(
+            lambda: json_dumps(bundle, indent=args.indent, backend=backend),
+            args.repeat,
+        )
+        same = data == expected
+        problems += not same
+        sys.stdout.write(
+            f"{backend:<12}{elapsed:>10.1f} ms  x{reference / elapsed:.1f}"
+            f"  {'identical' if same else 'DIFFERENT'}\n"
+        )
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Read a few top level fields of a large ``ExplanationOfBenefit``: eager
+``model_validate_json`` against ``model_validate_json_lazy``. Usage::
+
+    python benchmarks/bench_lazy.py [--items 50 200] [--repeat 5]
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+import corpus  # noqa: F401 (sys.path)
+
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.utils.lazy import model_validate_json_lazy
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+
+def make_eob(items, details=3, sub_details=3):
+    """Synthetic claim with ``items`` lines, each with details and
+    sub-details."""
+    money = {"value": 125.5, "currency": "USD"}
+    adjudication = [
+        {"category": {"coding": [{"code": code}]}, "amount": money}
+        for code in ("eligible", "benefit")
+    ]
+
+    def line(sequence, **extra):
+        return dict(
+            sequence=sequence,
+            productOrService={
+                "coding": [{"system": "http://example.org", "code": "1"}]
+            },
+            unitPrice=money,
+            net=money,
+            adjudication=adjudication,
+            **extra,
+        )
+
+    return {
+        "resourceType": "ExplanationOfBenefit",
+        "id": "EB3500",
+        "status": "active",
+        "type": {"coding": [{"code": "oral"}]},
+        "use": "claim",
+        "patient": {"reference": "Patient/pat1"},
+        "created": "2014-08-16",
+        "outcome": "complete",
+        "insurance": [{"focal": True, "coverage": {"reference": "Coverage/9"}}],
+        "item": [
+            line(
+                i + 1,
+                detail=[
+                    line(j + 1, subDetail=[line(k + 1) for k in range(sub_details)])
+                    for j in range(details)
+                ],
+            )
+            for i in range(items)
+        ],
+    }
+
+
+def read_few(parse, data):
+    """ """
+    eob = parse(data)
+    return eob.status, eob.patient.reference, eob.outcome
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    parsers = (
+        ("eager", ExplanationOfBenefit.model_validate_json),
+        ("lazy", lambda data: model_validate_json_lazy(ExplanationOfBenefit, data)),
+    )
+    # warm up schemas and caches
+    for _, parse in parsers:
+        read_few(parse, json.dumps(make_eob(1)))
+
+    sys.stdout.write(f"{'items':>6}{'KiB':>8}{'mode':>7}{'ms':>10}{'peak MiB':>10}\n")
+    for items in args.items:
+        data = json.dumps(make_eob(items)).encode()
+        for label, parse in parsers:
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                read_few(parse, data)
+            elapsed = (time.perf_counter() - started) / args.repeat
+
+            tracemalloc.start()
+            read_few(parse, data)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            sys.stdout.write(
+                f"{items:>6}{len(data) / 1024:>8.0f}{label:>7}"
+                f"{elapsed * 1000:>10.1f}{peak / 2**20:>10.2f}\n"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Per instance ``model_validate`` and ``model_dump_json`` cost of a wide
+element (``Extension``, 55 fields with a ``value[x]`` choice), a resource and
+a large ``ExplanationOfBenefit``. Usage::
+
+    python benchmarks/bench_models.py [--number 2000]
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from bench_lazy import make_eob
+from corpus import STATIC_PATH
+
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.extension import Extension
+from fhir.resources.observation import Observation
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+
+def per_call(func, number):
+    """Microseconds per call."""
+    func()
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - started) / number * 1e6
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    samples = (
+        (Extension, {"url": "http://example.org", "valueString": "abc"}, 1),
+        (Observation, json.loads((STATIC_PATH / "Observation.json").read_text()), 5),
+        (ExplanationOfBenefit, make_eob(10), 200),
+    )
+    sys.stdout.write(f"{'model':<24}{'validate us':>14}{'dump json us':>14}\n")
+    for klass, obj, slowdown in samples:
+        number = max(args.number // slowdown, 1)
+        instance = klass.model_validate(obj)
+        validate = per_call(lambda: klass.model_validate(obj), number)
+        dump = per_call(instance.model_dump_json, number)
+        sys.stdout.write(f"{klass.__name__:<24}{validate:>14.1f}{dump:>14.1f}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""NDJSON read (validation) and write throughput in resources/sec over the
+example corpus. Usage::
+
+    python benchmarks/bench_ndjson.py [--release R5] [--examples PATH]
+        [--repeat 20] [--workers 0 2 4]
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+from corpus import iter_example_resources
+
+from fhir.resources.utils.ndjson import NDJSONReader, NDJSONWriter
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--examples", default=None)
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="copies of the corpus in the file"
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2, 4])
+    args = parser.parse_args(argv)
+
+    lines = [
+        data.replace(b"\r", b"").replace(b"\n", b"")
+        for _, _, data in iter_example_resources(args.release, args.examples)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "corpus.ndjson")
+        with open(path, "wb") as fp:
+            for _ in range(args.repeat):
+                fp.write(b"\n".join(lines) + b"\n")
+        total = len(lines) * args.repeat
+        sys.stdout.write(
+            f"{total} resources, {os.path.getsize(path) / 2**20:.1f} MiB\n"
+        )
+
+        resources = []
+        for workers in args.workers:
+            started = time.perf_counter()
+            with NDJSONReader(
+                path, fhir_release=args.release, max_workers=workers
+            ) as reader:
+                resources = [r.resource for r in reader if r.error is None]
+            elapsed = time.perf_counter() - started
+            sys.stdout.write(
+                f"read  workers={workers:<3}{total / elapsed:>12.0f} resources/sec\n"
+            )
+
+        started = time.perf_counter()
+        with NDJSONWriter(io.BytesIO()) as writer:
+            writer.write_many(resources)
+        elapsed = time.perf_counter() - started
+        sys.stdout.write(
+            f"write{'':<12}{len(resources) / elapsed:>12.0f} resources/sec\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
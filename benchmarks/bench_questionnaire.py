@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""One answer changed in a generated ``Questionnaire`` (groups of questions,
+every group enabled by an answer in an earlier one): every item's
+``enableWhen`` re-evaluated against the incremental update of
+``EnableWhenState``, and the validation of a full response. Usage::
+
+    python benchmarks/bench_questionnaire.py [--release R5] [--groups 500]
+        [--questions 10] [--changes 2000]
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.questionnaire import EnableWhenState, QuestionnaireIndex
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+
+def make_questionnaire(release, groups, questions, rng):
+    """Group ``g`` holds the integer questions ``g.q``, each group after the
+    first enabled when a question of an earlier group is over 50."""
+    items = []
+    for group in range(groups):
+        item = {
+            "linkId": f"{group}",
+            "type": "group",
+            "item": [
+                {"linkId": f"{group}.{question}", "type": "integer"}
+                for question in range(questions)
+            ],
+        }
+        if group:
+            source = f"{rng.randrange(group)}.{rng.randrange(questions)}"
+            if release == "STU3":
+                condition = {"question": source, "hasAnswer": True}
+            else:
+                condition = {"question": source, "operator": ">", "answerInteger": 50}
+            item["enableWhen"] = [condition]
+        items.append(item)
+    return get_fhir_model_class("Questionnaire", release).model_validate(
+        {"resourceType": "Questionnaire", "status": "active", "item": items}
+    )
+
+
+def make_response(release, groups, questions, rng):
+    """ """
+    data = {"resourceType": "QuestionnaireResponse", "status": "in-progress"}
+    if release == "R5":
+        data["questionnaire"] = "http://example.org/fhir/Questionnaire/generated"
+    data["item"] = [
+        {
+            "linkId": f"{group}",
+            "item": [
+                {
+                    "linkId": f"{group}.{question}",
+                    "answer": [{"valueInteger": rng.randrange(100)}],
+                }
+                for question in range(questions)
+            ],
+        }
+        for group in range(groups)
+    ]
+    return get_fhir_model_class("QuestionnaireResponse", release).model_validate(data)
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--groups", type=int, default=500)
+    parser.add_argument("--questions", type=int, default=10)
+    parser.add_argument("--changes", type=int, default=2000)
+    args = parser.parse_args(argv)
+    rng = random.Random(0)
+
+    questionnaire = make_questionnaire(args.release, args.groups, args.questions, rng)
+    response = make_response(args.release, args.groups, args.questions, rng)
+    started = time.perf_counter()
+    index = QuestionnaireIndex(questionnaire)
+    built = time.perf_counter() - started
+    sys.stdout.write(
+        f"{len(index)} items\n{'index':<28}{built * 1e3:>10.1f} ms (once)\n"
+    )
+
+    state = index.state(response)
+    answers = {link_id: state.answers(link_id) for link_id in index.items}
+    changes = [
+        (f"{rng.randrange(args.groups)}.{rng.randrange(args.questions)}")
+        for _ in range(args.changes)
+    ]
+
+    sample = changes[:20]
+    started = time.perf_counter()
+    for link_id in sample:
+        answers[link_id] = [rng.randrange(100)]
+        EnableWhenState(index, answers)
+    elapsed = (time.perf_counter() - started) / len(sample)
+    sys.stdout.write(f"{'full re-evaluation':<28}{elapsed * 1e3:>10.2f} ms/change\n")
+
+    started = time.perf_counter()
+    for link_id in changes:
+        state.set_answers(link_id, [rng.randrange(100)])
+    elapsed = (time.perf_counter() - started) / len(changes)
+    sys.stdout.write(f"{'set_answers':<28}{elapsed * 1e6:>10.1f} us/change\n")
+
+    started = time.perf_counter()
+    issues = index.validate_response(response)
+    elapsed = time.perf_counter() - started
+    sys.stdout.write(
+        f"{'validate_response':<28}{elapsed * 1e3:>10.1f} ms ({len(issues)} issues)\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
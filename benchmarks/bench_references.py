@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Outgoing references of every example resource: the generated
+``reference_paths`` tables (``iter_reference_elements``) against a walk of
+every complex element (``iter_references(..., extensions=True)``), in
+microseconds per resource. Usage::
+
+    python benchmarks/bench_references.py [--release R5] [--examples PATH]
+        [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+
+from corpus import iter_example_resources
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.references import iter_reference_elements, iter_references
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--examples", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    resources = [
+        get_fhir_model_class(resource_type, args.release).model_validate_json(data)
+        for _, resource_type, data in iter_example_resources(
+            args.release, args.examples
+        )
+    ]
+    # a few more than the static examples have, when no corpus is around
+    repeat = args.repeat * max(1, 2000 // len(resources))
+    sys.stdout.write(f"{len(resources)} resources\n")
+
+    for label, func in (
+        ("every complex element", lambda r: list(iter_references(r, extensions=True))),
+        ("reference_paths tables", lambda r: list(iter_reference_elements(r))),
+    ):
+        for resource in resources:
+            func(resource)
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for resource in resources:
+                func(resource)
+        elapsed = time.perf_counter() - started
+        per_resource = elapsed / (repeat * len(resources)) * 1e6
+        sys.stdout.write(f"{label:<28}{per_resource:>10.1f} us/resource\n")
+
+
+if __name__ == "__main__":
+    main()
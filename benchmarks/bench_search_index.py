@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Search index rows of the example corpus with ``SearchIndexer``: one
+resource at a time (``extract``) against batches (``extract_many``), in
+resources per second. The ``SearchParameter`` definitions come from the
+specification downloads (``definitions.json.zip``); without them a few of
+the base ones (below) are used. Usage::
+
+    python benchmarks/bench_search_index.py [--release R5] [--examples PATH]
+        [--definitions definitions.json.zip] [--batch 1000] [--count 20000]
+"""
+
+import argparse
+import itertools
+import sys
+import time
+
+from corpus import iter_example_resources
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.search import SearchIndexer
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+# (code, type, base, expression)
+BASE_SEARCH_PARAMETERS = (
+    ("_id", "token", ["Resource"], "Resource.id"),
+    ("_lastUpdated", "date", ["Resource"], "Resource.meta.lastUpdated"),
+    ("_profile", "uri", ["Resource"], "Resource.meta.profile"),
+    ("_tag", "token", ["Resource"], "Resource.meta.tag"),
+    ("identifier", "token", ["Patient", "Observation"], "Patient.identifier"),
+    ("name", "string", ["Patient"], "Patient.name"),
+    ("family", "string", ["Patient"], "Patient.name.family"),
+    ("gender", "token", ["Patient"], "Patient.gender"),
+    ("birthdate", "date", ["Patient"], "Patient.birthDate"),
+    ("telecom", "token", ["Patient"], "Patient.telecom"),
+    ("organization", "reference", ["Patient"], "Patient.managingOrganization"),
+    ("code", "token", ["Observation"], "Observation.code"),
+    ("status", "token", ["Observation"], "Observation.status"),
+    (
+        "date",
+        "date",
+        ["Observation"],
+        "Observation.effective.ofType(dateTime) | Observation.effective.ofType("
+        "Period) | Observation.effective.ofType(instant)",
+    ),
+    ("subject", "reference", ["Observation"], "Observation.subject"),
+    (
+        "patient",
+        "reference",
+        ["Observation"],
+        "Observation.subject.where(resolve() is Patient)",
+    ),
+    (
+        "value-quantity",
+        "quantity",
+        ["Observation"],
+        "(Observation.value as Quantity) | (Observation.value as SampledData)",
+    ),
+    (
+        "component-code",
+        "token",
+        ["Observation"],
+        "Observation.component.code",
+    ),
+)
+
+
+def base_search_parameters(release):
+    """ """
+    klass = get_fhir_model_class("SearchParameter", release)
+    return [
+        klass.model_construct(
+            code=code, type=param_type, base=base, expression=expression
+        )
+        for code, param_type, base, expression in BASE_SEARCH_PARAMETERS
+    ]
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R5")
+    parser.add_argument("--examples", default=None)
+    parser.add_argument("--definitions", default=None)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    if args.definitions:
+        indexer = SearchIndexer.from_definitions(args.definitions, args.release)
+    else:
+        indexer = SearchIndexer(base_search_parameters(args.release), args.release)
+    examples = [
+        get_fhir_model_class(resource_type, args.release).model_validate_json(data)
+        for _, resource_type, data in iter_example_resources(
+            args.release, args.examples
+        )
+    ]
+    resources = list(itertools.islice(itertools.cycle(examples), args.count))
+    sys.stdout.write(
+        f"{len(examples)} example resources, {len(resources)} indexed, "
+        f"{len(indexer.skipped)} parameters skipped\n"
+    )
+
+    started = time.perf_counter()
+    rows = sum(len(indexer.extract(resource)) for resource in resources)
+    elapsed = time.perf_counter() - started
+    sys.stdout.write(
+        f"{'extract':<24}{len(resources) / elapsed:>12.0f} resources/s"
+        f"{rows:>10} rows\n"
+    )
+
+    started = time.perf_counter()
+    rows = 0
+    for position in range(0, len(resources), args.batch):
+        batch = resources[position : position + args.batch]
+        rows += sum(map(len, indexer.extract_many(batch)))
+    elapsed = time.perf_counter() - started
+    label = f"extract_many ({args.batch})"
+    sys.stdout.write(
+        f"{label:<24}{len(resources) / elapsed:>12.0f} resources/s{rows:>10} rows\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""``ResourceStore`` searches against list comprehensions over the same
+resources: a cache of Practitioners with NPI identifiers, tags and
+``meta.lastUpdated`` spread over a year, and PractitionerRoles referring to
+them. Usage::
+
+    python benchmarks/bench_store.py [--resources 50000] [--queries 1000]
+"""
+
+import argparse
+import datetime
+import random
+import sys
+import time
+
+import corpus  # noqa: F401
+
+from fhir.resources.practitioner import Practitioner
+from fhir.resources.practitionerrole import PractitionerRole
+from fhir.resources.utils.construct import construct_trusted
+from fhir.resources.utils.store import ResourceStore
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+NPI = "http://hl7.org/fhir/sid/us-npi"
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def make_resources(count):
+    """ """
+    resources = []
+    for number in range(count // 2):
+        last_updated = START + datetime.timedelta(minutes=number * 525600 // count)
+        resources.append(
+            construct_trusted(
+                Practitioner,
+                {
+                    "resourceType": "Practitioner",
+                    "id": f"p{number}",
+                    "meta": {
+                        "lastUpdated": last_updated.isoformat(),
+                        "tag": [{"code": "hot" if number % 10 == 0 else "cold"}],
+                    },
+                    "identifier": [{"system": NPI, "value": str(number)}],
+                },
+            )
+        )
+        resources.append(
+            construct_trusted(
+                PractitionerRole,
+                {
+                    "resourceType": "PractitionerRole",
+                    "id": f"r{number}",
+                    "practitioner": {"reference": f"Practitioner/p{number}"},
+                },
+            )
+        )
+    return resources
+
+
+def scan_queries(resources, numbers, since):
+    """The list comprehensions ``store_queries`` replaces."""
+    for number in numbers:
+        npi = str(number)
+        [
+            r
+            for r in resources
+            if r.get_resource_type() == "Practitioner"
+            and any(i.system == NPI and i.value == npi for i in r.identifier or ())
+        ]
+        [
+            r
+            for r in resources
+            if r.get_resource_type() == "PractitionerRole"
+            and r.practitioner is not None
+            and r.practitioner.reference == f"Practitioner/p{number}"
+        ]
+        [
+            r
+            for r in resources
+            if r.get_resource_type() == "Practitioner"
+            and r.meta.lastUpdated > since
+            and any(t.code == "hot" for t in r.meta.tag or ())
+        ]
+
+
+def store_queries(store, numbers, since):
+    """ """
+    for number in numbers:
+        store.search("Practitioner", identifier=f"{NPI}|{number}")
+        store.search("PractitionerRole", practitioner=f"Practitioner/p{number}")
+        store.search("Practitioner", _lastUpdated=f"gt{since.isoformat()}", _tag="hot")
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resources", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    resources = make_resources(args.resources)
+    started = time.perf_counter()
+    store = ResourceStore(resources)
+    load = time.perf_counter() - started
+    sys.stdout.write(f"{len(store)} resources, put_many {load * 1e3:.0f} ms\n")
+
+    numbers = random.Random(0).sample(range(args.resources // 2), args.queries)
+    # the last couple of days
+    since = START + datetime.timedelta(days=363)
+    scanned = max(1, args.queries // 100)
+    started = time.perf_counter()
+    scan_queries(resources, numbers[:scanned], since)
+    scan = (time.perf_counter() - started) / scanned
+    started = time.perf_counter()
+    store_queries(store, numbers, since)
+    indexed = (time.perf_counter() - started) / args.queries
+    sys.stdout.write(
+        f"{'list comprehensions':<24}{scan * 1e3:>10.3f} ms per 3 queries\n"
+        f"{'ResourceStore.search':<24}{indexed * 1e3:>10.3f} ms per 3 queries\n"
+    )
+
+    started = time.perf_counter()
+    for number in numbers[:100]:
+        store.put(resources[number * 2])
+    update = (time.perf_counter() - started) / 100
+    sys.stdout.write(f"{'put (copy on write)':<24}{update * 1e3:>10.3f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
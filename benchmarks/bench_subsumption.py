@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""``$subsumes`` and descendant queries on a generated code system: a walk
+of the ``CodeSystem.concept`` tree per question against the interval
+numbering of ``CodeSystemIndex``, for a tree and, with ``--shared``, a
+polyhierarchy (that fraction of the concepts gets a second parent through
+a ``parent`` property). Usage::
+
+    python benchmarks/bench_subsumption.py [--concepts 100000] [--fanout 8]
+        [--shared 0.05] [--checks 2000]
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from bench_terminology import make_code_system
+
+from fhir.resources.codesystem import CodeSystemConceptProperty
+from fhir.resources.utils.terminology import CodeSystemIndex
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+
+def naive_is_a(code_system, code, ancestor):
+    """Find ``ancestor`` in the tree, then ``code`` below it."""
+
+    def find(concepts, wanted):
+        for concept in concepts or ():
+            if concept.code == wanted:
+                return concept
+            found = find(concept.concept, wanted)
+            if found is not None:
+                return found
+        return None
+
+    top = find(code_system.concept, ancestor)
+    return top is not None and (top.code == code or find(top.concept, code) is not None)
+
+
+def add_second_parents(code_system, fraction, rng):
+    """``parent`` properties to concepts of a lower number (no cycles)."""
+    stack = list(code_system.concept)
+    concepts = []
+    while stack:
+        concept = stack.pop()
+        concepts.append(concept)
+        stack.extend(concept.concept or ())
+    for concept in rng.sample(concepts, int(len(concepts) * fraction)):
+        number = int(concept.code[1:])
+        if number < 2:
+            continue
+        parent = f"C{rng.randrange(1, number)}"
+        concept.property = [CodeSystemConceptProperty(code="parent", valueCode=parent)]
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concepts", type=int, default=100000)
+    parser.add_argument("--fanout", type=int, default=8)
+    parser.add_argument("--shared", type=float, default=0.05)
+    parser.add_argument("--checks", type=int, default=2000)
+    args = parser.parse_args(argv)
+    rng = random.Random(0)
+
+    tree = make_code_system(args.concepts, args.fanout)
+    pairs = [
+        (f"C{rng.randrange(args.concepts)}", f"C{rng.randrange(args.concepts // 50)}")
+        for _ in range(args.checks)
+    ]
+    sample = pairs[:20]
+    started = time.perf_counter()
+    for code, ancestor in sample:
+        naive_is_a(tree, code, ancestor)
+    naive = (time.perf_counter() - started) / len(sample)
+    sys.stdout.write(
+        f"{args.concepts} concepts\n{'tree walk, is-a':<32}{naive * 1e6:>12.1f} us\n"
+    )
+
+    for label, code_system in (
+        ("tree", tree),
+        ("polyhierarchy", None),
+    ):
+        if code_system is None:
+            code_system = make_code_system(args.concepts, args.fanout)
+            add_second_parents(code_system, args.shared, rng)
+        started = time.perf_counter()
+        index = CodeSystemIndex(code_system)
+        built = time.perf_counter() - started
+        started = time.perf_counter()
+        for code, ancestor in pairs:
+            index.is_a(code, ancestor)
+        is_a = (time.perf_counter() - started) / len(pairs)
+        started = time.perf_counter()
+        for code, ancestor in pairs:
+            index.subsumes(ancestor, code)
+        subsumes = (time.perf_counter() - started) / len(pairs)
+        started = time.perf_counter()
+        count = sum(1 for _ in index.iter_descendants("C1"))
+        enumerate_time = time.perf_counter() - started
+        sys.stdout.write(
+            f"{label + ', index':<32}{built * 1e3:>12.1f} ms (once)\n"
+            f"{label + ', is_a':<32}{is_a * 1e6:>12.2f} us\n"
+            f"{label + ', subsumes':<32}{subsumes * 1e6:>12.2f} us\n"
+            f"{label + ', descendants of C1':<32}{enumerate_time * 1e3:>12.1f} ms"
+            f" ({count} codes)\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
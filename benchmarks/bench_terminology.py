@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""``ValueSetExpander`` against a naive expander that walks the
+``CodeSystem.concept`` tree for every ``is-a`` filter and keeps nothing: a
+generated code system (``--concepts``, ``--fanout`` children per concept),
+value sets of a subtree, of a subtree minus another one and importing
+both. Usage::
+
+    python benchmarks/bench_terminology.py [--concepts 100000] [--fanout 8]
+        [--checks 10000]
+"""
+
+import argparse
+import random
+import sys
+import time
+
+import corpus  # noqa: F401
+
+from fhir.resources.codesystem import CodeSystem
+from fhir.resources.utils.construct import construct_trusted
+from fhir.resources.utils.terminology import ValueSetExpander
+from fhir.resources.valueset import ValueSet
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+SYSTEM = "http://example.org/fhir/CodeSystem/local"
+BASE = "http://example.org/fhir/ValueSet/"
+
+
+def make_code_system(count, fanout):
+    """Concept ``n`` has children ``n * fanout + 1`` ... ``n * fanout + fanout``."""
+
+    def concept(number):
+        children = [
+            concept(child)
+            for child in range(number * fanout + 1, number * fanout + fanout + 1)
+            if child < count
+        ]
+        data = {"code": f"C{number}", "display": f"Concept {number}"}
+        if children:
+            data["concept"] = children
+        return data
+
+    sys.setrecursionlimit(10000)
+    return construct_trusted(
+        CodeSystem,
+        {
+            "resourceType": "CodeSystem",
+            "url": SYSTEM,
+            "status": "active",
+            "content": "complete",
+            "concept": [concept(0)],
+        },
+    )
+
+
+def make_value_sets(fanout):
+    """ """
+
+    def include(code):
+        return {
+            "system": SYSTEM,
+            "filter": [{"property": "concept", "op": "is-a", "value": code}],
+        }
+
+    return [
+        construct_trusted(ValueSet, data)
+        for data in (
+            {
+                "resourceType": "ValueSet",
+                "url": BASE + "subtree",
+                "status": "active",
+                "compose": {"include": [include("C1")]},
+            },
+            {
+                "resourceType": "ValueSet",
+                "url": BASE + "subtree-minus",
+                "status": "active",
+                "compose": {
+                    "include": [include("C2")],
+                    "exclude": [include(f"C{2 * fanout + 1}")],
+                },
+            },
+            {
+                "resourceType": "ValueSet",
+                "url": BASE + "both",
+                "status": "active",
+                "compose": {
+                    "include": [
+                        {"valueSet": [BASE + "subtree"]},
+                        {"valueSet": [BASE + "subtree-minus"]},
+                    ]
+                },
+            },
+        )
+    ]
+
+
+def naive_expand(code_system, value_sets, url):
+    """What a hand written, uncached expander does."""
+
+    def find(concepts, code):
+        for concept in concepts or ():
+            if concept.code == code:
+                return concept
+            found = find(concept.concept, code)
+            if found is not None:
+                return found
+        return None
+
+    def subtree(concept):
+        codes = [concept.code]
+        for child in concept.concept or ():
+            codes.extend(subtree(child))
+        return codes
+
+    def include_codes(include):
+        if include.valueSet:
+            return [
+                c
+                for vs in include.valueSet
+                for c in naive_expand(code_system, value_sets, vs)
+            ]
+        codes = []
+        for flt in include.filter:
+            codes.extend(subtree(find(code_system.concept, flt.value)))
+        return codes
+
+    value_set = next(vs for vs in value_sets if vs.url == url)
+    codes = []
+    for include in value_set.compose.include:
+        codes.extend(include_codes(include))
+    excluded = set()
+    for exclude in value_set.compose.exclude or ():
+        excluded.update(include_codes(exclude))
+    return [code for code in dict.fromkeys(codes) if code not in excluded]
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concepts", type=int, default=100000)
+    parser.add_argument("--fanout", type=int, default=8)
+    parser.add_argument("--checks", type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    code_system = make_code_system(args.concepts, args.fanout)
+    value_sets = make_value_sets(args.fanout)
+    url = BASE + "both"
+
+    started = time.perf_counter()
+    naive = naive_expand(code_system, value_sets, url)
+    naive_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    expander = ValueSetExpander([code_system], value_sets)
+    index_time = time.perf_counter() - started
+    started = time.perf_counter()
+    expansion = expander.get_expansion(url)
+    cold = time.perf_counter() - started
+    assert [item["code"] for item in expansion.contains] == naive
+    started = time.perf_counter()
+    expander.expand(url)
+    model = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(100):
+        expander.get_expansion(url)
+    warm = (time.perf_counter() - started) / 100
+
+    codes = [
+        f"C{n}" for n in random.Random(0).sample(range(args.concepts), args.checks)
+    ]
+    started = time.perf_counter()
+    for code in codes:
+        expander.validate_code(url, code, SYSTEM)
+    check = (time.perf_counter() - started) / len(codes)
+
+    sys.stdout.write(
+        f"{args.concepts} concepts, {len(naive)} codes in {url}\n"
+        f"{'naive expansion':<28}{naive_time * 1e3:>12.1f} ms\n"
+        f"{'CodeSystemIndex':<28}{index_time * 1e3:>12.1f} ms (once)\n"
+        f"{'expansion, cold':<28}{cold * 1e3:>12.1f} ms\n"
+        f"{'ValueSetExpansion model':<28}{model * 1e3:>12.1f} ms (once)\n"
+        f"{'expansion, cached':<28}{warm * 1e6:>12.1f} us\n"
+        f"{'validate_code':<28}{check * 1e6:>12.2f} us\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
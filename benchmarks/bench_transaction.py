@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""``TransactionGraph`` on growing transaction Bundles (the ones of
+``bench_bundle_index.py``): building the graph, the topological order and
+the rewrite of every placeholder reference. Time per entry should stay flat.
+Usage::
+
+    python benchmarks/bench_transaction.py [--entries 50000]
+"""
+
+import argparse
+import sys
+import time
+
+from bench_bundle_index import make_transaction
+
+from fhir.resources.utils.transaction import TransactionGraph
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=50000)
+    args = parser.parse_args(argv)
+
+    sys.stdout.write(
+        f"{'entries':>8}{'graph ms':>12}{'order ms':>12}{'rewrite ms':>12}"
+        f"{'us/entry':>10}\n"
+    )
+    for entries in (args.entries // 25, args.entries // 5, args.entries):
+        bundle = make_transaction(entries)
+        count = len(bundle.entry)
+
+        started = time.perf_counter()
+        graph = TransactionGraph(bundle)
+        build = time.perf_counter() - started
+        started = time.perf_counter()
+        order = graph.topological_order()
+        ordering = time.perf_counter() - started
+        assigned = {
+            bundle.entry[position].fullUrl: f"Resource/{position}" for position in order
+        }
+        started = time.perf_counter()
+        graph.rewrite_references(assigned)
+        rewrite = time.perf_counter() - started
+        total = build + ordering + rewrite
+        sys.stdout.write(
+            f"{count:>8}{build * 1e3:>12.1f}{ordering * 1e3:>12.1f}"
+            f"{rewrite * 1e3:>12.1f}{total / count * 1e6:>10.1f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
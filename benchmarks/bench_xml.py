@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""XML against JSON, per resource type of the example corpus: serialize with
+``fhir_core``'s ``Node`` tree (the former ``model_dump_xml``) and with the
+direct writer of ``fhir.resources.utils.xml``, parse with both, and
+``model_dump_json``/``model_validate_json`` for reference, in microseconds
+per resource.
+
+Every written document is read back and compared with the model; with
+``--xsd`` (R4B, the schemas in ``tests/static/xsd`` are FHIR 4.0.1) it is
+also validated against the schema of its resource type. Usage::
+
+    python benchmarks/bench_xml.py [--release R4B] [--examples PATH]
+        [--repeat 3] [--xsd]
+"""
+
+import argparse
+import collections
+import sys
+
+from bench_corpus import best_per_item
+from corpus import ROOT_PATH, iter_example_resources
+from fhir_core.xml_utils import xml_dumps as node_xml_dumps
+from fhir_core.xml_utils import xml_loads as node_xml_loads
+from lxml import etree
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.xml import xml_dumps, xml_loads
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+XSD_DIR = ROOT_PATH / "tests" / "static" / "xsd" / "fhir"
+COLUMNS = ("node dump", "dump", "json dump", "node load", "load", "json load")
+
+
+def without_narratives(model):
+    """``text`` set aside: lxml rewrites the escaping of the XHTML."""
+    data = model.model_dump(mode="json")
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            item.pop("text", None)
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return data
+
+
+def check(klass, model, xsd):
+    """Problems of the XML of one model, ``None`` when there are none."""
+    data = xml_dumps(model)
+    if xsd is not None:
+        schema = etree.XMLSchema(file=str(xsd))
+        if not schema.validate(etree.fromstring(data)):
+            return f"XSD: {schema.error_log.last_error}"
+    if without_narratives(xml_loads(data, klass)) != without_narratives(model):
+        return "not read back the same"
+    return None
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R4B")
+    parser.add_argument("--examples", default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--xsd", action="store_true")
+    args = parser.parse_args(argv)
+
+    by_type = collections.defaultdict(list)
+    for _, resource_type, data in iter_example_resources(args.release, args.examples):
+        by_type[resource_type].append(data)
+
+    width = max([len(name) for name in by_type] + [12])
+    sys.stdout.write(
+        f"{'':<{width}}" + "".join(f"{column:>12}" for column in COLUMNS) + "\n"
+    )
+    totals = collections.Counter()
+    problems = 0
+    for resource_type, payloads in sorted(by_type.items()):
+        klass = get_fhir_model_class(resource_type, args.release)
+        models = [klass.model_validate_json(data) for data in payloads]
+        xsd = XSD_DIR / f"{resource_type.lower()}.xsd" if args.xsd else None
+        for model in models:
+            problem = check(klass, model, xsd if xsd and xsd.exists() else None)
+            if problem is not None:
+                problems += 1
+                sys.stderr.write(f"{resource_type}/{model.id}: {problem}\n")
+        documents = [xml_dumps(model) for model in models]
+        row = (
+            best_per_item(node_xml_dumps, models, args.repeat),
+            best_per_item(xml_dumps, models, args.repeat),
+            best_per_item(lambda obj: obj.model_dump_json(), models, args.repeat),
+            best_per_item(
+                lambda data: node_xml_loads(klass, data), documents, args.repeat
+            ),
+            best_per_item(lambda data: xml_loads(data, klass), documents, args.repeat),
+            best_per_item(klass.model_validate_json, payloads, args.repeat),
+        )
+        for column, value in zip(COLUMNS, row):
+            totals[column] += value * len(models)
+        totals["count"] += len(models)
+        sys.stdout.write(
+            f"{resource_type:<{width}}" + "".join(f"{value:>12.1f}" for value in row)
+        )
+        sys.stdout.write(f"  ({len(models)})\n")
+    count = totals["count"] or 1
+    sys.stdout.write(
+        f"{'mean':<{width}}"
+        + "".join(f"{totals[column] / count:>12.1f}" for column in COLUMNS)
+        + f"\n{problems} of {totals['count']} documents with problems\n"
+    )
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
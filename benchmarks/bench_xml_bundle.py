@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""A generated XML ``Bundle`` of ``Observation`` entries read whole with
+``xml_load`` and entry by entry with ``XMLBundleReader``: seconds and peak
+resident memory, each in a process of its own. Usage::
+
+    python benchmarks/bench_xml_bundle.py [--release R4B] [--entries 5000]
+        [--xsd]
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from corpus import ROOT_PATH
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.xml import XMLBundleReader, xml_dump, xml_load
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+XSD_DIR = ROOT_PATH / "tests" / "static" / "xsd" / "fhir"
+
+
+def make_bundle(release, entries, path):
+    """ """
+    data = (ROOT_PATH / "tests" / "static" / "Observation.json").read_bytes()
+    observation = get_fhir_model_class("Observation", release).model_validate_json(data)
+    bundle = get_fhir_model_class("Bundle", release)(
+        type="collection",
+        entry=[
+            {
+                "fullUrl": f"urn:uuid:00000000-0000-0000-0000-{index:012d}",
+                "resource": observation,
+            }
+            for index in range(entries)
+        ],
+    )
+    with open(path, "wb") as fp:
+        xml_dump(bundle, fp)
+
+
+def run(mode, path, release, xsd):
+    """Read ``path``, in this process."""
+    started = time.perf_counter()
+    if mode == "xml_load":
+        count = len(xml_load(path, fhir_release=release).entry)
+    else:
+        reader = XMLBundleReader(
+            path, fhir_release=release, xsd_dir=XSD_DIR if xsd else None
+        )
+        with reader:
+            count = sum(1 for _ in reader)
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    sys.stdout.write(f"{mode:<20}{elapsed:>10.2f} s{peak:>10.0f} MB  ({count})\n")
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R4B")
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--xsd", action="store_true")
+    parser.add_argument("--run", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--path", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.run:
+        run(args.run, args.path, args.release, args.xsd)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bundle.xml")
+        make_bundle(args.release, args.entries, path)
+        size = os.path.getsize(path) / 1024 / 1024
+        sys.stdout.write(f"{args.entries} entries, {size:.0f} MB\n")
+        for mode in ("xml_load", "XMLBundleReader"):
+            command = [sys.executable, __file__, "--run", mode, "--path", path]
+            command += ["--release", args.release]
+            if args.xsd:
+                command.append("--xsd")
+            subprocess.run(command, check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""YAML against JSON, per resource type of the example corpus, in
+microseconds per resource: ``model_dump_yaml``/``model_validate_yaml``
+(safe dumper and loader, libyaml when available), the same with the pure
+Python safe ones, and ``model_dump_json``/``model_validate_json`` for
+reference. Reading a multi-document stream of every example is timed at
+the end. Usage::
+
+    python benchmarks/bench_yaml.py [--release R4B] [--examples PATH]
+        [--repeat 3]
+"""
+
+import argparse
+import collections
+import io
+import sys
+import time
+
+import yaml
+from bench_corpus import best_per_item
+from corpus import iter_example_resources
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.yaml import (
+    HAS_LIBYAML,
+    FHIRYAMLDumper,
+    yaml_dump_all,
+    yaml_load_all,
+)
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+COLUMNS = ("yaml dump", "py dump", "json dump", "yaml load", "py load", "json load")
+
+
+class PyDumper(yaml.SafeDumper):
+    """``FHIRYAMLDumper`` without libyaml."""
+
+    yaml_representers = FHIRYAMLDumper.yaml_representers
+
+
+def main(argv=None):
+    """ """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--release", default="R4B")
+    parser.add_argument("--examples", default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    by_type = collections.defaultdict(list)
+    for _, resource_type, data in iter_example_resources(args.release, args.examples):
+        by_type[resource_type].append(data)
+
+    sys.stdout.write(f"libyaml: {HAS_LIBYAML}\n")
+    width = max([len(name) for name in by_type] + [12])
+    sys.stdout.write(
+        f"{'':<{width}}" + "".join(f"{column:>12}" for column in COLUMNS) + "\n"
+    )
+    totals = collections.Counter()
+    resources = []
+    for resource_type, payloads in sorted(by_type.items()):
+        klass = get_fhir_model_class(resource_type, args.release)
+        models = [klass.model_validate_json(data) for data in payloads]
+        resources.extend(models)
+        documents = [model.model_dump_yaml() for model in models]
+        for model, document in zip(models, documents):
+            if klass.model_validate_yaml(document) != model:
+                sys.stderr.write(f"{resource_type}/{model.id}: not read back\n")
+
+        def py_dump(obj):
+            return yaml.dump(obj.model_dump(), Dumper=PyDumper, sort_keys=False)
+
+        def py_load(data):
+            return klass.model_validate(yaml.load(data, Loader=yaml.SafeLoader))
+
+        row = (
+            best_per_item(lambda obj: obj.model_dump_yaml(), models, args.repeat),
+            best_per_item(py_dump, models, args.repeat),
+            best_per_item(lambda obj: obj.model_dump_json(), models, args.repeat),
+            best_per_item(klass.model_validate_yaml, documents, args.repeat),
+            best_per_item(py_load, documents, args.repeat),
+            best_per_item(klass.model_validate_json, payloads, args.repeat),
+        )
+        for column, value in zip(COLUMNS, row):
+            totals[column] += value * len(models)
+        totals["count"] += len(models)
+        sys.stdout.write(
+            f"{resource_type:<{width}}" + "".join(f"{value:>12.1f}" for value in row)
+        )
+        sys.stdout.write(f"  ({len(models)})\n")
+    count = totals["count"] or 1
+    sys.stdout.write(
+        f"{'mean':<{width}}"
+        + "".join(f"{totals[column] / count:>12.1f}" for column in COLUMNS)
+        + "\n"
+    )
+
+    stream = yaml_dump_all(resources)
+    started = time.perf_counter()
+    read = sum(1 for _ in yaml_load_all(io.StringIO(stream), fhir_release=args.release))
+    elapsed = time.perf_counter() - started
+    sys.stdout.write(
+        f"yaml_load_all: {read} documents, {elapsed / (read or 1) * 1e6:.1f} us each\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Access to the official FHIR example corpus for the benchmarks.
+
+The test fixtures download ``<version>-examples-json.zip`` into ``.cache``;
+the same archive is used here. Any other zip or directory of example JSON
+files can be given instead (``--examples``), so benchmarks run offline. When
+the cached archive is missing too, that is reported and the few JSON files
+from ``tests/static`` are used. Examples the models do not accept are
+skipped and counted.
+"""
+
+import hashlib
+import os
+import pathlib
+import sys
+import typing
+import zipfile
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+ROOT_PATH = pathlib.Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if str(ROOT_PATH) not in sys.path:
+    sys.path.insert(0, str(ROOT_PATH))
+
+STATIC_PATH = ROOT_PATH / "tests" / "static"
+EXAMPLE_RESOURCES_URLS = {
+    "R5": "https://github.com/nazrulworld/hl7-archives/raw/"
+    "0.4.0/FHIR/R5/5.0.0-examples-json.zip",
+    "R4B": "https://github.com/nazrulworld/hl7-archives/raw/"
+    "0.4.0/FHIR/R4B/4.3.0-examples-json.zip",
+    "STU3": "https://github.com/nazrulworld/hl7-archives/raw/"
+    "0.4.0/FHIR/STU3/3.0.2-examples-json.zip",
+}
+CACHE_PATHS = {
+    "R5": ROOT_PATH / ".cache",
+    "R4B": ROOT_PATH / ".cache" / "R4B",
+    "STU3": ROOT_PATH / ".cache" / "STU3",
+}
+
+
+def cached_archive(release: str) -> pathlib.Path:
+    """Location the test fixtures store the example archive at."""
+    url = EXAMPLE_RESOURCES_URLS[release]
+    return CACHE_PATHS[release] / (hashlib.md5(url.encode()).hexdigest() + ".zip")
+
+
+def find_corpus(
+    release: str, examples: typing.Optional[str] = None
+) -> typing.Optional[pathlib.Path]:
+    """The zip archive or directory of the examples, ``None`` when missing."""
+    path = pathlib.Path(examples) if examples else cached_archive(release)
+    if (path.is_file() and zipfile.is_zipfile(path)) or path.is_dir():
+        return path
+    return None
+
+
+def iter_examples(
+    release: str, examples: typing.Optional[str] = None
+) -> typing.Iterator[typing.Tuple[str, bytes]]:
+    """Yield ``(file name, JSON bytes)`` of every example.
+
+    examples: zip archive or directory, an error when missing; defaults to the
+    cached archive, then (reported on stderr) to ``tests/static``.
+    """
+    path = find_corpus(release, examples)
+    if path is None:
+        if examples:
+            raise FileNotFoundError(f"No example corpus for {release} at {examples}")
+        sys.stderr.write(
+            f"Example corpus for {release} is missing ({cached_archive(release)}),"
+            f" only the few examples of {STATIC_PATH} are used\n"
+        )
+        path = STATIC_PATH
+    if path.is_file():
+        with zipfile.ZipFile(path) as archive:
+            for name in sorted(archive.namelist()):
+                if name.endswith(".json"):
+                    yield pathlib.PurePath(name).name, archive.read(name)
+        return
+    for file in sorted(path.rglob("*.json")):
+        yield file.name, file.read_bytes()
+
+
+def iter_example_resources(
+    release: str,
+    examples: typing.Optional[str] = None,
+    skipped: typing.Optional[typing.List[typing.Tuple[str, str]]] = None,
+) -> typing.Iterator[typing.Tuple[str, str, bytes]]:
+    """Like ``iter_examples`` but with the resource type, and only the examples
+    this release's models accept. The others are counted on stderr at the
+    end, and added to ``skipped`` as ``(file name, error)`` when given."""
+    import json
+
+    from fhir.resources.utils import get_fhir_model_class
+
+    if skipped is None:
+        skipped = []
+    total = 0
+    for name, data in iter_examples(release, examples):
+        total += 1
+        try:
+            resource_type = json.loads(data)["resourceType"]
+            get_fhir_model_class(resource_type, release).model_validate_json(data)
+        except (KeyError, TypeError, ValueError) as exc:
+            skipped.append((name, f"{exc.__class__.__name__}: {exc}".split("\n")[0]))
+            continue
+        yield name, resource_type, data
+    if skipped:
+        names = ", ".join(name for name, _ in skipped[:5])
+        more = ", ..." if len(skipped) > 5 else ""
+        sys.stderr.write(
+            f"{len(skipped)} of {total} {release} examples skipped, not accepted "
+            f"by the models ({names}{more})\n"
+        )
@@ -1,7 +1,7 @@
 from __future__ import annotations as _annotations
 
 from functools import lru_cache
-from typing import TYPE_CHECKING, cast
+from importlib import import_module
 
 from fhir_core.fhirabstractmodel import FHIRAbstractModel
 
@@ -12,17 +12,16 @@ __fhir_version__ = "4.3.0"
 
 @lru_cache(maxsize=None, typed=True)
 def get_fhir_model_class(model_name: str) -> type[FHIRAbstractModel]:
-    """ """
+    """Resolve the model class straight from the ``fhirtypes`` registry, which
+    only imports the module that defines it."""
     from . import fhirtypes as ft
 
-    try:
-        model_type = getattr(ft, model_name + "Type")
-        if TYPE_CHECKING:
-            from fhir_core.types import FhirBase
-
-            model_type = cast(type[FhirBase], model_type)
-
-        return model_type.get_model_klass()
-
-    except AttributeError:
+    type_name = model_name + "Type"
+    model_klass = ft._FHIR_TYPES.get(
+        type_name, ft._FHIR_ELEMENT_OR_RESOURCE_TYPES.get(type_name)
+    )
+    if model_klass is None:
         raise ValueError(f"{model_name} is not a valid FHIR Model")
+
+    module_name, klass_name = model_klass.rsplit(".", 1)
+    return getattr(import_module(module_name), klass_name)
@@ -9,9 +9,9 @@ Last updated: 2022-05-28T12:47:40.239+10:00
 """
 import typing
 
-from fhir_core import fhirabstractmodel
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
+from .. import fhirabstractmodel
 from . import fhirtypes
 
 
@@ -26,6 +26,10 @@ class Element(fhirabstractmodel.FHIRAbstractModel):
 
     __resource_type__ = "Element"
 
+    # Core schemas are built on first validation, not at import time, so a
+    # module holding dozens of backbone elements only pays for those in use.
+    model_config = ConfigDict(defer_build=True)
+
     extension: typing.List[fhirtypes.ExtensionType] | None = Field(  # type: ignore
         None,
         alias="extension",
@@ -1,7 +1,8 @@
 from typing import Optional, Union
 
-from fhir_core.fhirabstractmodel import FHIRAbstractModel
+from pydantic import ConfigDict
 
+from ..fhirabstractmodel import FHIRAbstractModel
 from .fhirtypes import IdType, StringType
 
 
@@ -10,6 +11,9 @@ class FHIRResourceModel(FHIRAbstractModel):
 
     __resource_type__ = "FHIRAbstractResource"
 
+    # see ``Element.model_config``
+    model_config = ConfigDict(defer_build=True)
+
     id: Optional[Union[IdType, StringType]] = None
 
     def relative_base(self):
@@ -0,0 +1,8503 @@
+from __future__ import annotations as _annotations
+
+import typing
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+# Generated by ``script/generate.py``, see ``write_reference_paths``.
+#
+# The fields of every model class that lead to a ``Reference``, extensions
+# left out: ``{class name: ((field name, element name, is list, kind, target
+# types), ...)}``. ``kind`` is one of ``reference``, ``codeable`` (a
+# ``CodeableReference``), ``resource`` (a resource of any type, i.e.
+# ``contained``) or ``element`` (a complex element with references inside).
+ReferenceField = typing.Tuple[
+    str, str, bool, str, typing.Optional[typing.Tuple[str, ...]]
+]
+
+REFERENCE_FIELDS: typing.Dict[str, typing.Tuple[ReferenceField, ...]] = {
+    "Account": (
+        ("contained", "contained", True, "resource", None),
+        ("coverage", "coverage", True, "element", None),
+        ("guarantor", "guarantor", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("owner", "owner", False, "reference", ("Organization",)),
+        ("partOf", "partOf", False, "reference", ("Account",)),
+        (
+            "subject",
+            "subject",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Device",
+                "Practitioner",
+                "PractitionerRole",
+                "Location",
+                "HealthcareService",
+                "Organization",
+            ),
+        ),
+    ),
+    "AccountCoverage": (("coverage", "coverage", False, "reference", ("Coverage",)),),
+    "AccountGuarantor": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson", "Organization"),
+        ),
+    ),
+    "ActivityDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        (
+            "observationRequirement",
+            "observationRequirement",
+            True,
+            "reference",
+            ("ObservationDefinition",),
+        ),
+        (
+            "observationResultRequirement",
+            "observationResultRequirement",
+            True,
+            "reference",
+            ("ObservationDefinition",),
+        ),
+        (
+            "productReference",
+            "productReference",
+            False,
+            "reference",
+            ("Medication", "Substance", "Ingredient"),
+        ),
+        (
+            "specimenRequirement",
+            "specimenRequirement",
+            True,
+            "reference",
+            ("SpecimenDefinition",),
+        ),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "AdministrableProductDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("device", "device", False, "reference", ("DeviceDefinition",)),
+        ("formOf", "formOf", True, "reference", ("MedicinalProductDefinition",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "producedFrom",
+            "producedFrom",
+            True,
+            "reference",
+            ("ManufacturedItemDefinition",),
+        ),
+    ),
+    "AdverseEvent": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "contributor",
+            "contributor",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Device"),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", False, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        (
+            "recorder",
+            "recorder",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "PractitionerRole", "RelatedPerson"),
+        ),
+        (
+            "referenceDocument",
+            "referenceDocument",
+            True,
+            "reference",
+            ("DocumentReference",),
+        ),
+        ("resultingCondition", "resultingCondition", True, "reference", ("Condition",)),
+        ("study", "study", True, "reference", ("ResearchStudy",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Practitioner", "RelatedPerson"),
+        ),
+        (
+            "subjectMedicalHistory",
+            "subjectMedicalHistory",
+            True,
+            "reference",
+            (
+                "Condition",
+                "Observation",
+                "AllergyIntolerance",
+                "FamilyMemberHistory",
+                "Immunization",
+                "Procedure",
+                "Media",
+                "DocumentReference",
+            ),
+        ),
+        ("suspectEntity", "suspectEntity", True, "element", None),
+    ),
+    "AdverseEventSuspectEntity": (
+        ("causality", "causality", True, "element", None),
+        (
+            "instance",
+            "instance",
+            False,
+            "reference",
+            (
+                "Immunization",
+                "Procedure",
+                "Substance",
+                "Medication",
+                "MedicationAdministration",
+                "MedicationStatement",
+                "Device",
+            ),
+        ),
+    ),
+    "AdverseEventSuspectEntityCausality": (
+        ("author", "author", False, "reference", ("Practitioner", "PractitionerRole")),
+    ),
+    "AllergyIntolerance": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "asserter",
+            "asserter",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson", "Practitioner", "PractitionerRole"),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("reaction", "reaction", True, "element", None),
+        (
+            "recorder",
+            "recorder",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson"),
+        ),
+    ),
+    "AllergyIntoleranceReaction": (("note", "note", True, "element", None),),
+    "Annotation": (
+        (
+            "authorReference",
+            "authorReference",
+            False,
+            "reference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+    ),
+    "Appointment": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("ServiceRequest",)),
+        ("identifier", "identifier", True, "element", None),
+        ("participant", "participant", True, "element", None),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Procedure", "Observation", "ImmunizationRecommendation"),
+        ),
+        ("slot", "slot", True, "reference", ("Slot",)),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "AppointmentParticipant": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+    ),
+    "AppointmentResponse": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        ("appointment", "appointment", False, "reference", ("Appointment",)),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "AuditEvent": (
+        ("contained", "contained", True, "resource", None),
+        ("agent", "agent", True, "element", None),
+        ("entity", "entity", True, "element", None),
+        ("source", "source", False, "element", None),
+    ),
+    "AuditEventAgent": (
+        ("location", "location", False, "reference", ("Location",)),
+        (
+            "who",
+            "who",
+            False,
+            "reference",
+            (
+                "PractitionerRole",
+                "Practitioner",
+                "Organization",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "AuditEventEntity": (("what", "what", False, "reference", ("Resource",)),),
+    "AuditEventSource": (
+        (
+            "observer",
+            "observer",
+            False,
+            "reference",
+            (
+                "PractitionerRole",
+                "Practitioner",
+                "Organization",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "Basic": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("subject", "subject", False, "reference", ("Resource",)),
+    ),
+    "Binary": (
+        ("securityContext", "securityContext", False, "reference", ("Resource",)),
+    ),
+    "BiologicallyDerivedProduct": (
+        ("contained", "contained", True, "resource", None),
+        ("collection", "collection", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("parent", "parent", True, "reference", ("BiologicallyDerivedProduct",)),
+        ("processing", "processing", True, "element", None),
+        ("request", "request", True, "reference", ("ServiceRequest",)),
+    ),
+    "BiologicallyDerivedProductCollection": (
+        (
+            "collector",
+            "collector",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("source", "source", False, "reference", ("Patient", "Organization")),
+    ),
+    "BiologicallyDerivedProductProcessing": (
+        ("additive", "additive", False, "reference", ("Substance",)),
+    ),
+    "BodyStructure": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+    ),
+    "Bundle": (
+        ("entry", "entry", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("signature", "signature", False, "element", None),
+    ),
+    "BundleEntry": (
+        ("resource", "resource", False, "resource", None),
+        ("response", "response", False, "element", None),
+    ),
+    "BundleEntryResponse": (("outcome", "outcome", False, "resource", None),),
+    "CapabilityStatement": (
+        ("contained", "contained", True, "resource", None),
+        ("implementation", "implementation", False, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "CapabilityStatementImplementation": (
+        ("custodian", "custodian", False, "reference", ("Organization",)),
+    ),
+    "CarePlan": (
+        ("contained", "contained", True, "resource", None),
+        ("activity", "activity", True, "element", None),
+        ("addresses", "addresses", True, "reference", ("Condition",)),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "RelatedPerson",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        ("basedOn", "basedOn", True, "reference", ("CarePlan",)),
+        ("careTeam", "careTeam", True, "reference", ("CareTeam",)),
+        (
+            "contributor",
+            "contributor",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "RelatedPerson",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("goal", "goal", True, "reference", ("Goal",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("CarePlan",)),
+        ("replaces", "replaces", True, "reference", ("CarePlan",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+    ),
+    "CarePlanActivity": (
+        ("detail", "detail", False, "element", None),
+        ("outcomeReference", "outcomeReference", True, "reference", ("Resource",)),
+        ("progress", "progress", True, "element", None),
+        (
+            "reference",
+            "reference",
+            False,
+            "reference",
+            (
+                "Appointment",
+                "CommunicationRequest",
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "Task",
+                "ServiceRequest",
+                "VisionPrescription",
+                "RequestGroup",
+            ),
+        ),
+    ),
+    "CarePlanActivityDetail": (
+        ("goal", "goal", True, "reference", ("Goal",)),
+        ("location", "location", False, "reference", ("Location",)),
+        (
+            "performer",
+            "performer",
+            True,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "RelatedPerson",
+                "Patient",
+                "CareTeam",
+                "HealthcareService",
+                "Device",
+            ),
+        ),
+        (
+            "productReference",
+            "productReference",
+            False,
+            "reference",
+            ("Medication", "Substance"),
+        ),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+    ),
+    "CareTeam": (
+        ("contained", "contained", True, "resource", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            True,
+            "reference",
+            ("Organization",),
+        ),
+        ("note", "note", True, "element", None),
+        ("participant", "participant", True, "element", None),
+        ("reasonReference", "reasonReference", True, "reference", ("Condition",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "CareTeamParticipant": (
+        (
+            "member",
+            "member",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "CatalogEntry": (
+        ("contained", "contained", True, "resource", None),
+        ("additionalIdentifier", "additionalIdentifier", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "referencedItem",
+            "referencedItem",
+            False,
+            "reference",
+            (
+                "Medication",
+                "Device",
+                "Organization",
+                "Practitioner",
+                "PractitionerRole",
+                "HealthcareService",
+                "ActivityDefinition",
+                "PlanDefinition",
+                "SpecimenDefinition",
+                "ObservationDefinition",
+                "Binary",
+            ),
+        ),
+        ("relatedEntry", "relatedEntry", True, "element", None),
+    ),
+    "CatalogEntryRelatedEntry": (
+        ("item", "item", False, "reference", ("CatalogEntry",)),
+    ),
+    "ChargeItem": (
+        ("contained", "contained", True, "resource", None),
+        ("account", "account", True, "reference", ("Account",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("costCenter", "costCenter", False, "reference", ("Organization",)),
+        (
+            "enterer",
+            "enterer",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("ChargeItem",)),
+        ("performer", "performer", True, "element", None),
+        (
+            "performingOrganization",
+            "performingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        (
+            "productReference",
+            "productReference",
+            False,
+            "reference",
+            ("Device", "Medication", "Substance"),
+        ),
+        (
+            "requestingOrganization",
+            "requestingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        (
+            "service",
+            "service",
+            True,
+            "reference",
+            (
+                "DiagnosticReport",
+                "ImagingStudy",
+                "Immunization",
+                "MedicationAdministration",
+                "MedicationDispense",
+                "Observation",
+                "Procedure",
+                "SupplyDelivery",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "ChargeItemDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "instance",
+            "instance",
+            True,
+            "reference",
+            ("Medication", "Substance", "Device"),
+        ),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "ChargeItemPerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "Citation": (
+        ("contained", "contained", True, "resource", None),
+        ("citedArtifact", "citedArtifact", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("relatesTo", "relatesTo", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "CitationCitedArtifact": (
+        ("classification", "classification", True, "element", None),
+        ("contributorship", "contributorship", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("part", "part", False, "element", None),
+        ("publicationForm", "publicationForm", True, "element", None),
+        ("relatedIdentifier", "relatedIdentifier", True, "element", None),
+        ("relatesTo", "relatesTo", True, "element", None),
+        ("version", "version", False, "element", None),
+    ),
+    "CitationCitedArtifactClassification": (
+        ("whoClassified", "whoClassified", False, "element", None),
+    ),
+    "CitationCitedArtifactClassificationWhoClassified": (
+        ("organization", "organization", False, "reference", ("Organization",)),
+        ("person", "person", False, "reference", ("Person", "Practitioner")),
+        ("publisher", "publisher", False, "reference", ("Organization",)),
+    ),
+    "CitationCitedArtifactContributorship": (
+        ("entry", "entry", True, "element", None),
+    ),
+    "CitationCitedArtifactContributorshipEntry": (
+        ("affiliationInfo", "affiliationInfo", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "CitationCitedArtifactContributorshipEntryAffiliationInfo": (
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "CitationCitedArtifactPart": (
+        ("baseCitation", "baseCitation", False, "reference", ("Citation",)),
+    ),
+    "CitationCitedArtifactPublicationForm": (
+        ("publishedIn", "publishedIn", False, "element", None),
+    ),
+    "CitationCitedArtifactPublicationFormPublishedIn": (
+        ("identifier", "identifier", True, "element", None),
+        ("publisher", "publisher", False, "reference", ("Organization",)),
+    ),
+    "CitationCitedArtifactRelatesTo": (
+        ("targetIdentifier", "targetIdentifier", False, "element", None),
+        ("targetReference", "targetReference", False, "reference", ("Resource",)),
+    ),
+    "CitationCitedArtifactVersion": (
+        ("baseCitation", "baseCitation", False, "reference", ("Citation",)),
+    ),
+    "CitationRelatesTo": (
+        ("targetIdentifier", "targetIdentifier", False, "element", None),
+        ("targetReference", "targetReference", False, "reference", ("Resource",)),
+    ),
+    "Claim": (
+        ("contained", "contained", True, "resource", None),
+        ("accident", "accident", False, "element", None),
+        ("careTeam", "careTeam", True, "element", None),
+        ("diagnosis", "diagnosis", True, "element", None),
+        (
+            "enterer",
+            "enterer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("facility", "facility", False, "reference", ("Location",)),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("item", "item", True, "element", None),
+        (
+            "originalPrescription",
+            "originalPrescription",
+            False,
+            "reference",
+            ("DeviceRequest", "MedicationRequest", "VisionPrescription"),
+        ),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("payee", "payee", False, "element", None),
+        (
+            "prescription",
+            "prescription",
+            False,
+            "reference",
+            ("DeviceRequest", "MedicationRequest", "VisionPrescription"),
+        ),
+        ("procedure", "procedure", True, "element", None),
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("referral", "referral", False, "reference", ("ServiceRequest",)),
+        ("related", "related", True, "element", None),
+        ("supportingInfo", "supportingInfo", True, "element", None),
+    ),
+    "ClaimAccident": (
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+    ),
+    "ClaimCareTeam": (
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "ClaimDiagnosis": (
+        (
+            "diagnosisReference",
+            "diagnosisReference",
+            False,
+            "reference",
+            ("Condition",),
+        ),
+    ),
+    "ClaimInsurance": (
+        ("claimResponse", "claimResponse", False, "reference", ("ClaimResponse",)),
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "ClaimItem": (
+        ("detail", "detail", True, "element", None),
+        ("encounter", "encounter", True, "reference", ("Encounter",)),
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ClaimItemDetail": (
+        ("subDetail", "subDetail", True, "element", None),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ClaimItemDetailSubDetail": (("udi", "udi", True, "reference", ("Device",)),),
+    "ClaimPayee": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "ClaimProcedure": (
+        (
+            "procedureReference",
+            "procedureReference",
+            False,
+            "reference",
+            ("Procedure",),
+        ),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ClaimRelated": (
+        ("claim", "claim", False, "reference", ("Claim",)),
+        ("reference", "reference", False, "element", None),
+    ),
+    "ClaimResponse": (
+        ("contained", "contained", True, "resource", None),
+        ("addItem", "addItem", True, "element", None),
+        (
+            "communicationRequest",
+            "communicationRequest",
+            True,
+            "reference",
+            ("CommunicationRequest",),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("payment", "payment", False, "element", None),
+        ("request", "request", False, "reference", ("Claim",)),
+        (
+            "requestor",
+            "requestor",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "ClaimResponseAddItem": (
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+        (
+            "provider",
+            "provider",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "ClaimResponseInsurance": (
+        ("claimResponse", "claimResponse", False, "reference", ("ClaimResponse",)),
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+    ),
+    "ClaimResponsePayment": (("identifier", "identifier", False, "element", None),),
+    "ClaimSupportingInfo": (
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "ClinicalImpression": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "assessor",
+            "assessor",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("finding", "finding", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("investigation", "investigation", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("previous", "previous", False, "reference", ("ClinicalImpression",)),
+        ("problem", "problem", True, "reference", ("Condition", "AllergyIntolerance")),
+        (
+            "prognosisReference",
+            "prognosisReference",
+            True,
+            "reference",
+            ("RiskAssessment",),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+    ),
+    "ClinicalImpressionFinding": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            ("Condition", "Observation", "Media"),
+        ),
+    ),
+    "ClinicalImpressionInvestigation": (
+        (
+            "item",
+            "item",
+            True,
+            "reference",
+            (
+                "Observation",
+                "QuestionnaireResponse",
+                "FamilyMemberHistory",
+                "DiagnosticReport",
+                "RiskAssessment",
+                "ImagingStudy",
+                "Media",
+            ),
+        ),
+    ),
+    "ClinicalUseDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("contraindication", "contraindication", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("indication", "indication", False, "element", None),
+        ("interaction", "interaction", False, "element", None),
+        ("population", "population", True, "reference", ("Group",)),
+        (
+            "subject",
+            "subject",
+            True,
+            "reference",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "ActivityDefinition",
+                "PlanDefinition",
+                "Device",
+                "DeviceDefinition",
+                "Substance",
+            ),
+        ),
+        ("undesirableEffect", "undesirableEffect", False, "element", None),
+    ),
+    "ClinicalUseDefinitionContraindication": (
+        ("comorbidity", "comorbidity", True, "codeable", ("ObservationDefinition",)),
+        (
+            "diseaseStatus",
+            "diseaseStatus",
+            False,
+            "codeable",
+            ("ObservationDefinition",),
+        ),
+        (
+            "diseaseSymptomProcedure",
+            "diseaseSymptomProcedure",
+            False,
+            "codeable",
+            ("ObservationDefinition",),
+        ),
+        ("indication", "indication", True, "reference", ("ClinicalUseDefinition",)),
+        ("otherTherapy", "otherTherapy", True, "element", None),
+    ),
+    "ClinicalUseDefinitionContraindicationOtherTherapy": (
+        (
+            "therapy",
+            "therapy",
+            False,
+            "codeable",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "Substance",
+                "SubstanceDefinition",
+                "ActivityDefinition",
+            ),
+        ),
+    ),
+    "ClinicalUseDefinitionIndication": (
+        ("comorbidity", "comorbidity", True, "codeable", ("ObservationDefinition",)),
+        (
+            "diseaseStatus",
+            "diseaseStatus",
+            False,
+            "codeable",
+            ("ObservationDefinition",),
+        ),
+        (
+            "diseaseSymptomProcedure",
+            "diseaseSymptomProcedure",
+            False,
+            "codeable",
+            ("ObservationDefinition",),
+        ),
+        (
+            "intendedEffect",
+            "intendedEffect",
+            False,
+            "codeable",
+            ("ObservationDefinition",),
+        ),
+        ("otherTherapy", "otherTherapy", True, "element", None),
+        (
+            "undesirableEffect",
+            "undesirableEffect",
+            True,
+            "reference",
+            ("ClinicalUseDefinition",),
+        ),
+    ),
+    "ClinicalUseDefinitionInteraction": (
+        ("effect", "effect", False, "codeable", ("ObservationDefinition",)),
+        ("interactant", "interactant", True, "element", None),
+    ),
+    "ClinicalUseDefinitionInteractionInteractant": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "Substance",
+                "ObservationDefinition",
+            ),
+        ),
+    ),
+    "ClinicalUseDefinitionUndesirableEffect": (
+        (
+            "symptomConditionEffect",
+            "symptomConditionEffect",
+            False,
+            "codeable",
+            ("ObservationDefinition",),
+        ),
+    ),
+    "CodeSystem": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "CodeableReference": (("reference", "reference", False, "reference", None),),
+    "Communication": (
+        ("contained", "contained", True, "resource", None),
+        ("about", "about", True, "reference", ("Resource",)),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("inResponseTo", "inResponseTo", True, "reference", ("Communication",)),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("Resource",)),
+        ("payload", "payload", True, "element", None),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        (
+            "recipient",
+            "recipient",
+            True,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Group",
+                "CareTeam",
+                "HealthcareService",
+            ),
+        ),
+        (
+            "sender",
+            "sender",
+            False,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "CommunicationPayload": (
+        ("contentReference", "contentReference", False, "reference", ("Resource",)),
+    ),
+    "CommunicationRequest": (
+        ("contained", "contained", True, "resource", None),
+        ("about", "about", True, "reference", ("Resource",)),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("payload", "payload", True, "element", None),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        (
+            "recipient",
+            "recipient",
+            True,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Group",
+                "CareTeam",
+                "HealthcareService",
+            ),
+        ),
+        ("replaces", "replaces", True, "reference", ("CommunicationRequest",)),
+        (
+            "requester",
+            "requester",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        (
+            "sender",
+            "sender",
+            False,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "CommunicationRequestPayload": (
+        ("contentReference", "contentReference", False, "reference", ("Resource",)),
+    ),
+    "CompartmentDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "Composition": (
+        ("contained", "contained", True, "resource", None),
+        ("attester", "attester", True, "element", None),
+        (
+            "author",
+            "author",
+            True,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("custodian", "custodian", False, "reference", ("Organization",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("event", "event", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("relatesTo", "relatesTo", True, "element", None),
+        ("section", "section", True, "element", None),
+        ("subject", "subject", False, "reference", ("Resource",)),
+    ),
+    "CompositionAttester": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+            ),
+        ),
+    ),
+    "CompositionEvent": (("detail", "detail", True, "reference", ("Resource",)),),
+    "CompositionRelatesTo": (
+        ("targetIdentifier", "targetIdentifier", False, "element", None),
+        ("targetReference", "targetReference", False, "reference", ("Composition",)),
+    ),
+    "CompositionSection": (
+        (
+            "author",
+            "author",
+            True,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("entry", "entry", True, "reference", ("Resource",)),
+        ("focus", "focus", False, "reference", ("Resource",)),
+        ("section", "section", True, "element", None),
+    ),
+    "ConceptMap": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", False, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "Condition": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "asserter",
+            "asserter",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson"),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("evidence", "evidence", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "recorder",
+            "recorder",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson"),
+        ),
+        ("stage", "stage", True, "element", None),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "ConditionEvidence": (("detail", "detail", True, "reference", ("Resource",)),),
+    "ConditionStage": (
+        (
+            "assessment",
+            "assessment",
+            True,
+            "reference",
+            ("ClinicalImpression", "DiagnosticReport", "Observation"),
+        ),
+    ),
+    "Consent": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("organization", "organization", True, "reference", ("Organization",)),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        (
+            "performer",
+            "performer",
+            True,
+            "reference",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "PractitionerRole",
+            ),
+        ),
+        ("provision", "provision", False, "element", None),
+        (
+            "sourceReference",
+            "sourceReference",
+            False,
+            "reference",
+            ("Consent", "DocumentReference", "Contract", "QuestionnaireResponse"),
+        ),
+        ("verification", "verification", True, "element", None),
+    ),
+    "ConsentProvision": (
+        ("actor", "actor", True, "element", None),
+        ("data", "data", True, "element", None),
+        ("provision", "provision", True, "element", None),
+    ),
+    "ConsentProvisionActor": (
+        (
+            "reference",
+            "reference",
+            False,
+            "reference",
+            (
+                "Device",
+                "Group",
+                "CareTeam",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "PractitionerRole",
+            ),
+        ),
+    ),
+    "ConsentProvisionData": (
+        ("reference", "reference", False, "reference", ("Resource",)),
+    ),
+    "ConsentVerification": (
+        (
+            "verifiedWith",
+            "verifiedWith",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson"),
+        ),
+    ),
+    "Contract": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("authority", "authority", True, "reference", ("Organization",)),
+        ("contentDefinition", "contentDefinition", False, "element", None),
+        ("domain", "domain", True, "reference", ("Location",)),
+        ("friendly", "friendly", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "instantiatesCanonical",
+            "instantiatesCanonical",
+            False,
+            "reference",
+            ("Contract",),
+        ),
+        ("legal", "legal", True, "element", None),
+        (
+            "legallyBindingReference",
+            "legallyBindingReference",
+            False,
+            "reference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse", "Contract"),
+        ),
+        ("relevantHistory", "relevantHistory", True, "reference", ("Provenance",)),
+        ("rule", "rule", True, "element", None),
+        ("signer", "signer", True, "element", None),
+        ("site", "site", True, "reference", ("Location",)),
+        ("subject", "subject", True, "reference", ("Resource",)),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+        ("term", "term", True, "element", None),
+        ("topicReference", "topicReference", False, "reference", ("Resource",)),
+    ),
+    "ContractContentDefinition": (
+        (
+            "publisher",
+            "publisher",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "ContractFriendly": (
+        (
+            "contentReference",
+            "contentReference",
+            False,
+            "reference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+    ),
+    "ContractLegal": (
+        (
+            "contentReference",
+            "contentReference",
+            False,
+            "reference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+    ),
+    "ContractRule": (
+        (
+            "contentReference",
+            "contentReference",
+            False,
+            "reference",
+            ("DocumentReference",),
+        ),
+    ),
+    "ContractSigner": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("signature", "signature", True, "element", None),
+    ),
+    "ContractTerm": (
+        ("action", "action", True, "element", None),
+        ("asset", "asset", True, "element", None),
+        ("group", "group", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("offer", "offer", False, "element", None),
+        ("topicReference", "topicReference", False, "reference", ("Resource",)),
+    ),
+    "ContractTermAction": (
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("note", "note", True, "element", None),
+        (
+            "performer",
+            "performer",
+            False,
+            "reference",
+            (
+                "RelatedPerson",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "CareTeam",
+                "Device",
+                "Substance",
+                "Organization",
+                "Location",
+            ),
+        ),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            (
+                "Condition",
+                "Observation",
+                "DiagnosticReport",
+                "DocumentReference",
+                "Questionnaire",
+                "QuestionnaireResponse",
+            ),
+        ),
+        (
+            "requester",
+            "requester",
+            True,
+            "reference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+        ("subject", "subject", True, "element", None),
+    ),
+    "ContractTermActionSubject": (
+        (
+            "reference",
+            "reference",
+            True,
+            "reference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+    ),
+    "ContractTermAsset": (
+        ("answer", "answer", True, "element", None),
+        ("context", "context", True, "element", None),
+        ("typeReference", "typeReference", True, "reference", ("Resource",)),
+        ("valuedItem", "valuedItem", True, "element", None),
+    ),
+    "ContractTermAssetContext": (
+        ("reference", "reference", False, "reference", ("Resource",)),
+    ),
+    "ContractTermAssetValuedItem": (
+        ("entityReference", "entityReference", False, "reference", ("Resource",)),
+        ("identifier", "identifier", False, "element", None),
+        (
+            "recipient",
+            "recipient",
+            False,
+            "reference",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "responsible",
+            "responsible",
+            False,
+            "reference",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "ContractTermOffer": (
+        ("answer", "answer", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("party", "party", True, "element", None),
+        ("topic", "topic", False, "reference", ("Resource",)),
+    ),
+    "ContractTermOfferAnswer": (
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "ContractTermOfferParty": (
+        (
+            "reference",
+            "reference",
+            True,
+            "reference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+    ),
+    "Coverage": (
+        ("contained", "contained", True, "resource", None),
+        ("beneficiary", "beneficiary", False, "reference", ("Patient",)),
+        ("contract", "contract", True, "reference", ("Contract",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "payor",
+            "payor",
+            True,
+            "reference",
+            ("Organization", "Patient", "RelatedPerson"),
+        ),
+        (
+            "policyHolder",
+            "policyHolder",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson", "Organization"),
+        ),
+        ("subscriber", "subscriber", False, "reference", ("Patient", "RelatedPerson")),
+    ),
+    "CoverageEligibilityRequest": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "enterer",
+            "enterer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("facility", "facility", False, "reference", ("Location",)),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("item", "item", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("supportingInfo", "supportingInfo", True, "element", None),
+    ),
+    "CoverageEligibilityRequestInsurance": (
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+    ),
+    "CoverageEligibilityRequestItem": (
+        ("detail", "detail", True, "reference", ("Resource",)),
+        ("diagnosis", "diagnosis", True, "element", None),
+        ("facility", "facility", False, "reference", ("Location", "Organization")),
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+    ),
+    "CoverageEligibilityRequestItemDiagnosis": (
+        (
+            "diagnosisReference",
+            "diagnosisReference",
+            False,
+            "reference",
+            ("Condition",),
+        ),
+    ),
+    "CoverageEligibilityRequestSupportingInfo": (
+        ("information", "information", False, "reference", ("Resource",)),
+    ),
+    "CoverageEligibilityResponse": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("request", "request", False, "reference", ("CoverageEligibilityRequest",)),
+        (
+            "requestor",
+            "requestor",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "CoverageEligibilityResponseInsurance": (
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+        ("item", "item", True, "element", None),
+    ),
+    "CoverageEligibilityResponseInsuranceItem": (
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+    ),
+    "DataRequirement": (
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+    ),
+    "DetectedIssue": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Device"),
+        ),
+        ("evidence", "evidence", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("implicated", "implicated", True, "reference", ("Resource",)),
+        ("mitigation", "mitigation", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+    ),
+    "DetectedIssueEvidence": (("detail", "detail", True, "reference", ("Resource",)),),
+    "DetectedIssueMitigation": (
+        ("author", "author", False, "reference", ("Practitioner", "PractitionerRole")),
+    ),
+    "Device": (
+        ("contained", "contained", True, "resource", None),
+        ("definition", "definition", False, "reference", ("DeviceDefinition",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        ("owner", "owner", False, "reference", ("Organization",)),
+        ("parent", "parent", False, "reference", ("Device",)),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("version", "version", True, "element", None),
+    ),
+    "DeviceDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "manufacturerReference",
+            "manufacturerReference",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        ("note", "note", True, "element", None),
+        ("owner", "owner", False, "reference", ("Organization",)),
+        ("parentDevice", "parentDevice", False, "reference", ("DeviceDefinition",)),
+        ("shelfLifeStorage", "shelfLifeStorage", True, "element", None),
+    ),
+    "DeviceMetric": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("parent", "parent", False, "reference", ("Device",)),
+        ("source", "source", False, "reference", ("Device",)),
+    ),
+    "DeviceRequest": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("codeReference", "codeReference", False, "reference", ("Device",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "reference", ("Coverage", "ClaimResponse")),
+        ("note", "note", True, "element", None),
+        (
+            "performer",
+            "performer",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("priorRequest", "priorRequest", True, "reference", ("Resource",)),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("relevantHistory", "relevantHistory", True, "reference", ("Provenance",)),
+        (
+            "requester",
+            "requester",
+            False,
+            "reference",
+            ("Device", "Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Location", "Device"),
+        ),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+    ),
+    "DeviceUseStatement": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("ServiceRequest",)),
+        (
+            "derivedFrom",
+            "derivedFrom",
+            True,
+            "reference",
+            (
+                "ServiceRequest",
+                "Procedure",
+                "Claim",
+                "Observation",
+                "QuestionnaireResponse",
+                "DocumentReference",
+            ),
+        ),
+        ("device", "device", False, "reference", ("Device",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            (
+                "Condition",
+                "Observation",
+                "DiagnosticReport",
+                "DocumentReference",
+                "Media",
+            ),
+        ),
+        (
+            "source",
+            "source",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "PractitionerRole", "RelatedPerson"),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "DeviceVersion": (("component", "component", False, "element", None),),
+    "DiagnosticReport": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+            ),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("imagingStudy", "imagingStudy", True, "reference", ("ImagingStudy",)),
+        ("media", "media", True, "element", None),
+        (
+            "performer",
+            "performer",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization", "CareTeam"),
+        ),
+        ("result", "result", True, "reference", ("Observation",)),
+        (
+            "resultsInterpreter",
+            "resultsInterpreter",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization", "CareTeam"),
+        ),
+        ("specimen", "specimen", True, "reference", ("Specimen",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "Location",
+                "Organization",
+                "Procedure",
+                "Practitioner",
+                "Medication",
+                "Substance",
+            ),
+        ),
+    ),
+    "DiagnosticReportMedia": (("link", "link", False, "reference", ("Media",)),),
+    "DocumentManifest": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            True,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("content", "content", True, "reference", ("Resource",)),
+        ("identifier", "identifier", True, "element", None),
+        ("masterIdentifier", "masterIdentifier", False, "element", None),
+        (
+            "recipient",
+            "recipient",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("related", "related", True, "element", None),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "Group", "Device"),
+        ),
+    ),
+    "DocumentManifestRelated": (
+        ("identifier", "identifier", False, "element", None),
+        ("ref", "ref", False, "reference", ("Resource",)),
+    ),
+    "DocumentReference": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "authenticator",
+            "authenticator",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "author",
+            "author",
+            True,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("context", "context", False, "element", None),
+        ("custodian", "custodian", False, "reference", ("Organization",)),
+        ("identifier", "identifier", True, "element", None),
+        ("masterIdentifier", "masterIdentifier", False, "element", None),
+        ("relatesTo", "relatesTo", True, "element", None),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "Group", "Device"),
+        ),
+    ),
+    "DocumentReferenceContext": (
+        ("encounter", "encounter", True, "reference", ("Encounter", "EpisodeOfCare")),
+        ("related", "related", True, "reference", ("Resource",)),
+        ("sourcePatientInfo", "sourcePatientInfo", False, "reference", ("Patient",)),
+    ),
+    "DocumentReferenceRelatesTo": (
+        ("target", "target", False, "reference", ("DocumentReference",)),
+    ),
+    "DomainResource": (("contained", "contained", True, "resource", None),),
+    "ElementDefinition": (
+        ("defaultValueAnnotation", "defaultValueAnnotation", False, "element", None),
+        (
+            "defaultValueCodeableReference",
+            "defaultValueCodeableReference",
+            False,
+            "codeable",
+            None,
+        ),
+        (
+            "defaultValueDataRequirement",
+            "defaultValueDataRequirement",
+            False,
+            "element",
+            None,
+        ),
+        ("defaultValueIdentifier", "defaultValueIdentifier", False, "element", None),
+        ("defaultValueReference", "defaultValueReference", False, "reference", None),
+        ("defaultValueSignature", "defaultValueSignature", False, "element", None),
+        (
+            "defaultValueTriggerDefinition",
+            "defaultValueTriggerDefinition",
+            False,
+            "element",
+            None,
+        ),
+        (
+            "defaultValueUsageContext",
+            "defaultValueUsageContext",
+            False,
+            "element",
+            None,
+        ),
+        ("example", "example", True, "element", None),
+        ("fixedAnnotation", "fixedAnnotation", False, "element", None),
+        ("fixedCodeableReference", "fixedCodeableReference", False, "codeable", None),
+        ("fixedDataRequirement", "fixedDataRequirement", False, "element", None),
+        ("fixedIdentifier", "fixedIdentifier", False, "element", None),
+        ("fixedReference", "fixedReference", False, "reference", None),
+        ("fixedSignature", "fixedSignature", False, "element", None),
+        ("fixedTriggerDefinition", "fixedTriggerDefinition", False, "element", None),
+        ("fixedUsageContext", "fixedUsageContext", False, "element", None),
+        ("patternAnnotation", "patternAnnotation", False, "element", None),
+        (
+            "patternCodeableReference",
+            "patternCodeableReference",
+            False,
+            "codeable",
+            None,
+        ),
+        ("patternDataRequirement", "patternDataRequirement", False, "element", None),
+        ("patternIdentifier", "patternIdentifier", False, "element", None),
+        ("patternReference", "patternReference", False, "reference", None),
+        ("patternSignature", "patternSignature", False, "element", None),
+        (
+            "patternTriggerDefinition",
+            "patternTriggerDefinition",
+            False,
+            "element",
+            None,
+        ),
+        ("patternUsageContext", "patternUsageContext", False, "element", None),
+    ),
+    "ElementDefinitionExample": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueCodeableReference", "valueCodeableReference", False, "codeable", None),
+        ("valueDataRequirement", "valueDataRequirement", False, "element", None),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+        ("valueTriggerDefinition", "valueTriggerDefinition", False, "element", None),
+        ("valueUsageContext", "valueUsageContext", False, "element", None),
+    ),
+    "Encounter": (
+        ("contained", "contained", True, "resource", None),
+        ("account", "account", True, "reference", ("Account",)),
+        ("appointment", "appointment", True, "reference", ("Appointment",)),
+        ("basedOn", "basedOn", True, "reference", ("ServiceRequest",)),
+        ("diagnosis", "diagnosis", True, "element", None),
+        ("episodeOfCare", "episodeOfCare", True, "reference", ("EpisodeOfCare",)),
+        ("hospitalization", "hospitalization", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", True, "element", None),
+        ("partOf", "partOf", False, "reference", ("Encounter",)),
+        ("participant", "participant", True, "element", None),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Procedure", "Observation", "ImmunizationRecommendation"),
+        ),
+        ("serviceProvider", "serviceProvider", False, "reference", ("Organization",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "EncounterDiagnosis": (
+        ("condition", "condition", False, "reference", ("Condition", "Procedure")),
+    ),
+    "EncounterHospitalization": (
+        (
+            "destination",
+            "destination",
+            False,
+            "reference",
+            ("Location", "Organization"),
+        ),
+        ("origin", "origin", False, "reference", ("Location", "Organization")),
+        ("preAdmissionIdentifier", "preAdmissionIdentifier", False, "element", None),
+    ),
+    "EncounterLocation": (("location", "location", False, "reference", ("Location",)),),
+    "EncounterParticipant": (
+        (
+            "individual",
+            "individual",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "RelatedPerson"),
+        ),
+    ),
+    "Endpoint": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "EnrollmentRequest": (
+        ("contained", "contained", True, "resource", None),
+        ("candidate", "candidate", False, "reference", ("Patient",)),
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+        ("identifier", "identifier", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "EnrollmentResponse": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        ("request", "request", False, "reference", ("EnrollmentRequest",)),
+        (
+            "requestProvider",
+            "requestProvider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "EpisodeOfCare": (
+        ("contained", "contained", True, "resource", None),
+        ("account", "account", True, "reference", ("Account",)),
+        (
+            "careManager",
+            "careManager",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("diagnosis", "diagnosis", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("referralRequest", "referralRequest", True, "reference", ("ServiceRequest",)),
+        ("team", "team", True, "reference", ("CareTeam",)),
+    ),
+    "EpisodeOfCareDiagnosis": (
+        ("condition", "condition", False, "reference", ("Condition",)),
+    ),
+    "EventDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+        ("trigger", "trigger", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "Evidence": (
+        ("contained", "contained", True, "resource", None),
+        ("certainty", "certainty", True, "element", None),
+        ("citeAsReference", "citeAsReference", False, "reference", ("Citation",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("statistic", "statistic", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+        ("variableDefinition", "variableDefinition", True, "element", None),
+    ),
+    "EvidenceCertainty": (
+        ("note", "note", True, "element", None),
+        ("subcomponent", "subcomponent", True, "element", None),
+    ),
+    "EvidenceReport": (
+        ("contained", "contained", True, "resource", None),
+        ("citeAsReference", "citeAsReference", False, "reference", ("Citation",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("relatedIdentifier", "relatedIdentifier", True, "element", None),
+        ("relatesTo", "relatesTo", True, "element", None),
+        ("section", "section", True, "element", None),
+        ("subject", "subject", False, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "EvidenceReportRelatesTo": (
+        ("targetIdentifier", "targetIdentifier", False, "element", None),
+        ("targetReference", "targetReference", False, "reference", ("EvidenceReport",)),
+    ),
+    "EvidenceReportSection": (
+        (
+            "author",
+            "author",
+            True,
+            "reference",
+            ("Person", "Device", "Group", "Organization"),
+        ),
+        ("entryReference", "entryReference", True, "reference", ("Resource",)),
+        ("focusReference", "focusReference", False, "reference", ("Resource",)),
+        ("section", "section", True, "element", None),
+    ),
+    "EvidenceReportSubject": (
+        ("characteristic", "characteristic", True, "element", None),
+        ("note", "note", True, "element", None),
+    ),
+    "EvidenceReportSubjectCharacteristic": (
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "EvidenceStatistic": (
+        ("attributeEstimate", "attributeEstimate", True, "element", None),
+        ("modelCharacteristic", "modelCharacteristic", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("sampleSize", "sampleSize", False, "element", None),
+    ),
+    "EvidenceStatisticAttributeEstimate": (
+        ("attributeEstimate", "attributeEstimate", True, "element", None),
+        ("note", "note", True, "element", None),
+    ),
+    "EvidenceStatisticModelCharacteristic": (
+        ("attributeEstimate", "attributeEstimate", True, "element", None),
+        ("variable", "variable", True, "element", None),
+    ),
+    "EvidenceStatisticModelCharacteristicVariable": (
+        (
+            "variableDefinition",
+            "variableDefinition",
+            False,
+            "reference",
+            ("Group", "EvidenceVariable"),
+        ),
+    ),
+    "EvidenceStatisticSampleSize": (("note", "note", True, "element", None),),
+    "EvidenceVariable": (
+        ("contained", "contained", True, "resource", None),
+        ("characteristic", "characteristic", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "EvidenceVariableCharacteristic": (
+        (
+            "definitionReference",
+            "definitionReference",
+            False,
+            "reference",
+            ("Group", "EvidenceVariable"),
+        ),
+        ("device", "device", False, "reference", ("Device", "DeviceMetric")),
+        ("timeFromStart", "timeFromStart", False, "element", None),
+    ),
+    "EvidenceVariableCharacteristicTimeFromStart": (
+        ("note", "note", True, "element", None),
+    ),
+    "EvidenceVariableDefinition": (
+        ("intended", "intended", False, "reference", ("Group", "EvidenceVariable")),
+        ("note", "note", True, "element", None),
+        ("observed", "observed", False, "reference", ("Group", "EvidenceVariable")),
+    ),
+    "ExampleScenario": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "ExplanationOfBenefit": (
+        ("contained", "contained", True, "resource", None),
+        ("accident", "accident", False, "element", None),
+        ("addItem", "addItem", True, "element", None),
+        ("careTeam", "careTeam", True, "element", None),
+        ("claim", "claim", False, "reference", ("Claim",)),
+        ("claimResponse", "claimResponse", False, "reference", ("ClaimResponse",)),
+        ("diagnosis", "diagnosis", True, "element", None),
+        (
+            "enterer",
+            "enterer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("facility", "facility", False, "reference", ("Location",)),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("item", "item", True, "element", None),
+        (
+            "originalPrescription",
+            "originalPrescription",
+            False,
+            "reference",
+            ("MedicationRequest",),
+        ),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("payee", "payee", False, "element", None),
+        ("payment", "payment", False, "element", None),
+        (
+            "prescription",
+            "prescription",
+            False,
+            "reference",
+            ("MedicationRequest", "VisionPrescription"),
+        ),
+        ("procedure", "procedure", True, "element", None),
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("referral", "referral", False, "reference", ("ServiceRequest",)),
+        ("related", "related", True, "element", None),
+        ("supportingInfo", "supportingInfo", True, "element", None),
+    ),
+    "ExplanationOfBenefitAccident": (
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+    ),
+    "ExplanationOfBenefitAddItem": (
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+        (
+            "provider",
+            "provider",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "ExplanationOfBenefitCareTeam": (
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "ExplanationOfBenefitDiagnosis": (
+        (
+            "diagnosisReference",
+            "diagnosisReference",
+            False,
+            "reference",
+            ("Condition",),
+        ),
+    ),
+    "ExplanationOfBenefitInsurance": (
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+    ),
+    "ExplanationOfBenefitItem": (
+        ("detail", "detail", True, "element", None),
+        ("encounter", "encounter", True, "reference", ("Encounter",)),
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ExplanationOfBenefitItemDetail": (
+        ("subDetail", "subDetail", True, "element", None),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ExplanationOfBenefitItemDetailSubDetail": (
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ExplanationOfBenefitPayee": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "ExplanationOfBenefitPayment": (
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "ExplanationOfBenefitProcedure": (
+        (
+            "procedureReference",
+            "procedureReference",
+            False,
+            "reference",
+            ("Procedure",),
+        ),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ExplanationOfBenefitRelated": (
+        ("claim", "claim", False, "reference", ("Claim",)),
+        ("reference", "reference", False, "element", None),
+    ),
+    "ExplanationOfBenefitSupportingInfo": (
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "Extension": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueCodeableReference", "valueCodeableReference", False, "codeable", None),
+        ("valueDataRequirement", "valueDataRequirement", False, "element", None),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+        ("valueTriggerDefinition", "valueTriggerDefinition", False, "element", None),
+        ("valueUsageContext", "valueUsageContext", False, "element", None),
+    ),
+    "FamilyMemberHistory": (
+        ("contained", "contained", True, "resource", None),
+        ("condition", "condition", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            (
+                "Condition",
+                "Observation",
+                "AllergyIntolerance",
+                "QuestionnaireResponse",
+                "DiagnosticReport",
+                "DocumentReference",
+            ),
+        ),
+    ),
+    "FamilyMemberHistoryCondition": (("note", "note", True, "element", None),),
+    "Flag": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Device", "Organization", "Patient", "Practitioner", "PractitionerRole"),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Location",
+                "Group",
+                "Organization",
+                "Practitioner",
+                "PlanDefinition",
+                "Medication",
+                "Procedure",
+            ),
+        ),
+    ),
+    "Goal": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "addresses",
+            "addresses",
+            True,
+            "reference",
+            (
+                "Condition",
+                "Observation",
+                "MedicationStatement",
+                "NutritionOrder",
+                "ServiceRequest",
+                "RiskAssessment",
+            ),
+        ),
+        (
+            "expressedBy",
+            "expressedBy",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "PractitionerRole", "RelatedPerson"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("outcomeReference", "outcomeReference", True, "reference", ("Observation",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Organization"),
+        ),
+    ),
+    "GraphDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "Group": (
+        ("contained", "contained", True, "resource", None),
+        ("characteristic", "characteristic", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingEntity",
+            "managingEntity",
+            False,
+            "reference",
+            ("Organization", "RelatedPerson", "Practitioner", "PractitionerRole"),
+        ),
+        ("member", "member", True, "element", None),
+    ),
+    "GroupCharacteristic": (
+        ("valueReference", "valueReference", False, "reference", None),
+    ),
+    "GroupMember": (
+        (
+            "entity",
+            "entity",
+            False,
+            "reference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Medication",
+                "Substance",
+                "Group",
+            ),
+        ),
+    ),
+    "GuidanceResponse": (
+        ("contained", "contained", True, "resource", None),
+        ("dataRequirement", "dataRequirement", True, "element", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        (
+            "evaluationMessage",
+            "evaluationMessage",
+            True,
+            "reference",
+            ("OperationOutcome",),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("outputParameters", "outputParameters", False, "reference", ("Parameters",)),
+        ("performer", "performer", False, "reference", ("Device",)),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("requestIdentifier", "requestIdentifier", False, "element", None),
+        ("result", "result", False, "reference", ("CarePlan", "RequestGroup")),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "HealthcareService": (
+        ("contained", "contained", True, "resource", None),
+        ("coverageArea", "coverageArea", True, "reference", ("Location",)),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", True, "reference", ("Location",)),
+        ("providedBy", "providedBy", False, "reference", ("Organization",)),
+    ),
+    "Identifier": (("assigner", "assigner", False, "reference", ("Organization",)),),
+    "ImagingStudy": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "ServiceRequest",
+                "Appointment",
+                "AppointmentResponse",
+                "Task",
+            ),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "interpreter",
+            "interpreter",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        (
+            "procedureReference",
+            "procedureReference",
+            False,
+            "reference",
+            ("Procedure",),
+        ),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            (
+                "Condition",
+                "Observation",
+                "Media",
+                "DiagnosticReport",
+                "DocumentReference",
+            ),
+        ),
+        (
+            "referrer",
+            "referrer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("series", "series", True, "element", None),
+        ("subject", "subject", False, "reference", ("Patient", "Device", "Group")),
+    ),
+    "ImagingStudySeries": (
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("performer", "performer", True, "element", None),
+        ("specimen", "specimen", True, "reference", ("Specimen",)),
+    ),
+    "ImagingStudySeriesPerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "Immunization": (
+        ("contained", "contained", True, "resource", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("manufacturer", "manufacturer", False, "reference", ("Organization",)),
+        ("note", "note", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("performer", "performer", True, "element", None),
+        ("protocolApplied", "protocolApplied", True, "element", None),
+        ("reaction", "reaction", True, "element", None),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation", "DiagnosticReport"),
+        ),
+    ),
+    "ImmunizationEvaluation": (
+        ("contained", "contained", True, "resource", None),
+        ("authority", "authority", False, "reference", ("Organization",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "immunizationEvent",
+            "immunizationEvent",
+            False,
+            "reference",
+            ("Immunization",),
+        ),
+        ("patient", "patient", False, "reference", ("Patient",)),
+    ),
+    "ImmunizationPerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "ImmunizationProtocolApplied": (
+        ("authority", "authority", False, "reference", ("Organization",)),
+    ),
+    "ImmunizationReaction": (
+        ("detail", "detail", False, "reference", ("Observation",)),
+    ),
+    "ImmunizationRecommendation": (
+        ("contained", "contained", True, "resource", None),
+        ("authority", "authority", False, "reference", ("Organization",)),
+        ("identifier", "identifier", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("recommendation", "recommendation", True, "element", None),
+    ),
+    "ImmunizationRecommendationRecommendation": (
+        (
+            "supportingImmunization",
+            "supportingImmunization",
+            True,
+            "reference",
+            ("Immunization", "ImmunizationEvaluation"),
+        ),
+        (
+            "supportingPatientInformation",
+            "supportingPatientInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "ImplementationGuide": (
+        ("contained", "contained", True, "resource", None),
+        ("definition", "definition", False, "element", None),
+        ("manifest", "manifest", False, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "ImplementationGuideDefinition": (
+        ("page", "page", False, "element", None),
+        ("resource", "resource", True, "element", None),
+    ),
+    "ImplementationGuideDefinitionPage": (
+        ("nameReference", "nameReference", False, "reference", ("Binary",)),
+        ("page", "page", True, "element", None),
+    ),
+    "ImplementationGuideDefinitionResource": (
+        ("reference", "reference", False, "reference", ("Resource",)),
+    ),
+    "ImplementationGuideManifest": (("resource", "resource", True, "element", None),),
+    "ImplementationGuideManifestResource": (
+        ("reference", "reference", False, "reference", ("Resource",)),
+    ),
+    "Ingredient": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "for_fhir",
+            "for",
+            True,
+            "reference",
+            (
+                "MedicinalProductDefinition",
+                "AdministrableProductDefinition",
+                "ManufacturedItemDefinition",
+            ),
+        ),
+        ("identifier", "identifier", False, "element", None),
+        ("manufacturer", "manufacturer", True, "element", None),
+        ("substance", "substance", False, "element", None),
+    ),
+    "IngredientManufacturer": (
+        ("manufacturer", "manufacturer", False, "reference", ("Organization",)),
+    ),
+    "IngredientSubstance": (
+        ("code", "code", False, "codeable", ("SubstanceDefinition",)),
+        ("strength", "strength", True, "element", None),
+    ),
+    "IngredientSubstanceStrength": (
+        ("referenceStrength", "referenceStrength", True, "element", None),
+    ),
+    "IngredientSubstanceStrengthReferenceStrength": (
+        ("substance", "substance", False, "codeable", ("SubstanceDefinition",)),
+    ),
+    "InsurancePlan": (
+        ("contained", "contained", True, "resource", None),
+        ("administeredBy", "administeredBy", False, "reference", ("Organization",)),
+        ("coverage", "coverage", True, "element", None),
+        ("coverageArea", "coverageArea", True, "reference", ("Location",)),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        ("network", "network", True, "reference", ("Organization",)),
+        ("ownedBy", "ownedBy", False, "reference", ("Organization",)),
+        ("plan", "plan", True, "element", None),
+    ),
+    "InsurancePlanCoverage": (
+        ("network", "network", True, "reference", ("Organization",)),
+    ),
+    "InsurancePlanPlan": (
+        ("coverageArea", "coverageArea", True, "reference", ("Location",)),
+        ("identifier", "identifier", True, "element", None),
+        ("network", "network", True, "reference", ("Organization",)),
+    ),
+    "Invoice": (
+        ("contained", "contained", True, "resource", None),
+        ("account", "account", False, "reference", ("Account",)),
+        ("identifier", "identifier", True, "element", None),
+        ("issuer", "issuer", False, "reference", ("Organization",)),
+        ("lineItem", "lineItem", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("participant", "participant", True, "element", None),
+        (
+            "recipient",
+            "recipient",
+            False,
+            "reference",
+            ("Organization", "Patient", "RelatedPerson"),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "InvoiceLineItem": (
+        (
+            "chargeItemReference",
+            "chargeItemReference",
+            False,
+            "reference",
+            ("ChargeItem",),
+        ),
+    ),
+    "InvoiceParticipant": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "Organization",
+                "Patient",
+                "PractitionerRole",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "Library": (
+        ("contained", "contained", True, "resource", None),
+        ("dataRequirement", "dataRequirement", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "Linkage": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("item", "item", True, "element", None),
+    ),
+    "LinkageItem": (("resource", "resource", False, "reference", ("Resource",)),),
+    "List": (
+        ("contained", "contained", True, "resource", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("entry", "entry", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "source",
+            "source",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Patient", "Device"),
+        ),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Device", "Location"),
+        ),
+    ),
+    "ListEntry": (("item", "item", False, "reference", ("Resource",)),),
+    "Location": (
+        ("contained", "contained", True, "resource", None),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        ("partOf", "partOf", False, "reference", ("Location",)),
+    ),
+    "ManufacturedItemDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("manufacturer", "manufacturer", True, "reference", ("Organization",)),
+    ),
+    "Measure": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "MeasureReport": (
+        ("contained", "contained", True, "resource", None),
+        ("evaluatedResource", "evaluatedResource", True, "reference", ("Resource",)),
+        ("group", "group", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "reporter",
+            "reporter",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Location", "Organization"),
+        ),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "Location",
+                "Device",
+                "RelatedPerson",
+                "Group",
+            ),
+        ),
+    ),
+    "MeasureReportGroup": (
+        ("population", "population", True, "element", None),
+        ("stratifier", "stratifier", True, "element", None),
+    ),
+    "MeasureReportGroupPopulation": (
+        ("subjectResults", "subjectResults", False, "reference", ("List",)),
+    ),
+    "MeasureReportGroupStratifier": (("stratum", "stratum", True, "element", None),),
+    "MeasureReportGroupStratifierStratum": (
+        ("population", "population", True, "element", None),
+    ),
+    "MeasureReportGroupStratifierStratumPopulation": (
+        ("subjectResults", "subjectResults", False, "reference", ("List",)),
+    ),
+    "Media": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("ServiceRequest", "CarePlan")),
+        ("device", "device", False, "reference", ("Device", "DeviceMetric", "Device")),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "operator",
+            "operator",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("partOf", "partOf", True, "reference", ("Resource",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "Group",
+                "Device",
+                "Specimen",
+                "Location",
+            ),
+        ),
+    ),
+    "Medication": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("ingredient", "ingredient", True, "element", None),
+        ("manufacturer", "manufacturer", False, "reference", ("Organization",)),
+    ),
+    "MedicationAdministration": (
+        ("contained", "contained", True, "resource", None),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("device", "device", True, "reference", ("Device",)),
+        ("eventHistory", "eventHistory", True, "reference", ("Provenance",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "medicationReference",
+            "medicationReference",
+            False,
+            "reference",
+            ("Medication",),
+        ),
+        ("note", "note", True, "element", None),
+        (
+            "partOf",
+            "partOf",
+            True,
+            "reference",
+            ("MedicationAdministration", "Procedure"),
+        ),
+        ("performer", "performer", True, "element", None),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation", "DiagnosticReport"),
+        ),
+        ("request", "request", False, "reference", ("MedicationRequest",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "MedicationAdministrationPerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson", "Device"),
+        ),
+    ),
+    "MedicationDispense": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "authorizingPrescription",
+            "authorizingPrescription",
+            True,
+            "reference",
+            ("MedicationRequest",),
+        ),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("destination", "destination", False, "reference", ("Location",)),
+        ("detectedIssue", "detectedIssue", True, "reference", ("DetectedIssue",)),
+        ("eventHistory", "eventHistory", True, "reference", ("Provenance",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        (
+            "medicationReference",
+            "medicationReference",
+            False,
+            "reference",
+            ("Medication",),
+        ),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("Procedure",)),
+        ("performer", "performer", True, "element", None),
+        ("receiver", "receiver", True, "reference", ("Patient", "Practitioner")),
+        (
+            "statusReasonReference",
+            "statusReasonReference",
+            False,
+            "reference",
+            ("DetectedIssue",),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        ("substitution", "substitution", False, "element", None),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "MedicationDispensePerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "MedicationDispenseSubstitution": (
+        (
+            "responsibleParty",
+            "responsibleParty",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+    ),
+    "MedicationIngredient": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            ("Substance", "Medication"),
+        ),
+    ),
+    "MedicationKnowledge": (
+        ("contained", "contained", True, "resource", None),
+        ("administrationGuidelines", "administrationGuidelines", True, "element", None),
+        (
+            "associatedMedication",
+            "associatedMedication",
+            True,
+            "reference",
+            ("Medication",),
+        ),
+        ("contraindication", "contraindication", True, "reference", ("DetectedIssue",)),
+        ("ingredient", "ingredient", True, "element", None),
+        ("manufacturer", "manufacturer", False, "reference", ("Organization",)),
+        ("monograph", "monograph", True, "element", None),
+        ("regulatory", "regulatory", True, "element", None),
+        (
+            "relatedMedicationKnowledge",
+            "relatedMedicationKnowledge",
+            True,
+            "element",
+            None,
+        ),
+    ),
+    "MedicationKnowledgeAdministrationGuidelines": (
+        (
+            "indicationReference",
+            "indicationReference",
+            False,
+            "reference",
+            ("ObservationDefinition",),
+        ),
+    ),
+    "MedicationKnowledgeIngredient": (
+        ("itemReference", "itemReference", False, "reference", ("Substance",)),
+    ),
+    "MedicationKnowledgeMonograph": (
+        ("source", "source", False, "reference", ("DocumentReference", "Media")),
+    ),
+    "MedicationKnowledgeRegulatory": (
+        (
+            "regulatoryAuthority",
+            "regulatoryAuthority",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "MedicationKnowledgeRelatedMedicationKnowledge": (
+        ("reference", "reference", True, "reference", ("MedicationKnowledge",)),
+    ),
+    "MedicationRequest": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "MedicationRequest",
+                "ServiceRequest",
+                "ImmunizationRecommendation",
+            ),
+        ),
+        ("detectedIssue", "detectedIssue", True, "reference", ("DetectedIssue",)),
+        ("dispenseRequest", "dispenseRequest", False, "element", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("eventHistory", "eventHistory", True, "reference", ("Provenance",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "reference", ("Coverage", "ClaimResponse")),
+        (
+            "medicationReference",
+            "medicationReference",
+            False,
+            "reference",
+            ("Medication",),
+        ),
+        ("note", "note", True, "element", None),
+        (
+            "performer",
+            "performer",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "CareTeam",
+            ),
+        ),
+        (
+            "priorPrescription",
+            "priorPrescription",
+            False,
+            "reference",
+            ("MedicationRequest",),
+        ),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation"),
+        ),
+        (
+            "recorder",
+            "recorder",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        (
+            "reportedReference",
+            "reportedReference",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "requester",
+            "requester",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "MedicationRequestDispenseRequest": (
+        ("performer", "performer", False, "reference", ("Organization",)),
+    ),
+    "MedicationStatement": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("MedicationRequest", "CarePlan", "ServiceRequest"),
+        ),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("derivedFrom", "derivedFrom", True, "reference", ("Resource",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "informationSource",
+            "informationSource",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "medicationReference",
+            "medicationReference",
+            False,
+            "reference",
+            ("Medication",),
+        ),
+        ("note", "note", True, "element", None),
+        (
+            "partOf",
+            "partOf",
+            True,
+            "reference",
+            (
+                "MedicationAdministration",
+                "MedicationDispense",
+                "MedicationStatement",
+                "Procedure",
+                "Observation",
+            ),
+        ),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation", "DiagnosticReport"),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "MedicinalProductDefinition": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "attachedDocument",
+            "attachedDocument",
+            True,
+            "reference",
+            ("DocumentReference",),
+        ),
+        ("clinicalTrial", "clinicalTrial", True, "reference", ("ResearchStudy",)),
+        ("contact", "contact", True, "element", None),
+        ("crossReference", "crossReference", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("impurity", "impurity", True, "codeable", ("SubstanceDefinition",)),
+        ("masterFile", "masterFile", True, "reference", ("DocumentReference",)),
+        ("operation", "operation", True, "element", None),
+    ),
+    "MedicinalProductDefinitionContact": (
+        (
+            "contact",
+            "contact",
+            False,
+            "reference",
+            ("Organization", "PractitionerRole"),
+        ),
+    ),
+    "MedicinalProductDefinitionCrossReference": (
+        ("product", "product", False, "codeable", ("MedicinalProductDefinition",)),
+    ),
+    "MedicinalProductDefinitionOperation": (
+        ("organization", "organization", True, "reference", ("Organization",)),
+        ("type", "type", False, "codeable", ("ActivityDefinition", "PlanDefinition")),
+    ),
+    "MessageDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "MessageHeader": (
+        ("contained", "contained", True, "resource", None),
+        ("author", "author", False, "reference", ("Practitioner", "PractitionerRole")),
+        ("destination", "destination", True, "element", None),
+        (
+            "enterer",
+            "enterer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("focus", "focus", True, "reference", ("Resource",)),
+        ("response", "response", False, "element", None),
+        (
+            "responsible",
+            "responsible",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "sender",
+            "sender",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "MessageHeaderDestination": (
+        (
+            "receiver",
+            "receiver",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("target", "target", False, "reference", ("Device",)),
+    ),
+    "MessageHeaderResponse": (
+        ("details", "details", False, "reference", ("OperationOutcome",)),
+    ),
+    "MolecularSequence": (
+        ("contained", "contained", True, "resource", None),
+        ("device", "device", False, "reference", ("Device",)),
+        ("identifier", "identifier", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("performer", "performer", False, "reference", ("Organization",)),
+        ("pointer", "pointer", True, "reference", ("MolecularSequence",)),
+        ("referenceSeq", "referenceSeq", False, "element", None),
+        ("specimen", "specimen", False, "reference", ("Specimen",)),
+        ("variant", "variant", True, "element", None),
+    ),
+    "MolecularSequenceReferenceSeq": (
+        (
+            "referenceSeqPointer",
+            "referenceSeqPointer",
+            False,
+            "reference",
+            ("MolecularSequence",),
+        ),
+    ),
+    "MolecularSequenceVariant": (
+        ("variantPointer", "variantPointer", False, "reference", ("Observation",)),
+    ),
+    "NamingSystem": (
+        ("contained", "contained", True, "resource", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "NutritionOrder": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "allergyIntolerance",
+            "allergyIntolerance",
+            True,
+            "reference",
+            ("AllergyIntolerance",),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "orderer",
+            "orderer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("patient", "patient", False, "reference", ("Patient",)),
+    ),
+    "NutritionProduct": (
+        ("contained", "contained", True, "resource", None),
+        ("ingredient", "ingredient", True, "element", None),
+        ("instance", "instance", False, "element", None),
+        ("knownAllergen", "knownAllergen", True, "codeable", ("Substance",)),
+        ("manufacturer", "manufacturer", True, "reference", ("Organization",)),
+        ("note", "note", True, "element", None),
+        ("nutrient", "nutrient", True, "element", None),
+    ),
+    "NutritionProductIngredient": (
+        ("item", "item", False, "codeable", ("NutritionProduct",)),
+    ),
+    "NutritionProductInstance": (("identifier", "identifier", True, "element", None),),
+    "NutritionProductNutrient": (("item", "item", False, "codeable", ("Substance",)),),
+    "Observation": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "DeviceRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+            ),
+        ),
+        (
+            "derivedFrom",
+            "derivedFrom",
+            True,
+            "reference",
+            (
+                "DocumentReference",
+                "ImagingStudy",
+                "Media",
+                "QuestionnaireResponse",
+                "Observation",
+                "MolecularSequence",
+            ),
+        ),
+        ("device", "device", False, "reference", ("Device", "DeviceMetric")),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("focus", "focus", True, "reference", ("Resource",)),
+        (
+            "hasMember",
+            "hasMember",
+            True,
+            "reference",
+            ("Observation", "QuestionnaireResponse", "MolecularSequence"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "partOf",
+            "partOf",
+            True,
+            "reference",
+            (
+                "MedicationAdministration",
+                "MedicationDispense",
+                "MedicationStatement",
+                "Procedure",
+                "Immunization",
+                "ImagingStudy",
+            ),
+        ),
+        (
+            "performer",
+            "performer",
+            True,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("specimen", "specimen", False, "reference", ("Specimen",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "Location",
+                "Organization",
+                "Procedure",
+                "Practitioner",
+                "Medication",
+                "Substance",
+            ),
+        ),
+    ),
+    "ObservationDefinition": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "abnormalCodedValueSet",
+            "abnormalCodedValueSet",
+            False,
+            "reference",
+            ("ValueSet",),
+        ),
+        (
+            "criticalCodedValueSet",
+            "criticalCodedValueSet",
+            False,
+            "reference",
+            ("ValueSet",),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "normalCodedValueSet",
+            "normalCodedValueSet",
+            False,
+            "reference",
+            ("ValueSet",),
+        ),
+        ("validCodedValueSet", "validCodedValueSet", False, "reference", ("ValueSet",)),
+    ),
+    "OperationDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "OperationOutcome": (("contained", "contained", True, "resource", None),),
+    "Organization": (
+        ("contained", "contained", True, "resource", None),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        ("partOf", "partOf", False, "reference", ("Organization",)),
+    ),
+    "OrganizationAffiliation": (
+        ("contained", "contained", True, "resource", None),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        (
+            "healthcareService",
+            "healthcareService",
+            True,
+            "reference",
+            ("HealthcareService",),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", True, "reference", ("Location",)),
+        ("network", "network", True, "reference", ("Organization",)),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        (
+            "participatingOrganization",
+            "participatingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "PackagedProductDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("manufacturer", "manufacturer", True, "reference", ("Organization",)),
+        ("package", "package", False, "element", None),
+        (
+            "packageFor",
+            "packageFor",
+            True,
+            "reference",
+            ("MedicinalProductDefinition",),
+        ),
+    ),
+    "PackagedProductDefinitionPackage": (
+        ("containedItem", "containedItem", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("manufacturer", "manufacturer", True, "reference", ("Organization",)),
+        ("package", "package", True, "element", None),
+    ),
+    "PackagedProductDefinitionPackageContainedItem": (
+        (
+            "item",
+            "item",
+            False,
+            "codeable",
+            (
+                "ManufacturedItemDefinition",
+                "DeviceDefinition",
+                "PackagedProductDefinition",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+            ),
+        ),
+    ),
+    "Parameters": (("parameter", "parameter", True, "element", None),),
+    "ParametersParameter": (
+        ("part", "part", True, "element", None),
+        ("resource", "resource", False, "resource", None),
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueDataRequirement", "valueDataRequirement", False, "element", None),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+        ("valueTriggerDefinition", "valueTriggerDefinition", False, "element", None),
+        ("valueUsageContext", "valueUsageContext", False, "element", None),
+    ),
+    "Patient": (
+        ("contained", "contained", True, "resource", None),
+        ("contact", "contact", True, "element", None),
+        (
+            "generalPractitioner",
+            "generalPractitioner",
+            True,
+            "reference",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("link", "link", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "PatientContact": (
+        ("organization", "organization", False, "reference", ("Organization",)),
+    ),
+    "PatientLink": (
+        ("other", "other", False, "reference", ("Patient", "RelatedPerson")),
+    ),
+    "PaymentNotice": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "payee",
+            "payee",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("payment", "payment", False, "reference", ("PaymentReconciliation",)),
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("recipient", "recipient", False, "reference", ("Organization",)),
+        ("request", "request", False, "reference", ("Resource",)),
+        ("response", "response", False, "reference", ("Resource",)),
+    ),
+    "PaymentReconciliation": (
+        ("contained", "contained", True, "resource", None),
+        ("detail", "detail", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("paymentIdentifier", "paymentIdentifier", False, "element", None),
+        ("paymentIssuer", "paymentIssuer", False, "reference", ("Organization",)),
+        ("request", "request", False, "reference", ("Task",)),
+        (
+            "requestor",
+            "requestor",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "PaymentReconciliationDetail": (
+        ("identifier", "identifier", False, "element", None),
+        (
+            "payee",
+            "payee",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("predecessor", "predecessor", False, "element", None),
+        ("request", "request", False, "reference", ("Resource",)),
+        ("response", "response", False, "reference", ("Resource",)),
+        ("responsible", "responsible", False, "reference", ("PractitionerRole",)),
+        (
+            "submitter",
+            "submitter",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "Person": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("link", "link", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "PersonLink": (
+        (
+            "target",
+            "target",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "RelatedPerson", "Person"),
+        ),
+    ),
+    "PlanDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("action", "action", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "PlanDefinitionAction": (
+        ("action", "action", True, "element", None),
+        ("input", "input", True, "element", None),
+        ("output", "output", True, "element", None),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+        ("trigger", "trigger", True, "element", None),
+    ),
+    "Practitioner": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("qualification", "qualification", True, "element", None),
+    ),
+    "PractitionerQualification": (
+        ("identifier", "identifier", True, "element", None),
+        ("issuer", "issuer", False, "reference", ("Organization",)),
+    ),
+    "PractitionerRole": (
+        ("contained", "contained", True, "resource", None),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        (
+            "healthcareService",
+            "healthcareService",
+            True,
+            "reference",
+            ("HealthcareService",),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", True, "reference", ("Location",)),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        ("practitioner", "practitioner", False, "reference", ("Practitioner",)),
+    ),
+    "Procedure": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "asserter",
+            "asserter",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson", "Practitioner", "PractitionerRole"),
+        ),
+        ("basedOn", "basedOn", True, "reference", ("CarePlan", "ServiceRequest")),
+        ("complicationDetail", "complicationDetail", True, "reference", ("Condition",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("focalDevice", "focalDevice", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        (
+            "partOf",
+            "partOf",
+            True,
+            "reference",
+            ("Procedure", "Observation", "MedicationAdministration"),
+        ),
+        ("performer", "performer", True, "element", None),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            (
+                "Condition",
+                "Observation",
+                "Procedure",
+                "DiagnosticReport",
+                "DocumentReference",
+            ),
+        ),
+        (
+            "recorder",
+            "recorder",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson", "Practitioner", "PractitionerRole"),
+        ),
+        (
+            "report",
+            "report",
+            True,
+            "reference",
+            ("DiagnosticReport", "DocumentReference", "Composition"),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        (
+            "usedReference",
+            "usedReference",
+            True,
+            "reference",
+            ("Device", "Medication", "Substance"),
+        ),
+    ),
+    "ProcedureFocalDevice": (
+        ("manipulated", "manipulated", False, "reference", ("Device",)),
+    ),
+    "ProcedurePerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "ProductShelfLife": (("identifier", "identifier", False, "element", None),),
+    "Provenance": (
+        ("contained", "contained", True, "resource", None),
+        ("agent", "agent", True, "element", None),
+        ("entity", "entity", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("signature", "signature", True, "element", None),
+        ("target", "target", True, "reference", ("Resource",)),
+    ),
+    "ProvenanceAgent": (
+        (
+            "onBehalfOf",
+            "onBehalfOf",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "who",
+            "who",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+    ),
+    "ProvenanceEntity": (
+        ("agent", "agent", True, "element", None),
+        ("what", "what", False, "reference", ("Resource",)),
+    ),
+    "Questionnaire": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("item", "item", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "QuestionnaireItem": (
+        ("answerOption", "answerOption", True, "element", None),
+        ("enableWhen", "enableWhen", True, "element", None),
+        ("initial", "initial", True, "element", None),
+        ("item", "item", True, "element", None),
+    ),
+    "QuestionnaireItemAnswerOption": (
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "QuestionnaireItemEnableWhen": (
+        ("answerReference", "answerReference", False, "reference", ("Resource",)),
+    ),
+    "QuestionnaireItemInitial": (
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "QuestionnaireResponse": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            (
+                "Device",
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("basedOn", "basedOn", True, "reference", ("CarePlan", "ServiceRequest")),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", False, "element", None),
+        ("item", "item", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("Observation", "Procedure")),
+        (
+            "source",
+            "source",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "PractitionerRole", "RelatedPerson"),
+        ),
+        ("subject", "subject", False, "reference", ("Resource",)),
+    ),
+    "QuestionnaireResponseItem": (
+        ("answer", "answer", True, "element", None),
+        ("item", "item", True, "element", None),
+    ),
+    "QuestionnaireResponseItemAnswer": (
+        ("item", "item", True, "element", None),
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "Reference": (("identifier", "identifier", False, "element", None),),
+    "RegulatedAuthorization": (
+        ("contained", "contained", True, "resource", None),
+        ("case", "case", False, "element", None),
+        ("holder", "holder", False, "reference", ("Organization",)),
+        ("identifier", "identifier", True, "element", None),
+        ("indication", "indication", False, "codeable", ("ClinicalUseDefinition",)),
+        ("regulator", "regulator", False, "reference", ("Organization",)),
+        (
+            "subject",
+            "subject",
+            True,
+            "reference",
+            (
+                "MedicinalProductDefinition",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+                "PackagedProductDefinition",
+                "SubstanceDefinition",
+                "DeviceDefinition",
+                "ResearchStudy",
+                "ActivityDefinition",
+                "PlanDefinition",
+                "ObservationDefinition",
+                "Practitioner",
+                "Organization",
+                "Location",
+            ),
+        ),
+    ),
+    "RegulatedAuthorizationCase": (
+        ("application", "application", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "RelatedPerson": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+    ),
+    "RequestGroup": (
+        ("contained", "contained", True, "resource", None),
+        ("action", "action", True, "element", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Device", "Practitioner", "PractitionerRole"),
+        ),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("replaces", "replaces", True, "reference", ("Resource",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "RequestGroupAction": (
+        ("action", "action", True, "element", None),
+        (
+            "participant",
+            "participant",
+            True,
+            "reference",
+            ("Patient", "Practitioner", "PractitionerRole", "RelatedPerson", "Device"),
+        ),
+        ("resource", "resource", False, "reference", ("Resource",)),
+    ),
+    "ResearchDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("exposure", "exposure", False, "reference", ("ResearchElementDefinition",)),
+        (
+            "exposureAlternative",
+            "exposureAlternative",
+            False,
+            "reference",
+            ("ResearchElementDefinition",),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("outcome", "outcome", False, "reference", ("ResearchElementDefinition",)),
+        (
+            "population",
+            "population",
+            False,
+            "reference",
+            ("ResearchElementDefinition",),
+        ),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "ResearchElementDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("characteristic", "characteristic", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "ResearchElementDefinitionCharacteristic": (
+        (
+            "definitionDataRequirement",
+            "definitionDataRequirement",
+            False,
+            "element",
+            None,
+        ),
+        ("usageContext", "usageContext", True, "element", None),
+    ),
+    "ResearchStudy": (
+        ("contained", "contained", True, "resource", None),
+        ("enrollment", "enrollment", True, "reference", ("Group",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("ResearchStudy",)),
+        (
+            "principalInvestigator",
+            "principalInvestigator",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("protocol", "protocol", True, "reference", ("PlanDefinition",)),
+        ("site", "site", True, "reference", ("Location",)),
+        ("sponsor", "sponsor", False, "reference", ("Organization",)),
+    ),
+    "ResearchSubject": (
+        ("contained", "contained", True, "resource", None),
+        ("consent", "consent", False, "reference", ("Consent",)),
+        ("identifier", "identifier", True, "element", None),
+        ("individual", "individual", False, "reference", ("Patient",)),
+        ("study", "study", False, "reference", ("ResearchStudy",)),
+    ),
+    "RiskAssessment": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", False, "reference", ("Resource",)),
+        ("basis", "basis", True, "reference", ("Resource",)),
+        ("condition", "condition", False, "reference", ("Condition",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("parent", "parent", False, "reference", ("Resource",)),
+        (
+            "performer",
+            "performer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Device"),
+        ),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "Schedule": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "actor",
+            "actor",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "SearchParameter": (
+        ("contained", "contained", True, "resource", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "ServiceRequest": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("CarePlan", "ServiceRequest", "MedicationRequest"),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "reference", ("Coverage", "ClaimResponse")),
+        ("locationReference", "locationReference", True, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        (
+            "performer",
+            "performer",
+            True,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("relevantHistory", "relevantHistory", True, "reference", ("Provenance",)),
+        ("replaces", "replaces", True, "reference", ("ServiceRequest",)),
+        (
+            "requester",
+            "requester",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        ("requisition", "requisition", False, "element", None),
+        ("specimen", "specimen", True, "reference", ("Specimen",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Location", "Device"),
+        ),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+    ),
+    "Signature": (
+        (
+            "onBehalfOf",
+            "onBehalfOf",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "who",
+            "who",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+    ),
+    "Slot": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("schedule", "schedule", False, "reference", ("Schedule",)),
+    ),
+    "Specimen": (
+        ("contained", "contained", True, "resource", None),
+        ("accessionIdentifier", "accessionIdentifier", False, "element", None),
+        ("collection", "collection", False, "element", None),
+        ("container", "container", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("parent", "parent", True, "reference", ("Specimen",)),
+        ("processing", "processing", True, "element", None),
+        ("request", "request", True, "reference", ("ServiceRequest",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Device", "Substance", "Location"),
+        ),
+    ),
+    "SpecimenCollection": (
+        (
+            "collector",
+            "collector",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+    ),
+    "SpecimenContainer": (
+        ("additiveReference", "additiveReference", False, "reference", ("Substance",)),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "SpecimenDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", False, "element", None),
+        ("typeTested", "typeTested", True, "element", None),
+    ),
+    "SpecimenDefinitionTypeTested": (
+        ("container", "container", False, "element", None),
+    ),
+    "SpecimenDefinitionTypeTestedContainer": (
+        ("additive", "additive", True, "element", None),
+    ),
+    "SpecimenDefinitionTypeTestedContainerAdditive": (
+        ("additiveReference", "additiveReference", False, "reference", ("Substance",)),
+    ),
+    "SpecimenProcessing": (
+        ("additive", "additive", True, "reference", ("Substance",)),
+    ),
+    "StructureDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("differential", "differential", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("snapshot", "snapshot", False, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "StructureDefinitionDifferential": (("element", "element", True, "element", None),),
+    "StructureDefinitionSnapshot": (("element", "element", True, "element", None),),
+    "StructureMap": (
+        ("contained", "contained", True, "resource", None),
+        ("group", "group", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "StructureMapGroup": (("rule", "rule", True, "element", None),),
+    "StructureMapGroupRule": (
+        ("rule", "rule", True, "element", None),
+        ("source", "source", True, "element", None),
+    ),
+    "StructureMapGroupRuleSource": (
+        ("defaultValueAnnotation", "defaultValueAnnotation", False, "element", None),
+        (
+            "defaultValueDataRequirement",
+            "defaultValueDataRequirement",
+            False,
+            "element",
+            None,
+        ),
+        ("defaultValueIdentifier", "defaultValueIdentifier", False, "element", None),
+        ("defaultValueReference", "defaultValueReference", False, "reference", None),
+        ("defaultValueSignature", "defaultValueSignature", False, "element", None),
+        (
+            "defaultValueTriggerDefinition",
+            "defaultValueTriggerDefinition",
+            False,
+            "element",
+            None,
+        ),
+        (
+            "defaultValueUsageContext",
+            "defaultValueUsageContext",
+            False,
+            "element",
+            None,
+        ),
+    ),
+    "Subscription": (("contained", "contained", True, "resource", None),),
+    "SubscriptionStatus": (
+        ("contained", "contained", True, "resource", None),
+        ("notificationEvent", "notificationEvent", True, "element", None),
+        ("subscription", "subscription", False, "reference", ("Subscription",)),
+    ),
+    "SubscriptionStatusNotificationEvent": (
+        ("additionalContext", "additionalContext", True, "reference", ("Resource",)),
+        ("focus", "focus", False, "reference", ("Resource",)),
+    ),
+    "SubscriptionTopic": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "Substance": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("ingredient", "ingredient", True, "element", None),
+        ("instance", "instance", True, "element", None),
+    ),
+    "SubstanceDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("code", "code", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("informationSource", "informationSource", True, "reference", ("Citation",)),
+        ("manufacturer", "manufacturer", True, "reference", ("Organization",)),
+        ("moiety", "moiety", True, "element", None),
+        ("name", "name", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("relationship", "relationship", True, "element", None),
+        ("structure", "structure", False, "element", None),
+        ("supplier", "supplier", True, "reference", ("Organization",)),
+    ),
+    "SubstanceDefinitionCode": (
+        ("note", "note", True, "element", None),
+        ("source", "source", True, "reference", ("DocumentReference",)),
+    ),
+    "SubstanceDefinitionMoiety": (
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "SubstanceDefinitionName": (
+        ("source", "source", True, "reference", ("DocumentReference",)),
+        ("synonym", "synonym", True, "element", None),
+        ("translation", "translation", True, "element", None),
+    ),
+    "SubstanceDefinitionRelationship": (
+        ("source", "source", True, "reference", ("DocumentReference",)),
+        (
+            "substanceDefinitionReference",
+            "substanceDefinitionReference",
+            False,
+            "reference",
+            ("SubstanceDefinition",),
+        ),
+    ),
+    "SubstanceDefinitionStructure": (
+        ("representation", "representation", True, "element", None),
+        ("sourceDocument", "sourceDocument", True, "reference", ("DocumentReference",)),
+    ),
+    "SubstanceDefinitionStructureRepresentation": (
+        ("document", "document", False, "reference", ("DocumentReference",)),
+    ),
+    "SubstanceIngredient": (
+        (
+            "substanceReference",
+            "substanceReference",
+            False,
+            "reference",
+            ("Substance",),
+        ),
+    ),
+    "SubstanceInstance": (("identifier", "identifier", False, "element", None),),
+    "SupplyDelivery": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("SupplyRequest",)),
+        ("destination", "destination", False, "reference", ("Location",)),
+        ("identifier", "identifier", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("SupplyDelivery", "Contract")),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        (
+            "receiver",
+            "receiver",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("suppliedItem", "suppliedItem", False, "element", None),
+        (
+            "supplier",
+            "supplier",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "SupplyDeliverySuppliedItem": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            ("Medication", "Substance", "Device"),
+        ),
+    ),
+    "SupplyRequest": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "deliverFrom",
+            "deliverFrom",
+            False,
+            "reference",
+            ("Organization", "Location"),
+        ),
+        (
+            "deliverTo",
+            "deliverTo",
+            False,
+            "reference",
+            ("Organization", "Location", "Patient"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            ("Medication", "Substance", "Device"),
+        ),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        (
+            "requester",
+            "requester",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        (
+            "supplier",
+            "supplier",
+            True,
+            "reference",
+            ("Organization", "HealthcareService"),
+        ),
+    ),
+    "Task": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("focus", "focus", False, "reference", ("Resource",)),
+        ("for_fhir", "for", False, "reference", ("Resource",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("input", "input", True, "element", None),
+        ("insurance", "insurance", True, "reference", ("Coverage", "ClaimResponse")),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        ("output", "output", True, "element", None),
+        (
+            "owner",
+            "owner",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("partOf", "partOf", True, "reference", ("Task",)),
+        ("reasonReference", "reasonReference", False, "reference", ("Resource",)),
+        ("relevantHistory", "relevantHistory", True, "reference", ("Provenance",)),
+        (
+            "requester",
+            "requester",
+            False,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("restriction", "restriction", False, "element", None),
+    ),
+    "TaskInput": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueDataRequirement", "valueDataRequirement", False, "element", None),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+        ("valueTriggerDefinition", "valueTriggerDefinition", False, "element", None),
+        ("valueUsageContext", "valueUsageContext", False, "element", None),
+    ),
+    "TaskOutput": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueDataRequirement", "valueDataRequirement", False, "element", None),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+        ("valueTriggerDefinition", "valueTriggerDefinition", False, "element", None),
+        ("valueUsageContext", "valueUsageContext", False, "element", None),
+    ),
+    "TaskRestriction": (
+        (
+            "recipient",
+            "recipient",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Group",
+                "Organization",
+            ),
+        ),
+    ),
+    "TerminologyCapabilities": (
+        ("contained", "contained", True, "resource", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "TestReport": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", False, "element", None),
+        ("testScript", "testScript", False, "reference", ("TestScript",)),
+    ),
+    "TestScript": (
+        ("contained", "contained", True, "resource", None),
+        ("fixture", "fixture", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("profile", "profile", True, "reference", ("Resource",)),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "TestScriptFixture": (("resource", "resource", False, "reference", ("Resource",)),),
+    "TriggerDefinition": (
+        ("data", "data", True, "element", None),
+        ("timingReference", "timingReference", False, "reference", ("Schedule",)),
+    ),
+    "UsageContext": (
+        (
+            "valueReference",
+            "valueReference",
+            False,
+            "reference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ValueSet": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "VerificationResult": (
+        ("contained", "contained", True, "resource", None),
+        ("attestation", "attestation", False, "element", None),
+        ("primarySource", "primarySource", True, "element", None),
+        ("target", "target", True, "reference", ("Resource",)),
+        ("validator", "validator", True, "element", None),
+    ),
+    "VerificationResultAttestation": (
+        (
+            "onBehalfOf",
+            "onBehalfOf",
+            False,
+            "reference",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+        ("proxySignature", "proxySignature", False, "element", None),
+        ("sourceSignature", "sourceSignature", False, "element", None),
+        (
+            "who",
+            "who",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "VerificationResultPrimarySource": (
+        (
+            "who",
+            "who",
+            False,
+            "reference",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+    ),
+    "VerificationResultValidator": (
+        ("attestationSignature", "attestationSignature", False, "element", None),
+        ("organization", "organization", False, "reference", ("Organization",)),
+    ),
+    "VisionPrescription": (
+        ("contained", "contained", True, "resource", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("lensSpecification", "lensSpecification", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        (
+            "prescriber",
+            "prescriber",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+    ),
+    "VisionPrescriptionLensSpecification": (("note", "note", True, "element", None),),
+}
+
+# {resource type: ((FHIR path, target types), ...)}
+REFERENCE_PATHS: typing.Dict[
+    str, typing.Tuple[typing.Tuple[str, typing.Optional[typing.Tuple[str, ...]]], ...]
+] = {
+    "Account": (
+        ("Account.coverage[*].coverage", ("Coverage",)),
+        ("Account.guarantor[*].party", ("Patient", "RelatedPerson", "Organization")),
+        ("Account.identifier[*].assigner", ("Organization",)),
+        ("Account.owner", ("Organization",)),
+        ("Account.partOf", ("Account",)),
+        (
+            "Account.subject[*]",
+            (
+                "Patient",
+                "Device",
+                "Practitioner",
+                "PractitionerRole",
+                "Location",
+                "HealthcareService",
+                "Organization",
+            ),
+        ),
+    ),
+    "ActivityDefinition": (
+        ("ActivityDefinition.identifier[*].assigner", ("Organization",)),
+        ("ActivityDefinition.location", ("Location",)),
+        ("ActivityDefinition.observationRequirement[*]", ("ObservationDefinition",)),
+        (
+            "ActivityDefinition.observationResultRequirement[*]",
+            ("ObservationDefinition",),
+        ),
+        (
+            "ActivityDefinition.productReference",
+            ("Medication", "Substance", "Ingredient"),
+        ),
+        ("ActivityDefinition.specimenRequirement[*]", ("SpecimenDefinition",)),
+        ("ActivityDefinition.subjectReference", ("Group",)),
+        (
+            "ActivityDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "AdministrableProductDefinition": (
+        ("AdministrableProductDefinition.device", ("DeviceDefinition",)),
+        ("AdministrableProductDefinition.formOf[*]", ("MedicinalProductDefinition",)),
+        ("AdministrableProductDefinition.identifier[*].assigner", ("Organization",)),
+        (
+            "AdministrableProductDefinition.producedFrom[*]",
+            ("ManufacturedItemDefinition",),
+        ),
+    ),
+    "AdverseEvent": (
+        ("AdverseEvent.contributor[*]", ("Practitioner", "PractitionerRole", "Device")),
+        ("AdverseEvent.encounter", ("Encounter",)),
+        ("AdverseEvent.identifier.assigner", ("Organization",)),
+        ("AdverseEvent.location", ("Location",)),
+        (
+            "AdverseEvent.recorder",
+            ("Patient", "Practitioner", "PractitionerRole", "RelatedPerson"),
+        ),
+        ("AdverseEvent.referenceDocument[*]", ("DocumentReference",)),
+        ("AdverseEvent.resultingCondition[*]", ("Condition",)),
+        ("AdverseEvent.study[*]", ("ResearchStudy",)),
+        ("AdverseEvent.subject", ("Patient", "Group", "Practitioner", "RelatedPerson")),
+        (
+            "AdverseEvent.subjectMedicalHistory[*]",
+            (
+                "Condition",
+                "Observation",
+                "AllergyIntolerance",
+                "FamilyMemberHistory",
+                "Immunization",
+                "Procedure",
+                "Media",
+                "DocumentReference",
+            ),
+        ),
+        (
+            "AdverseEvent.suspectEntity[*].causality[*].author",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        (
+            "AdverseEvent.suspectEntity[*].instance",
+            (
+                "Immunization",
+                "Procedure",
+                "Substance",
+                "Medication",
+                "MedicationAdministration",
+                "MedicationStatement",
+                "Device",
+            ),
+        ),
+    ),
+    "AllergyIntolerance": (
+        (
+            "AllergyIntolerance.asserter",
+            ("Patient", "RelatedPerson", "Practitioner", "PractitionerRole"),
+        ),
+        ("AllergyIntolerance.encounter", ("Encounter",)),
+        ("AllergyIntolerance.identifier[*].assigner", ("Organization",)),
+        (
+            "AllergyIntolerance.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("AllergyIntolerance.patient", ("Patient",)),
+        (
+            "AllergyIntolerance.reaction[*].note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "AllergyIntolerance.recorder",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson"),
+        ),
+    ),
+    "Appointment": (
+        ("Appointment.basedOn[*]", ("ServiceRequest",)),
+        ("Appointment.identifier[*].assigner", ("Organization",)),
+        (
+            "Appointment.participant[*].actor",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        (
+            "Appointment.reasonReference[*]",
+            ("Condition", "Procedure", "Observation", "ImmunizationRecommendation"),
+        ),
+        ("Appointment.slot[*]", ("Slot",)),
+        ("Appointment.supportingInformation[*]", ("Resource",)),
+    ),
+    "AppointmentResponse": (
+        (
+            "AppointmentResponse.actor",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        ("AppointmentResponse.appointment", ("Appointment",)),
+        ("AppointmentResponse.identifier[*].assigner", ("Organization",)),
+    ),
+    "AuditEvent": (
+        ("AuditEvent.agent[*].location", ("Location",)),
+        (
+            "AuditEvent.agent[*].who",
+            (
+                "PractitionerRole",
+                "Practitioner",
+                "Organization",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("AuditEvent.entity[*].what", ("Resource",)),
+        (
+            "AuditEvent.source.observer",
+            (
+                "PractitionerRole",
+                "Practitioner",
+                "Organization",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "Basic": (
+        (
+            "Basic.author",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Basic.identifier[*].assigner", ("Organization",)),
+        ("Basic.subject", ("Resource",)),
+    ),
+    "Binary": (("Binary.securityContext", ("Resource",)),),
+    "BiologicallyDerivedProduct": (
+        (
+            "BiologicallyDerivedProduct.collection.collector",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("BiologicallyDerivedProduct.collection.source", ("Patient", "Organization")),
+        ("BiologicallyDerivedProduct.identifier[*].assigner", ("Organization",)),
+        ("BiologicallyDerivedProduct.parent[*]", ("BiologicallyDerivedProduct",)),
+        ("BiologicallyDerivedProduct.processing[*].additive", ("Substance",)),
+        ("BiologicallyDerivedProduct.request[*]", ("ServiceRequest",)),
+    ),
+    "BodyStructure": (
+        ("BodyStructure.identifier[*].assigner", ("Organization",)),
+        ("BodyStructure.patient", ("Patient",)),
+    ),
+    "Bundle": (
+        ("Bundle.identifier.assigner", ("Organization",)),
+        (
+            "Bundle.signature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Bundle.signature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+    ),
+    "CapabilityStatement": (
+        ("CapabilityStatement.implementation.custodian", ("Organization",)),
+        (
+            "CapabilityStatement.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "CarePlan": (
+        ("CarePlan.activity[*].detail.goal[*]", ("Goal",)),
+        ("CarePlan.activity[*].detail.location", ("Location",)),
+        (
+            "CarePlan.activity[*].detail.performer[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "RelatedPerson",
+                "Patient",
+                "CareTeam",
+                "HealthcareService",
+                "Device",
+            ),
+        ),
+        ("CarePlan.activity[*].detail.productReference", ("Medication", "Substance")),
+        (
+            "CarePlan.activity[*].detail.reasonReference[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("CarePlan.activity[*].outcomeReference[*]", ("Resource",)),
+        (
+            "CarePlan.activity[*].progress[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "CarePlan.activity[*].reference",
+            (
+                "Appointment",
+                "CommunicationRequest",
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "Task",
+                "ServiceRequest",
+                "VisionPrescription",
+                "RequestGroup",
+            ),
+        ),
+        ("CarePlan.addresses[*]", ("Condition",)),
+        (
+            "CarePlan.author",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "RelatedPerson",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        ("CarePlan.basedOn[*]", ("CarePlan",)),
+        ("CarePlan.careTeam[*]", ("CareTeam",)),
+        (
+            "CarePlan.contributor[*]",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "RelatedPerson",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        ("CarePlan.encounter", ("Encounter",)),
+        ("CarePlan.goal[*]", ("Goal",)),
+        ("CarePlan.identifier[*].assigner", ("Organization",)),
+        (
+            "CarePlan.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("CarePlan.partOf[*]", ("CarePlan",)),
+        ("CarePlan.replaces[*]", ("CarePlan",)),
+        ("CarePlan.subject", ("Patient", "Group")),
+        ("CarePlan.supportingInfo[*]", ("Resource",)),
+    ),
+    "CareTeam": (
+        ("CareTeam.encounter", ("Encounter",)),
+        ("CareTeam.identifier[*].assigner", ("Organization",)),
+        ("CareTeam.managingOrganization[*]", ("Organization",)),
+        (
+            "CareTeam.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "CareTeam.participant[*].member",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        ("CareTeam.participant[*].onBehalfOf", ("Organization",)),
+        ("CareTeam.reasonReference[*]", ("Condition",)),
+        ("CareTeam.subject", ("Patient", "Group")),
+    ),
+    "CatalogEntry": (
+        ("CatalogEntry.additionalIdentifier[*].assigner", ("Organization",)),
+        ("CatalogEntry.identifier[*].assigner", ("Organization",)),
+        (
+            "CatalogEntry.referencedItem",
+            (
+                "Medication",
+                "Device",
+                "Organization",
+                "Practitioner",
+                "PractitionerRole",
+                "HealthcareService",
+                "ActivityDefinition",
+                "PlanDefinition",
+                "SpecimenDefinition",
+                "ObservationDefinition",
+                "Binary",
+            ),
+        ),
+        ("CatalogEntry.relatedEntry[*].item", ("CatalogEntry",)),
+    ),
+    "ChargeItem": (
+        ("ChargeItem.account[*]", ("Account",)),
+        ("ChargeItem.context", ("Encounter", "EpisodeOfCare")),
+        ("ChargeItem.costCenter", ("Organization",)),
+        (
+            "ChargeItem.enterer",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("ChargeItem.identifier[*].assigner", ("Organization",)),
+        (
+            "ChargeItem.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("ChargeItem.partOf[*]", ("ChargeItem",)),
+        (
+            "ChargeItem.performer[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("ChargeItem.performingOrganization", ("Organization",)),
+        ("ChargeItem.productReference", ("Device", "Medication", "Substance")),
+        ("ChargeItem.requestingOrganization", ("Organization",)),
+        (
+            "ChargeItem.service[*]",
+            (
+                "DiagnosticReport",
+                "ImagingStudy",
+                "Immunization",
+                "MedicationAdministration",
+                "MedicationDispense",
+                "Observation",
+                "Procedure",
+                "SupplyDelivery",
+            ),
+        ),
+        ("ChargeItem.subject", ("Patient", "Group")),
+        ("ChargeItem.supportingInformation[*]", ("Resource",)),
+    ),
+    "ChargeItemDefinition": (
+        ("ChargeItemDefinition.identifier[*].assigner", ("Organization",)),
+        ("ChargeItemDefinition.instance[*]", ("Medication", "Substance", "Device")),
+        (
+            "ChargeItemDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Citation": (
+        (
+            "Citation.citedArtifact.classification[*].whoClassified.organization",
+            ("Organization",),
+        ),
+        (
+            "Citation.citedArtifact.classification[*].whoClassified.person",
+            ("Person", "Practitioner"),
+        ),
+        (
+            "Citation.citedArtifact.classification[*].whoClassified.publisher",
+            ("Organization",),
+        ),
+        (
+            "Citation.citedArtifact.contributorship.entry[*].affiliationInfo[*].identifier[*].assigner",
+            ("Organization",),
+        ),
+        (
+            "Citation.citedArtifact.contributorship.entry[*].identifier[*].assigner",
+            ("Organization",),
+        ),
+        ("Citation.citedArtifact.identifier[*].assigner", ("Organization",)),
+        (
+            "Citation.citedArtifact.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("Citation.citedArtifact.part.baseCitation", ("Citation",)),
+        (
+            "Citation.citedArtifact.publicationForm[*].publishedIn.identifier[*].assigner",
+            ("Organization",),
+        ),
+        (
+            "Citation.citedArtifact.publicationForm[*].publishedIn.publisher",
+            ("Organization",),
+        ),
+        ("Citation.citedArtifact.relatedIdentifier[*].assigner", ("Organization",)),
+        (
+            "Citation.citedArtifact.relatesTo[*].targetIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("Citation.citedArtifact.relatesTo[*].targetReference", ("Resource",)),
+        ("Citation.citedArtifact.version.baseCitation", ("Citation",)),
+        ("Citation.identifier[*].assigner", ("Organization",)),
+        (
+            "Citation.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("Citation.relatesTo[*].targetIdentifier.assigner", ("Organization",)),
+        ("Citation.relatesTo[*].targetReference", ("Resource",)),
+        (
+            "Citation.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Claim": (
+        ("Claim.accident.locationReference", ("Location",)),
+        (
+            "Claim.careTeam[*].provider",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("Claim.diagnosis[*].diagnosisReference", ("Condition",)),
+        ("Claim.enterer", ("Practitioner", "PractitionerRole")),
+        ("Claim.facility", ("Location",)),
+        ("Claim.identifier[*].assigner", ("Organization",)),
+        ("Claim.insurance[*].claimResponse", ("ClaimResponse",)),
+        ("Claim.insurance[*].coverage", ("Coverage",)),
+        ("Claim.insurance[*].identifier.assigner", ("Organization",)),
+        ("Claim.insurer", ("Organization",)),
+        ("Claim.item[*].detail[*].subDetail[*].udi[*]", ("Device",)),
+        ("Claim.item[*].detail[*].udi[*]", ("Device",)),
+        ("Claim.item[*].encounter[*]", ("Encounter",)),
+        ("Claim.item[*].locationReference", ("Location",)),
+        ("Claim.item[*].udi[*]", ("Device",)),
+        (
+            "Claim.originalPrescription",
+            ("DeviceRequest", "MedicationRequest", "VisionPrescription"),
+        ),
+        ("Claim.patient", ("Patient",)),
+        (
+            "Claim.payee.party",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "Claim.prescription",
+            ("DeviceRequest", "MedicationRequest", "VisionPrescription"),
+        ),
+        ("Claim.procedure[*].procedureReference", ("Procedure",)),
+        ("Claim.procedure[*].udi[*]", ("Device",)),
+        ("Claim.provider", ("Practitioner", "PractitionerRole", "Organization")),
+        ("Claim.referral", ("ServiceRequest",)),
+        ("Claim.related[*].claim", ("Claim",)),
+        ("Claim.related[*].reference.assigner", ("Organization",)),
+        ("Claim.supportingInfo[*].valueReference", ("Resource",)),
+    ),
+    "ClaimResponse": (
+        ("ClaimResponse.addItem[*].locationReference", ("Location",)),
+        (
+            "ClaimResponse.addItem[*].provider[*]",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("ClaimResponse.communicationRequest[*]", ("CommunicationRequest",)),
+        ("ClaimResponse.identifier[*].assigner", ("Organization",)),
+        ("ClaimResponse.insurance[*].claimResponse", ("ClaimResponse",)),
+        ("ClaimResponse.insurance[*].coverage", ("Coverage",)),
+        ("ClaimResponse.insurer", ("Organization",)),
+        ("ClaimResponse.patient", ("Patient",)),
+        ("ClaimResponse.payment.identifier.assigner", ("Organization",)),
+        ("ClaimResponse.request", ("Claim",)),
+        (
+            "ClaimResponse.requestor",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "ClinicalImpression": (
+        ("ClinicalImpression.assessor", ("Practitioner", "PractitionerRole")),
+        ("ClinicalImpression.encounter", ("Encounter",)),
+        (
+            "ClinicalImpression.finding[*].itemReference",
+            ("Condition", "Observation", "Media"),
+        ),
+        ("ClinicalImpression.identifier[*].assigner", ("Organization",)),
+        (
+            "ClinicalImpression.investigation[*].item[*]",
+            (
+                "Observation",
+                "QuestionnaireResponse",
+                "FamilyMemberHistory",
+                "DiagnosticReport",
+                "RiskAssessment",
+                "ImagingStudy",
+                "Media",
+            ),
+        ),
+        (
+            "ClinicalImpression.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("ClinicalImpression.previous", ("ClinicalImpression",)),
+        ("ClinicalImpression.problem[*]", ("Condition", "AllergyIntolerance")),
+        ("ClinicalImpression.prognosisReference[*]", ("RiskAssessment",)),
+        ("ClinicalImpression.subject", ("Patient", "Group")),
+        ("ClinicalImpression.supportingInfo[*]", ("Resource",)),
+    ),
+    "ClinicalUseDefinition": (
+        (
+            "ClinicalUseDefinition.contraindication.comorbidity[*]",
+            ("ObservationDefinition",),
+        ),
+        (
+            "ClinicalUseDefinition.contraindication.diseaseStatus",
+            ("ObservationDefinition",),
+        ),
+        (
+            "ClinicalUseDefinition.contraindication.diseaseSymptomProcedure",
+            ("ObservationDefinition",),
+        ),
+        (
+            "ClinicalUseDefinition.contraindication.indication[*]",
+            ("ClinicalUseDefinition",),
+        ),
+        (
+            "ClinicalUseDefinition.contraindication.otherTherapy[*].therapy",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "Substance",
+                "SubstanceDefinition",
+                "ActivityDefinition",
+            ),
+        ),
+        ("ClinicalUseDefinition.identifier[*].assigner", ("Organization",)),
+        ("ClinicalUseDefinition.indication.comorbidity[*]", ("ObservationDefinition",)),
+        ("ClinicalUseDefinition.indication.diseaseStatus", ("ObservationDefinition",)),
+        (
+            "ClinicalUseDefinition.indication.diseaseSymptomProcedure",
+            ("ObservationDefinition",),
+        ),
+        ("ClinicalUseDefinition.indication.intendedEffect", ("ObservationDefinition",)),
+        (
+            "ClinicalUseDefinition.indication.otherTherapy[*].therapy",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "Substance",
+                "SubstanceDefinition",
+                "ActivityDefinition",
+            ),
+        ),
+        (
+            "ClinicalUseDefinition.indication.undesirableEffect[*]",
+            ("ClinicalUseDefinition",),
+        ),
+        ("ClinicalUseDefinition.interaction.effect", ("ObservationDefinition",)),
+        (
+            "ClinicalUseDefinition.interaction.interactant[*].itemReference",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "Substance",
+                "ObservationDefinition",
+            ),
+        ),
+        ("ClinicalUseDefinition.population[*]", ("Group",)),
+        (
+            "ClinicalUseDefinition.subject[*]",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "ActivityDefinition",
+                "PlanDefinition",
+                "Device",
+                "DeviceDefinition",
+                "Substance",
+            ),
+        ),
+        (
+            "ClinicalUseDefinition.undesirableEffect.symptomConditionEffect",
+            ("ObservationDefinition",),
+        ),
+    ),
+    "CodeSystem": (
+        ("CodeSystem.identifier[*].assigner", ("Organization",)),
+        (
+            "CodeSystem.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Communication": (
+        ("Communication.about[*]", ("Resource",)),
+        ("Communication.basedOn[*]", ("Resource",)),
+        ("Communication.encounter", ("Encounter",)),
+        ("Communication.identifier[*].assigner", ("Organization",)),
+        ("Communication.inResponseTo[*]", ("Communication",)),
+        (
+            "Communication.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("Communication.partOf[*]", ("Resource",)),
+        ("Communication.payload[*].contentReference", ("Resource",)),
+        (
+            "Communication.reasonReference[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        (
+            "Communication.recipient[*]",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Group",
+                "CareTeam",
+                "HealthcareService",
+            ),
+        ),
+        (
+            "Communication.sender",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+        ("Communication.subject", ("Patient", "Group")),
+    ),
+    "CommunicationRequest": (
+        ("CommunicationRequest.about[*]", ("Resource",)),
+        ("CommunicationRequest.basedOn[*]", ("Resource",)),
+        ("CommunicationRequest.encounter", ("Encounter",)),
+        ("CommunicationRequest.groupIdentifier.assigner", ("Organization",)),
+        ("CommunicationRequest.identifier[*].assigner", ("Organization",)),
+        (
+            "CommunicationRequest.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("CommunicationRequest.payload[*].contentReference", ("Resource",)),
+        (
+            "CommunicationRequest.reasonReference[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        (
+            "CommunicationRequest.recipient[*]",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Group",
+                "CareTeam",
+                "HealthcareService",
+            ),
+        ),
+        ("CommunicationRequest.replaces[*]", ("CommunicationRequest",)),
+        (
+            "CommunicationRequest.requester",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        (
+            "CommunicationRequest.sender",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+        ("CommunicationRequest.subject", ("Patient", "Group")),
+    ),
+    "CompartmentDefinition": (
+        (
+            "CompartmentDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Composition": (
+        (
+            "Composition.attester[*].party",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+            ),
+        ),
+        (
+            "Composition.author[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Composition.custodian", ("Organization",)),
+        ("Composition.encounter", ("Encounter",)),
+        ("Composition.event[*].detail[*]", ("Resource",)),
+        ("Composition.identifier.assigner", ("Organization",)),
+        ("Composition.relatesTo[*].targetIdentifier.assigner", ("Organization",)),
+        ("Composition.relatesTo[*].targetReference", ("Composition",)),
+        (
+            "Composition.section[*].author[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Composition.section[*].entry[*]", ("Resource",)),
+        ("Composition.section[*].focus", ("Resource",)),
+        ("Composition.subject", ("Resource",)),
+    ),
+    "ConceptMap": (
+        ("ConceptMap.identifier.assigner", ("Organization",)),
+        (
+            "ConceptMap.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Condition": (
+        (
+            "Condition.asserter",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson"),
+        ),
+        ("Condition.encounter", ("Encounter",)),
+        ("Condition.evidence[*].detail[*]", ("Resource",)),
+        ("Condition.identifier[*].assigner", ("Organization",)),
+        (
+            "Condition.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "Condition.recorder",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson"),
+        ),
+        (
+            "Condition.stage[*].assessment[*]",
+            ("ClinicalImpression", "DiagnosticReport", "Observation"),
+        ),
+        ("Condition.subject", ("Patient", "Group")),
+    ),
+    "Consent": (
+        ("Consent.identifier[*].assigner", ("Organization",)),
+        ("Consent.organization[*]", ("Organization",)),
+        ("Consent.patient", ("Patient",)),
+        (
+            "Consent.performer[*]",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "PractitionerRole",
+            ),
+        ),
+        (
+            "Consent.provision.actor[*].reference",
+            (
+                "Device",
+                "Group",
+                "CareTeam",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "PractitionerRole",
+            ),
+        ),
+        ("Consent.provision.data[*].reference", ("Resource",)),
+        (
+            "Consent.sourceReference",
+            ("Consent", "DocumentReference", "Contract", "QuestionnaireResponse"),
+        ),
+        ("Consent.verification[*].verifiedWith", ("Patient", "RelatedPerson")),
+    ),
+    "Contract": (
+        (
+            "Contract.author",
+            ("Patient", "Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("Contract.authority[*]", ("Organization",)),
+        (
+            "Contract.contentDefinition.publisher",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("Contract.domain[*]", ("Location",)),
+        (
+            "Contract.friendly[*].contentReference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+        ("Contract.identifier[*].assigner", ("Organization",)),
+        ("Contract.instantiatesCanonical", ("Contract",)),
+        (
+            "Contract.legal[*].contentReference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+        (
+            "Contract.legallyBindingReference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse", "Contract"),
+        ),
+        ("Contract.relevantHistory[*]", ("Provenance",)),
+        ("Contract.rule[*].contentReference", ("DocumentReference",)),
+        (
+            "Contract.signer[*].party",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "Contract.signer[*].signature[*].onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Contract.signer[*].signature[*].who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        ("Contract.site[*]", ("Location",)),
+        ("Contract.subject[*]", ("Resource",)),
+        ("Contract.supportingInfo[*]", ("Resource",)),
+        ("Contract.term[*].action[*].context", ("Encounter", "EpisodeOfCare")),
+        (
+            "Contract.term[*].action[*].note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "Contract.term[*].action[*].performer",
+            (
+                "RelatedPerson",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "CareTeam",
+                "Device",
+                "Substance",
+                "Organization",
+                "Location",
+            ),
+        ),
+        (
+            "Contract.term[*].action[*].reasonReference[*]",
+            (
+                "Condition",
+                "Observation",
+                "DiagnosticReport",
+                "DocumentReference",
+                "Questionnaire",
+                "QuestionnaireResponse",
+            ),
+        ),
+        (
+            "Contract.term[*].action[*].requester[*]",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+        (
+            "Contract.term[*].action[*].subject[*].reference[*]",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+        ("Contract.term[*].asset[*].answer[*].valueReference", ("Resource",)),
+        ("Contract.term[*].asset[*].context[*].reference", ("Resource",)),
+        ("Contract.term[*].asset[*].typeReference[*]", ("Resource",)),
+        ("Contract.term[*].asset[*].valuedItem[*].entityReference", ("Resource",)),
+        (
+            "Contract.term[*].asset[*].valuedItem[*].identifier.assigner",
+            ("Organization",),
+        ),
+        (
+            "Contract.term[*].asset[*].valuedItem[*].recipient",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "Contract.term[*].asset[*].valuedItem[*].responsible",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("Contract.term[*].identifier.assigner", ("Organization",)),
+        ("Contract.term[*].offer.answer[*].valueReference", ("Resource",)),
+        ("Contract.term[*].offer.identifier[*].assigner", ("Organization",)),
+        (
+            "Contract.term[*].offer.party[*].reference[*]",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+        ("Contract.term[*].offer.topic", ("Resource",)),
+        ("Contract.term[*].topicReference", ("Resource",)),
+        ("Contract.topicReference", ("Resource",)),
+    ),
+    "Coverage": (
+        ("Coverage.beneficiary", ("Patient",)),
+        ("Coverage.contract[*]", ("Contract",)),
+        ("Coverage.identifier[*].assigner", ("Organization",)),
+        ("Coverage.payor[*]", ("Organization", "Patient", "RelatedPerson")),
+        ("Coverage.policyHolder", ("Patient", "RelatedPerson", "Organization")),
+        ("Coverage.subscriber", ("Patient", "RelatedPerson")),
+    ),
+    "CoverageEligibilityRequest": (
+        ("CoverageEligibilityRequest.enterer", ("Practitioner", "PractitionerRole")),
+        ("CoverageEligibilityRequest.facility", ("Location",)),
+        ("CoverageEligibilityRequest.identifier[*].assigner", ("Organization",)),
+        ("CoverageEligibilityRequest.insurance[*].coverage", ("Coverage",)),
+        ("CoverageEligibilityRequest.insurer", ("Organization",)),
+        ("CoverageEligibilityRequest.item[*].detail[*]", ("Resource",)),
+        (
+            "CoverageEligibilityRequest.item[*].diagnosis[*].diagnosisReference",
+            ("Condition",),
+        ),
+        ("CoverageEligibilityRequest.item[*].facility", ("Location", "Organization")),
+        (
+            "CoverageEligibilityRequest.item[*].provider",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("CoverageEligibilityRequest.patient", ("Patient",)),
+        (
+            "CoverageEligibilityRequest.provider",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("CoverageEligibilityRequest.supportingInfo[*].information", ("Resource",)),
+    ),
+    "CoverageEligibilityResponse": (
+        ("CoverageEligibilityResponse.identifier[*].assigner", ("Organization",)),
+        ("CoverageEligibilityResponse.insurance[*].coverage", ("Coverage",)),
+        (
+            "CoverageEligibilityResponse.insurance[*].item[*].provider",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("CoverageEligibilityResponse.insurer", ("Organization",)),
+        ("CoverageEligibilityResponse.patient", ("Patient",)),
+        ("CoverageEligibilityResponse.request", ("CoverageEligibilityRequest",)),
+        (
+            "CoverageEligibilityResponse.requestor",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "DetectedIssue": (
+        ("DetectedIssue.author", ("Practitioner", "PractitionerRole", "Device")),
+        ("DetectedIssue.evidence[*].detail[*]", ("Resource",)),
+        ("DetectedIssue.identifier[*].assigner", ("Organization",)),
+        ("DetectedIssue.implicated[*]", ("Resource",)),
+        ("DetectedIssue.mitigation[*].author", ("Practitioner", "PractitionerRole")),
+        ("DetectedIssue.patient", ("Patient",)),
+    ),
+    "Device": (
+        ("Device.definition", ("DeviceDefinition",)),
+        ("Device.identifier[*].assigner", ("Organization",)),
+        ("Device.location", ("Location",)),
+        (
+            "Device.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("Device.owner", ("Organization",)),
+        ("Device.parent", ("Device",)),
+        ("Device.patient", ("Patient",)),
+        ("Device.version[*].component.assigner", ("Organization",)),
+    ),
+    "DeviceDefinition": (
+        ("DeviceDefinition.identifier[*].assigner", ("Organization",)),
+        ("DeviceDefinition.manufacturerReference", ("Organization",)),
+        (
+            "DeviceDefinition.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("DeviceDefinition.owner", ("Organization",)),
+        ("DeviceDefinition.parentDevice", ("DeviceDefinition",)),
+        ("DeviceDefinition.shelfLifeStorage[*].identifier.assigner", ("Organization",)),
+    ),
+    "DeviceMetric": (
+        ("DeviceMetric.identifier[*].assigner", ("Organization",)),
+        ("DeviceMetric.parent", ("Device",)),
+        ("DeviceMetric.source", ("Device",)),
+    ),
+    "DeviceRequest": (
+        ("DeviceRequest.basedOn[*]", ("Resource",)),
+        ("DeviceRequest.codeReference", ("Device",)),
+        ("DeviceRequest.encounter", ("Encounter",)),
+        ("DeviceRequest.groupIdentifier.assigner", ("Organization",)),
+        ("DeviceRequest.identifier[*].assigner", ("Organization",)),
+        ("DeviceRequest.insurance[*]", ("Coverage", "ClaimResponse")),
+        (
+            "DeviceRequest.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "DeviceRequest.performer",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("DeviceRequest.priorRequest[*]", ("Resource",)),
+        (
+            "DeviceRequest.reasonReference[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("DeviceRequest.relevantHistory[*]", ("Provenance",)),
+        (
+            "DeviceRequest.requester",
+            ("Device", "Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("DeviceRequest.subject", ("Patient", "Group", "Location", "Device")),
+        ("DeviceRequest.supportingInfo[*]", ("Resource",)),
+    ),
+    "DeviceUseStatement": (
+        ("DeviceUseStatement.basedOn[*]", ("ServiceRequest",)),
+        (
+            "DeviceUseStatement.derivedFrom[*]",
+            (
+                "ServiceRequest",
+                "Procedure",
+                "Claim",
+                "Observation",
+                "QuestionnaireResponse",
+                "DocumentReference",
+            ),
+        ),
+        ("DeviceUseStatement.device", ("Device",)),
+        ("DeviceUseStatement.identifier[*].assigner", ("Organization",)),
+        (
+            "DeviceUseStatement.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "DeviceUseStatement.reasonReference[*]",
+            (
+                "Condition",
+                "Observation",
+                "DiagnosticReport",
+                "DocumentReference",
+                "Media",
+            ),
+        ),
+        (
+            "DeviceUseStatement.source",
+            ("Patient", "Practitioner", "PractitionerRole", "RelatedPerson"),
+        ),
+        ("DeviceUseStatement.subject", ("Patient", "Group")),
+    ),
+    "DiagnosticReport": (
+        (
+            "DiagnosticReport.basedOn[*]",
+            (
+                "CarePlan",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+            ),
+        ),
+        ("DiagnosticReport.encounter", ("Encounter",)),
+        ("DiagnosticReport.identifier[*].assigner", ("Organization",)),
+        ("DiagnosticReport.imagingStudy[*]", ("ImagingStudy",)),
+        ("DiagnosticReport.media[*].link", ("Media",)),
+        (
+            "DiagnosticReport.performer[*]",
+            ("Practitioner", "PractitionerRole", "Organization", "CareTeam"),
+        ),
+        ("DiagnosticReport.result[*]", ("Observation",)),
+        (
+            "DiagnosticReport.resultsInterpreter[*]",
+            ("Practitioner", "PractitionerRole", "Organization", "CareTeam"),
+        ),
+        ("DiagnosticReport.specimen[*]", ("Specimen",)),
+        (
+            "DiagnosticReport.subject",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "Location",
+                "Organization",
+                "Procedure",
+                "Practitioner",
+                "Medication",
+                "Substance",
+            ),
+        ),
+    ),
+    "DocumentManifest": (
+        (
+            "DocumentManifest.author[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("DocumentManifest.content[*]", ("Resource",)),
+        ("DocumentManifest.identifier[*].assigner", ("Organization",)),
+        ("DocumentManifest.masterIdentifier.assigner", ("Organization",)),
+        (
+            "DocumentManifest.recipient[*]",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("DocumentManifest.related[*].identifier.assigner", ("Organization",)),
+        ("DocumentManifest.related[*].ref", ("Resource",)),
+        ("DocumentManifest.subject", ("Patient", "Practitioner", "Group", "Device")),
+    ),
+    "DocumentReference": (
+        (
+            "DocumentReference.authenticator",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "DocumentReference.author[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("DocumentReference.context.encounter[*]", ("Encounter", "EpisodeOfCare")),
+        ("DocumentReference.context.related[*]", ("Resource",)),
+        ("DocumentReference.context.sourcePatientInfo", ("Patient",)),
+        ("DocumentReference.custodian", ("Organization",)),
+        ("DocumentReference.identifier[*].assigner", ("Organization",)),
+        ("DocumentReference.masterIdentifier.assigner", ("Organization",)),
+        ("DocumentReference.relatesTo[*].target", ("DocumentReference",)),
+        ("DocumentReference.subject", ("Patient", "Practitioner", "Group", "Device")),
+    ),
+    "Encounter": (
+        ("Encounter.account[*]", ("Account",)),
+        ("Encounter.appointment[*]", ("Appointment",)),
+        ("Encounter.basedOn[*]", ("ServiceRequest",)),
+        ("Encounter.diagnosis[*].condition", ("Condition", "Procedure")),
+        ("Encounter.episodeOfCare[*]", ("EpisodeOfCare",)),
+        ("Encounter.hospitalization.destination", ("Location", "Organization")),
+        ("Encounter.hospitalization.origin", ("Location", "Organization")),
+        (
+            "Encounter.hospitalization.preAdmissionIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("Encounter.identifier[*].assigner", ("Organization",)),
+        ("Encounter.location[*].location", ("Location",)),
+        ("Encounter.partOf", ("Encounter",)),
+        (
+            "Encounter.participant[*].individual",
+            ("Practitioner", "PractitionerRole", "RelatedPerson"),
+        ),
+        (
+            "Encounter.reasonReference[*]",
+            ("Condition", "Procedure", "Observation", "ImmunizationRecommendation"),
+        ),
+        ("Encounter.serviceProvider", ("Organization",)),
+        ("Encounter.subject", ("Patient", "Group")),
+    ),
+    "Endpoint": (
+        ("Endpoint.identifier[*].assigner", ("Organization",)),
+        ("Endpoint.managingOrganization", ("Organization",)),
+    ),
+    "EnrollmentRequest": (
+        ("EnrollmentRequest.candidate", ("Patient",)),
+        ("EnrollmentRequest.coverage", ("Coverage",)),
+        ("EnrollmentRequest.identifier[*].assigner", ("Organization",)),
+        ("EnrollmentRequest.insurer", ("Organization",)),
+        (
+            "EnrollmentRequest.provider",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "EnrollmentResponse": (
+        ("EnrollmentResponse.identifier[*].assigner", ("Organization",)),
+        ("EnrollmentResponse.organization", ("Organization",)),
+        ("EnrollmentResponse.request", ("EnrollmentRequest",)),
+        (
+            "EnrollmentResponse.requestProvider",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "EpisodeOfCare": (
+        ("EpisodeOfCare.account[*]", ("Account",)),
+        ("EpisodeOfCare.careManager", ("Practitioner", "PractitionerRole")),
+        ("EpisodeOfCare.diagnosis[*].condition", ("Condition",)),
+        ("EpisodeOfCare.identifier[*].assigner", ("Organization",)),
+        ("EpisodeOfCare.managingOrganization", ("Organization",)),
+        ("EpisodeOfCare.patient", ("Patient",)),
+        ("EpisodeOfCare.referralRequest[*]", ("ServiceRequest",)),
+        ("EpisodeOfCare.team[*]", ("CareTeam",)),
+    ),
+    "EventDefinition": (
+        ("EventDefinition.identifier[*].assigner", ("Organization",)),
+        ("EventDefinition.subjectReference", ("Group",)),
+        ("EventDefinition.trigger[*].data[*].subjectReference", ("Group",)),
+        ("EventDefinition.trigger[*].timingReference", ("Schedule",)),
+        (
+            "EventDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Evidence": (
+        (
+            "Evidence.certainty[*].note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("Evidence.citeAsReference", ("Citation",)),
+        ("Evidence.identifier[*].assigner", ("Organization",)),
+        (
+            "Evidence.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "Evidence.statistic[*].attributeEstimate[*].note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "Evidence.statistic[*].modelCharacteristic[*].attributeEstimate[*].note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "Evidence.statistic[*].modelCharacteristic[*].variable[*].variableDefinition",
+            ("Group", "EvidenceVariable"),
+        ),
+        (
+            "Evidence.statistic[*].note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "Evidence.statistic[*].sampleSize.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "Evidence.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        ("Evidence.variableDefinition[*].intended", ("Group", "EvidenceVariable")),
+        (
+            "Evidence.variableDefinition[*].note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("Evidence.variableDefinition[*].observed", ("Group", "EvidenceVariable")),
+    ),
+    "EvidenceReport": (
+        ("EvidenceReport.citeAsReference", ("Citation",)),
+        ("EvidenceReport.identifier[*].assigner", ("Organization",)),
+        (
+            "EvidenceReport.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("EvidenceReport.relatedIdentifier[*].assigner", ("Organization",)),
+        ("EvidenceReport.relatesTo[*].targetIdentifier.assigner", ("Organization",)),
+        ("EvidenceReport.relatesTo[*].targetReference", ("EvidenceReport",)),
+        (
+            "EvidenceReport.section[*].author[*]",
+            ("Person", "Device", "Group", "Organization"),
+        ),
+        ("EvidenceReport.section[*].entryReference[*]", ("Resource",)),
+        ("EvidenceReport.section[*].focusReference", ("Resource",)),
+        ("EvidenceReport.subject.characteristic[*].valueReference", ("Resource",)),
+        (
+            "EvidenceReport.subject.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "EvidenceReport.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "EvidenceVariable": (
+        (
+            "EvidenceVariable.characteristic[*].definitionReference",
+            ("Group", "EvidenceVariable"),
+        ),
+        ("EvidenceVariable.characteristic[*].device", ("Device", "DeviceMetric")),
+        (
+            "EvidenceVariable.characteristic[*].timeFromStart.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("EvidenceVariable.identifier[*].assigner", ("Organization",)),
+        (
+            "EvidenceVariable.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "EvidenceVariable.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ExampleScenario": (
+        ("ExampleScenario.identifier[*].assigner", ("Organization",)),
+        (
+            "ExampleScenario.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ExplanationOfBenefit": (
+        ("ExplanationOfBenefit.accident.locationReference", ("Location",)),
+        ("ExplanationOfBenefit.addItem[*].locationReference", ("Location",)),
+        (
+            "ExplanationOfBenefit.addItem[*].provider[*]",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "ExplanationOfBenefit.careTeam[*].provider",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("ExplanationOfBenefit.claim", ("Claim",)),
+        ("ExplanationOfBenefit.claimResponse", ("ClaimResponse",)),
+        ("ExplanationOfBenefit.diagnosis[*].diagnosisReference", ("Condition",)),
+        ("ExplanationOfBenefit.enterer", ("Practitioner", "PractitionerRole")),
+        ("ExplanationOfBenefit.facility", ("Location",)),
+        ("ExplanationOfBenefit.identifier[*].assigner", ("Organization",)),
+        ("ExplanationOfBenefit.insurance[*].coverage", ("Coverage",)),
+        ("ExplanationOfBenefit.insurer", ("Organization",)),
+        ("ExplanationOfBenefit.item[*].detail[*].subDetail[*].udi[*]", ("Device",)),
+        ("ExplanationOfBenefit.item[*].detail[*].udi[*]", ("Device",)),
+        ("ExplanationOfBenefit.item[*].encounter[*]", ("Encounter",)),
+        ("ExplanationOfBenefit.item[*].locationReference", ("Location",)),
+        ("ExplanationOfBenefit.item[*].udi[*]", ("Device",)),
+        ("ExplanationOfBenefit.originalPrescription", ("MedicationRequest",)),
+        ("ExplanationOfBenefit.patient", ("Patient",)),
+        (
+            "ExplanationOfBenefit.payee.party",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("ExplanationOfBenefit.payment.identifier.assigner", ("Organization",)),
+        (
+            "ExplanationOfBenefit.prescription",
+            ("MedicationRequest", "VisionPrescription"),
+        ),
+        ("ExplanationOfBenefit.procedure[*].procedureReference", ("Procedure",)),
+        ("ExplanationOfBenefit.procedure[*].udi[*]", ("Device",)),
+        (
+            "ExplanationOfBenefit.provider",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("ExplanationOfBenefit.referral", ("ServiceRequest",)),
+        ("ExplanationOfBenefit.related[*].claim", ("Claim",)),
+        ("ExplanationOfBenefit.related[*].reference.assigner", ("Organization",)),
+        ("ExplanationOfBenefit.supportingInfo[*].valueReference", ("Resource",)),
+    ),
+    "FamilyMemberHistory": (
+        (
+            "FamilyMemberHistory.condition[*].note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("FamilyMemberHistory.identifier[*].assigner", ("Organization",)),
+        (
+            "FamilyMemberHistory.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("FamilyMemberHistory.patient", ("Patient",)),
+        (
+            "FamilyMemberHistory.reasonReference[*]",
+            (
+                "Condition",
+                "Observation",
+                "AllergyIntolerance",
+                "QuestionnaireResponse",
+                "DiagnosticReport",
+                "DocumentReference",
+            ),
+        ),
+    ),
+    "Flag": (
+        (
+            "Flag.author",
+            ("Device", "Organization", "Patient", "Practitioner", "PractitionerRole"),
+        ),
+        ("Flag.encounter", ("Encounter",)),
+        ("Flag.identifier[*].assigner", ("Organization",)),
+        (
+            "Flag.subject",
+            (
+                "Patient",
+                "Location",
+                "Group",
+                "Organization",
+                "Practitioner",
+                "PlanDefinition",
+                "Medication",
+                "Procedure",
+            ),
+        ),
+    ),
+    "Goal": (
+        (
+            "Goal.addresses[*]",
+            (
+                "Condition",
+                "Observation",
+                "MedicationStatement",
+                "NutritionOrder",
+                "ServiceRequest",
+                "RiskAssessment",
+            ),
+        ),
+        (
+            "Goal.expressedBy",
+            ("Patient", "Practitioner", "PractitionerRole", "RelatedPerson"),
+        ),
+        ("Goal.identifier[*].assigner", ("Organization",)),
+        (
+            "Goal.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("Goal.outcomeReference[*]", ("Observation",)),
+        ("Goal.subject", ("Patient", "Group", "Organization")),
+    ),
+    "GraphDefinition": (
+        (
+            "GraphDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Group": (
+        ("Group.characteristic[*].valueReference", None),
+        ("Group.identifier[*].assigner", ("Organization",)),
+        (
+            "Group.managingEntity",
+            ("Organization", "RelatedPerson", "Practitioner", "PractitionerRole"),
+        ),
+        (
+            "Group.member[*].entity",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Medication",
+                "Substance",
+                "Group",
+            ),
+        ),
+    ),
+    "GuidanceResponse": (
+        ("GuidanceResponse.dataRequirement[*].subjectReference", ("Group",)),
+        ("GuidanceResponse.encounter", ("Encounter",)),
+        ("GuidanceResponse.evaluationMessage[*]", ("OperationOutcome",)),
+        ("GuidanceResponse.identifier[*].assigner", ("Organization",)),
+        (
+            "GuidanceResponse.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("GuidanceResponse.outputParameters", ("Parameters",)),
+        ("GuidanceResponse.performer", ("Device",)),
+        (
+            "GuidanceResponse.reasonReference[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("GuidanceResponse.requestIdentifier.assigner", ("Organization",)),
+        ("GuidanceResponse.result", ("CarePlan", "RequestGroup")),
+        ("GuidanceResponse.subject", ("Patient", "Group")),
+    ),
+    "HealthcareService": (
+        ("HealthcareService.coverageArea[*]", ("Location",)),
+        ("HealthcareService.endpoint[*]", ("Endpoint",)),
+        ("HealthcareService.identifier[*].assigner", ("Organization",)),
+        ("HealthcareService.location[*]", ("Location",)),
+        ("HealthcareService.providedBy", ("Organization",)),
+    ),
+    "ImagingStudy": (
+        (
+            "ImagingStudy.basedOn[*]",
+            (
+                "CarePlan",
+                "ServiceRequest",
+                "Appointment",
+                "AppointmentResponse",
+                "Task",
+            ),
+        ),
+        ("ImagingStudy.encounter", ("Encounter",)),
+        ("ImagingStudy.endpoint[*]", ("Endpoint",)),
+        ("ImagingStudy.identifier[*].assigner", ("Organization",)),
+        ("ImagingStudy.interpreter[*]", ("Practitioner", "PractitionerRole")),
+        ("ImagingStudy.location", ("Location",)),
+        (
+            "ImagingStudy.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("ImagingStudy.procedureReference", ("Procedure",)),
+        (
+            "ImagingStudy.reasonReference[*]",
+            (
+                "Condition",
+                "Observation",
+                "Media",
+                "DiagnosticReport",
+                "DocumentReference",
+            ),
+        ),
+        ("ImagingStudy.referrer", ("Practitioner", "PractitionerRole")),
+        ("ImagingStudy.series[*].endpoint[*]", ("Endpoint",)),
+        (
+            "ImagingStudy.series[*].performer[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("ImagingStudy.series[*].specimen[*]", ("Specimen",)),
+        ("ImagingStudy.subject", ("Patient", "Device", "Group")),
+    ),
+    "Immunization": (
+        ("Immunization.encounter", ("Encounter",)),
+        ("Immunization.identifier[*].assigner", ("Organization",)),
+        ("Immunization.location", ("Location",)),
+        ("Immunization.manufacturer", ("Organization",)),
+        (
+            "Immunization.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("Immunization.patient", ("Patient",)),
+        (
+            "Immunization.performer[*].actor",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("Immunization.protocolApplied[*].authority", ("Organization",)),
+        ("Immunization.reaction[*].detail", ("Observation",)),
+        (
+            "Immunization.reasonReference[*]",
+            ("Condition", "Observation", "DiagnosticReport"),
+        ),
+    ),
+    "ImmunizationEvaluation": (
+        ("ImmunizationEvaluation.authority", ("Organization",)),
+        ("ImmunizationEvaluation.identifier[*].assigner", ("Organization",)),
+        ("ImmunizationEvaluation.immunizationEvent", ("Immunization",)),
+        ("ImmunizationEvaluation.patient", ("Patient",)),
+    ),
+    "ImmunizationRecommendation": (
+        ("ImmunizationRecommendation.authority", ("Organization",)),
+        ("ImmunizationRecommendation.identifier[*].assigner", ("Organization",)),
+        ("ImmunizationRecommendation.patient", ("Patient",)),
+        (
+            "ImmunizationRecommendation.recommendation[*].supportingImmunization[*]",
+            ("Immunization", "ImmunizationEvaluation"),
+        ),
+        (
+            "ImmunizationRecommendation.recommendation[*].supportingPatientInformation[*]",
+            ("Resource",),
+        ),
+    ),
+    "ImplementationGuide": (
+        ("ImplementationGuide.definition.page.nameReference", ("Binary",)),
+        ("ImplementationGuide.definition.resource[*].reference", ("Resource",)),
+        ("ImplementationGuide.manifest.resource[*].reference", ("Resource",)),
+        (
+            "ImplementationGuide.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Ingredient": (
+        (
+            "Ingredient.for[*]",
+            (
+                "MedicinalProductDefinition",
+                "AdministrableProductDefinition",
+                "ManufacturedItemDefinition",
+            ),
+        ),
+        ("Ingredient.identifier.assigner", ("Organization",)),
+        ("Ingredient.manufacturer[*].manufacturer", ("Organization",)),
+        ("Ingredient.substance.code", ("SubstanceDefinition",)),
+        (
+            "Ingredient.substance.strength[*].referenceStrength[*].substance",
+            ("SubstanceDefinition",),
+        ),
+    ),
+    "InsurancePlan": (
+        ("InsurancePlan.administeredBy", ("Organization",)),
+        ("InsurancePlan.coverage[*].network[*]", ("Organization",)),
+        ("InsurancePlan.coverageArea[*]", ("Location",)),
+        ("InsurancePlan.endpoint[*]", ("Endpoint",)),
+        ("InsurancePlan.identifier[*].assigner", ("Organization",)),
+        ("InsurancePlan.network[*]", ("Organization",)),
+        ("InsurancePlan.ownedBy", ("Organization",)),
+        ("InsurancePlan.plan[*].coverageArea[*]", ("Location",)),
+        ("InsurancePlan.plan[*].identifier[*].assigner", ("Organization",)),
+        ("InsurancePlan.plan[*].network[*]", ("Organization",)),
+    ),
+    "Invoice": (
+        ("Invoice.account", ("Account",)),
+        ("Invoice.identifier[*].assigner", ("Organization",)),
+        ("Invoice.issuer", ("Organization",)),
+        ("Invoice.lineItem[*].chargeItemReference", ("ChargeItem",)),
+        (
+            "Invoice.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "Invoice.participant[*].actor",
+            (
+                "Practitioner",
+                "Organization",
+                "Patient",
+                "PractitionerRole",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("Invoice.recipient", ("Organization", "Patient", "RelatedPerson")),
+        ("Invoice.subject", ("Patient", "Group")),
+    ),
+    "Library": (
+        ("Library.dataRequirement[*].subjectReference", ("Group",)),
+        ("Library.identifier[*].assigner", ("Organization",)),
+        ("Library.subjectReference", ("Group",)),
+        (
+            "Library.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Linkage": (
+        ("Linkage.author", ("Practitioner", "PractitionerRole", "Organization")),
+        ("Linkage.item[*].resource", ("Resource",)),
+    ),
+    "List": (
+        ("List.encounter", ("Encounter",)),
+        ("List.entry[*].item", ("Resource",)),
+        ("List.identifier[*].assigner", ("Organization",)),
+        (
+            "List.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("List.source", ("Practitioner", "PractitionerRole", "Patient", "Device")),
+        ("List.subject", ("Patient", "Group", "Device", "Location")),
+    ),
+    "Location": (
+        ("Location.endpoint[*]", ("Endpoint",)),
+        ("Location.identifier[*].assigner", ("Organization",)),
+        ("Location.managingOrganization", ("Organization",)),
+        ("Location.partOf", ("Location",)),
+    ),
+    "ManufacturedItemDefinition": (
+        ("ManufacturedItemDefinition.identifier[*].assigner", ("Organization",)),
+        ("ManufacturedItemDefinition.manufacturer[*]", ("Organization",)),
+    ),
+    "Measure": (
+        ("Measure.identifier[*].assigner", ("Organization",)),
+        ("Measure.subjectReference", ("Group",)),
+        (
+            "Measure.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "MeasureReport": (
+        ("MeasureReport.evaluatedResource[*]", ("Resource",)),
+        ("MeasureReport.group[*].population[*].subjectResults", ("List",)),
+        (
+            "MeasureReport.group[*].stratifier[*].stratum[*].population[*].subjectResults",
+            ("List",),
+        ),
+        ("MeasureReport.identifier[*].assigner", ("Organization",)),
+        (
+            "MeasureReport.reporter",
+            ("Practitioner", "PractitionerRole", "Location", "Organization"),
+        ),
+        (
+            "MeasureReport.subject",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "Location",
+                "Device",
+                "RelatedPerson",
+                "Group",
+            ),
+        ),
+    ),
+    "Media": (
+        ("Media.basedOn[*]", ("ServiceRequest", "CarePlan")),
+        ("Media.device", ("Device", "DeviceMetric", "Device")),
+        ("Media.encounter", ("Encounter",)),
+        ("Media.identifier[*].assigner", ("Organization",)),
+        (
+            "Media.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "Media.operator",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("Media.partOf[*]", ("Resource",)),
+        (
+            "Media.subject",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "Group",
+                "Device",
+                "Specimen",
+                "Location",
+            ),
+        ),
+    ),
+    "Medication": (
+        ("Medication.identifier[*].assigner", ("Organization",)),
+        ("Medication.ingredient[*].itemReference", ("Substance", "Medication")),
+        ("Medication.manufacturer", ("Organization",)),
+    ),
+    "MedicationAdministration": (
+        ("MedicationAdministration.context", ("Encounter", "EpisodeOfCare")),
+        ("MedicationAdministration.device[*]", ("Device",)),
+        ("MedicationAdministration.eventHistory[*]", ("Provenance",)),
+        ("MedicationAdministration.identifier[*].assigner", ("Organization",)),
+        ("MedicationAdministration.medicationReference", ("Medication",)),
+        (
+            "MedicationAdministration.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "MedicationAdministration.partOf[*]",
+            ("MedicationAdministration", "Procedure"),
+        ),
+        (
+            "MedicationAdministration.performer[*].actor",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson", "Device"),
+        ),
+        (
+            "MedicationAdministration.reasonReference[*]",
+            ("Condition", "Observation", "DiagnosticReport"),
+        ),
+        ("MedicationAdministration.request", ("MedicationRequest",)),
+        ("MedicationAdministration.subject", ("Patient", "Group")),
+        ("MedicationAdministration.supportingInformation[*]", ("Resource",)),
+    ),
+    "MedicationDispense": (
+        ("MedicationDispense.authorizingPrescription[*]", ("MedicationRequest",)),
+        ("MedicationDispense.context", ("Encounter", "EpisodeOfCare")),
+        ("MedicationDispense.destination", ("Location",)),
+        ("MedicationDispense.detectedIssue[*]", ("DetectedIssue",)),
+        ("MedicationDispense.eventHistory[*]", ("Provenance",)),
+        ("MedicationDispense.identifier[*].assigner", ("Organization",)),
+        ("MedicationDispense.location", ("Location",)),
+        ("MedicationDispense.medicationReference", ("Medication",)),
+        (
+            "MedicationDispense.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("MedicationDispense.partOf[*]", ("Procedure",)),
+        (
+            "MedicationDispense.performer[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("MedicationDispense.receiver[*]", ("Patient", "Practitioner")),
+        ("MedicationDispense.statusReasonReference", ("DetectedIssue",)),
+        ("MedicationDispense.subject", ("Patient", "Group")),
+        (
+            "MedicationDispense.substitution.responsibleParty[*]",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("MedicationDispense.supportingInformation[*]", ("Resource",)),
+    ),
+    "MedicationKnowledge": (
+        (
+            "MedicationKnowledge.administrationGuidelines[*].indicationReference",
+            ("ObservationDefinition",),
+        ),
+        ("MedicationKnowledge.associatedMedication[*]", ("Medication",)),
+        ("MedicationKnowledge.contraindication[*]", ("DetectedIssue",)),
+        ("MedicationKnowledge.ingredient[*].itemReference", ("Substance",)),
+        ("MedicationKnowledge.manufacturer", ("Organization",)),
+        ("MedicationKnowledge.monograph[*].source", ("DocumentReference", "Media")),
+        ("MedicationKnowledge.regulatory[*].regulatoryAuthority", ("Organization",)),
+        (
+            "MedicationKnowledge.relatedMedicationKnowledge[*].reference[*]",
+            ("MedicationKnowledge",),
+        ),
+    ),
+    "MedicationRequest": (
+        (
+            "MedicationRequest.basedOn[*]",
+            (
+                "CarePlan",
+                "MedicationRequest",
+                "ServiceRequest",
+                "ImmunizationRecommendation",
+            ),
+        ),
+        ("MedicationRequest.detectedIssue[*]", ("DetectedIssue",)),
+        ("MedicationRequest.dispenseRequest.performer", ("Organization",)),
+        ("MedicationRequest.encounter", ("Encounter",)),
+        ("MedicationRequest.eventHistory[*]", ("Provenance",)),
+        ("MedicationRequest.groupIdentifier.assigner", ("Organization",)),
+        ("MedicationRequest.identifier[*].assigner", ("Organization",)),
+        ("MedicationRequest.insurance[*]", ("Coverage", "ClaimResponse")),
+        ("MedicationRequest.medicationReference", ("Medication",)),
+        (
+            "MedicationRequest.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "MedicationRequest.performer",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "CareTeam",
+            ),
+        ),
+        ("MedicationRequest.priorPrescription", ("MedicationRequest",)),
+        ("MedicationRequest.reasonReference[*]", ("Condition", "Observation")),
+        ("MedicationRequest.recorder", ("Practitioner", "PractitionerRole")),
+        (
+            "MedicationRequest.reportedReference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "MedicationRequest.requester",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        ("MedicationRequest.subject", ("Patient", "Group")),
+        ("MedicationRequest.supportingInformation[*]", ("Resource",)),
+    ),
+    "MedicationStatement": (
+        (
+            "MedicationStatement.basedOn[*]",
+            ("MedicationRequest", "CarePlan", "ServiceRequest"),
+        ),
+        ("MedicationStatement.context", ("Encounter", "EpisodeOfCare")),
+        ("MedicationStatement.derivedFrom[*]", ("Resource",)),
+        ("MedicationStatement.identifier[*].assigner", ("Organization",)),
+        (
+            "MedicationStatement.informationSource",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("MedicationStatement.medicationReference", ("Medication",)),
+        (
+            "MedicationStatement.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "MedicationStatement.partOf[*]",
+            (
+                "MedicationAdministration",
+                "MedicationDispense",
+                "MedicationStatement",
+                "Procedure",
+                "Observation",
+            ),
+        ),
+        (
+            "MedicationStatement.reasonReference[*]",
+            ("Condition", "Observation", "DiagnosticReport"),
+        ),
+        ("MedicationStatement.subject", ("Patient", "Group")),
+    ),
+    "MedicinalProductDefinition": (
+        ("MedicinalProductDefinition.attachedDocument[*]", ("DocumentReference",)),
+        ("MedicinalProductDefinition.clinicalTrial[*]", ("ResearchStudy",)),
+        (
+            "MedicinalProductDefinition.contact[*].contact",
+            ("Organization", "PractitionerRole"),
+        ),
+        (
+            "MedicinalProductDefinition.crossReference[*].product",
+            ("MedicinalProductDefinition",),
+        ),
+        ("MedicinalProductDefinition.identifier[*].assigner", ("Organization",)),
+        ("MedicinalProductDefinition.impurity[*]", ("SubstanceDefinition",)),
+        ("MedicinalProductDefinition.masterFile[*]", ("DocumentReference",)),
+        ("MedicinalProductDefinition.operation[*].organization[*]", ("Organization",)),
+        (
+            "MedicinalProductDefinition.operation[*].type",
+            ("ActivityDefinition", "PlanDefinition"),
+        ),
+    ),
+    "MessageDefinition": (
+        ("MessageDefinition.identifier[*].assigner", ("Organization",)),
+        (
+            "MessageDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "MessageHeader": (
+        ("MessageHeader.author", ("Practitioner", "PractitionerRole")),
+        (
+            "MessageHeader.destination[*].receiver",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("MessageHeader.destination[*].target", ("Device",)),
+        ("MessageHeader.enterer", ("Practitioner", "PractitionerRole")),
+        ("MessageHeader.focus[*]", ("Resource",)),
+        ("MessageHeader.response.details", ("OperationOutcome",)),
+        (
+            "MessageHeader.responsible",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("MessageHeader.sender", ("Practitioner", "PractitionerRole", "Organization")),
+    ),
+    "MolecularSequence": (
+        ("MolecularSequence.device", ("Device",)),
+        ("MolecularSequence.identifier[*].assigner", ("Organization",)),
+        ("MolecularSequence.patient", ("Patient",)),
+        ("MolecularSequence.performer", ("Organization",)),
+        ("MolecularSequence.pointer[*]", ("MolecularSequence",)),
+        ("MolecularSequence.referenceSeq.referenceSeqPointer", ("MolecularSequence",)),
+        ("MolecularSequence.specimen", ("Specimen",)),
+        ("MolecularSequence.variant[*].variantPointer", ("Observation",)),
+    ),
+    "NamingSystem": (
+        (
+            "NamingSystem.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "NutritionOrder": (
+        ("NutritionOrder.allergyIntolerance[*]", ("AllergyIntolerance",)),
+        ("NutritionOrder.encounter", ("Encounter",)),
+        ("NutritionOrder.identifier[*].assigner", ("Organization",)),
+        (
+            "NutritionOrder.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("NutritionOrder.orderer", ("Practitioner", "PractitionerRole")),
+        ("NutritionOrder.patient", ("Patient",)),
+    ),
+    "NutritionProduct": (
+        ("NutritionProduct.ingredient[*].item", ("NutritionProduct",)),
+        ("NutritionProduct.instance.identifier[*].assigner", ("Organization",)),
+        ("NutritionProduct.knownAllergen[*]", ("Substance",)),
+        ("NutritionProduct.manufacturer[*]", ("Organization",)),
+        (
+            "NutritionProduct.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("NutritionProduct.nutrient[*].item", ("Substance",)),
+    ),
+    "Observation": (
+        (
+            "Observation.basedOn[*]",
+            (
+                "CarePlan",
+                "DeviceRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+            ),
+        ),
+        (
+            "Observation.derivedFrom[*]",
+            (
+                "DocumentReference",
+                "ImagingStudy",
+                "Media",
+                "QuestionnaireResponse",
+                "Observation",
+                "MolecularSequence",
+            ),
+        ),
+        ("Observation.device", ("Device", "DeviceMetric")),
+        ("Observation.encounter", ("Encounter",)),
+        ("Observation.focus[*]", ("Resource",)),
+        (
+            "Observation.hasMember[*]",
+            ("Observation", "QuestionnaireResponse", "MolecularSequence"),
+        ),
+        ("Observation.identifier[*].assigner", ("Organization",)),
+        (
+            "Observation.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "Observation.partOf[*]",
+            (
+                "MedicationAdministration",
+                "MedicationDispense",
+                "MedicationStatement",
+                "Procedure",
+                "Immunization",
+                "ImagingStudy",
+            ),
+        ),
+        (
+            "Observation.performer[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("Observation.specimen", ("Specimen",)),
+        (
+            "Observation.subject",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "Location",
+                "Organization",
+                "Procedure",
+                "Practitioner",
+                "Medication",
+                "Substance",
+            ),
+        ),
+    ),
+    "ObservationDefinition": (
+        ("ObservationDefinition.abnormalCodedValueSet", ("ValueSet",)),
+        ("ObservationDefinition.criticalCodedValueSet", ("ValueSet",)),
+        ("ObservationDefinition.identifier[*].assigner", ("Organization",)),
+        ("ObservationDefinition.normalCodedValueSet", ("ValueSet",)),
+        ("ObservationDefinition.validCodedValueSet", ("ValueSet",)),
+    ),
+    "OperationDefinition": (
+        (
+            "OperationDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Organization": (
+        ("Organization.endpoint[*]", ("Endpoint",)),
+        ("Organization.identifier[*].assigner", ("Organization",)),
+        ("Organization.partOf", ("Organization",)),
+    ),
+    "OrganizationAffiliation": (
+        ("OrganizationAffiliation.endpoint[*]", ("Endpoint",)),
+        ("OrganizationAffiliation.healthcareService[*]", ("HealthcareService",)),
+        ("OrganizationAffiliation.identifier[*].assigner", ("Organization",)),
+        ("OrganizationAffiliation.location[*]", ("Location",)),
+        ("OrganizationAffiliation.network[*]", ("Organization",)),
+        ("OrganizationAffiliation.organization", ("Organization",)),
+        ("OrganizationAffiliation.participatingOrganization", ("Organization",)),
+    ),
+    "PackagedProductDefinition": (
+        ("PackagedProductDefinition.identifier[*].assigner", ("Organization",)),
+        ("PackagedProductDefinition.manufacturer[*]", ("Organization",)),
+        (
+            "PackagedProductDefinition.package.containedItem[*].item",
+            (
+                "ManufacturedItemDefinition",
+                "DeviceDefinition",
+                "PackagedProductDefinition",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+            ),
+        ),
+        ("PackagedProductDefinition.package.identifier[*].assigner", ("Organization",)),
+        ("PackagedProductDefinition.package.manufacturer[*]", ("Organization",)),
+        ("PackagedProductDefinition.packageFor[*]", ("MedicinalProductDefinition",)),
+    ),
+    "Parameters": (
+        (
+            "Parameters.parameter[*].valueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("Parameters.parameter[*].valueDataRequirement.subjectReference", ("Group",)),
+        ("Parameters.parameter[*].valueIdentifier.assigner", ("Organization",)),
+        ("Parameters.parameter[*].valueReference", None),
+        (
+            "Parameters.parameter[*].valueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Parameters.parameter[*].valueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Parameters.parameter[*].valueTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "Parameters.parameter[*].valueTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "Parameters.parameter[*].valueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Patient": (
+        ("Patient.contact[*].organization", ("Organization",)),
+        (
+            "Patient.generalPractitioner[*]",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+        ("Patient.identifier[*].assigner", ("Organization",)),
+        ("Patient.link[*].other", ("Patient", "RelatedPerson")),
+        ("Patient.managingOrganization", ("Organization",)),
+    ),
+    "PaymentNotice": (
+        ("PaymentNotice.identifier[*].assigner", ("Organization",)),
+        ("PaymentNotice.payee", ("Practitioner", "PractitionerRole", "Organization")),
+        ("PaymentNotice.payment", ("PaymentReconciliation",)),
+        (
+            "PaymentNotice.provider",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("PaymentNotice.recipient", ("Organization",)),
+        ("PaymentNotice.request", ("Resource",)),
+        ("PaymentNotice.response", ("Resource",)),
+    ),
+    "PaymentReconciliation": (
+        ("PaymentReconciliation.detail[*].identifier.assigner", ("Organization",)),
+        (
+            "PaymentReconciliation.detail[*].payee",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("PaymentReconciliation.detail[*].predecessor.assigner", ("Organization",)),
+        ("PaymentReconciliation.detail[*].request", ("Resource",)),
+        ("PaymentReconciliation.detail[*].response", ("Resource",)),
+        ("PaymentReconciliation.detail[*].responsible", ("PractitionerRole",)),
+        (
+            "PaymentReconciliation.detail[*].submitter",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("PaymentReconciliation.identifier[*].assigner", ("Organization",)),
+        ("PaymentReconciliation.paymentIdentifier.assigner", ("Organization",)),
+        ("PaymentReconciliation.paymentIssuer", ("Organization",)),
+        ("PaymentReconciliation.request", ("Task",)),
+        (
+            "PaymentReconciliation.requestor",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "Person": (
+        ("Person.identifier[*].assigner", ("Organization",)),
+        (
+            "Person.link[*].target",
+            ("Patient", "Practitioner", "RelatedPerson", "Person"),
+        ),
+        ("Person.managingOrganization", ("Organization",)),
+    ),
+    "PlanDefinition": (
+        ("PlanDefinition.action[*].input[*].subjectReference", ("Group",)),
+        ("PlanDefinition.action[*].output[*].subjectReference", ("Group",)),
+        ("PlanDefinition.action[*].subjectReference", ("Group",)),
+        ("PlanDefinition.action[*].trigger[*].data[*].subjectReference", ("Group",)),
+        ("PlanDefinition.action[*].trigger[*].timingReference", ("Schedule",)),
+        ("PlanDefinition.identifier[*].assigner", ("Organization",)),
+        ("PlanDefinition.subjectReference", ("Group",)),
+        (
+            "PlanDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Practitioner": (
+        ("Practitioner.identifier[*].assigner", ("Organization",)),
+        ("Practitioner.qualification[*].identifier[*].assigner", ("Organization",)),
+        ("Practitioner.qualification[*].issuer", ("Organization",)),
+    ),
+    "PractitionerRole": (
+        ("PractitionerRole.endpoint[*]", ("Endpoint",)),
+        ("PractitionerRole.healthcareService[*]", ("HealthcareService",)),
+        ("PractitionerRole.identifier[*].assigner", ("Organization",)),
+        ("PractitionerRole.location[*]", ("Location",)),
+        ("PractitionerRole.organization", ("Organization",)),
+        ("PractitionerRole.practitioner", ("Practitioner",)),
+    ),
+    "Procedure": (
+        (
+            "Procedure.asserter",
+            ("Patient", "RelatedPerson", "Practitioner", "PractitionerRole"),
+        ),
+        ("Procedure.basedOn[*]", ("CarePlan", "ServiceRequest")),
+        ("Procedure.complicationDetail[*]", ("Condition",)),
+        ("Procedure.encounter", ("Encounter",)),
+        ("Procedure.focalDevice[*].manipulated", ("Device",)),
+        ("Procedure.identifier[*].assigner", ("Organization",)),
+        ("Procedure.location", ("Location",)),
+        (
+            "Procedure.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "Procedure.partOf[*]",
+            ("Procedure", "Observation", "MedicationAdministration"),
+        ),
+        (
+            "Procedure.performer[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        ("Procedure.performer[*].onBehalfOf", ("Organization",)),
+        (
+            "Procedure.reasonReference[*]",
+            (
+                "Condition",
+                "Observation",
+                "Procedure",
+                "DiagnosticReport",
+                "DocumentReference",
+            ),
+        ),
+        (
+            "Procedure.recorder",
+            ("Patient", "RelatedPerson", "Practitioner", "PractitionerRole"),
+        ),
+        (
+            "Procedure.report[*]",
+            ("DiagnosticReport", "DocumentReference", "Composition"),
+        ),
+        ("Procedure.subject", ("Patient", "Group")),
+        ("Procedure.usedReference[*]", ("Device", "Medication", "Substance")),
+    ),
+    "Provenance": (
+        (
+            "Provenance.agent[*].onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Provenance.agent[*].who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Provenance.entity[*].agent[*].onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Provenance.entity[*].agent[*].who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        ("Provenance.entity[*].what", ("Resource",)),
+        ("Provenance.location", ("Location",)),
+        (
+            "Provenance.signature[*].onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Provenance.signature[*].who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        ("Provenance.target[*]", ("Resource",)),
+    ),
+    "Questionnaire": (
+        ("Questionnaire.identifier[*].assigner", ("Organization",)),
+        ("Questionnaire.item[*].answerOption[*].valueReference", ("Resource",)),
+        ("Questionnaire.item[*].enableWhen[*].answerReference", ("Resource",)),
+        ("Questionnaire.item[*].initial[*].valueReference", ("Resource",)),
+        (
+            "Questionnaire.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "QuestionnaireResponse": (
+        (
+            "QuestionnaireResponse.author",
+            (
+                "Device",
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("QuestionnaireResponse.basedOn[*]", ("CarePlan", "ServiceRequest")),
+        ("QuestionnaireResponse.encounter", ("Encounter",)),
+        ("QuestionnaireResponse.identifier.assigner", ("Organization",)),
+        ("QuestionnaireResponse.item[*].answer[*].valueReference", ("Resource",)),
+        ("QuestionnaireResponse.partOf[*]", ("Observation", "Procedure")),
+        (
+            "QuestionnaireResponse.source",
+            ("Patient", "Practitioner", "PractitionerRole", "RelatedPerson"),
+        ),
+        ("QuestionnaireResponse.subject", ("Resource",)),
+    ),
+    "RegulatedAuthorization": (
+        ("RegulatedAuthorization.case.identifier.assigner", ("Organization",)),
+        ("RegulatedAuthorization.holder", ("Organization",)),
+        ("RegulatedAuthorization.identifier[*].assigner", ("Organization",)),
+        ("RegulatedAuthorization.indication", ("ClinicalUseDefinition",)),
+        ("RegulatedAuthorization.regulator", ("Organization",)),
+        (
+            "RegulatedAuthorization.subject[*]",
+            (
+                "MedicinalProductDefinition",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+                "PackagedProductDefinition",
+                "SubstanceDefinition",
+                "DeviceDefinition",
+                "ResearchStudy",
+                "ActivityDefinition",
+                "PlanDefinition",
+                "ObservationDefinition",
+                "Practitioner",
+                "Organization",
+                "Location",
+            ),
+        ),
+    ),
+    "RelatedPerson": (
+        ("RelatedPerson.identifier[*].assigner", ("Organization",)),
+        ("RelatedPerson.patient", ("Patient",)),
+    ),
+    "RequestGroup": (
+        (
+            "RequestGroup.action[*].participant[*]",
+            ("Patient", "Practitioner", "PractitionerRole", "RelatedPerson", "Device"),
+        ),
+        ("RequestGroup.action[*].resource", ("Resource",)),
+        ("RequestGroup.author", ("Device", "Practitioner", "PractitionerRole")),
+        ("RequestGroup.basedOn[*]", ("Resource",)),
+        ("RequestGroup.encounter", ("Encounter",)),
+        ("RequestGroup.groupIdentifier.assigner", ("Organization",)),
+        ("RequestGroup.identifier[*].assigner", ("Organization",)),
+        (
+            "RequestGroup.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "RequestGroup.reasonReference[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("RequestGroup.replaces[*]", ("Resource",)),
+        ("RequestGroup.subject", ("Patient", "Group")),
+    ),
+    "ResearchDefinition": (
+        ("ResearchDefinition.exposure", ("ResearchElementDefinition",)),
+        ("ResearchDefinition.exposureAlternative", ("ResearchElementDefinition",)),
+        ("ResearchDefinition.identifier[*].assigner", ("Organization",)),
+        ("ResearchDefinition.outcome", ("ResearchElementDefinition",)),
+        ("ResearchDefinition.population", ("ResearchElementDefinition",)),
+        ("ResearchDefinition.subjectReference", ("Group",)),
+        (
+            "ResearchDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ResearchElementDefinition": (
+        (
+            "ResearchElementDefinition.characteristic[*].definitionDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "ResearchElementDefinition.characteristic[*].usageContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        ("ResearchElementDefinition.identifier[*].assigner", ("Organization",)),
+        ("ResearchElementDefinition.subjectReference", ("Group",)),
+        (
+            "ResearchElementDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ResearchStudy": (
+        ("ResearchStudy.enrollment[*]", ("Group",)),
+        ("ResearchStudy.identifier[*].assigner", ("Organization",)),
+        (
+            "ResearchStudy.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("ResearchStudy.partOf[*]", ("ResearchStudy",)),
+        ("ResearchStudy.principalInvestigator", ("Practitioner", "PractitionerRole")),
+        ("ResearchStudy.protocol[*]", ("PlanDefinition",)),
+        ("ResearchStudy.site[*]", ("Location",)),
+        ("ResearchStudy.sponsor", ("Organization",)),
+    ),
+    "ResearchSubject": (
+        ("ResearchSubject.consent", ("Consent",)),
+        ("ResearchSubject.identifier[*].assigner", ("Organization",)),
+        ("ResearchSubject.individual", ("Patient",)),
+        ("ResearchSubject.study", ("ResearchStudy",)),
+    ),
+    "RiskAssessment": (
+        ("RiskAssessment.basedOn", ("Resource",)),
+        ("RiskAssessment.basis[*]", ("Resource",)),
+        ("RiskAssessment.condition", ("Condition",)),
+        ("RiskAssessment.encounter", ("Encounter",)),
+        ("RiskAssessment.identifier[*].assigner", ("Organization",)),
+        (
+            "RiskAssessment.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("RiskAssessment.parent", ("Resource",)),
+        ("RiskAssessment.performer", ("Practitioner", "PractitionerRole", "Device")),
+        (
+            "RiskAssessment.reasonReference[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("RiskAssessment.subject", ("Patient", "Group")),
+    ),
+    "Schedule": (
+        (
+            "Schedule.actor[*]",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        ("Schedule.identifier[*].assigner", ("Organization",)),
+    ),
+    "SearchParameter": (
+        (
+            "SearchParameter.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ServiceRequest": (
+        (
+            "ServiceRequest.basedOn[*]",
+            ("CarePlan", "ServiceRequest", "MedicationRequest"),
+        ),
+        ("ServiceRequest.encounter", ("Encounter",)),
+        ("ServiceRequest.identifier[*].assigner", ("Organization",)),
+        ("ServiceRequest.insurance[*]", ("Coverage", "ClaimResponse")),
+        ("ServiceRequest.locationReference[*]", ("Location",)),
+        (
+            "ServiceRequest.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "ServiceRequest.performer[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "ServiceRequest.reasonReference[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("ServiceRequest.relevantHistory[*]", ("Provenance",)),
+        ("ServiceRequest.replaces[*]", ("ServiceRequest",)),
+        (
+            "ServiceRequest.requester",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        ("ServiceRequest.requisition.assigner", ("Organization",)),
+        ("ServiceRequest.specimen[*]", ("Specimen",)),
+        ("ServiceRequest.subject", ("Patient", "Group", "Location", "Device")),
+        ("ServiceRequest.supportingInfo[*]", ("Resource",)),
+    ),
+    "Slot": (
+        ("Slot.identifier[*].assigner", ("Organization",)),
+        ("Slot.schedule", ("Schedule",)),
+    ),
+    "Specimen": (
+        ("Specimen.accessionIdentifier.assigner", ("Organization",)),
+        ("Specimen.collection.collector", ("Practitioner", "PractitionerRole")),
+        ("Specimen.container[*].additiveReference", ("Substance",)),
+        ("Specimen.container[*].identifier[*].assigner", ("Organization",)),
+        ("Specimen.identifier[*].assigner", ("Organization",)),
+        (
+            "Specimen.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("Specimen.parent[*]", ("Specimen",)),
+        ("Specimen.processing[*].additive[*]", ("Substance",)),
+        ("Specimen.request[*]", ("ServiceRequest",)),
+        ("Specimen.subject", ("Patient", "Group", "Device", "Substance", "Location")),
+    ),
+    "SpecimenDefinition": (
+        ("SpecimenDefinition.identifier.assigner", ("Organization",)),
+        (
+            "SpecimenDefinition.typeTested[*].container.additive[*].additiveReference",
+            ("Substance",),
+        ),
+    ),
+    "StructureDefinition": (
+        (
+            "StructureDefinition.differential.element[*].defaultValueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueCodeableReference",
+            None,
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.differential.element[*].defaultValueReference", None),
+        (
+            "StructureDefinition.differential.element[*].defaultValueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueCodeableReference",
+            None,
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.differential.element[*].example[*].valueReference", None),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("StructureDefinition.differential.element[*].fixedCodeableReference", None),
+        (
+            "StructureDefinition.differential.element[*].fixedDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.differential.element[*].fixedReference", None),
+        (
+            "StructureDefinition.differential.element[*].fixedSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("StructureDefinition.differential.element[*].patternCodeableReference", None),
+        (
+            "StructureDefinition.differential.element[*].patternDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.differential.element[*].patternReference", None),
+        (
+            "StructureDefinition.differential.element[*].patternSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        ("StructureDefinition.identifier[*].assigner", ("Organization",)),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("StructureDefinition.snapshot.element[*].defaultValueCodeableReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.snapshot.element[*].defaultValueReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueCodeableReference",
+            None,
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.snapshot.element[*].example[*].valueReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("StructureDefinition.snapshot.element[*].fixedCodeableReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].fixedDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.snapshot.element[*].fixedReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].fixedSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("StructureDefinition.snapshot.element[*].patternCodeableReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].patternDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.snapshot.element[*].patternReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].patternSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "StructureMap": (
+        (
+            "StructureMap.group[*].rule[*].source[*].defaultValueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "StructureMap.group[*].rule[*].source[*].defaultValueDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureMap.group[*].rule[*].source[*].defaultValueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureMap.group[*].rule[*].source[*].defaultValueReference", None),
+        (
+            "StructureMap.group[*].rule[*].source[*].defaultValueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureMap.group[*].rule[*].source[*].defaultValueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureMap.group[*].rule[*].source[*].defaultValueTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureMap.group[*].rule[*].source[*].defaultValueTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureMap.group[*].rule[*].source[*].defaultValueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        ("StructureMap.identifier[*].assigner", ("Organization",)),
+        (
+            "StructureMap.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "SubscriptionStatus": (
+        ("SubscriptionStatus.notificationEvent[*].additionalContext[*]", ("Resource",)),
+        ("SubscriptionStatus.notificationEvent[*].focus", ("Resource",)),
+        ("SubscriptionStatus.subscription", ("Subscription",)),
+    ),
+    "SubscriptionTopic": (
+        ("SubscriptionTopic.identifier[*].assigner", ("Organization",)),
+        (
+            "SubscriptionTopic.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Substance": (
+        ("Substance.identifier[*].assigner", ("Organization",)),
+        ("Substance.ingredient[*].substanceReference", ("Substance",)),
+        ("Substance.instance[*].identifier.assigner", ("Organization",)),
+    ),
+    "SubstanceDefinition": (
+        (
+            "SubstanceDefinition.code[*].note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("SubstanceDefinition.code[*].source[*]", ("DocumentReference",)),
+        ("SubstanceDefinition.identifier[*].assigner", ("Organization",)),
+        ("SubstanceDefinition.informationSource[*]", ("Citation",)),
+        ("SubstanceDefinition.manufacturer[*]", ("Organization",)),
+        ("SubstanceDefinition.moiety[*].identifier.assigner", ("Organization",)),
+        ("SubstanceDefinition.name[*].source[*]", ("DocumentReference",)),
+        (
+            "SubstanceDefinition.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("SubstanceDefinition.relationship[*].source[*]", ("DocumentReference",)),
+        (
+            "SubstanceDefinition.relationship[*].substanceDefinitionReference",
+            ("SubstanceDefinition",),
+        ),
+        (
+            "SubstanceDefinition.structure.representation[*].document",
+            ("DocumentReference",),
+        ),
+        ("SubstanceDefinition.structure.sourceDocument[*]", ("DocumentReference",)),
+        ("SubstanceDefinition.supplier[*]", ("Organization",)),
+    ),
+    "SupplyDelivery": (
+        ("SupplyDelivery.basedOn[*]", ("SupplyRequest",)),
+        ("SupplyDelivery.destination", ("Location",)),
+        ("SupplyDelivery.identifier[*].assigner", ("Organization",)),
+        ("SupplyDelivery.partOf[*]", ("SupplyDelivery", "Contract")),
+        ("SupplyDelivery.patient", ("Patient",)),
+        ("SupplyDelivery.receiver[*]", ("Practitioner", "PractitionerRole")),
+        (
+            "SupplyDelivery.suppliedItem.itemReference",
+            ("Medication", "Substance", "Device"),
+        ),
+        (
+            "SupplyDelivery.supplier",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "SupplyRequest": (
+        ("SupplyRequest.deliverFrom", ("Organization", "Location")),
+        ("SupplyRequest.deliverTo", ("Organization", "Location", "Patient")),
+        ("SupplyRequest.identifier[*].assigner", ("Organization",)),
+        ("SupplyRequest.itemReference", ("Medication", "Substance", "Device")),
+        (
+            "SupplyRequest.reasonReference[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        (
+            "SupplyRequest.requester",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        ("SupplyRequest.supplier[*]", ("Organization", "HealthcareService")),
+    ),
+    "Task": (
+        ("Task.basedOn[*]", ("Resource",)),
+        ("Task.encounter", ("Encounter",)),
+        ("Task.focus", ("Resource",)),
+        ("Task.for", ("Resource",)),
+        ("Task.groupIdentifier.assigner", ("Organization",)),
+        ("Task.identifier[*].assigner", ("Organization",)),
+        (
+            "Task.input[*].valueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("Task.input[*].valueDataRequirement.subjectReference", ("Group",)),
+        ("Task.input[*].valueIdentifier.assigner", ("Organization",)),
+        ("Task.input[*].valueReference", None),
+        (
+            "Task.input[*].valueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Task.input[*].valueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        ("Task.input[*].valueTriggerDefinition.data[*].subjectReference", ("Group",)),
+        ("Task.input[*].valueTriggerDefinition.timingReference", ("Schedule",)),
+        (
+            "Task.input[*].valueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        ("Task.insurance[*]", ("Coverage", "ClaimResponse")),
+        ("Task.location", ("Location",)),
+        (
+            "Task.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        (
+            "Task.output[*].valueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("Task.output[*].valueDataRequirement.subjectReference", ("Group",)),
+        ("Task.output[*].valueIdentifier.assigner", ("Organization",)),
+        ("Task.output[*].valueReference", None),
+        (
+            "Task.output[*].valueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Task.output[*].valueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        ("Task.output[*].valueTriggerDefinition.data[*].subjectReference", ("Group",)),
+        ("Task.output[*].valueTriggerDefinition.timingReference", ("Schedule",)),
+        (
+            "Task.output[*].valueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "Task.owner",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("Task.partOf[*]", ("Task",)),
+        ("Task.reasonReference", ("Resource",)),
+        ("Task.relevantHistory[*]", ("Provenance",)),
+        (
+            "Task.requester",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "Task.restriction.recipient[*]",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Group",
+                "Organization",
+            ),
+        ),
+    ),
+    "TerminologyCapabilities": (
+        (
+            "TerminologyCapabilities.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "TestReport": (
+        ("TestReport.identifier.assigner", ("Organization",)),
+        ("TestReport.testScript", ("TestScript",)),
+    ),
+    "TestScript": (
+        ("TestScript.fixture[*].resource", ("Resource",)),
+        ("TestScript.identifier.assigner", ("Organization",)),
+        ("TestScript.profile[*]", ("Resource",)),
+        (
+            "TestScript.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ValueSet": (
+        ("ValueSet.identifier[*].assigner", ("Organization",)),
+        (
+            "ValueSet.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "VerificationResult": (
+        (
+            "VerificationResult.attestation.onBehalfOf",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+        (
+            "VerificationResult.attestation.proxySignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "VerificationResult.attestation.proxySignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "VerificationResult.attestation.sourceSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "VerificationResult.attestation.sourceSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "VerificationResult.attestation.who",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "VerificationResult.primarySource[*].who",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+        ("VerificationResult.target[*]", ("Resource",)),
+        (
+            "VerificationResult.validator[*].attestationSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "VerificationResult.validator[*].attestationSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        ("VerificationResult.validator[*].organization", ("Organization",)),
+    ),
+    "VisionPrescription": (
+        ("VisionPrescription.encounter", ("Encounter",)),
+        ("VisionPrescription.identifier[*].assigner", ("Organization",)),
+        (
+            "VisionPrescription.lensSpecification[*].note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson", "Organization"),
+        ),
+        ("VisionPrescription.patient", ("Patient",)),
+        ("VisionPrescription.prescriber", ("Practitioner", "PractitionerRole")),
+    ),
+}
+
+__all__ = ["REFERENCE_FIELDS", "REFERENCE_PATHS"]
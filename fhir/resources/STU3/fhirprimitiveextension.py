@@ -2,10 +2,10 @@ from __future__ import annotations as _annotations
 
 import typing
 
-from fhir_core import fhirabstractmodel
 from pydantic import Field, model_validator
 from pydantic_core import PydanticCustomError
 
+from .. import fhirabstractmodel
 from . import fhirtypes
 
 __author__ = "Md Nazrul Islam"
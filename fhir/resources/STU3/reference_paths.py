@@ -0,0 +1,4917 @@
+from __future__ import annotations as _annotations
+
+import typing
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+# Generated by ``script/generate.py``, see ``write_reference_paths``.
+#
+# The fields of every model class that lead to a ``Reference``, extensions
+# left out: ``{class name: ((field name, element name, is list, kind, target
+# types), ...)}``. ``kind`` is one of ``reference``, ``codeable`` (a
+# ``CodeableReference``), ``resource`` (a resource of any type, i.e.
+# ``contained``) or ``element`` (a complex element with references inside).
+ReferenceField = typing.Tuple[
+    str, str, bool, str, typing.Optional[typing.Tuple[str, ...]]
+]
+
+REFERENCE_FIELDS: typing.Dict[str, typing.Tuple[ReferenceField, ...]] = {
+    "Account": (
+        ("contained", "contained", True, "resource", None),
+        ("coverage", "coverage", True, "element", None),
+        ("guarantor", "guarantor", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("owner", "owner", False, "reference", ("Organization",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Device",
+                "Practitioner",
+                "Location",
+                "HealthcareService",
+                "Organization",
+            ),
+        ),
+    ),
+    "AccountCoverage": (("coverage", "coverage", False, "reference", ("Coverage",)),),
+    "AccountGuarantor": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson", "Organization"),
+        ),
+    ),
+    "ActivityDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("library", "library", True, "reference", ("Library",)),
+        ("location", "location", False, "reference", ("Location",)),
+        (
+            "productReference",
+            "productReference",
+            False,
+            "reference",
+            ("Medication", "Substance"),
+        ),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("transform", "transform", False, "reference", ("StructureMap",)),
+    ),
+    "AdverseEvent": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "eventParticipant",
+            "eventParticipant",
+            False,
+            "reference",
+            ("Practitioner", "Device"),
+        ),
+        ("identifier", "identifier", False, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("reaction", "reaction", True, "reference", ("Condition",)),
+        (
+            "recorder",
+            "recorder",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "RelatedPerson"),
+        ),
+        (
+            "referenceDocument",
+            "referenceDocument",
+            True,
+            "reference",
+            ("DocumentReference",),
+        ),
+        ("study", "study", True, "reference", ("ResearchStudy",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "ResearchSubject", "Medication", "Device"),
+        ),
+        (
+            "subjectMedicalHistory",
+            "subjectMedicalHistory",
+            True,
+            "reference",
+            (
+                "Condition",
+                "Observation",
+                "AllergyIntolerance",
+                "FamilyMemberHistory",
+                "Immunization",
+                "Procedure",
+            ),
+        ),
+        ("suspectEntity", "suspectEntity", True, "element", None),
+    ),
+    "AdverseEventSuspectEntity": (
+        (
+            "causalityAuthor",
+            "causalityAuthor",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        (
+            "instance",
+            "instance",
+            False,
+            "reference",
+            (
+                "Substance",
+                "Medication",
+                "MedicationAdministration",
+                "MedicationStatement",
+                "Device",
+            ),
+        ),
+    ),
+    "AllergyIntolerance": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "asserter",
+            "asserter",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson", "Practitioner"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("reaction", "reaction", True, "element", None),
+        ("recorder", "recorder", False, "reference", ("Practitioner", "Patient")),
+    ),
+    "AllergyIntoleranceReaction": (("note", "note", True, "element", None),),
+    "Annotation": (
+        (
+            "authorReference",
+            "authorReference",
+            False,
+            "reference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+    ),
+    "Appointment": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "incomingReferral",
+            "incomingReferral",
+            True,
+            "reference",
+            ("ReferralRequest",),
+        ),
+        ("indication", "indication", True, "reference", ("Condition", "Procedure")),
+        ("participant", "participant", True, "element", None),
+        ("slot", "slot", True, "reference", ("Slot",)),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "AppointmentParticipant": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+    ),
+    "AppointmentResponse": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        ("appointment", "appointment", False, "reference", ("Appointment",)),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "AuditEvent": (
+        ("contained", "contained", True, "resource", None),
+        ("agent", "agent", True, "element", None),
+        ("entity", "entity", True, "element", None),
+        ("source", "source", False, "element", None),
+    ),
+    "AuditEventAgent": (
+        ("location", "location", False, "reference", ("Location",)),
+        (
+            "reference",
+            "reference",
+            False,
+            "reference",
+            ("Practitioner", "Organization", "Device", "Patient", "RelatedPerson"),
+        ),
+        ("userId", "userId", False, "element", None),
+    ),
+    "AuditEventEntity": (
+        ("identifier", "identifier", False, "element", None),
+        ("reference", "reference", False, "reference", ("Resource",)),
+    ),
+    "AuditEventSource": (("identifier", "identifier", False, "element", None),),
+    "Basic": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("subject", "subject", False, "reference", ("Resource",)),
+    ),
+    "Binary": (
+        ("securityContext", "securityContext", False, "reference", ("Resource",)),
+    ),
+    "BodySite": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+    ),
+    "Bundle": (
+        ("entry", "entry", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("signature", "signature", False, "element", None),
+    ),
+    "BundleEntry": (
+        ("resource", "resource", False, "resource", None),
+        ("response", "response", False, "element", None),
+    ),
+    "BundleEntryResponse": (("outcome", "outcome", False, "resource", None),),
+    "CapabilityStatement": (
+        ("contained", "contained", True, "resource", None),
+        ("document", "document", True, "element", None),
+        ("messaging", "messaging", True, "element", None),
+        ("profile", "profile", True, "reference", ("StructureDefinition",)),
+        ("rest", "rest", True, "element", None),
+    ),
+    "CapabilityStatementDocument": (
+        ("profile", "profile", False, "reference", ("StructureDefinition",)),
+    ),
+    "CapabilityStatementMessaging": (
+        ("event", "event", True, "element", None),
+        ("supportedMessage", "supportedMessage", True, "element", None),
+    ),
+    "CapabilityStatementMessagingEvent": (
+        ("request", "request", False, "reference", ("StructureDefinition",)),
+        ("response", "response", False, "reference", ("StructureDefinition",)),
+    ),
+    "CapabilityStatementMessagingSupportedMessage": (
+        ("definition", "definition", False, "reference", ("MessageDefinition",)),
+    ),
+    "CapabilityStatementRest": (
+        ("operation", "operation", True, "element", None),
+        ("resource", "resource", True, "element", None),
+    ),
+    "CapabilityStatementRestOperation": (
+        ("definition", "definition", False, "reference", ("OperationDefinition",)),
+    ),
+    "CapabilityStatementRestResource": (
+        ("profile", "profile", False, "reference", ("StructureDefinition",)),
+    ),
+    "CarePlan": (
+        ("contained", "contained", True, "resource", None),
+        ("activity", "activity", True, "element", None),
+        ("addresses", "addresses", True, "reference", ("Condition",)),
+        (
+            "author",
+            "author",
+            True,
+            "reference",
+            ("Patient", "Practitioner", "RelatedPerson", "Organization", "CareTeam"),
+        ),
+        ("basedOn", "basedOn", True, "reference", ("CarePlan",)),
+        ("careTeam", "careTeam", True, "reference", ("CareTeam",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        (
+            "definition",
+            "definition",
+            True,
+            "reference",
+            ("PlanDefinition", "Questionnaire"),
+        ),
+        ("goal", "goal", True, "reference", ("Goal",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("CarePlan",)),
+        ("replaces", "replaces", True, "reference", ("CarePlan",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+    ),
+    "CarePlanActivity": (
+        ("detail", "detail", False, "element", None),
+        ("outcomeReference", "outcomeReference", True, "reference", ("Resource",)),
+        ("progress", "progress", True, "element", None),
+        (
+            "reference",
+            "reference",
+            False,
+            "reference",
+            (
+                "Appointment",
+                "CommunicationRequest",
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "Task",
+                "ProcedureRequest",
+                "ReferralRequest",
+                "VisionPrescription",
+                "RequestGroup",
+            ),
+        ),
+    ),
+    "CarePlanActivityDetail": (
+        (
+            "definition",
+            "definition",
+            False,
+            "reference",
+            ("PlanDefinition", "ActivityDefinition", "Questionnaire"),
+        ),
+        ("goal", "goal", True, "reference", ("Goal",)),
+        ("location", "location", False, "reference", ("Location",)),
+        (
+            "performer",
+            "performer",
+            True,
+            "reference",
+            ("Practitioner", "Organization", "RelatedPerson", "Patient", "CareTeam"),
+        ),
+        (
+            "productReference",
+            "productReference",
+            False,
+            "reference",
+            ("Medication", "Substance"),
+        ),
+        ("reasonReference", "reasonReference", True, "reference", ("Condition",)),
+    ),
+    "CareTeam": (
+        ("contained", "contained", True, "resource", None),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            True,
+            "reference",
+            ("Organization",),
+        ),
+        ("note", "note", True, "element", None),
+        ("participant", "participant", True, "element", None),
+        ("reasonReference", "reasonReference", True, "reference", ("Condition",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "CareTeamParticipant": (
+        (
+            "member",
+            "member",
+            False,
+            "reference",
+            ("Practitioner", "RelatedPerson", "Patient", "Organization", "CareTeam"),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "ChargeItem": (
+        ("contained", "contained", True, "resource", None),
+        ("account", "account", True, "reference", ("Account",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        (
+            "enterer",
+            "enterer",
+            False,
+            "reference",
+            ("Practitioner", "Organization", "Patient", "Device", "RelatedPerson"),
+        ),
+        ("identifier", "identifier", False, "element", None),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("ChargeItem",)),
+        ("participant", "participant", True, "element", None),
+        (
+            "performingOrganization",
+            "performingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        (
+            "requestingOrganization",
+            "requestingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        (
+            "service",
+            "service",
+            True,
+            "reference",
+            (
+                "DiagnosticReport",
+                "ImagingStudy",
+                "Immunization",
+                "MedicationAdministration",
+                "MedicationDispense",
+                "Observation",
+                "Procedure",
+                "SupplyDelivery",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "ChargeItemParticipant": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            ("Practitioner", "Organization", "Patient", "Device", "RelatedPerson"),
+        ),
+    ),
+    "Claim": (
+        ("contained", "contained", True, "resource", None),
+        ("accident", "accident", False, "element", None),
+        ("careTeam", "careTeam", True, "element", None),
+        ("diagnosis", "diagnosis", True, "element", None),
+        ("enterer", "enterer", False, "reference", ("Practitioner",)),
+        ("facility", "facility", False, "reference", ("Location",)),
+        ("identifier", "identifier", True, "element", None),
+        ("information", "information", True, "element", None),
+        ("insurance", "insurance", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("item", "item", True, "element", None),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        (
+            "originalPrescription",
+            "originalPrescription",
+            False,
+            "reference",
+            ("MedicationRequest",),
+        ),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("payee", "payee", False, "element", None),
+        (
+            "prescription",
+            "prescription",
+            False,
+            "reference",
+            ("MedicationRequest", "VisionPrescription"),
+        ),
+        ("procedure", "procedure", True, "element", None),
+        ("provider", "provider", False, "reference", ("Practitioner",)),
+        ("referral", "referral", False, "reference", ("ReferralRequest",)),
+        ("related", "related", True, "element", None),
+    ),
+    "ClaimAccident": (
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+    ),
+    "ClaimCareTeam": (
+        ("provider", "provider", False, "reference", ("Practitioner", "Organization")),
+    ),
+    "ClaimDiagnosis": (
+        (
+            "diagnosisReference",
+            "diagnosisReference",
+            False,
+            "reference",
+            ("Condition",),
+        ),
+    ),
+    "ClaimInformation": (
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "ClaimInsurance": (
+        ("claimResponse", "claimResponse", False, "reference", ("ClaimResponse",)),
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+    ),
+    "ClaimItem": (
+        ("detail", "detail", True, "element", None),
+        ("encounter", "encounter", True, "reference", ("Encounter",)),
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ClaimItemDetail": (
+        ("subDetail", "subDetail", True, "element", None),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ClaimItemDetailSubDetail": (("udi", "udi", True, "reference", ("Device",)),),
+    "ClaimPayee": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson"),
+        ),
+    ),
+    "ClaimProcedure": (
+        (
+            "procedureReference",
+            "procedureReference",
+            False,
+            "reference",
+            ("Procedure",),
+        ),
+    ),
+    "ClaimRelated": (
+        ("claim", "claim", False, "reference", ("Claim",)),
+        ("reference", "reference", False, "element", None),
+    ),
+    "ClaimResponse": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "communicationRequest",
+            "communicationRequest",
+            True,
+            "reference",
+            ("CommunicationRequest",),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("payment", "payment", False, "element", None),
+        ("request", "request", False, "reference", ("Claim",)),
+        (
+            "requestOrganization",
+            "requestOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        ("requestProvider", "requestProvider", False, "reference", ("Practitioner",)),
+    ),
+    "ClaimResponseInsurance": (
+        ("claimResponse", "claimResponse", False, "reference", ("ClaimResponse",)),
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+    ),
+    "ClaimResponsePayment": (("identifier", "identifier", False, "element", None),),
+    "ClinicalImpression": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "action",
+            "action",
+            True,
+            "reference",
+            (
+                "ReferralRequest",
+                "ProcedureRequest",
+                "Procedure",
+                "MedicationRequest",
+                "Appointment",
+            ),
+        ),
+        ("assessor", "assessor", False, "reference", ("Practitioner",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("finding", "finding", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("investigation", "investigation", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("previous", "previous", False, "reference", ("ClinicalImpression",)),
+        ("problem", "problem", True, "reference", ("Condition", "AllergyIntolerance")),
+        (
+            "prognosisReference",
+            "prognosisReference",
+            True,
+            "reference",
+            ("RiskAssessment",),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "ClinicalImpressionFinding": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            ("Condition", "Observation"),
+        ),
+    ),
+    "ClinicalImpressionInvestigation": (
+        (
+            "item",
+            "item",
+            True,
+            "reference",
+            (
+                "Observation",
+                "QuestionnaireResponse",
+                "FamilyMemberHistory",
+                "DiagnosticReport",
+                "RiskAssessment",
+                "ImagingStudy",
+            ),
+        ),
+    ),
+    "CodeSystem": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "Communication": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        (
+            "definition",
+            "definition",
+            True,
+            "reference",
+            ("PlanDefinition", "ActivityDefinition"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("Resource",)),
+        ("payload", "payload", True, "element", None),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation"),
+        ),
+        (
+            "recipient",
+            "recipient",
+            True,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Group",
+            ),
+        ),
+        (
+            "sender",
+            "sender",
+            False,
+            "reference",
+            ("Device", "Organization", "Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        ("topic", "topic", True, "reference", ("Resource",)),
+    ),
+    "CommunicationPayload": (
+        ("contentReference", "contentReference", False, "reference", ("Resource",)),
+    ),
+    "CommunicationRequest": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("payload", "payload", True, "element", None),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation"),
+        ),
+        (
+            "recipient",
+            "recipient",
+            True,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Group",
+                "CareTeam",
+            ),
+        ),
+        ("replaces", "replaces", True, "reference", ("CommunicationRequest",)),
+        ("requester", "requester", False, "element", None),
+        (
+            "sender",
+            "sender",
+            False,
+            "reference",
+            ("Device", "Organization", "Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        ("topic", "topic", True, "reference", ("Resource",)),
+    ),
+    "CommunicationRequestPayload": (
+        ("contentReference", "contentReference", False, "reference", ("Resource",)),
+    ),
+    "CommunicationRequestRequester": (
+        (
+            "agent",
+            "agent",
+            False,
+            "reference",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson", "Device"),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "CompartmentDefinition": (("contained", "contained", True, "resource", None),),
+    "Composition": (
+        ("contained", "contained", True, "resource", None),
+        ("attester", "attester", True, "element", None),
+        (
+            "author",
+            "author",
+            True,
+            "reference",
+            ("Practitioner", "Device", "Patient", "RelatedPerson"),
+        ),
+        ("custodian", "custodian", False, "reference", ("Organization",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("event", "event", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("relatesTo", "relatesTo", True, "element", None),
+        ("section", "section", True, "element", None),
+        ("subject", "subject", False, "reference", ("Resource",)),
+    ),
+    "CompositionAttester": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "Organization"),
+        ),
+    ),
+    "CompositionEvent": (("detail", "detail", True, "reference", ("Resource",)),),
+    "CompositionRelatesTo": (
+        ("targetIdentifier", "targetIdentifier", False, "element", None),
+        ("targetReference", "targetReference", False, "reference", ("Composition",)),
+    ),
+    "CompositionSection": (
+        ("entry", "entry", True, "reference", ("Resource",)),
+        ("section", "section", True, "element", None),
+    ),
+    "ConceptMap": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", False, "element", None),
+        ("sourceReference", "sourceReference", False, "reference", ("ValueSet",)),
+        ("targetReference", "targetReference", False, "reference", ("ValueSet",)),
+    ),
+    "Condition": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "asserter",
+            "asserter",
+            False,
+            "reference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("evidence", "evidence", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("stage", "stage", False, "element", None),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "ConditionEvidence": (("detail", "detail", True, "reference", ("Resource",)),),
+    "ConditionStage": (
+        (
+            "assessment",
+            "assessment",
+            True,
+            "reference",
+            ("ClinicalImpression", "DiagnosticReport", "Observation"),
+        ),
+    ),
+    "Consent": (
+        ("contained", "contained", True, "resource", None),
+        ("actor", "actor", True, "element", None),
+        (
+            "consentingParty",
+            "consentingParty",
+            True,
+            "reference",
+            ("Organization", "Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("data", "data", True, "element", None),
+        ("except_fhir", "except", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("organization", "organization", True, "reference", ("Organization",)),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("sourceIdentifier", "sourceIdentifier", False, "element", None),
+        (
+            "sourceReference",
+            "sourceReference",
+            False,
+            "reference",
+            ("Consent", "DocumentReference", "Contract", "QuestionnaireResponse"),
+        ),
+    ),
+    "ConsentActor": (
+        (
+            "reference",
+            "reference",
+            False,
+            "reference",
+            (
+                "Device",
+                "Group",
+                "CareTeam",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "ConsentData": (("reference", "reference", False, "reference", ("Resource",)),),
+    "ConsentExcept": (
+        ("actor", "actor", True, "element", None),
+        ("data", "data", True, "element", None),
+    ),
+    "ConsentExceptActor": (
+        (
+            "reference",
+            "reference",
+            False,
+            "reference",
+            (
+                "Device",
+                "Group",
+                "CareTeam",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "ConsentExceptData": (
+        ("reference", "reference", False, "reference", ("Resource",)),
+    ),
+    "Contract": (
+        ("contained", "contained", True, "resource", None),
+        ("agent", "agent", True, "element", None),
+        ("authority", "authority", True, "reference", ("Organization",)),
+        (
+            "bindingReference",
+            "bindingReference",
+            False,
+            "reference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+        ("domain", "domain", True, "reference", ("Location",)),
+        ("friendly", "friendly", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("legal", "legal", True, "element", None),
+        ("rule", "rule", True, "element", None),
+        ("signer", "signer", True, "element", None),
+        ("subject", "subject", True, "reference", ("Resource",)),
+        ("term", "term", True, "element", None),
+        ("topic", "topic", True, "reference", ("Resource",)),
+        ("valuedItem", "valuedItem", True, "element", None),
+    ),
+    "ContractAgent": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Contract",
+                "Device",
+                "Group",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Substance",
+            ),
+        ),
+    ),
+    "ContractFriendly": (
+        (
+            "contentReference",
+            "contentReference",
+            False,
+            "reference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+    ),
+    "ContractLegal": (
+        (
+            "contentReference",
+            "contentReference",
+            False,
+            "reference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+    ),
+    "ContractRule": (
+        (
+            "contentReference",
+            "contentReference",
+            False,
+            "reference",
+            ("DocumentReference",),
+        ),
+    ),
+    "ContractSigner": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            ("Organization", "Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("signature", "signature", True, "element", None),
+    ),
+    "ContractTerm": (
+        ("agent", "agent", True, "element", None),
+        ("group", "group", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("topic", "topic", True, "reference", ("Resource",)),
+        ("valuedItem", "valuedItem", True, "element", None),
+    ),
+    "ContractTermAgent": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Contract",
+                "Device",
+                "Group",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Substance",
+            ),
+        ),
+    ),
+    "ContractTermValuedItem": (
+        ("entityReference", "entityReference", False, "reference", ("Resource",)),
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "ContractValuedItem": (
+        ("entityReference", "entityReference", False, "reference", ("Resource",)),
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "Coverage": (
+        ("contained", "contained", True, "resource", None),
+        ("beneficiary", "beneficiary", False, "reference", ("Patient",)),
+        ("contract", "contract", True, "reference", ("Contract",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "payor",
+            "payor",
+            True,
+            "reference",
+            ("Organization", "Patient", "RelatedPerson"),
+        ),
+        (
+            "policyHolder",
+            "policyHolder",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson", "Organization"),
+        ),
+        ("subscriber", "subscriber", False, "reference", ("Patient", "RelatedPerson")),
+    ),
+    "DataElement": (
+        ("contained", "contained", True, "resource", None),
+        ("element", "element", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "DataRequirement": (("codeFilter", "codeFilter", True, "element", None),),
+    "DataRequirementCodeFilter": (
+        ("valueSetReference", "valueSetReference", False, "reference", ("ValueSet",)),
+    ),
+    "DetectedIssue": (
+        ("contained", "contained", True, "resource", None),
+        ("author", "author", False, "reference", ("Practitioner", "Device")),
+        ("identifier", "identifier", False, "element", None),
+        ("implicated", "implicated", True, "reference", ("Resource",)),
+        ("mitigation", "mitigation", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+    ),
+    "DetectedIssueMitigation": (
+        ("author", "author", False, "reference", ("Practitioner",)),
+    ),
+    "Device": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        ("owner", "owner", False, "reference", ("Organization",)),
+        ("patient", "patient", False, "reference", ("Patient",)),
+    ),
+    "DeviceComponent": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", False, "element", None),
+        ("parent", "parent", False, "reference", ("DeviceComponent",)),
+        ("productionSpecification", "productionSpecification", True, "element", None),
+        ("source", "source", False, "reference", ("Device",)),
+    ),
+    "DeviceComponentProductionSpecification": (
+        ("componentId", "componentId", False, "element", None),
+    ),
+    "DeviceMetric": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", False, "element", None),
+        ("parent", "parent", False, "reference", ("DeviceComponent",)),
+        ("source", "source", False, "reference", ("Device",)),
+    ),
+    "DeviceRequest": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("codeReference", "codeReference", False, "reference", ("Device",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        (
+            "definition",
+            "definition",
+            True,
+            "reference",
+            ("ActivityDefinition", "PlanDefinition"),
+        ),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "performer",
+            "performer",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+        ("priorRequest", "priorRequest", True, "reference", ("Resource",)),
+        ("reasonReference", "reasonReference", True, "reference", ("Resource",)),
+        ("relevantHistory", "relevantHistory", True, "reference", ("Provenance",)),
+        ("requester", "requester", False, "element", None),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Location", "Device"),
+        ),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+    ),
+    "DeviceRequestRequester": (
+        (
+            "agent",
+            "agent",
+            False,
+            "reference",
+            ("Device", "Practitioner", "Organization"),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "DeviceUseStatement": (
+        ("contained", "contained", True, "resource", None),
+        ("device", "device", False, "reference", ("Device",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "source",
+            "source",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "DiagnosticReport": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ProcedureRequest",
+                "ReferralRequest",
+            ),
+        ),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("identifier", "identifier", True, "element", None),
+        ("image", "image", True, "element", None),
+        (
+            "imagingStudy",
+            "imagingStudy",
+            True,
+            "reference",
+            ("ImagingStudy", "ImagingManifest"),
+        ),
+        ("performer", "performer", True, "element", None),
+        ("result", "result", True, "reference", ("Observation",)),
+        ("specimen", "specimen", True, "reference", ("Specimen",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Device", "Location"),
+        ),
+    ),
+    "DiagnosticReportImage": (("link", "link", False, "reference", ("Media",)),),
+    "DiagnosticReportPerformer": (
+        ("actor", "actor", False, "reference", ("Practitioner", "Organization")),
+    ),
+    "DocumentManifest": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            True,
+            "reference",
+            ("Practitioner", "Organization", "Device", "Patient", "RelatedPerson"),
+        ),
+        ("content", "content", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("masterIdentifier", "masterIdentifier", False, "element", None),
+        (
+            "recipient",
+            "recipient",
+            True,
+            "reference",
+            ("Patient", "Practitioner", "RelatedPerson", "Organization"),
+        ),
+        ("related", "related", True, "element", None),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "Group", "Device"),
+        ),
+    ),
+    "DocumentManifestContent": (
+        ("pReference", "pReference", False, "reference", ("Resource",)),
+    ),
+    "DocumentManifestRelated": (
+        ("identifier", "identifier", False, "element", None),
+        ("ref", "ref", False, "reference", ("Resource",)),
+    ),
+    "DocumentReference": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "authenticator",
+            "authenticator",
+            False,
+            "reference",
+            ("Practitioner", "Organization"),
+        ),
+        (
+            "author",
+            "author",
+            True,
+            "reference",
+            ("Practitioner", "Organization", "Device", "Patient", "RelatedPerson"),
+        ),
+        ("context", "context", False, "element", None),
+        ("custodian", "custodian", False, "reference", ("Organization",)),
+        ("identifier", "identifier", True, "element", None),
+        ("masterIdentifier", "masterIdentifier", False, "element", None),
+        ("relatesTo", "relatesTo", True, "element", None),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "Group", "Device"),
+        ),
+    ),
+    "DocumentReferenceContext": (
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("related", "related", True, "element", None),
+        ("sourcePatientInfo", "sourcePatientInfo", False, "reference", ("Patient",)),
+    ),
+    "DocumentReferenceContextRelated": (
+        ("identifier", "identifier", False, "element", None),
+        ("ref", "ref", False, "reference", ("Resource",)),
+    ),
+    "DocumentReferenceRelatesTo": (
+        ("target", "target", False, "reference", ("DocumentReference",)),
+    ),
+    "DomainResource": (("contained", "contained", True, "resource", None),),
+    "ElementDefinition": (
+        ("binding", "binding", False, "element", None),
+        ("defaultValueAnnotation", "defaultValueAnnotation", False, "element", None),
+        ("defaultValueIdentifier", "defaultValueIdentifier", False, "element", None),
+        ("defaultValueReference", "defaultValueReference", False, "reference", None),
+        ("defaultValueSignature", "defaultValueSignature", False, "element", None),
+        ("example", "example", True, "element", None),
+        ("fixedAnnotation", "fixedAnnotation", False, "element", None),
+        ("fixedIdentifier", "fixedIdentifier", False, "element", None),
+        ("fixedReference", "fixedReference", False, "reference", None),
+        ("fixedSignature", "fixedSignature", False, "element", None),
+        ("patternAnnotation", "patternAnnotation", False, "element", None),
+        ("patternIdentifier", "patternIdentifier", False, "element", None),
+        ("patternReference", "patternReference", False, "reference", None),
+        ("patternSignature", "patternSignature", False, "element", None),
+    ),
+    "ElementDefinitionBinding": (
+        ("valueSetReference", "valueSetReference", False, "reference", ("ValueSet",)),
+    ),
+    "ElementDefinitionExample": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+    ),
+    "EligibilityRequest": (
+        ("contained", "contained", True, "resource", None),
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+        ("enterer", "enterer", False, "reference", ("Practitioner",)),
+        ("facility", "facility", False, "reference", ("Location",)),
+        ("identifier", "identifier", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("provider", "provider", False, "reference", ("Practitioner",)),
+    ),
+    "EligibilityResponse": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("request", "request", False, "reference", ("EligibilityRequest",)),
+        (
+            "requestOrganization",
+            "requestOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        ("requestProvider", "requestProvider", False, "reference", ("Practitioner",)),
+    ),
+    "EligibilityResponseInsurance": (
+        ("contract", "contract", False, "reference", ("Contract",)),
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+    ),
+    "Encounter": (
+        ("contained", "contained", True, "resource", None),
+        ("account", "account", True, "reference", ("Account",)),
+        ("appointment", "appointment", False, "reference", ("Appointment",)),
+        ("diagnosis", "diagnosis", True, "element", None),
+        ("episodeOfCare", "episodeOfCare", True, "reference", ("EpisodeOfCare",)),
+        ("hospitalization", "hospitalization", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "incomingReferral",
+            "incomingReferral",
+            True,
+            "reference",
+            ("ReferralRequest",),
+        ),
+        ("location", "location", True, "element", None),
+        ("partOf", "partOf", False, "reference", ("Encounter",)),
+        ("participant", "participant", True, "element", None),
+        ("serviceProvider", "serviceProvider", False, "reference", ("Organization",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "EncounterDiagnosis": (
+        ("condition", "condition", False, "reference", ("Condition", "Procedure")),
+    ),
+    "EncounterHospitalization": (
+        ("destination", "destination", False, "reference", ("Location",)),
+        ("origin", "origin", False, "reference", ("Location",)),
+        ("preAdmissionIdentifier", "preAdmissionIdentifier", False, "element", None),
+    ),
+    "EncounterLocation": (("location", "location", False, "reference", ("Location",)),),
+    "EncounterParticipant": (
+        (
+            "individual",
+            "individual",
+            False,
+            "reference",
+            ("Practitioner", "RelatedPerson"),
+        ),
+    ),
+    "Endpoint": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "EnrollmentRequest": (
+        ("contained", "contained", True, "resource", None),
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+        ("identifier", "identifier", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        ("provider", "provider", False, "reference", ("Practitioner",)),
+        ("subject", "subject", False, "reference", ("Patient",)),
+    ),
+    "EnrollmentResponse": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        ("request", "request", False, "reference", ("EnrollmentRequest",)),
+        (
+            "requestOrganization",
+            "requestOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        ("requestProvider", "requestProvider", False, "reference", ("Practitioner",)),
+    ),
+    "EpisodeOfCare": (
+        ("contained", "contained", True, "resource", None),
+        ("account", "account", True, "reference", ("Account",)),
+        ("careManager", "careManager", False, "reference", ("Practitioner",)),
+        ("diagnosis", "diagnosis", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("referralRequest", "referralRequest", True, "reference", ("ReferralRequest",)),
+        ("team", "team", True, "reference", ("CareTeam",)),
+    ),
+    "EpisodeOfCareDiagnosis": (
+        ("condition", "condition", False, "reference", ("Condition",)),
+    ),
+    "ExpansionProfile": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "ExplanationOfBenefit": (
+        ("contained", "contained", True, "resource", None),
+        ("accident", "accident", False, "element", None),
+        ("careTeam", "careTeam", True, "element", None),
+        ("claim", "claim", False, "reference", ("Claim",)),
+        ("claimResponse", "claimResponse", False, "reference", ("ClaimResponse",)),
+        ("diagnosis", "diagnosis", True, "element", None),
+        ("enterer", "enterer", False, "reference", ("Practitioner",)),
+        ("facility", "facility", False, "reference", ("Location",)),
+        ("identifier", "identifier", True, "element", None),
+        ("information", "information", True, "element", None),
+        ("insurance", "insurance", False, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("item", "item", True, "element", None),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        (
+            "originalPrescription",
+            "originalPrescription",
+            False,
+            "reference",
+            ("MedicationRequest",),
+        ),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("payee", "payee", False, "element", None),
+        ("payment", "payment", False, "element", None),
+        (
+            "prescription",
+            "prescription",
+            False,
+            "reference",
+            ("MedicationRequest", "VisionPrescription"),
+        ),
+        ("procedure", "procedure", True, "element", None),
+        ("provider", "provider", False, "reference", ("Practitioner",)),
+        ("referral", "referral", False, "reference", ("ReferralRequest",)),
+        ("related", "related", True, "element", None),
+    ),
+    "ExplanationOfBenefitAccident": (
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+    ),
+    "ExplanationOfBenefitCareTeam": (
+        ("provider", "provider", False, "reference", ("Practitioner", "Organization")),
+    ),
+    "ExplanationOfBenefitDiagnosis": (
+        (
+            "diagnosisReference",
+            "diagnosisReference",
+            False,
+            "reference",
+            ("Condition",),
+        ),
+    ),
+    "ExplanationOfBenefitInformation": (
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "ExplanationOfBenefitInsurance": (
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+    ),
+    "ExplanationOfBenefitItem": (
+        ("detail", "detail", True, "element", None),
+        ("encounter", "encounter", True, "reference", ("Encounter",)),
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ExplanationOfBenefitItemDetail": (
+        ("subDetail", "subDetail", True, "element", None),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ExplanationOfBenefitItemDetailSubDetail": (
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ExplanationOfBenefitPayee": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson"),
+        ),
+    ),
+    "ExplanationOfBenefitPayment": (
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "ExplanationOfBenefitProcedure": (
+        (
+            "procedureReference",
+            "procedureReference",
+            False,
+            "reference",
+            ("Procedure",),
+        ),
+    ),
+    "ExplanationOfBenefitRelated": (
+        ("claim", "claim", False, "reference", ("Claim",)),
+        ("reference", "reference", False, "element", None),
+    ),
+    "Extension": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+    ),
+    "FamilyMemberHistory": (
+        ("contained", "contained", True, "resource", None),
+        ("condition", "condition", True, "element", None),
+        (
+            "definition",
+            "definition",
+            True,
+            "reference",
+            ("PlanDefinition", "Questionnaire"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation", "AllergyIntolerance", "QuestionnaireResponse"),
+        ),
+    ),
+    "FamilyMemberHistoryCondition": (("note", "note", True, "element", None),),
+    "Flag": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Device", "Organization", "Patient", "Practitioner"),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Location",
+                "Group",
+                "Organization",
+                "Practitioner",
+                "PlanDefinition",
+                "Medication",
+                "Procedure",
+            ),
+        ),
+    ),
+    "Goal": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "addresses",
+            "addresses",
+            True,
+            "reference",
+            (
+                "Condition",
+                "Observation",
+                "MedicationStatement",
+                "NutritionOrder",
+                "ProcedureRequest",
+                "RiskAssessment",
+            ),
+        ),
+        (
+            "expressedBy",
+            "expressedBy",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("outcomeReference", "outcomeReference", True, "reference", ("Observation",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Organization"),
+        ),
+    ),
+    "GraphDefinition": (("contained", "contained", True, "resource", None),),
+    "Group": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("member", "member", True, "element", None),
+    ),
+    "GroupMember": (
+        (
+            "entity",
+            "entity",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "Device", "Medication", "Substance"),
+        ),
+    ),
+    "GuidanceResponse": (
+        ("contained", "contained", True, "resource", None),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("dataRequirement", "dataRequirement", True, "element", None),
+        (
+            "evaluationMessage",
+            "evaluationMessage",
+            True,
+            "reference",
+            ("OperationOutcome",),
+        ),
+        ("identifier", "identifier", False, "element", None),
+        ("module", "module", False, "reference", ("ServiceDefinition",)),
+        ("note", "note", True, "element", None),
+        ("outputParameters", "outputParameters", False, "reference", ("Parameters",)),
+        ("performer", "performer", False, "reference", ("Device",)),
+        ("reasonReference", "reasonReference", False, "reference", ("Resource",)),
+        ("result", "result", False, "reference", ("CarePlan", "RequestGroup")),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "HealthcareService": (
+        ("contained", "contained", True, "resource", None),
+        ("coverageArea", "coverageArea", True, "reference", ("Location",)),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", True, "reference", ("Location",)),
+        ("providedBy", "providedBy", False, "reference", ("Organization",)),
+    ),
+    "Identifier": (("assigner", "assigner", False, "reference", ("Organization",)),),
+    "ImagingManifest": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Practitioner", "Device", "Organization", "Patient", "RelatedPerson"),
+        ),
+        ("identifier", "identifier", False, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("study", "study", True, "element", None),
+    ),
+    "ImagingManifestStudy": (
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("imagingStudy", "imagingStudy", False, "reference", ("ImagingStudy",)),
+        ("series", "series", True, "element", None),
+    ),
+    "ImagingManifestStudySeries": (
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+    ),
+    "ImagingStudy": (
+        ("contained", "contained", True, "resource", None),
+        ("accession", "accession", False, "element", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("ReferralRequest", "CarePlan", "ProcedureRequest"),
+        ),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        ("interpreter", "interpreter", True, "reference", ("Practitioner",)),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("procedureReference", "procedureReference", True, "reference", ("Procedure",)),
+        ("referrer", "referrer", False, "reference", ("Practitioner",)),
+        ("series", "series", True, "element", None),
+    ),
+    "ImagingStudySeries": (
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("performer", "performer", True, "reference", ("Practitioner",)),
+    ),
+    "Immunization": (
+        ("contained", "contained", True, "resource", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("manufacturer", "manufacturer", False, "reference", ("Organization",)),
+        ("note", "note", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("practitioner", "practitioner", True, "element", None),
+        ("reaction", "reaction", True, "element", None),
+        ("vaccinationProtocol", "vaccinationProtocol", True, "element", None),
+    ),
+    "ImmunizationPractitioner": (
+        ("actor", "actor", False, "reference", ("Practitioner",)),
+    ),
+    "ImmunizationReaction": (
+        ("detail", "detail", False, "reference", ("Observation",)),
+    ),
+    "ImmunizationRecommendation": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("recommendation", "recommendation", True, "element", None),
+    ),
+    "ImmunizationRecommendationRecommendation": (
+        ("protocol", "protocol", False, "element", None),
+        (
+            "supportingImmunization",
+            "supportingImmunization",
+            True,
+            "reference",
+            ("Immunization",),
+        ),
+        (
+            "supportingPatientInformation",
+            "supportingPatientInformation",
+            True,
+            "reference",
+            ("Observation", "AllergyIntolerance"),
+        ),
+    ),
+    "ImmunizationRecommendationRecommendationProtocol": (
+        ("authority", "authority", False, "reference", ("Organization",)),
+    ),
+    "ImmunizationVaccinationProtocol": (
+        ("authority", "authority", False, "reference", ("Organization",)),
+    ),
+    "ImplementationGuide": (
+        ("contained", "contained", True, "resource", None),
+        ("global_fhir", "global", True, "element", None),
+        ("package", "package", True, "element", None),
+    ),
+    "ImplementationGuideGlobal": (
+        ("profile", "profile", False, "reference", ("StructureDefinition",)),
+    ),
+    "ImplementationGuidePackage": (("resource", "resource", True, "element", None),),
+    "ImplementationGuidePackageResource": (
+        ("exampleFor", "exampleFor", False, "reference", ("StructureDefinition",)),
+        ("sourceReference", "sourceReference", False, "reference", ("Resource",)),
+    ),
+    "Library": (
+        ("contained", "contained", True, "resource", None),
+        ("dataRequirement", "dataRequirement", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("parameter", "parameter", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+    ),
+    "Linkage": (
+        ("contained", "contained", True, "resource", None),
+        ("author", "author", False, "reference", ("Practitioner", "Organization")),
+        ("item", "item", True, "element", None),
+    ),
+    "LinkageItem": (("resource", "resource", False, "reference", None),),
+    "List": (
+        ("contained", "contained", True, "resource", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("entry", "entry", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("source", "source", False, "reference", ("Practitioner", "Patient", "Device")),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Device", "Location"),
+        ),
+    ),
+    "ListEntry": (("item", "item", False, "reference", ("Resource",)),),
+    "Location": (
+        ("contained", "contained", True, "resource", None),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        ("partOf", "partOf", False, "reference", ("Location",)),
+    ),
+    "Measure": (
+        ("contained", "contained", True, "resource", None),
+        ("group", "group", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("library", "library", True, "reference", ("Library",)),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("supplementalData", "supplementalData", True, "element", None),
+    ),
+    "MeasureGroup": (
+        ("identifier", "identifier", False, "element", None),
+        ("population", "population", True, "element", None),
+        ("stratifier", "stratifier", True, "element", None),
+    ),
+    "MeasureGroupPopulation": (("identifier", "identifier", False, "element", None),),
+    "MeasureGroupStratifier": (("identifier", "identifier", False, "element", None),),
+    "MeasureReport": (
+        ("contained", "contained", True, "resource", None),
+        ("evaluatedResources", "evaluatedResources", False, "reference", ("Bundle",)),
+        ("group", "group", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("measure", "measure", False, "reference", ("Measure",)),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        (
+            "reportingOrganization",
+            "reportingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "MeasureReportGroup": (
+        ("identifier", "identifier", False, "element", None),
+        ("population", "population", True, "element", None),
+        ("stratifier", "stratifier", True, "element", None),
+    ),
+    "MeasureReportGroupPopulation": (
+        ("identifier", "identifier", False, "element", None),
+        ("patients", "patients", False, "reference", ("List",)),
+    ),
+    "MeasureReportGroupStratifier": (
+        ("identifier", "identifier", False, "element", None),
+        ("stratum", "stratum", True, "element", None),
+    ),
+    "MeasureReportGroupStratifierStratum": (
+        ("population", "population", True, "element", None),
+    ),
+    "MeasureReportGroupStratifierStratumPopulation": (
+        ("identifier", "identifier", False, "element", None),
+        ("patients", "patients", False, "reference", ("List",)),
+    ),
+    "MeasureSupplementalData": (("identifier", "identifier", False, "element", None),),
+    "Media": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("ProcedureRequest",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("device", "device", False, "reference", ("Device", "DeviceMetric")),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("operator", "operator", False, "reference", ("Practitioner",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "Group", "Device", "Specimen"),
+        ),
+    ),
+    "Medication": (
+        ("contained", "contained", True, "resource", None),
+        ("ingredient", "ingredient", True, "element", None),
+        ("manufacturer", "manufacturer", False, "reference", ("Organization",)),
+        ("package", "package", False, "element", None),
+    ),
+    "MedicationAdministration": (
+        ("contained", "contained", True, "resource", None),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        (
+            "definition",
+            "definition",
+            True,
+            "reference",
+            ("PlanDefinition", "ActivityDefinition"),
+        ),
+        ("device", "device", True, "reference", ("Device",)),
+        ("eventHistory", "eventHistory", True, "reference", ("Provenance",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "medicationReference",
+            "medicationReference",
+            False,
+            "reference",
+            ("Medication",),
+        ),
+        ("note", "note", True, "element", None),
+        (
+            "partOf",
+            "partOf",
+            True,
+            "reference",
+            ("MedicationAdministration", "Procedure"),
+        ),
+        ("performer", "performer", True, "element", None),
+        ("prescription", "prescription", False, "reference", ("MedicationRequest",)),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation"),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "MedicationAdministrationPerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            ("Practitioner", "Patient", "RelatedPerson", "Device"),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "MedicationDispense": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "authorizingPrescription",
+            "authorizingPrescription",
+            True,
+            "reference",
+            ("MedicationRequest",),
+        ),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("destination", "destination", False, "reference", ("Location",)),
+        ("detectedIssue", "detectedIssue", True, "reference", ("DetectedIssue",)),
+        ("eventHistory", "eventHistory", True, "reference", ("Provenance",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "medicationReference",
+            "medicationReference",
+            False,
+            "reference",
+            ("Medication",),
+        ),
+        (
+            "notDoneReasonReference",
+            "notDoneReasonReference",
+            False,
+            "reference",
+            ("DetectedIssue",),
+        ),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("Procedure",)),
+        ("performer", "performer", True, "element", None),
+        ("receiver", "receiver", True, "reference", ("Patient", "Practitioner")),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        ("substitution", "substitution", False, "element", None),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "MedicationDispensePerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            ("Practitioner", "Organization", "Patient", "Device", "RelatedPerson"),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "MedicationDispenseSubstitution": (
+        ("responsibleParty", "responsibleParty", True, "reference", ("Practitioner",)),
+    ),
+    "MedicationIngredient": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            ("Substance", "Medication"),
+        ),
+    ),
+    "MedicationPackage": (("content", "content", True, "element", None),),
+    "MedicationPackageContent": (
+        ("itemReference", "itemReference", False, "reference", ("Medication",)),
+    ),
+    "MedicationRequest": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("CarePlan", "MedicationRequest", "ProcedureRequest", "ReferralRequest"),
+        ),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        (
+            "definition",
+            "definition",
+            True,
+            "reference",
+            ("ActivityDefinition", "PlanDefinition"),
+        ),
+        ("detectedIssue", "detectedIssue", True, "reference", ("DetectedIssue",)),
+        ("dispenseRequest", "dispenseRequest", False, "element", None),
+        ("eventHistory", "eventHistory", True, "reference", ("Provenance",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "medicationReference",
+            "medicationReference",
+            False,
+            "reference",
+            ("Medication",),
+        ),
+        ("note", "note", True, "element", None),
+        (
+            "priorPrescription",
+            "priorPrescription",
+            False,
+            "reference",
+            ("MedicationRequest",),
+        ),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation"),
+        ),
+        ("recorder", "recorder", False, "reference", ("Practitioner",)),
+        ("requester", "requester", False, "element", None),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "MedicationRequestDispenseRequest": (
+        ("performer", "performer", False, "reference", ("Organization",)),
+    ),
+    "MedicationRequestRequester": (
+        (
+            "agent",
+            "agent",
+            False,
+            "reference",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson", "Device"),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "MedicationStatement": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("MedicationRequest", "CarePlan", "ProcedureRequest", "ReferralRequest"),
+        ),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("derivedFrom", "derivedFrom", True, "reference", ("Resource",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "informationSource",
+            "informationSource",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "RelatedPerson", "Organization"),
+        ),
+        (
+            "medicationReference",
+            "medicationReference",
+            False,
+            "reference",
+            ("Medication",),
+        ),
+        ("note", "note", True, "element", None),
+        (
+            "partOf",
+            "partOf",
+            True,
+            "reference",
+            (
+                "MedicationAdministration",
+                "MedicationDispense",
+                "MedicationStatement",
+                "Procedure",
+                "Observation",
+            ),
+        ),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation"),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "MessageDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("allowedResponse", "allowedResponse", True, "element", None),
+        ("base", "base", False, "reference", ("MessageDefinition",)),
+        ("focus", "focus", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        (
+            "parent",
+            "parent",
+            True,
+            "reference",
+            ("ActivityDefinition", "PlanDefinition"),
+        ),
+        ("replaces", "replaces", True, "reference", ("MessageDefinition",)),
+    ),
+    "MessageDefinitionAllowedResponse": (
+        ("message", "message", False, "reference", ("MessageDefinition",)),
+    ),
+    "MessageDefinitionFocus": (
+        ("profile", "profile", False, "reference", ("StructureDefinition",)),
+    ),
+    "MessageHeader": (
+        ("contained", "contained", True, "resource", None),
+        ("author", "author", False, "reference", ("Practitioner",)),
+        ("destination", "destination", True, "element", None),
+        ("enterer", "enterer", False, "reference", ("Practitioner",)),
+        ("focus", "focus", True, "reference", ("Resource",)),
+        ("receiver", "receiver", False, "reference", ("Practitioner", "Organization")),
+        ("response", "response", False, "element", None),
+        (
+            "responsible",
+            "responsible",
+            False,
+            "reference",
+            ("Practitioner", "Organization"),
+        ),
+        ("sender", "sender", False, "reference", ("Practitioner", "Organization")),
+    ),
+    "MessageHeaderDestination": (
+        ("target", "target", False, "reference", ("Device",)),
+    ),
+    "MessageHeaderResponse": (
+        ("details", "details", False, "reference", ("OperationOutcome",)),
+    ),
+    "MetadataResource": (("contained", "contained", True, "resource", None),),
+    "NamingSystem": (
+        ("contained", "contained", True, "resource", None),
+        ("replacedBy", "replacedBy", False, "reference", ("NamingSystem",)),
+    ),
+    "NutritionOrder": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "allergyIntolerance",
+            "allergyIntolerance",
+            True,
+            "reference",
+            ("AllergyIntolerance",),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("orderer", "orderer", False, "reference", ("Practitioner",)),
+        ("patient", "patient", False, "reference", ("Patient",)),
+    ),
+    "Observation": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "DeviceRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ProcedureRequest",
+                "ReferralRequest",
+            ),
+        ),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("device", "device", False, "reference", ("Device", "DeviceMetric")),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "performer",
+            "performer",
+            True,
+            "reference",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson"),
+        ),
+        ("related", "related", True, "element", None),
+        ("specimen", "specimen", False, "reference", ("Specimen",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Device", "Location"),
+        ),
+    ),
+    "ObservationRelated": (
+        (
+            "target",
+            "target",
+            False,
+            "reference",
+            ("Observation", "QuestionnaireResponse", "Sequence"),
+        ),
+    ),
+    "OperationDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("base", "base", False, "reference", ("OperationDefinition",)),
+        ("parameter", "parameter", True, "element", None),
+    ),
+    "OperationDefinitionParameter": (
+        ("binding", "binding", False, "element", None),
+        ("part", "part", True, "element", None),
+        ("profile", "profile", False, "reference", ("StructureDefinition",)),
+    ),
+    "OperationDefinitionParameterBinding": (
+        ("valueSetReference", "valueSetReference", False, "reference", ("ValueSet",)),
+    ),
+    "OperationOutcome": (("contained", "contained", True, "resource", None),),
+    "Organization": (
+        ("contained", "contained", True, "resource", None),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        ("partOf", "partOf", False, "reference", ("Organization",)),
+    ),
+    "ParameterDefinition": (
+        ("profile", "profile", False, "reference", ("StructureDefinition",)),
+    ),
+    "Parameters": (("parameter", "parameter", True, "element", None),),
+    "ParametersParameter": (
+        ("part", "part", True, "element", None),
+        ("resource", "resource", False, "resource", None),
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+    ),
+    "Patient": (
+        ("contained", "contained", True, "resource", None),
+        ("contact", "contact", True, "element", None),
+        (
+            "generalPractitioner",
+            "generalPractitioner",
+            True,
+            "reference",
+            ("Organization", "Practitioner"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("link", "link", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "PatientContact": (
+        ("organization", "organization", False, "reference", ("Organization",)),
+    ),
+    "PatientLink": (
+        ("other", "other", False, "reference", ("Patient", "RelatedPerson")),
+    ),
+    "PaymentNotice": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        ("provider", "provider", False, "reference", ("Practitioner",)),
+        ("request", "request", False, "reference", ("Resource",)),
+        ("response", "response", False, "reference", ("Resource",)),
+        ("target", "target", False, "reference", ("Organization",)),
+    ),
+    "PaymentReconciliation": (
+        ("contained", "contained", True, "resource", None),
+        ("detail", "detail", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        ("request", "request", False, "reference", ("ProcessRequest",)),
+        (
+            "requestOrganization",
+            "requestOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        ("requestProvider", "requestProvider", False, "reference", ("Practitioner",)),
+    ),
+    "PaymentReconciliationDetail": (
+        ("payee", "payee", False, "reference", ("Organization",)),
+        ("request", "request", False, "reference", ("Resource",)),
+        ("response", "response", False, "reference", ("Resource",)),
+        ("submitter", "submitter", False, "reference", ("Organization",)),
+    ),
+    "Person": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("link", "link", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "PersonLink": (
+        (
+            "target",
+            "target",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "RelatedPerson", "Person"),
+        ),
+    ),
+    "PlanDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("action", "action", True, "element", None),
+        ("goal", "goal", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("library", "library", True, "reference", ("Library",)),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+    ),
+    "PlanDefinitionAction": (
+        ("action", "action", True, "element", None),
+        (
+            "definition",
+            "definition",
+            False,
+            "reference",
+            ("ActivityDefinition", "PlanDefinition"),
+        ),
+        ("documentation", "documentation", True, "element", None),
+        ("input", "input", True, "element", None),
+        ("output", "output", True, "element", None),
+        ("transform", "transform", False, "reference", ("StructureMap",)),
+        ("triggerDefinition", "triggerDefinition", True, "element", None),
+    ),
+    "PlanDefinitionGoal": (("documentation", "documentation", True, "element", None),),
+    "Practitioner": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("qualification", "qualification", True, "element", None),
+    ),
+    "PractitionerQualification": (
+        ("identifier", "identifier", True, "element", None),
+        ("issuer", "issuer", False, "reference", ("Organization",)),
+    ),
+    "PractitionerRole": (
+        ("contained", "contained", True, "resource", None),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        (
+            "healthcareService",
+            "healthcareService",
+            True,
+            "reference",
+            ("HealthcareService",),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", True, "reference", ("Location",)),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        ("practitioner", "practitioner", False, "reference", ("Practitioner",)),
+    ),
+    "Procedure": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("CarePlan", "ProcedureRequest", "ReferralRequest"),
+        ),
+        ("complicationDetail", "complicationDetail", True, "reference", ("Condition",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        (
+            "definition",
+            "definition",
+            True,
+            "reference",
+            ("PlanDefinition", "ActivityDefinition", "HealthcareService"),
+        ),
+        ("focalDevice", "focalDevice", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        (
+            "partOf",
+            "partOf",
+            True,
+            "reference",
+            ("Procedure", "Observation", "MedicationAdministration"),
+        ),
+        ("performer", "performer", True, "element", None),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation"),
+        ),
+        ("report", "report", True, "reference", ("DiagnosticReport",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        (
+            "usedReference",
+            "usedReference",
+            True,
+            "reference",
+            ("Device", "Medication", "Substance"),
+        ),
+    ),
+    "ProcedureFocalDevice": (
+        ("manipulated", "manipulated", False, "reference", ("Device",)),
+    ),
+    "ProcedurePerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson", "Device"),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "ProcedureRequest": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        (
+            "definition",
+            "definition",
+            True,
+            "reference",
+            ("ActivityDefinition", "PlanDefinition"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "performer",
+            "performer",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation"),
+        ),
+        ("relevantHistory", "relevantHistory", True, "reference", ("Provenance",)),
+        ("replaces", "replaces", True, "reference", ("Resource",)),
+        ("requester", "requester", False, "element", None),
+        ("requisition", "requisition", False, "element", None),
+        ("specimen", "specimen", True, "reference", ("Specimen",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Location", "Device"),
+        ),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+    ),
+    "ProcedureRequestRequester": (
+        (
+            "agent",
+            "agent",
+            False,
+            "reference",
+            ("Device", "Practitioner", "Organization"),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "ProcessRequest": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        ("provider", "provider", False, "reference", ("Practitioner",)),
+        ("request", "request", False, "reference", ("Resource",)),
+        ("response", "response", False, "reference", ("Resource",)),
+        ("target", "target", False, "reference", ("Organization",)),
+    ),
+    "ProcessResponse": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "communicationRequest",
+            "communicationRequest",
+            True,
+            "reference",
+            ("CommunicationRequest",),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        ("request", "request", False, "reference", ("Resource",)),
+        (
+            "requestOrganization",
+            "requestOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        ("requestProvider", "requestProvider", False, "reference", ("Practitioner",)),
+    ),
+    "Provenance": (
+        ("contained", "contained", True, "resource", None),
+        ("agent", "agent", True, "element", None),
+        ("entity", "entity", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("signature", "signature", True, "element", None),
+        ("target", "target", True, "reference", ("Resource",)),
+    ),
+    "ProvenanceAgent": (
+        (
+            "onBehalfOfReference",
+            "onBehalfOfReference",
+            False,
+            "reference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "whoReference",
+            "whoReference",
+            False,
+            "reference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+    ),
+    "ProvenanceEntity": (
+        ("agent", "agent", True, "element", None),
+        ("whatIdentifier", "whatIdentifier", False, "element", None),
+        ("whatReference", "whatReference", False, "reference", ("Resource",)),
+    ),
+    "Questionnaire": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("item", "item", True, "element", None),
+    ),
+    "QuestionnaireItem": (
+        ("enableWhen", "enableWhen", True, "element", None),
+        ("initialReference", "initialReference", False, "reference", ("Resource",)),
+        ("item", "item", True, "element", None),
+        ("options", "options", False, "reference", ("ValueSet",)),
+    ),
+    "QuestionnaireItemEnableWhen": (
+        ("answerReference", "answerReference", False, "reference", ("Resource",)),
+    ),
+    "QuestionnaireResponse": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Device", "Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("ReferralRequest", "CarePlan", "ProcedureRequest"),
+        ),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("identifier", "identifier", False, "element", None),
+        ("item", "item", True, "element", None),
+        ("parent", "parent", True, "reference", ("Observation", "Procedure")),
+        ("questionnaire", "questionnaire", False, "reference", ("Questionnaire",)),
+        (
+            "source",
+            "source",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("subject", "subject", False, "reference", ("Resource",)),
+    ),
+    "QuestionnaireResponseItem": (
+        ("answer", "answer", True, "element", None),
+        ("item", "item", True, "element", None),
+        ("subject", "subject", False, "reference", ("Resource",)),
+    ),
+    "QuestionnaireResponseItemAnswer": (
+        ("item", "item", True, "element", None),
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "Reference": (("identifier", "identifier", False, "element", None),),
+    "ReferralRequest": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("ReferralRequest", "CarePlan", "ProcedureRequest"),
+        ),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        (
+            "definition",
+            "definition",
+            True,
+            "reference",
+            ("ActivityDefinition", "PlanDefinition"),
+        ),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "reasonReference",
+            "reasonReference",
+            True,
+            "reference",
+            ("Condition", "Observation"),
+        ),
+        (
+            "recipient",
+            "recipient",
+            True,
+            "reference",
+            ("Practitioner", "Organization", "HealthcareService"),
+        ),
+        ("relevantHistory", "relevantHistory", True, "reference", ("Provenance",)),
+        ("replaces", "replaces", True, "reference", ("ReferralRequest",)),
+        ("requester", "requester", False, "element", None),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+    ),
+    "ReferralRequestRequester": (
+        (
+            "agent",
+            "agent",
+            False,
+            "reference",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson", "Device"),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "RelatedArtifact": (("resource", "resource", False, "reference", ("Resource",)),),
+    "RelatedPerson": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+    ),
+    "RequestGroup": (
+        ("contained", "contained", True, "resource", None),
+        ("action", "action", True, "element", None),
+        ("author", "author", False, "reference", ("Device", "Practitioner")),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("definition", "definition", True, "reference", ("Resource",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("reasonReference", "reasonReference", False, "reference", ("Resource",)),
+        ("replaces", "replaces", True, "reference", ("Resource",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "RequestGroupAction": (
+        ("action", "action", True, "element", None),
+        ("documentation", "documentation", True, "element", None),
+        (
+            "participant",
+            "participant",
+            True,
+            "reference",
+            ("Patient", "Person", "Practitioner", "RelatedPerson"),
+        ),
+        ("resource", "resource", False, "reference", ("Resource",)),
+    ),
+    "ResearchStudy": (
+        ("contained", "contained", True, "resource", None),
+        ("enrollment", "enrollment", True, "reference", ("Group",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("ResearchStudy",)),
+        (
+            "principalInvestigator",
+            "principalInvestigator",
+            False,
+            "reference",
+            ("Practitioner",),
+        ),
+        ("protocol", "protocol", True, "reference", ("PlanDefinition",)),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("site", "site", True, "reference", ("Location",)),
+        ("sponsor", "sponsor", False, "reference", ("Organization",)),
+    ),
+    "ResearchSubject": (
+        ("contained", "contained", True, "resource", None),
+        ("consent", "consent", False, "reference", ("Consent",)),
+        ("identifier", "identifier", False, "element", None),
+        ("individual", "individual", False, "reference", ("Patient",)),
+        ("study", "study", False, "reference", ("ResearchStudy",)),
+    ),
+    "RiskAssessment": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", False, "reference", ("Resource",)),
+        ("basis", "basis", True, "reference", ("Resource",)),
+        ("condition", "condition", False, "reference", ("Condition",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("identifier", "identifier", False, "element", None),
+        ("parent", "parent", False, "reference", ("Resource",)),
+        ("performer", "performer", False, "reference", ("Practitioner", "Device")),
+        ("reasonReference", "reasonReference", False, "reference", ("Resource",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "Schedule": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "actor",
+            "actor",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "SearchParameter": (
+        ("contained", "contained", True, "resource", None),
+        ("component", "component", True, "element", None),
+    ),
+    "SearchParameterComponent": (
+        ("definition", "definition", False, "reference", ("SearchParameter",)),
+    ),
+    "Sequence": (
+        ("contained", "contained", True, "resource", None),
+        ("device", "device", False, "reference", ("Device",)),
+        ("identifier", "identifier", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("performer", "performer", False, "reference", ("Organization",)),
+        ("pointer", "pointer", True, "reference", ("Sequence",)),
+        ("referenceSeq", "referenceSeq", False, "element", None),
+        ("specimen", "specimen", False, "reference", ("Specimen",)),
+        ("variant", "variant", True, "element", None),
+    ),
+    "SequenceReferenceSeq": (
+        (
+            "referenceSeqPointer",
+            "referenceSeqPointer",
+            False,
+            "reference",
+            ("Sequence",),
+        ),
+    ),
+    "SequenceVariant": (
+        ("variantPointer", "variantPointer", False, "reference", ("Observation",)),
+    ),
+    "ServiceDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("dataRequirement", "dataRequirement", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "operationDefinition",
+            "operationDefinition",
+            False,
+            "reference",
+            ("OperationDefinition",),
+        ),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("trigger", "trigger", True, "element", None),
+    ),
+    "Signature": (
+        (
+            "onBehalfOfReference",
+            "onBehalfOfReference",
+            False,
+            "reference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "whoReference",
+            "whoReference",
+            False,
+            "reference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+    ),
+    "Slot": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("schedule", "schedule", False, "reference", ("Schedule",)),
+    ),
+    "Specimen": (
+        ("contained", "contained", True, "resource", None),
+        ("accessionIdentifier", "accessionIdentifier", False, "element", None),
+        ("collection", "collection", False, "element", None),
+        ("container", "container", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("parent", "parent", True, "reference", ("Specimen",)),
+        ("processing", "processing", True, "element", None),
+        ("request", "request", True, "reference", ("ProcedureRequest",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Device", "Substance"),
+        ),
+    ),
+    "SpecimenCollection": (
+        ("collector", "collector", False, "reference", ("Practitioner",)),
+    ),
+    "SpecimenContainer": (
+        ("additiveReference", "additiveReference", False, "reference", ("Substance",)),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "SpecimenProcessing": (
+        ("additive", "additive", True, "reference", ("Substance",)),
+    ),
+    "StructureDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("differential", "differential", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("snapshot", "snapshot", False, "element", None),
+    ),
+    "StructureDefinitionDifferential": (("element", "element", True, "element", None),),
+    "StructureDefinitionSnapshot": (("element", "element", True, "element", None),),
+    "StructureMap": (
+        ("contained", "contained", True, "resource", None),
+        ("group", "group", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "StructureMapGroup": (("rule", "rule", True, "element", None),),
+    "StructureMapGroupRule": (
+        ("rule", "rule", True, "element", None),
+        ("source", "source", True, "element", None),
+    ),
+    "StructureMapGroupRuleSource": (
+        ("defaultValueAnnotation", "defaultValueAnnotation", False, "element", None),
+        ("defaultValueIdentifier", "defaultValueIdentifier", False, "element", None),
+        ("defaultValueReference", "defaultValueReference", False, "reference", None),
+        ("defaultValueSignature", "defaultValueSignature", False, "element", None),
+    ),
+    "Subscription": (("contained", "contained", True, "resource", None),),
+    "Substance": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("ingredient", "ingredient", True, "element", None),
+        ("instance", "instance", True, "element", None),
+    ),
+    "SubstanceIngredient": (
+        (
+            "substanceReference",
+            "substanceReference",
+            False,
+            "reference",
+            ("Substance",),
+        ),
+    ),
+    "SubstanceInstance": (("identifier", "identifier", False, "element", None),),
+    "SupplyDelivery": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("SupplyRequest",)),
+        ("destination", "destination", False, "reference", ("Location",)),
+        ("identifier", "identifier", False, "element", None),
+        ("partOf", "partOf", True, "reference", ("SupplyDelivery", "Contract")),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("receiver", "receiver", True, "reference", ("Practitioner",)),
+        ("suppliedItem", "suppliedItem", False, "element", None),
+        ("supplier", "supplier", False, "reference", ("Practitioner", "Organization")),
+    ),
+    "SupplyDeliverySuppliedItem": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            ("Medication", "Substance", "Device"),
+        ),
+    ),
+    "SupplyRequest": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "deliverFrom",
+            "deliverFrom",
+            False,
+            "reference",
+            ("Organization", "Location"),
+        ),
+        (
+            "deliverTo",
+            "deliverTo",
+            False,
+            "reference",
+            ("Organization", "Location", "Patient"),
+        ),
+        ("identifier", "identifier", False, "element", None),
+        ("orderedItem", "orderedItem", False, "element", None),
+        ("reasonReference", "reasonReference", False, "reference", ("Resource",)),
+        ("requester", "requester", False, "element", None),
+        ("supplier", "supplier", True, "reference", ("Organization",)),
+    ),
+    "SupplyRequestOrderedItem": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            ("Medication", "Substance", "Device"),
+        ),
+    ),
+    "SupplyRequestRequester": (
+        (
+            "agent",
+            "agent",
+            False,
+            "reference",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson", "Device"),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "Task": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        (
+            "definitionReference",
+            "definitionReference",
+            False,
+            "reference",
+            ("ActivityDefinition",),
+        ),
+        ("focus", "focus", False, "reference", ("Resource",)),
+        ("for_fhir", "for", False, "reference", ("Resource",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("input", "input", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("output", "output", True, "element", None),
+        (
+            "owner",
+            "owner",
+            False,
+            "reference",
+            ("Device", "Organization", "Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("partOf", "partOf", True, "reference", ("Task",)),
+        ("relevantHistory", "relevantHistory", True, "reference", ("Provenance",)),
+        ("requester", "requester", False, "element", None),
+        ("restriction", "restriction", False, "element", None),
+    ),
+    "TaskInput": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+    ),
+    "TaskOutput": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+    ),
+    "TaskRequester": (
+        (
+            "agent",
+            "agent",
+            False,
+            "reference",
+            ("Device", "Organization", "Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "TaskRestriction": (
+        (
+            "recipient",
+            "recipient",
+            True,
+            "reference",
+            ("Patient", "Practitioner", "RelatedPerson", "Group", "Organization"),
+        ),
+    ),
+    "TestReport": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", False, "element", None),
+        ("testScript", "testScript", False, "reference", ("TestScript",)),
+    ),
+    "TestScript": (
+        ("contained", "contained", True, "resource", None),
+        ("fixture", "fixture", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("metadata", "metadata", False, "element", None),
+        ("profile", "profile", True, "reference", ("Resource",)),
+        ("rule", "rule", True, "element", None),
+        ("ruleset", "ruleset", True, "element", None),
+    ),
+    "TestScriptFixture": (("resource", "resource", False, "reference", ("Resource",)),),
+    "TestScriptMetadata": (("capability", "capability", True, "element", None),),
+    "TestScriptMetadataCapability": (
+        ("capabilities", "capabilities", False, "reference", ("CapabilityStatement",)),
+    ),
+    "TestScriptRule": (("resource", "resource", False, "reference", ("Resource",)),),
+    "TestScriptRuleset": (("resource", "resource", False, "reference", ("Resource",)),),
+    "TriggerDefinition": (
+        ("eventData", "eventData", False, "element", None),
+        (
+            "eventTimingReference",
+            "eventTimingReference",
+            False,
+            "reference",
+            ("Schedule",),
+        ),
+    ),
+    "ValueSet": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "VisionPrescription": (
+        ("contained", "contained", True, "resource", None),
+        ("dispense", "dispense", True, "element", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("prescriber", "prescriber", False, "reference", ("Practitioner",)),
+        ("reasonReference", "reasonReference", False, "reference", ("Condition",)),
+    ),
+    "VisionPrescriptionDispense": (("note", "note", True, "element", None),),
+}
+
+# {resource type: ((FHIR path, target types), ...)}
+REFERENCE_PATHS: typing.Dict[
+    str, typing.Tuple[typing.Tuple[str, typing.Optional[typing.Tuple[str, ...]]], ...]
+] = {
+    "Account": (
+        ("Account.coverage[*].coverage", ("Coverage",)),
+        ("Account.guarantor[*].party", ("Patient", "RelatedPerson", "Organization")),
+        ("Account.identifier[*].assigner", ("Organization",)),
+        ("Account.owner", ("Organization",)),
+        (
+            "Account.subject",
+            (
+                "Patient",
+                "Device",
+                "Practitioner",
+                "Location",
+                "HealthcareService",
+                "Organization",
+            ),
+        ),
+    ),
+    "ActivityDefinition": (
+        ("ActivityDefinition.identifier[*].assigner", ("Organization",)),
+        ("ActivityDefinition.library[*]", ("Library",)),
+        ("ActivityDefinition.location", ("Location",)),
+        ("ActivityDefinition.productReference", ("Medication", "Substance")),
+        ("ActivityDefinition.relatedArtifact[*].resource", ("Resource",)),
+        ("ActivityDefinition.transform", ("StructureMap",)),
+    ),
+    "AdverseEvent": (
+        ("AdverseEvent.eventParticipant", ("Practitioner", "Device")),
+        ("AdverseEvent.identifier.assigner", ("Organization",)),
+        ("AdverseEvent.location", ("Location",)),
+        ("AdverseEvent.reaction[*]", ("Condition",)),
+        ("AdverseEvent.recorder", ("Patient", "Practitioner", "RelatedPerson")),
+        ("AdverseEvent.referenceDocument[*]", ("DocumentReference",)),
+        ("AdverseEvent.study[*]", ("ResearchStudy",)),
+        (
+            "AdverseEvent.subject",
+            ("Patient", "ResearchSubject", "Medication", "Device"),
+        ),
+        (
+            "AdverseEvent.subjectMedicalHistory[*]",
+            (
+                "Condition",
+                "Observation",
+                "AllergyIntolerance",
+                "FamilyMemberHistory",
+                "Immunization",
+                "Procedure",
+            ),
+        ),
+        (
+            "AdverseEvent.suspectEntity[*].causalityAuthor",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        (
+            "AdverseEvent.suspectEntity[*].instance",
+            (
+                "Substance",
+                "Medication",
+                "MedicationAdministration",
+                "MedicationStatement",
+                "Device",
+            ),
+        ),
+    ),
+    "AllergyIntolerance": (
+        ("AllergyIntolerance.asserter", ("Patient", "RelatedPerson", "Practitioner")),
+        ("AllergyIntolerance.identifier[*].assigner", ("Organization",)),
+        (
+            "AllergyIntolerance.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("AllergyIntolerance.patient", ("Patient",)),
+        (
+            "AllergyIntolerance.reaction[*].note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("AllergyIntolerance.recorder", ("Practitioner", "Patient")),
+    ),
+    "Appointment": (
+        ("Appointment.identifier[*].assigner", ("Organization",)),
+        ("Appointment.incomingReferral[*]", ("ReferralRequest",)),
+        ("Appointment.indication[*]", ("Condition", "Procedure")),
+        (
+            "Appointment.participant[*].actor",
+            (
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        ("Appointment.slot[*]", ("Slot",)),
+        ("Appointment.supportingInformation[*]", ("Resource",)),
+    ),
+    "AppointmentResponse": (
+        (
+            "AppointmentResponse.actor",
+            (
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        ("AppointmentResponse.appointment", ("Appointment",)),
+        ("AppointmentResponse.identifier[*].assigner", ("Organization",)),
+    ),
+    "AuditEvent": (
+        ("AuditEvent.agent[*].location", ("Location",)),
+        (
+            "AuditEvent.agent[*].reference",
+            ("Practitioner", "Organization", "Device", "Patient", "RelatedPerson"),
+        ),
+        ("AuditEvent.agent[*].userId.assigner", ("Organization",)),
+        ("AuditEvent.entity[*].identifier.assigner", ("Organization",)),
+        ("AuditEvent.entity[*].reference", ("Resource",)),
+        ("AuditEvent.source.identifier.assigner", ("Organization",)),
+    ),
+    "Basic": (
+        ("Basic.author", ("Practitioner", "Patient", "RelatedPerson")),
+        ("Basic.identifier[*].assigner", ("Organization",)),
+        ("Basic.subject", ("Resource",)),
+    ),
+    "Binary": (("Binary.securityContext", ("Resource",)),),
+    "BodySite": (
+        ("BodySite.identifier[*].assigner", ("Organization",)),
+        ("BodySite.patient", ("Patient",)),
+    ),
+    "Bundle": (
+        ("Bundle.identifier.assigner", ("Organization",)),
+        (
+            "Bundle.signature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "Bundle.signature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+    ),
+    "CapabilityStatement": (
+        ("CapabilityStatement.document[*].profile", ("StructureDefinition",)),
+        ("CapabilityStatement.messaging[*].event[*].request", ("StructureDefinition",)),
+        (
+            "CapabilityStatement.messaging[*].event[*].response",
+            ("StructureDefinition",),
+        ),
+        (
+            "CapabilityStatement.messaging[*].supportedMessage[*].definition",
+            ("MessageDefinition",),
+        ),
+        ("CapabilityStatement.profile[*]", ("StructureDefinition",)),
+        (
+            "CapabilityStatement.rest[*].operation[*].definition",
+            ("OperationDefinition",),
+        ),
+        ("CapabilityStatement.rest[*].resource[*].profile", ("StructureDefinition",)),
+    ),
+    "CarePlan": (
+        (
+            "CarePlan.activity[*].detail.definition",
+            ("PlanDefinition", "ActivityDefinition", "Questionnaire"),
+        ),
+        ("CarePlan.activity[*].detail.goal[*]", ("Goal",)),
+        ("CarePlan.activity[*].detail.location", ("Location",)),
+        (
+            "CarePlan.activity[*].detail.performer[*]",
+            ("Practitioner", "Organization", "RelatedPerson", "Patient", "CareTeam"),
+        ),
+        ("CarePlan.activity[*].detail.productReference", ("Medication", "Substance")),
+        ("CarePlan.activity[*].detail.reasonReference[*]", ("Condition",)),
+        ("CarePlan.activity[*].outcomeReference[*]", ("Resource",)),
+        (
+            "CarePlan.activity[*].progress[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "CarePlan.activity[*].reference",
+            (
+                "Appointment",
+                "CommunicationRequest",
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "Task",
+                "ProcedureRequest",
+                "ReferralRequest",
+                "VisionPrescription",
+                "RequestGroup",
+            ),
+        ),
+        ("CarePlan.addresses[*]", ("Condition",)),
+        (
+            "CarePlan.author[*]",
+            ("Patient", "Practitioner", "RelatedPerson", "Organization", "CareTeam"),
+        ),
+        ("CarePlan.basedOn[*]", ("CarePlan",)),
+        ("CarePlan.careTeam[*]", ("CareTeam",)),
+        ("CarePlan.context", ("Encounter", "EpisodeOfCare")),
+        ("CarePlan.definition[*]", ("PlanDefinition", "Questionnaire")),
+        ("CarePlan.goal[*]", ("Goal",)),
+        ("CarePlan.identifier[*].assigner", ("Organization",)),
+        (
+            "CarePlan.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("CarePlan.partOf[*]", ("CarePlan",)),
+        ("CarePlan.replaces[*]", ("CarePlan",)),
+        ("CarePlan.subject", ("Patient", "Group")),
+        ("CarePlan.supportingInfo[*]", ("Resource",)),
+    ),
+    "CareTeam": (
+        ("CareTeam.context", ("Encounter", "EpisodeOfCare")),
+        ("CareTeam.identifier[*].assigner", ("Organization",)),
+        ("CareTeam.managingOrganization[*]", ("Organization",)),
+        (
+            "CareTeam.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "CareTeam.participant[*].member",
+            ("Practitioner", "RelatedPerson", "Patient", "Organization", "CareTeam"),
+        ),
+        ("CareTeam.participant[*].onBehalfOf", ("Organization",)),
+        ("CareTeam.reasonReference[*]", ("Condition",)),
+        ("CareTeam.subject", ("Patient", "Group")),
+    ),
+    "ChargeItem": (
+        ("ChargeItem.account[*]", ("Account",)),
+        ("ChargeItem.context", ("Encounter", "EpisodeOfCare")),
+        (
+            "ChargeItem.enterer",
+            ("Practitioner", "Organization", "Patient", "Device", "RelatedPerson"),
+        ),
+        ("ChargeItem.identifier.assigner", ("Organization",)),
+        (
+            "ChargeItem.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("ChargeItem.partOf[*]", ("ChargeItem",)),
+        (
+            "ChargeItem.participant[*].actor",
+            ("Practitioner", "Organization", "Patient", "Device", "RelatedPerson"),
+        ),
+        ("ChargeItem.performingOrganization", ("Organization",)),
+        ("ChargeItem.requestingOrganization", ("Organization",)),
+        (
+            "ChargeItem.service[*]",
+            (
+                "DiagnosticReport",
+                "ImagingStudy",
+                "Immunization",
+                "MedicationAdministration",
+                "MedicationDispense",
+                "Observation",
+                "Procedure",
+                "SupplyDelivery",
+            ),
+        ),
+        ("ChargeItem.subject", ("Patient", "Group")),
+        ("ChargeItem.supportingInformation[*]", ("Resource",)),
+    ),
+    "Claim": (
+        ("Claim.accident.locationReference", ("Location",)),
+        ("Claim.careTeam[*].provider", ("Practitioner", "Organization")),
+        ("Claim.diagnosis[*].diagnosisReference", ("Condition",)),
+        ("Claim.enterer", ("Practitioner",)),
+        ("Claim.facility", ("Location",)),
+        ("Claim.identifier[*].assigner", ("Organization",)),
+        ("Claim.information[*].valueReference", ("Resource",)),
+        ("Claim.insurance[*].claimResponse", ("ClaimResponse",)),
+        ("Claim.insurance[*].coverage", ("Coverage",)),
+        ("Claim.insurer", ("Organization",)),
+        ("Claim.item[*].detail[*].subDetail[*].udi[*]", ("Device",)),
+        ("Claim.item[*].detail[*].udi[*]", ("Device",)),
+        ("Claim.item[*].encounter[*]", ("Encounter",)),
+        ("Claim.item[*].locationReference", ("Location",)),
+        ("Claim.item[*].udi[*]", ("Device",)),
+        ("Claim.organization", ("Organization",)),
+        ("Claim.originalPrescription", ("MedicationRequest",)),
+        ("Claim.patient", ("Patient",)),
+        (
+            "Claim.payee.party",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson"),
+        ),
+        ("Claim.prescription", ("MedicationRequest", "VisionPrescription")),
+        ("Claim.procedure[*].procedureReference", ("Procedure",)),
+        ("Claim.provider", ("Practitioner",)),
+        ("Claim.referral", ("ReferralRequest",)),
+        ("Claim.related[*].claim", ("Claim",)),
+        ("Claim.related[*].reference.assigner", ("Organization",)),
+    ),
+    "ClaimResponse": (
+        ("ClaimResponse.communicationRequest[*]", ("CommunicationRequest",)),
+        ("ClaimResponse.identifier[*].assigner", ("Organization",)),
+        ("ClaimResponse.insurance[*].claimResponse", ("ClaimResponse",)),
+        ("ClaimResponse.insurance[*].coverage", ("Coverage",)),
+        ("ClaimResponse.insurer", ("Organization",)),
+        ("ClaimResponse.patient", ("Patient",)),
+        ("ClaimResponse.payment.identifier.assigner", ("Organization",)),
+        ("ClaimResponse.request", ("Claim",)),
+        ("ClaimResponse.requestOrganization", ("Organization",)),
+        ("ClaimResponse.requestProvider", ("Practitioner",)),
+    ),
+    "ClinicalImpression": (
+        (
+            "ClinicalImpression.action[*]",
+            (
+                "ReferralRequest",
+                "ProcedureRequest",
+                "Procedure",
+                "MedicationRequest",
+                "Appointment",
+            ),
+        ),
+        ("ClinicalImpression.assessor", ("Practitioner",)),
+        ("ClinicalImpression.context", ("Encounter", "EpisodeOfCare")),
+        ("ClinicalImpression.finding[*].itemReference", ("Condition", "Observation")),
+        ("ClinicalImpression.identifier[*].assigner", ("Organization",)),
+        (
+            "ClinicalImpression.investigation[*].item[*]",
+            (
+                "Observation",
+                "QuestionnaireResponse",
+                "FamilyMemberHistory",
+                "DiagnosticReport",
+                "RiskAssessment",
+                "ImagingStudy",
+            ),
+        ),
+        (
+            "ClinicalImpression.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("ClinicalImpression.previous", ("ClinicalImpression",)),
+        ("ClinicalImpression.problem[*]", ("Condition", "AllergyIntolerance")),
+        ("ClinicalImpression.prognosisReference[*]", ("RiskAssessment",)),
+        ("ClinicalImpression.subject", ("Patient", "Group")),
+    ),
+    "CodeSystem": (("CodeSystem.identifier.assigner", ("Organization",)),),
+    "Communication": (
+        ("Communication.basedOn[*]", ("Resource",)),
+        ("Communication.context", ("Encounter", "EpisodeOfCare")),
+        ("Communication.definition[*]", ("PlanDefinition", "ActivityDefinition")),
+        ("Communication.identifier[*].assigner", ("Organization",)),
+        (
+            "Communication.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("Communication.partOf[*]", ("Resource",)),
+        ("Communication.payload[*].contentReference", ("Resource",)),
+        ("Communication.reasonReference[*]", ("Condition", "Observation")),
+        (
+            "Communication.recipient[*]",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Group",
+            ),
+        ),
+        (
+            "Communication.sender",
+            ("Device", "Organization", "Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("Communication.subject", ("Patient", "Group")),
+        ("Communication.topic[*]", ("Resource",)),
+    ),
+    "CommunicationRequest": (
+        ("CommunicationRequest.basedOn[*]", ("Resource",)),
+        ("CommunicationRequest.context", ("Encounter", "EpisodeOfCare")),
+        ("CommunicationRequest.groupIdentifier.assigner", ("Organization",)),
+        ("CommunicationRequest.identifier[*].assigner", ("Organization",)),
+        (
+            "CommunicationRequest.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("CommunicationRequest.payload[*].contentReference", ("Resource",)),
+        ("CommunicationRequest.reasonReference[*]", ("Condition", "Observation")),
+        (
+            "CommunicationRequest.recipient[*]",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Group",
+                "CareTeam",
+            ),
+        ),
+        ("CommunicationRequest.replaces[*]", ("CommunicationRequest",)),
+        (
+            "CommunicationRequest.requester.agent",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson", "Device"),
+        ),
+        ("CommunicationRequest.requester.onBehalfOf", ("Organization",)),
+        (
+            "CommunicationRequest.sender",
+            ("Device", "Organization", "Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("CommunicationRequest.subject", ("Patient", "Group")),
+        ("CommunicationRequest.topic[*]", ("Resource",)),
+    ),
+    "Composition": (
+        ("Composition.attester[*].party", ("Patient", "Practitioner", "Organization")),
+        (
+            "Composition.author[*]",
+            ("Practitioner", "Device", "Patient", "RelatedPerson"),
+        ),
+        ("Composition.custodian", ("Organization",)),
+        ("Composition.encounter", ("Encounter",)),
+        ("Composition.event[*].detail[*]", ("Resource",)),
+        ("Composition.identifier.assigner", ("Organization",)),
+        ("Composition.relatesTo[*].targetIdentifier.assigner", ("Organization",)),
+        ("Composition.relatesTo[*].targetReference", ("Composition",)),
+        ("Composition.section[*].entry[*]", ("Resource",)),
+        ("Composition.subject", ("Resource",)),
+    ),
+    "ConceptMap": (
+        ("ConceptMap.identifier.assigner", ("Organization",)),
+        ("ConceptMap.sourceReference", ("ValueSet",)),
+        ("ConceptMap.targetReference", ("ValueSet",)),
+    ),
+    "Condition": (
+        ("Condition.asserter", ("Practitioner", "Patient", "RelatedPerson")),
+        ("Condition.context", ("Encounter", "EpisodeOfCare")),
+        ("Condition.evidence[*].detail[*]", ("Resource",)),
+        ("Condition.identifier[*].assigner", ("Organization",)),
+        (
+            "Condition.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "Condition.stage.assessment[*]",
+            ("ClinicalImpression", "DiagnosticReport", "Observation"),
+        ),
+        ("Condition.subject", ("Patient", "Group")),
+    ),
+    "Consent": (
+        (
+            "Consent.actor[*].reference",
+            (
+                "Device",
+                "Group",
+                "CareTeam",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "Consent.consentingParty[*]",
+            ("Organization", "Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("Consent.data[*].reference", ("Resource",)),
+        (
+            "Consent.except[*].actor[*].reference",
+            (
+                "Device",
+                "Group",
+                "CareTeam",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+            ),
+        ),
+        ("Consent.except[*].data[*].reference", ("Resource",)),
+        ("Consent.identifier.assigner", ("Organization",)),
+        ("Consent.organization[*]", ("Organization",)),
+        ("Consent.patient", ("Patient",)),
+        ("Consent.sourceIdentifier.assigner", ("Organization",)),
+        (
+            "Consent.sourceReference",
+            ("Consent", "DocumentReference", "Contract", "QuestionnaireResponse"),
+        ),
+    ),
+    "Contract": (
+        (
+            "Contract.agent[*].actor",
+            (
+                "Contract",
+                "Device",
+                "Group",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Substance",
+            ),
+        ),
+        ("Contract.authority[*]", ("Organization",)),
+        (
+            "Contract.bindingReference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+        ("Contract.domain[*]", ("Location",)),
+        (
+            "Contract.friendly[*].contentReference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+        ("Contract.identifier.assigner", ("Organization",)),
+        (
+            "Contract.legal[*].contentReference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+        ("Contract.rule[*].contentReference", ("DocumentReference",)),
+        (
+            "Contract.signer[*].party",
+            ("Organization", "Patient", "Practitioner", "RelatedPerson"),
+        ),
+        (
+            "Contract.signer[*].signature[*].onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "Contract.signer[*].signature[*].whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        ("Contract.subject[*]", ("Resource",)),
+        (
+            "Contract.term[*].agent[*].actor",
+            (
+                "Contract",
+                "Device",
+                "Group",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Substance",
+            ),
+        ),
+        ("Contract.term[*].identifier.assigner", ("Organization",)),
+        ("Contract.term[*].topic[*]", ("Resource",)),
+        ("Contract.term[*].valuedItem[*].entityReference", ("Resource",)),
+        ("Contract.term[*].valuedItem[*].identifier.assigner", ("Organization",)),
+        ("Contract.topic[*]", ("Resource",)),
+        ("Contract.valuedItem[*].entityReference", ("Resource",)),
+        ("Contract.valuedItem[*].identifier.assigner", ("Organization",)),
+    ),
+    "Coverage": (
+        ("Coverage.beneficiary", ("Patient",)),
+        ("Coverage.contract[*]", ("Contract",)),
+        ("Coverage.identifier[*].assigner", ("Organization",)),
+        ("Coverage.payor[*]", ("Organization", "Patient", "RelatedPerson")),
+        ("Coverage.policyHolder", ("Patient", "RelatedPerson", "Organization")),
+        ("Coverage.subscriber", ("Patient", "RelatedPerson")),
+    ),
+    "DataElement": (
+        ("DataElement.element[*].binding.valueSetReference", ("ValueSet",)),
+        (
+            "DataElement.element[*].defaultValueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("DataElement.element[*].defaultValueIdentifier.assigner", ("Organization",)),
+        ("DataElement.element[*].defaultValueReference", None),
+        (
+            "DataElement.element[*].defaultValueSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "DataElement.element[*].defaultValueSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "DataElement.element[*].example[*].valueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "DataElement.element[*].example[*].valueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("DataElement.element[*].example[*].valueReference", None),
+        (
+            "DataElement.element[*].example[*].valueSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "DataElement.element[*].example[*].valueSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "DataElement.element[*].fixedAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("DataElement.element[*].fixedIdentifier.assigner", ("Organization",)),
+        ("DataElement.element[*].fixedReference", None),
+        (
+            "DataElement.element[*].fixedSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "DataElement.element[*].fixedSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "DataElement.element[*].patternAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("DataElement.element[*].patternIdentifier.assigner", ("Organization",)),
+        ("DataElement.element[*].patternReference", None),
+        (
+            "DataElement.element[*].patternSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "DataElement.element[*].patternSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        ("DataElement.identifier[*].assigner", ("Organization",)),
+    ),
+    "DetectedIssue": (
+        ("DetectedIssue.author", ("Practitioner", "Device")),
+        ("DetectedIssue.identifier.assigner", ("Organization",)),
+        ("DetectedIssue.implicated[*]", ("Resource",)),
+        ("DetectedIssue.mitigation[*].author", ("Practitioner",)),
+        ("DetectedIssue.patient", ("Patient",)),
+    ),
+    "Device": (
+        ("Device.identifier[*].assigner", ("Organization",)),
+        ("Device.location", ("Location",)),
+        (
+            "Device.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("Device.owner", ("Organization",)),
+        ("Device.patient", ("Patient",)),
+    ),
+    "DeviceComponent": (
+        ("DeviceComponent.identifier.assigner", ("Organization",)),
+        ("DeviceComponent.parent", ("DeviceComponent",)),
+        (
+            "DeviceComponent.productionSpecification[*].componentId.assigner",
+            ("Organization",),
+        ),
+        ("DeviceComponent.source", ("Device",)),
+    ),
+    "DeviceMetric": (
+        ("DeviceMetric.identifier.assigner", ("Organization",)),
+        ("DeviceMetric.parent", ("DeviceComponent",)),
+        ("DeviceMetric.source", ("Device",)),
+    ),
+    "DeviceRequest": (
+        ("DeviceRequest.basedOn[*]", ("Resource",)),
+        ("DeviceRequest.codeReference", ("Device",)),
+        ("DeviceRequest.context", ("Encounter", "EpisodeOfCare")),
+        ("DeviceRequest.definition[*]", ("ActivityDefinition", "PlanDefinition")),
+        ("DeviceRequest.groupIdentifier.assigner", ("Organization",)),
+        ("DeviceRequest.identifier[*].assigner", ("Organization",)),
+        (
+            "DeviceRequest.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "DeviceRequest.performer",
+            (
+                "Practitioner",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+        ("DeviceRequest.priorRequest[*]", ("Resource",)),
+        ("DeviceRequest.reasonReference[*]", ("Resource",)),
+        ("DeviceRequest.relevantHistory[*]", ("Provenance",)),
+        ("DeviceRequest.requester.agent", ("Device", "Practitioner", "Organization")),
+        ("DeviceRequest.requester.onBehalfOf", ("Organization",)),
+        ("DeviceRequest.subject", ("Patient", "Group", "Location", "Device")),
+        ("DeviceRequest.supportingInfo[*]", ("Resource",)),
+    ),
+    "DeviceUseStatement": (
+        ("DeviceUseStatement.device", ("Device",)),
+        ("DeviceUseStatement.identifier[*].assigner", ("Organization",)),
+        (
+            "DeviceUseStatement.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("DeviceUseStatement.source", ("Patient", "Practitioner", "RelatedPerson")),
+        ("DeviceUseStatement.subject", ("Patient", "Group")),
+    ),
+    "DiagnosticReport": (
+        (
+            "DiagnosticReport.basedOn[*]",
+            (
+                "CarePlan",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ProcedureRequest",
+                "ReferralRequest",
+            ),
+        ),
+        ("DiagnosticReport.context", ("Encounter", "EpisodeOfCare")),
+        ("DiagnosticReport.identifier[*].assigner", ("Organization",)),
+        ("DiagnosticReport.image[*].link", ("Media",)),
+        ("DiagnosticReport.imagingStudy[*]", ("ImagingStudy", "ImagingManifest")),
+        ("DiagnosticReport.performer[*].actor", ("Practitioner", "Organization")),
+        ("DiagnosticReport.result[*]", ("Observation",)),
+        ("DiagnosticReport.specimen[*]", ("Specimen",)),
+        ("DiagnosticReport.subject", ("Patient", "Group", "Device", "Location")),
+    ),
+    "DocumentManifest": (
+        (
+            "DocumentManifest.author[*]",
+            ("Practitioner", "Organization", "Device", "Patient", "RelatedPerson"),
+        ),
+        ("DocumentManifest.content[*].pReference", ("Resource",)),
+        ("DocumentManifest.identifier[*].assigner", ("Organization",)),
+        ("DocumentManifest.masterIdentifier.assigner", ("Organization",)),
+        (
+            "DocumentManifest.recipient[*]",
+            ("Patient", "Practitioner", "RelatedPerson", "Organization"),
+        ),
+        ("DocumentManifest.related[*].identifier.assigner", ("Organization",)),
+        ("DocumentManifest.related[*].ref", ("Resource",)),
+        ("DocumentManifest.subject", ("Patient", "Practitioner", "Group", "Device")),
+    ),
+    "DocumentReference": (
+        ("DocumentReference.authenticator", ("Practitioner", "Organization")),
+        (
+            "DocumentReference.author[*]",
+            ("Practitioner", "Organization", "Device", "Patient", "RelatedPerson"),
+        ),
+        ("DocumentReference.context.encounter", ("Encounter",)),
+        ("DocumentReference.context.related[*].identifier.assigner", ("Organization",)),
+        ("DocumentReference.context.related[*].ref", ("Resource",)),
+        ("DocumentReference.context.sourcePatientInfo", ("Patient",)),
+        ("DocumentReference.custodian", ("Organization",)),
+        ("DocumentReference.identifier[*].assigner", ("Organization",)),
+        ("DocumentReference.masterIdentifier.assigner", ("Organization",)),
+        ("DocumentReference.relatesTo[*].target", ("DocumentReference",)),
+        ("DocumentReference.subject", ("Patient", "Practitioner", "Group", "Device")),
+    ),
+    "EligibilityRequest": (
+        ("EligibilityRequest.coverage", ("Coverage",)),
+        ("EligibilityRequest.enterer", ("Practitioner",)),
+        ("EligibilityRequest.facility", ("Location",)),
+        ("EligibilityRequest.identifier[*].assigner", ("Organization",)),
+        ("EligibilityRequest.insurer", ("Organization",)),
+        ("EligibilityRequest.organization", ("Organization",)),
+        ("EligibilityRequest.patient", ("Patient",)),
+        ("EligibilityRequest.provider", ("Practitioner",)),
+    ),
+    "EligibilityResponse": (
+        ("EligibilityResponse.identifier[*].assigner", ("Organization",)),
+        ("EligibilityResponse.insurance[*].contract", ("Contract",)),
+        ("EligibilityResponse.insurance[*].coverage", ("Coverage",)),
+        ("EligibilityResponse.insurer", ("Organization",)),
+        ("EligibilityResponse.request", ("EligibilityRequest",)),
+        ("EligibilityResponse.requestOrganization", ("Organization",)),
+        ("EligibilityResponse.requestProvider", ("Practitioner",)),
+    ),
+    "Encounter": (
+        ("Encounter.account[*]", ("Account",)),
+        ("Encounter.appointment", ("Appointment",)),
+        ("Encounter.diagnosis[*].condition", ("Condition", "Procedure")),
+        ("Encounter.episodeOfCare[*]", ("EpisodeOfCare",)),
+        ("Encounter.hospitalization.destination", ("Location",)),
+        ("Encounter.hospitalization.origin", ("Location",)),
+        (
+            "Encounter.hospitalization.preAdmissionIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("Encounter.identifier[*].assigner", ("Organization",)),
+        ("Encounter.incomingReferral[*]", ("ReferralRequest",)),
+        ("Encounter.location[*].location", ("Location",)),
+        ("Encounter.partOf", ("Encounter",)),
+        ("Encounter.participant[*].individual", ("Practitioner", "RelatedPerson")),
+        ("Encounter.serviceProvider", ("Organization",)),
+        ("Encounter.subject", ("Patient", "Group")),
+    ),
+    "Endpoint": (
+        ("Endpoint.identifier[*].assigner", ("Organization",)),
+        ("Endpoint.managingOrganization", ("Organization",)),
+    ),
+    "EnrollmentRequest": (
+        ("EnrollmentRequest.coverage", ("Coverage",)),
+        ("EnrollmentRequest.identifier[*].assigner", ("Organization",)),
+        ("EnrollmentRequest.insurer", ("Organization",)),
+        ("EnrollmentRequest.organization", ("Organization",)),
+        ("EnrollmentRequest.provider", ("Practitioner",)),
+        ("EnrollmentRequest.subject", ("Patient",)),
+    ),
+    "EnrollmentResponse": (
+        ("EnrollmentResponse.identifier[*].assigner", ("Organization",)),
+        ("EnrollmentResponse.organization", ("Organization",)),
+        ("EnrollmentResponse.request", ("EnrollmentRequest",)),
+        ("EnrollmentResponse.requestOrganization", ("Organization",)),
+        ("EnrollmentResponse.requestProvider", ("Practitioner",)),
+    ),
+    "EpisodeOfCare": (
+        ("EpisodeOfCare.account[*]", ("Account",)),
+        ("EpisodeOfCare.careManager", ("Practitioner",)),
+        ("EpisodeOfCare.diagnosis[*].condition", ("Condition",)),
+        ("EpisodeOfCare.identifier[*].assigner", ("Organization",)),
+        ("EpisodeOfCare.managingOrganization", ("Organization",)),
+        ("EpisodeOfCare.patient", ("Patient",)),
+        ("EpisodeOfCare.referralRequest[*]", ("ReferralRequest",)),
+        ("EpisodeOfCare.team[*]", ("CareTeam",)),
+    ),
+    "ExpansionProfile": (("ExpansionProfile.identifier.assigner", ("Organization",)),),
+    "ExplanationOfBenefit": (
+        ("ExplanationOfBenefit.accident.locationReference", ("Location",)),
+        ("ExplanationOfBenefit.careTeam[*].provider", ("Practitioner", "Organization")),
+        ("ExplanationOfBenefit.claim", ("Claim",)),
+        ("ExplanationOfBenefit.claimResponse", ("ClaimResponse",)),
+        ("ExplanationOfBenefit.diagnosis[*].diagnosisReference", ("Condition",)),
+        ("ExplanationOfBenefit.enterer", ("Practitioner",)),
+        ("ExplanationOfBenefit.facility", ("Location",)),
+        ("ExplanationOfBenefit.identifier[*].assigner", ("Organization",)),
+        ("ExplanationOfBenefit.information[*].valueReference", ("Resource",)),
+        ("ExplanationOfBenefit.insurance.coverage", ("Coverage",)),
+        ("ExplanationOfBenefit.insurer", ("Organization",)),
+        ("ExplanationOfBenefit.item[*].detail[*].subDetail[*].udi[*]", ("Device",)),
+        ("ExplanationOfBenefit.item[*].detail[*].udi[*]", ("Device",)),
+        ("ExplanationOfBenefit.item[*].encounter[*]", ("Encounter",)),
+        ("ExplanationOfBenefit.item[*].locationReference", ("Location",)),
+        ("ExplanationOfBenefit.item[*].udi[*]", ("Device",)),
+        ("ExplanationOfBenefit.organization", ("Organization",)),
+        ("ExplanationOfBenefit.originalPrescription", ("MedicationRequest",)),
+        ("ExplanationOfBenefit.patient", ("Patient",)),
+        (
+            "ExplanationOfBenefit.payee.party",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson"),
+        ),
+        ("ExplanationOfBenefit.payment.identifier.assigner", ("Organization",)),
+        (
+            "ExplanationOfBenefit.prescription",
+            ("MedicationRequest", "VisionPrescription"),
+        ),
+        ("ExplanationOfBenefit.procedure[*].procedureReference", ("Procedure",)),
+        ("ExplanationOfBenefit.provider", ("Practitioner",)),
+        ("ExplanationOfBenefit.referral", ("ReferralRequest",)),
+        ("ExplanationOfBenefit.related[*].claim", ("Claim",)),
+        ("ExplanationOfBenefit.related[*].reference.assigner", ("Organization",)),
+    ),
+    "FamilyMemberHistory": (
+        (
+            "FamilyMemberHistory.condition[*].note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("FamilyMemberHistory.definition[*]", ("PlanDefinition", "Questionnaire")),
+        ("FamilyMemberHistory.identifier[*].assigner", ("Organization",)),
+        (
+            "FamilyMemberHistory.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("FamilyMemberHistory.patient", ("Patient",)),
+        (
+            "FamilyMemberHistory.reasonReference[*]",
+            ("Condition", "Observation", "AllergyIntolerance", "QuestionnaireResponse"),
+        ),
+    ),
+    "Flag": (
+        ("Flag.author", ("Device", "Organization", "Patient", "Practitioner")),
+        ("Flag.encounter", ("Encounter",)),
+        ("Flag.identifier[*].assigner", ("Organization",)),
+        (
+            "Flag.subject",
+            (
+                "Patient",
+                "Location",
+                "Group",
+                "Organization",
+                "Practitioner",
+                "PlanDefinition",
+                "Medication",
+                "Procedure",
+            ),
+        ),
+    ),
+    "Goal": (
+        (
+            "Goal.addresses[*]",
+            (
+                "Condition",
+                "Observation",
+                "MedicationStatement",
+                "NutritionOrder",
+                "ProcedureRequest",
+                "RiskAssessment",
+            ),
+        ),
+        ("Goal.expressedBy", ("Patient", "Practitioner", "RelatedPerson")),
+        ("Goal.identifier[*].assigner", ("Organization",)),
+        ("Goal.note[*].authorReference", ("Practitioner", "Patient", "RelatedPerson")),
+        ("Goal.outcomeReference[*]", ("Observation",)),
+        ("Goal.subject", ("Patient", "Group", "Organization")),
+    ),
+    "Group": (
+        ("Group.identifier[*].assigner", ("Organization",)),
+        (
+            "Group.member[*].entity",
+            ("Patient", "Practitioner", "Device", "Medication", "Substance"),
+        ),
+    ),
+    "GuidanceResponse": (
+        ("GuidanceResponse.context", ("Encounter", "EpisodeOfCare")),
+        (
+            "GuidanceResponse.dataRequirement[*].codeFilter[*].valueSetReference",
+            ("ValueSet",),
+        ),
+        ("GuidanceResponse.evaluationMessage[*]", ("OperationOutcome",)),
+        ("GuidanceResponse.identifier.assigner", ("Organization",)),
+        ("GuidanceResponse.module", ("ServiceDefinition",)),
+        (
+            "GuidanceResponse.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("GuidanceResponse.outputParameters", ("Parameters",)),
+        ("GuidanceResponse.performer", ("Device",)),
+        ("GuidanceResponse.reasonReference", ("Resource",)),
+        ("GuidanceResponse.result", ("CarePlan", "RequestGroup")),
+        ("GuidanceResponse.subject", ("Patient", "Group")),
+    ),
+    "HealthcareService": (
+        ("HealthcareService.coverageArea[*]", ("Location",)),
+        ("HealthcareService.endpoint[*]", ("Endpoint",)),
+        ("HealthcareService.identifier[*].assigner", ("Organization",)),
+        ("HealthcareService.location[*]", ("Location",)),
+        ("HealthcareService.providedBy", ("Organization",)),
+    ),
+    "ImagingManifest": (
+        (
+            "ImagingManifest.author",
+            ("Practitioner", "Device", "Organization", "Patient", "RelatedPerson"),
+        ),
+        ("ImagingManifest.identifier.assigner", ("Organization",)),
+        ("ImagingManifest.patient", ("Patient",)),
+        ("ImagingManifest.study[*].endpoint[*]", ("Endpoint",)),
+        ("ImagingManifest.study[*].imagingStudy", ("ImagingStudy",)),
+        ("ImagingManifest.study[*].series[*].endpoint[*]", ("Endpoint",)),
+    ),
+    "ImagingStudy": (
+        ("ImagingStudy.accession.assigner", ("Organization",)),
+        (
+            "ImagingStudy.basedOn[*]",
+            ("ReferralRequest", "CarePlan", "ProcedureRequest"),
+        ),
+        ("ImagingStudy.context", ("Encounter", "EpisodeOfCare")),
+        ("ImagingStudy.endpoint[*]", ("Endpoint",)),
+        ("ImagingStudy.identifier[*].assigner", ("Organization",)),
+        ("ImagingStudy.interpreter[*]", ("Practitioner",)),
+        ("ImagingStudy.patient", ("Patient",)),
+        ("ImagingStudy.procedureReference[*]", ("Procedure",)),
+        ("ImagingStudy.referrer", ("Practitioner",)),
+        ("ImagingStudy.series[*].endpoint[*]", ("Endpoint",)),
+        ("ImagingStudy.series[*].performer[*]", ("Practitioner",)),
+    ),
+    "Immunization": (
+        ("Immunization.encounter", ("Encounter",)),
+        ("Immunization.identifier[*].assigner", ("Organization",)),
+        ("Immunization.location", ("Location",)),
+        ("Immunization.manufacturer", ("Organization",)),
+        (
+            "Immunization.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("Immunization.patient", ("Patient",)),
+        ("Immunization.practitioner[*].actor", ("Practitioner",)),
+        ("Immunization.reaction[*].detail", ("Observation",)),
+        ("Immunization.vaccinationProtocol[*].authority", ("Organization",)),
+    ),
+    "ImmunizationRecommendation": (
+        ("ImmunizationRecommendation.identifier[*].assigner", ("Organization",)),
+        ("ImmunizationRecommendation.patient", ("Patient",)),
+        (
+            "ImmunizationRecommendation.recommendation[*].protocol.authority",
+            ("Organization",),
+        ),
+        (
+            "ImmunizationRecommendation.recommendation[*].supportingImmunization[*]",
+            ("Immunization",),
+        ),
+        (
+            "ImmunizationRecommendation.recommendation[*].supportingPatientInformation[*]",
+            ("Observation", "AllergyIntolerance"),
+        ),
+    ),
+    "ImplementationGuide": (
+        ("ImplementationGuide.global[*].profile", ("StructureDefinition",)),
+        (
+            "ImplementationGuide.package[*].resource[*].exampleFor",
+            ("StructureDefinition",),
+        ),
+        ("ImplementationGuide.package[*].resource[*].sourceReference", ("Resource",)),
+    ),
+    "Library": (
+        ("Library.dataRequirement[*].codeFilter[*].valueSetReference", ("ValueSet",)),
+        ("Library.identifier[*].assigner", ("Organization",)),
+        ("Library.parameter[*].profile", ("StructureDefinition",)),
+        ("Library.relatedArtifact[*].resource", ("Resource",)),
+    ),
+    "Linkage": (
+        ("Linkage.author", ("Practitioner", "Organization")),
+        ("Linkage.item[*].resource", None),
+    ),
+    "List": (
+        ("List.encounter", ("Encounter",)),
+        ("List.entry[*].item", ("Resource",)),
+        ("List.identifier[*].assigner", ("Organization",)),
+        ("List.note[*].authorReference", ("Practitioner", "Patient", "RelatedPerson")),
+        ("List.source", ("Practitioner", "Patient", "Device")),
+        ("List.subject", ("Patient", "Group", "Device", "Location")),
+    ),
+    "Location": (
+        ("Location.endpoint[*]", ("Endpoint",)),
+        ("Location.identifier[*].assigner", ("Organization",)),
+        ("Location.managingOrganization", ("Organization",)),
+        ("Location.partOf", ("Location",)),
+    ),
+    "Measure": (
+        ("Measure.group[*].identifier.assigner", ("Organization",)),
+        ("Measure.group[*].population[*].identifier.assigner", ("Organization",)),
+        ("Measure.group[*].stratifier[*].identifier.assigner", ("Organization",)),
+        ("Measure.identifier[*].assigner", ("Organization",)),
+        ("Measure.library[*]", ("Library",)),
+        ("Measure.relatedArtifact[*].resource", ("Resource",)),
+        ("Measure.supplementalData[*].identifier.assigner", ("Organization",)),
+    ),
+    "MeasureReport": (
+        ("MeasureReport.evaluatedResources", ("Bundle",)),
+        ("MeasureReport.group[*].identifier.assigner", ("Organization",)),
+        ("MeasureReport.group[*].population[*].identifier.assigner", ("Organization",)),
+        ("MeasureReport.group[*].population[*].patients", ("List",)),
+        ("MeasureReport.group[*].stratifier[*].identifier.assigner", ("Organization",)),
+        (
+            "MeasureReport.group[*].stratifier[*].stratum[*].population[*].identifier.assigner",
+            ("Organization",),
+        ),
+        (
+            "MeasureReport.group[*].stratifier[*].stratum[*].population[*].patients",
+            ("List",),
+        ),
+        ("MeasureReport.identifier.assigner", ("Organization",)),
+        ("MeasureReport.measure", ("Measure",)),
+        ("MeasureReport.patient", ("Patient",)),
+        ("MeasureReport.reportingOrganization", ("Organization",)),
+    ),
+    "Media": (
+        ("Media.basedOn[*]", ("ProcedureRequest",)),
+        ("Media.context", ("Encounter", "EpisodeOfCare")),
+        ("Media.device", ("Device", "DeviceMetric")),
+        ("Media.identifier[*].assigner", ("Organization",)),
+        ("Media.note[*].authorReference", ("Practitioner", "Patient", "RelatedPerson")),
+        ("Media.operator", ("Practitioner",)),
+        ("Media.subject", ("Patient", "Practitioner", "Group", "Device", "Specimen")),
+    ),
+    "Medication": (
+        ("Medication.ingredient[*].itemReference", ("Substance", "Medication")),
+        ("Medication.manufacturer", ("Organization",)),
+        ("Medication.package.content[*].itemReference", ("Medication",)),
+    ),
+    "MedicationAdministration": (
+        ("MedicationAdministration.context", ("Encounter", "EpisodeOfCare")),
+        (
+            "MedicationAdministration.definition[*]",
+            ("PlanDefinition", "ActivityDefinition"),
+        ),
+        ("MedicationAdministration.device[*]", ("Device",)),
+        ("MedicationAdministration.eventHistory[*]", ("Provenance",)),
+        ("MedicationAdministration.identifier[*].assigner", ("Organization",)),
+        ("MedicationAdministration.medicationReference", ("Medication",)),
+        (
+            "MedicationAdministration.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "MedicationAdministration.partOf[*]",
+            ("MedicationAdministration", "Procedure"),
+        ),
+        (
+            "MedicationAdministration.performer[*].actor",
+            ("Practitioner", "Patient", "RelatedPerson", "Device"),
+        ),
+        ("MedicationAdministration.performer[*].onBehalfOf", ("Organization",)),
+        ("MedicationAdministration.prescription", ("MedicationRequest",)),
+        ("MedicationAdministration.reasonReference[*]", ("Condition", "Observation")),
+        ("MedicationAdministration.subject", ("Patient", "Group")),
+        ("MedicationAdministration.supportingInformation[*]", ("Resource",)),
+    ),
+    "MedicationDispense": (
+        ("MedicationDispense.authorizingPrescription[*]", ("MedicationRequest",)),
+        ("MedicationDispense.context", ("Encounter", "EpisodeOfCare")),
+        ("MedicationDispense.destination", ("Location",)),
+        ("MedicationDispense.detectedIssue[*]", ("DetectedIssue",)),
+        ("MedicationDispense.eventHistory[*]", ("Provenance",)),
+        ("MedicationDispense.identifier[*].assigner", ("Organization",)),
+        ("MedicationDispense.medicationReference", ("Medication",)),
+        ("MedicationDispense.notDoneReasonReference", ("DetectedIssue",)),
+        (
+            "MedicationDispense.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("MedicationDispense.partOf[*]", ("Procedure",)),
+        (
+            "MedicationDispense.performer[*].actor",
+            ("Practitioner", "Organization", "Patient", "Device", "RelatedPerson"),
+        ),
+        ("MedicationDispense.performer[*].onBehalfOf", ("Organization",)),
+        ("MedicationDispense.receiver[*]", ("Patient", "Practitioner")),
+        ("MedicationDispense.subject", ("Patient", "Group")),
+        ("MedicationDispense.substitution.responsibleParty[*]", ("Practitioner",)),
+        ("MedicationDispense.supportingInformation[*]", ("Resource",)),
+    ),
+    "MedicationRequest": (
+        (
+            "MedicationRequest.basedOn[*]",
+            ("CarePlan", "MedicationRequest", "ProcedureRequest", "ReferralRequest"),
+        ),
+        ("MedicationRequest.context", ("Encounter", "EpisodeOfCare")),
+        ("MedicationRequest.definition[*]", ("ActivityDefinition", "PlanDefinition")),
+        ("MedicationRequest.detectedIssue[*]", ("DetectedIssue",)),
+        ("MedicationRequest.dispenseRequest.performer", ("Organization",)),
+        ("MedicationRequest.eventHistory[*]", ("Provenance",)),
+        ("MedicationRequest.groupIdentifier.assigner", ("Organization",)),
+        ("MedicationRequest.identifier[*].assigner", ("Organization",)),
+        ("MedicationRequest.medicationReference", ("Medication",)),
+        (
+            "MedicationRequest.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("MedicationRequest.priorPrescription", ("MedicationRequest",)),
+        ("MedicationRequest.reasonReference[*]", ("Condition", "Observation")),
+        ("MedicationRequest.recorder", ("Practitioner",)),
+        (
+            "MedicationRequest.requester.agent",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson", "Device"),
+        ),
+        ("MedicationRequest.requester.onBehalfOf", ("Organization",)),
+        ("MedicationRequest.subject", ("Patient", "Group")),
+        ("MedicationRequest.supportingInformation[*]", ("Resource",)),
+    ),
+    "MedicationStatement": (
+        (
+            "MedicationStatement.basedOn[*]",
+            ("MedicationRequest", "CarePlan", "ProcedureRequest", "ReferralRequest"),
+        ),
+        ("MedicationStatement.context", ("Encounter", "EpisodeOfCare")),
+        ("MedicationStatement.derivedFrom[*]", ("Resource",)),
+        ("MedicationStatement.identifier[*].assigner", ("Organization",)),
+        (
+            "MedicationStatement.informationSource",
+            ("Patient", "Practitioner", "RelatedPerson", "Organization"),
+        ),
+        ("MedicationStatement.medicationReference", ("Medication",)),
+        (
+            "MedicationStatement.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "MedicationStatement.partOf[*]",
+            (
+                "MedicationAdministration",
+                "MedicationDispense",
+                "MedicationStatement",
+                "Procedure",
+                "Observation",
+            ),
+        ),
+        ("MedicationStatement.reasonReference[*]", ("Condition", "Observation")),
+        ("MedicationStatement.subject", ("Patient", "Group")),
+    ),
+    "MessageDefinition": (
+        ("MessageDefinition.allowedResponse[*].message", ("MessageDefinition",)),
+        ("MessageDefinition.base", ("MessageDefinition",)),
+        ("MessageDefinition.focus[*].profile", ("StructureDefinition",)),
+        ("MessageDefinition.identifier.assigner", ("Organization",)),
+        ("MessageDefinition.parent[*]", ("ActivityDefinition", "PlanDefinition")),
+        ("MessageDefinition.replaces[*]", ("MessageDefinition",)),
+    ),
+    "MessageHeader": (
+        ("MessageHeader.author", ("Practitioner",)),
+        ("MessageHeader.destination[*].target", ("Device",)),
+        ("MessageHeader.enterer", ("Practitioner",)),
+        ("MessageHeader.focus[*]", ("Resource",)),
+        ("MessageHeader.receiver", ("Practitioner", "Organization")),
+        ("MessageHeader.response.details", ("OperationOutcome",)),
+        ("MessageHeader.responsible", ("Practitioner", "Organization")),
+        ("MessageHeader.sender", ("Practitioner", "Organization")),
+    ),
+    "NamingSystem": (("NamingSystem.replacedBy", ("NamingSystem",)),),
+    "NutritionOrder": (
+        ("NutritionOrder.allergyIntolerance[*]", ("AllergyIntolerance",)),
+        ("NutritionOrder.encounter", ("Encounter",)),
+        ("NutritionOrder.identifier[*].assigner", ("Organization",)),
+        ("NutritionOrder.orderer", ("Practitioner",)),
+        ("NutritionOrder.patient", ("Patient",)),
+    ),
+    "Observation": (
+        (
+            "Observation.basedOn[*]",
+            (
+                "CarePlan",
+                "DeviceRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ProcedureRequest",
+                "ReferralRequest",
+            ),
+        ),
+        ("Observation.context", ("Encounter", "EpisodeOfCare")),
+        ("Observation.device", ("Device", "DeviceMetric")),
+        ("Observation.identifier[*].assigner", ("Organization",)),
+        (
+            "Observation.performer[*]",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson"),
+        ),
+        (
+            "Observation.related[*].target",
+            ("Observation", "QuestionnaireResponse", "Sequence"),
+        ),
+        ("Observation.specimen", ("Specimen",)),
+        ("Observation.subject", ("Patient", "Group", "Device", "Location")),
+    ),
+    "OperationDefinition": (
+        ("OperationDefinition.base", ("OperationDefinition",)),
+        ("OperationDefinition.parameter[*].binding.valueSetReference", ("ValueSet",)),
+        ("OperationDefinition.parameter[*].profile", ("StructureDefinition",)),
+    ),
+    "Organization": (
+        ("Organization.endpoint[*]", ("Endpoint",)),
+        ("Organization.identifier[*].assigner", ("Organization",)),
+        ("Organization.partOf", ("Organization",)),
+    ),
+    "Parameters": (
+        (
+            "Parameters.parameter[*].valueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("Parameters.parameter[*].valueIdentifier.assigner", ("Organization",)),
+        ("Parameters.parameter[*].valueReference", None),
+        (
+            "Parameters.parameter[*].valueSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "Parameters.parameter[*].valueSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+    ),
+    "Patient": (
+        ("Patient.contact[*].organization", ("Organization",)),
+        ("Patient.generalPractitioner[*]", ("Organization", "Practitioner")),
+        ("Patient.identifier[*].assigner", ("Organization",)),
+        ("Patient.link[*].other", ("Patient", "RelatedPerson")),
+        ("Patient.managingOrganization", ("Organization",)),
+    ),
+    "PaymentNotice": (
+        ("PaymentNotice.identifier[*].assigner", ("Organization",)),
+        ("PaymentNotice.organization", ("Organization",)),
+        ("PaymentNotice.provider", ("Practitioner",)),
+        ("PaymentNotice.request", ("Resource",)),
+        ("PaymentNotice.response", ("Resource",)),
+        ("PaymentNotice.target", ("Organization",)),
+    ),
+    "PaymentReconciliation": (
+        ("PaymentReconciliation.detail[*].payee", ("Organization",)),
+        ("PaymentReconciliation.detail[*].request", ("Resource",)),
+        ("PaymentReconciliation.detail[*].response", ("Resource",)),
+        ("PaymentReconciliation.detail[*].submitter", ("Organization",)),
+        ("PaymentReconciliation.identifier[*].assigner", ("Organization",)),
+        ("PaymentReconciliation.organization", ("Organization",)),
+        ("PaymentReconciliation.request", ("ProcessRequest",)),
+        ("PaymentReconciliation.requestOrganization", ("Organization",)),
+        ("PaymentReconciliation.requestProvider", ("Practitioner",)),
+    ),
+    "Person": (
+        ("Person.identifier[*].assigner", ("Organization",)),
+        (
+            "Person.link[*].target",
+            ("Patient", "Practitioner", "RelatedPerson", "Person"),
+        ),
+        ("Person.managingOrganization", ("Organization",)),
+    ),
+    "PlanDefinition": (
+        (
+            "PlanDefinition.action[*].definition",
+            ("ActivityDefinition", "PlanDefinition"),
+        ),
+        ("PlanDefinition.action[*].documentation[*].resource", ("Resource",)),
+        (
+            "PlanDefinition.action[*].input[*].codeFilter[*].valueSetReference",
+            ("ValueSet",),
+        ),
+        (
+            "PlanDefinition.action[*].output[*].codeFilter[*].valueSetReference",
+            ("ValueSet",),
+        ),
+        ("PlanDefinition.action[*].transform", ("StructureMap",)),
+        (
+            "PlanDefinition.action[*].triggerDefinition[*].eventData.codeFilter[*].valueSetReference",
+            ("ValueSet",),
+        ),
+        (
+            "PlanDefinition.action[*].triggerDefinition[*].eventTimingReference",
+            ("Schedule",),
+        ),
+        ("PlanDefinition.goal[*].documentation[*].resource", ("Resource",)),
+        ("PlanDefinition.identifier[*].assigner", ("Organization",)),
+        ("PlanDefinition.library[*]", ("Library",)),
+        ("PlanDefinition.relatedArtifact[*].resource", ("Resource",)),
+    ),
+    "Practitioner": (
+        ("Practitioner.identifier[*].assigner", ("Organization",)),
+        ("Practitioner.qualification[*].identifier[*].assigner", ("Organization",)),
+        ("Practitioner.qualification[*].issuer", ("Organization",)),
+    ),
+    "PractitionerRole": (
+        ("PractitionerRole.endpoint[*]", ("Endpoint",)),
+        ("PractitionerRole.healthcareService[*]", ("HealthcareService",)),
+        ("PractitionerRole.identifier[*].assigner", ("Organization",)),
+        ("PractitionerRole.location[*]", ("Location",)),
+        ("PractitionerRole.organization", ("Organization",)),
+        ("PractitionerRole.practitioner", ("Practitioner",)),
+    ),
+    "Procedure": (
+        ("Procedure.basedOn[*]", ("CarePlan", "ProcedureRequest", "ReferralRequest")),
+        ("Procedure.complicationDetail[*]", ("Condition",)),
+        ("Procedure.context", ("Encounter", "EpisodeOfCare")),
+        (
+            "Procedure.definition[*]",
+            ("PlanDefinition", "ActivityDefinition", "HealthcareService"),
+        ),
+        ("Procedure.focalDevice[*].manipulated", ("Device",)),
+        ("Procedure.identifier[*].assigner", ("Organization",)),
+        ("Procedure.location", ("Location",)),
+        (
+            "Procedure.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "Procedure.partOf[*]",
+            ("Procedure", "Observation", "MedicationAdministration"),
+        ),
+        (
+            "Procedure.performer[*].actor",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson", "Device"),
+        ),
+        ("Procedure.performer[*].onBehalfOf", ("Organization",)),
+        ("Procedure.reasonReference[*]", ("Condition", "Observation")),
+        ("Procedure.report[*]", ("DiagnosticReport",)),
+        ("Procedure.subject", ("Patient", "Group")),
+        ("Procedure.usedReference[*]", ("Device", "Medication", "Substance")),
+    ),
+    "ProcedureRequest": (
+        ("ProcedureRequest.basedOn[*]", ("Resource",)),
+        ("ProcedureRequest.context", ("Encounter", "EpisodeOfCare")),
+        ("ProcedureRequest.definition[*]", ("ActivityDefinition", "PlanDefinition")),
+        ("ProcedureRequest.identifier[*].assigner", ("Organization",)),
+        (
+            "ProcedureRequest.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "ProcedureRequest.performer",
+            (
+                "Practitioner",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+        ("ProcedureRequest.reasonReference[*]", ("Condition", "Observation")),
+        ("ProcedureRequest.relevantHistory[*]", ("Provenance",)),
+        ("ProcedureRequest.replaces[*]", ("Resource",)),
+        (
+            "ProcedureRequest.requester.agent",
+            ("Device", "Practitioner", "Organization"),
+        ),
+        ("ProcedureRequest.requester.onBehalfOf", ("Organization",)),
+        ("ProcedureRequest.requisition.assigner", ("Organization",)),
+        ("ProcedureRequest.specimen[*]", ("Specimen",)),
+        ("ProcedureRequest.subject", ("Patient", "Group", "Location", "Device")),
+        ("ProcedureRequest.supportingInfo[*]", ("Resource",)),
+    ),
+    "ProcessRequest": (
+        ("ProcessRequest.identifier[*].assigner", ("Organization",)),
+        ("ProcessRequest.organization", ("Organization",)),
+        ("ProcessRequest.provider", ("Practitioner",)),
+        ("ProcessRequest.request", ("Resource",)),
+        ("ProcessRequest.response", ("Resource",)),
+        ("ProcessRequest.target", ("Organization",)),
+    ),
+    "ProcessResponse": (
+        ("ProcessResponse.communicationRequest[*]", ("CommunicationRequest",)),
+        ("ProcessResponse.identifier[*].assigner", ("Organization",)),
+        ("ProcessResponse.organization", ("Organization",)),
+        ("ProcessResponse.request", ("Resource",)),
+        ("ProcessResponse.requestOrganization", ("Organization",)),
+        ("ProcessResponse.requestProvider", ("Practitioner",)),
+    ),
+    "Provenance": (
+        (
+            "Provenance.agent[*].onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "Provenance.agent[*].whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "Provenance.entity[*].agent[*].onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "Provenance.entity[*].agent[*].whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        ("Provenance.entity[*].whatIdentifier.assigner", ("Organization",)),
+        ("Provenance.entity[*].whatReference", ("Resource",)),
+        ("Provenance.location", ("Location",)),
+        (
+            "Provenance.signature[*].onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "Provenance.signature[*].whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        ("Provenance.target[*]", ("Resource",)),
+    ),
+    "Questionnaire": (
+        ("Questionnaire.identifier[*].assigner", ("Organization",)),
+        ("Questionnaire.item[*].enableWhen[*].answerReference", ("Resource",)),
+        ("Questionnaire.item[*].initialReference", ("Resource",)),
+        ("Questionnaire.item[*].options", ("ValueSet",)),
+    ),
+    "QuestionnaireResponse": (
+        (
+            "QuestionnaireResponse.author",
+            ("Device", "Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "QuestionnaireResponse.basedOn[*]",
+            ("ReferralRequest", "CarePlan", "ProcedureRequest"),
+        ),
+        ("QuestionnaireResponse.context", ("Encounter", "EpisodeOfCare")),
+        ("QuestionnaireResponse.identifier.assigner", ("Organization",)),
+        ("QuestionnaireResponse.item[*].answer[*].valueReference", ("Resource",)),
+        ("QuestionnaireResponse.item[*].subject", ("Resource",)),
+        ("QuestionnaireResponse.parent[*]", ("Observation", "Procedure")),
+        ("QuestionnaireResponse.questionnaire", ("Questionnaire",)),
+        ("QuestionnaireResponse.source", ("Patient", "Practitioner", "RelatedPerson")),
+        ("QuestionnaireResponse.subject", ("Resource",)),
+    ),
+    "ReferralRequest": (
+        (
+            "ReferralRequest.basedOn[*]",
+            ("ReferralRequest", "CarePlan", "ProcedureRequest"),
+        ),
+        ("ReferralRequest.context", ("Encounter", "EpisodeOfCare")),
+        ("ReferralRequest.definition[*]", ("ActivityDefinition", "PlanDefinition")),
+        ("ReferralRequest.groupIdentifier.assigner", ("Organization",)),
+        ("ReferralRequest.identifier[*].assigner", ("Organization",)),
+        (
+            "ReferralRequest.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("ReferralRequest.reasonReference[*]", ("Condition", "Observation")),
+        (
+            "ReferralRequest.recipient[*]",
+            ("Practitioner", "Organization", "HealthcareService"),
+        ),
+        ("ReferralRequest.relevantHistory[*]", ("Provenance",)),
+        ("ReferralRequest.replaces[*]", ("ReferralRequest",)),
+        (
+            "ReferralRequest.requester.agent",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson", "Device"),
+        ),
+        ("ReferralRequest.requester.onBehalfOf", ("Organization",)),
+        ("ReferralRequest.subject", ("Patient", "Group")),
+        ("ReferralRequest.supportingInfo[*]", ("Resource",)),
+    ),
+    "RelatedPerson": (
+        ("RelatedPerson.identifier[*].assigner", ("Organization",)),
+        ("RelatedPerson.patient", ("Patient",)),
+    ),
+    "RequestGroup": (
+        ("RequestGroup.action[*].documentation[*].resource", ("Resource",)),
+        (
+            "RequestGroup.action[*].participant[*]",
+            ("Patient", "Person", "Practitioner", "RelatedPerson"),
+        ),
+        ("RequestGroup.action[*].resource", ("Resource",)),
+        ("RequestGroup.author", ("Device", "Practitioner")),
+        ("RequestGroup.basedOn[*]", ("Resource",)),
+        ("RequestGroup.context", ("Encounter", "EpisodeOfCare")),
+        ("RequestGroup.definition[*]", ("Resource",)),
+        ("RequestGroup.groupIdentifier.assigner", ("Organization",)),
+        ("RequestGroup.identifier[*].assigner", ("Organization",)),
+        (
+            "RequestGroup.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("RequestGroup.reasonReference", ("Resource",)),
+        ("RequestGroup.replaces[*]", ("Resource",)),
+        ("RequestGroup.subject", ("Patient", "Group")),
+    ),
+    "ResearchStudy": (
+        ("ResearchStudy.enrollment[*]", ("Group",)),
+        ("ResearchStudy.identifier[*].assigner", ("Organization",)),
+        (
+            "ResearchStudy.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("ResearchStudy.partOf[*]", ("ResearchStudy",)),
+        ("ResearchStudy.principalInvestigator", ("Practitioner",)),
+        ("ResearchStudy.protocol[*]", ("PlanDefinition",)),
+        ("ResearchStudy.relatedArtifact[*].resource", ("Resource",)),
+        ("ResearchStudy.site[*]", ("Location",)),
+        ("ResearchStudy.sponsor", ("Organization",)),
+    ),
+    "ResearchSubject": (
+        ("ResearchSubject.consent", ("Consent",)),
+        ("ResearchSubject.identifier.assigner", ("Organization",)),
+        ("ResearchSubject.individual", ("Patient",)),
+        ("ResearchSubject.study", ("ResearchStudy",)),
+    ),
+    "RiskAssessment": (
+        ("RiskAssessment.basedOn", ("Resource",)),
+        ("RiskAssessment.basis[*]", ("Resource",)),
+        ("RiskAssessment.condition", ("Condition",)),
+        ("RiskAssessment.context", ("Encounter", "EpisodeOfCare")),
+        ("RiskAssessment.identifier.assigner", ("Organization",)),
+        ("RiskAssessment.parent", ("Resource",)),
+        ("RiskAssessment.performer", ("Practitioner", "Device")),
+        ("RiskAssessment.reasonReference", ("Resource",)),
+        ("RiskAssessment.subject", ("Patient", "Group")),
+    ),
+    "Schedule": (
+        (
+            "Schedule.actor[*]",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        ("Schedule.identifier[*].assigner", ("Organization",)),
+    ),
+    "SearchParameter": (
+        ("SearchParameter.component[*].definition", ("SearchParameter",)),
+    ),
+    "Sequence": (
+        ("Sequence.device", ("Device",)),
+        ("Sequence.identifier[*].assigner", ("Organization",)),
+        ("Sequence.patient", ("Patient",)),
+        ("Sequence.performer", ("Organization",)),
+        ("Sequence.pointer[*]", ("Sequence",)),
+        ("Sequence.referenceSeq.referenceSeqPointer", ("Sequence",)),
+        ("Sequence.specimen", ("Specimen",)),
+        ("Sequence.variant[*].variantPointer", ("Observation",)),
+    ),
+    "ServiceDefinition": (
+        (
+            "ServiceDefinition.dataRequirement[*].codeFilter[*].valueSetReference",
+            ("ValueSet",),
+        ),
+        ("ServiceDefinition.identifier[*].assigner", ("Organization",)),
+        ("ServiceDefinition.operationDefinition", ("OperationDefinition",)),
+        ("ServiceDefinition.relatedArtifact[*].resource", ("Resource",)),
+        (
+            "ServiceDefinition.trigger[*].eventData.codeFilter[*].valueSetReference",
+            ("ValueSet",),
+        ),
+        ("ServiceDefinition.trigger[*].eventTimingReference", ("Schedule",)),
+    ),
+    "Slot": (
+        ("Slot.identifier[*].assigner", ("Organization",)),
+        ("Slot.schedule", ("Schedule",)),
+    ),
+    "Specimen": (
+        ("Specimen.accessionIdentifier.assigner", ("Organization",)),
+        ("Specimen.collection.collector", ("Practitioner",)),
+        ("Specimen.container[*].additiveReference", ("Substance",)),
+        ("Specimen.container[*].identifier[*].assigner", ("Organization",)),
+        ("Specimen.identifier[*].assigner", ("Organization",)),
+        (
+            "Specimen.note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("Specimen.parent[*]", ("Specimen",)),
+        ("Specimen.processing[*].additive[*]", ("Substance",)),
+        ("Specimen.request[*]", ("ProcedureRequest",)),
+        ("Specimen.subject", ("Patient", "Group", "Device", "Substance")),
+    ),
+    "StructureDefinition": (
+        (
+            "StructureDefinition.differential.element[*].binding.valueSetReference",
+            ("ValueSet",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.differential.element[*].defaultValueReference", None),
+        (
+            "StructureDefinition.differential.element[*].defaultValueSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.differential.element[*].example[*].valueReference", None),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.differential.element[*].fixedReference", None),
+        (
+            "StructureDefinition.differential.element[*].fixedSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.differential.element[*].patternReference", None),
+        (
+            "StructureDefinition.differential.element[*].patternSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        ("StructureDefinition.identifier[*].assigner", ("Organization",)),
+        (
+            "StructureDefinition.snapshot.element[*].binding.valueSetReference",
+            ("ValueSet",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.snapshot.element[*].defaultValueReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.snapshot.element[*].example[*].valueReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.snapshot.element[*].fixedReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].fixedSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.snapshot.element[*].patternReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].patternSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+    ),
+    "StructureMap": (
+        (
+            "StructureMap.group[*].rule[*].source[*].defaultValueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        (
+            "StructureMap.group[*].rule[*].source[*].defaultValueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureMap.group[*].rule[*].source[*].defaultValueReference", None),
+        (
+            "StructureMap.group[*].rule[*].source[*].defaultValueSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "StructureMap.group[*].rule[*].source[*].defaultValueSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        ("StructureMap.identifier[*].assigner", ("Organization",)),
+    ),
+    "Substance": (
+        ("Substance.identifier[*].assigner", ("Organization",)),
+        ("Substance.ingredient[*].substanceReference", ("Substance",)),
+        ("Substance.instance[*].identifier.assigner", ("Organization",)),
+    ),
+    "SupplyDelivery": (
+        ("SupplyDelivery.basedOn[*]", ("SupplyRequest",)),
+        ("SupplyDelivery.destination", ("Location",)),
+        ("SupplyDelivery.identifier.assigner", ("Organization",)),
+        ("SupplyDelivery.partOf[*]", ("SupplyDelivery", "Contract")),
+        ("SupplyDelivery.patient", ("Patient",)),
+        ("SupplyDelivery.receiver[*]", ("Practitioner",)),
+        (
+            "SupplyDelivery.suppliedItem.itemReference",
+            ("Medication", "Substance", "Device"),
+        ),
+        ("SupplyDelivery.supplier", ("Practitioner", "Organization")),
+    ),
+    "SupplyRequest": (
+        ("SupplyRequest.deliverFrom", ("Organization", "Location")),
+        ("SupplyRequest.deliverTo", ("Organization", "Location", "Patient")),
+        ("SupplyRequest.identifier.assigner", ("Organization",)),
+        (
+            "SupplyRequest.orderedItem.itemReference",
+            ("Medication", "Substance", "Device"),
+        ),
+        ("SupplyRequest.reasonReference", ("Resource",)),
+        (
+            "SupplyRequest.requester.agent",
+            ("Practitioner", "Organization", "Patient", "RelatedPerson", "Device"),
+        ),
+        ("SupplyRequest.requester.onBehalfOf", ("Organization",)),
+        ("SupplyRequest.supplier[*]", ("Organization",)),
+    ),
+    "Task": (
+        ("Task.basedOn[*]", ("Resource",)),
+        ("Task.context", ("Encounter", "EpisodeOfCare")),
+        ("Task.definitionReference", ("ActivityDefinition",)),
+        ("Task.focus", ("Resource",)),
+        ("Task.for", ("Resource",)),
+        ("Task.groupIdentifier.assigner", ("Organization",)),
+        ("Task.identifier[*].assigner", ("Organization",)),
+        (
+            "Task.input[*].valueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("Task.input[*].valueIdentifier.assigner", ("Organization",)),
+        ("Task.input[*].valueReference", None),
+        (
+            "Task.input[*].valueSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "Task.input[*].valueSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        ("Task.note[*].authorReference", ("Practitioner", "Patient", "RelatedPerson")),
+        (
+            "Task.output[*].valueAnnotation.authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("Task.output[*].valueIdentifier.assigner", ("Organization",)),
+        ("Task.output[*].valueReference", None),
+        (
+            "Task.output[*].valueSignature.onBehalfOfReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "Task.output[*].valueSignature.whoReference",
+            ("Practitioner", "RelatedPerson", "Patient", "Device", "Organization"),
+        ),
+        (
+            "Task.owner",
+            ("Device", "Organization", "Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("Task.partOf[*]", ("Task",)),
+        ("Task.relevantHistory[*]", ("Provenance",)),
+        (
+            "Task.requester.agent",
+            ("Device", "Organization", "Patient", "Practitioner", "RelatedPerson"),
+        ),
+        ("Task.requester.onBehalfOf", ("Organization",)),
+        (
+            "Task.restriction.recipient[*]",
+            ("Patient", "Practitioner", "RelatedPerson", "Group", "Organization"),
+        ),
+    ),
+    "TestReport": (
+        ("TestReport.identifier.assigner", ("Organization",)),
+        ("TestReport.testScript", ("TestScript",)),
+    ),
+    "TestScript": (
+        ("TestScript.fixture[*].resource", ("Resource",)),
+        ("TestScript.identifier.assigner", ("Organization",)),
+        ("TestScript.metadata.capability[*].capabilities", ("CapabilityStatement",)),
+        ("TestScript.profile[*]", ("Resource",)),
+        ("TestScript.rule[*].resource", ("Resource",)),
+        ("TestScript.ruleset[*].resource", ("Resource",)),
+    ),
+    "ValueSet": (("ValueSet.identifier[*].assigner", ("Organization",)),),
+    "VisionPrescription": (
+        (
+            "VisionPrescription.dispense[*].note[*].authorReference",
+            ("Practitioner", "Patient", "RelatedPerson"),
+        ),
+        ("VisionPrescription.encounter", ("Encounter",)),
+        ("VisionPrescription.identifier[*].assigner", ("Organization",)),
+        ("VisionPrescription.patient", ("Patient",)),
+        ("VisionPrescription.prescriber", ("Practitioner",)),
+        ("VisionPrescription.reasonReference", ("Condition",)),
+    ),
+}
+
+__all__ = ["REFERENCE_FIELDS", "REFERENCE_PATHS"]
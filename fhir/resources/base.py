@@ -7,7 +7,9 @@ Version: 5.0.0
 Build ID: 2aecd53
 Last updated: 2023-03-26T15:21:02.749+11:00
 """
-from fhir_core import fhirabstractmodel
+from pydantic import ConfigDict
+
+from . import fhirabstractmodel
 
 
 class Base(fhirabstractmodel.FHIRAbstractModel):
@@ -21,6 +23,10 @@ class Base(fhirabstractmodel.FHIRAbstractModel):
 
     __resource_type__ = "Base"
 
+    # Core schemas are built on first validation, not at import time, so a
+    # module holding dozens of backbone elements only pays for those in use.
+    model_config = ConfigDict(defer_build=True)
+
     @classmethod
     def elements_sequence(cls):
         """returning all elements names from
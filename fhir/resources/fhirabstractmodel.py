@@ -0,0 +1,522 @@
+from __future__ import annotations as _annotations
+
+import types
+import typing
+from functools import lru_cache
+from types import MappingProxyType
+
+import typing_extensions
+from fhir_core import fhirabstractmodel
+from fhir_core.constraints import HAS_XML_SUPPORT, HAS_YAML_SUPPORT
+from fhir_core.fhirabstractmodel import FHIR_COMMENTS_FIELD_NAME
+from fhir_core.types import FhirBase
+from fhir_core.utils import is_list_type, is_primitive_type
+from pydantic import SerializationInfo, model_validator
+from pydantic.fields import FieldInfo
+from pydantic_core import InitErrorDetails, PydanticCustomError, ValidationError
+
+if typing.TYPE_CHECKING:
+    from pydantic.main import TupleGenerator
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+_UNION_TYPES = (typing.Union, getattr(types, "UnionType", typing.Union))
+
+
+class FHIRElementMetadata(typing.NamedTuple):
+    """One entry of ``elements_sequence``."""
+
+    name: str
+    field_key: str
+    field_info: FieldInfo
+    alias: typing.Optional[str]
+    is_primitive: bool
+    is_summary: bool
+    # the ``<field>__ext`` sibling of primitives
+    ext_key: str
+    ext_alias: typing.Optional[str]
+    # complex types: the model class (of the items for a list)
+    model_klass: typing.Optional[typing.Type[fhirabstractmodel.FHIRAbstractModel]]
+    is_list: bool
+
+
+class FHIRModelMetadata(typing.NamedTuple):
+    """Frozen per class tables, built once from the generated field metadata
+    (``elements_sequence``, ``get_one_of_many_fields``, ``get_required_fields``
+    and ``json_schema_extra``)."""
+
+    elements: typing.Tuple[FHIRElementMetadata, ...]
+    # element name -> field name
+    alias_index: typing.Mapping[str, str]
+    # choice (``value[x]``) groups: {prefix: (fields, required)}
+    one_of_many: typing.Mapping[str, typing.Tuple[typing.Tuple[str, ...], bool]]
+    # concrete choice field name (``valueQuantity`` ...) -> prefix
+    choice_index: typing.Mapping[str, str]
+    # (field name, ext field name, alias)
+    required: typing.Tuple[
+        typing.Tuple[str, typing.Optional[str], typing.Optional[str]], ...
+    ]
+    # lists of complex types, where a null item is an error:
+    # {key: (field alias, field position)}
+    complex_list_keys: typing.Mapping[str, typing.Tuple[str, int]]
+
+
+def get_field_item_type(annotation: typing.Any) -> typing.Tuple[typing.Any, bool]:
+    """``(item type, is list)`` of a generated field annotation: ``X``,
+    ``X | None``, ``List[X]`` (required lists) or ``List[X] | None``.
+    ``(None, False)`` for ``fhir_comments`` (``str | List[str]``).
+
+    >>> get_field_item_type(Patient.model_fields["name"].annotation)
+    (HumanNameType, True)
+    """
+    if typing.get_origin(annotation) in _UNION_TYPES:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None, False
+        (annotation,) = args
+    if typing.get_origin(annotation) is list:
+        return typing.get_args(annotation)[0], True
+    return annotation, False
+
+
+def get_field_model_klass(
+    annotation: typing.Any,
+) -> typing.Tuple[
+    typing.Optional[typing.Type[fhirabstractmodel.FHIRAbstractModel]], bool
+]:
+    """``(model class, is list)`` of a complex field annotation (the class of
+    the items for a list), ``(None, False)`` for primitives.
+
+    >>> get_field_model_klass(Patient.model_fields["name"].annotation)
+    (HumanName, True)
+    """
+    item_type, is_list = get_field_item_type(annotation)
+    if isinstance(item_type, type) and issubclass(item_type, FhirBase):
+        return item_type.get_model_klass(), is_list
+    return None, False
+
+
+def _present_choices(
+    obj: fhirabstractmodel.FHIRAbstractModel, choice_index: typing.Mapping[str, str]
+) -> typing.List[typing.Tuple[str, str]]:
+    """``(prefix, field name)`` of every choice field that has a value.
+
+    Only the fields that were set are looked at, not every variant of every
+    group (``Extension.value[x]`` alone has more than fifty).
+    """
+    values = obj.__dict__
+    fields_set = obj.__pydantic_fields_set__
+    if len(fields_set) > len(choice_index):
+        fields_set = choice_index  # type: ignore[assignment]
+    return [
+        (choice_index[name], name)
+        for name in fields_set
+        if name in choice_index and values.get(name) is not None
+    ]
+
+
+def get_choice_element(
+    obj: fhirabstractmodel.FHIRAbstractModel, prefix: str
+) -> typing.Optional[typing.Tuple[str, typing.Any]]:
+    """``(field name, value)`` of the choice element ``<prefix>[x]``, i.e.
+    ``("valueQuantity", Quantity(...))`` for ``prefix="value"``, ``None`` when
+    none is set.
+
+    >>> get_choice_element(extension, "value")
+    """
+    metadata = obj.__class__.get_fhir_metadata()  # type: ignore[attr-defined]
+    if prefix not in metadata.one_of_many:
+        raise ValueError(
+            f"{obj.__class__.__name__} has no choice element ``{prefix}[x]``, "
+            f"expected one of {list(metadata.one_of_many)}"
+        )
+    for group, name in _present_choices(obj, metadata.choice_index):
+        if group == prefix:
+            return name, obj.__dict__[name]
+    return None
+
+
+def get_choice_value(
+    obj: fhirabstractmodel.FHIRAbstractModel, prefix: str
+) -> typing.Any:
+    """Value of the choice element ``<prefix>[x]``, whichever its type is,
+    ``None`` when none is set.
+
+    >>> get_choice_value(extension, "value")
+    """
+    element = get_choice_element(obj, prefix)
+    return element[1] if element is not None else None
+
+
+class FHIRAbstractModel(fhirabstractmodel.FHIRAbstractModel):
+    """``fhir_core``'s abstract model, with validators and serializer reading
+    precomputed per class tables instead of walking the fields on every call."""
+
+    # opt-in check of the coded elements of every validated model, see
+    # ``fhir.resources.utils.bindings.enable_code_validation``
+    __fhir_code_validator__: typing.ClassVar[
+        typing.Optional[typing.Callable[[typing.Any], None]]
+    ] = None
+
+    @classmethod
+    @lru_cache(maxsize=None, typed=True)
+    def get_fhir_metadata(cls) -> FHIRModelMetadata:
+        """ """
+        model_fields = cls.model_fields
+        alias_mapping = cls.get_alias_mapping()
+        summary = frozenset(cls.summary_elements_sequence())
+
+        elements = list()
+        for name in cls.elements_sequence():
+            field_key = alias_mapping[name]
+            field_info = model_fields[field_key]
+            ext_key = f"{field_key}__ext"
+            ext_info = model_fields.get(ext_key)
+            model_klass, is_list = get_field_model_klass(field_info.annotation)
+            if model_klass is None:
+                is_list = get_field_item_type(field_info.annotation)[1]
+            elements.append(
+                FHIRElementMetadata(
+                    name=name,
+                    field_key=field_key,
+                    field_info=field_info,
+                    alias=field_info.alias,
+                    is_primitive=is_primitive_type(field_info),
+                    is_summary=name in summary,
+                    ext_key=ext_key,
+                    ext_alias=ext_info.alias if ext_info is not None else None,
+                    model_klass=model_klass,
+                    is_list=is_list,
+                )
+            )
+
+        # the generated methods don't depend on the instance state
+        sample = cls.model_construct()
+        one_of_many = dict()
+        choice_index = dict()
+        for prefix, fields in sample.get_one_of_many_fields().items():
+            json_schema_extra = model_fields[fields[0]].json_schema_extra
+            assert json_schema_extra["one_of_many"] == prefix  # type: ignore
+            required = json_schema_extra["one_of_many_required"] is True  # type: ignore
+            one_of_many[prefix] = (tuple(fields), required)
+            for field in fields:
+                choice_index[field] = prefix
+        required_fields = tuple(
+            (
+                alias_mapping[name],
+                ext,
+                model_fields[alias_mapping[name]].alias,
+            )
+            for name, ext in sample.get_required_fields()
+        )
+
+        complex_list_keys = dict()
+        for position, (name, field_info) in enumerate(model_fields.items()):
+            # ``<name>__ext`` lists are the extension siblings of primitive
+            # arrays; their nulls are positional placeholders.
+            if (
+                not is_list_type(field_info)
+                or is_primitive_type(field_info)
+                or name.endswith("__ext")
+            ):
+                continue
+            alias = field_info.alias or name
+            complex_list_keys[name] = complex_list_keys[alias] = (alias, position)
+
+        return FHIRModelMetadata(
+            elements=tuple(elements),
+            alias_index=MappingProxyType(dict(alias_mapping)),
+            one_of_many=MappingProxyType(one_of_many),
+            choice_index=MappingProxyType(choice_index),
+            required=required_fields,
+            complex_list_keys=MappingProxyType(complex_list_keys),
+        )
+
+    @model_validator(mode="before")
+    @classmethod
+    def reject_null_complex_elements(cls, data: typing.Any) -> typing.Any:
+        """A null inside a list of complex types has no meaning in FHIR.
+
+        Primitive lists keep their nulls: there a null is the positional
+        placeholder that lines a value up with its ``_field`` extension sibling.
+        """
+        if not isinstance(data, dict):
+            return data
+        complex_list_keys = cls.get_fhir_metadata().complex_list_keys
+        errors: typing.List[typing.Tuple[int, InitErrorDetails]] = []
+        for key, value in data.items():
+            if key not in complex_list_keys or not isinstance(value, list):
+                continue
+            alias, position = complex_list_keys[key]
+            # by field name, only when the alias is not given as well
+            if key != alias and alias in data:
+                continue
+            if any(item is None for item in value):
+                errors.append(
+                    (
+                        position,
+                        {
+                            "type": PydanticCustomError(
+                                "list_type",
+                                "None is not allowed as an element of {field}",
+                                {"field": key},
+                            ),
+                            "loc": (key,),
+                            "input": value,
+                        },
+                    )
+                )
+        if errors:
+            # in field order, whatever the order of the input
+            errors.sort(key=lambda error: error[0])
+            raise ValidationError.from_exception_data(
+                cls.__name__, [error for _, error in errors]
+            )
+        return data
+
+    @model_validator(mode="after")
+    def validate_codes(self) -> typing.Any:
+        """Enforce ``enum_values`` and required bindings, only while a code
+        validator is enabled."""
+        validator = self.__fhir_code_validator__
+        if validator is not None:
+            validator(self)
+        return self
+
+    def model_dump_json(
+        self,
+        *,
+        indent: typing.Optional[int] = None,
+        exclude_comments: bool = False,
+        summary_only: bool = False,
+        **pydantic_kwargs,
+    ) -> str:
+        """JSON written from the emit plan of the class by the default
+        backend, the same output as pydantic's. Other pydantic parameters
+        go through ``fhir_core``. See ``fhir.resources.utils.jsonwriter.json_dumps``"""
+        if (
+            exclude_comments is None
+            or summary_only is None
+            or any(
+                key not in ("by_alias", "exclude_none") or value not in (None, True)
+                for key, value in pydantic_kwargs.items()
+            )
+        ):
+            return super().model_dump_json(
+                indent=indent,
+                exclude_comments=exclude_comments,
+                summary_only=summary_only,
+                **pydantic_kwargs,
+            )
+        from .utils.jsonwriter import json_dumps
+
+        return json_dumps(
+            self,
+            indent=indent,
+            exclude_comments=exclude_comments,
+            summary_only=summary_only,
+        ).decode("utf-8")
+
+    def model_dump_yaml(
+        self,
+        *,
+        indent: typing.Optional[int] = None,
+        exclude_comments: bool = False,
+        summary_only: bool = False,
+        **pydantic_kwargs,
+    ) -> str:
+        """YAML through PyYAML's safe (libyaml when available) dumper.
+        See ``fhir.resources.utils.yaml.yaml_dumps``"""
+        if not HAS_YAML_SUPPORT:
+            raise ModuleNotFoundError(
+                "You need to install ``PyYAML`` package to use this method. "
+            )
+        from .utils.yaml import yaml_dumps
+
+        return yaml_dumps(
+            self,
+            indent=indent,
+            exclude_comments=exclude_comments,
+            summary_only=summary_only,
+            **pydantic_kwargs,
+        )
+
+    @classmethod
+    def model_validate_yaml(
+        cls,
+        yaml_data: typing.Union[str, bytes, bytearray],
+        *,
+        strict: typing.Optional[bool] = None,
+        context: typing.Optional[typing.Any] = None,
+    ) -> typing_extensions.Self:
+        """Validate YAML, read by PyYAML's safe (libyaml when available)
+        loader. See ``fhir.resources.utils.yaml.yaml_loads``"""
+        if not HAS_YAML_SUPPORT:
+            raise ModuleNotFoundError(
+                "You need to install ``PyYAML`` package to use this method. "
+            )
+        from .utils.yaml import yaml_loads
+
+        return yaml_loads(  # type: ignore[return-value]
+            yaml_data, cls, strict=strict, context=context
+        )
+
+    def model_dump_xml(  # type: ignore[override]
+        self,
+        *,
+        pretty_print: bool = False,
+        xml_declaration: bool = True,
+        exclude_comments: bool = False,
+        summary_only: bool = False,
+        **pydantic_kwargs,
+    ) -> bytes:
+        """FHIR XML, written straight from the model in ``elements_sequence``
+        order. See ``fhir.resources.utils.xml.xml_dumps``"""
+        if not HAS_XML_SUPPORT:
+            raise ModuleNotFoundError(
+                "You need to install ``lxml`` package to use this method. "
+            )
+        from .utils.xml import xml_dumps
+
+        return xml_dumps(
+            self,
+            pretty_print=pretty_print,
+            xml_declaration=xml_declaration,
+            exclude_comments=exclude_comments,
+            summary_only=summary_only,
+        )
+
+    @classmethod
+    def model_validate_xml(
+        cls,
+        xml_data: typing.Union[str, bytes, bytearray],
+        *,
+        strict: typing.Optional[bool] = None,
+        context: typing.Optional[typing.Any] = None,
+        xmlparser: typing.Optional[typing.Any] = None,
+    ) -> typing_extensions.Self:
+        """Validate FHIR XML, read by lxml ``iterparse`` into a single
+        ``model_validate``. See ``fhir.resources.utils.xml.xml_loads``"""
+        if not HAS_XML_SUPPORT:
+            raise ModuleNotFoundError(
+                "You need to install ``lxml`` package to use this method. "
+            )
+        from .utils.xml import xml_loads
+
+        return xml_loads(  # type: ignore[return-value]
+            xml_data, cls, xmlparser=xmlparser, strict=strict, context=context
+        )
+
+    def _validate_one_of_many(self):
+        """https://www.hl7.org/fhir/formats.html#choice
+        See ``fhir_core.fhirabstractmodel.FHIRAbstractModel._validate_one_of_many``
+        """
+        metadata = self.__class__.get_fhir_metadata()
+        if not metadata.one_of_many:
+            return
+        found = [prefix for prefix, _ in _present_choices(self, metadata.choice_index)]
+        for prefix, (fields, required) in metadata.one_of_many.items():
+            if required is False and not found:
+                continue
+            count = found.count(prefix)
+            if count > 1:
+                raise ValueError(
+                    "Any of one field value is expected from "
+                    f"this list {list(fields)}, but got multiple!"
+                )
+            if required is True and count == 0:
+                raise ValueError(
+                    f"Expect any of field value from this list {list(fields)}."
+                )
+
+    def _validate_required_primitive_elements(self):
+        """https://www.hl7.org/fhir/extensibility.html#Special-Case
+        See ``fhir_core.fhirabstractmodel.FHIRAbstractModel.
+        _validate_required_primitive_elements``
+        """
+        required = self.__class__.get_fhir_metadata().required
+        if not required:
+            return
+        values = self.__dict__
+        errors: typing.List[InitErrorDetails] = list()
+        for field_key, ext, alias in required:
+            value = values.get(field_key)
+            if value is not None:
+                continue
+            ext_value = values.get(ext) if ext is not None else None
+            missing_ext = True
+            if ext_value is not None:
+                if isinstance(ext_value, dict):
+                    missing_ext = len(ext_value.get("extension", [])) == 0
+                elif ext_value.extension and len(ext_value.extension) > 0:
+                    missing_ext = False
+            if missing_ext:
+                errors.append(
+                    {
+                        "type": PydanticCustomError(
+                            "model_field_validation.missing",
+                            "Value for the field '{field_name}' is required.",
+                            {"field_name": alias},
+                        ),
+                        "loc": (alias,),  # type: ignore
+                        "input": value,
+                    }
+                )
+        if len(errors) > 0:
+            raise ValidationError.from_exception_data(self.__class__.__name__, errors)  # type: ignore
+
+    def _fhir_iter(
+        self,
+        serialize: typing.Callable[[typing.Any], typing.Any],
+        info: SerializationInfo,
+    ) -> "TupleGenerator":
+        """See ``fhir_core.fhirabstractmodel.FHIRAbstractModel._fhir_iter``"""
+        klass = self.__class__
+        if klass.has_resource_base():
+            yield "resourceType", self.__resource_type__
+
+        values = self.__dict__
+        summary_only = self.__fhir_serialization_summary_only__
+        by_alias = info.by_alias
+        keep_none = info.exclude_none is False
+        for element in klass.get_fhir_metadata().elements:
+            if summary_only and not element.is_summary:
+                # we are ignoring a non-summary element
+                continue
+
+            value = values.get(element.field_key, None)
+            if value is not None:
+                if element.is_primitive:
+                    value = self._serialize_primitive_value(value, element.field_info)
+                else:
+                    value = self._serialize_non_primitive_value(value, serialize, info)
+            if value is not None or keep_none:
+                yield (by_alias and element.alias or element.field_key), value
+
+            # xxx: we are intentionally ignoring any primitive type extension
+            # even if the main primitive field doesn't have value.
+            if element.is_primitive and not summary_only:
+                ext_val = values.get(element.ext_key, None)
+                if ext_val is not None:
+                    ext_val = self._serialize_non_primitive_value(
+                        ext_val, serialize, info
+                    )
+                if ext_val is not None and len(ext_val) > 0:
+                    yield (by_alias and element.ext_alias or element.ext_key), ext_val
+
+        if not summary_only:
+            comments = values.get(FHIR_COMMENTS_FIELD_NAME, None)
+            if comments is not None and not self.__fhir_serialization_exclude_comment__:
+                yield FHIR_COMMENTS_FIELD_NAME, comments
+
+
+__all__ = [
+    "FHIRAbstractModel",
+    "FHIRElementMetadata",
+    "FHIRModelMetadata",
+    "get_choice_element",
+    "get_choice_value",
+    "get_field_item_type",
+    "get_field_model_klass",
+]
@@ -2,11 +2,10 @@ from __future__ import annotations as _annotations
 
 import typing
 
-from fhir_core import fhirabstractmodel
 from pydantic import Field, model_validator
 from pydantic_core import PydanticCustomError
 
-from . import fhirtypes
+from . import fhirabstractmodel, fhirtypes
 
 __author__ = "Md Nazrul Islam"
 __email__ = "email2nazrul@gmail.com"
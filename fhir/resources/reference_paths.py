@@ -0,0 +1,12459 @@
+from __future__ import annotations as _annotations
+
+import typing
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+# Generated by ``script/generate.py``, see ``write_reference_paths``.
+#
+# The fields of every model class that lead to a ``Reference``, extensions
+# left out: ``{class name: ((field name, element name, is list, kind, target
+# types), ...)}``. ``kind`` is one of ``reference``, ``codeable`` (a
+# ``CodeableReference``), ``resource`` (a resource of any type, i.e.
+# ``contained``) or ``element`` (a complex element with references inside).
+ReferenceField = typing.Tuple[
+    str, str, bool, str, typing.Optional[typing.Tuple[str, ...]]
+]
+
+REFERENCE_FIELDS: typing.Dict[str, typing.Tuple[ReferenceField, ...]] = {
+    "Account": (
+        ("contained", "contained", True, "resource", None),
+        ("coverage", "coverage", True, "element", None),
+        ("diagnosis", "diagnosis", True, "element", None),
+        ("guarantor", "guarantor", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("owner", "owner", False, "reference", ("Organization",)),
+        ("procedure", "procedure", True, "element", None),
+        ("relatedAccount", "relatedAccount", True, "element", None),
+        (
+            "subject",
+            "subject",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Device",
+                "Practitioner",
+                "PractitionerRole",
+                "Location",
+                "HealthcareService",
+                "Organization",
+            ),
+        ),
+    ),
+    "AccountCoverage": (("coverage", "coverage", False, "reference", ("Coverage",)),),
+    "AccountDiagnosis": (
+        ("condition", "condition", False, "codeable", ("Condition",)),
+    ),
+    "AccountGuarantor": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson", "Organization"),
+        ),
+    ),
+    "AccountProcedure": (
+        ("code", "code", False, "codeable", ("Procedure",)),
+        ("device", "device", True, "reference", ("Device",)),
+    ),
+    "AccountRelatedAccount": (
+        ("account", "account", False, "reference", ("Account",)),
+    ),
+    "ActivityDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "codeable", ("Location",)),
+        ("participant", "participant", True, "element", None),
+        (
+            "productReference",
+            "productReference",
+            False,
+            "reference",
+            ("Medication", "Ingredient", "Substance", "SubstanceDefinition"),
+        ),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        (
+            "subjectReference",
+            "subjectReference",
+            False,
+            "reference",
+            (
+                "Group",
+                "MedicinalProductDefinition",
+                "SubstanceDefinition",
+                "AdministrableProductDefinition",
+                "ManufacturedItemDefinition",
+                "PackagedProductDefinition",
+            ),
+        ),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "ActivityDefinitionParticipant": (
+        (
+            "typeReference",
+            "typeReference",
+            False,
+            "reference",
+            (
+                "CareTeam",
+                "Device",
+                "DeviceDefinition",
+                "Endpoint",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "ActorDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "AdministrableProductDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("device", "device", False, "reference", ("DeviceDefinition",)),
+        ("formOf", "formOf", True, "reference", ("MedicinalProductDefinition",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "producedFrom",
+            "producedFrom",
+            True,
+            "reference",
+            ("ManufacturedItemDefinition",),
+        ),
+        ("property", "property", True, "element", None),
+    ),
+    "AdministrableProductDefinitionProperty": (
+        ("valueReference", "valueReference", False, "reference", ("Binary",)),
+    ),
+    "AdverseEvent": (
+        ("contained", "contained", True, "resource", None),
+        ("contributingFactor", "contributingFactor", True, "element", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("mitigatingAction", "mitigatingAction", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("participant", "participant", True, "element", None),
+        ("preventiveAction", "preventiveAction", True, "element", None),
+        (
+            "recorder",
+            "recorder",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "ResearchSubject",
+            ),
+        ),
+        (
+            "resultingEffect",
+            "resultingEffect",
+            True,
+            "reference",
+            ("Condition", "Observation"),
+        ),
+        ("study", "study", True, "reference", ("ResearchStudy",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Practitioner", "RelatedPerson", "ResearchSubject"),
+        ),
+        ("supportingInfo", "supportingInfo", True, "element", None),
+        ("suspectEntity", "suspectEntity", True, "element", None),
+    ),
+    "AdverseEventContributingFactor": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            (
+                "Condition",
+                "Observation",
+                "AllergyIntolerance",
+                "FamilyMemberHistory",
+                "Immunization",
+                "Procedure",
+                "Device",
+                "DeviceUsage",
+                "DocumentReference",
+                "MedicationAdministration",
+                "MedicationStatement",
+            ),
+        ),
+    ),
+    "AdverseEventMitigatingAction": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            (
+                "Procedure",
+                "DocumentReference",
+                "MedicationAdministration",
+                "MedicationRequest",
+            ),
+        ),
+    ),
+    "AdverseEventParticipant": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "ResearchSubject",
+            ),
+        ),
+    ),
+    "AdverseEventPreventiveAction": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            (
+                "Immunization",
+                "Procedure",
+                "DocumentReference",
+                "MedicationAdministration",
+                "MedicationRequest",
+            ),
+        ),
+    ),
+    "AdverseEventSupportingInfo": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            (
+                "Condition",
+                "Observation",
+                "AllergyIntolerance",
+                "FamilyMemberHistory",
+                "Immunization",
+                "Procedure",
+                "DocumentReference",
+                "MedicationAdministration",
+                "MedicationStatement",
+                "QuestionnaireResponse",
+            ),
+        ),
+    ),
+    "AdverseEventSuspectEntity": (
+        ("causality", "causality", False, "element", None),
+        (
+            "instanceReference",
+            "instanceReference",
+            False,
+            "reference",
+            (
+                "Immunization",
+                "Procedure",
+                "Substance",
+                "Medication",
+                "MedicationAdministration",
+                "MedicationStatement",
+                "Device",
+                "BiologicallyDerivedProduct",
+                "ResearchStudy",
+            ),
+        ),
+    ),
+    "AdverseEventSuspectEntityCausality": (
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "ResearchSubject",
+            ),
+        ),
+    ),
+    "AllergyIntolerance": (
+        ("contained", "contained", True, "resource", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("participant", "participant", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("reaction", "reaction", True, "element", None),
+    ),
+    "AllergyIntoleranceParticipant": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+    ),
+    "AllergyIntoleranceReaction": (
+        ("manifestation", "manifestation", True, "codeable", ("Observation",)),
+        ("note", "note", True, "element", None),
+    ),
+    "Annotation": (
+        (
+            "authorReference",
+            "authorReference",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+    ),
+    "Appointment": (
+        ("contained", "contained", True, "resource", None),
+        ("account", "account", True, "reference", ("Account",)),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("CarePlan", "DeviceRequest", "MedicationRequest", "ServiceRequest"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "originatingAppointment",
+            "originatingAppointment",
+            False,
+            "reference",
+            ("Appointment",),
+        ),
+        ("participant", "participant", True, "element", None),
+        (
+            "patientInstruction",
+            "patientInstruction",
+            True,
+            "codeable",
+            ("DocumentReference", "Binary", "Communication"),
+        ),
+        (
+            "previousAppointment",
+            "previousAppointment",
+            False,
+            "reference",
+            ("Appointment",),
+        ),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            ("Condition", "Procedure", "Observation", "ImmunizationRecommendation"),
+        ),
+        ("replaces", "replaces", True, "reference", ("Appointment",)),
+        ("serviceType", "serviceType", True, "codeable", ("HealthcareService",)),
+        ("slot", "slot", True, "reference", ("Slot",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+        ("virtualService", "virtualService", True, "element", None),
+    ),
+    "AppointmentParticipant": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "Practitioner",
+                "PractitionerRole",
+                "CareTeam",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+    ),
+    "AppointmentResponse": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        ("appointment", "appointment", False, "reference", ("Appointment",)),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "ArtifactAssessment": (
+        ("contained", "contained", True, "resource", None),
+        ("artifactReference", "artifactReference", False, "reference", ("Resource",)),
+        ("citeAsReference", "citeAsReference", False, "reference", ("Citation",)),
+        ("content", "content", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "ArtifactAssessmentContent": (
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "PractitionerRole", "Organization", "Device"),
+        ),
+        ("component", "component", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+    ),
+    "AuditEvent": (
+        ("contained", "contained", True, "resource", None),
+        ("agent", "agent", True, "element", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "DeviceRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "Task",
+            ),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("entity", "entity", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("source", "source", False, "element", None),
+    ),
+    "AuditEventAgent": (
+        ("location", "location", False, "reference", ("Location",)),
+        ("networkReference", "networkReference", False, "reference", ("Endpoint",)),
+        (
+            "who",
+            "who",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "AuditEventEntity": (
+        ("agent", "agent", True, "element", None),
+        ("what", "what", False, "reference", ("Resource",)),
+    ),
+    "AuditEventSource": (
+        (
+            "observer",
+            "observer",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("site", "site", False, "reference", ("Location",)),
+    ),
+    "Basic": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+                "Device",
+                "CareTeam",
+            ),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("subject", "subject", False, "reference", ("Resource",)),
+    ),
+    "Binary": (
+        ("securityContext", "securityContext", False, "reference", ("Resource",)),
+    ),
+    "BiologicallyDerivedProduct": (
+        ("contained", "contained", True, "resource", None),
+        ("biologicalSourceEvent", "biologicalSourceEvent", False, "element", None),
+        ("collection", "collection", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("parent", "parent", True, "reference", ("BiologicallyDerivedProduct",)),
+        (
+            "processingFacility",
+            "processingFacility",
+            True,
+            "reference",
+            ("Organization",),
+        ),
+        ("request", "request", True, "reference", ("ServiceRequest",)),
+    ),
+    "BiologicallyDerivedProductCollection": (
+        (
+            "collector",
+            "collector",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("source", "source", False, "reference", ("Patient", "Organization")),
+    ),
+    "BiologicallyDerivedProductDispense": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("ServiceRequest",)),
+        ("destination", "destination", False, "reference", ("Location",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        (
+            "partOf",
+            "partOf",
+            True,
+            "reference",
+            ("BiologicallyDerivedProductDispense",),
+        ),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("performer", "performer", True, "element", None),
+        ("product", "product", False, "reference", ("BiologicallyDerivedProduct",)),
+    ),
+    "BiologicallyDerivedProductDispensePerformer": (
+        ("actor", "actor", False, "reference", ("Practitioner",)),
+    ),
+    "BodyStructure": (
+        ("contained", "contained", True, "resource", None),
+        ("excludedStructure", "excludedStructure", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("includedStructure", "includedStructure", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+    ),
+    "BodyStructureIncludedStructure": (
+        ("bodyLandmarkOrientation", "bodyLandmarkOrientation", True, "element", None),
+        (
+            "spatialReference",
+            "spatialReference",
+            True,
+            "reference",
+            ("ImagingSelection",),
+        ),
+    ),
+    "BodyStructureIncludedStructureBodyLandmarkOrientation": (
+        ("distanceFromLandmark", "distanceFromLandmark", True, "element", None),
+    ),
+    "BodyStructureIncludedStructureBodyLandmarkOrientationDistanceFromLandmark": (
+        ("device", "device", True, "codeable", ("Device",)),
+    ),
+    "Bundle": (
+        ("entry", "entry", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("issues", "issues", False, "resource", None),
+        ("signature", "signature", False, "element", None),
+    ),
+    "BundleEntry": (
+        ("resource", "resource", False, "resource", None),
+        ("response", "response", False, "element", None),
+    ),
+    "BundleEntryResponse": (("outcome", "outcome", False, "resource", None),),
+    "CanonicalResource": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "CapabilityStatement": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("implementation", "implementation", False, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "CapabilityStatementImplementation": (
+        ("custodian", "custodian", False, "reference", ("Organization",)),
+    ),
+    "CarePlan": (
+        ("contained", "contained", True, "resource", None),
+        ("activity", "activity", True, "element", None),
+        ("addresses", "addresses", True, "codeable", ("Condition",)),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("CarePlan", "ServiceRequest", "RequestOrchestration", "NutritionOrder"),
+        ),
+        ("careTeam", "careTeam", True, "reference", ("CareTeam",)),
+        (
+            "contributor",
+            "contributor",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "RelatedPerson",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        (
+            "custodian",
+            "custodian",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "RelatedPerson",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("goal", "goal", True, "reference", ("Goal",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("CarePlan",)),
+        ("replaces", "replaces", True, "reference", ("CarePlan",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+    ),
+    "CarePlanActivity": (
+        ("performedActivity", "performedActivity", True, "codeable", ("Resource",)),
+        (
+            "plannedActivityReference",
+            "plannedActivityReference",
+            False,
+            "reference",
+            (
+                "Appointment",
+                "CommunicationRequest",
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "Task",
+                "ServiceRequest",
+                "VisionPrescription",
+                "RequestOrchestration",
+                "ImmunizationRecommendation",
+                "SupplyRequest",
+            ),
+        ),
+        ("progress", "progress", True, "element", None),
+    ),
+    "CareTeam": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            True,
+            "reference",
+            ("Organization",),
+        ),
+        ("note", "note", True, "element", None),
+        ("participant", "participant", True, "element", None),
+        ("reason", "reason", True, "codeable", ("Condition",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "CareTeamParticipant": (
+        (
+            "member",
+            "member",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "ChargeItem": (
+        ("contained", "contained", True, "resource", None),
+        ("account", "account", True, "reference", ("Account",)),
+        ("costCenter", "costCenter", False, "reference", ("Organization",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        (
+            "enterer",
+            "enterer",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("ChargeItem",)),
+        ("performer", "performer", True, "element", None),
+        (
+            "performingOrganization",
+            "performingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        ("product", "product", True, "codeable", ("Device", "Medication", "Substance")),
+        (
+            "requestingOrganization",
+            "requestingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        (
+            "service",
+            "service",
+            True,
+            "codeable",
+            (
+                "DiagnosticReport",
+                "ImagingStudy",
+                "Immunization",
+                "MedicationAdministration",
+                "MedicationDispense",
+                "MedicationRequest",
+                "Observation",
+                "Procedure",
+                "ServiceRequest",
+                "SupplyDelivery",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "ChargeItemDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("applicability", "applicability", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "instance",
+            "instance",
+            True,
+            "reference",
+            (
+                "Medication",
+                "Substance",
+                "Device",
+                "DeviceDefinition",
+                "ActivityDefinition",
+                "PlanDefinition",
+                "HealthcareService",
+            ),
+        ),
+        ("propertyGroup", "propertyGroup", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "ChargeItemDefinitionApplicability": (
+        ("relatedArtifact", "relatedArtifact", False, "element", None),
+    ),
+    "ChargeItemDefinitionPropertyGroup": (
+        ("applicability", "applicability", True, "element", None),
+    ),
+    "ChargeItemPerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "HealthcareService",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "Citation": (
+        ("contained", "contained", True, "resource", None),
+        ("citedArtifact", "citedArtifact", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "CitationCitedArtifact": (
+        ("classification", "classification", True, "element", None),
+        ("contributorship", "contributorship", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("part", "part", False, "element", None),
+        ("publicationForm", "publicationForm", True, "element", None),
+        ("relatedIdentifier", "relatedIdentifier", True, "element", None),
+        ("relatesTo", "relatesTo", True, "element", None),
+        ("version", "version", False, "element", None),
+    ),
+    "CitationCitedArtifactClassification": (
+        (
+            "artifactAssessment",
+            "artifactAssessment",
+            True,
+            "reference",
+            ("ArtifactAssessment",),
+        ),
+    ),
+    "CitationCitedArtifactContributorship": (
+        ("entry", "entry", True, "element", None),
+    ),
+    "CitationCitedArtifactContributorshipEntry": (
+        (
+            "affiliation",
+            "affiliation",
+            True,
+            "reference",
+            ("Organization", "PractitionerRole"),
+        ),
+        (
+            "contributor",
+            "contributor",
+            False,
+            "reference",
+            ("Practitioner", "Organization"),
+        ),
+    ),
+    "CitationCitedArtifactPart": (
+        ("baseCitation", "baseCitation", False, "reference", ("Citation",)),
+    ),
+    "CitationCitedArtifactPublicationForm": (
+        ("publishedIn", "publishedIn", False, "element", None),
+    ),
+    "CitationCitedArtifactPublicationFormPublishedIn": (
+        ("identifier", "identifier", True, "element", None),
+        ("publisher", "publisher", False, "reference", ("Organization",)),
+    ),
+    "CitationCitedArtifactRelatesTo": (
+        ("resourceReference", "resourceReference", False, "reference", None),
+    ),
+    "CitationCitedArtifactVersion": (
+        ("baseCitation", "baseCitation", False, "reference", ("Citation",)),
+    ),
+    "Claim": (
+        ("contained", "contained", True, "resource", None),
+        ("accident", "accident", False, "element", None),
+        ("careTeam", "careTeam", True, "element", None),
+        ("diagnosis", "diagnosis", True, "element", None),
+        ("encounter", "encounter", True, "reference", ("Encounter",)),
+        (
+            "enterer",
+            "enterer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson"),
+        ),
+        ("facility", "facility", False, "reference", ("Location", "Organization")),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("item", "item", True, "element", None),
+        (
+            "originalPrescription",
+            "originalPrescription",
+            False,
+            "reference",
+            ("DeviceRequest", "MedicationRequest", "VisionPrescription"),
+        ),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("payee", "payee", False, "element", None),
+        (
+            "prescription",
+            "prescription",
+            False,
+            "reference",
+            ("DeviceRequest", "MedicationRequest", "VisionPrescription"),
+        ),
+        ("procedure", "procedure", True, "element", None),
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("referral", "referral", False, "reference", ("ServiceRequest",)),
+        ("related", "related", True, "element", None),
+        ("supportingInfo", "supportingInfo", True, "element", None),
+        ("traceNumber", "traceNumber", True, "element", None),
+    ),
+    "ClaimAccident": (
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+    ),
+    "ClaimCareTeam": (
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "ClaimDiagnosis": (
+        (
+            "diagnosisReference",
+            "diagnosisReference",
+            False,
+            "reference",
+            ("Condition",),
+        ),
+    ),
+    "ClaimInsurance": (
+        ("claimResponse", "claimResponse", False, "reference", ("ClaimResponse",)),
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "ClaimItem": (
+        ("bodySite", "bodySite", True, "element", None),
+        ("detail", "detail", True, "element", None),
+        ("encounter", "encounter", True, "reference", ("Encounter",)),
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+        (
+            "request",
+            "request",
+            True,
+            "reference",
+            (
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "SupplyRequest",
+                "VisionPrescription",
+            ),
+        ),
+        ("traceNumber", "traceNumber", True, "element", None),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ClaimItemBodySite": (("site", "site", True, "codeable", ("BodyStructure",)),),
+    "ClaimItemDetail": (
+        ("subDetail", "subDetail", True, "element", None),
+        ("traceNumber", "traceNumber", True, "element", None),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ClaimItemDetailSubDetail": (
+        ("traceNumber", "traceNumber", True, "element", None),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ClaimPayee": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "ClaimProcedure": (
+        (
+            "procedureReference",
+            "procedureReference",
+            False,
+            "reference",
+            ("Procedure",),
+        ),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ClaimRelated": (
+        ("claim", "claim", False, "reference", ("Claim",)),
+        ("reference", "reference", False, "element", None),
+    ),
+    "ClaimResponse": (
+        ("contained", "contained", True, "resource", None),
+        ("addItem", "addItem", True, "element", None),
+        (
+            "communicationRequest",
+            "communicationRequest",
+            True,
+            "reference",
+            ("CommunicationRequest",),
+        ),
+        ("encounter", "encounter", True, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("item", "item", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("payment", "payment", False, "element", None),
+        ("request", "request", False, "reference", ("Claim",)),
+        (
+            "requestor",
+            "requestor",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("traceNumber", "traceNumber", True, "element", None),
+    ),
+    "ClaimResponseAddItem": (
+        ("bodySite", "bodySite", True, "element", None),
+        ("detail", "detail", True, "element", None),
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+        (
+            "provider",
+            "provider",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "request",
+            "request",
+            True,
+            "reference",
+            (
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "SupplyRequest",
+                "VisionPrescription",
+            ),
+        ),
+        ("traceNumber", "traceNumber", True, "element", None),
+    ),
+    "ClaimResponseAddItemBodySite": (
+        ("site", "site", True, "codeable", ("BodyStructure",)),
+    ),
+    "ClaimResponseAddItemDetail": (
+        ("subDetail", "subDetail", True, "element", None),
+        ("traceNumber", "traceNumber", True, "element", None),
+    ),
+    "ClaimResponseAddItemDetailSubDetail": (
+        ("traceNumber", "traceNumber", True, "element", None),
+    ),
+    "ClaimResponseInsurance": (
+        ("claimResponse", "claimResponse", False, "reference", ("ClaimResponse",)),
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+    ),
+    "ClaimResponseItem": (
+        ("detail", "detail", True, "element", None),
+        ("traceNumber", "traceNumber", True, "element", None),
+    ),
+    "ClaimResponseItemDetail": (
+        ("subDetail", "subDetail", True, "element", None),
+        ("traceNumber", "traceNumber", True, "element", None),
+    ),
+    "ClaimResponseItemDetailSubDetail": (
+        ("traceNumber", "traceNumber", True, "element", None),
+    ),
+    "ClaimResponsePayment": (("identifier", "identifier", False, "element", None),),
+    "ClaimSupportingInfo": (
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "ClinicalImpression": (
+        ("contained", "contained", True, "resource", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("finding", "finding", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "performer",
+            "performer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("previous", "previous", False, "reference", ("ClinicalImpression",)),
+        ("problem", "problem", True, "reference", ("Condition", "AllergyIntolerance")),
+        (
+            "prognosisReference",
+            "prognosisReference",
+            True,
+            "reference",
+            ("RiskAssessment",),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+    ),
+    "ClinicalImpressionFinding": (
+        (
+            "item",
+            "item",
+            False,
+            "codeable",
+            ("Condition", "Observation", "DocumentReference"),
+        ),
+    ),
+    "ClinicalUseDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("contraindication", "contraindication", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("indication", "indication", False, "element", None),
+        ("interaction", "interaction", False, "element", None),
+        ("population", "population", True, "reference", ("Group",)),
+        (
+            "subject",
+            "subject",
+            True,
+            "reference",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "ActivityDefinition",
+                "PlanDefinition",
+                "Device",
+                "DeviceDefinition",
+                "Substance",
+                "NutritionProduct",
+                "BiologicallyDerivedProduct",
+            ),
+        ),
+        ("undesirableEffect", "undesirableEffect", False, "element", None),
+    ),
+    "ClinicalUseDefinitionContraindication": (
+        ("comorbidity", "comorbidity", True, "codeable", ("ObservationDefinition",)),
+        (
+            "diseaseStatus",
+            "diseaseStatus",
+            False,
+            "codeable",
+            ("ObservationDefinition",),
+        ),
+        (
+            "diseaseSymptomProcedure",
+            "diseaseSymptomProcedure",
+            False,
+            "codeable",
+            ("ObservationDefinition",),
+        ),
+        ("indication", "indication", True, "reference", ("ClinicalUseDefinition",)),
+        ("otherTherapy", "otherTherapy", True, "element", None),
+    ),
+    "ClinicalUseDefinitionContraindicationOtherTherapy": (
+        (
+            "treatment",
+            "treatment",
+            False,
+            "codeable",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "Substance",
+                "SubstanceDefinition",
+                "NutritionProduct",
+                "BiologicallyDerivedProduct",
+                "ActivityDefinition",
+            ),
+        ),
+    ),
+    "ClinicalUseDefinitionIndication": (
+        ("comorbidity", "comorbidity", True, "codeable", ("ObservationDefinition",)),
+        (
+            "diseaseStatus",
+            "diseaseStatus",
+            False,
+            "codeable",
+            ("ObservationDefinition",),
+        ),
+        (
+            "diseaseSymptomProcedure",
+            "diseaseSymptomProcedure",
+            False,
+            "codeable",
+            ("ObservationDefinition",),
+        ),
+        (
+            "intendedEffect",
+            "intendedEffect",
+            False,
+            "codeable",
+            ("ObservationDefinition",),
+        ),
+        ("otherTherapy", "otherTherapy", True, "element", None),
+        (
+            "undesirableEffect",
+            "undesirableEffect",
+            True,
+            "reference",
+            ("ClinicalUseDefinition",),
+        ),
+    ),
+    "ClinicalUseDefinitionInteraction": (
+        ("effect", "effect", False, "codeable", ("ObservationDefinition",)),
+        ("interactant", "interactant", True, "element", None),
+    ),
+    "ClinicalUseDefinitionInteractionInteractant": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "Substance",
+                "NutritionProduct",
+                "BiologicallyDerivedProduct",
+                "ObservationDefinition",
+            ),
+        ),
+    ),
+    "ClinicalUseDefinitionUndesirableEffect": (
+        (
+            "symptomConditionEffect",
+            "symptomConditionEffect",
+            False,
+            "codeable",
+            ("ObservationDefinition",),
+        ),
+    ),
+    "CodeSystem": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "CodeableReference": (("reference", "reference", False, "reference", None),),
+    "Communication": (
+        ("contained", "contained", True, "resource", None),
+        ("about", "about", True, "reference", ("Resource",)),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("inResponseTo", "inResponseTo", True, "reference", ("Communication",)),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("Resource",)),
+        ("payload", "payload", True, "element", None),
+        ("reason", "reason", True, "codeable", ("Resource",)),
+        (
+            "recipient",
+            "recipient",
+            True,
+            "reference",
+            (
+                "CareTeam",
+                "Device",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Endpoint",
+            ),
+        ),
+        (
+            "sender",
+            "sender",
+            False,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "HealthcareService",
+                "Endpoint",
+                "CareTeam",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "CommunicationPayload": (
+        ("contentReference", "contentReference", False, "reference", ("Resource",)),
+    ),
+    "CommunicationRequest": (
+        ("contained", "contained", True, "resource", None),
+        ("about", "about", True, "reference", ("Resource",)),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "informationProvider",
+            "informationProvider",
+            True,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "HealthcareService",
+                "Endpoint",
+            ),
+        ),
+        ("note", "note", True, "element", None),
+        ("payload", "payload", True, "element", None),
+        ("reason", "reason", True, "codeable", ("Resource",)),
+        (
+            "recipient",
+            "recipient",
+            True,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Group",
+                "CareTeam",
+                "HealthcareService",
+                "Endpoint",
+            ),
+        ),
+        ("replaces", "replaces", True, "reference", ("CommunicationRequest",)),
+        (
+            "requester",
+            "requester",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "CommunicationRequestPayload": (
+        ("contentReference", "contentReference", False, "reference", ("Resource",)),
+    ),
+    "CompartmentDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "Composition": (
+        ("contained", "contained", True, "resource", None),
+        ("attester", "attester", True, "element", None),
+        (
+            "author",
+            "author",
+            True,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("custodian", "custodian", False, "reference", ("Organization",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("event", "event", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("relatesTo", "relatesTo", True, "element", None),
+        ("section", "section", True, "element", None),
+        ("subject", "subject", True, "reference", ("Resource",)),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "CompositionAttester": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+            ),
+        ),
+    ),
+    "CompositionEvent": (("detail", "detail", True, "codeable", ("Resource",)),),
+    "CompositionSection": (
+        (
+            "author",
+            "author",
+            True,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("entry", "entry", True, "reference", ("Resource",)),
+        ("focus", "focus", False, "reference", ("Resource",)),
+        ("section", "section", True, "element", None),
+    ),
+    "ConceptMap": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "Condition": (
+        ("contained", "contained", True, "resource", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("evidence", "evidence", True, "codeable", ("Resource",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("participant", "participant", True, "element", None),
+        ("stage", "stage", True, "element", None),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "ConditionDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("plan", "plan", True, "element", None),
+        ("questionnaire", "questionnaire", True, "element", None),
+        ("team", "team", True, "reference", ("CareTeam",)),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "ConditionDefinitionPlan": (
+        ("reference", "reference", False, "reference", ("PlanDefinition",)),
+    ),
+    "ConditionDefinitionQuestionnaire": (
+        ("reference", "reference", False, "reference", ("Questionnaire",)),
+    ),
+    "ConditionParticipant": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+    ),
+    "ConditionStage": (
+        (
+            "assessment",
+            "assessment",
+            True,
+            "reference",
+            ("ClinicalImpression", "DiagnosticReport", "Observation"),
+        ),
+    ),
+    "Consent": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "controller",
+            "controller",
+            True,
+            "reference",
+            ("HealthcareService", "Organization", "Patient", "Practitioner"),
+        ),
+        (
+            "grantee",
+            "grantee",
+            True,
+            "reference",
+            (
+                "CareTeam",
+                "HealthcareService",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "PractitionerRole",
+            ),
+        ),
+        (
+            "grantor",
+            "grantor",
+            True,
+            "reference",
+            (
+                "CareTeam",
+                "HealthcareService",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "PractitionerRole",
+            ),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "manager",
+            "manager",
+            True,
+            "reference",
+            ("HealthcareService", "Organization", "Patient", "Practitioner"),
+        ),
+        ("policyBasis", "policyBasis", False, "element", None),
+        ("policyText", "policyText", True, "reference", ("DocumentReference",)),
+        ("provision", "provision", True, "element", None),
+        (
+            "sourceReference",
+            "sourceReference",
+            True,
+            "reference",
+            ("Consent", "DocumentReference", "Contract", "QuestionnaireResponse"),
+        ),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "Group"),
+        ),
+        ("verification", "verification", True, "element", None),
+    ),
+    "ConsentPolicyBasis": (
+        ("reference", "reference", False, "reference", ("Resource",)),
+    ),
+    "ConsentProvision": (
+        ("actor", "actor", True, "element", None),
+        ("data", "data", True, "element", None),
+        ("provision", "provision", True, "element", None),
+    ),
+    "ConsentProvisionActor": (
+        (
+            "reference",
+            "reference",
+            False,
+            "reference",
+            (
+                "Device",
+                "Group",
+                "CareTeam",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "PractitionerRole",
+            ),
+        ),
+    ),
+    "ConsentProvisionData": (
+        ("reference", "reference", False, "reference", ("Resource",)),
+    ),
+    "ConsentVerification": (
+        (
+            "verifiedBy",
+            "verifiedBy",
+            False,
+            "reference",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+        (
+            "verifiedWith",
+            "verifiedWith",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson"),
+        ),
+    ),
+    "Contract": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("authority", "authority", True, "reference", ("Organization",)),
+        ("contentDefinition", "contentDefinition", False, "element", None),
+        ("domain", "domain", True, "reference", ("Location",)),
+        ("friendly", "friendly", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "instantiatesCanonical",
+            "instantiatesCanonical",
+            False,
+            "reference",
+            ("Contract",),
+        ),
+        ("legal", "legal", True, "element", None),
+        (
+            "legallyBindingReference",
+            "legallyBindingReference",
+            False,
+            "reference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse", "Contract"),
+        ),
+        ("relevantHistory", "relevantHistory", True, "reference", ("Provenance",)),
+        ("rule", "rule", True, "element", None),
+        ("signer", "signer", True, "element", None),
+        ("site", "site", True, "reference", ("Location",)),
+        ("subject", "subject", True, "reference", ("Resource",)),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+        ("term", "term", True, "element", None),
+        ("topicReference", "topicReference", False, "reference", ("Resource",)),
+    ),
+    "ContractContentDefinition": (
+        (
+            "publisher",
+            "publisher",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "ContractFriendly": (
+        (
+            "contentReference",
+            "contentReference",
+            False,
+            "reference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+    ),
+    "ContractLegal": (
+        (
+            "contentReference",
+            "contentReference",
+            False,
+            "reference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+    ),
+    "ContractRule": (
+        (
+            "contentReference",
+            "contentReference",
+            False,
+            "reference",
+            ("DocumentReference",),
+        ),
+    ),
+    "ContractSigner": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("signature", "signature", True, "element", None),
+    ),
+    "ContractTerm": (
+        ("action", "action", True, "element", None),
+        ("asset", "asset", True, "element", None),
+        ("group", "group", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("offer", "offer", False, "element", None),
+        ("topicReference", "topicReference", False, "reference", ("Resource",)),
+    ),
+    "ContractTermAction": (
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        ("note", "note", True, "element", None),
+        (
+            "performer",
+            "performer",
+            False,
+            "reference",
+            (
+                "RelatedPerson",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "CareTeam",
+                "Device",
+                "Substance",
+                "Organization",
+                "Location",
+            ),
+        ),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            (
+                "Condition",
+                "Observation",
+                "DiagnosticReport",
+                "DocumentReference",
+                "Questionnaire",
+                "QuestionnaireResponse",
+            ),
+        ),
+        (
+            "requester",
+            "requester",
+            True,
+            "reference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+        ("subject", "subject", True, "element", None),
+    ),
+    "ContractTermActionSubject": (
+        (
+            "reference",
+            "reference",
+            True,
+            "reference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+    ),
+    "ContractTermAsset": (
+        ("answer", "answer", True, "element", None),
+        ("context", "context", True, "element", None),
+        ("typeReference", "typeReference", True, "reference", ("Resource",)),
+        ("valuedItem", "valuedItem", True, "element", None),
+    ),
+    "ContractTermAssetContext": (
+        ("reference", "reference", False, "reference", ("Resource",)),
+    ),
+    "ContractTermAssetValuedItem": (
+        ("entityReference", "entityReference", False, "reference", ("Resource",)),
+        ("identifier", "identifier", False, "element", None),
+        (
+            "recipient",
+            "recipient",
+            False,
+            "reference",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "responsible",
+            "responsible",
+            False,
+            "reference",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "ContractTermOffer": (
+        ("answer", "answer", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("party", "party", True, "element", None),
+        ("topic", "topic", False, "reference", ("Resource",)),
+    ),
+    "ContractTermOfferAnswer": (
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "ContractTermOfferParty": (
+        (
+            "reference",
+            "reference",
+            True,
+            "reference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+    ),
+    "Coverage": (
+        ("contained", "contained", True, "resource", None),
+        ("beneficiary", "beneficiary", False, "reference", ("Patient",)),
+        ("class_fhir", "class", True, "element", None),
+        ("contract", "contract", True, "reference", ("Contract",)),
+        ("identifier", "identifier", True, "element", None),
+        ("insurancePlan", "insurancePlan", False, "reference", ("InsurancePlan",)),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("paymentBy", "paymentBy", True, "element", None),
+        (
+            "policyHolder",
+            "policyHolder",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson", "Organization"),
+        ),
+        ("subscriber", "subscriber", False, "reference", ("Patient", "RelatedPerson")),
+        ("subscriberId", "subscriberId", True, "element", None),
+    ),
+    "CoverageClass": (("value", "value", False, "element", None),),
+    "CoverageEligibilityRequest": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "enterer",
+            "enterer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("facility", "facility", False, "reference", ("Location",)),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("item", "item", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("supportingInfo", "supportingInfo", True, "element", None),
+    ),
+    "CoverageEligibilityRequestInsurance": (
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+    ),
+    "CoverageEligibilityRequestItem": (
+        ("detail", "detail", True, "reference", ("Resource",)),
+        ("diagnosis", "diagnosis", True, "element", None),
+        ("facility", "facility", False, "reference", ("Location", "Organization")),
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+    ),
+    "CoverageEligibilityRequestItemDiagnosis": (
+        (
+            "diagnosisReference",
+            "diagnosisReference",
+            False,
+            "reference",
+            ("Condition",),
+        ),
+    ),
+    "CoverageEligibilityRequestSupportingInfo": (
+        ("information", "information", False, "reference", ("Resource",)),
+    ),
+    "CoverageEligibilityResponse": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("request", "request", False, "reference", ("CoverageEligibilityRequest",)),
+        (
+            "requestor",
+            "requestor",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "CoverageEligibilityResponseInsurance": (
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+        ("item", "item", True, "element", None),
+    ),
+    "CoverageEligibilityResponseInsuranceItem": (
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+    ),
+    "CoveragePaymentBy": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson", "Organization"),
+        ),
+    ),
+    "DataRequirement": (
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+    ),
+    "DetectedIssue": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson", "Practitioner", "PractitionerRole", "Device"),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("evidence", "evidence", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("implicated", "implicated", True, "reference", ("Resource",)),
+        ("mitigation", "mitigation", True, "element", None),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "Location",
+                "Organization",
+                "Procedure",
+                "Practitioner",
+                "Medication",
+                "Substance",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+            ),
+        ),
+    ),
+    "DetectedIssueEvidence": (("detail", "detail", True, "reference", ("Resource",)),),
+    "DetectedIssueMitigation": (
+        ("author", "author", False, "reference", ("Practitioner", "PractitionerRole")),
+        ("note", "note", True, "element", None),
+    ),
+    "Device": (
+        ("contained", "contained", True, "resource", None),
+        ("biologicalSourceEvent", "biologicalSourceEvent", False, "element", None),
+        ("definition", "definition", False, "codeable", ("DeviceDefinition",)),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("gateway", "gateway", True, "codeable", ("Device",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        ("owner", "owner", False, "reference", ("Organization",)),
+        ("parent", "parent", False, "reference", ("Device",)),
+        ("version", "version", True, "element", None),
+    ),
+    "DeviceAssociation": (
+        ("contained", "contained", True, "resource", None),
+        ("bodyStructure", "bodyStructure", False, "reference", ("BodyStructure",)),
+        ("device", "device", False, "reference", ("Device",)),
+        ("identifier", "identifier", True, "element", None),
+        ("operation", "operation", True, "element", None),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Practitioner", "RelatedPerson", "Device"),
+        ),
+    ),
+    "DeviceAssociationOperation": (
+        (
+            "operator",
+            "operator",
+            True,
+            "reference",
+            ("Patient", "Practitioner", "RelatedPerson"),
+        ),
+    ),
+    "DeviceDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("chargeItem", "chargeItem", True, "element", None),
+        ("classification", "classification", True, "element", None),
+        ("conformsTo", "conformsTo", True, "element", None),
+        ("guideline", "guideline", False, "element", None),
+        ("hasPart", "hasPart", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("link", "link", True, "element", None),
+        ("manufacturer", "manufacturer", False, "reference", ("Organization",)),
+        ("note", "note", True, "element", None),
+        ("owner", "owner", False, "reference", ("Organization",)),
+        ("packaging", "packaging", True, "element", None),
+        ("version", "version", True, "element", None),
+    ),
+    "DeviceDefinitionChargeItem": (
+        (
+            "chargeItemCode",
+            "chargeItemCode",
+            False,
+            "codeable",
+            ("ChargeItemDefinition",),
+        ),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "DeviceDefinitionClassification": (
+        ("justification", "justification", True, "element", None),
+    ),
+    "DeviceDefinitionConformsTo": (("source", "source", True, "element", None),),
+    "DeviceDefinitionGuideline": (
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "DeviceDefinitionHasPart": (
+        ("reference", "reference", False, "reference", ("DeviceDefinition",)),
+    ),
+    "DeviceDefinitionLink": (
+        ("relatedDevice", "relatedDevice", False, "codeable", ("DeviceDefinition",)),
+    ),
+    "DeviceDefinitionPackaging": (
+        ("distributor", "distributor", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+        ("packaging", "packaging", True, "element", None),
+    ),
+    "DeviceDefinitionPackagingDistributor": (
+        (
+            "organizationReference",
+            "organizationReference",
+            True,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "DeviceDefinitionVersion": (("component", "component", False, "element", None),),
+    "DeviceDispense": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("CarePlan", "DeviceRequest")),
+        ("destination", "destination", False, "reference", ("Location",)),
+        ("device", "device", False, "codeable", ("Device", "DeviceDefinition")),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("eventHistory", "eventHistory", True, "reference", ("Provenance",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("Procedure",)),
+        ("performer", "performer", True, "element", None),
+        (
+            "receiver",
+            "receiver",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Location",
+                "PractitionerRole",
+            ),
+        ),
+        ("statusReason", "statusReason", False, "codeable", ("DetectedIssue",)),
+        ("subject", "subject", False, "reference", ("Patient", "Practitioner")),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "DeviceDispensePerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "CareTeam",
+            ),
+        ),
+    ),
+    "DeviceMetric": (
+        ("contained", "contained", True, "resource", None),
+        ("device", "device", False, "reference", ("Device",)),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "DeviceRequest": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("code", "code", False, "codeable", ("Device", "DeviceDefinition")),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "reference", ("Coverage", "ClaimResponse")),
+        ("note", "note", True, "element", None),
+        (
+            "performer",
+            "performer",
+            False,
+            "codeable",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("relevantHistory", "relevantHistory", True, "reference", ("Provenance",)),
+        ("replaces", "replaces", True, "reference", ("DeviceRequest",)),
+        (
+            "requester",
+            "requester",
+            False,
+            "reference",
+            ("Device", "Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Location", "Device"),
+        ),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+    ),
+    "DeviceUsage": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("ServiceRequest",)),
+        ("bodySite", "bodySite", False, "codeable", ("BodyStructure",)),
+        ("context", "context", False, "reference", ("Encounter", "EpisodeOfCare")),
+        (
+            "derivedFrom",
+            "derivedFrom",
+            True,
+            "reference",
+            (
+                "ServiceRequest",
+                "Procedure",
+                "Claim",
+                "Observation",
+                "QuestionnaireResponse",
+                "DocumentReference",
+            ),
+        ),
+        ("device", "device", False, "codeable", ("Device", "DeviceDefinition")),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "informationSource",
+            "informationSource",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("note", "note", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            (
+                "Condition",
+                "Observation",
+                "DiagnosticReport",
+                "DocumentReference",
+                "Procedure",
+            ),
+        ),
+    ),
+    "DeviceVersion": (("component", "component", False, "element", None),),
+    "DiagnosticReport": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+            ),
+        ),
+        ("composition", "composition", False, "reference", ("Composition",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("media", "media", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "performer",
+            "performer",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization", "CareTeam"),
+        ),
+        ("result", "result", True, "reference", ("Observation",)),
+        (
+            "resultsInterpreter",
+            "resultsInterpreter",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization", "CareTeam"),
+        ),
+        ("specimen", "specimen", True, "reference", ("Specimen",)),
+        ("study", "study", True, "reference", ("GenomicStudy", "ImagingStudy")),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "Location",
+                "Organization",
+                "Practitioner",
+                "Medication",
+                "Substance",
+                "BiologicallyDerivedProduct",
+            ),
+        ),
+        ("supportingInfo", "supportingInfo", True, "element", None),
+    ),
+    "DiagnosticReportMedia": (
+        ("link", "link", False, "reference", ("DocumentReference",)),
+    ),
+    "DiagnosticReportSupportingInfo": (
+        (
+            "reference",
+            "reference",
+            False,
+            "reference",
+            ("Procedure", "Observation", "DiagnosticReport", "Citation"),
+        ),
+    ),
+    "DocumentReference": (
+        ("contained", "contained", True, "resource", None),
+        ("attester", "attester", True, "element", None),
+        (
+            "author",
+            "author",
+            True,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+                "CareTeam",
+            ),
+        ),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "Appointment",
+                "AppointmentResponse",
+                "CarePlan",
+                "Claim",
+                "CommunicationRequest",
+                "Contract",
+                "CoverageEligibilityRequest",
+                "DeviceRequest",
+                "EnrollmentRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "RequestOrchestration",
+                "ServiceRequest",
+                "SupplyRequest",
+                "VisionPrescription",
+            ),
+        ),
+        ("bodySite", "bodySite", True, "codeable", ("BodyStructure",)),
+        (
+            "context",
+            "context",
+            True,
+            "reference",
+            ("Appointment", "Encounter", "EpisodeOfCare"),
+        ),
+        ("custodian", "custodian", False, "reference", ("Organization",)),
+        ("event", "event", True, "codeable", None),
+        ("identifier", "identifier", True, "element", None),
+        ("relatesTo", "relatesTo", True, "element", None),
+        ("subject", "subject", False, "reference", ("Resource",)),
+    ),
+    "DocumentReferenceAttester": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+            ),
+        ),
+    ),
+    "DocumentReferenceRelatesTo": (
+        ("target", "target", False, "reference", ("DocumentReference",)),
+    ),
+    "DomainResource": (("contained", "contained", True, "resource", None),),
+    "ElementDefinition": (
+        ("binding", "binding", False, "element", None),
+        ("defaultValueAnnotation", "defaultValueAnnotation", False, "element", None),
+        (
+            "defaultValueCodeableReference",
+            "defaultValueCodeableReference",
+            False,
+            "codeable",
+            None,
+        ),
+        (
+            "defaultValueDataRequirement",
+            "defaultValueDataRequirement",
+            False,
+            "element",
+            None,
+        ),
+        (
+            "defaultValueExtendedContactDetail",
+            "defaultValueExtendedContactDetail",
+            False,
+            "element",
+            None,
+        ),
+        ("defaultValueIdentifier", "defaultValueIdentifier", False, "element", None),
+        ("defaultValueReference", "defaultValueReference", False, "reference", None),
+        (
+            "defaultValueRelatedArtifact",
+            "defaultValueRelatedArtifact",
+            False,
+            "element",
+            None,
+        ),
+        ("defaultValueSignature", "defaultValueSignature", False, "element", None),
+        (
+            "defaultValueTriggerDefinition",
+            "defaultValueTriggerDefinition",
+            False,
+            "element",
+            None,
+        ),
+        (
+            "defaultValueUsageContext",
+            "defaultValueUsageContext",
+            False,
+            "element",
+            None,
+        ),
+        ("example", "example", True, "element", None),
+        ("fixedAnnotation", "fixedAnnotation", False, "element", None),
+        ("fixedCodeableReference", "fixedCodeableReference", False, "codeable", None),
+        ("fixedDataRequirement", "fixedDataRequirement", False, "element", None),
+        (
+            "fixedExtendedContactDetail",
+            "fixedExtendedContactDetail",
+            False,
+            "element",
+            None,
+        ),
+        ("fixedIdentifier", "fixedIdentifier", False, "element", None),
+        ("fixedReference", "fixedReference", False, "reference", None),
+        ("fixedRelatedArtifact", "fixedRelatedArtifact", False, "element", None),
+        ("fixedSignature", "fixedSignature", False, "element", None),
+        ("fixedTriggerDefinition", "fixedTriggerDefinition", False, "element", None),
+        ("fixedUsageContext", "fixedUsageContext", False, "element", None),
+        ("patternAnnotation", "patternAnnotation", False, "element", None),
+        (
+            "patternCodeableReference",
+            "patternCodeableReference",
+            False,
+            "codeable",
+            None,
+        ),
+        ("patternDataRequirement", "patternDataRequirement", False, "element", None),
+        (
+            "patternExtendedContactDetail",
+            "patternExtendedContactDetail",
+            False,
+            "element",
+            None,
+        ),
+        ("patternIdentifier", "patternIdentifier", False, "element", None),
+        ("patternReference", "patternReference", False, "reference", None),
+        ("patternRelatedArtifact", "patternRelatedArtifact", False, "element", None),
+        ("patternSignature", "patternSignature", False, "element", None),
+        (
+            "patternTriggerDefinition",
+            "patternTriggerDefinition",
+            False,
+            "element",
+            None,
+        ),
+        ("patternUsageContext", "patternUsageContext", False, "element", None),
+    ),
+    "ElementDefinitionBinding": (("additional", "additional", True, "element", None),),
+    "ElementDefinitionBindingAdditional": (("usage", "usage", True, "element", None),),
+    "ElementDefinitionExample": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueCodeableReference", "valueCodeableReference", False, "codeable", None),
+        ("valueDataRequirement", "valueDataRequirement", False, "element", None),
+        (
+            "valueExtendedContactDetail",
+            "valueExtendedContactDetail",
+            False,
+            "element",
+            None,
+        ),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueRelatedArtifact", "valueRelatedArtifact", False, "element", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+        ("valueTriggerDefinition", "valueTriggerDefinition", False, "element", None),
+        ("valueUsageContext", "valueUsageContext", False, "element", None),
+    ),
+    "Encounter": (
+        ("contained", "contained", True, "resource", None),
+        ("account", "account", True, "reference", ("Account",)),
+        ("admission", "admission", False, "element", None),
+        ("appointment", "appointment", True, "reference", ("Appointment",)),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("CarePlan", "DeviceRequest", "MedicationRequest", "ServiceRequest"),
+        ),
+        ("careTeam", "careTeam", True, "reference", ("CareTeam",)),
+        ("diagnosis", "diagnosis", True, "element", None),
+        ("episodeOfCare", "episodeOfCare", True, "reference", ("EpisodeOfCare",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", True, "element", None),
+        ("partOf", "partOf", False, "reference", ("Encounter",)),
+        ("participant", "participant", True, "element", None),
+        ("reason", "reason", True, "element", None),
+        ("serviceProvider", "serviceProvider", False, "reference", ("Organization",)),
+        ("serviceType", "serviceType", True, "codeable", ("HealthcareService",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        ("virtualService", "virtualService", True, "element", None),
+    ),
+    "EncounterAdmission": (
+        (
+            "destination",
+            "destination",
+            False,
+            "reference",
+            ("Location", "Organization"),
+        ),
+        ("origin", "origin", False, "reference", ("Location", "Organization")),
+        ("preAdmissionIdentifier", "preAdmissionIdentifier", False, "element", None),
+    ),
+    "EncounterDiagnosis": (
+        ("condition", "condition", True, "codeable", ("Condition",)),
+    ),
+    "EncounterHistory": (
+        ("contained", "contained", True, "resource", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", True, "element", None),
+        ("serviceType", "serviceType", True, "codeable", ("HealthcareService",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "EncounterHistoryLocation": (
+        ("location", "location", False, "reference", ("Location",)),
+    ),
+    "EncounterLocation": (("location", "location", False, "reference", ("Location",)),),
+    "EncounterParticipant": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "HealthcareService",
+            ),
+        ),
+    ),
+    "EncounterReason": (
+        (
+            "value",
+            "value",
+            True,
+            "codeable",
+            (
+                "Condition",
+                "DiagnosticReport",
+                "Observation",
+                "ImmunizationRecommendation",
+                "Procedure",
+            ),
+        ),
+    ),
+    "Endpoint": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "EnrollmentRequest": (
+        ("contained", "contained", True, "resource", None),
+        ("candidate", "candidate", False, "reference", ("Patient",)),
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+        ("identifier", "identifier", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "EnrollmentResponse": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        ("request", "request", False, "reference", ("EnrollmentRequest",)),
+        (
+            "requestProvider",
+            "requestProvider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "EpisodeOfCare": (
+        ("contained", "contained", True, "resource", None),
+        ("account", "account", True, "reference", ("Account",)),
+        (
+            "careManager",
+            "careManager",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("careTeam", "careTeam", True, "reference", ("CareTeam",)),
+        ("diagnosis", "diagnosis", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("reason", "reason", True, "element", None),
+        ("referralRequest", "referralRequest", True, "reference", ("ServiceRequest",)),
+    ),
+    "EpisodeOfCareDiagnosis": (
+        ("condition", "condition", True, "codeable", ("Condition",)),
+    ),
+    "EpisodeOfCareReason": (
+        (
+            "value",
+            "value",
+            True,
+            "codeable",
+            ("Condition", "Procedure", "Observation", "HealthcareService"),
+        ),
+    ),
+    "EventDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+        ("trigger", "trigger", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "Evidence": (
+        ("contained", "contained", True, "resource", None),
+        ("certainty", "certainty", True, "element", None),
+        ("citeAsReference", "citeAsReference", False, "reference", ("Citation",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("statistic", "statistic", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+        ("variableDefinition", "variableDefinition", True, "element", None),
+    ),
+    "EvidenceCertainty": (
+        ("note", "note", True, "element", None),
+        ("subcomponent", "subcomponent", True, "element", None),
+    ),
+    "EvidenceReport": (
+        ("contained", "contained", True, "resource", None),
+        ("citeAsReference", "citeAsReference", False, "reference", ("Citation",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("relatedIdentifier", "relatedIdentifier", True, "element", None),
+        ("relatesTo", "relatesTo", True, "element", None),
+        ("section", "section", True, "element", None),
+        ("subject", "subject", False, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "EvidenceReportRelatesTo": (("target", "target", False, "element", None),),
+    "EvidenceReportRelatesToTarget": (
+        ("identifier", "identifier", False, "element", None),
+        ("resource", "resource", False, "reference", ("Resource",)),
+    ),
+    "EvidenceReportSection": (
+        (
+            "author",
+            "author",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+        ("entryReference", "entryReference", True, "reference", ("Resource",)),
+        ("focusReference", "focusReference", False, "reference", ("Resource",)),
+        ("section", "section", True, "element", None),
+    ),
+    "EvidenceReportSubject": (
+        ("characteristic", "characteristic", True, "element", None),
+        ("note", "note", True, "element", None),
+    ),
+    "EvidenceReportSubjectCharacteristic": (
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "EvidenceStatistic": (
+        ("attributeEstimate", "attributeEstimate", True, "element", None),
+        ("modelCharacteristic", "modelCharacteristic", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("sampleSize", "sampleSize", False, "element", None),
+    ),
+    "EvidenceStatisticAttributeEstimate": (
+        ("attributeEstimate", "attributeEstimate", True, "element", None),
+        ("note", "note", True, "element", None),
+    ),
+    "EvidenceStatisticModelCharacteristic": (
+        ("attributeEstimate", "attributeEstimate", True, "element", None),
+        ("variable", "variable", True, "element", None),
+    ),
+    "EvidenceStatisticModelCharacteristicVariable": (
+        (
+            "variableDefinition",
+            "variableDefinition",
+            False,
+            "reference",
+            ("Group", "EvidenceVariable"),
+        ),
+    ),
+    "EvidenceStatisticSampleSize": (("note", "note", True, "element", None),),
+    "EvidenceVariable": (
+        ("contained", "contained", True, "resource", None),
+        ("characteristic", "characteristic", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "EvidenceVariableCharacteristic": (
+        ("definitionByCombination", "definitionByCombination", False, "element", None),
+        (
+            "definitionByTypeAndValue",
+            "definitionByTypeAndValue",
+            False,
+            "element",
+            None,
+        ),
+        (
+            "definitionReference",
+            "definitionReference",
+            False,
+            "reference",
+            ("EvidenceVariable", "Group", "Evidence"),
+        ),
+        ("note", "note", True, "element", None),
+        ("timeFromEvent", "timeFromEvent", True, "element", None),
+    ),
+    "EvidenceVariableCharacteristicDefinitionByCombination": (
+        ("characteristic", "characteristic", True, "element", None),
+    ),
+    "EvidenceVariableCharacteristicDefinitionByTypeAndValue": (
+        ("device", "device", False, "reference", ("Device", "DeviceMetric")),
+        ("valueReference", "valueReference", False, "reference", None),
+    ),
+    "EvidenceVariableCharacteristicTimeFromEvent": (
+        ("eventReference", "eventReference", False, "reference", None),
+        ("note", "note", True, "element", None),
+    ),
+    "EvidenceVariableDefinition": (
+        ("intended", "intended", False, "reference", ("Group", "EvidenceVariable")),
+        ("note", "note", True, "element", None),
+        ("observed", "observed", False, "reference", ("Group", "EvidenceVariable")),
+    ),
+    "ExampleScenario": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("instance", "instance", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "ExampleScenarioInstance": (
+        ("content", "content", False, "reference", None),
+        ("version", "version", True, "element", None),
+    ),
+    "ExampleScenarioInstanceVersion": (
+        ("content", "content", False, "reference", None),
+    ),
+    "ExplanationOfBenefit": (
+        ("contained", "contained", True, "resource", None),
+        ("accident", "accident", False, "element", None),
+        ("addItem", "addItem", True, "element", None),
+        ("careTeam", "careTeam", True, "element", None),
+        ("claim", "claim", False, "reference", ("Claim",)),
+        ("claimResponse", "claimResponse", False, "reference", ("ClaimResponse",)),
+        ("diagnosis", "diagnosis", True, "element", None),
+        ("encounter", "encounter", True, "reference", ("Encounter",)),
+        (
+            "enterer",
+            "enterer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson"),
+        ),
+        ("facility", "facility", False, "reference", ("Location", "Organization")),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "element", None),
+        ("insurer", "insurer", False, "reference", ("Organization",)),
+        ("item", "item", True, "element", None),
+        (
+            "originalPrescription",
+            "originalPrescription",
+            False,
+            "reference",
+            ("MedicationRequest",),
+        ),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("payee", "payee", False, "element", None),
+        ("payment", "payment", False, "element", None),
+        (
+            "prescription",
+            "prescription",
+            False,
+            "reference",
+            ("MedicationRequest", "VisionPrescription"),
+        ),
+        ("procedure", "procedure", True, "element", None),
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("referral", "referral", False, "reference", ("ServiceRequest",)),
+        ("related", "related", True, "element", None),
+        ("supportingInfo", "supportingInfo", True, "element", None),
+        ("traceNumber", "traceNumber", True, "element", None),
+    ),
+    "ExplanationOfBenefitAccident": (
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+    ),
+    "ExplanationOfBenefitAddItem": (
+        ("bodySite", "bodySite", True, "element", None),
+        ("detail", "detail", True, "element", None),
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+        (
+            "provider",
+            "provider",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "request",
+            "request",
+            True,
+            "reference",
+            (
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "SupplyRequest",
+                "VisionPrescription",
+            ),
+        ),
+        ("traceNumber", "traceNumber", True, "element", None),
+    ),
+    "ExplanationOfBenefitAddItemBodySite": (
+        ("site", "site", True, "codeable", ("BodyStructure",)),
+    ),
+    "ExplanationOfBenefitAddItemDetail": (
+        ("subDetail", "subDetail", True, "element", None),
+        ("traceNumber", "traceNumber", True, "element", None),
+    ),
+    "ExplanationOfBenefitAddItemDetailSubDetail": (
+        ("traceNumber", "traceNumber", True, "element", None),
+    ),
+    "ExplanationOfBenefitCareTeam": (
+        (
+            "provider",
+            "provider",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "ExplanationOfBenefitDiagnosis": (
+        (
+            "diagnosisReference",
+            "diagnosisReference",
+            False,
+            "reference",
+            ("Condition",),
+        ),
+    ),
+    "ExplanationOfBenefitInsurance": (
+        ("coverage", "coverage", False, "reference", ("Coverage",)),
+    ),
+    "ExplanationOfBenefitItem": (
+        ("bodySite", "bodySite", True, "element", None),
+        ("detail", "detail", True, "element", None),
+        ("encounter", "encounter", True, "reference", ("Encounter",)),
+        ("locationReference", "locationReference", False, "reference", ("Location",)),
+        (
+            "request",
+            "request",
+            True,
+            "reference",
+            (
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "SupplyRequest",
+                "VisionPrescription",
+            ),
+        ),
+        ("traceNumber", "traceNumber", True, "element", None),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ExplanationOfBenefitItemBodySite": (
+        ("site", "site", True, "codeable", ("BodyStructure",)),
+    ),
+    "ExplanationOfBenefitItemDetail": (
+        ("subDetail", "subDetail", True, "element", None),
+        ("traceNumber", "traceNumber", True, "element", None),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ExplanationOfBenefitItemDetailSubDetail": (
+        ("traceNumber", "traceNumber", True, "element", None),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ExplanationOfBenefitPayee": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "ExplanationOfBenefitPayment": (
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "ExplanationOfBenefitProcedure": (
+        (
+            "procedureReference",
+            "procedureReference",
+            False,
+            "reference",
+            ("Procedure",),
+        ),
+        ("udi", "udi", True, "reference", ("Device",)),
+    ),
+    "ExplanationOfBenefitRelated": (
+        ("claim", "claim", False, "reference", ("Claim",)),
+        ("reference", "reference", False, "element", None),
+    ),
+    "ExplanationOfBenefitSupportingInfo": (
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "ExtendedContactDetail": (
+        ("organization", "organization", False, "reference", ("Organization",)),
+    ),
+    "Extension": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueCodeableReference", "valueCodeableReference", False, "codeable", None),
+        ("valueDataRequirement", "valueDataRequirement", False, "element", None),
+        (
+            "valueExtendedContactDetail",
+            "valueExtendedContactDetail",
+            False,
+            "element",
+            None,
+        ),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueRelatedArtifact", "valueRelatedArtifact", False, "element", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+        ("valueTriggerDefinition", "valueTriggerDefinition", False, "element", None),
+        ("valueUsageContext", "valueUsageContext", False, "element", None),
+    ),
+    "FamilyMemberHistory": (
+        ("contained", "contained", True, "resource", None),
+        ("condition", "condition", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("participant", "participant", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("procedure", "procedure", True, "element", None),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            (
+                "Condition",
+                "Observation",
+                "AllergyIntolerance",
+                "QuestionnaireResponse",
+                "DiagnosticReport",
+                "DocumentReference",
+            ),
+        ),
+    ),
+    "FamilyMemberHistoryCondition": (("note", "note", True, "element", None),),
+    "FamilyMemberHistoryParticipant": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+    ),
+    "FamilyMemberHistoryProcedure": (("note", "note", True, "element", None),),
+    "Flag": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+            ),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Location",
+                "Group",
+                "Organization",
+                "Practitioner",
+                "PractitionerRole",
+                "PlanDefinition",
+                "Medication",
+                "Procedure",
+            ),
+        ),
+    ),
+    "FormularyItem": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "GenomicStudy": (
+        ("contained", "contained", True, "resource", None),
+        ("analysis", "analysis", True, "element", None),
+        ("basedOn", "basedOn", True, "reference", ("ServiceRequest", "Task")),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "interpreter",
+            "interpreter",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("note", "note", True, "element", None),
+        ("reason", "reason", True, "codeable", ("Condition", "Observation")),
+        (
+            "referrer",
+            "referrer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "Substance",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+            ),
+        ),
+    ),
+    "GenomicStudyAnalysis": (
+        ("device", "device", True, "element", None),
+        ("focus", "focus", True, "reference", ("Resource",)),
+        ("identifier", "identifier", True, "element", None),
+        ("input", "input", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("output", "output", True, "element", None),
+        ("performer", "performer", True, "element", None),
+        (
+            "protocolPerformed",
+            "protocolPerformed",
+            False,
+            "reference",
+            ("Procedure", "Task"),
+        ),
+        (
+            "regionsCalled",
+            "regionsCalled",
+            True,
+            "reference",
+            ("DocumentReference", "Observation"),
+        ),
+        (
+            "regionsStudied",
+            "regionsStudied",
+            True,
+            "reference",
+            ("DocumentReference", "Observation"),
+        ),
+        ("specimen", "specimen", True, "reference", ("Specimen",)),
+    ),
+    "GenomicStudyAnalysisDevice": (
+        ("device", "device", False, "reference", ("Device",)),
+    ),
+    "GenomicStudyAnalysisInput": (
+        ("file", "file", False, "reference", ("DocumentReference",)),
+        ("generatedByIdentifier", "generatedByIdentifier", False, "element", None),
+        (
+            "generatedByReference",
+            "generatedByReference",
+            False,
+            "reference",
+            ("GenomicStudy",),
+        ),
+    ),
+    "GenomicStudyAnalysisOutput": (
+        ("file", "file", False, "reference", ("DocumentReference",)),
+    ),
+    "GenomicStudyAnalysisPerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization", "Device"),
+        ),
+    ),
+    "Goal": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "addresses",
+            "addresses",
+            True,
+            "reference",
+            (
+                "Condition",
+                "Observation",
+                "MedicationStatement",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "RiskAssessment",
+                "Procedure",
+            ),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("outcome", "outcome", True, "codeable", ("Observation",)),
+        (
+            "source",
+            "source",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "CareTeam",
+            ),
+        ),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Organization"),
+        ),
+    ),
+    "GraphDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "Group": (
+        ("contained", "contained", True, "resource", None),
+        ("characteristic", "characteristic", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingEntity",
+            "managingEntity",
+            False,
+            "reference",
+            ("Organization", "RelatedPerson", "Practitioner", "PractitionerRole"),
+        ),
+        ("member", "member", True, "element", None),
+    ),
+    "GroupCharacteristic": (
+        ("valueReference", "valueReference", False, "reference", None),
+    ),
+    "GroupMember": (
+        (
+            "entity",
+            "entity",
+            False,
+            "reference",
+            (
+                "CareTeam",
+                "Device",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Specimen",
+            ),
+        ),
+    ),
+    "GuidanceResponse": (
+        ("contained", "contained", True, "resource", None),
+        ("dataRequirement", "dataRequirement", True, "element", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        (
+            "evaluationMessage",
+            "evaluationMessage",
+            False,
+            "reference",
+            ("OperationOutcome",),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("outputParameters", "outputParameters", False, "reference", ("Parameters",)),
+        ("performer", "performer", False, "reference", ("Device",)),
+        ("reason", "reason", True, "codeable", None),
+        ("requestIdentifier", "requestIdentifier", False, "element", None),
+        (
+            "result",
+            "result",
+            True,
+            "reference",
+            (
+                "Appointment",
+                "AppointmentResponse",
+                "CarePlan",
+                "Claim",
+                "CommunicationRequest",
+                "Contract",
+                "CoverageEligibilityRequest",
+                "DeviceRequest",
+                "EnrollmentRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "RequestOrchestration",
+                "ServiceRequest",
+                "SupplyRequest",
+                "Task",
+                "VisionPrescription",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "HealthcareService": (
+        ("contained", "contained", True, "resource", None),
+        ("contact", "contact", True, "element", None),
+        ("coverageArea", "coverageArea", True, "reference", ("Location",)),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", True, "reference", ("Location",)),
+        ("offeredIn", "offeredIn", True, "reference", ("HealthcareService",)),
+        ("providedBy", "providedBy", False, "reference", ("Organization",)),
+    ),
+    "Identifier": (("assigner", "assigner", False, "reference", ("Organization",)),),
+    "ImagingSelection": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "ServiceRequest",
+                "Appointment",
+                "AppointmentResponse",
+                "Task",
+            ),
+        ),
+        ("bodySite", "bodySite", False, "codeable", ("BodyStructure",)),
+        (
+            "derivedFrom",
+            "derivedFrom",
+            True,
+            "reference",
+            ("ImagingStudy", "DocumentReference"),
+        ),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("focus", "focus", True, "reference", ("ImagingSelection",)),
+        ("identifier", "identifier", True, "element", None),
+        ("performer", "performer", True, "element", None),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "Location",
+                "Organization",
+                "Procedure",
+                "Practitioner",
+                "Medication",
+                "Substance",
+                "Specimen",
+            ),
+        ),
+    ),
+    "ImagingSelectionPerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+    ),
+    "ImagingStudy": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "ServiceRequest",
+                "Appointment",
+                "AppointmentResponse",
+                "Task",
+            ),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("Procedure",)),
+        (
+            "procedure",
+            "procedure",
+            True,
+            "codeable",
+            ("PlanDefinition", "ActivityDefinition"),
+        ),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        (
+            "referrer",
+            "referrer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("series", "series", True, "element", None),
+        ("subject", "subject", False, "reference", ("Patient", "Device", "Group")),
+    ),
+    "ImagingStudySeries": (
+        ("bodySite", "bodySite", False, "codeable", ("BodyStructure",)),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("performer", "performer", True, "element", None),
+        ("specimen", "specimen", True, "reference", ("Specimen",)),
+    ),
+    "ImagingStudySeriesPerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+    ),
+    "Immunization": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "administeredProduct",
+            "administeredProduct",
+            False,
+            "codeable",
+            ("Medication",),
+        ),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "MedicationRequest",
+                "ServiceRequest",
+                "ImmunizationRecommendation",
+            ),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "informationSource",
+            "informationSource",
+            False,
+            "codeable",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("location", "location", False, "reference", ("Location",)),
+        ("manufacturer", "manufacturer", False, "codeable", ("Organization",)),
+        ("note", "note", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("performer", "performer", True, "element", None),
+        ("protocolApplied", "protocolApplied", True, "element", None),
+        ("reaction", "reaction", True, "element", None),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            ("Condition", "Observation", "DiagnosticReport"),
+        ),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "ImmunizationEvaluation": (
+        ("contained", "contained", True, "resource", None),
+        ("authority", "authority", False, "reference", ("Organization",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "immunizationEvent",
+            "immunizationEvent",
+            False,
+            "reference",
+            ("Immunization",),
+        ),
+        ("patient", "patient", False, "reference", ("Patient",)),
+    ),
+    "ImmunizationPerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "ImmunizationProtocolApplied": (
+        ("authority", "authority", False, "reference", ("Organization",)),
+    ),
+    "ImmunizationReaction": (
+        ("manifestation", "manifestation", False, "codeable", ("Observation",)),
+    ),
+    "ImmunizationRecommendation": (
+        ("contained", "contained", True, "resource", None),
+        ("authority", "authority", False, "reference", ("Organization",)),
+        ("identifier", "identifier", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("recommendation", "recommendation", True, "element", None),
+    ),
+    "ImmunizationRecommendationRecommendation": (
+        (
+            "supportingImmunization",
+            "supportingImmunization",
+            True,
+            "reference",
+            ("Immunization", "ImmunizationEvaluation"),
+        ),
+        (
+            "supportingPatientInformation",
+            "supportingPatientInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "ImplementationGuide": (
+        ("contained", "contained", True, "resource", None),
+        ("definition", "definition", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("manifest", "manifest", False, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "ImplementationGuideDefinition": (("resource", "resource", True, "element", None),),
+    "ImplementationGuideDefinitionResource": (
+        ("reference", "reference", False, "reference", ("Resource",)),
+    ),
+    "ImplementationGuideManifest": (("resource", "resource", True, "element", None),),
+    "ImplementationGuideManifestResource": (
+        ("reference", "reference", False, "reference", ("Resource",)),
+    ),
+    "Ingredient": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "for_fhir",
+            "for",
+            True,
+            "reference",
+            (
+                "MedicinalProductDefinition",
+                "AdministrableProductDefinition",
+                "ManufacturedItemDefinition",
+            ),
+        ),
+        ("identifier", "identifier", False, "element", None),
+        ("manufacturer", "manufacturer", True, "element", None),
+        ("substance", "substance", False, "element", None),
+    ),
+    "IngredientManufacturer": (
+        ("manufacturer", "manufacturer", False, "reference", ("Organization",)),
+    ),
+    "IngredientSubstance": (
+        ("code", "code", False, "codeable", ("SubstanceDefinition",)),
+        ("strength", "strength", True, "element", None),
+    ),
+    "IngredientSubstanceStrength": (
+        ("referenceStrength", "referenceStrength", True, "element", None),
+    ),
+    "IngredientSubstanceStrengthReferenceStrength": (
+        ("substance", "substance", False, "codeable", ("SubstanceDefinition",)),
+    ),
+    "InsurancePlan": (
+        ("contained", "contained", True, "resource", None),
+        ("administeredBy", "administeredBy", False, "reference", ("Organization",)),
+        ("contact", "contact", True, "element", None),
+        ("coverage", "coverage", True, "element", None),
+        ("coverageArea", "coverageArea", True, "reference", ("Location",)),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        ("network", "network", True, "reference", ("Organization",)),
+        ("ownedBy", "ownedBy", False, "reference", ("Organization",)),
+        ("plan", "plan", True, "element", None),
+    ),
+    "InsurancePlanCoverage": (
+        ("network", "network", True, "reference", ("Organization",)),
+    ),
+    "InsurancePlanPlan": (
+        ("coverageArea", "coverageArea", True, "reference", ("Location",)),
+        ("identifier", "identifier", True, "element", None),
+        ("network", "network", True, "reference", ("Organization",)),
+    ),
+    "InventoryItem": (
+        ("contained", "contained", True, "resource", None),
+        ("association", "association", True, "element", None),
+        ("characteristic", "characteristic", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("instance", "instance", False, "element", None),
+        (
+            "productReference",
+            "productReference",
+            False,
+            "reference",
+            ("Medication", "Device", "NutritionProduct", "BiologicallyDerivedProduct"),
+        ),
+        ("responsibleOrganization", "responsibleOrganization", True, "element", None),
+    ),
+    "InventoryItemAssociation": (
+        (
+            "relatedItem",
+            "relatedItem",
+            False,
+            "reference",
+            (
+                "InventoryItem",
+                "Medication",
+                "MedicationKnowledge",
+                "Device",
+                "DeviceDefinition",
+                "NutritionProduct",
+                "BiologicallyDerivedProduct",
+            ),
+        ),
+    ),
+    "InventoryItemCharacteristic": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+    ),
+    "InventoryItemInstance": (
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("subject", "subject", False, "reference", ("Patient", "Organization")),
+    ),
+    "InventoryItemResponsibleOrganization": (
+        ("organization", "organization", False, "reference", ("Organization",)),
+    ),
+    "InventoryReport": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("inventoryListing", "inventoryListing", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "reporter",
+            "reporter",
+            False,
+            "reference",
+            ("Practitioner", "Patient", "RelatedPerson", "Device"),
+        ),
+    ),
+    "InventoryReportInventoryListing": (
+        ("item", "item", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+    ),
+    "InventoryReportInventoryListingItem": (
+        (
+            "item",
+            "item",
+            False,
+            "codeable",
+            (
+                "Medication",
+                "Device",
+                "Medication",
+                "NutritionProduct",
+                "InventoryItem",
+                "BiologicallyDerivedProduct",
+                "InventoryItem",
+            ),
+        ),
+    ),
+    "Invoice": (
+        ("contained", "contained", True, "resource", None),
+        ("account", "account", False, "reference", ("Account",)),
+        ("identifier", "identifier", True, "element", None),
+        ("issuer", "issuer", False, "reference", ("Organization",)),
+        ("lineItem", "lineItem", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("participant", "participant", True, "element", None),
+        (
+            "recipient",
+            "recipient",
+            False,
+            "reference",
+            ("Organization", "Patient", "RelatedPerson"),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "InvoiceLineItem": (
+        (
+            "chargeItemReference",
+            "chargeItemReference",
+            False,
+            "reference",
+            ("ChargeItem",),
+        ),
+    ),
+    "InvoiceParticipant": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "Organization",
+                "Patient",
+                "PractitionerRole",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "Library": (
+        ("contained", "contained", True, "resource", None),
+        ("dataRequirement", "dataRequirement", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "Linkage": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("item", "item", True, "element", None),
+    ),
+    "LinkageItem": (("resource", "resource", False, "reference", ("Resource",)),),
+    "List": (
+        ("contained", "contained", True, "resource", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("entry", "entry", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "source",
+            "source",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "Device",
+                "Organization",
+                "RelatedPerson",
+                "CareTeam",
+            ),
+        ),
+        ("subject", "subject", True, "reference", ("Resource",)),
+    ),
+    "ListEntry": (("item", "item", False, "reference", ("Resource",)),),
+    "Location": (
+        ("contained", "contained", True, "resource", None),
+        ("contact", "contact", True, "element", None),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+        ("partOf", "partOf", False, "reference", ("Location",)),
+        ("virtualService", "virtualService", True, "element", None),
+    ),
+    "ManufacturedItemDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("component", "component", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("manufacturer", "manufacturer", True, "reference", ("Organization",)),
+        ("property", "property", True, "element", None),
+    ),
+    "ManufacturedItemDefinitionComponent": (
+        ("component", "component", True, "element", None),
+        ("constituent", "constituent", True, "element", None),
+        ("property", "property", True, "element", None),
+    ),
+    "ManufacturedItemDefinitionComponentConstituent": (
+        ("hasIngredient", "hasIngredient", True, "codeable", ("Ingredient",)),
+    ),
+    "ManufacturedItemDefinitionProperty": (
+        ("valueReference", "valueReference", False, "reference", ("Binary",)),
+    ),
+    "Measure": (
+        ("contained", "contained", True, "resource", None),
+        ("group", "group", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "MeasureGroup": (
+        ("population", "population", True, "element", None),
+        ("stratifier", "stratifier", True, "element", None),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+    ),
+    "MeasureGroupPopulation": (
+        ("groupDefinition", "groupDefinition", False, "reference", ("Group",)),
+    ),
+    "MeasureGroupStratifier": (
+        ("component", "component", True, "element", None),
+        ("groupDefinition", "groupDefinition", False, "reference", ("Group",)),
+    ),
+    "MeasureGroupStratifierComponent": (
+        ("groupDefinition", "groupDefinition", False, "reference", ("Group",)),
+    ),
+    "MeasureReport": (
+        ("contained", "contained", True, "resource", None),
+        ("evaluatedResource", "evaluatedResource", True, "reference", ("Resource",)),
+        ("group", "group", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("inputParameters", "inputParameters", False, "reference", ("Parameters",)),
+        ("location", "location", False, "reference", ("Location",)),
+        (
+            "reporter",
+            "reporter",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization", "Group"),
+        ),
+        ("reportingVendor", "reportingVendor", False, "reference", ("Organization",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "CareTeam",
+                "Device",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("supplementalData", "supplementalData", True, "reference", ("Resource",)),
+    ),
+    "MeasureReportGroup": (
+        ("population", "population", True, "element", None),
+        ("stratifier", "stratifier", True, "element", None),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "CareTeam",
+                "Device",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "MeasureReportGroupPopulation": (
+        ("subjectReport", "subjectReport", True, "reference", ("MeasureReport",)),
+        ("subjectResults", "subjectResults", False, "reference", ("List",)),
+        ("subjects", "subjects", False, "reference", ("Group",)),
+    ),
+    "MeasureReportGroupStratifier": (("stratum", "stratum", True, "element", None),),
+    "MeasureReportGroupStratifierStratum": (
+        ("component", "component", True, "element", None),
+        ("population", "population", True, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+    ),
+    "MeasureReportGroupStratifierStratumComponent": (
+        ("valueReference", "valueReference", False, "reference", None),
+    ),
+    "MeasureReportGroupStratifierStratumPopulation": (
+        ("subjectReport", "subjectReport", True, "reference", ("MeasureReport",)),
+        ("subjectResults", "subjectResults", False, "reference", ("List",)),
+        ("subjects", "subjects", False, "reference", ("Group",)),
+    ),
+    "Medication": (
+        ("contained", "contained", True, "resource", None),
+        ("definition", "definition", False, "reference", ("MedicationKnowledge",)),
+        ("identifier", "identifier", True, "element", None),
+        ("ingredient", "ingredient", True, "element", None),
+        (
+            "marketingAuthorizationHolder",
+            "marketingAuthorizationHolder",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "MedicationAdministration": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("CarePlan",)),
+        ("device", "device", True, "codeable", ("Device",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("eventHistory", "eventHistory", True, "reference", ("Provenance",)),
+        ("identifier", "identifier", True, "element", None),
+        ("medication", "medication", False, "codeable", ("Medication",)),
+        ("note", "note", True, "element", None),
+        (
+            "partOf",
+            "partOf",
+            True,
+            "reference",
+            ("MedicationAdministration", "Procedure", "MedicationDispense"),
+        ),
+        ("performer", "performer", True, "element", None),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            ("Condition", "Observation", "DiagnosticReport"),
+        ),
+        ("request", "request", False, "reference", ("MedicationRequest",)),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "MedicationAdministrationPerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "codeable",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson", "Device"),
+        ),
+    ),
+    "MedicationDispense": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "authorizingPrescription",
+            "authorizingPrescription",
+            True,
+            "reference",
+            ("MedicationRequest",),
+        ),
+        ("basedOn", "basedOn", True, "reference", ("CarePlan",)),
+        ("destination", "destination", False, "reference", ("Location",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("eventHistory", "eventHistory", True, "reference", ("Provenance",)),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("medication", "medication", False, "codeable", ("Medication",)),
+        (
+            "notPerformedReason",
+            "notPerformedReason",
+            False,
+            "codeable",
+            ("DetectedIssue",),
+        ),
+        ("note", "note", True, "element", None),
+        (
+            "partOf",
+            "partOf",
+            True,
+            "reference",
+            ("Procedure", "MedicationAdministration"),
+        ),
+        ("performer", "performer", True, "element", None),
+        (
+            "receiver",
+            "receiver",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Location",
+                "PractitionerRole",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        ("substitution", "substitution", False, "element", None),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "MedicationDispensePerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "CareTeam",
+            ),
+        ),
+    ),
+    "MedicationDispenseSubstitution": (
+        (
+            "responsibleParty",
+            "responsibleParty",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "MedicationIngredient": (
+        ("item", "item", False, "codeable", ("Substance", "Medication")),
+    ),
+    "MedicationKnowledge": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "associatedMedication",
+            "associatedMedication",
+            True,
+            "reference",
+            ("Medication",),
+        ),
+        ("author", "author", False, "reference", ("Organization",)),
+        (
+            "clinicalUseIssue",
+            "clinicalUseIssue",
+            True,
+            "reference",
+            ("ClinicalUseDefinition",),
+        ),
+        ("definitional", "definitional", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("indicationGuideline", "indicationGuideline", True, "element", None),
+        ("monograph", "monograph", True, "element", None),
+        ("packaging", "packaging", True, "element", None),
+        ("regulatory", "regulatory", True, "element", None),
+        (
+            "relatedMedicationKnowledge",
+            "relatedMedicationKnowledge",
+            True,
+            "element",
+            None,
+        ),
+        ("storageGuideline", "storageGuideline", True, "element", None),
+    ),
+    "MedicationKnowledgeDefinitional": (
+        (
+            "definition",
+            "definition",
+            True,
+            "reference",
+            ("MedicinalProductDefinition",),
+        ),
+        ("ingredient", "ingredient", True, "element", None),
+    ),
+    "MedicationKnowledgeDefinitionalIngredient": (
+        ("item", "item", False, "codeable", ("Substance",)),
+    ),
+    "MedicationKnowledgeIndicationGuideline": (
+        ("indication", "indication", True, "codeable", ("ClinicalUseDefinition",)),
+    ),
+    "MedicationKnowledgeMonograph": (
+        ("source", "source", False, "reference", ("DocumentReference",)),
+    ),
+    "MedicationKnowledgePackaging": (
+        (
+            "packagedProduct",
+            "packagedProduct",
+            False,
+            "reference",
+            ("PackagedProductDefinition",),
+        ),
+    ),
+    "MedicationKnowledgeRegulatory": (
+        (
+            "regulatoryAuthority",
+            "regulatoryAuthority",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "MedicationKnowledgeRelatedMedicationKnowledge": (
+        ("reference", "reference", True, "reference", ("MedicationKnowledge",)),
+    ),
+    "MedicationKnowledgeStorageGuideline": (("note", "note", True, "element", None),),
+    "MedicationRequest": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "MedicationRequest",
+                "ServiceRequest",
+                "ImmunizationRecommendation",
+            ),
+        ),
+        ("device", "device", True, "codeable", ("DeviceDefinition",)),
+        ("dispenseRequest", "dispenseRequest", False, "element", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("eventHistory", "eventHistory", True, "reference", ("Provenance",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "informationSource",
+            "informationSource",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("insurance", "insurance", True, "reference", ("Coverage", "ClaimResponse")),
+        ("medication", "medication", False, "codeable", ("Medication",)),
+        ("note", "note", True, "element", None),
+        (
+            "performer",
+            "performer",
+            True,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "DeviceDefinition",
+                "RelatedPerson",
+                "CareTeam",
+                "HealthcareService",
+            ),
+        ),
+        (
+            "priorPrescription",
+            "priorPrescription",
+            False,
+            "reference",
+            ("MedicationRequest",),
+        ),
+        ("reason", "reason", True, "codeable", ("Condition", "Observation")),
+        (
+            "recorder",
+            "recorder",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        (
+            "requester",
+            "requester",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "MedicationRequestDispenseRequest": (
+        ("dispenser", "dispenser", False, "reference", ("Organization",)),
+        ("dispenserInstruction", "dispenserInstruction", True, "element", None),
+    ),
+    "MedicationStatement": (
+        ("contained", "contained", True, "resource", None),
+        ("derivedFrom", "derivedFrom", True, "reference", ("Resource",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "informationSource",
+            "informationSource",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("medication", "medication", False, "codeable", ("Medication",)),
+        ("note", "note", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("Procedure", "MedicationStatement")),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            ("Condition", "Observation", "DiagnosticReport"),
+        ),
+        (
+            "relatedClinicalInformation",
+            "relatedClinicalInformation",
+            True,
+            "reference",
+            ("Observation", "Condition"),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "MedicinalProductDefinition": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "attachedDocument",
+            "attachedDocument",
+            True,
+            "reference",
+            ("DocumentReference",),
+        ),
+        ("clinicalTrial", "clinicalTrial", True, "reference", ("ResearchStudy",)),
+        (
+            "comprisedOf",
+            "comprisedOf",
+            True,
+            "reference",
+            ("ManufacturedItemDefinition", "DeviceDefinition"),
+        ),
+        ("contact", "contact", True, "element", None),
+        ("crossReference", "crossReference", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("impurity", "impurity", True, "codeable", ("SubstanceDefinition",)),
+        ("masterFile", "masterFile", True, "reference", ("DocumentReference",)),
+        ("operation", "operation", True, "element", None),
+    ),
+    "MedicinalProductDefinitionContact": (
+        (
+            "contact",
+            "contact",
+            False,
+            "reference",
+            ("Organization", "PractitionerRole"),
+        ),
+    ),
+    "MedicinalProductDefinitionCrossReference": (
+        ("product", "product", False, "codeable", ("MedicinalProductDefinition",)),
+    ),
+    "MedicinalProductDefinitionOperation": (
+        ("organization", "organization", True, "reference", ("Organization",)),
+        ("type", "type", False, "codeable", ("ActivityDefinition", "PlanDefinition")),
+    ),
+    "MessageDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "MessageHeader": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Device", "Organization"),
+        ),
+        ("destination", "destination", True, "element", None),
+        ("focus", "focus", True, "reference", ("Resource",)),
+        ("response", "response", False, "element", None),
+        (
+            "responsible",
+            "responsible",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "sender",
+            "sender",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Device", "Organization"),
+        ),
+        ("source", "source", False, "element", None),
+    ),
+    "MessageHeaderDestination": (
+        ("endpointReference", "endpointReference", False, "reference", ("Endpoint",)),
+        (
+            "receiver",
+            "receiver",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("target", "target", False, "reference", ("Device",)),
+    ),
+    "MessageHeaderResponse": (
+        ("details", "details", False, "reference", ("OperationOutcome",)),
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "MessageHeaderSource": (
+        ("endpointReference", "endpointReference", False, "reference", ("Endpoint",)),
+    ),
+    "MetadataResource": (
+        ("contained", "contained", True, "resource", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+    ),
+    "MolecularSequence": (
+        ("contained", "contained", True, "resource", None),
+        ("device", "device", False, "reference", ("Device",)),
+        ("focus", "focus", True, "reference", ("Resource",)),
+        ("identifier", "identifier", True, "element", None),
+        ("performer", "performer", False, "reference", ("Organization",)),
+        ("relative", "relative", True, "element", None),
+        ("specimen", "specimen", False, "reference", ("Specimen",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "Substance",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+            ),
+        ),
+    ),
+    "MolecularSequenceRelative": (
+        ("startingSequence", "startingSequence", False, "element", None),
+    ),
+    "MolecularSequenceRelativeStartingSequence": (
+        (
+            "sequenceReference",
+            "sequenceReference",
+            False,
+            "reference",
+            ("MolecularSequence",),
+        ),
+    ),
+    "NamingSystem": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "NutritionIntake": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("NutritionOrder", "CarePlan", "ServiceRequest"),
+        ),
+        ("consumedItem", "consumedItem", True, "element", None),
+        ("derivedFrom", "derivedFrom", True, "reference", ("Resource",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("ingredientLabel", "ingredientLabel", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        (
+            "partOf",
+            "partOf",
+            True,
+            "reference",
+            ("NutritionIntake", "Procedure", "Observation"),
+        ),
+        ("performer", "performer", True, "element", None),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        (
+            "reportedReference",
+            "reportedReference",
+            False,
+            "reference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "NutritionIntakeConsumedItem": (
+        (
+            "nutritionProduct",
+            "nutritionProduct",
+            False,
+            "codeable",
+            ("NutritionProduct",),
+        ),
+    ),
+    "NutritionIntakeIngredientLabel": (
+        ("nutrient", "nutrient", False, "codeable", ("Substance",)),
+    ),
+    "NutritionIntakePerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "NutritionOrder": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "allergyIntolerance",
+            "allergyIntolerance",
+            True,
+            "reference",
+            ("AllergyIntolerance",),
+        ),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("CarePlan", "NutritionOrder", "ServiceRequest"),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("enteralFormula", "enteralFormula", False, "element", None),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "orderer",
+            "orderer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        (
+            "performer",
+            "performer",
+            True,
+            "codeable",
+            (
+                "CareTeam",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Organization",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+        ("supplement", "supplement", True, "element", None),
+        (
+            "supportingInformation",
+            "supportingInformation",
+            True,
+            "reference",
+            ("Resource",),
+        ),
+    ),
+    "NutritionOrderEnteralFormula": (
+        ("additive", "additive", True, "element", None),
+        (
+            "baseFormulaType",
+            "baseFormulaType",
+            False,
+            "codeable",
+            ("NutritionProduct",),
+        ),
+        ("deliveryDevice", "deliveryDevice", True, "codeable", ("DeviceDefinition",)),
+    ),
+    "NutritionOrderEnteralFormulaAdditive": (
+        ("type", "type", False, "codeable", ("NutritionProduct",)),
+    ),
+    "NutritionOrderSupplement": (
+        ("type", "type", False, "codeable", ("NutritionProduct",)),
+    ),
+    "NutritionProduct": (
+        ("contained", "contained", True, "resource", None),
+        ("ingredient", "ingredient", True, "element", None),
+        ("instance", "instance", True, "element", None),
+        ("knownAllergen", "knownAllergen", True, "codeable", ("Substance",)),
+        ("manufacturer", "manufacturer", True, "reference", ("Organization",)),
+        ("note", "note", True, "element", None),
+        ("nutrient", "nutrient", True, "element", None),
+    ),
+    "NutritionProductIngredient": (
+        ("item", "item", False, "codeable", ("NutritionProduct",)),
+    ),
+    "NutritionProductInstance": (
+        ("biologicalSourceEvent", "biologicalSourceEvent", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+    ),
+    "NutritionProductNutrient": (("item", "item", False, "codeable", ("Substance",)),),
+    "Observation": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "DeviceRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+            ),
+        ),
+        ("bodyStructure", "bodyStructure", False, "reference", ("BodyStructure",)),
+        ("component", "component", True, "element", None),
+        (
+            "derivedFrom",
+            "derivedFrom",
+            True,
+            "reference",
+            (
+                "DocumentReference",
+                "ImagingStudy",
+                "ImagingSelection",
+                "QuestionnaireResponse",
+                "Observation",
+                "MolecularSequence",
+                "GenomicStudy",
+            ),
+        ),
+        ("device", "device", False, "reference", ("Device", "DeviceMetric")),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("focus", "focus", True, "reference", ("Resource",)),
+        (
+            "hasMember",
+            "hasMember",
+            True,
+            "reference",
+            ("Observation", "QuestionnaireResponse", "MolecularSequence"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "instantiatesReference",
+            "instantiatesReference",
+            False,
+            "reference",
+            ("ObservationDefinition",),
+        ),
+        ("note", "note", True, "element", None),
+        (
+            "partOf",
+            "partOf",
+            True,
+            "reference",
+            (
+                "MedicationAdministration",
+                "MedicationDispense",
+                "MedicationStatement",
+                "Procedure",
+                "Immunization",
+                "ImagingStudy",
+                "GenomicStudy",
+            ),
+        ),
+        (
+            "performer",
+            "performer",
+            True,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("specimen", "specimen", False, "reference", ("Specimen", "Group")),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "Location",
+                "Organization",
+                "Procedure",
+                "Practitioner",
+                "Medication",
+                "Substance",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+            ),
+        ),
+        ("triggeredBy", "triggeredBy", True, "element", None),
+        (
+            "valueReference",
+            "valueReference",
+            False,
+            "reference",
+            ("MolecularSequence",),
+        ),
+    ),
+    "ObservationComponent": (
+        (
+            "valueReference",
+            "valueReference",
+            False,
+            "reference",
+            ("MolecularSequence",),
+        ),
+    ),
+    "ObservationDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("device", "device", True, "reference", ("DeviceDefinition", "Device")),
+        (
+            "hasMember",
+            "hasMember",
+            True,
+            "reference",
+            ("ObservationDefinition", "Questionnaire"),
+        ),
+        ("identifier", "identifier", False, "element", None),
+        ("specimen", "specimen", True, "reference", ("SpecimenDefinition",)),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "ObservationTriggeredBy": (
+        ("observation", "observation", False, "reference", ("Observation",)),
+    ),
+    "OperationDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "OperationOutcome": (("contained", "contained", True, "resource", None),),
+    "Organization": (
+        ("contained", "contained", True, "resource", None),
+        ("contact", "contact", True, "element", None),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        ("identifier", "identifier", True, "element", None),
+        ("partOf", "partOf", False, "reference", ("Organization",)),
+        ("qualification", "qualification", True, "element", None),
+    ),
+    "OrganizationAffiliation": (
+        ("contained", "contained", True, "resource", None),
+        ("contact", "contact", True, "element", None),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        (
+            "healthcareService",
+            "healthcareService",
+            True,
+            "reference",
+            ("HealthcareService",),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", True, "reference", ("Location",)),
+        ("network", "network", True, "reference", ("Organization",)),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        (
+            "participatingOrganization",
+            "participatingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "OrganizationQualification": (
+        ("identifier", "identifier", True, "element", None),
+        ("issuer", "issuer", False, "reference", ("Organization",)),
+    ),
+    "PackagedProductDefinition": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "attachedDocument",
+            "attachedDocument",
+            True,
+            "reference",
+            ("DocumentReference",),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("manufacturer", "manufacturer", True, "reference", ("Organization",)),
+        (
+            "packageFor",
+            "packageFor",
+            True,
+            "reference",
+            ("MedicinalProductDefinition",),
+        ),
+        ("packaging", "packaging", False, "element", None),
+    ),
+    "PackagedProductDefinitionPackaging": (
+        ("containedItem", "containedItem", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("manufacturer", "manufacturer", True, "reference", ("Organization",)),
+        ("packaging", "packaging", True, "element", None),
+    ),
+    "PackagedProductDefinitionPackagingContainedItem": (
+        (
+            "item",
+            "item",
+            False,
+            "codeable",
+            (
+                "ManufacturedItemDefinition",
+                "DeviceDefinition",
+                "PackagedProductDefinition",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+            ),
+        ),
+    ),
+    "Parameters": (("parameter", "parameter", True, "element", None),),
+    "ParametersParameter": (
+        ("part", "part", True, "element", None),
+        ("resource", "resource", False, "resource", None),
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueCodeableReference", "valueCodeableReference", False, "codeable", None),
+        ("valueDataRequirement", "valueDataRequirement", False, "element", None),
+        (
+            "valueExtendedContactDetail",
+            "valueExtendedContactDetail",
+            False,
+            "element",
+            None,
+        ),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueRelatedArtifact", "valueRelatedArtifact", False, "element", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+        ("valueTriggerDefinition", "valueTriggerDefinition", False, "element", None),
+        ("valueUsageContext", "valueUsageContext", False, "element", None),
+    ),
+    "Patient": (
+        ("contained", "contained", True, "resource", None),
+        ("contact", "contact", True, "element", None),
+        (
+            "generalPractitioner",
+            "generalPractitioner",
+            True,
+            "reference",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("link", "link", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "PatientContact": (
+        ("organization", "organization", False, "reference", ("Organization",)),
+    ),
+    "PatientLink": (
+        ("other", "other", False, "reference", ("Patient", "RelatedPerson")),
+    ),
+    "PaymentNotice": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "payee",
+            "payee",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("payment", "payment", False, "reference", ("PaymentReconciliation",)),
+        ("recipient", "recipient", False, "reference", ("Organization",)),
+        (
+            "reporter",
+            "reporter",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("request", "request", False, "reference", ("Resource",)),
+        ("response", "response", False, "reference", ("Resource",)),
+    ),
+    "PaymentReconciliation": (
+        ("contained", "contained", True, "resource", None),
+        ("allocation", "allocation", True, "element", None),
+        (
+            "enterer",
+            "enterer",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("paymentIdentifier", "paymentIdentifier", False, "element", None),
+        (
+            "paymentIssuer",
+            "paymentIssuer",
+            False,
+            "reference",
+            ("Organization", "Patient", "RelatedPerson"),
+        ),
+        ("request", "request", False, "reference", ("Task",)),
+        (
+            "requestor",
+            "requestor",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "PaymentReconciliationAllocation": (
+        ("account", "account", False, "reference", ("Account",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", False, "element", None),
+        (
+            "payee",
+            "payee",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("predecessor", "predecessor", False, "element", None),
+        ("response", "response", False, "reference", ("ClaimResponse",)),
+        ("responsible", "responsible", False, "reference", ("PractitionerRole",)),
+        (
+            "submitter",
+            "submitter",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "target",
+            "target",
+            False,
+            "reference",
+            ("Claim", "Account", "Invoice", "ChargeItem", "Encounter", "Contract"),
+        ),
+        ("targetItemIdentifier", "targetItemIdentifier", False, "element", None),
+    ),
+    "Permission": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "asserter",
+            "asserter",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+        ("justification", "justification", False, "element", None),
+        ("rule", "rule", True, "element", None),
+    ),
+    "PermissionJustification": (
+        ("evidence", "evidence", True, "reference", ("Resource",)),
+    ),
+    "PermissionRule": (
+        ("activity", "activity", True, "element", None),
+        ("data", "data", True, "element", None),
+    ),
+    "PermissionRuleActivity": (
+        (
+            "actor",
+            "actor",
+            True,
+            "reference",
+            (
+                "Device",
+                "Group",
+                "CareTeam",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "PractitionerRole",
+            ),
+        ),
+    ),
+    "PermissionRuleData": (("resource", "resource", True, "element", None),),
+    "PermissionRuleDataResource": (
+        ("reference", "reference", False, "reference", ("Resource",)),
+    ),
+    "Person": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("link", "link", True, "element", None),
+        (
+            "managingOrganization",
+            "managingOrganization",
+            False,
+            "reference",
+            ("Organization",),
+        ),
+    ),
+    "PersonLink": (
+        (
+            "target",
+            "target",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "RelatedPerson", "Person"),
+        ),
+    ),
+    "PlanDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("action", "action", True, "element", None),
+        ("actor", "actor", True, "element", None),
+        ("goal", "goal", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        (
+            "subjectReference",
+            "subjectReference",
+            False,
+            "reference",
+            (
+                "Group",
+                "MedicinalProductDefinition",
+                "SubstanceDefinition",
+                "AdministrableProductDefinition",
+                "ManufacturedItemDefinition",
+                "PackagedProductDefinition",
+            ),
+        ),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "PlanDefinitionAction": (
+        ("action", "action", True, "element", None),
+        ("documentation", "documentation", True, "element", None),
+        ("input", "input", True, "element", None),
+        ("location", "location", False, "codeable", ("Location",)),
+        ("output", "output", True, "element", None),
+        ("participant", "participant", True, "element", None),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+        ("trigger", "trigger", True, "element", None),
+    ),
+    "PlanDefinitionActionInput": (
+        ("requirement", "requirement", False, "element", None),
+    ),
+    "PlanDefinitionActionOutput": (
+        ("requirement", "requirement", False, "element", None),
+    ),
+    "PlanDefinitionActionParticipant": (
+        (
+            "typeReference",
+            "typeReference",
+            False,
+            "reference",
+            (
+                "CareTeam",
+                "Device",
+                "DeviceDefinition",
+                "Endpoint",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "PlanDefinitionActor": (("option", "option", True, "element", None),),
+    "PlanDefinitionActorOption": (
+        (
+            "typeReference",
+            "typeReference",
+            False,
+            "reference",
+            (
+                "CareTeam",
+                "Device",
+                "DeviceDefinition",
+                "Endpoint",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "PlanDefinitionGoal": (("documentation", "documentation", True, "element", None),),
+    "Practitioner": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("qualification", "qualification", True, "element", None),
+    ),
+    "PractitionerQualification": (
+        ("identifier", "identifier", True, "element", None),
+        ("issuer", "issuer", False, "reference", ("Organization",)),
+    ),
+    "PractitionerRole": (
+        ("contained", "contained", True, "resource", None),
+        ("contact", "contact", True, "element", None),
+        ("endpoint", "endpoint", True, "reference", ("Endpoint",)),
+        (
+            "healthcareService",
+            "healthcareService",
+            True,
+            "reference",
+            ("HealthcareService",),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", True, "reference", ("Location",)),
+        ("organization", "organization", False, "reference", ("Organization",)),
+        ("practitioner", "practitioner", False, "reference", ("Practitioner",)),
+    ),
+    "Procedure": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("CarePlan", "ServiceRequest")),
+        ("complication", "complication", True, "codeable", ("Condition",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("focalDevice", "focalDevice", True, "element", None),
+        (
+            "focus",
+            "focus",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "RelatedPerson",
+                "Practitioner",
+                "Organization",
+                "CareTeam",
+                "PractitionerRole",
+                "Specimen",
+            ),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        (
+            "partOf",
+            "partOf",
+            True,
+            "reference",
+            ("Procedure", "Observation", "MedicationAdministration"),
+        ),
+        ("performer", "performer", True, "element", None),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            (
+                "Condition",
+                "Observation",
+                "Procedure",
+                "DiagnosticReport",
+                "DocumentReference",
+            ),
+        ),
+        (
+            "recorder",
+            "recorder",
+            False,
+            "reference",
+            ("Patient", "RelatedPerson", "Practitioner", "PractitionerRole"),
+        ),
+        (
+            "report",
+            "report",
+            True,
+            "reference",
+            ("DiagnosticReport", "DocumentReference", "Composition"),
+        ),
+        (
+            "reportedReference",
+            "reportedReference",
+            False,
+            "reference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+            ),
+        ),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Device", "Practitioner", "Organization", "Location"),
+        ),
+        ("supportingInfo", "supportingInfo", True, "reference", ("Resource",)),
+        (
+            "used",
+            "used",
+            True,
+            "codeable",
+            ("Device", "Medication", "Substance", "BiologicallyDerivedProduct"),
+        ),
+    ),
+    "ProcedureFocalDevice": (
+        ("manipulated", "manipulated", False, "reference", ("Device",)),
+    ),
+    "ProcedurePerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+                "CareTeam",
+                "HealthcareService",
+            ),
+        ),
+        ("onBehalfOf", "onBehalfOf", False, "reference", ("Organization",)),
+    ),
+    "Provenance": (
+        ("contained", "contained", True, "resource", None),
+        ("agent", "agent", True, "element", None),
+        ("authorization", "authorization", True, "codeable", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            (
+                "CarePlan",
+                "DeviceRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "Task",
+            ),
+        ),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("entity", "entity", True, "element", None),
+        ("location", "location", False, "reference", ("Location",)),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        ("signature", "signature", True, "element", None),
+        ("target", "target", True, "reference", ("Resource",)),
+    ),
+    "ProvenanceAgent": (
+        (
+            "onBehalfOf",
+            "onBehalfOf",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization", "CareTeam", "Patient"),
+        ),
+        (
+            "who",
+            "who",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "ProvenanceEntity": (
+        ("agent", "agent", True, "element", None),
+        ("what", "what", False, "reference", ("Resource",)),
+    ),
+    "Questionnaire": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("item", "item", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "QuestionnaireItem": (
+        ("answerOption", "answerOption", True, "element", None),
+        ("enableWhen", "enableWhen", True, "element", None),
+        ("initial", "initial", True, "element", None),
+        ("item", "item", True, "element", None),
+    ),
+    "QuestionnaireItemAnswerOption": (
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "QuestionnaireItemEnableWhen": (
+        ("answerReference", "answerReference", False, "reference", ("Resource",)),
+    ),
+    "QuestionnaireItemInitial": (
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "QuestionnaireResponse": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            (
+                "Device",
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("basedOn", "basedOn", True, "reference", ("CarePlan", "ServiceRequest")),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("item", "item", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("Observation", "Procedure")),
+        (
+            "source",
+            "source",
+            False,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("subject", "subject", False, "reference", ("Resource",)),
+    ),
+    "QuestionnaireResponseItem": (
+        ("answer", "answer", True, "element", None),
+        ("item", "item", True, "element", None),
+    ),
+    "QuestionnaireResponseItemAnswer": (
+        ("item", "item", True, "element", None),
+        ("valueReference", "valueReference", False, "reference", ("Resource",)),
+    ),
+    "Reference": (("identifier", "identifier", False, "element", None),),
+    "RegulatedAuthorization": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "attachedDocument",
+            "attachedDocument",
+            True,
+            "reference",
+            ("DocumentReference",),
+        ),
+        ("case", "case", False, "element", None),
+        ("holder", "holder", False, "reference", ("Organization",)),
+        ("identifier", "identifier", True, "element", None),
+        ("indication", "indication", True, "codeable", ("ClinicalUseDefinition",)),
+        ("regulator", "regulator", False, "reference", ("Organization",)),
+        (
+            "subject",
+            "subject",
+            True,
+            "reference",
+            (
+                "MedicinalProductDefinition",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+                "PackagedProductDefinition",
+                "ManufacturedItemDefinition",
+                "Ingredient",
+                "SubstanceDefinition",
+                "DeviceDefinition",
+                "ResearchStudy",
+                "ActivityDefinition",
+                "PlanDefinition",
+                "ObservationDefinition",
+                "Practitioner",
+                "Organization",
+                "Location",
+            ),
+        ),
+    ),
+    "RegulatedAuthorizationCase": (
+        ("application", "application", True, "element", None),
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "RelatedArtifact": (
+        ("resourceReference", "resourceReference", False, "reference", ("Resource",)),
+    ),
+    "RelatedPerson": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+    ),
+    "RequestOrchestration": (
+        ("contained", "contained", True, "resource", None),
+        ("action", "action", True, "element", None),
+        (
+            "author",
+            "author",
+            False,
+            "reference",
+            ("Device", "Practitioner", "PractitionerRole"),
+        ),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("goal", "goal", True, "reference", ("Goal",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("replaces", "replaces", True, "reference", ("Resource",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "CareTeam",
+                "Device",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "RequestOrchestrationAction": (
+        ("action", "action", True, "element", None),
+        ("documentation", "documentation", True, "element", None),
+        ("goal", "goal", True, "reference", ("Goal",)),
+        ("input", "input", True, "element", None),
+        ("location", "location", False, "codeable", ("Location",)),
+        ("output", "output", True, "element", None),
+        ("participant", "participant", True, "element", None),
+        ("resource", "resource", False, "reference", ("Resource",)),
+    ),
+    "RequestOrchestrationActionInput": (
+        ("requirement", "requirement", False, "element", None),
+    ),
+    "RequestOrchestrationActionOutput": (
+        ("requirement", "requirement", False, "element", None),
+    ),
+    "RequestOrchestrationActionParticipant": (
+        (
+            "actorReference",
+            "actorReference",
+            False,
+            "reference",
+            (
+                "CareTeam",
+                "Device",
+                "DeviceDefinition",
+                "Endpoint",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "typeReference",
+            "typeReference",
+            False,
+            "reference",
+            (
+                "CareTeam",
+                "Device",
+                "DeviceDefinition",
+                "Endpoint",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "Requirements": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("statement", "statement", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "RequirementsStatement": (
+        (
+            "source",
+            "source",
+            True,
+            "reference",
+            (
+                "CareTeam",
+                "Device",
+                "Group",
+                "HealthcareService",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "ResearchStudy": (
+        ("contained", "contained", True, "resource", None),
+        ("associatedParty", "associatedParty", True, "element", None),
+        ("comparisonGroup", "comparisonGroup", True, "element", None),
+        (
+            "focus",
+            "focus",
+            True,
+            "codeable",
+            (
+                "Medication",
+                "MedicinalProductDefinition",
+                "SubstanceDefinition",
+                "EvidenceVariable",
+            ),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("outcomeMeasure", "outcomeMeasure", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("ResearchStudy",)),
+        ("protocol", "protocol", True, "reference", ("PlanDefinition",)),
+        ("recruitment", "recruitment", False, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        (
+            "result",
+            "result",
+            True,
+            "reference",
+            ("EvidenceReport", "Citation", "DiagnosticReport"),
+        ),
+        (
+            "site",
+            "site",
+            True,
+            "reference",
+            ("Location", "ResearchStudy", "Organization"),
+        ),
+    ),
+    "ResearchStudyAssociatedParty": (
+        (
+            "party",
+            "party",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "ResearchStudyComparisonGroup": (
+        (
+            "intendedExposure",
+            "intendedExposure",
+            True,
+            "reference",
+            ("EvidenceVariable",),
+        ),
+        ("observedGroup", "observedGroup", False, "reference", ("Group",)),
+    ),
+    "ResearchStudyOutcomeMeasure": (
+        ("reference", "reference", False, "reference", ("EvidenceVariable",)),
+    ),
+    "ResearchStudyRecruitment": (
+        ("actualGroup", "actualGroup", False, "reference", ("Group",)),
+        (
+            "eligibility",
+            "eligibility",
+            False,
+            "reference",
+            ("Group", "EvidenceVariable"),
+        ),
+    ),
+    "ResearchSubject": (
+        ("contained", "contained", True, "resource", None),
+        ("consent", "consent", True, "reference", ("Consent",)),
+        ("identifier", "identifier", True, "element", None),
+        ("study", "study", False, "reference", ("ResearchStudy",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "Specimen",
+                "Device",
+                "Medication",
+                "Substance",
+                "BiologicallyDerivedProduct",
+            ),
+        ),
+    ),
+    "RiskAssessment": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", False, "reference", ("Resource",)),
+        ("basis", "basis", True, "reference", ("Resource",)),
+        ("condition", "condition", False, "reference", ("Condition",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("parent", "parent", False, "reference", ("Resource",)),
+        (
+            "performer",
+            "performer",
+            False,
+            "reference",
+            ("Patient", "Practitioner", "PractitionerRole", "RelatedPerson", "Device"),
+        ),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("subject", "subject", False, "reference", ("Patient", "Group")),
+    ),
+    "Schedule": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "actor",
+            "actor",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "CareTeam",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        ("serviceType", "serviceType", True, "codeable", ("HealthcareService",)),
+    ),
+    "SearchParameter": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "ServiceRequest": (
+        ("contained", "contained", True, "resource", None),
+        (
+            "basedOn",
+            "basedOn",
+            True,
+            "reference",
+            ("CarePlan", "ServiceRequest", "MedicationRequest"),
+        ),
+        ("bodyStructure", "bodyStructure", False, "reference", ("BodyStructure",)),
+        ("code", "code", False, "codeable", ("ActivityDefinition", "PlanDefinition")),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("focus", "focus", True, "reference", ("Resource",)),
+        ("identifier", "identifier", True, "element", None),
+        ("insurance", "insurance", True, "reference", ("Coverage", "ClaimResponse")),
+        ("location", "location", True, "codeable", ("Location",)),
+        ("note", "note", True, "element", None),
+        ("orderDetail", "orderDetail", True, "element", None),
+        ("patientInstruction", "patientInstruction", True, "element", None),
+        (
+            "performer",
+            "performer",
+            True,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            (
+                "Condition",
+                "Observation",
+                "DiagnosticReport",
+                "DocumentReference",
+                "DetectedIssue",
+            ),
+        ),
+        ("relevantHistory", "relevantHistory", True, "reference", ("Provenance",)),
+        ("replaces", "replaces", True, "reference", ("ServiceRequest",)),
+        (
+            "requester",
+            "requester",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        ("requisition", "requisition", False, "element", None),
+        ("specimen", "specimen", True, "reference", ("Specimen",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            ("Patient", "Group", "Location", "Device"),
+        ),
+        ("supportingInfo", "supportingInfo", True, "codeable", ("Resource",)),
+    ),
+    "ServiceRequestOrderDetail": (
+        (
+            "parameterFocus",
+            "parameterFocus",
+            False,
+            "codeable",
+            (
+                "Device",
+                "DeviceDefinition",
+                "DeviceRequest",
+                "SupplyRequest",
+                "Medication",
+                "MedicationRequest",
+                "BiologicallyDerivedProduct",
+                "Substance",
+            ),
+        ),
+    ),
+    "ServiceRequestPatientInstruction": (
+        (
+            "instructionReference",
+            "instructionReference",
+            False,
+            "reference",
+            ("DocumentReference",),
+        ),
+    ),
+    "Signature": (
+        (
+            "onBehalfOf",
+            "onBehalfOf",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "who",
+            "who",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+    ),
+    "Slot": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("schedule", "schedule", False, "reference", ("Schedule",)),
+        ("serviceType", "serviceType", True, "codeable", ("HealthcareService",)),
+    ),
+    "Specimen": (
+        ("contained", "contained", True, "resource", None),
+        ("accessionIdentifier", "accessionIdentifier", False, "element", None),
+        ("collection", "collection", False, "element", None),
+        ("container", "container", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("parent", "parent", True, "reference", ("Specimen",)),
+        ("processing", "processing", True, "element", None),
+        ("request", "request", True, "reference", ("ServiceRequest",)),
+        (
+            "subject",
+            "subject",
+            False,
+            "reference",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "BiologicallyDerivedProduct",
+                "Substance",
+                "Location",
+            ),
+        ),
+    ),
+    "SpecimenCollection": (
+        ("bodySite", "bodySite", False, "codeable", ("BodyStructure",)),
+        (
+            "collector",
+            "collector",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson"),
+        ),
+        ("device", "device", False, "codeable", ("Device",)),
+        ("procedure", "procedure", False, "reference", ("Procedure",)),
+    ),
+    "SpecimenContainer": (
+        ("device", "device", False, "reference", ("Device",)),
+        ("location", "location", False, "reference", ("Location",)),
+    ),
+    "SpecimenDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", False, "element", None),
+        ("subjectReference", "subjectReference", False, "reference", ("Group",)),
+        ("typeTested", "typeTested", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "SpecimenDefinitionTypeTested": (
+        ("container", "container", False, "element", None),
+    ),
+    "SpecimenDefinitionTypeTestedContainer": (
+        ("additive", "additive", True, "element", None),
+    ),
+    "SpecimenDefinitionTypeTestedContainerAdditive": (
+        (
+            "additiveReference",
+            "additiveReference",
+            False,
+            "reference",
+            ("SubstanceDefinition",),
+        ),
+    ),
+    "SpecimenProcessing": (
+        ("additive", "additive", True, "reference", ("Substance",)),
+    ),
+    "StructureDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("differential", "differential", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("snapshot", "snapshot", False, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "StructureDefinitionDifferential": (("element", "element", True, "element", None),),
+    "StructureDefinitionSnapshot": (("element", "element", True, "element", None),),
+    "StructureMap": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "Subscription": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "managingEntity",
+            "managingEntity",
+            False,
+            "reference",
+            (
+                "CareTeam",
+                "HealthcareService",
+                "Organization",
+                "RelatedPerson",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+            ),
+        ),
+    ),
+    "SubscriptionStatus": (
+        ("contained", "contained", True, "resource", None),
+        ("notificationEvent", "notificationEvent", True, "element", None),
+        ("subscription", "subscription", False, "reference", ("Subscription",)),
+    ),
+    "SubscriptionStatusNotificationEvent": (
+        ("additionalContext", "additionalContext", True, "reference", ("Resource",)),
+        ("focus", "focus", False, "reference", ("Resource",)),
+    ),
+    "SubscriptionTopic": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "Substance": (
+        ("contained", "contained", True, "resource", None),
+        ("code", "code", False, "codeable", ("SubstanceDefinition",)),
+        ("identifier", "identifier", True, "element", None),
+        ("ingredient", "ingredient", True, "element", None),
+    ),
+    "SubstanceDefinition": (
+        ("contained", "contained", True, "resource", None),
+        ("code", "code", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("informationSource", "informationSource", True, "reference", ("Citation",)),
+        ("manufacturer", "manufacturer", True, "reference", ("Organization",)),
+        ("moiety", "moiety", True, "element", None),
+        ("name", "name", True, "element", None),
+        ("note", "note", True, "element", None),
+        ("nucleicAcid", "nucleicAcid", False, "reference", ("SubstanceNucleicAcid",)),
+        ("polymer", "polymer", False, "reference", ("SubstancePolymer",)),
+        ("protein", "protein", False, "reference", ("SubstanceProtein",)),
+        (
+            "referenceInformation",
+            "referenceInformation",
+            False,
+            "reference",
+            ("SubstanceReferenceInformation",),
+        ),
+        ("relationship", "relationship", True, "element", None),
+        ("structure", "structure", False, "element", None),
+        ("supplier", "supplier", True, "reference", ("Organization",)),
+    ),
+    "SubstanceDefinitionCode": (
+        ("note", "note", True, "element", None),
+        ("source", "source", True, "reference", ("DocumentReference",)),
+    ),
+    "SubstanceDefinitionMoiety": (
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "SubstanceDefinitionName": (
+        ("source", "source", True, "reference", ("DocumentReference",)),
+        ("synonym", "synonym", True, "element", None),
+        ("translation", "translation", True, "element", None),
+    ),
+    "SubstanceDefinitionRelationship": (
+        ("source", "source", True, "reference", ("DocumentReference",)),
+        (
+            "substanceDefinitionReference",
+            "substanceDefinitionReference",
+            False,
+            "reference",
+            ("SubstanceDefinition",),
+        ),
+    ),
+    "SubstanceDefinitionStructure": (
+        ("representation", "representation", True, "element", None),
+        ("sourceDocument", "sourceDocument", True, "reference", ("DocumentReference",)),
+    ),
+    "SubstanceDefinitionStructureRepresentation": (
+        ("document", "document", False, "reference", ("DocumentReference",)),
+    ),
+    "SubstanceIngredient": (
+        (
+            "substanceReference",
+            "substanceReference",
+            False,
+            "reference",
+            ("Substance",),
+        ),
+    ),
+    "SubstanceNucleicAcid": (
+        ("contained", "contained", True, "resource", None),
+        ("subunit", "subunit", True, "element", None),
+    ),
+    "SubstanceNucleicAcidSubunit": (
+        ("linkage", "linkage", True, "element", None),
+        ("sugar", "sugar", True, "element", None),
+    ),
+    "SubstanceNucleicAcidSubunitLinkage": (
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "SubstanceNucleicAcidSubunitSugar": (
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "SubstancePolymer": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "SubstanceProtein": (
+        ("contained", "contained", True, "resource", None),
+        ("subunit", "subunit", True, "element", None),
+    ),
+    "SubstanceProteinSubunit": (
+        ("cTerminalModificationId", "cTerminalModificationId", False, "element", None),
+        ("nTerminalModificationId", "nTerminalModificationId", False, "element", None),
+    ),
+    "SubstanceReferenceInformation": (
+        ("contained", "contained", True, "resource", None),
+        ("gene", "gene", True, "element", None),
+        ("geneElement", "geneElement", True, "element", None),
+        ("target", "target", True, "element", None),
+    ),
+    "SubstanceReferenceInformationGene": (
+        ("source", "source", True, "reference", ("DocumentReference",)),
+    ),
+    "SubstanceReferenceInformationGeneElement": (
+        ("element", "element", False, "element", None),
+        ("source", "source", True, "reference", ("DocumentReference",)),
+    ),
+    "SubstanceReferenceInformationTarget": (
+        ("source", "source", True, "reference", ("DocumentReference",)),
+        ("target", "target", False, "element", None),
+    ),
+    "SubstanceSourceMaterial": (
+        ("contained", "contained", True, "resource", None),
+        ("organismId", "organismId", False, "element", None),
+        ("parentSubstanceId", "parentSubstanceId", True, "element", None),
+    ),
+    "SupplyDelivery": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("SupplyRequest",)),
+        ("destination", "destination", False, "reference", ("Location",)),
+        ("identifier", "identifier", True, "element", None),
+        ("partOf", "partOf", True, "reference", ("SupplyDelivery", "Contract")),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        (
+            "receiver",
+            "receiver",
+            True,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("suppliedItem", "suppliedItem", True, "element", None),
+        (
+            "supplier",
+            "supplier",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "SupplyDeliverySuppliedItem": (
+        (
+            "itemReference",
+            "itemReference",
+            False,
+            "reference",
+            (
+                "Medication",
+                "Substance",
+                "Device",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+                "InventoryItem",
+            ),
+        ),
+    ),
+    "SupplyRequest": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("deliverFor", "deliverFor", False, "reference", ("Patient",)),
+        (
+            "deliverFrom",
+            "deliverFrom",
+            False,
+            "reference",
+            ("Organization", "Location"),
+        ),
+        (
+            "deliverTo",
+            "deliverTo",
+            False,
+            "reference",
+            ("Organization", "Location", "Patient", "RelatedPerson"),
+        ),
+        ("identifier", "identifier", True, "element", None),
+        (
+            "item",
+            "item",
+            False,
+            "codeable",
+            (
+                "Medication",
+                "Substance",
+                "Device",
+                "DeviceDefinition",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+                "InventoryItem",
+            ),
+        ),
+        (
+            "reason",
+            "reason",
+            True,
+            "codeable",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        (
+            "requester",
+            "requester",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+                "CareTeam",
+            ),
+        ),
+        (
+            "supplier",
+            "supplier",
+            True,
+            "reference",
+            ("Organization", "HealthcareService"),
+        ),
+    ),
+    "Task": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("focus", "focus", False, "reference", ("Resource",)),
+        ("for_fhir", "for", False, "reference", ("Resource",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("input", "input", True, "element", None),
+        ("insurance", "insurance", True, "reference", ("Coverage", "ClaimResponse")),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        ("output", "output", True, "element", None),
+        (
+            "owner",
+            "owner",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("partOf", "partOf", True, "reference", ("Task",)),
+        ("performer", "performer", True, "element", None),
+        ("reason", "reason", True, "codeable", None),
+        ("relevantHistory", "relevantHistory", True, "reference", ("Provenance",)),
+        (
+            "requestedPerformer",
+            "requestedPerformer",
+            True,
+            "codeable",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "requester",
+            "requester",
+            False,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("restriction", "restriction", False, "element", None),
+        ("statusReason", "statusReason", False, "codeable", None),
+    ),
+    "TaskInput": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueCodeableReference", "valueCodeableReference", False, "codeable", None),
+        ("valueDataRequirement", "valueDataRequirement", False, "element", None),
+        (
+            "valueExtendedContactDetail",
+            "valueExtendedContactDetail",
+            False,
+            "element",
+            None,
+        ),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueRelatedArtifact", "valueRelatedArtifact", False, "element", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+        ("valueTriggerDefinition", "valueTriggerDefinition", False, "element", None),
+        ("valueUsageContext", "valueUsageContext", False, "element", None),
+    ),
+    "TaskOutput": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueCodeableReference", "valueCodeableReference", False, "codeable", None),
+        ("valueDataRequirement", "valueDataRequirement", False, "element", None),
+        (
+            "valueExtendedContactDetail",
+            "valueExtendedContactDetail",
+            False,
+            "element",
+            None,
+        ),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueRelatedArtifact", "valueRelatedArtifact", False, "element", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+        ("valueTriggerDefinition", "valueTriggerDefinition", False, "element", None),
+        ("valueUsageContext", "valueUsageContext", False, "element", None),
+    ),
+    "TaskPerformer": (
+        (
+            "actor",
+            "actor",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "TaskRestriction": (
+        (
+            "recipient",
+            "recipient",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Group",
+                "Organization",
+            ),
+        ),
+    ),
+    "TerminologyCapabilities": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "TestPlan": (
+        ("contained", "contained", True, "resource", None),
+        ("dependency", "dependency", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("scope", "scope", True, "reference", None),
+        ("testCase", "testCase", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "TestPlanDependency": (("predecessor", "predecessor", False, "reference", None),),
+    "TestPlanTestCase": (
+        ("assertion", "assertion", True, "element", None),
+        ("dependency", "dependency", True, "element", None),
+        ("scope", "scope", True, "reference", None),
+        ("testData", "testData", True, "element", None),
+        ("testRun", "testRun", True, "element", None),
+    ),
+    "TestPlanTestCaseAssertion": (
+        ("object", "object", True, "codeable", None),
+        ("result", "result", True, "codeable", None),
+    ),
+    "TestPlanTestCaseDependency": (
+        ("predecessor", "predecessor", False, "reference", None),
+    ),
+    "TestPlanTestCaseTestData": (
+        ("content", "content", False, "reference", None),
+        ("sourceReference", "sourceReference", False, "reference", None),
+    ),
+    "TestPlanTestCaseTestRun": (("script", "script", False, "element", None),),
+    "TestPlanTestCaseTestRunScript": (
+        ("sourceReference", "sourceReference", False, "reference", None),
+    ),
+    "TestReport": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", False, "element", None),
+    ),
+    "TestScript": (
+        ("contained", "contained", True, "resource", None),
+        ("fixture", "fixture", True, "element", None),
+        ("identifier", "identifier", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "TestScriptFixture": (("resource", "resource", False, "reference", ("Resource",)),),
+    "Transport": (
+        ("contained", "contained", True, "resource", None),
+        ("basedOn", "basedOn", True, "reference", ("Resource",)),
+        ("currentLocation", "currentLocation", False, "reference", ("Location",)),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("focus", "focus", False, "reference", ("Resource",)),
+        ("for_fhir", "for", False, "reference", ("Resource",)),
+        ("groupIdentifier", "groupIdentifier", False, "element", None),
+        ("history", "history", False, "reference", ("Transport",)),
+        ("identifier", "identifier", True, "element", None),
+        ("input", "input", True, "element", None),
+        ("insurance", "insurance", True, "reference", ("Coverage", "ClaimResponse")),
+        ("location", "location", False, "reference", ("Location",)),
+        ("note", "note", True, "element", None),
+        ("output", "output", True, "element", None),
+        (
+            "owner",
+            "owner",
+            False,
+            "reference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("partOf", "partOf", True, "reference", ("Transport",)),
+        ("reason", "reason", False, "codeable", ("Resource",)),
+        ("relevantHistory", "relevantHistory", True, "reference", ("Provenance",)),
+        ("requestedLocation", "requestedLocation", False, "reference", ("Location",)),
+        (
+            "requester",
+            "requester",
+            False,
+            "reference",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("restriction", "restriction", False, "element", None),
+    ),
+    "TransportInput": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueCodeableReference", "valueCodeableReference", False, "codeable", None),
+        ("valueDataRequirement", "valueDataRequirement", False, "element", None),
+        (
+            "valueExtendedContactDetail",
+            "valueExtendedContactDetail",
+            False,
+            "element",
+            None,
+        ),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueRelatedArtifact", "valueRelatedArtifact", False, "element", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+        ("valueTriggerDefinition", "valueTriggerDefinition", False, "element", None),
+        ("valueUsageContext", "valueUsageContext", False, "element", None),
+    ),
+    "TransportOutput": (
+        ("valueAnnotation", "valueAnnotation", False, "element", None),
+        ("valueCodeableReference", "valueCodeableReference", False, "codeable", None),
+        ("valueDataRequirement", "valueDataRequirement", False, "element", None),
+        (
+            "valueExtendedContactDetail",
+            "valueExtendedContactDetail",
+            False,
+            "element",
+            None,
+        ),
+        ("valueIdentifier", "valueIdentifier", False, "element", None),
+        ("valueReference", "valueReference", False, "reference", None),
+        ("valueRelatedArtifact", "valueRelatedArtifact", False, "element", None),
+        ("valueSignature", "valueSignature", False, "element", None),
+        ("valueTriggerDefinition", "valueTriggerDefinition", False, "element", None),
+        ("valueUsageContext", "valueUsageContext", False, "element", None),
+    ),
+    "TransportRestriction": (
+        (
+            "recipient",
+            "recipient",
+            True,
+            "reference",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Group",
+                "Organization",
+            ),
+        ),
+    ),
+    "TriggerDefinition": (
+        ("data", "data", True, "element", None),
+        ("timingReference", "timingReference", False, "reference", ("Schedule",)),
+    ),
+    "UsageContext": (
+        (
+            "valueReference",
+            "valueReference",
+            False,
+            "reference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ValueSet": (
+        ("contained", "contained", True, "resource", None),
+        ("identifier", "identifier", True, "element", None),
+        ("relatedArtifact", "relatedArtifact", True, "element", None),
+        ("useContext", "useContext", True, "element", None),
+    ),
+    "VerificationResult": (
+        ("contained", "contained", True, "resource", None),
+        ("attestation", "attestation", False, "element", None),
+        ("primarySource", "primarySource", True, "element", None),
+        ("target", "target", True, "reference", ("Resource",)),
+        ("validator", "validator", True, "element", None),
+    ),
+    "VerificationResultAttestation": (
+        (
+            "onBehalfOf",
+            "onBehalfOf",
+            False,
+            "reference",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+        ("proxySignature", "proxySignature", False, "element", None),
+        ("sourceSignature", "sourceSignature", False, "element", None),
+        (
+            "who",
+            "who",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "VerificationResultPrimarySource": (
+        (
+            "who",
+            "who",
+            False,
+            "reference",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+    ),
+    "VerificationResultValidator": (
+        ("attestationSignature", "attestationSignature", False, "element", None),
+        ("organization", "organization", False, "reference", ("Organization",)),
+    ),
+    "VirtualServiceDetail": (
+        (
+            "addressExtendedContactDetail",
+            "addressExtendedContactDetail",
+            False,
+            "element",
+            None,
+        ),
+    ),
+    "VisionPrescription": (
+        ("contained", "contained", True, "resource", None),
+        ("encounter", "encounter", False, "reference", ("Encounter",)),
+        ("identifier", "identifier", True, "element", None),
+        ("lensSpecification", "lensSpecification", True, "element", None),
+        ("patient", "patient", False, "reference", ("Patient",)),
+        (
+            "prescriber",
+            "prescriber",
+            False,
+            "reference",
+            ("Practitioner", "PractitionerRole"),
+        ),
+    ),
+    "VisionPrescriptionLensSpecification": (("note", "note", True, "element", None),),
+}
+
+# {resource type: ((FHIR path, target types), ...)}
+REFERENCE_PATHS: typing.Dict[
+    str, typing.Tuple[typing.Tuple[str, typing.Optional[typing.Tuple[str, ...]]], ...]
+] = {
+    "Account": (
+        ("Account.coverage[*].coverage", ("Coverage",)),
+        ("Account.diagnosis[*].condition", ("Condition",)),
+        ("Account.guarantor[*].party", ("Patient", "RelatedPerson", "Organization")),
+        ("Account.identifier[*].assigner", ("Organization",)),
+        ("Account.owner", ("Organization",)),
+        ("Account.procedure[*].code", ("Procedure",)),
+        ("Account.procedure[*].device[*]", ("Device",)),
+        ("Account.relatedAccount[*].account", ("Account",)),
+        (
+            "Account.subject[*]",
+            (
+                "Patient",
+                "Device",
+                "Practitioner",
+                "PractitionerRole",
+                "Location",
+                "HealthcareService",
+                "Organization",
+            ),
+        ),
+    ),
+    "ActivityDefinition": (
+        ("ActivityDefinition.identifier[*].assigner", ("Organization",)),
+        ("ActivityDefinition.location", ("Location",)),
+        (
+            "ActivityDefinition.participant[*].typeReference",
+            (
+                "CareTeam",
+                "Device",
+                "DeviceDefinition",
+                "Endpoint",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "ActivityDefinition.productReference",
+            ("Medication", "Ingredient", "Substance", "SubstanceDefinition"),
+        ),
+        ("ActivityDefinition.relatedArtifact[*].resourceReference", ("Resource",)),
+        (
+            "ActivityDefinition.subjectReference",
+            (
+                "Group",
+                "MedicinalProductDefinition",
+                "SubstanceDefinition",
+                "AdministrableProductDefinition",
+                "ManufacturedItemDefinition",
+                "PackagedProductDefinition",
+            ),
+        ),
+        (
+            "ActivityDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ActorDefinition": (
+        ("ActorDefinition.identifier[*].assigner", ("Organization",)),
+        (
+            "ActorDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "AdministrableProductDefinition": (
+        ("AdministrableProductDefinition.device", ("DeviceDefinition",)),
+        ("AdministrableProductDefinition.formOf[*]", ("MedicinalProductDefinition",)),
+        ("AdministrableProductDefinition.identifier[*].assigner", ("Organization",)),
+        (
+            "AdministrableProductDefinition.producedFrom[*]",
+            ("ManufacturedItemDefinition",),
+        ),
+        ("AdministrableProductDefinition.property[*].valueReference", ("Binary",)),
+    ),
+    "AdverseEvent": (
+        (
+            "AdverseEvent.contributingFactor[*].itemReference",
+            (
+                "Condition",
+                "Observation",
+                "AllergyIntolerance",
+                "FamilyMemberHistory",
+                "Immunization",
+                "Procedure",
+                "Device",
+                "DeviceUsage",
+                "DocumentReference",
+                "MedicationAdministration",
+                "MedicationStatement",
+            ),
+        ),
+        ("AdverseEvent.encounter", ("Encounter",)),
+        ("AdverseEvent.identifier[*].assigner", ("Organization",)),
+        ("AdverseEvent.location", ("Location",)),
+        (
+            "AdverseEvent.mitigatingAction[*].itemReference",
+            (
+                "Procedure",
+                "DocumentReference",
+                "MedicationAdministration",
+                "MedicationRequest",
+            ),
+        ),
+        (
+            "AdverseEvent.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "AdverseEvent.participant[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "ResearchSubject",
+            ),
+        ),
+        (
+            "AdverseEvent.preventiveAction[*].itemReference",
+            (
+                "Immunization",
+                "Procedure",
+                "DocumentReference",
+                "MedicationAdministration",
+                "MedicationRequest",
+            ),
+        ),
+        (
+            "AdverseEvent.recorder",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "ResearchSubject",
+            ),
+        ),
+        ("AdverseEvent.resultingEffect[*]", ("Condition", "Observation")),
+        ("AdverseEvent.study[*]", ("ResearchStudy",)),
+        (
+            "AdverseEvent.subject",
+            ("Patient", "Group", "Practitioner", "RelatedPerson", "ResearchSubject"),
+        ),
+        (
+            "AdverseEvent.supportingInfo[*].itemReference",
+            (
+                "Condition",
+                "Observation",
+                "AllergyIntolerance",
+                "FamilyMemberHistory",
+                "Immunization",
+                "Procedure",
+                "DocumentReference",
+                "MedicationAdministration",
+                "MedicationStatement",
+                "QuestionnaireResponse",
+            ),
+        ),
+        (
+            "AdverseEvent.suspectEntity[*].causality.author",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "ResearchSubject",
+            ),
+        ),
+        (
+            "AdverseEvent.suspectEntity[*].instanceReference",
+            (
+                "Immunization",
+                "Procedure",
+                "Substance",
+                "Medication",
+                "MedicationAdministration",
+                "MedicationStatement",
+                "Device",
+                "BiologicallyDerivedProduct",
+                "ResearchStudy",
+            ),
+        ),
+    ),
+    "AllergyIntolerance": (
+        ("AllergyIntolerance.encounter", ("Encounter",)),
+        ("AllergyIntolerance.identifier[*].assigner", ("Organization",)),
+        (
+            "AllergyIntolerance.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "AllergyIntolerance.participant[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        ("AllergyIntolerance.patient", ("Patient",)),
+        ("AllergyIntolerance.reaction[*].manifestation[*]", ("Observation",)),
+        (
+            "AllergyIntolerance.reaction[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+    ),
+    "Appointment": (
+        ("Appointment.account[*]", ("Account",)),
+        (
+            "Appointment.basedOn[*]",
+            ("CarePlan", "DeviceRequest", "MedicationRequest", "ServiceRequest"),
+        ),
+        ("Appointment.identifier[*].assigner", ("Organization",)),
+        (
+            "Appointment.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Appointment.originatingAppointment", ("Appointment",)),
+        (
+            "Appointment.participant[*].actor",
+            (
+                "Patient",
+                "Group",
+                "Practitioner",
+                "PractitionerRole",
+                "CareTeam",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        (
+            "Appointment.patientInstruction[*]",
+            ("DocumentReference", "Binary", "Communication"),
+        ),
+        ("Appointment.previousAppointment", ("Appointment",)),
+        (
+            "Appointment.reason[*]",
+            ("Condition", "Procedure", "Observation", "ImmunizationRecommendation"),
+        ),
+        ("Appointment.replaces[*]", ("Appointment",)),
+        ("Appointment.serviceType[*]", ("HealthcareService",)),
+        ("Appointment.slot[*]", ("Slot",)),
+        ("Appointment.subject", ("Patient", "Group")),
+        ("Appointment.supportingInformation[*]", ("Resource",)),
+        (
+            "Appointment.virtualService[*].addressExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+    ),
+    "AppointmentResponse": (
+        (
+            "AppointmentResponse.actor",
+            (
+                "Patient",
+                "Group",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        ("AppointmentResponse.appointment", ("Appointment",)),
+        ("AppointmentResponse.identifier[*].assigner", ("Organization",)),
+    ),
+    "ArtifactAssessment": (
+        ("ArtifactAssessment.artifactReference", ("Resource",)),
+        ("ArtifactAssessment.citeAsReference", ("Citation",)),
+        (
+            "ArtifactAssessment.content[*].author",
+            ("Patient", "Practitioner", "PractitionerRole", "Organization", "Device"),
+        ),
+        (
+            "ArtifactAssessment.content[*].relatedArtifact[*].resourceReference",
+            ("Resource",),
+        ),
+        ("ArtifactAssessment.identifier[*].assigner", ("Organization",)),
+    ),
+    "AuditEvent": (
+        ("AuditEvent.agent[*].location", ("Location",)),
+        ("AuditEvent.agent[*].networkReference", ("Endpoint",)),
+        (
+            "AuditEvent.agent[*].who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "AuditEvent.basedOn[*]",
+            (
+                "CarePlan",
+                "DeviceRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "Task",
+            ),
+        ),
+        ("AuditEvent.encounter", ("Encounter",)),
+        ("AuditEvent.entity[*].agent[*].location", ("Location",)),
+        ("AuditEvent.entity[*].agent[*].networkReference", ("Endpoint",)),
+        (
+            "AuditEvent.entity[*].agent[*].who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("AuditEvent.entity[*].what", ("Resource",)),
+        ("AuditEvent.patient", ("Patient",)),
+        (
+            "AuditEvent.source.observer",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("AuditEvent.source.site", ("Location",)),
+    ),
+    "Basic": (
+        (
+            "Basic.author",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+                "Device",
+                "CareTeam",
+            ),
+        ),
+        ("Basic.identifier[*].assigner", ("Organization",)),
+        ("Basic.subject", ("Resource",)),
+    ),
+    "Binary": (("Binary.securityContext", ("Resource",)),),
+    "BiologicallyDerivedProduct": (
+        (
+            "BiologicallyDerivedProduct.biologicalSourceEvent.assigner",
+            ("Organization",),
+        ),
+        (
+            "BiologicallyDerivedProduct.collection.collector",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("BiologicallyDerivedProduct.collection.source", ("Patient", "Organization")),
+        ("BiologicallyDerivedProduct.identifier[*].assigner", ("Organization",)),
+        ("BiologicallyDerivedProduct.parent[*]", ("BiologicallyDerivedProduct",)),
+        ("BiologicallyDerivedProduct.processingFacility[*]", ("Organization",)),
+        ("BiologicallyDerivedProduct.request[*]", ("ServiceRequest",)),
+    ),
+    "BiologicallyDerivedProductDispense": (
+        ("BiologicallyDerivedProductDispense.basedOn[*]", ("ServiceRequest",)),
+        ("BiologicallyDerivedProductDispense.destination", ("Location",)),
+        (
+            "BiologicallyDerivedProductDispense.identifier[*].assigner",
+            ("Organization",),
+        ),
+        ("BiologicallyDerivedProductDispense.location", ("Location",)),
+        (
+            "BiologicallyDerivedProductDispense.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "BiologicallyDerivedProductDispense.partOf[*]",
+            ("BiologicallyDerivedProductDispense",),
+        ),
+        ("BiologicallyDerivedProductDispense.patient", ("Patient",)),
+        ("BiologicallyDerivedProductDispense.performer[*].actor", ("Practitioner",)),
+        ("BiologicallyDerivedProductDispense.product", ("BiologicallyDerivedProduct",)),
+    ),
+    "BodyStructure": (
+        (
+            "BodyStructure.excludedStructure[*].bodyLandmarkOrientation[*].distanceFromLandmark[*].device[*]",
+            ("Device",),
+        ),
+        (
+            "BodyStructure.excludedStructure[*].spatialReference[*]",
+            ("ImagingSelection",),
+        ),
+        ("BodyStructure.identifier[*].assigner", ("Organization",)),
+        (
+            "BodyStructure.includedStructure[*].bodyLandmarkOrientation[*].distanceFromLandmark[*].device[*]",
+            ("Device",),
+        ),
+        (
+            "BodyStructure.includedStructure[*].spatialReference[*]",
+            ("ImagingSelection",),
+        ),
+        ("BodyStructure.patient", ("Patient",)),
+    ),
+    "Bundle": (
+        ("Bundle.identifier.assigner", ("Organization",)),
+        (
+            "Bundle.signature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Bundle.signature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+    ),
+    "CanonicalResource": (
+        ("CanonicalResource.identifier[*].assigner", ("Organization",)),
+        (
+            "CanonicalResource.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "CapabilityStatement": (
+        ("CapabilityStatement.identifier[*].assigner", ("Organization",)),
+        ("CapabilityStatement.implementation.custodian", ("Organization",)),
+        (
+            "CapabilityStatement.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "CarePlan": (
+        ("CarePlan.activity[*].performedActivity[*]", ("Resource",)),
+        (
+            "CarePlan.activity[*].plannedActivityReference",
+            (
+                "Appointment",
+                "CommunicationRequest",
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "Task",
+                "ServiceRequest",
+                "VisionPrescription",
+                "RequestOrchestration",
+                "ImmunizationRecommendation",
+                "SupplyRequest",
+            ),
+        ),
+        (
+            "CarePlan.activity[*].progress[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("CarePlan.addresses[*]", ("Condition",)),
+        (
+            "CarePlan.basedOn[*]",
+            ("CarePlan", "ServiceRequest", "RequestOrchestration", "NutritionOrder"),
+        ),
+        ("CarePlan.careTeam[*]", ("CareTeam",)),
+        (
+            "CarePlan.contributor[*]",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "RelatedPerson",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        (
+            "CarePlan.custodian",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "RelatedPerson",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        ("CarePlan.encounter", ("Encounter",)),
+        ("CarePlan.goal[*]", ("Goal",)),
+        ("CarePlan.identifier[*].assigner", ("Organization",)),
+        (
+            "CarePlan.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("CarePlan.partOf[*]", ("CarePlan",)),
+        ("CarePlan.replaces[*]", ("CarePlan",)),
+        ("CarePlan.subject", ("Patient", "Group")),
+        ("CarePlan.supportingInfo[*]", ("Resource",)),
+    ),
+    "CareTeam": (
+        ("CareTeam.identifier[*].assigner", ("Organization",)),
+        ("CareTeam.managingOrganization[*]", ("Organization",)),
+        (
+            "CareTeam.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "CareTeam.participant[*].member",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        ("CareTeam.participant[*].onBehalfOf", ("Organization",)),
+        ("CareTeam.reason[*]", ("Condition",)),
+        ("CareTeam.subject", ("Patient", "Group")),
+    ),
+    "ChargeItem": (
+        ("ChargeItem.account[*]", ("Account",)),
+        ("ChargeItem.costCenter", ("Organization",)),
+        ("ChargeItem.encounter", ("Encounter",)),
+        (
+            "ChargeItem.enterer",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("ChargeItem.identifier[*].assigner", ("Organization",)),
+        (
+            "ChargeItem.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("ChargeItem.partOf[*]", ("ChargeItem",)),
+        (
+            "ChargeItem.performer[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "HealthcareService",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("ChargeItem.performingOrganization", ("Organization",)),
+        ("ChargeItem.product[*]", ("Device", "Medication", "Substance")),
+        ("ChargeItem.requestingOrganization", ("Organization",)),
+        (
+            "ChargeItem.service[*]",
+            (
+                "DiagnosticReport",
+                "ImagingStudy",
+                "Immunization",
+                "MedicationAdministration",
+                "MedicationDispense",
+                "MedicationRequest",
+                "Observation",
+                "Procedure",
+                "ServiceRequest",
+                "SupplyDelivery",
+            ),
+        ),
+        ("ChargeItem.subject", ("Patient", "Group")),
+        ("ChargeItem.supportingInformation[*]", ("Resource",)),
+    ),
+    "ChargeItemDefinition": (
+        (
+            "ChargeItemDefinition.applicability[*].relatedArtifact.resourceReference",
+            ("Resource",),
+        ),
+        ("ChargeItemDefinition.identifier[*].assigner", ("Organization",)),
+        (
+            "ChargeItemDefinition.instance[*]",
+            (
+                "Medication",
+                "Substance",
+                "Device",
+                "DeviceDefinition",
+                "ActivityDefinition",
+                "PlanDefinition",
+                "HealthcareService",
+            ),
+        ),
+        (
+            "ChargeItemDefinition.propertyGroup[*].applicability[*].relatedArtifact.resourceReference",
+            ("Resource",),
+        ),
+        (
+            "ChargeItemDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Citation": (
+        (
+            "Citation.citedArtifact.classification[*].artifactAssessment[*]",
+            ("ArtifactAssessment",),
+        ),
+        (
+            "Citation.citedArtifact.contributorship.entry[*].affiliation[*]",
+            ("Organization", "PractitionerRole"),
+        ),
+        (
+            "Citation.citedArtifact.contributorship.entry[*].contributor",
+            ("Practitioner", "Organization"),
+        ),
+        ("Citation.citedArtifact.identifier[*].assigner", ("Organization",)),
+        (
+            "Citation.citedArtifact.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Citation.citedArtifact.part.baseCitation", ("Citation",)),
+        (
+            "Citation.citedArtifact.publicationForm[*].publishedIn.identifier[*].assigner",
+            ("Organization",),
+        ),
+        (
+            "Citation.citedArtifact.publicationForm[*].publishedIn.publisher",
+            ("Organization",),
+        ),
+        ("Citation.citedArtifact.relatedIdentifier[*].assigner", ("Organization",)),
+        ("Citation.citedArtifact.relatesTo[*].resourceReference", None),
+        ("Citation.citedArtifact.version.baseCitation", ("Citation",)),
+        ("Citation.identifier[*].assigner", ("Organization",)),
+        (
+            "Citation.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Citation.relatedArtifact[*].resourceReference", ("Resource",)),
+        (
+            "Citation.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Claim": (
+        ("Claim.accident.locationReference", ("Location",)),
+        (
+            "Claim.careTeam[*].provider",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("Claim.diagnosis[*].diagnosisReference", ("Condition",)),
+        ("Claim.encounter[*]", ("Encounter",)),
+        (
+            "Claim.enterer",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson"),
+        ),
+        ("Claim.facility", ("Location", "Organization")),
+        ("Claim.identifier[*].assigner", ("Organization",)),
+        ("Claim.insurance[*].claimResponse", ("ClaimResponse",)),
+        ("Claim.insurance[*].coverage", ("Coverage",)),
+        ("Claim.insurance[*].identifier.assigner", ("Organization",)),
+        ("Claim.insurer", ("Organization",)),
+        ("Claim.item[*].bodySite[*].site[*]", ("BodyStructure",)),
+        (
+            "Claim.item[*].detail[*].subDetail[*].traceNumber[*].assigner",
+            ("Organization",),
+        ),
+        ("Claim.item[*].detail[*].subDetail[*].udi[*]", ("Device",)),
+        ("Claim.item[*].detail[*].traceNumber[*].assigner", ("Organization",)),
+        ("Claim.item[*].detail[*].udi[*]", ("Device",)),
+        ("Claim.item[*].encounter[*]", ("Encounter",)),
+        ("Claim.item[*].locationReference", ("Location",)),
+        (
+            "Claim.item[*].request[*]",
+            (
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "SupplyRequest",
+                "VisionPrescription",
+            ),
+        ),
+        ("Claim.item[*].traceNumber[*].assigner", ("Organization",)),
+        ("Claim.item[*].udi[*]", ("Device",)),
+        (
+            "Claim.originalPrescription",
+            ("DeviceRequest", "MedicationRequest", "VisionPrescription"),
+        ),
+        ("Claim.patient", ("Patient",)),
+        (
+            "Claim.payee.party",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "Claim.prescription",
+            ("DeviceRequest", "MedicationRequest", "VisionPrescription"),
+        ),
+        ("Claim.procedure[*].procedureReference", ("Procedure",)),
+        ("Claim.procedure[*].udi[*]", ("Device",)),
+        ("Claim.provider", ("Practitioner", "PractitionerRole", "Organization")),
+        ("Claim.referral", ("ServiceRequest",)),
+        ("Claim.related[*].claim", ("Claim",)),
+        ("Claim.related[*].reference.assigner", ("Organization",)),
+        ("Claim.supportingInfo[*].valueIdentifier.assigner", ("Organization",)),
+        ("Claim.supportingInfo[*].valueReference", ("Resource",)),
+        ("Claim.traceNumber[*].assigner", ("Organization",)),
+    ),
+    "ClaimResponse": (
+        ("ClaimResponse.addItem[*].bodySite[*].site[*]", ("BodyStructure",)),
+        (
+            "ClaimResponse.addItem[*].detail[*].subDetail[*].traceNumber[*].assigner",
+            ("Organization",),
+        ),
+        (
+            "ClaimResponse.addItem[*].detail[*].traceNumber[*].assigner",
+            ("Organization",),
+        ),
+        ("ClaimResponse.addItem[*].locationReference", ("Location",)),
+        (
+            "ClaimResponse.addItem[*].provider[*]",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "ClaimResponse.addItem[*].request[*]",
+            (
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "SupplyRequest",
+                "VisionPrescription",
+            ),
+        ),
+        ("ClaimResponse.addItem[*].traceNumber[*].assigner", ("Organization",)),
+        ("ClaimResponse.communicationRequest[*]", ("CommunicationRequest",)),
+        ("ClaimResponse.encounter[*]", ("Encounter",)),
+        ("ClaimResponse.identifier[*].assigner", ("Organization",)),
+        ("ClaimResponse.insurance[*].claimResponse", ("ClaimResponse",)),
+        ("ClaimResponse.insurance[*].coverage", ("Coverage",)),
+        ("ClaimResponse.insurer", ("Organization",)),
+        (
+            "ClaimResponse.item[*].detail[*].subDetail[*].traceNumber[*].assigner",
+            ("Organization",),
+        ),
+        ("ClaimResponse.item[*].detail[*].traceNumber[*].assigner", ("Organization",)),
+        ("ClaimResponse.item[*].traceNumber[*].assigner", ("Organization",)),
+        ("ClaimResponse.patient", ("Patient",)),
+        ("ClaimResponse.payment.identifier.assigner", ("Organization",)),
+        ("ClaimResponse.request", ("Claim",)),
+        (
+            "ClaimResponse.requestor",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("ClaimResponse.traceNumber[*].assigner", ("Organization",)),
+    ),
+    "ClinicalImpression": (
+        ("ClinicalImpression.encounter", ("Encounter",)),
+        (
+            "ClinicalImpression.finding[*].item",
+            ("Condition", "Observation", "DocumentReference"),
+        ),
+        ("ClinicalImpression.identifier[*].assigner", ("Organization",)),
+        (
+            "ClinicalImpression.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("ClinicalImpression.performer", ("Practitioner", "PractitionerRole")),
+        ("ClinicalImpression.previous", ("ClinicalImpression",)),
+        ("ClinicalImpression.problem[*]", ("Condition", "AllergyIntolerance")),
+        ("ClinicalImpression.prognosisReference[*]", ("RiskAssessment",)),
+        ("ClinicalImpression.subject", ("Patient", "Group")),
+        ("ClinicalImpression.supportingInfo[*]", ("Resource",)),
+    ),
+    "ClinicalUseDefinition": (
+        (
+            "ClinicalUseDefinition.contraindication.comorbidity[*]",
+            ("ObservationDefinition",),
+        ),
+        (
+            "ClinicalUseDefinition.contraindication.diseaseStatus",
+            ("ObservationDefinition",),
+        ),
+        (
+            "ClinicalUseDefinition.contraindication.diseaseSymptomProcedure",
+            ("ObservationDefinition",),
+        ),
+        (
+            "ClinicalUseDefinition.contraindication.indication[*]",
+            ("ClinicalUseDefinition",),
+        ),
+        (
+            "ClinicalUseDefinition.contraindication.otherTherapy[*].treatment",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "Substance",
+                "SubstanceDefinition",
+                "NutritionProduct",
+                "BiologicallyDerivedProduct",
+                "ActivityDefinition",
+            ),
+        ),
+        ("ClinicalUseDefinition.identifier[*].assigner", ("Organization",)),
+        ("ClinicalUseDefinition.indication.comorbidity[*]", ("ObservationDefinition",)),
+        ("ClinicalUseDefinition.indication.diseaseStatus", ("ObservationDefinition",)),
+        (
+            "ClinicalUseDefinition.indication.diseaseSymptomProcedure",
+            ("ObservationDefinition",),
+        ),
+        ("ClinicalUseDefinition.indication.intendedEffect", ("ObservationDefinition",)),
+        (
+            "ClinicalUseDefinition.indication.otherTherapy[*].treatment",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "Substance",
+                "SubstanceDefinition",
+                "NutritionProduct",
+                "BiologicallyDerivedProduct",
+                "ActivityDefinition",
+            ),
+        ),
+        (
+            "ClinicalUseDefinition.indication.undesirableEffect[*]",
+            ("ClinicalUseDefinition",),
+        ),
+        ("ClinicalUseDefinition.interaction.effect", ("ObservationDefinition",)),
+        (
+            "ClinicalUseDefinition.interaction.interactant[*].itemReference",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "Substance",
+                "NutritionProduct",
+                "BiologicallyDerivedProduct",
+                "ObservationDefinition",
+            ),
+        ),
+        ("ClinicalUseDefinition.population[*]", ("Group",)),
+        (
+            "ClinicalUseDefinition.subject[*]",
+            (
+                "MedicinalProductDefinition",
+                "Medication",
+                "ActivityDefinition",
+                "PlanDefinition",
+                "Device",
+                "DeviceDefinition",
+                "Substance",
+                "NutritionProduct",
+                "BiologicallyDerivedProduct",
+            ),
+        ),
+        (
+            "ClinicalUseDefinition.undesirableEffect.symptomConditionEffect",
+            ("ObservationDefinition",),
+        ),
+    ),
+    "CodeSystem": (
+        ("CodeSystem.identifier[*].assigner", ("Organization",)),
+        ("CodeSystem.relatedArtifact[*].resourceReference", ("Resource",)),
+        (
+            "CodeSystem.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Communication": (
+        ("Communication.about[*]", ("Resource",)),
+        ("Communication.basedOn[*]", ("Resource",)),
+        ("Communication.encounter", ("Encounter",)),
+        ("Communication.identifier[*].assigner", ("Organization",)),
+        ("Communication.inResponseTo[*]", ("Communication",)),
+        (
+            "Communication.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Communication.partOf[*]", ("Resource",)),
+        ("Communication.payload[*].contentReference", ("Resource",)),
+        ("Communication.reason[*]", ("Resource",)),
+        (
+            "Communication.recipient[*]",
+            (
+                "CareTeam",
+                "Device",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Endpoint",
+            ),
+        ),
+        (
+            "Communication.sender",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "HealthcareService",
+                "Endpoint",
+                "CareTeam",
+            ),
+        ),
+        ("Communication.subject", ("Patient", "Group")),
+    ),
+    "CommunicationRequest": (
+        ("CommunicationRequest.about[*]", ("Resource",)),
+        ("CommunicationRequest.basedOn[*]", ("Resource",)),
+        ("CommunicationRequest.encounter", ("Encounter",)),
+        ("CommunicationRequest.groupIdentifier.assigner", ("Organization",)),
+        ("CommunicationRequest.identifier[*].assigner", ("Organization",)),
+        (
+            "CommunicationRequest.informationProvider[*]",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "HealthcareService",
+                "Endpoint",
+            ),
+        ),
+        (
+            "CommunicationRequest.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("CommunicationRequest.payload[*].contentReference", ("Resource",)),
+        ("CommunicationRequest.reason[*]", ("Resource",)),
+        (
+            "CommunicationRequest.recipient[*]",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Group",
+                "CareTeam",
+                "HealthcareService",
+                "Endpoint",
+            ),
+        ),
+        ("CommunicationRequest.replaces[*]", ("CommunicationRequest",)),
+        (
+            "CommunicationRequest.requester",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        ("CommunicationRequest.subject", ("Patient", "Group")),
+    ),
+    "CompartmentDefinition": (
+        (
+            "CompartmentDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Composition": (
+        (
+            "Composition.attester[*].party",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+            ),
+        ),
+        (
+            "Composition.author[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Composition.custodian", ("Organization",)),
+        ("Composition.encounter", ("Encounter",)),
+        ("Composition.event[*].detail[*]", ("Resource",)),
+        ("Composition.identifier[*].assigner", ("Organization",)),
+        (
+            "Composition.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Composition.relatesTo[*].resourceReference", ("Resource",)),
+        (
+            "Composition.section[*].author[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Composition.section[*].entry[*]", ("Resource",)),
+        ("Composition.section[*].focus", ("Resource",)),
+        ("Composition.subject[*]", ("Resource",)),
+        (
+            "Composition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ConceptMap": (
+        ("ConceptMap.identifier[*].assigner", ("Organization",)),
+        ("ConceptMap.relatedArtifact[*].resourceReference", ("Resource",)),
+        (
+            "ConceptMap.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Condition": (
+        ("Condition.encounter", ("Encounter",)),
+        ("Condition.evidence[*]", ("Resource",)),
+        ("Condition.identifier[*].assigner", ("Organization",)),
+        (
+            "Condition.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "Condition.participant[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        (
+            "Condition.stage[*].assessment[*]",
+            ("ClinicalImpression", "DiagnosticReport", "Observation"),
+        ),
+        ("Condition.subject", ("Patient", "Group")),
+    ),
+    "ConditionDefinition": (
+        ("ConditionDefinition.identifier[*].assigner", ("Organization",)),
+        ("ConditionDefinition.plan[*].reference", ("PlanDefinition",)),
+        ("ConditionDefinition.questionnaire[*].reference", ("Questionnaire",)),
+        ("ConditionDefinition.team[*]", ("CareTeam",)),
+        (
+            "ConditionDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Consent": (
+        (
+            "Consent.controller[*]",
+            ("HealthcareService", "Organization", "Patient", "Practitioner"),
+        ),
+        (
+            "Consent.grantee[*]",
+            (
+                "CareTeam",
+                "HealthcareService",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "PractitionerRole",
+            ),
+        ),
+        (
+            "Consent.grantor[*]",
+            (
+                "CareTeam",
+                "HealthcareService",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "PractitionerRole",
+            ),
+        ),
+        ("Consent.identifier[*].assigner", ("Organization",)),
+        (
+            "Consent.manager[*]",
+            ("HealthcareService", "Organization", "Patient", "Practitioner"),
+        ),
+        ("Consent.policyBasis.reference", ("Resource",)),
+        ("Consent.policyText[*]", ("DocumentReference",)),
+        (
+            "Consent.provision[*].actor[*].reference",
+            (
+                "Device",
+                "Group",
+                "CareTeam",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "PractitionerRole",
+            ),
+        ),
+        ("Consent.provision[*].data[*].reference", ("Resource",)),
+        (
+            "Consent.sourceReference[*]",
+            ("Consent", "DocumentReference", "Contract", "QuestionnaireResponse"),
+        ),
+        ("Consent.subject", ("Patient", "Practitioner", "Group")),
+        (
+            "Consent.verification[*].verifiedBy",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+        ("Consent.verification[*].verifiedWith", ("Patient", "RelatedPerson")),
+    ),
+    "Contract": (
+        (
+            "Contract.author",
+            ("Patient", "Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("Contract.authority[*]", ("Organization",)),
+        (
+            "Contract.contentDefinition.publisher",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("Contract.domain[*]", ("Location",)),
+        (
+            "Contract.friendly[*].contentReference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+        ("Contract.identifier[*].assigner", ("Organization",)),
+        ("Contract.instantiatesCanonical", ("Contract",)),
+        (
+            "Contract.legal[*].contentReference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse"),
+        ),
+        (
+            "Contract.legallyBindingReference",
+            ("Composition", "DocumentReference", "QuestionnaireResponse", "Contract"),
+        ),
+        ("Contract.relevantHistory[*]", ("Provenance",)),
+        ("Contract.rule[*].contentReference", ("DocumentReference",)),
+        (
+            "Contract.signer[*].party",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "Contract.signer[*].signature[*].onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Contract.signer[*].signature[*].who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        ("Contract.site[*]", ("Location",)),
+        ("Contract.subject[*]", ("Resource",)),
+        ("Contract.supportingInfo[*]", ("Resource",)),
+        ("Contract.term[*].action[*].context", ("Encounter", "EpisodeOfCare")),
+        (
+            "Contract.term[*].action[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "Contract.term[*].action[*].performer",
+            (
+                "RelatedPerson",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "CareTeam",
+                "Device",
+                "Substance",
+                "Organization",
+                "Location",
+            ),
+        ),
+        (
+            "Contract.term[*].action[*].reason[*]",
+            (
+                "Condition",
+                "Observation",
+                "DiagnosticReport",
+                "DocumentReference",
+                "Questionnaire",
+                "QuestionnaireResponse",
+            ),
+        ),
+        (
+            "Contract.term[*].action[*].requester[*]",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+        (
+            "Contract.term[*].action[*].subject[*].reference[*]",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+        ("Contract.term[*].asset[*].answer[*].valueReference", ("Resource",)),
+        ("Contract.term[*].asset[*].context[*].reference", ("Resource",)),
+        ("Contract.term[*].asset[*].typeReference[*]", ("Resource",)),
+        ("Contract.term[*].asset[*].valuedItem[*].entityReference", ("Resource",)),
+        (
+            "Contract.term[*].asset[*].valuedItem[*].identifier.assigner",
+            ("Organization",),
+        ),
+        (
+            "Contract.term[*].asset[*].valuedItem[*].recipient",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "Contract.term[*].asset[*].valuedItem[*].responsible",
+            (
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("Contract.term[*].identifier.assigner", ("Organization",)),
+        ("Contract.term[*].offer.answer[*].valueReference", ("Resource",)),
+        ("Contract.term[*].offer.identifier[*].assigner", ("Organization",)),
+        (
+            "Contract.term[*].offer.party[*].reference[*]",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+        ("Contract.term[*].offer.topic", ("Resource",)),
+        ("Contract.term[*].topicReference", ("Resource",)),
+        ("Contract.topicReference", ("Resource",)),
+    ),
+    "Coverage": (
+        ("Coverage.beneficiary", ("Patient",)),
+        ("Coverage.class[*].value.assigner", ("Organization",)),
+        ("Coverage.contract[*]", ("Contract",)),
+        ("Coverage.identifier[*].assigner", ("Organization",)),
+        ("Coverage.insurancePlan", ("InsurancePlan",)),
+        ("Coverage.insurer", ("Organization",)),
+        ("Coverage.paymentBy[*].party", ("Patient", "RelatedPerson", "Organization")),
+        ("Coverage.policyHolder", ("Patient", "RelatedPerson", "Organization")),
+        ("Coverage.subscriber", ("Patient", "RelatedPerson")),
+        ("Coverage.subscriberId[*].assigner", ("Organization",)),
+    ),
+    "CoverageEligibilityRequest": (
+        ("CoverageEligibilityRequest.enterer", ("Practitioner", "PractitionerRole")),
+        ("CoverageEligibilityRequest.facility", ("Location",)),
+        ("CoverageEligibilityRequest.identifier[*].assigner", ("Organization",)),
+        ("CoverageEligibilityRequest.insurance[*].coverage", ("Coverage",)),
+        ("CoverageEligibilityRequest.insurer", ("Organization",)),
+        ("CoverageEligibilityRequest.item[*].detail[*]", ("Resource",)),
+        (
+            "CoverageEligibilityRequest.item[*].diagnosis[*].diagnosisReference",
+            ("Condition",),
+        ),
+        ("CoverageEligibilityRequest.item[*].facility", ("Location", "Organization")),
+        (
+            "CoverageEligibilityRequest.item[*].provider",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("CoverageEligibilityRequest.patient", ("Patient",)),
+        (
+            "CoverageEligibilityRequest.provider",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("CoverageEligibilityRequest.supportingInfo[*].information", ("Resource",)),
+    ),
+    "CoverageEligibilityResponse": (
+        ("CoverageEligibilityResponse.identifier[*].assigner", ("Organization",)),
+        ("CoverageEligibilityResponse.insurance[*].coverage", ("Coverage",)),
+        (
+            "CoverageEligibilityResponse.insurance[*].item[*].provider",
+            ("Practitioner", "PractitionerRole"),
+        ),
+        ("CoverageEligibilityResponse.insurer", ("Organization",)),
+        ("CoverageEligibilityResponse.patient", ("Patient",)),
+        ("CoverageEligibilityResponse.request", ("CoverageEligibilityRequest",)),
+        (
+            "CoverageEligibilityResponse.requestor",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "DetectedIssue": (
+        (
+            "DetectedIssue.author",
+            ("Patient", "RelatedPerson", "Practitioner", "PractitionerRole", "Device"),
+        ),
+        ("DetectedIssue.encounter", ("Encounter",)),
+        ("DetectedIssue.evidence[*].detail[*]", ("Resource",)),
+        ("DetectedIssue.identifier[*].assigner", ("Organization",)),
+        ("DetectedIssue.implicated[*]", ("Resource",)),
+        ("DetectedIssue.mitigation[*].author", ("Practitioner", "PractitionerRole")),
+        (
+            "DetectedIssue.mitigation[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "DetectedIssue.subject",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "Location",
+                "Organization",
+                "Procedure",
+                "Practitioner",
+                "Medication",
+                "Substance",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+            ),
+        ),
+    ),
+    "Device": (
+        ("Device.biologicalSourceEvent.assigner", ("Organization",)),
+        ("Device.definition", ("DeviceDefinition",)),
+        ("Device.endpoint[*]", ("Endpoint",)),
+        ("Device.gateway[*]", ("Device",)),
+        ("Device.identifier[*].assigner", ("Organization",)),
+        ("Device.location", ("Location",)),
+        (
+            "Device.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Device.owner", ("Organization",)),
+        ("Device.parent", ("Device",)),
+        ("Device.version[*].component.assigner", ("Organization",)),
+    ),
+    "DeviceAssociation": (
+        ("DeviceAssociation.bodyStructure", ("BodyStructure",)),
+        ("DeviceAssociation.device", ("Device",)),
+        ("DeviceAssociation.identifier[*].assigner", ("Organization",)),
+        (
+            "DeviceAssociation.operation[*].operator[*]",
+            ("Patient", "Practitioner", "RelatedPerson"),
+        ),
+        (
+            "DeviceAssociation.subject",
+            ("Patient", "Group", "Practitioner", "RelatedPerson", "Device"),
+        ),
+    ),
+    "DeviceDefinition": (
+        ("DeviceDefinition.chargeItem[*].chargeItemCode", ("ChargeItemDefinition",)),
+        (
+            "DeviceDefinition.chargeItem[*].useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "DeviceDefinition.classification[*].justification[*].resourceReference",
+            ("Resource",),
+        ),
+        ("DeviceDefinition.conformsTo[*].source[*].resourceReference", ("Resource",)),
+        (
+            "DeviceDefinition.guideline.relatedArtifact[*].resourceReference",
+            ("Resource",),
+        ),
+        (
+            "DeviceDefinition.guideline.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        ("DeviceDefinition.hasPart[*].reference", ("DeviceDefinition",)),
+        ("DeviceDefinition.identifier[*].assigner", ("Organization",)),
+        ("DeviceDefinition.link[*].relatedDevice", ("DeviceDefinition",)),
+        ("DeviceDefinition.manufacturer", ("Organization",)),
+        (
+            "DeviceDefinition.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("DeviceDefinition.owner", ("Organization",)),
+        (
+            "DeviceDefinition.packaging[*].distributor[*].organizationReference[*]",
+            ("Organization",),
+        ),
+        ("DeviceDefinition.packaging[*].identifier.assigner", ("Organization",)),
+        ("DeviceDefinition.version[*].component.assigner", ("Organization",)),
+    ),
+    "DeviceDispense": (
+        ("DeviceDispense.basedOn[*]", ("CarePlan", "DeviceRequest")),
+        ("DeviceDispense.destination", ("Location",)),
+        ("DeviceDispense.device", ("Device", "DeviceDefinition")),
+        ("DeviceDispense.encounter", ("Encounter",)),
+        ("DeviceDispense.eventHistory[*]", ("Provenance",)),
+        ("DeviceDispense.identifier[*].assigner", ("Organization",)),
+        ("DeviceDispense.location", ("Location",)),
+        (
+            "DeviceDispense.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("DeviceDispense.partOf[*]", ("Procedure",)),
+        (
+            "DeviceDispense.performer[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "CareTeam",
+            ),
+        ),
+        (
+            "DeviceDispense.receiver",
+            (
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Location",
+                "PractitionerRole",
+            ),
+        ),
+        ("DeviceDispense.statusReason", ("DetectedIssue",)),
+        ("DeviceDispense.subject", ("Patient", "Practitioner")),
+        ("DeviceDispense.supportingInformation[*]", ("Resource",)),
+    ),
+    "DeviceMetric": (
+        ("DeviceMetric.device", ("Device",)),
+        ("DeviceMetric.identifier[*].assigner", ("Organization",)),
+    ),
+    "DeviceRequest": (
+        ("DeviceRequest.basedOn[*]", ("Resource",)),
+        ("DeviceRequest.code", ("Device", "DeviceDefinition")),
+        ("DeviceRequest.encounter", ("Encounter",)),
+        ("DeviceRequest.groupIdentifier.assigner", ("Organization",)),
+        ("DeviceRequest.identifier[*].assigner", ("Organization",)),
+        ("DeviceRequest.insurance[*]", ("Coverage", "ClaimResponse")),
+        (
+            "DeviceRequest.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "DeviceRequest.performer",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "DeviceRequest.reason[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("DeviceRequest.relevantHistory[*]", ("Provenance",)),
+        ("DeviceRequest.replaces[*]", ("DeviceRequest",)),
+        (
+            "DeviceRequest.requester",
+            ("Device", "Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("DeviceRequest.subject", ("Patient", "Group", "Location", "Device")),
+        ("DeviceRequest.supportingInfo[*]", ("Resource",)),
+    ),
+    "DeviceUsage": (
+        ("DeviceUsage.basedOn[*]", ("ServiceRequest",)),
+        ("DeviceUsage.bodySite", ("BodyStructure",)),
+        ("DeviceUsage.context", ("Encounter", "EpisodeOfCare")),
+        (
+            "DeviceUsage.derivedFrom[*]",
+            (
+                "ServiceRequest",
+                "Procedure",
+                "Claim",
+                "Observation",
+                "QuestionnaireResponse",
+                "DocumentReference",
+            ),
+        ),
+        ("DeviceUsage.device", ("Device", "DeviceDefinition")),
+        ("DeviceUsage.identifier[*].assigner", ("Organization",)),
+        (
+            "DeviceUsage.informationSource",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "DeviceUsage.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("DeviceUsage.patient", ("Patient",)),
+        (
+            "DeviceUsage.reason[*]",
+            (
+                "Condition",
+                "Observation",
+                "DiagnosticReport",
+                "DocumentReference",
+                "Procedure",
+            ),
+        ),
+    ),
+    "DiagnosticReport": (
+        (
+            "DiagnosticReport.basedOn[*]",
+            (
+                "CarePlan",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+            ),
+        ),
+        ("DiagnosticReport.composition", ("Composition",)),
+        ("DiagnosticReport.encounter", ("Encounter",)),
+        ("DiagnosticReport.identifier[*].assigner", ("Organization",)),
+        ("DiagnosticReport.media[*].link", ("DocumentReference",)),
+        (
+            "DiagnosticReport.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "DiagnosticReport.performer[*]",
+            ("Practitioner", "PractitionerRole", "Organization", "CareTeam"),
+        ),
+        ("DiagnosticReport.result[*]", ("Observation",)),
+        (
+            "DiagnosticReport.resultsInterpreter[*]",
+            ("Practitioner", "PractitionerRole", "Organization", "CareTeam"),
+        ),
+        ("DiagnosticReport.specimen[*]", ("Specimen",)),
+        ("DiagnosticReport.study[*]", ("GenomicStudy", "ImagingStudy")),
+        (
+            "DiagnosticReport.subject",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "Location",
+                "Organization",
+                "Practitioner",
+                "Medication",
+                "Substance",
+                "BiologicallyDerivedProduct",
+            ),
+        ),
+        (
+            "DiagnosticReport.supportingInfo[*].reference",
+            ("Procedure", "Observation", "DiagnosticReport", "Citation"),
+        ),
+    ),
+    "DocumentReference": (
+        (
+            "DocumentReference.attester[*].party",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+            ),
+        ),
+        (
+            "DocumentReference.author[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Device",
+                "Patient",
+                "RelatedPerson",
+                "CareTeam",
+            ),
+        ),
+        (
+            "DocumentReference.basedOn[*]",
+            (
+                "Appointment",
+                "AppointmentResponse",
+                "CarePlan",
+                "Claim",
+                "CommunicationRequest",
+                "Contract",
+                "CoverageEligibilityRequest",
+                "DeviceRequest",
+                "EnrollmentRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "RequestOrchestration",
+                "ServiceRequest",
+                "SupplyRequest",
+                "VisionPrescription",
+            ),
+        ),
+        ("DocumentReference.bodySite[*]", ("BodyStructure",)),
+        ("DocumentReference.context[*]", ("Appointment", "Encounter", "EpisodeOfCare")),
+        ("DocumentReference.custodian", ("Organization",)),
+        ("DocumentReference.event[*]", None),
+        ("DocumentReference.identifier[*].assigner", ("Organization",)),
+        ("DocumentReference.relatesTo[*].target", ("DocumentReference",)),
+        ("DocumentReference.subject", ("Resource",)),
+    ),
+    "Encounter": (
+        ("Encounter.account[*]", ("Account",)),
+        ("Encounter.admission.destination", ("Location", "Organization")),
+        ("Encounter.admission.origin", ("Location", "Organization")),
+        ("Encounter.admission.preAdmissionIdentifier.assigner", ("Organization",)),
+        ("Encounter.appointment[*]", ("Appointment",)),
+        (
+            "Encounter.basedOn[*]",
+            ("CarePlan", "DeviceRequest", "MedicationRequest", "ServiceRequest"),
+        ),
+        ("Encounter.careTeam[*]", ("CareTeam",)),
+        ("Encounter.diagnosis[*].condition[*]", ("Condition",)),
+        ("Encounter.episodeOfCare[*]", ("EpisodeOfCare",)),
+        ("Encounter.identifier[*].assigner", ("Organization",)),
+        ("Encounter.location[*].location", ("Location",)),
+        ("Encounter.partOf", ("Encounter",)),
+        (
+            "Encounter.participant[*].actor",
+            (
+                "Patient",
+                "Group",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "HealthcareService",
+            ),
+        ),
+        (
+            "Encounter.reason[*].value[*]",
+            (
+                "Condition",
+                "DiagnosticReport",
+                "Observation",
+                "ImmunizationRecommendation",
+                "Procedure",
+            ),
+        ),
+        ("Encounter.serviceProvider", ("Organization",)),
+        ("Encounter.serviceType[*]", ("HealthcareService",)),
+        ("Encounter.subject", ("Patient", "Group")),
+        (
+            "Encounter.virtualService[*].addressExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+    ),
+    "EncounterHistory": (
+        ("EncounterHistory.encounter", ("Encounter",)),
+        ("EncounterHistory.identifier[*].assigner", ("Organization",)),
+        ("EncounterHistory.location[*].location", ("Location",)),
+        ("EncounterHistory.serviceType[*]", ("HealthcareService",)),
+        ("EncounterHistory.subject", ("Patient", "Group")),
+    ),
+    "Endpoint": (
+        ("Endpoint.identifier[*].assigner", ("Organization",)),
+        ("Endpoint.managingOrganization", ("Organization",)),
+    ),
+    "EnrollmentRequest": (
+        ("EnrollmentRequest.candidate", ("Patient",)),
+        ("EnrollmentRequest.coverage", ("Coverage",)),
+        ("EnrollmentRequest.identifier[*].assigner", ("Organization",)),
+        ("EnrollmentRequest.insurer", ("Organization",)),
+        (
+            "EnrollmentRequest.provider",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "EnrollmentResponse": (
+        ("EnrollmentResponse.identifier[*].assigner", ("Organization",)),
+        ("EnrollmentResponse.organization", ("Organization",)),
+        ("EnrollmentResponse.request", ("EnrollmentRequest",)),
+        (
+            "EnrollmentResponse.requestProvider",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "EpisodeOfCare": (
+        ("EpisodeOfCare.account[*]", ("Account",)),
+        ("EpisodeOfCare.careManager", ("Practitioner", "PractitionerRole")),
+        ("EpisodeOfCare.careTeam[*]", ("CareTeam",)),
+        ("EpisodeOfCare.diagnosis[*].condition[*]", ("Condition",)),
+        ("EpisodeOfCare.identifier[*].assigner", ("Organization",)),
+        ("EpisodeOfCare.managingOrganization", ("Organization",)),
+        ("EpisodeOfCare.patient", ("Patient",)),
+        (
+            "EpisodeOfCare.reason[*].value[*]",
+            ("Condition", "Procedure", "Observation", "HealthcareService"),
+        ),
+        ("EpisodeOfCare.referralRequest[*]", ("ServiceRequest",)),
+    ),
+    "EventDefinition": (
+        ("EventDefinition.identifier[*].assigner", ("Organization",)),
+        ("EventDefinition.relatedArtifact[*].resourceReference", ("Resource",)),
+        ("EventDefinition.subjectReference", ("Group",)),
+        ("EventDefinition.trigger[*].data[*].subjectReference", ("Group",)),
+        ("EventDefinition.trigger[*].timingReference", ("Schedule",)),
+        (
+            "EventDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Evidence": (
+        (
+            "Evidence.certainty[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Evidence.citeAsReference", ("Citation",)),
+        ("Evidence.identifier[*].assigner", ("Organization",)),
+        (
+            "Evidence.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Evidence.relatedArtifact[*].resourceReference", ("Resource",)),
+        (
+            "Evidence.statistic[*].attributeEstimate[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "Evidence.statistic[*].modelCharacteristic[*].attributeEstimate[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "Evidence.statistic[*].modelCharacteristic[*].variable[*].variableDefinition",
+            ("Group", "EvidenceVariable"),
+        ),
+        (
+            "Evidence.statistic[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "Evidence.statistic[*].sampleSize.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "Evidence.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        ("Evidence.variableDefinition[*].intended", ("Group", "EvidenceVariable")),
+        (
+            "Evidence.variableDefinition[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Evidence.variableDefinition[*].observed", ("Group", "EvidenceVariable")),
+    ),
+    "EvidenceReport": (
+        ("EvidenceReport.citeAsReference", ("Citation",)),
+        ("EvidenceReport.identifier[*].assigner", ("Organization",)),
+        (
+            "EvidenceReport.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("EvidenceReport.relatedArtifact[*].resourceReference", ("Resource",)),
+        ("EvidenceReport.relatedIdentifier[*].assigner", ("Organization",)),
+        ("EvidenceReport.relatesTo[*].target.identifier.assigner", ("Organization",)),
+        ("EvidenceReport.relatesTo[*].target.resource", ("Resource",)),
+        (
+            "EvidenceReport.section[*].author[*]",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Device",
+                "Group",
+                "Organization",
+            ),
+        ),
+        ("EvidenceReport.section[*].entryReference[*]", ("Resource",)),
+        ("EvidenceReport.section[*].focusReference", ("Resource",)),
+        ("EvidenceReport.subject.characteristic[*].valueReference", ("Resource",)),
+        (
+            "EvidenceReport.subject.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "EvidenceReport.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "EvidenceVariable": (
+        (
+            "EvidenceVariable.characteristic[*].definitionByTypeAndValue.device",
+            ("Device", "DeviceMetric"),
+        ),
+        (
+            "EvidenceVariable.characteristic[*].definitionByTypeAndValue.valueReference",
+            None,
+        ),
+        (
+            "EvidenceVariable.characteristic[*].definitionReference",
+            ("EvidenceVariable", "Group", "Evidence"),
+        ),
+        (
+            "EvidenceVariable.characteristic[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("EvidenceVariable.characteristic[*].timeFromEvent[*].eventReference", None),
+        (
+            "EvidenceVariable.characteristic[*].timeFromEvent[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("EvidenceVariable.identifier[*].assigner", ("Organization",)),
+        (
+            "EvidenceVariable.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("EvidenceVariable.relatedArtifact[*].resourceReference", ("Resource",)),
+        (
+            "EvidenceVariable.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ExampleScenario": (
+        ("ExampleScenario.identifier[*].assigner", ("Organization",)),
+        ("ExampleScenario.instance[*].content", None),
+        ("ExampleScenario.instance[*].version[*].content", None),
+        (
+            "ExampleScenario.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ExplanationOfBenefit": (
+        ("ExplanationOfBenefit.accident.locationReference", ("Location",)),
+        ("ExplanationOfBenefit.addItem[*].bodySite[*].site[*]", ("BodyStructure",)),
+        (
+            "ExplanationOfBenefit.addItem[*].detail[*].subDetail[*].traceNumber[*].assigner",
+            ("Organization",),
+        ),
+        (
+            "ExplanationOfBenefit.addItem[*].detail[*].traceNumber[*].assigner",
+            ("Organization",),
+        ),
+        ("ExplanationOfBenefit.addItem[*].locationReference", ("Location",)),
+        (
+            "ExplanationOfBenefit.addItem[*].provider[*]",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "ExplanationOfBenefit.addItem[*].request[*]",
+            (
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "SupplyRequest",
+                "VisionPrescription",
+            ),
+        ),
+        ("ExplanationOfBenefit.addItem[*].traceNumber[*].assigner", ("Organization",)),
+        (
+            "ExplanationOfBenefit.careTeam[*].provider",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("ExplanationOfBenefit.claim", ("Claim",)),
+        ("ExplanationOfBenefit.claimResponse", ("ClaimResponse",)),
+        ("ExplanationOfBenefit.diagnosis[*].diagnosisReference", ("Condition",)),
+        ("ExplanationOfBenefit.encounter[*]", ("Encounter",)),
+        (
+            "ExplanationOfBenefit.enterer",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson"),
+        ),
+        ("ExplanationOfBenefit.facility", ("Location", "Organization")),
+        ("ExplanationOfBenefit.identifier[*].assigner", ("Organization",)),
+        ("ExplanationOfBenefit.insurance[*].coverage", ("Coverage",)),
+        ("ExplanationOfBenefit.insurer", ("Organization",)),
+        ("ExplanationOfBenefit.item[*].bodySite[*].site[*]", ("BodyStructure",)),
+        (
+            "ExplanationOfBenefit.item[*].detail[*].subDetail[*].traceNumber[*].assigner",
+            ("Organization",),
+        ),
+        ("ExplanationOfBenefit.item[*].detail[*].subDetail[*].udi[*]", ("Device",)),
+        (
+            "ExplanationOfBenefit.item[*].detail[*].traceNumber[*].assigner",
+            ("Organization",),
+        ),
+        ("ExplanationOfBenefit.item[*].detail[*].udi[*]", ("Device",)),
+        ("ExplanationOfBenefit.item[*].encounter[*]", ("Encounter",)),
+        ("ExplanationOfBenefit.item[*].locationReference", ("Location",)),
+        (
+            "ExplanationOfBenefit.item[*].request[*]",
+            (
+                "DeviceRequest",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "SupplyRequest",
+                "VisionPrescription",
+            ),
+        ),
+        ("ExplanationOfBenefit.item[*].traceNumber[*].assigner", ("Organization",)),
+        ("ExplanationOfBenefit.item[*].udi[*]", ("Device",)),
+        ("ExplanationOfBenefit.originalPrescription", ("MedicationRequest",)),
+        ("ExplanationOfBenefit.patient", ("Patient",)),
+        (
+            "ExplanationOfBenefit.payee.party",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("ExplanationOfBenefit.payment.identifier.assigner", ("Organization",)),
+        (
+            "ExplanationOfBenefit.prescription",
+            ("MedicationRequest", "VisionPrescription"),
+        ),
+        ("ExplanationOfBenefit.procedure[*].procedureReference", ("Procedure",)),
+        ("ExplanationOfBenefit.procedure[*].udi[*]", ("Device",)),
+        (
+            "ExplanationOfBenefit.provider",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("ExplanationOfBenefit.referral", ("ServiceRequest",)),
+        ("ExplanationOfBenefit.related[*].claim", ("Claim",)),
+        ("ExplanationOfBenefit.related[*].reference.assigner", ("Organization",)),
+        (
+            "ExplanationOfBenefit.supportingInfo[*].valueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("ExplanationOfBenefit.supportingInfo[*].valueReference", ("Resource",)),
+        ("ExplanationOfBenefit.traceNumber[*].assigner", ("Organization",)),
+    ),
+    "FamilyMemberHistory": (
+        (
+            "FamilyMemberHistory.condition[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("FamilyMemberHistory.identifier[*].assigner", ("Organization",)),
+        (
+            "FamilyMemberHistory.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "FamilyMemberHistory.participant[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+                "Organization",
+                "CareTeam",
+            ),
+        ),
+        ("FamilyMemberHistory.patient", ("Patient",)),
+        (
+            "FamilyMemberHistory.procedure[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "FamilyMemberHistory.reason[*]",
+            (
+                "Condition",
+                "Observation",
+                "AllergyIntolerance",
+                "QuestionnaireResponse",
+                "DiagnosticReport",
+                "DocumentReference",
+            ),
+        ),
+    ),
+    "Flag": (
+        (
+            "Flag.author",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+            ),
+        ),
+        ("Flag.encounter", ("Encounter",)),
+        ("Flag.identifier[*].assigner", ("Organization",)),
+        (
+            "Flag.subject",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Location",
+                "Group",
+                "Organization",
+                "Practitioner",
+                "PractitionerRole",
+                "PlanDefinition",
+                "Medication",
+                "Procedure",
+            ),
+        ),
+    ),
+    "FormularyItem": (("FormularyItem.identifier[*].assigner", ("Organization",)),),
+    "GenomicStudy": (
+        ("GenomicStudy.analysis[*].device[*].device", ("Device",)),
+        ("GenomicStudy.analysis[*].focus[*]", ("Resource",)),
+        ("GenomicStudy.analysis[*].identifier[*].assigner", ("Organization",)),
+        ("GenomicStudy.analysis[*].input[*].file", ("DocumentReference",)),
+        (
+            "GenomicStudy.analysis[*].input[*].generatedByIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("GenomicStudy.analysis[*].input[*].generatedByReference", ("GenomicStudy",)),
+        (
+            "GenomicStudy.analysis[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("GenomicStudy.analysis[*].output[*].file", ("DocumentReference",)),
+        (
+            "GenomicStudy.analysis[*].performer[*].actor",
+            ("Practitioner", "PractitionerRole", "Organization", "Device"),
+        ),
+        ("GenomicStudy.analysis[*].protocolPerformed", ("Procedure", "Task")),
+        (
+            "GenomicStudy.analysis[*].regionsCalled[*]",
+            ("DocumentReference", "Observation"),
+        ),
+        (
+            "GenomicStudy.analysis[*].regionsStudied[*]",
+            ("DocumentReference", "Observation"),
+        ),
+        ("GenomicStudy.analysis[*].specimen[*]", ("Specimen",)),
+        ("GenomicStudy.basedOn[*]", ("ServiceRequest", "Task")),
+        ("GenomicStudy.encounter", ("Encounter",)),
+        ("GenomicStudy.identifier[*].assigner", ("Organization",)),
+        ("GenomicStudy.interpreter[*]", ("Practitioner", "PractitionerRole")),
+        (
+            "GenomicStudy.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("GenomicStudy.reason[*]", ("Condition", "Observation")),
+        ("GenomicStudy.referrer", ("Practitioner", "PractitionerRole")),
+        (
+            "GenomicStudy.subject",
+            (
+                "Patient",
+                "Group",
+                "Substance",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+            ),
+        ),
+    ),
+    "Goal": (
+        (
+            "Goal.addresses[*]",
+            (
+                "Condition",
+                "Observation",
+                "MedicationStatement",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "RiskAssessment",
+                "Procedure",
+            ),
+        ),
+        ("Goal.identifier[*].assigner", ("Organization",)),
+        (
+            "Goal.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Goal.outcome[*]", ("Observation",)),
+        (
+            "Goal.source",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "CareTeam",
+            ),
+        ),
+        ("Goal.subject", ("Patient", "Group", "Organization")),
+    ),
+    "GraphDefinition": (
+        ("GraphDefinition.identifier[*].assigner", ("Organization",)),
+        (
+            "GraphDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Group": (
+        ("Group.characteristic[*].valueReference", None),
+        ("Group.identifier[*].assigner", ("Organization",)),
+        (
+            "Group.managingEntity",
+            ("Organization", "RelatedPerson", "Practitioner", "PractitionerRole"),
+        ),
+        (
+            "Group.member[*].entity",
+            (
+                "CareTeam",
+                "Device",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Specimen",
+            ),
+        ),
+    ),
+    "GuidanceResponse": (
+        ("GuidanceResponse.dataRequirement[*].subjectReference", ("Group",)),
+        ("GuidanceResponse.encounter", ("Encounter",)),
+        ("GuidanceResponse.evaluationMessage", ("OperationOutcome",)),
+        ("GuidanceResponse.identifier[*].assigner", ("Organization",)),
+        (
+            "GuidanceResponse.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("GuidanceResponse.outputParameters", ("Parameters",)),
+        ("GuidanceResponse.performer", ("Device",)),
+        ("GuidanceResponse.reason[*]", None),
+        ("GuidanceResponse.requestIdentifier.assigner", ("Organization",)),
+        (
+            "GuidanceResponse.result[*]",
+            (
+                "Appointment",
+                "AppointmentResponse",
+                "CarePlan",
+                "Claim",
+                "CommunicationRequest",
+                "Contract",
+                "CoverageEligibilityRequest",
+                "DeviceRequest",
+                "EnrollmentRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "RequestOrchestration",
+                "ServiceRequest",
+                "SupplyRequest",
+                "Task",
+                "VisionPrescription",
+            ),
+        ),
+        ("GuidanceResponse.subject", ("Patient", "Group")),
+    ),
+    "HealthcareService": (
+        ("HealthcareService.contact[*].organization", ("Organization",)),
+        ("HealthcareService.coverageArea[*]", ("Location",)),
+        ("HealthcareService.endpoint[*]", ("Endpoint",)),
+        ("HealthcareService.identifier[*].assigner", ("Organization",)),
+        ("HealthcareService.location[*]", ("Location",)),
+        ("HealthcareService.offeredIn[*]", ("HealthcareService",)),
+        ("HealthcareService.providedBy", ("Organization",)),
+    ),
+    "ImagingSelection": (
+        (
+            "ImagingSelection.basedOn[*]",
+            (
+                "CarePlan",
+                "ServiceRequest",
+                "Appointment",
+                "AppointmentResponse",
+                "Task",
+            ),
+        ),
+        ("ImagingSelection.bodySite", ("BodyStructure",)),
+        ("ImagingSelection.derivedFrom[*]", ("ImagingStudy", "DocumentReference")),
+        ("ImagingSelection.endpoint[*]", ("Endpoint",)),
+        ("ImagingSelection.focus[*]", ("ImagingSelection",)),
+        ("ImagingSelection.identifier[*].assigner", ("Organization",)),
+        (
+            "ImagingSelection.performer[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Device",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+        (
+            "ImagingSelection.subject",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "Location",
+                "Organization",
+                "Procedure",
+                "Practitioner",
+                "Medication",
+                "Substance",
+                "Specimen",
+            ),
+        ),
+    ),
+    "ImagingStudy": (
+        (
+            "ImagingStudy.basedOn[*]",
+            (
+                "CarePlan",
+                "ServiceRequest",
+                "Appointment",
+                "AppointmentResponse",
+                "Task",
+            ),
+        ),
+        ("ImagingStudy.encounter", ("Encounter",)),
+        ("ImagingStudy.endpoint[*]", ("Endpoint",)),
+        ("ImagingStudy.identifier[*].assigner", ("Organization",)),
+        ("ImagingStudy.location", ("Location",)),
+        (
+            "ImagingStudy.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("ImagingStudy.partOf[*]", ("Procedure",)),
+        ("ImagingStudy.procedure[*]", ("PlanDefinition", "ActivityDefinition")),
+        (
+            "ImagingStudy.reason[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("ImagingStudy.referrer", ("Practitioner", "PractitionerRole")),
+        ("ImagingStudy.series[*].bodySite", ("BodyStructure",)),
+        ("ImagingStudy.series[*].endpoint[*]", ("Endpoint",)),
+        (
+            "ImagingStudy.series[*].performer[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+        ("ImagingStudy.series[*].specimen[*]", ("Specimen",)),
+        ("ImagingStudy.subject", ("Patient", "Device", "Group")),
+    ),
+    "Immunization": (
+        ("Immunization.administeredProduct", ("Medication",)),
+        (
+            "Immunization.basedOn[*]",
+            (
+                "CarePlan",
+                "MedicationRequest",
+                "ServiceRequest",
+                "ImmunizationRecommendation",
+            ),
+        ),
+        ("Immunization.encounter", ("Encounter",)),
+        ("Immunization.identifier[*].assigner", ("Organization",)),
+        (
+            "Immunization.informationSource",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Immunization.location", ("Location",)),
+        ("Immunization.manufacturer", ("Organization",)),
+        (
+            "Immunization.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Immunization.patient", ("Patient",)),
+        (
+            "Immunization.performer[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("Immunization.protocolApplied[*].authority", ("Organization",)),
+        ("Immunization.reaction[*].manifestation", ("Observation",)),
+        ("Immunization.reason[*]", ("Condition", "Observation", "DiagnosticReport")),
+        ("Immunization.supportingInformation[*]", ("Resource",)),
+    ),
+    "ImmunizationEvaluation": (
+        ("ImmunizationEvaluation.authority", ("Organization",)),
+        ("ImmunizationEvaluation.identifier[*].assigner", ("Organization",)),
+        ("ImmunizationEvaluation.immunizationEvent", ("Immunization",)),
+        ("ImmunizationEvaluation.patient", ("Patient",)),
+    ),
+    "ImmunizationRecommendation": (
+        ("ImmunizationRecommendation.authority", ("Organization",)),
+        ("ImmunizationRecommendation.identifier[*].assigner", ("Organization",)),
+        ("ImmunizationRecommendation.patient", ("Patient",)),
+        (
+            "ImmunizationRecommendation.recommendation[*].supportingImmunization[*]",
+            ("Immunization", "ImmunizationEvaluation"),
+        ),
+        (
+            "ImmunizationRecommendation.recommendation[*].supportingPatientInformation[*]",
+            ("Resource",),
+        ),
+    ),
+    "ImplementationGuide": (
+        ("ImplementationGuide.definition.resource[*].reference", ("Resource",)),
+        ("ImplementationGuide.identifier[*].assigner", ("Organization",)),
+        ("ImplementationGuide.manifest.resource[*].reference", ("Resource",)),
+        (
+            "ImplementationGuide.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Ingredient": (
+        (
+            "Ingredient.for[*]",
+            (
+                "MedicinalProductDefinition",
+                "AdministrableProductDefinition",
+                "ManufacturedItemDefinition",
+            ),
+        ),
+        ("Ingredient.identifier.assigner", ("Organization",)),
+        ("Ingredient.manufacturer[*].manufacturer", ("Organization",)),
+        ("Ingredient.substance.code", ("SubstanceDefinition",)),
+        (
+            "Ingredient.substance.strength[*].referenceStrength[*].substance",
+            ("SubstanceDefinition",),
+        ),
+    ),
+    "InsurancePlan": (
+        ("InsurancePlan.administeredBy", ("Organization",)),
+        ("InsurancePlan.contact[*].organization", ("Organization",)),
+        ("InsurancePlan.coverage[*].network[*]", ("Organization",)),
+        ("InsurancePlan.coverageArea[*]", ("Location",)),
+        ("InsurancePlan.endpoint[*]", ("Endpoint",)),
+        ("InsurancePlan.identifier[*].assigner", ("Organization",)),
+        ("InsurancePlan.network[*]", ("Organization",)),
+        ("InsurancePlan.ownedBy", ("Organization",)),
+        ("InsurancePlan.plan[*].coverageArea[*]", ("Location",)),
+        ("InsurancePlan.plan[*].identifier[*].assigner", ("Organization",)),
+        ("InsurancePlan.plan[*].network[*]", ("Organization",)),
+    ),
+    "InventoryItem": (
+        (
+            "InventoryItem.association[*].relatedItem",
+            (
+                "InventoryItem",
+                "Medication",
+                "MedicationKnowledge",
+                "Device",
+                "DeviceDefinition",
+                "NutritionProduct",
+                "BiologicallyDerivedProduct",
+            ),
+        ),
+        (
+            "InventoryItem.characteristic[*].valueAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("InventoryItem.identifier[*].assigner", ("Organization",)),
+        ("InventoryItem.instance.identifier[*].assigner", ("Organization",)),
+        ("InventoryItem.instance.location", ("Location",)),
+        ("InventoryItem.instance.subject", ("Patient", "Organization")),
+        (
+            "InventoryItem.productReference",
+            ("Medication", "Device", "NutritionProduct", "BiologicallyDerivedProduct"),
+        ),
+        ("InventoryItem.responsibleOrganization[*].organization", ("Organization",)),
+    ),
+    "InventoryReport": (
+        ("InventoryReport.identifier[*].assigner", ("Organization",)),
+        (
+            "InventoryReport.inventoryListing[*].item[*].item",
+            (
+                "Medication",
+                "Device",
+                "Medication",
+                "NutritionProduct",
+                "InventoryItem",
+                "BiologicallyDerivedProduct",
+                "InventoryItem",
+            ),
+        ),
+        ("InventoryReport.inventoryListing[*].location", ("Location",)),
+        (
+            "InventoryReport.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "InventoryReport.reporter",
+            ("Practitioner", "Patient", "RelatedPerson", "Device"),
+        ),
+    ),
+    "Invoice": (
+        ("Invoice.account", ("Account",)),
+        ("Invoice.identifier[*].assigner", ("Organization",)),
+        ("Invoice.issuer", ("Organization",)),
+        ("Invoice.lineItem[*].chargeItemReference", ("ChargeItem",)),
+        (
+            "Invoice.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "Invoice.participant[*].actor",
+            (
+                "Practitioner",
+                "Organization",
+                "Patient",
+                "PractitionerRole",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("Invoice.recipient", ("Organization", "Patient", "RelatedPerson")),
+        ("Invoice.subject", ("Patient", "Group")),
+    ),
+    "Library": (
+        ("Library.dataRequirement[*].subjectReference", ("Group",)),
+        ("Library.identifier[*].assigner", ("Organization",)),
+        ("Library.relatedArtifact[*].resourceReference", ("Resource",)),
+        ("Library.subjectReference", ("Group",)),
+        (
+            "Library.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Linkage": (
+        ("Linkage.author", ("Practitioner", "PractitionerRole", "Organization")),
+        ("Linkage.item[*].resource", ("Resource",)),
+    ),
+    "List": (
+        ("List.encounter", ("Encounter",)),
+        ("List.entry[*].item", ("Resource",)),
+        ("List.identifier[*].assigner", ("Organization",)),
+        (
+            "List.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "List.source",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "Device",
+                "Organization",
+                "RelatedPerson",
+                "CareTeam",
+            ),
+        ),
+        ("List.subject[*]", ("Resource",)),
+    ),
+    "Location": (
+        ("Location.contact[*].organization", ("Organization",)),
+        ("Location.endpoint[*]", ("Endpoint",)),
+        ("Location.identifier[*].assigner", ("Organization",)),
+        ("Location.managingOrganization", ("Organization",)),
+        ("Location.partOf", ("Location",)),
+        (
+            "Location.virtualService[*].addressExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+    ),
+    "ManufacturedItemDefinition": (
+        (
+            "ManufacturedItemDefinition.component[*].constituent[*].hasIngredient[*]",
+            ("Ingredient",),
+        ),
+        (
+            "ManufacturedItemDefinition.component[*].property[*].valueReference",
+            ("Binary",),
+        ),
+        ("ManufacturedItemDefinition.identifier[*].assigner", ("Organization",)),
+        ("ManufacturedItemDefinition.manufacturer[*]", ("Organization",)),
+        ("ManufacturedItemDefinition.property[*].valueReference", ("Binary",)),
+    ),
+    "Measure": (
+        ("Measure.group[*].population[*].groupDefinition", ("Group",)),
+        ("Measure.group[*].stratifier[*].component[*].groupDefinition", ("Group",)),
+        ("Measure.group[*].stratifier[*].groupDefinition", ("Group",)),
+        ("Measure.group[*].subjectReference", ("Group",)),
+        ("Measure.identifier[*].assigner", ("Organization",)),
+        ("Measure.relatedArtifact[*].resourceReference", ("Resource",)),
+        ("Measure.subjectReference", ("Group",)),
+        (
+            "Measure.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "MeasureReport": (
+        ("MeasureReport.evaluatedResource[*]", ("Resource",)),
+        ("MeasureReport.group[*].population[*].subjectReport[*]", ("MeasureReport",)),
+        ("MeasureReport.group[*].population[*].subjectResults", ("List",)),
+        ("MeasureReport.group[*].population[*].subjects", ("Group",)),
+        (
+            "MeasureReport.group[*].stratifier[*].stratum[*].component[*].valueReference",
+            None,
+        ),
+        (
+            "MeasureReport.group[*].stratifier[*].stratum[*].population[*].subjectReport[*]",
+            ("MeasureReport",),
+        ),
+        (
+            "MeasureReport.group[*].stratifier[*].stratum[*].population[*].subjectResults",
+            ("List",),
+        ),
+        (
+            "MeasureReport.group[*].stratifier[*].stratum[*].population[*].subjects",
+            ("Group",),
+        ),
+        ("MeasureReport.group[*].stratifier[*].stratum[*].valueReference", None),
+        (
+            "MeasureReport.group[*].subject",
+            (
+                "CareTeam",
+                "Device",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("MeasureReport.identifier[*].assigner", ("Organization",)),
+        ("MeasureReport.inputParameters", ("Parameters",)),
+        ("MeasureReport.location", ("Location",)),
+        (
+            "MeasureReport.reporter",
+            ("Practitioner", "PractitionerRole", "Organization", "Group"),
+        ),
+        ("MeasureReport.reportingVendor", ("Organization",)),
+        (
+            "MeasureReport.subject",
+            (
+                "CareTeam",
+                "Device",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("MeasureReport.supplementalData[*]", ("Resource",)),
+    ),
+    "Medication": (
+        ("Medication.definition", ("MedicationKnowledge",)),
+        ("Medication.identifier[*].assigner", ("Organization",)),
+        ("Medication.ingredient[*].item", ("Substance", "Medication")),
+        ("Medication.marketingAuthorizationHolder", ("Organization",)),
+    ),
+    "MedicationAdministration": (
+        ("MedicationAdministration.basedOn[*]", ("CarePlan",)),
+        ("MedicationAdministration.device[*]", ("Device",)),
+        ("MedicationAdministration.encounter", ("Encounter",)),
+        ("MedicationAdministration.eventHistory[*]", ("Provenance",)),
+        ("MedicationAdministration.identifier[*].assigner", ("Organization",)),
+        ("MedicationAdministration.medication", ("Medication",)),
+        (
+            "MedicationAdministration.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "MedicationAdministration.partOf[*]",
+            ("MedicationAdministration", "Procedure", "MedicationDispense"),
+        ),
+        (
+            "MedicationAdministration.performer[*].actor",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson", "Device"),
+        ),
+        (
+            "MedicationAdministration.reason[*]",
+            ("Condition", "Observation", "DiagnosticReport"),
+        ),
+        ("MedicationAdministration.request", ("MedicationRequest",)),
+        ("MedicationAdministration.subject", ("Patient", "Group")),
+        ("MedicationAdministration.supportingInformation[*]", ("Resource",)),
+    ),
+    "MedicationDispense": (
+        ("MedicationDispense.authorizingPrescription[*]", ("MedicationRequest",)),
+        ("MedicationDispense.basedOn[*]", ("CarePlan",)),
+        ("MedicationDispense.destination", ("Location",)),
+        ("MedicationDispense.encounter", ("Encounter",)),
+        ("MedicationDispense.eventHistory[*]", ("Provenance",)),
+        ("MedicationDispense.identifier[*].assigner", ("Organization",)),
+        ("MedicationDispense.location", ("Location",)),
+        ("MedicationDispense.medication", ("Medication",)),
+        ("MedicationDispense.notPerformedReason", ("DetectedIssue",)),
+        (
+            "MedicationDispense.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("MedicationDispense.partOf[*]", ("Procedure", "MedicationAdministration")),
+        (
+            "MedicationDispense.performer[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+                "CareTeam",
+            ),
+        ),
+        (
+            "MedicationDispense.receiver[*]",
+            (
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "Location",
+                "PractitionerRole",
+            ),
+        ),
+        ("MedicationDispense.subject", ("Patient", "Group")),
+        (
+            "MedicationDispense.substitution.responsibleParty",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("MedicationDispense.supportingInformation[*]", ("Resource",)),
+    ),
+    "MedicationKnowledge": (
+        ("MedicationKnowledge.associatedMedication[*]", ("Medication",)),
+        ("MedicationKnowledge.author", ("Organization",)),
+        ("MedicationKnowledge.clinicalUseIssue[*]", ("ClinicalUseDefinition",)),
+        (
+            "MedicationKnowledge.definitional.definition[*]",
+            ("MedicinalProductDefinition",),
+        ),
+        ("MedicationKnowledge.definitional.ingredient[*].item", ("Substance",)),
+        ("MedicationKnowledge.identifier[*].assigner", ("Organization",)),
+        (
+            "MedicationKnowledge.indicationGuideline[*].indication[*]",
+            ("ClinicalUseDefinition",),
+        ),
+        ("MedicationKnowledge.monograph[*].source", ("DocumentReference",)),
+        (
+            "MedicationKnowledge.packaging[*].packagedProduct",
+            ("PackagedProductDefinition",),
+        ),
+        ("MedicationKnowledge.regulatory[*].regulatoryAuthority", ("Organization",)),
+        (
+            "MedicationKnowledge.relatedMedicationKnowledge[*].reference[*]",
+            ("MedicationKnowledge",),
+        ),
+        (
+            "MedicationKnowledge.storageGuideline[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+    ),
+    "MedicationRequest": (
+        (
+            "MedicationRequest.basedOn[*]",
+            (
+                "CarePlan",
+                "MedicationRequest",
+                "ServiceRequest",
+                "ImmunizationRecommendation",
+            ),
+        ),
+        ("MedicationRequest.device[*]", ("DeviceDefinition",)),
+        ("MedicationRequest.dispenseRequest.dispenser", ("Organization",)),
+        (
+            "MedicationRequest.dispenseRequest.dispenserInstruction[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("MedicationRequest.encounter", ("Encounter",)),
+        ("MedicationRequest.eventHistory[*]", ("Provenance",)),
+        ("MedicationRequest.groupIdentifier.assigner", ("Organization",)),
+        ("MedicationRequest.identifier[*].assigner", ("Organization",)),
+        (
+            "MedicationRequest.informationSource[*]",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("MedicationRequest.insurance[*]", ("Coverage", "ClaimResponse")),
+        ("MedicationRequest.medication", ("Medication",)),
+        (
+            "MedicationRequest.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "MedicationRequest.performer[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "DeviceDefinition",
+                "RelatedPerson",
+                "CareTeam",
+                "HealthcareService",
+            ),
+        ),
+        ("MedicationRequest.priorPrescription", ("MedicationRequest",)),
+        ("MedicationRequest.reason[*]", ("Condition", "Observation")),
+        ("MedicationRequest.recorder", ("Practitioner", "PractitionerRole")),
+        (
+            "MedicationRequest.requester",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        ("MedicationRequest.subject", ("Patient", "Group")),
+        ("MedicationRequest.supportingInformation[*]", ("Resource",)),
+    ),
+    "MedicationStatement": (
+        ("MedicationStatement.derivedFrom[*]", ("Resource",)),
+        ("MedicationStatement.encounter", ("Encounter",)),
+        ("MedicationStatement.identifier[*].assigner", ("Organization",)),
+        (
+            "MedicationStatement.informationSource[*]",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("MedicationStatement.medication", ("Medication",)),
+        (
+            "MedicationStatement.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("MedicationStatement.partOf[*]", ("Procedure", "MedicationStatement")),
+        (
+            "MedicationStatement.reason[*]",
+            ("Condition", "Observation", "DiagnosticReport"),
+        ),
+        (
+            "MedicationStatement.relatedClinicalInformation[*]",
+            ("Observation", "Condition"),
+        ),
+        ("MedicationStatement.subject", ("Patient", "Group")),
+    ),
+    "MedicinalProductDefinition": (
+        ("MedicinalProductDefinition.attachedDocument[*]", ("DocumentReference",)),
+        ("MedicinalProductDefinition.clinicalTrial[*]", ("ResearchStudy",)),
+        (
+            "MedicinalProductDefinition.comprisedOf[*]",
+            ("ManufacturedItemDefinition", "DeviceDefinition"),
+        ),
+        (
+            "MedicinalProductDefinition.contact[*].contact",
+            ("Organization", "PractitionerRole"),
+        ),
+        (
+            "MedicinalProductDefinition.crossReference[*].product",
+            ("MedicinalProductDefinition",),
+        ),
+        ("MedicinalProductDefinition.identifier[*].assigner", ("Organization",)),
+        ("MedicinalProductDefinition.impurity[*]", ("SubstanceDefinition",)),
+        ("MedicinalProductDefinition.masterFile[*]", ("DocumentReference",)),
+        ("MedicinalProductDefinition.operation[*].organization[*]", ("Organization",)),
+        (
+            "MedicinalProductDefinition.operation[*].type",
+            ("ActivityDefinition", "PlanDefinition"),
+        ),
+    ),
+    "MessageDefinition": (
+        ("MessageDefinition.identifier[*].assigner", ("Organization",)),
+        (
+            "MessageDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "MessageHeader": (
+        (
+            "MessageHeader.author",
+            ("Practitioner", "PractitionerRole", "Device", "Organization"),
+        ),
+        ("MessageHeader.destination[*].endpointReference", ("Endpoint",)),
+        (
+            "MessageHeader.destination[*].receiver",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("MessageHeader.destination[*].target", ("Device",)),
+        ("MessageHeader.focus[*]", ("Resource",)),
+        ("MessageHeader.response.details", ("OperationOutcome",)),
+        ("MessageHeader.response.identifier.assigner", ("Organization",)),
+        (
+            "MessageHeader.responsible",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "MessageHeader.sender",
+            ("Practitioner", "PractitionerRole", "Device", "Organization"),
+        ),
+        ("MessageHeader.source.endpointReference", ("Endpoint",)),
+    ),
+    "MetadataResource": (
+        ("MetadataResource.relatedArtifact[*].resourceReference", ("Resource",)),
+    ),
+    "MolecularSequence": (
+        ("MolecularSequence.device", ("Device",)),
+        ("MolecularSequence.focus[*]", ("Resource",)),
+        ("MolecularSequence.identifier[*].assigner", ("Organization",)),
+        ("MolecularSequence.performer", ("Organization",)),
+        (
+            "MolecularSequence.relative[*].startingSequence.sequenceReference",
+            ("MolecularSequence",),
+        ),
+        ("MolecularSequence.specimen", ("Specimen",)),
+        (
+            "MolecularSequence.subject",
+            (
+                "Patient",
+                "Group",
+                "Substance",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+            ),
+        ),
+    ),
+    "NamingSystem": (
+        ("NamingSystem.identifier[*].assigner", ("Organization",)),
+        ("NamingSystem.relatedArtifact[*].resourceReference", ("Resource",)),
+        (
+            "NamingSystem.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "NutritionIntake": (
+        (
+            "NutritionIntake.basedOn[*]",
+            ("NutritionOrder", "CarePlan", "ServiceRequest"),
+        ),
+        ("NutritionIntake.consumedItem[*].nutritionProduct", ("NutritionProduct",)),
+        ("NutritionIntake.derivedFrom[*]", ("Resource",)),
+        ("NutritionIntake.encounter", ("Encounter",)),
+        ("NutritionIntake.identifier[*].assigner", ("Organization",)),
+        ("NutritionIntake.ingredientLabel[*].nutrient", ("Substance",)),
+        ("NutritionIntake.location", ("Location",)),
+        (
+            "NutritionIntake.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("NutritionIntake.partOf[*]", ("NutritionIntake", "Procedure", "Observation")),
+        (
+            "NutritionIntake.performer[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "NutritionIntake.reason[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        (
+            "NutritionIntake.reportedReference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+            ),
+        ),
+        ("NutritionIntake.subject", ("Patient", "Group")),
+    ),
+    "NutritionOrder": (
+        ("NutritionOrder.allergyIntolerance[*]", ("AllergyIntolerance",)),
+        ("NutritionOrder.basedOn[*]", ("CarePlan", "NutritionOrder", "ServiceRequest")),
+        ("NutritionOrder.encounter", ("Encounter",)),
+        ("NutritionOrder.enteralFormula.additive[*].type", ("NutritionProduct",)),
+        ("NutritionOrder.enteralFormula.baseFormulaType", ("NutritionProduct",)),
+        ("NutritionOrder.enteralFormula.deliveryDevice[*]", ("DeviceDefinition",)),
+        ("NutritionOrder.groupIdentifier.assigner", ("Organization",)),
+        ("NutritionOrder.identifier[*].assigner", ("Organization",)),
+        (
+            "NutritionOrder.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("NutritionOrder.orderer", ("Practitioner", "PractitionerRole")),
+        (
+            "NutritionOrder.performer[*]",
+            (
+                "CareTeam",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Organization",
+            ),
+        ),
+        ("NutritionOrder.subject", ("Patient", "Group")),
+        ("NutritionOrder.supplement[*].type", ("NutritionProduct",)),
+        ("NutritionOrder.supportingInformation[*]", ("Resource",)),
+    ),
+    "NutritionProduct": (
+        ("NutritionProduct.ingredient[*].item", ("NutritionProduct",)),
+        (
+            "NutritionProduct.instance[*].biologicalSourceEvent.assigner",
+            ("Organization",),
+        ),
+        ("NutritionProduct.instance[*].identifier[*].assigner", ("Organization",)),
+        ("NutritionProduct.knownAllergen[*]", ("Substance",)),
+        ("NutritionProduct.manufacturer[*]", ("Organization",)),
+        (
+            "NutritionProduct.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("NutritionProduct.nutrient[*].item", ("Substance",)),
+    ),
+    "Observation": (
+        (
+            "Observation.basedOn[*]",
+            (
+                "CarePlan",
+                "DeviceRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+            ),
+        ),
+        ("Observation.bodyStructure", ("BodyStructure",)),
+        ("Observation.component[*].valueReference", ("MolecularSequence",)),
+        (
+            "Observation.derivedFrom[*]",
+            (
+                "DocumentReference",
+                "ImagingStudy",
+                "ImagingSelection",
+                "QuestionnaireResponse",
+                "Observation",
+                "MolecularSequence",
+                "GenomicStudy",
+            ),
+        ),
+        ("Observation.device", ("Device", "DeviceMetric")),
+        ("Observation.encounter", ("Encounter",)),
+        ("Observation.focus[*]", ("Resource",)),
+        (
+            "Observation.hasMember[*]",
+            ("Observation", "QuestionnaireResponse", "MolecularSequence"),
+        ),
+        ("Observation.identifier[*].assigner", ("Organization",)),
+        ("Observation.instantiatesReference", ("ObservationDefinition",)),
+        (
+            "Observation.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "Observation.partOf[*]",
+            (
+                "MedicationAdministration",
+                "MedicationDispense",
+                "MedicationStatement",
+                "Procedure",
+                "Immunization",
+                "ImagingStudy",
+                "GenomicStudy",
+            ),
+        ),
+        (
+            "Observation.performer[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("Observation.specimen", ("Specimen", "Group")),
+        (
+            "Observation.subject",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "Location",
+                "Organization",
+                "Procedure",
+                "Practitioner",
+                "Medication",
+                "Substance",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+            ),
+        ),
+        ("Observation.triggeredBy[*].observation", ("Observation",)),
+        ("Observation.valueReference", ("MolecularSequence",)),
+    ),
+    "ObservationDefinition": (
+        ("ObservationDefinition.device[*]", ("DeviceDefinition", "Device")),
+        (
+            "ObservationDefinition.hasMember[*]",
+            ("ObservationDefinition", "Questionnaire"),
+        ),
+        ("ObservationDefinition.identifier.assigner", ("Organization",)),
+        ("ObservationDefinition.specimen[*]", ("SpecimenDefinition",)),
+        (
+            "ObservationDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "OperationDefinition": (
+        ("OperationDefinition.identifier[*].assigner", ("Organization",)),
+        (
+            "OperationDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Organization": (
+        ("Organization.contact[*].organization", ("Organization",)),
+        ("Organization.endpoint[*]", ("Endpoint",)),
+        ("Organization.identifier[*].assigner", ("Organization",)),
+        ("Organization.partOf", ("Organization",)),
+        ("Organization.qualification[*].identifier[*].assigner", ("Organization",)),
+        ("Organization.qualification[*].issuer", ("Organization",)),
+    ),
+    "OrganizationAffiliation": (
+        ("OrganizationAffiliation.contact[*].organization", ("Organization",)),
+        ("OrganizationAffiliation.endpoint[*]", ("Endpoint",)),
+        ("OrganizationAffiliation.healthcareService[*]", ("HealthcareService",)),
+        ("OrganizationAffiliation.identifier[*].assigner", ("Organization",)),
+        ("OrganizationAffiliation.location[*]", ("Location",)),
+        ("OrganizationAffiliation.network[*]", ("Organization",)),
+        ("OrganizationAffiliation.organization", ("Organization",)),
+        ("OrganizationAffiliation.participatingOrganization", ("Organization",)),
+    ),
+    "PackagedProductDefinition": (
+        ("PackagedProductDefinition.attachedDocument[*]", ("DocumentReference",)),
+        ("PackagedProductDefinition.identifier[*].assigner", ("Organization",)),
+        ("PackagedProductDefinition.manufacturer[*]", ("Organization",)),
+        ("PackagedProductDefinition.packageFor[*]", ("MedicinalProductDefinition",)),
+        (
+            "PackagedProductDefinition.packaging.containedItem[*].item",
+            (
+                "ManufacturedItemDefinition",
+                "DeviceDefinition",
+                "PackagedProductDefinition",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+            ),
+        ),
+        (
+            "PackagedProductDefinition.packaging.identifier[*].assigner",
+            ("Organization",),
+        ),
+        ("PackagedProductDefinition.packaging.manufacturer[*]", ("Organization",)),
+    ),
+    "Parameters": (
+        (
+            "Parameters.parameter[*].valueAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Parameters.parameter[*].valueCodeableReference", None),
+        ("Parameters.parameter[*].valueDataRequirement.subjectReference", ("Group",)),
+        (
+            "Parameters.parameter[*].valueExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+        ("Parameters.parameter[*].valueIdentifier.assigner", ("Organization",)),
+        ("Parameters.parameter[*].valueReference", None),
+        (
+            "Parameters.parameter[*].valueRelatedArtifact.resourceReference",
+            ("Resource",),
+        ),
+        (
+            "Parameters.parameter[*].valueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Parameters.parameter[*].valueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Parameters.parameter[*].valueTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "Parameters.parameter[*].valueTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "Parameters.parameter[*].valueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Patient": (
+        ("Patient.contact[*].organization", ("Organization",)),
+        (
+            "Patient.generalPractitioner[*]",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+        ("Patient.identifier[*].assigner", ("Organization",)),
+        ("Patient.link[*].other", ("Patient", "RelatedPerson")),
+        ("Patient.managingOrganization", ("Organization",)),
+    ),
+    "PaymentNotice": (
+        ("PaymentNotice.identifier[*].assigner", ("Organization",)),
+        ("PaymentNotice.payee", ("Practitioner", "PractitionerRole", "Organization")),
+        ("PaymentNotice.payment", ("PaymentReconciliation",)),
+        ("PaymentNotice.recipient", ("Organization",)),
+        (
+            "PaymentNotice.reporter",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("PaymentNotice.request", ("Resource",)),
+        ("PaymentNotice.response", ("Resource",)),
+    ),
+    "PaymentReconciliation": (
+        ("PaymentReconciliation.allocation[*].account", ("Account",)),
+        ("PaymentReconciliation.allocation[*].encounter", ("Encounter",)),
+        ("PaymentReconciliation.allocation[*].identifier.assigner", ("Organization",)),
+        (
+            "PaymentReconciliation.allocation[*].payee",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("PaymentReconciliation.allocation[*].predecessor.assigner", ("Organization",)),
+        ("PaymentReconciliation.allocation[*].response", ("ClaimResponse",)),
+        ("PaymentReconciliation.allocation[*].responsible", ("PractitionerRole",)),
+        (
+            "PaymentReconciliation.allocation[*].submitter",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "PaymentReconciliation.allocation[*].target",
+            ("Claim", "Account", "Invoice", "ChargeItem", "Encounter", "Contract"),
+        ),
+        (
+            "PaymentReconciliation.allocation[*].targetItemIdentifier.assigner",
+            ("Organization",),
+        ),
+        (
+            "PaymentReconciliation.enterer",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("PaymentReconciliation.identifier[*].assigner", ("Organization",)),
+        ("PaymentReconciliation.location", ("Location",)),
+        ("PaymentReconciliation.paymentIdentifier.assigner", ("Organization",)),
+        (
+            "PaymentReconciliation.paymentIssuer",
+            ("Organization", "Patient", "RelatedPerson"),
+        ),
+        ("PaymentReconciliation.request", ("Task",)),
+        (
+            "PaymentReconciliation.requestor",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "Permission": (
+        (
+            "Permission.asserter",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "RelatedPerson",
+                "HealthcareService",
+            ),
+        ),
+        ("Permission.justification.evidence[*]", ("Resource",)),
+        (
+            "Permission.rule[*].activity[*].actor[*]",
+            (
+                "Device",
+                "Group",
+                "CareTeam",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "RelatedPerson",
+                "PractitionerRole",
+            ),
+        ),
+        ("Permission.rule[*].data[*].resource[*].reference", ("Resource",)),
+    ),
+    "Person": (
+        ("Person.identifier[*].assigner", ("Organization",)),
+        (
+            "Person.link[*].target",
+            ("Patient", "Practitioner", "RelatedPerson", "Person"),
+        ),
+        ("Person.managingOrganization", ("Organization",)),
+    ),
+    "PlanDefinition": (
+        ("PlanDefinition.action[*].documentation[*].resourceReference", ("Resource",)),
+        ("PlanDefinition.action[*].input[*].requirement.subjectReference", ("Group",)),
+        ("PlanDefinition.action[*].location", ("Location",)),
+        ("PlanDefinition.action[*].output[*].requirement.subjectReference", ("Group",)),
+        (
+            "PlanDefinition.action[*].participant[*].typeReference",
+            (
+                "CareTeam",
+                "Device",
+                "DeviceDefinition",
+                "Endpoint",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("PlanDefinition.action[*].subjectReference", ("Group",)),
+        ("PlanDefinition.action[*].trigger[*].data[*].subjectReference", ("Group",)),
+        ("PlanDefinition.action[*].trigger[*].timingReference", ("Schedule",)),
+        (
+            "PlanDefinition.actor[*].option[*].typeReference",
+            (
+                "CareTeam",
+                "Device",
+                "DeviceDefinition",
+                "Endpoint",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("PlanDefinition.goal[*].documentation[*].resourceReference", ("Resource",)),
+        ("PlanDefinition.identifier[*].assigner", ("Organization",)),
+        ("PlanDefinition.relatedArtifact[*].resourceReference", ("Resource",)),
+        (
+            "PlanDefinition.subjectReference",
+            (
+                "Group",
+                "MedicinalProductDefinition",
+                "SubstanceDefinition",
+                "AdministrableProductDefinition",
+                "ManufacturedItemDefinition",
+                "PackagedProductDefinition",
+            ),
+        ),
+        (
+            "PlanDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Practitioner": (
+        ("Practitioner.identifier[*].assigner", ("Organization",)),
+        ("Practitioner.qualification[*].identifier[*].assigner", ("Organization",)),
+        ("Practitioner.qualification[*].issuer", ("Organization",)),
+    ),
+    "PractitionerRole": (
+        ("PractitionerRole.contact[*].organization", ("Organization",)),
+        ("PractitionerRole.endpoint[*]", ("Endpoint",)),
+        ("PractitionerRole.healthcareService[*]", ("HealthcareService",)),
+        ("PractitionerRole.identifier[*].assigner", ("Organization",)),
+        ("PractitionerRole.location[*]", ("Location",)),
+        ("PractitionerRole.organization", ("Organization",)),
+        ("PractitionerRole.practitioner", ("Practitioner",)),
+    ),
+    "Procedure": (
+        ("Procedure.basedOn[*]", ("CarePlan", "ServiceRequest")),
+        ("Procedure.complication[*]", ("Condition",)),
+        ("Procedure.encounter", ("Encounter",)),
+        ("Procedure.focalDevice[*].manipulated", ("Device",)),
+        (
+            "Procedure.focus",
+            (
+                "Patient",
+                "Group",
+                "RelatedPerson",
+                "Practitioner",
+                "Organization",
+                "CareTeam",
+                "PractitionerRole",
+                "Specimen",
+            ),
+        ),
+        ("Procedure.identifier[*].assigner", ("Organization",)),
+        ("Procedure.location", ("Location",)),
+        (
+            "Procedure.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "Procedure.partOf[*]",
+            ("Procedure", "Observation", "MedicationAdministration"),
+        ),
+        (
+            "Procedure.performer[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+                "CareTeam",
+                "HealthcareService",
+            ),
+        ),
+        ("Procedure.performer[*].onBehalfOf", ("Organization",)),
+        (
+            "Procedure.reason[*]",
+            (
+                "Condition",
+                "Observation",
+                "Procedure",
+                "DiagnosticReport",
+                "DocumentReference",
+            ),
+        ),
+        (
+            "Procedure.recorder",
+            ("Patient", "RelatedPerson", "Practitioner", "PractitionerRole"),
+        ),
+        (
+            "Procedure.report[*]",
+            ("DiagnosticReport", "DocumentReference", "Composition"),
+        ),
+        (
+            "Procedure.reportedReference",
+            (
+                "Patient",
+                "RelatedPerson",
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+            ),
+        ),
+        (
+            "Procedure.subject",
+            ("Patient", "Group", "Device", "Practitioner", "Organization", "Location"),
+        ),
+        ("Procedure.supportingInfo[*]", ("Resource",)),
+        (
+            "Procedure.used[*]",
+            ("Device", "Medication", "Substance", "BiologicallyDerivedProduct"),
+        ),
+    ),
+    "Provenance": (
+        (
+            "Provenance.agent[*].onBehalfOf",
+            ("Practitioner", "PractitionerRole", "Organization", "CareTeam", "Patient"),
+        ),
+        (
+            "Provenance.agent[*].who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("Provenance.authorization[*]", None),
+        (
+            "Provenance.basedOn[*]",
+            (
+                "CarePlan",
+                "DeviceRequest",
+                "ImmunizationRecommendation",
+                "MedicationRequest",
+                "NutritionOrder",
+                "ServiceRequest",
+                "Task",
+            ),
+        ),
+        ("Provenance.encounter", ("Encounter",)),
+        (
+            "Provenance.entity[*].agent[*].onBehalfOf",
+            ("Practitioner", "PractitionerRole", "Organization", "CareTeam", "Patient"),
+        ),
+        (
+            "Provenance.entity[*].agent[*].who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("Provenance.entity[*].what", ("Resource",)),
+        ("Provenance.location", ("Location",)),
+        ("Provenance.patient", ("Patient",)),
+        (
+            "Provenance.signature[*].onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Provenance.signature[*].who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        ("Provenance.target[*]", ("Resource",)),
+    ),
+    "Questionnaire": (
+        ("Questionnaire.identifier[*].assigner", ("Organization",)),
+        ("Questionnaire.item[*].answerOption[*].valueReference", ("Resource",)),
+        ("Questionnaire.item[*].enableWhen[*].answerReference", ("Resource",)),
+        ("Questionnaire.item[*].initial[*].valueReference", ("Resource",)),
+        (
+            "Questionnaire.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "QuestionnaireResponse": (
+        (
+            "QuestionnaireResponse.author",
+            (
+                "Device",
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("QuestionnaireResponse.basedOn[*]", ("CarePlan", "ServiceRequest")),
+        ("QuestionnaireResponse.encounter", ("Encounter",)),
+        ("QuestionnaireResponse.identifier[*].assigner", ("Organization",)),
+        ("QuestionnaireResponse.item[*].answer[*].valueReference", ("Resource",)),
+        ("QuestionnaireResponse.partOf[*]", ("Observation", "Procedure")),
+        (
+            "QuestionnaireResponse.source",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("QuestionnaireResponse.subject", ("Resource",)),
+    ),
+    "RegulatedAuthorization": (
+        ("RegulatedAuthorization.attachedDocument[*]", ("DocumentReference",)),
+        ("RegulatedAuthorization.case.identifier.assigner", ("Organization",)),
+        ("RegulatedAuthorization.holder", ("Organization",)),
+        ("RegulatedAuthorization.identifier[*].assigner", ("Organization",)),
+        ("RegulatedAuthorization.indication[*]", ("ClinicalUseDefinition",)),
+        ("RegulatedAuthorization.regulator", ("Organization",)),
+        (
+            "RegulatedAuthorization.subject[*]",
+            (
+                "MedicinalProductDefinition",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+                "PackagedProductDefinition",
+                "ManufacturedItemDefinition",
+                "Ingredient",
+                "SubstanceDefinition",
+                "DeviceDefinition",
+                "ResearchStudy",
+                "ActivityDefinition",
+                "PlanDefinition",
+                "ObservationDefinition",
+                "Practitioner",
+                "Organization",
+                "Location",
+            ),
+        ),
+    ),
+    "RelatedPerson": (
+        ("RelatedPerson.identifier[*].assigner", ("Organization",)),
+        ("RelatedPerson.patient", ("Patient",)),
+    ),
+    "RequestOrchestration": (
+        (
+            "RequestOrchestration.action[*].documentation[*].resourceReference",
+            ("Resource",),
+        ),
+        ("RequestOrchestration.action[*].goal[*]", ("Goal",)),
+        (
+            "RequestOrchestration.action[*].input[*].requirement.subjectReference",
+            ("Group",),
+        ),
+        ("RequestOrchestration.action[*].location", ("Location",)),
+        (
+            "RequestOrchestration.action[*].output[*].requirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "RequestOrchestration.action[*].participant[*].actorReference",
+            (
+                "CareTeam",
+                "Device",
+                "DeviceDefinition",
+                "Endpoint",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "RequestOrchestration.action[*].participant[*].typeReference",
+            (
+                "CareTeam",
+                "Device",
+                "DeviceDefinition",
+                "Endpoint",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        ("RequestOrchestration.action[*].resource", ("Resource",)),
+        ("RequestOrchestration.author", ("Device", "Practitioner", "PractitionerRole")),
+        ("RequestOrchestration.basedOn[*]", ("Resource",)),
+        ("RequestOrchestration.encounter", ("Encounter",)),
+        ("RequestOrchestration.goal[*]", ("Goal",)),
+        ("RequestOrchestration.groupIdentifier.assigner", ("Organization",)),
+        ("RequestOrchestration.identifier[*].assigner", ("Organization",)),
+        (
+            "RequestOrchestration.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "RequestOrchestration.reason[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("RequestOrchestration.replaces[*]", ("Resource",)),
+        (
+            "RequestOrchestration.subject",
+            (
+                "CareTeam",
+                "Device",
+                "Group",
+                "HealthcareService",
+                "Location",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+    ),
+    "Requirements": (
+        ("Requirements.identifier[*].assigner", ("Organization",)),
+        (
+            "Requirements.statement[*].source[*]",
+            (
+                "CareTeam",
+                "Device",
+                "Group",
+                "HealthcareService",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "Requirements.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ResearchStudy": (
+        (
+            "ResearchStudy.associatedParty[*].party",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        ("ResearchStudy.comparisonGroup[*].intendedExposure[*]", ("EvidenceVariable",)),
+        ("ResearchStudy.comparisonGroup[*].observedGroup", ("Group",)),
+        (
+            "ResearchStudy.focus[*]",
+            (
+                "Medication",
+                "MedicinalProductDefinition",
+                "SubstanceDefinition",
+                "EvidenceVariable",
+            ),
+        ),
+        ("ResearchStudy.identifier[*].assigner", ("Organization",)),
+        (
+            "ResearchStudy.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("ResearchStudy.outcomeMeasure[*].reference", ("EvidenceVariable",)),
+        ("ResearchStudy.partOf[*]", ("ResearchStudy",)),
+        ("ResearchStudy.protocol[*]", ("PlanDefinition",)),
+        ("ResearchStudy.recruitment.actualGroup", ("Group",)),
+        ("ResearchStudy.recruitment.eligibility", ("Group", "EvidenceVariable")),
+        ("ResearchStudy.relatedArtifact[*].resourceReference", ("Resource",)),
+        ("ResearchStudy.result[*]", ("EvidenceReport", "Citation", "DiagnosticReport")),
+        ("ResearchStudy.site[*]", ("Location", "ResearchStudy", "Organization")),
+    ),
+    "ResearchSubject": (
+        ("ResearchSubject.consent[*]", ("Consent",)),
+        ("ResearchSubject.identifier[*].assigner", ("Organization",)),
+        ("ResearchSubject.study", ("ResearchStudy",)),
+        (
+            "ResearchSubject.subject",
+            (
+                "Patient",
+                "Group",
+                "Specimen",
+                "Device",
+                "Medication",
+                "Substance",
+                "BiologicallyDerivedProduct",
+            ),
+        ),
+    ),
+    "RiskAssessment": (
+        ("RiskAssessment.basedOn", ("Resource",)),
+        ("RiskAssessment.basis[*]", ("Resource",)),
+        ("RiskAssessment.condition", ("Condition",)),
+        ("RiskAssessment.encounter", ("Encounter",)),
+        ("RiskAssessment.identifier[*].assigner", ("Organization",)),
+        (
+            "RiskAssessment.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("RiskAssessment.parent", ("Resource",)),
+        (
+            "RiskAssessment.performer",
+            ("Patient", "Practitioner", "PractitionerRole", "RelatedPerson", "Device"),
+        ),
+        (
+            "RiskAssessment.reason[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        ("RiskAssessment.subject", ("Patient", "Group")),
+    ),
+    "Schedule": (
+        (
+            "Schedule.actor[*]",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "CareTeam",
+                "RelatedPerson",
+                "Device",
+                "HealthcareService",
+                "Location",
+            ),
+        ),
+        ("Schedule.identifier[*].assigner", ("Organization",)),
+        ("Schedule.serviceType[*]", ("HealthcareService",)),
+    ),
+    "SearchParameter": (
+        ("SearchParameter.identifier[*].assigner", ("Organization",)),
+        (
+            "SearchParameter.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "ServiceRequest": (
+        (
+            "ServiceRequest.basedOn[*]",
+            ("CarePlan", "ServiceRequest", "MedicationRequest"),
+        ),
+        ("ServiceRequest.bodyStructure", ("BodyStructure",)),
+        ("ServiceRequest.code", ("ActivityDefinition", "PlanDefinition")),
+        ("ServiceRequest.encounter", ("Encounter",)),
+        ("ServiceRequest.focus[*]", ("Resource",)),
+        ("ServiceRequest.identifier[*].assigner", ("Organization",)),
+        ("ServiceRequest.insurance[*]", ("Coverage", "ClaimResponse")),
+        ("ServiceRequest.location[*]", ("Location",)),
+        (
+            "ServiceRequest.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "ServiceRequest.orderDetail[*].parameterFocus",
+            (
+                "Device",
+                "DeviceDefinition",
+                "DeviceRequest",
+                "SupplyRequest",
+                "Medication",
+                "MedicationRequest",
+                "BiologicallyDerivedProduct",
+                "Substance",
+            ),
+        ),
+        (
+            "ServiceRequest.patientInstruction[*].instructionReference",
+            ("DocumentReference",),
+        ),
+        (
+            "ServiceRequest.performer[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "ServiceRequest.reason[*]",
+            (
+                "Condition",
+                "Observation",
+                "DiagnosticReport",
+                "DocumentReference",
+                "DetectedIssue",
+            ),
+        ),
+        ("ServiceRequest.relevantHistory[*]", ("Provenance",)),
+        ("ServiceRequest.replaces[*]", ("ServiceRequest",)),
+        (
+            "ServiceRequest.requester",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+            ),
+        ),
+        ("ServiceRequest.requisition.assigner", ("Organization",)),
+        ("ServiceRequest.specimen[*]", ("Specimen",)),
+        ("ServiceRequest.subject", ("Patient", "Group", "Location", "Device")),
+        ("ServiceRequest.supportingInfo[*]", ("Resource",)),
+    ),
+    "Slot": (
+        ("Slot.identifier[*].assigner", ("Organization",)),
+        ("Slot.schedule", ("Schedule",)),
+        ("Slot.serviceType[*]", ("HealthcareService",)),
+    ),
+    "Specimen": (
+        ("Specimen.accessionIdentifier.assigner", ("Organization",)),
+        ("Specimen.collection.bodySite", ("BodyStructure",)),
+        (
+            "Specimen.collection.collector",
+            ("Practitioner", "PractitionerRole", "Patient", "RelatedPerson"),
+        ),
+        ("Specimen.collection.device", ("Device",)),
+        ("Specimen.collection.procedure", ("Procedure",)),
+        ("Specimen.container[*].device", ("Device",)),
+        ("Specimen.container[*].location", ("Location",)),
+        ("Specimen.identifier[*].assigner", ("Organization",)),
+        (
+            "Specimen.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Specimen.parent[*]", ("Specimen",)),
+        ("Specimen.processing[*].additive[*]", ("Substance",)),
+        ("Specimen.request[*]", ("ServiceRequest",)),
+        (
+            "Specimen.subject",
+            (
+                "Patient",
+                "Group",
+                "Device",
+                "BiologicallyDerivedProduct",
+                "Substance",
+                "Location",
+            ),
+        ),
+    ),
+    "SpecimenDefinition": (
+        ("SpecimenDefinition.identifier.assigner", ("Organization",)),
+        ("SpecimenDefinition.subjectReference", ("Group",)),
+        (
+            "SpecimenDefinition.typeTested[*].container.additive[*].additiveReference",
+            ("SubstanceDefinition",),
+        ),
+        (
+            "SpecimenDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "StructureDefinition": (
+        (
+            "StructureDefinition.differential.element[*].binding.additional[*].usage[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueCodeableReference",
+            None,
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.differential.element[*].defaultValueReference", None),
+        (
+            "StructureDefinition.differential.element[*].defaultValueRelatedArtifact.resourceReference",
+            ("Resource",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].defaultValueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueCodeableReference",
+            None,
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.differential.element[*].example[*].valueReference", None),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueRelatedArtifact.resourceReference",
+            ("Resource",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].example[*].valueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("StructureDefinition.differential.element[*].fixedCodeableReference", None),
+        (
+            "StructureDefinition.differential.element[*].fixedDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.differential.element[*].fixedReference", None),
+        (
+            "StructureDefinition.differential.element[*].fixedRelatedArtifact.resourceReference",
+            ("Resource",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].fixedUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("StructureDefinition.differential.element[*].patternCodeableReference", None),
+        (
+            "StructureDefinition.differential.element[*].patternDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.differential.element[*].patternReference", None),
+        (
+            "StructureDefinition.differential.element[*].patternRelatedArtifact.resourceReference",
+            ("Resource",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.differential.element[*].patternUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        ("StructureDefinition.identifier[*].assigner", ("Organization",)),
+        (
+            "StructureDefinition.snapshot.element[*].binding.additional[*].usage[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("StructureDefinition.snapshot.element[*].defaultValueCodeableReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.snapshot.element[*].defaultValueReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueRelatedArtifact.resourceReference",
+            ("Resource",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].defaultValueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueCodeableReference",
+            None,
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.snapshot.element[*].example[*].valueReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueRelatedArtifact.resourceReference",
+            ("Resource",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].example[*].valueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("StructureDefinition.snapshot.element[*].fixedCodeableReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].fixedDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.snapshot.element[*].fixedReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].fixedRelatedArtifact.resourceReference",
+            ("Resource",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].fixedUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("StructureDefinition.snapshot.element[*].patternCodeableReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].patternDataRequirement.subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternIdentifier.assigner",
+            ("Organization",),
+        ),
+        ("StructureDefinition.snapshot.element[*].patternReference", None),
+        (
+            "StructureDefinition.snapshot.element[*].patternRelatedArtifact.resourceReference",
+            ("Resource",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternTriggerDefinition.timingReference",
+            ("Schedule",),
+        ),
+        (
+            "StructureDefinition.snapshot.element[*].patternUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "StructureDefinition.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "StructureMap": (
+        ("StructureMap.identifier[*].assigner", ("Organization",)),
+        (
+            "StructureMap.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Subscription": (
+        ("Subscription.identifier[*].assigner", ("Organization",)),
+        (
+            "Subscription.managingEntity",
+            (
+                "CareTeam",
+                "HealthcareService",
+                "Organization",
+                "RelatedPerson",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+            ),
+        ),
+    ),
+    "SubscriptionStatus": (
+        ("SubscriptionStatus.notificationEvent[*].additionalContext[*]", ("Resource",)),
+        ("SubscriptionStatus.notificationEvent[*].focus", ("Resource",)),
+        ("SubscriptionStatus.subscription", ("Subscription",)),
+    ),
+    "SubscriptionTopic": (
+        ("SubscriptionTopic.identifier[*].assigner", ("Organization",)),
+        (
+            "SubscriptionTopic.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Substance": (
+        ("Substance.code", ("SubstanceDefinition",)),
+        ("Substance.identifier[*].assigner", ("Organization",)),
+        ("Substance.ingredient[*].substanceReference", ("Substance",)),
+    ),
+    "SubstanceDefinition": (
+        (
+            "SubstanceDefinition.code[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("SubstanceDefinition.code[*].source[*]", ("DocumentReference",)),
+        ("SubstanceDefinition.identifier[*].assigner", ("Organization",)),
+        ("SubstanceDefinition.informationSource[*]", ("Citation",)),
+        ("SubstanceDefinition.manufacturer[*]", ("Organization",)),
+        ("SubstanceDefinition.moiety[*].identifier.assigner", ("Organization",)),
+        ("SubstanceDefinition.name[*].source[*]", ("DocumentReference",)),
+        (
+            "SubstanceDefinition.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("SubstanceDefinition.nucleicAcid", ("SubstanceNucleicAcid",)),
+        ("SubstanceDefinition.polymer", ("SubstancePolymer",)),
+        ("SubstanceDefinition.protein", ("SubstanceProtein",)),
+        (
+            "SubstanceDefinition.referenceInformation",
+            ("SubstanceReferenceInformation",),
+        ),
+        ("SubstanceDefinition.relationship[*].source[*]", ("DocumentReference",)),
+        (
+            "SubstanceDefinition.relationship[*].substanceDefinitionReference",
+            ("SubstanceDefinition",),
+        ),
+        (
+            "SubstanceDefinition.structure.representation[*].document",
+            ("DocumentReference",),
+        ),
+        ("SubstanceDefinition.structure.sourceDocument[*]", ("DocumentReference",)),
+        ("SubstanceDefinition.supplier[*]", ("Organization",)),
+    ),
+    "SubstanceNucleicAcid": (
+        (
+            "SubstanceNucleicAcid.subunit[*].linkage[*].identifier.assigner",
+            ("Organization",),
+        ),
+        (
+            "SubstanceNucleicAcid.subunit[*].sugar[*].identifier.assigner",
+            ("Organization",),
+        ),
+    ),
+    "SubstancePolymer": (("SubstancePolymer.identifier.assigner", ("Organization",)),),
+    "SubstanceProtein": (
+        (
+            "SubstanceProtein.subunit[*].cTerminalModificationId.assigner",
+            ("Organization",),
+        ),
+        (
+            "SubstanceProtein.subunit[*].nTerminalModificationId.assigner",
+            ("Organization",),
+        ),
+    ),
+    "SubstanceReferenceInformation": (
+        ("SubstanceReferenceInformation.gene[*].source[*]", ("DocumentReference",)),
+        (
+            "SubstanceReferenceInformation.geneElement[*].element.assigner",
+            ("Organization",),
+        ),
+        (
+            "SubstanceReferenceInformation.geneElement[*].source[*]",
+            ("DocumentReference",),
+        ),
+        ("SubstanceReferenceInformation.target[*].source[*]", ("DocumentReference",)),
+        ("SubstanceReferenceInformation.target[*].target.assigner", ("Organization",)),
+    ),
+    "SubstanceSourceMaterial": (
+        ("SubstanceSourceMaterial.organismId.assigner", ("Organization",)),
+        ("SubstanceSourceMaterial.parentSubstanceId[*].assigner", ("Organization",)),
+    ),
+    "SupplyDelivery": (
+        ("SupplyDelivery.basedOn[*]", ("SupplyRequest",)),
+        ("SupplyDelivery.destination", ("Location",)),
+        ("SupplyDelivery.identifier[*].assigner", ("Organization",)),
+        ("SupplyDelivery.partOf[*]", ("SupplyDelivery", "Contract")),
+        ("SupplyDelivery.patient", ("Patient",)),
+        (
+            "SupplyDelivery.receiver[*]",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "SupplyDelivery.suppliedItem[*].itemReference",
+            (
+                "Medication",
+                "Substance",
+                "Device",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+                "InventoryItem",
+            ),
+        ),
+        (
+            "SupplyDelivery.supplier",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+    ),
+    "SupplyRequest": (
+        ("SupplyRequest.basedOn[*]", ("Resource",)),
+        ("SupplyRequest.deliverFor", ("Patient",)),
+        ("SupplyRequest.deliverFrom", ("Organization", "Location")),
+        (
+            "SupplyRequest.deliverTo",
+            ("Organization", "Location", "Patient", "RelatedPerson"),
+        ),
+        ("SupplyRequest.identifier[*].assigner", ("Organization",)),
+        (
+            "SupplyRequest.item",
+            (
+                "Medication",
+                "Substance",
+                "Device",
+                "DeviceDefinition",
+                "BiologicallyDerivedProduct",
+                "NutritionProduct",
+                "InventoryItem",
+            ),
+        ),
+        (
+            "SupplyRequest.reason[*]",
+            ("Condition", "Observation", "DiagnosticReport", "DocumentReference"),
+        ),
+        (
+            "SupplyRequest.requester",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "Patient",
+                "RelatedPerson",
+                "Device",
+                "CareTeam",
+            ),
+        ),
+        ("SupplyRequest.supplier[*]", ("Organization", "HealthcareService")),
+    ),
+    "Task": (
+        ("Task.basedOn[*]", ("Resource",)),
+        ("Task.encounter", ("Encounter",)),
+        ("Task.focus", ("Resource",)),
+        ("Task.for", ("Resource",)),
+        ("Task.groupIdentifier.assigner", ("Organization",)),
+        ("Task.identifier[*].assigner", ("Organization",)),
+        (
+            "Task.input[*].valueAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Task.input[*].valueCodeableReference", None),
+        ("Task.input[*].valueDataRequirement.subjectReference", ("Group",)),
+        ("Task.input[*].valueExtendedContactDetail.organization", ("Organization",)),
+        ("Task.input[*].valueIdentifier.assigner", ("Organization",)),
+        ("Task.input[*].valueReference", None),
+        ("Task.input[*].valueRelatedArtifact.resourceReference", ("Resource",)),
+        (
+            "Task.input[*].valueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Task.input[*].valueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        ("Task.input[*].valueTriggerDefinition.data[*].subjectReference", ("Group",)),
+        ("Task.input[*].valueTriggerDefinition.timingReference", ("Schedule",)),
+        (
+            "Task.input[*].valueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        ("Task.insurance[*]", ("Coverage", "ClaimResponse")),
+        ("Task.location", ("Location",)),
+        (
+            "Task.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "Task.output[*].valueAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Task.output[*].valueCodeableReference", None),
+        ("Task.output[*].valueDataRequirement.subjectReference", ("Group",)),
+        ("Task.output[*].valueExtendedContactDetail.organization", ("Organization",)),
+        ("Task.output[*].valueIdentifier.assigner", ("Organization",)),
+        ("Task.output[*].valueReference", None),
+        ("Task.output[*].valueRelatedArtifact.resourceReference", ("Resource",)),
+        (
+            "Task.output[*].valueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Task.output[*].valueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        ("Task.output[*].valueTriggerDefinition.data[*].subjectReference", ("Group",)),
+        ("Task.output[*].valueTriggerDefinition.timingReference", ("Schedule",)),
+        (
+            "Task.output[*].valueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "Task.owner",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("Task.partOf[*]", ("Task",)),
+        (
+            "Task.performer[*].actor",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "Patient",
+                "RelatedPerson",
+            ),
+        ),
+        ("Task.reason[*]", None),
+        ("Task.relevantHistory[*]", ("Provenance",)),
+        (
+            "Task.requestedPerformer[*]",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "Task.requester",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "Task.restriction.recipient[*]",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Group",
+                "Organization",
+            ),
+        ),
+        ("Task.statusReason", None),
+    ),
+    "TerminologyCapabilities": (
+        ("TerminologyCapabilities.identifier[*].assigner", ("Organization",)),
+        (
+            "TerminologyCapabilities.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "TestPlan": (
+        ("TestPlan.dependency[*].predecessor", None),
+        ("TestPlan.identifier[*].assigner", ("Organization",)),
+        ("TestPlan.scope[*]", None),
+        ("TestPlan.testCase[*].assertion[*].object[*]", None),
+        ("TestPlan.testCase[*].assertion[*].result[*]", None),
+        ("TestPlan.testCase[*].dependency[*].predecessor", None),
+        ("TestPlan.testCase[*].scope[*]", None),
+        ("TestPlan.testCase[*].testData[*].content", None),
+        ("TestPlan.testCase[*].testData[*].sourceReference", None),
+        ("TestPlan.testCase[*].testRun[*].script.sourceReference", None),
+        (
+            "TestPlan.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "TestReport": (("TestReport.identifier.assigner", ("Organization",)),),
+    "TestScript": (
+        ("TestScript.fixture[*].resource", ("Resource",)),
+        ("TestScript.identifier[*].assigner", ("Organization",)),
+        (
+            "TestScript.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "Transport": (
+        ("Transport.basedOn[*]", ("Resource",)),
+        ("Transport.currentLocation", ("Location",)),
+        ("Transport.encounter", ("Encounter",)),
+        ("Transport.focus", ("Resource",)),
+        ("Transport.for", ("Resource",)),
+        ("Transport.groupIdentifier.assigner", ("Organization",)),
+        ("Transport.history", ("Transport",)),
+        ("Transport.identifier[*].assigner", ("Organization",)),
+        (
+            "Transport.input[*].valueAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Transport.input[*].valueCodeableReference", None),
+        ("Transport.input[*].valueDataRequirement.subjectReference", ("Group",)),
+        (
+            "Transport.input[*].valueExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+        ("Transport.input[*].valueIdentifier.assigner", ("Organization",)),
+        ("Transport.input[*].valueReference", None),
+        ("Transport.input[*].valueRelatedArtifact.resourceReference", ("Resource",)),
+        (
+            "Transport.input[*].valueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Transport.input[*].valueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Transport.input[*].valueTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        ("Transport.input[*].valueTriggerDefinition.timingReference", ("Schedule",)),
+        (
+            "Transport.input[*].valueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        ("Transport.insurance[*]", ("Coverage", "ClaimResponse")),
+        ("Transport.location", ("Location",)),
+        (
+            "Transport.note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        (
+            "Transport.output[*].valueAnnotation.authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("Transport.output[*].valueCodeableReference", None),
+        ("Transport.output[*].valueDataRequirement.subjectReference", ("Group",)),
+        (
+            "Transport.output[*].valueExtendedContactDetail.organization",
+            ("Organization",),
+        ),
+        ("Transport.output[*].valueIdentifier.assigner", ("Organization",)),
+        ("Transport.output[*].valueReference", None),
+        ("Transport.output[*].valueRelatedArtifact.resourceReference", ("Resource",)),
+        (
+            "Transport.output[*].valueSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Transport.output[*].valueSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "Transport.output[*].valueTriggerDefinition.data[*].subjectReference",
+            ("Group",),
+        ),
+        ("Transport.output[*].valueTriggerDefinition.timingReference", ("Schedule",)),
+        (
+            "Transport.output[*].valueUsageContext.valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+        (
+            "Transport.owner",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Organization",
+                "CareTeam",
+                "HealthcareService",
+                "Patient",
+                "Device",
+                "RelatedPerson",
+            ),
+        ),
+        ("Transport.partOf[*]", ("Transport",)),
+        ("Transport.reason", ("Resource",)),
+        ("Transport.relevantHistory[*]", ("Provenance",)),
+        ("Transport.requestedLocation", ("Location",)),
+        (
+            "Transport.requester",
+            (
+                "Device",
+                "Organization",
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+            ),
+        ),
+        (
+            "Transport.restriction.recipient[*]",
+            (
+                "Patient",
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Group",
+                "Organization",
+            ),
+        ),
+    ),
+    "ValueSet": (
+        ("ValueSet.identifier[*].assigner", ("Organization",)),
+        ("ValueSet.relatedArtifact[*].resourceReference", ("Resource",)),
+        (
+            "ValueSet.useContext[*].valueReference",
+            (
+                "PlanDefinition",
+                "ResearchStudy",
+                "InsurancePlan",
+                "HealthcareService",
+                "Group",
+                "Location",
+                "Organization",
+            ),
+        ),
+    ),
+    "VerificationResult": (
+        (
+            "VerificationResult.attestation.onBehalfOf",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+        (
+            "VerificationResult.attestation.proxySignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "VerificationResult.attestation.proxySignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "VerificationResult.attestation.sourceSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "VerificationResult.attestation.sourceSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "VerificationResult.attestation.who",
+            ("Practitioner", "PractitionerRole", "Organization"),
+        ),
+        (
+            "VerificationResult.primarySource[*].who",
+            ("Organization", "Practitioner", "PractitionerRole"),
+        ),
+        ("VerificationResult.target[*]", ("Resource",)),
+        (
+            "VerificationResult.validator[*].attestationSignature.onBehalfOf",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        (
+            "VerificationResult.validator[*].attestationSignature.who",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "RelatedPerson",
+                "Patient",
+                "Device",
+                "Organization",
+            ),
+        ),
+        ("VerificationResult.validator[*].organization", ("Organization",)),
+    ),
+    "VisionPrescription": (
+        ("VisionPrescription.encounter", ("Encounter",)),
+        ("VisionPrescription.identifier[*].assigner", ("Organization",)),
+        (
+            "VisionPrescription.lensSpecification[*].note[*].authorReference",
+            (
+                "Practitioner",
+                "PractitionerRole",
+                "Patient",
+                "RelatedPerson",
+                "Organization",
+            ),
+        ),
+        ("VisionPrescription.patient", ("Patient",)),
+        ("VisionPrescription.prescriber", ("Practitioner", "PractitionerRole")),
+    ),
+}
+
+__all__ = ["REFERENCE_FIELDS", "REFERENCE_PATHS"]
@@ -0,0 +1,113 @@
+from __future__ import annotations as _annotations
+
+import io
+import json
+import re
+import typing
+from importlib import import_module
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+
+from .construct import construct_trusted
+from .jsonstream import JSONStreamScanner
+from .lazy import model_validate_json_lazy
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+FHIR_RELEASES: typing.Dict[str, str] = {
+    "R5": "fhir.resources",
+    "R4B": "fhir.resources.R4B",
+    "STU3": "fhir.resources.STU3",
+}
+DEFAULT_FHIR_RELEASE = "R5"
+# ``resourceType`` is written first by (nearly) every FHIR server
+_LEADING_RESOURCE_TYPE = re.compile(
+    rb'(?:\xef\xbb\xbf)?\s*\{\s*"resourceType"\s*:\s*"([A-Za-z0-9]+)"'
+)
+
+
+def get_fhir_model_class(
+    model_name: str, fhir_release: str = DEFAULT_FHIR_RELEASE
+) -> typing.Type[FHIRAbstractModel]:
+    """Version aware ``get_fhir_model_class``.
+
+    fhir_release: one of ``FHIR_RELEASES`` (``R5``, ``R4B`` or ``STU3``).
+    """
+    try:
+        package = FHIR_RELEASES[fhir_release]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported FHIR release ``{fhir_release}``, "
+            f"expected one of {list(FHIR_RELEASES)}"
+        )
+    return import_module(package).get_fhir_model_class(model_name)
+
+
+def sniff_resource_type(data: typing.Union[str, bytes]) -> str:
+    """Read the top level ``resourceType`` from raw JSON without parsing the
+    whole document."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    match = _LEADING_RESOURCE_TYPE.match(data)
+    if match is not None:
+        return match.group(1).decode("ascii")
+
+    # not the first member, walk over the top level members only, so that a
+    # ``resourceType`` of a contained resource is never picked up.
+    scanner = JSONStreamScanner(io.BytesIO(data))
+    for key in scanner.iter_object_members():
+        value = scanner.read_value()
+        if key == "resourceType":
+            resource_type = json.loads(value)
+            if isinstance(resource_type, str):
+                return resource_type
+            break
+    raise ValueError("Value for the field 'resourceType' is required.")
+
+
+def parse_resource(
+    data: typing.Union[str, bytes, typing.Dict[str, typing.Any]],
+    fhir_release: str = DEFAULT_FHIR_RELEASE,
+    *,
+    lazy: bool = False,
+    trusted: bool = False,
+) -> FHIRAbstractModel:
+    """Validate a resource of any type, the model class is picked from its
+    ``resourceType``.
+
+    Raw JSON goes through ``model_validate_json`` in one pass, only the
+    ``resourceType`` is sniffed beforehand (no ``json.loads`` of the payload).
+
+    lazy: lists of ``BackboneElement`` are validated on first access, see
+        ``fhir.resources.utils.lazy.model_validate_json_lazy``. Applies to raw
+        JSON only, a ``dict`` is always validated at once.
+    trusted: the data was validated before, build the instance without
+        validation, see ``fhir.resources.utils.construct.construct_trusted``.
+    """
+    if trusted:
+        if lazy:
+            raise ValueError("``lazy`` and ``trusted`` cannot be combined.")
+        if not isinstance(data, dict):
+            data = json.loads(data)
+    if isinstance(data, dict):
+        resource_type = data.get("resourceType")
+        if not isinstance(resource_type, str):
+            raise ValueError("Value for the field 'resourceType' is required.")
+        model_klass = get_fhir_model_class(resource_type, fhir_release)
+        if trusted:
+            return construct_trusted(model_klass, data)
+        return model_klass.model_validate(data)
+    model_klass = get_fhir_model_class(sniff_resource_type(data), fhir_release)
+    if lazy:
+        return model_validate_json_lazy(model_klass, data)
+    return model_klass.model_validate_json(data)
+
+
+__all__ = [
+    "FHIR_RELEASES",
+    "DEFAULT_FHIR_RELEASE",
+    "get_fhir_model_class",
+    "sniff_resource_type",
+    "parse_resource",
+]
@@ -0,0 +1,467 @@
+"""Opt-in enforcement of coded values: the ``enum_values`` of the generated
+fields and the ``required`` bindings of ``Coding``/``CodeableConcept`` (and
+code) elements, checked against preloaded ``ValueSet`` expansions.
+
+>>> codes = CodeIndex()
+>>> codes.add_expansion(value_set)  # a ``ValueSet`` with ``expansion``
+>>> validator = CodeValidator(codes, load_required_bindings("definitions.json.zip"))
+>>> enable_code_validation(validator)
+>>> Patient.model_validate({"resourceType": "Patient", "gender": "M"})
+Traceback (most recent call last):
+...
+pydantic_core._pydantic_core.ValidationError: 1 validation error for Patient
+gender
+  Value 'M' is not one of ['female', 'male', 'other', 'unknown'] ...
+
+Every model checks its own coded fields after validation, nested elements
+included, from a table compiled once per class: one set lookup per code.
+``validate()`` does the same for models that were never validated
+(``model_construct``, ``construct_trusted``).
+"""
+
+from __future__ import annotations as _annotations
+
+import json
+import os
+import sys
+import typing
+import zipfile
+from functools import lru_cache
+from types import MappingProxyType
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+from fhir_core.utils import is_primitive_type
+from pydantic.fields import FieldInfo
+from pydantic_core import InitErrorDetails, PydanticCustomError, ValidationError
+
+from ..fhirabstractmodel import FHIRAbstractModel as _LocalAbstractModel
+from ..fhirabstractmodel import get_field_model_klass
+from . import DEFAULT_FHIR_RELEASE, get_fhir_model_class
+from .bundle import BundleReader
+from .terminology import ExpandedValueSet
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+_CODED_TYPES = ("code", "Coding", "CodeableConcept")
+_DEFINITION_FILES = ("profiles-types.json", "profiles-resources.json")
+# (field name, alias, kind, enum values, value set)
+_Check = typing.Tuple[
+    str, str, str, typing.Optional[typing.FrozenSet[str]], typing.Optional[str]
+]
+# not codes, the generator copies them from the short definition of an
+# extensible list (``text/cql | text/fhirpath | etc.``)
+_OPEN_MARKERS = frozenset(("etc.", "etc", "...", "\u2026"))
+
+
+def _is_open_marker(value: str) -> bool:
+    """ """
+    return value.endswith("+") or value in _OPEN_MARKERS
+
+
+@lru_cache(maxsize=None)
+def get_enum_values(
+    klass: typing.Type[FHIRAbstractModel],
+) -> typing.Mapping[str, typing.FrozenSet[str]]:
+    """``{field name: enum values}`` of a model class, as frozensets.
+
+    Lists the generator had to cut short (``registered | preliminary | final
+    | amended +``) or that end with ``etc.`` are open, they are left out.
+    """
+    enums = dict()
+    for name, field_info in klass.model_fields.items():
+        extra = field_info.json_schema_extra
+        if not isinstance(extra, dict) or "enum_values" not in extra:
+            continue
+        values = extra["enum_values"]
+        if any(_is_open_marker(value) for value in values):  # type: ignore
+            continue
+        enums[name] = frozenset(values)  # type: ignore
+    return MappingProxyType(enums)
+
+
+class CodeIndex:
+    """Members of any number of expanded value sets, as one set of interned
+    ``(value set, system, code)`` and ``(value set, code)`` keys; meant to be
+    shared by every ``CodeValidator`` (and thread) of a process.
+
+    The value set is the canonical URL without version.
+    """
+
+    def __init__(self):
+        self._keys: typing.Set[typing.Tuple[str, ...]] = set()
+        self._value_sets: typing.Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._value_sets)
+
+    def add(
+        self,
+        value_set: str,
+        members: typing.Iterable[typing.Tuple[typing.Optional[str], str]],
+    ) -> None:
+        """``(system, code)`` members of a value set."""
+        url = sys.intern(value_set.split("|", 1)[0])
+        keys = self._keys
+        for system, code in members:
+            code = sys.intern(code)
+            keys.add((url, code))
+            if system is not None:
+                keys.add((url, sys.intern(system), code))
+        self._value_sets.add(url)
+
+    def add_expansion(
+        self, value_set: typing.Union[FHIRAbstractModel, ExpandedValueSet]
+    ) -> None:
+        """A ``ValueSet`` that has an ``expansion``, or an ``ExpandedValueSet``
+        of ``fhir.resources.utils.terminology.ValueSetExpander``."""
+        if isinstance(value_set, ExpandedValueSet):
+            if value_set.url is None:
+                raise ValueError("ExpandedValueSet without url")
+            self.add(value_set.url, value_set.members)
+            return
+        if value_set.url is None or value_set.expansion is None:
+            raise ValueError(
+                "ValueSet with url and expansion expected, "
+                f"got {value_set.url!r} without expansion"
+            )
+        members = []
+        stack = list(value_set.expansion.contains or ())
+        while stack:
+            item = stack.pop()
+            if item.code is not None:
+                members.append((item.system, item.code))
+            stack.extend(item.contains or ())
+        self.add(value_set.url, members)
+
+    def has_value_set(self, value_set: str) -> bool:
+        """ """
+        return value_set in self._value_sets
+
+    def contains(
+        self, value_set: str, code: str, system: typing.Optional[str] = None
+    ) -> bool:
+        """Whether ``code`` (of ``system``, any system when ``None``) is a
+        member of ``value_set``."""
+        if system is None:
+            return (value_set, code) in self._keys
+        return (value_set, system, code) in self._keys
+
+
+def load_required_bindings(
+    source: typing.Union[str, os.PathLike],
+    fhir_release: str = DEFAULT_FHIR_RELEASE,
+) -> typing.Dict[str, str]:
+    """``{element path: value set}`` of the ``required`` bindings of ``code``,
+    ``Coding`` and ``CodeableConcept`` elements, out of the base
+    ``StructureDefinition`` resources of a Bundle JSON file
+    (``profiles-resources.json``) or a zip archive holding them
+    (``definitions.json.zip``). Profiles (``derivation: constraint``) are
+    left out.
+
+    fhir_release: only used for the error message of an unknown release.
+    """
+    get_fhir_model_class("StructureDefinition", fhir_release)
+    bindings: typing.Dict[str, str] = dict()
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            names = [
+                name
+                for name in archive.namelist()
+                if os.path.basename(name) in _DEFINITION_FILES
+            ]
+            if not names:
+                raise ValueError(f"No {' or '.join(_DEFINITION_FILES)} in {source}")
+            for name in names:
+                with archive.open(name) as stream:
+                    _required_bindings(stream, bindings)
+        return bindings
+    with open(source, "rb") as stream:
+        _required_bindings(stream, bindings)
+    return bindings
+
+
+def _required_bindings(
+    stream: typing.IO[bytes], bindings: typing.Dict[str, str]
+) -> None:
+    """Raw entries only, the ``StructureDefinition`` models are not needed."""
+    reader = BundleReader(stream)
+    for raw in reader.iter_raw_entries():
+        resource = json.loads(raw).get("resource") or {}
+        if (
+            resource.get("resourceType") != "StructureDefinition"
+            or resource.get("derivation") == "constraint"
+        ):
+            continue
+        elements = resource.get("snapshot") or resource.get("differential") or {}
+        for element in elements.get("element", ()):
+            binding = element.get("binding") or {}
+            if binding.get("strength") != "required":
+                continue
+            types = {type_.get("code") for type_ in element.get("type", ())}
+            # a choice element stands for its coded types only
+            if not types.intersection(_CODED_TYPES):
+                continue
+            # R4 and later: ``valueSet``, STU3: ``valueSetReference``/``valueSetUri``
+            value_set = (
+                binding.get("valueSet")
+                or (binding.get("valueSetReference") or {}).get("reference")
+                or binding.get("valueSetUri")
+            )
+            if value_set:
+                bindings[element["path"]] = value_set.split("|", 1)[0]
+
+
+def _kind(field_info: FieldInfo) -> typing.Optional[str]:
+    """``code``, ``Coding`` or ``CodeableConcept``, ``None`` for any other."""
+    if is_primitive_type(field_info):
+        return "code"
+    klass = get_field_model_klass(field_info.annotation)[0]
+    if klass is None:
+        return None
+    type_name = klass.get_resource_type()
+    return type_name if type_name in _CODED_TYPES else None
+
+
+class CodeValidator:
+    """Checks the coded fields of models: ``enum_values`` against their
+    frozensets, bound elements against the value sets of ``code_index``.
+
+    bindings: ``{element path: value set}``, i.e. ``load_required_bindings()``;
+    a binding to a value set ``code_index`` has no expansion of is not
+    checked. Paths that match no model field of ``fhir_release`` are listed
+    in ``skipped``.
+
+    The validator is a callable, what ``enable_code_validation()`` installs.
+    """
+
+    def __init__(
+        self,
+        code_index: typing.Optional[CodeIndex] = None,
+        bindings: typing.Optional[typing.Mapping[str, str]] = None,
+        *,
+        fhir_release: str = DEFAULT_FHIR_RELEASE,
+        enums: bool = True,
+    ):
+        self.code_index = code_index if code_index is not None else CodeIndex()
+        self.fhir_release = fhir_release
+        self.enums = enums
+        self.skipped: typing.List[str] = list()
+        # {model class: {field name: value set}}
+        self._bindings: typing.Dict[type, typing.Dict[str, str]] = dict()
+        for path, value_set in (bindings or {}).items():
+            target = self._resolve(path)
+            if target is None:
+                self.skipped.append(path)
+                continue
+            klass, field_names = target
+            for name in field_names:
+                self._bindings.setdefault(klass, {})[name] = value_set
+        self._tables: typing.Dict[type, typing.Tuple[_Check, ...]] = dict()
+
+    def _resolve(
+        self, path: str
+    ) -> typing.Optional[typing.Tuple[type, typing.Tuple[str, ...]]]:
+        """Model class and coded fields of an element path; a choice
+        (``Observation.value[x]``) stands for its coded variants."""
+        type_name, *names = path.split(".")
+        if not names:
+            return None
+        try:
+            klass = get_fhir_model_class(type_name, self.fhir_release)
+        except (KeyError, LookupError, ValueError):
+            return None
+        for position, name in enumerate(names):
+            metadata = klass.get_fhir_metadata()  # type: ignore[attr-defined]
+            last = position == len(names) - 1
+            if name.endswith("[x]") and last:
+                fields = metadata.one_of_many.get(name[:-3], ((), False))[0]
+                coded = tuple(
+                    field
+                    for field in fields
+                    if _kind(klass.model_fields[field]) is not None
+                )
+                return (klass, coded) if coded else None
+            field_key = metadata.alias_index.get(name)
+            if field_key is None:
+                return None
+            field_info = klass.model_fields[field_key]
+            if last:
+                if _kind(field_info) is None:
+                    return None
+                return klass, (field_key,)
+            item_klass = get_field_model_klass(field_info.annotation)[0]
+            if item_klass is None:
+                return None
+            klass = item_klass
+        return None
+
+    def _table(self, klass: type) -> typing.Tuple[_Check, ...]:
+        """The checks of a model class, compiled once."""
+        model_fields = klass.model_fields  # type: ignore[attr-defined]
+        enums = get_enum_values(klass) if self.enums else {}  # type: ignore
+        bound = self._bindings.get(klass, {})
+        checks = list()
+        for name in model_fields:
+            value_set = bound.get(name)
+            enum_values = enums.get(name)
+            if value_set is None and enum_values is None:
+                continue
+            field_info = model_fields[name]
+            kind = _kind(field_info)
+            if kind is None:
+                continue
+            if kind != "code":
+                # enum values only ever describe codes
+                enum_values = None
+            checks.append(
+                (name, field_info.alias or name, kind, enum_values, value_set)
+            )
+        table = self._tables[klass] = tuple(checks)
+        return table
+
+    def _is_valid(
+        self,
+        kind: str,
+        item: typing.Any,
+        enum_values: typing.Optional[typing.FrozenSet[str]],
+        value_set: typing.Optional[str],
+    ) -> bool:
+        """A ``CodeableConcept`` is valid with one of its codings in the value
+        set, a ``Coding`` without code is left alone."""
+        if kind == "code":
+            if enum_values is not None:
+                return item in enum_values
+            return self.code_index.contains(value_set, item)  # type: ignore
+        contains = self.code_index.contains
+        if kind == "Coding":
+            return item.code is None or contains(
+                value_set, item.code, item.system  # type: ignore
+            )
+        return any(
+            coding.code is not None
+            and contains(value_set, coding.code, coding.system)  # type: ignore
+            for coding in item.coding or ()
+        )
+
+    @staticmethod
+    def _error(
+        loc: typing.Tuple[typing.Union[str, int], ...],
+        kind: str,
+        item: typing.Any,
+        enum_values: typing.Optional[typing.FrozenSet[str]],
+        value_set: typing.Optional[str],
+    ) -> InitErrorDetails:
+        """ """
+        if kind == "Coding":
+            item = item.code
+        elif kind == "CodeableConcept":
+            item = [c.code for c in item.coding or () if c.code] or item.text
+        if enum_values is not None:
+            error = PydanticCustomError(
+                "enum",
+                "Value {value} is not one of {expected}",
+                {"value": repr(item), "expected": sorted(enum_values)},
+            )
+        else:
+            error = PydanticCustomError(
+                "code_not_in_value_set",
+                "Code {value} is not in the value set {value_set}",
+                {"value": repr(item), "value_set": value_set},
+            )
+        return {"type": error, "loc": loc, "input": item}
+
+    def errors(self, model: FHIRAbstractModel) -> typing.List[InitErrorDetails]:
+        """Errors of the coded fields of ``model`` itself, nested models not
+        included."""
+        klass = model.__class__
+        try:
+            table = self._tables[klass]
+        except KeyError:
+            table = self._table(klass)
+        if not table:
+            return []
+        values = model.__dict__
+        has_value_set = self.code_index.has_value_set
+        errors: typing.List[InitErrorDetails] = list()
+        for name, alias, kind, enum_values, value_set in table:
+            value = values.get(name)
+            if value is None:
+                continue
+            if value_set is not None and not has_value_set(value_set):
+                if enum_values is None:
+                    continue
+                value_set = None
+            if isinstance(value, list):
+                for position, item in enumerate(value):
+                    if item is not None and not self._is_valid(
+                        kind, item, enum_values, value_set
+                    ):
+                        errors.append(
+                            self._error(
+                                (alias, position), kind, item, enum_values, value_set
+                            )
+                        )
+            elif not self._is_valid(kind, value, enum_values, value_set):
+                errors.append(
+                    self._error((alias,), kind, value, enum_values, value_set)
+                )
+        return errors
+
+    def __call__(self, model: FHIRAbstractModel) -> None:
+        """Raise ``ValidationError`` for the coded fields of ``model``."""
+        # most classes have no coded field
+        if self._tables.get(model.__class__) == ():
+            return
+        errors = self.errors(model)
+        if errors:
+            raise ValidationError.from_exception_data(model.__class__.__name__, errors)
+
+    def validate(self, model: FHIRAbstractModel) -> None:
+        """Check ``model`` and every model inside it, all errors in one
+        ``ValidationError`` with their location."""
+        errors: typing.List[InitErrorDetails] = list()
+        stack: typing.List[
+            typing.Tuple[typing.Tuple[typing.Union[str, int], ...], typing.Any]
+        ] = [((), model)]
+        while stack:
+            loc, item = stack.pop()
+            for error in self.errors(item):
+                errors.append({**error, "loc": loc + tuple(error["loc"])})
+            for name, value in item.__dict__.items():
+                if isinstance(value, FHIRAbstractModel):
+                    alias = item.__class__.model_fields[name].alias or name
+                    stack.append((loc + (alias,), value))
+                elif isinstance(value, list):
+                    alias = item.__class__.model_fields[name].alias or name
+                    stack.extend(
+                        (loc + (alias, position), child)
+                        for position, child in enumerate(value)
+                        if isinstance(child, FHIRAbstractModel)
+                    )
+        if errors:
+            errors.sort(key=lambda error: tuple(map(str, error["loc"])))
+            raise ValidationError.from_exception_data(model.__class__.__name__, errors)
+
+
+def enable_code_validation(validator: typing.Optional[CodeValidator] = None) -> None:
+    """Check the coded fields of every model validated from now on (any
+    release, any thread); a ``CodeValidator()`` with enums only by default."""
+    _LocalAbstractModel.__fhir_code_validator__ = (
+        validator if validator is not None else CodeValidator()
+    )
+
+
+def disable_code_validation() -> None:
+    """ """
+    _LocalAbstractModel.__fhir_code_validator__ = None
+
+
+__all__ = [
+    "CodeIndex",
+    "CodeValidator",
+    "disable_code_validation",
+    "enable_code_validation",
+    "get_enum_values",
+    "load_required_bindings",
+]
@@ -0,0 +1,312 @@
+from __future__ import annotations as _annotations
+
+import json
+import os
+import re
+import typing
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+
+from . import DEFAULT_FHIR_RELEASE, get_fhir_model_class
+from .jsonstream import DEFAULT_CHUNK_SIZE, JSONStreamScanner
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+_NEW, _ENTRIES, _DONE = "new", "entries", "done"
+# ``[base/]Type/id[/_history/version]``, see
+# https://www.hl7.org/fhir/references.html#literal
+_RESTFUL_URL = re.compile(
+    r"^(?P<base>.+/)?(?P<path>[A-Z][A-Za-z]+/[A-Za-z0-9\-.]{1,64})"
+    r"(?:/_history/(?P<version>[A-Za-z0-9\-.]{1,64}))?$"
+)
+_Resource = FHIRAbstractModel
+
+
+class BundleReader:
+    """Read a JSON ``Bundle`` entry by entry, without ever holding the whole
+    document, its parsed ``dict`` or the full list of ``BundleEntry`` models
+    in memory.
+
+    >>> with BundleReader("searchset.json") as reader:
+    ...     reader.bundle.type, reader.bundle.total
+    ...     for entry in reader:
+    ...         r = entry.resource
+    ...         print(f"{r.get_resource_type()}/{r.id}")
+
+    The reader is single pass. ``bundle`` is the ``Bundle`` made from every
+    member except ``entry``; members that come after ``entry`` in the document
+    (``signature`` fx.) are only part of it once iteration has finished.
+    """
+
+    def __init__(
+        self,
+        source: typing.Union[str, os.PathLike, typing.IO[typing.Any]],
+        *,
+        fhir_release: str = DEFAULT_FHIR_RELEASE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        source: path of a JSON file, or a binary (preferred) or text stream.
+        fhir_release: ``R5``, ``R4B`` or ``STU3``
+        """
+        self._owned_stream: typing.Optional[typing.IO[bytes]] = None
+        if isinstance(source, (str, os.PathLike)):
+            source = self._owned_stream = open(source, "rb")
+        self._scanner = JSONStreamScanner(source, chunk_size=chunk_size)
+        self._members = self._scanner.iter_object_members()
+        self._bundle_klass = get_fhir_model_class("Bundle", fhir_release)
+        self._entry_klass = get_fhir_model_class("BundleEntry", fhir_release)
+        self._header: typing.Dict[str, typing.Any] = {}
+        self._state = _NEW
+        self._iterated = False
+        self._bundle: typing.Optional[FHIRAbstractModel] = None
+
+    def __enter__(self) -> "BundleReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying file, when this reader has opened it."""
+        if self._owned_stream is not None:
+            self._owned_stream.close()
+            self._owned_stream = None
+
+    def _advance_to_entries(self) -> bool:
+        """Read ``Bundle`` level members until ``entry`` starts, ``False`` once
+        the document is exhausted."""
+        for key in self._members:
+            if key == "entry" and self._scanner.peek() == 0x5B:
+                self._state = _ENTRIES
+                return True
+            self._header[key] = json.loads(self._scanner.read_value())
+            self._bundle = None
+            if key == "resourceType" and self._header[key] != "Bundle":
+                raise ValueError(
+                    f"Expected resourceType ``Bundle``, "
+                    f"but got ``{self._header[key]}``."
+                )
+        self._state = _DONE
+        return False
+
+    @property
+    def bundle(self) -> FHIRAbstractModel:
+        """``Bundle`` without entries (``type``, ``total``, ``link`` ...)."""
+        if self._state == _NEW:
+            self._advance_to_entries()
+        if self._bundle is None:
+            self._bundle = self._bundle_klass.model_validate(self._header)
+        return self._bundle
+
+    def iter_raw_entries(self) -> typing.Iterator[bytes]:
+        """Raw JSON bytes of every ``Bundle.entry`` item, not validated."""
+        if self._iterated:
+            raise RuntimeError("BundleReader can be iterated only once.")
+        self._iterated = True
+        if self._state == _NEW:
+            self._advance_to_entries()
+        while self._state == _ENTRIES:
+            yield from self._scanner.iter_array_items()
+            self._advance_to_entries()
+
+    def __iter__(self) -> typing.Iterator[FHIRAbstractModel]:
+        """Validated ``BundleEntry`` models, one at a time."""
+        validate = self._entry_klass.model_validate_json
+        for raw in self.iter_raw_entries():
+            yield validate(raw)
+
+    def iter_resources(self) -> typing.Iterator[typing.Optional[FHIRAbstractModel]]:
+        """``BundleEntry.resource`` of every entry."""
+        for entry in self:
+            yield entry.resource
+
+
+def iter_bundle_entries(
+    source: typing.Union[str, os.PathLike, typing.IO[typing.Any]],
+    *,
+    fhir_release: str = DEFAULT_FHIR_RELEASE,
+) -> typing.Iterator[FHIRAbstractModel]:
+    """Shortcut for iterating over ``BundleReader``."""
+    with BundleReader(source, fhir_release=fhir_release) as reader:
+        yield from reader
+
+
+def _parse_url(
+    url: str,
+) -> typing.Tuple[typing.Optional[str], typing.Optional[str], typing.Optional[str]]:
+    """``(base, "Type/id", version)`` of a RESTful URL, all ``None`` for any
+    other (``urn:uuid:...``, ``urn:oid:...``)."""
+    if url.startswith("urn:"):
+        return None, None, None
+    match = _RESTFUL_URL.match(url)
+    if match is None:
+        return None, None, None
+    return match.group("base"), match.group("path"), match.group("version")
+
+
+def _version_id(resource: _Resource) -> typing.Optional[str]:
+    """ """
+    meta = getattr(resource, "meta", None)
+    return meta.versionId if meta is not None else None
+
+
+class BundleIndex:
+    """Reference resolution inside a ``Bundle``, following
+    https://www.hl7.org/fhir/bundle.html#references (the rules are the same
+    for R5, R4B and STU3).
+
+    The index is built in a single pass over the entries, every lookup is a
+    dictionary access, so resolving all references of a Bundle is linear.
+
+    >>> index = BundleIndex(bundle)
+    >>> for entry in bundle.entry:
+    ...     index.resolve(entry.resource.subject, entry)
+
+    References are looked up by:
+
+    * absolute URL (``http://...``, ``urn:uuid:...``) against ``fullUrl``,
+      ``.../_history/<version>`` against ``meta.versionId`` as well;
+    * relative URL (``Patient/123``) against the base of the ``fullUrl`` of
+      the referring entry, then against the ``Type/id`` of every entry when
+      the match is not ambiguous;
+    * local reference (``#id``) against the ``contained`` resources of the
+      referring resource, ``#`` is the referring resource itself.
+    """
+
+    def __init__(self, bundle: FHIRAbstractModel):
+        """bundle: ``Bundle`` of any release."""
+        self.bundle = bundle
+        # fullUrl -> resource, (fullUrl without version, version) -> resource
+        self._by_url: typing.Dict[str, _Resource] = dict()
+        self._by_version: typing.Dict[typing.Tuple[str, str], _Resource] = dict()
+        # "Type/id" -> [(base, version, resource)]
+        self._by_path: typing.Dict[
+            str,
+            typing.List[
+                typing.Tuple[typing.Optional[str], typing.Optional[str], _Resource]
+            ],
+        ] = dict()
+        # ``id()`` of the resources of the entries -> base of their fullUrl
+        self._base_of: typing.Dict[int, typing.Optional[str]] = dict()
+        # ``id()`` of a container -> {contained id: resource}, and back
+        self._contained: typing.Dict[int, typing.Dict[str, _Resource]] = dict()
+        self._container_of: typing.Dict[int, _Resource] = dict()
+
+        for entry in bundle.entry or ():
+            resource = entry.resource
+            if resource is None:
+                continue
+            self._add(entry.fullUrl, resource)
+
+    def _add(self, full_url: typing.Optional[str], resource: _Resource) -> None:
+        """ """
+        base = path = version = None
+        if full_url is not None:
+            base, path, version = _parse_url(full_url)
+            self._by_url.setdefault(full_url, resource)
+        version = version or _version_id(resource)
+        if version is not None and full_url is not None:
+            unversioned = full_url.split("/_history/", 1)[0]
+            self._by_version.setdefault((unversioned, version), resource)
+        if getattr(resource, "id", None) is not None:
+            # ``relative_path()``, which R5 resources don't inherit
+            path = f"{resource.get_resource_type()}/{resource.id}"
+        if path is not None:
+            self._by_path.setdefault(path, []).append((base, version, resource))
+        self._base_of[id(resource)] = base
+
+        contained = getattr(resource, "contained", None)
+        if contained:
+            local = self._contained[id(resource)] = dict()
+            for item in contained:
+                if item.id is not None:
+                    local.setdefault(item.id, item)
+                self._container_of[id(item)] = resource
+
+    def _context(
+        self, context: typing.Any
+    ) -> typing.Tuple[typing.Optional[_Resource], typing.Optional[str]]:
+        """``(referring resource, base of its fullUrl)`` out of a
+        ``BundleEntry``, a resource (contained ones included) or ``None``."""
+        if context is None:
+            return None, None
+        if hasattr(context, "fullUrl"):
+            resource = context.resource
+            base = None
+            if context.fullUrl is not None:
+                base = _parse_url(context.fullUrl)[0]
+            return resource, base
+        # a contained resource refers within its container
+        container = self._container_of.get(id(context))
+        if container is not None:
+            return container, self._base_of.get(id(container))
+        return context, self._base_of.get(id(context))
+
+    def resolve(
+        self, reference: typing.Any, context: typing.Any = None
+    ) -> typing.Optional[_Resource]:
+        """The resource a reference points to, ``None`` when it is not part of
+        the Bundle (or ambiguous).
+
+        reference: ``Reference`` model or its ``reference`` string.
+        context: ``BundleEntry`` or resource the reference is found in; needed
+            for local (``#id``) references, and to resolve relative ones
+            against the base of the entry ``fullUrl``.
+        """
+        if reference is not None and not isinstance(reference, str):
+            reference = reference.reference
+        if not reference:
+            return None
+
+        if reference[0] == "#":
+            container, _ = self._context(context)
+            if container is None:
+                return None
+            if reference == "#":
+                return container
+            return self._contained.get(id(container), {}).get(reference[1:])
+
+        resource = self._by_url.get(reference)
+        if resource is not None:
+            return resource
+        base, path, version = _parse_url(reference)
+        if path is None:
+            return None
+        if base is not None:
+            # absolute, only ``fullUrl`` counts
+            if version is not None:
+                return self._by_version.get((base + path, version))
+            return None
+
+        _, context_base = self._context(context)
+        if context_base is not None:
+            url = context_base + path
+            if version is not None:
+                resource = self._by_version.get((url, version))
+            else:
+                resource = self._by_url.get(url)
+            if resource is not None:
+                return resource
+        candidates = [
+            candidate
+            for _, candidate_version, candidate in self._by_path.get(path, ())
+            if version is None or candidate_version == version
+        ]
+        if len(candidates) == 1:
+            return candidates[0]
+        return None
+
+    def resolve_many(
+        self, references: typing.Iterable[typing.Any], context: typing.Any = None
+    ) -> typing.List[typing.Optional[_Resource]]:
+        """``resolve`` of every reference, all found in the same ``context``."""
+        return [self.resolve(reference, context) for reference in references]
+
+    def __contains__(self, reference: typing.Any) -> bool:
+        """ """
+        return self.resolve(reference) is not None
+
+
+__all__ = ["BundleIndex", "BundleReader", "iter_bundle_entries"]
@@ -0,0 +1,468 @@
+"""``$translate`` over ``ConceptMap`` resources compiled into lookup tables
+(https://hl7.org/fhir/conceptmap-operation-translate.html).
+
+>>> translator = ConceptMapTranslator([concept_map])
+>>> translator.translate("GLU", "http://example.org/fhir/CodeSystem/lab")
+[Translation(system='http://loinc.org', version=None, code='2345-7', ...)]
+>>> translator.translate_many(observation.code.coding for observation in batch)
+[[Translation(...)], [], ...]
+
+Works for R5, R4B and STU3 maps: ``relationship`` is the R5
+``relationship`` or the R4B/STU3 ``equivalence`` of the map, unchanged.
+"""
+
+from __future__ import annotations as _annotations
+
+import typing
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+
+from ..fhirabstractmodel import get_choice_value
+
+if typing.TYPE_CHECKING:
+    from .bindings import CodeIndex
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+# a code (no system) or ``(system, code)``
+_Key = typing.Union[str, typing.Tuple[str, str]]
+_CodingLike = typing.Union[FHIRAbstractModel, typing.Tuple[str, str]]
+# relationships/equivalences that are no match, the ``result`` of $translate
+NO_MATCH = frozenset(("not-related-to", "unmatched", "disjoint"))
+
+
+class Translation(typing.NamedTuple):
+    """One target of a translation."""
+
+    system: typing.Optional[str]
+    version: typing.Optional[str]
+    code: typing.Optional[str]
+    display: typing.Optional[str]
+    relationship: typing.Optional[str]
+    # canonical url of the ``ConceptMap``
+    source: typing.Optional[str]
+    comment: typing.Optional[str] = None
+    # ``(attribute, code or (system, code))`` of ``product``
+    product: typing.Tuple[typing.Tuple[str, _Key], ...] = ()
+
+
+class _Condition(typing.NamedTuple):
+    """``dependsOn``: one of ``keys`` or a code of ``value_set``."""
+
+    attribute: str
+    keys: typing.FrozenSet[_Key]
+    value_set: typing.Optional[str]
+
+
+class _Unmapped(typing.NamedTuple):
+    """ """
+
+    mode: str
+    code: typing.Optional[str]
+    display: typing.Optional[str]
+    relationship: typing.Optional[str]
+    other_map: typing.Optional[str]
+
+
+class _Group(typing.NamedTuple):
+    """ """
+
+    url: typing.Optional[str]
+    source: typing.Optional[str]
+    source_version: typing.Optional[str]
+    target: typing.Optional[str]
+    target_version: typing.Optional[str]
+    unmapped: typing.Optional[_Unmapped]
+
+
+class _Target(typing.NamedTuple):
+    """An element target, ``code`` and ``relationship`` are ``None`` for a
+    ``noMap`` element."""
+
+    group: int
+    code: typing.Optional[str]
+    display: typing.Optional[str]
+    relationship: typing.Optional[str]
+    comment: typing.Optional[str]
+    conditions: typing.Tuple[_Condition, ...]
+    product: typing.Tuple[typing.Tuple[str, _Key], ...]
+
+
+def _canonical(
+    value: typing.Optional[str], version: typing.Optional[str] = None
+) -> typing.Tuple[typing.Optional[str], typing.Optional[str]]:
+    """``(url, version)`` out of ``url|version``."""
+    if value is None or "|" not in value:
+        return value, version
+    url, version = value.split("|", 1)
+    return url, version
+
+
+def _keys(value: typing.Any) -> typing.FrozenSet[_Key]:
+    """What a dependency value matches: the code, and ``(system, code)`` when
+    there is a system."""
+    if value is None:
+        return frozenset()
+    if isinstance(value, bool):
+        return frozenset(("true" if value else "false",))
+    if isinstance(value, str):
+        return frozenset((value,))
+    if isinstance(value, tuple):
+        system, code = value
+        return frozenset((code, (system, code)) if system else (code,))
+    if isinstance(value, FHIRAbstractModel):
+        code = getattr(value, "code", None)
+        if code is None:
+            return frozenset()
+        system = getattr(value, "system", None)
+        return frozenset((code, (system, code)) if system else (code,))
+    keys: typing.Set[_Key] = set()
+    for item in value:
+        keys.update(_keys(item))
+    return frozenset(keys)
+
+
+def _dependency(
+    item: FHIRAbstractModel,
+) -> typing.Tuple[str, typing.Optional[_Key], typing.Optional[str]]:
+    """``(attribute, key, value set)`` of a ``dependsOn``/``product``: R5
+    ``attribute`` and ``value[x]``/``valueSet``, R4B ``property``, ``system``
+    and ``value``, STU3 ``property``, ``system`` and ``code``."""
+    attribute = getattr(item, "attribute", None)
+    if attribute is not None:
+        value = get_choice_value(item, "value")
+        key: typing.Optional[_Key] = None
+        if isinstance(value, bool):
+            key = "true" if value else "false"
+        elif isinstance(value, str):
+            key = value
+        elif isinstance(value, FHIRAbstractModel):
+            if value.get_resource_type() == "Quantity":
+                key = str(value.value) if value.value is not None else None
+            elif value.code is not None:
+                key = (value.system, value.code) if value.system else value.code
+        return attribute, key, getattr(item, "valueSet", None)
+    code = getattr(item, "value", None) or getattr(item, "code", None)
+    system = item.system
+    return item.property, (system, code) if system and code else code, None
+
+
+class ConceptMapTranslator:
+    """``ConceptMap`` resources compiled once into a dict keyed on
+    ``(source system, code)``: the targets of every group, with their
+    ``dependsOn`` conditions as sets of keys, and per source system the
+    groups an ``unmapped`` fallback applies to.
+
+    code_index: ``fhir.resources.utils.bindings.CodeIndex`` for ``dependsOn``
+        conditions on a value set (R5), which are not met otherwise.
+    """
+
+    def __init__(
+        self,
+        concept_maps: typing.Iterable[FHIRAbstractModel] = (),
+        *,
+        code_index: typing.Optional["CodeIndex"] = None,
+    ):
+        self.code_index = code_index
+        self._groups: typing.List[_Group] = list()
+        self._table: typing.Dict[typing.Tuple[str, str], typing.List[_Target]] = dict()
+        # source system -> groups with an ``unmapped``
+        self._unmapped: typing.Dict[str, typing.List[int]] = dict()
+        self._urls: typing.Set[str] = set()
+        for concept_map in concept_maps:
+            self.add_concept_map(concept_map)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def add_concept_map(self, concept_map: FHIRAbstractModel) -> None:
+        """ """
+        url, _ = _canonical(concept_map.url)
+        if url is not None:
+            self._urls.add(url)
+        for group in concept_map.group or ():
+            source, source_version = _canonical(
+                group.source, getattr(group, "sourceVersion", None)
+            )
+            target, target_version = _canonical(
+                group.target, getattr(group, "targetVersion", None)
+            )
+            unmapped = None
+            if group.unmapped is not None:
+                unmapped = _Unmapped(
+                    mode=group.unmapped.mode,
+                    code=group.unmapped.code,
+                    display=group.unmapped.display,
+                    relationship=getattr(group.unmapped, "relationship", None),
+                    other_map=_canonical(
+                        getattr(group.unmapped, "otherMap", None)
+                        or getattr(group.unmapped, "url", None)
+                    )[0],
+                )
+            position = len(self._groups)
+            self._groups.append(
+                _Group(url, source, source_version, target, target_version, unmapped)
+            )
+            if unmapped is not None and source is not None:
+                self._unmapped.setdefault(source, []).append(position)
+            if source is None:
+                continue
+            for element in group.element or ():
+                if element.code is None:
+                    continue
+                entries = self._table.setdefault((source, element.code), [])
+                if getattr(element, "noMap", None) or not element.target:
+                    # no ``unmapped`` for this code in this group
+                    entries.append(_Target(position, None, None, None, None, (), ()))
+                    continue
+                for target_item in element.target:
+                    entries.append(self._target(position, target_item))
+
+    def _target(self, group: int, item: FHIRAbstractModel) -> _Target:
+        """ """
+        conditions = list()
+        for depends_on in item.dependsOn or ():
+            attribute, key, value_set = _dependency(depends_on)
+            conditions.append(
+                _Condition(
+                    attribute,
+                    frozenset((key,)) if key is not None else frozenset(),
+                    value_set,
+                )
+            )
+        product = list()
+        for item_product in item.product or ():
+            attribute, key, _ = _dependency(item_product)
+            if key is not None:
+                product.append((attribute, key))
+        return _Target(
+            group=group,
+            code=item.code,
+            display=item.display,
+            relationship=getattr(item, "relationship", None)
+            or getattr(item, "equivalence", None),
+            comment=item.comment,
+            conditions=tuple(conditions),
+            product=tuple(product),
+        )
+
+    def _met(
+        self,
+        condition: _Condition,
+        dependencies: typing.Mapping[str, typing.FrozenSet[_Key]],
+    ) -> bool:
+        """ """
+        keys = dependencies.get(condition.attribute)
+        if not keys:
+            return False
+        if not condition.keys.isdisjoint(keys):
+            return True
+        if condition.value_set is None or self.code_index is None:
+            return False
+        contains = self.code_index.contains
+        return any(
+            isinstance(key, tuple) and contains(condition.value_set, key[1], key[0])
+            for key in keys
+        )
+
+    def _group_matches(
+        self,
+        group: _Group,
+        version: typing.Optional[str],
+        url: typing.Optional[str],
+        target_system: typing.Optional[str],
+    ) -> bool:
+        """ """
+        return (
+            (url is None or group.url == url)
+            and (target_system is None or group.target == target_system)
+            and (
+                version is None
+                or group.source_version is None
+                or group.source_version == version
+            )
+        )
+
+    def translate(
+        self,
+        code: str,
+        system: str,
+        *,
+        version: typing.Optional[str] = None,
+        url: typing.Optional[str] = None,
+        target_system: typing.Optional[str] = None,
+        dependencies: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+    ) -> typing.List[Translation]:
+        """Targets of ``code`` of ``system``, in map order, then the
+        ``unmapped`` fallbacks of the groups that have no element for the
+        code (R5 ``noMap`` elements included), each group on its own.
+
+        url: only this ``ConceptMap``.
+        target_system: only groups to this system.
+        dependencies: ``{attribute: value}`` the ``dependsOn`` conditions are
+            checked against (R4B/STU3: ``property``), the value a code,
+            ``(system, code)``, a ``Coding`` or a list of them; a target with
+            conditions is left out unless all are met.
+        """
+        if url is not None:
+            url = _canonical(url)[0]
+            if url not in self._urls:
+                raise ValueError(f"Unknown ConceptMap {url}")
+        keys = {
+            attribute: _keys(value) for attribute, value in (dependencies or {}).items()
+        }
+        return self._translate(code, system, version, url, target_system, keys, set())
+
+    def _translate(
+        self,
+        code: str,
+        system: str,
+        version: typing.Optional[str],
+        url: typing.Optional[str],
+        target_system: typing.Optional[str],
+        dependencies: typing.Mapping[str, typing.FrozenSet[_Key]],
+        visited: typing.Set[typing.Optional[str]],
+    ) -> typing.List[Translation]:
+        """ """
+        translations: typing.List[Translation] = list()
+        groups = self._groups
+        mapped: typing.Set[int] = set()
+        for entry in self._table.get((system, code), ()):
+            group = groups[entry.group]
+            if not self._group_matches(group, version, url, target_system):
+                continue
+            mapped.add(entry.group)
+            if entry.code is None and entry.relationship is None:
+                continue
+            if entry.conditions and not all(
+                self._met(condition, dependencies) for condition in entry.conditions
+            ):
+                continue
+            translations.append(
+                Translation(
+                    system=group.target,
+                    version=group.target_version,
+                    code=entry.code,
+                    display=entry.display,
+                    relationship=entry.relationship,
+                    source=group.url,
+                    comment=entry.comment,
+                    product=entry.product,
+                )
+            )
+        # ``unmapped`` of every group without an element for the code; maps
+        # chained with ``other-map`` may give the same fallback twice
+        for position in self._unmapped.get(system, ()):
+            group = groups[position]
+            if position not in mapped and self._group_matches(
+                group, version, url, target_system
+            ):
+                translations.extend(
+                    self._fallback(
+                        group,
+                        code,
+                        system,
+                        version,
+                        target_system,
+                        dependencies,
+                        visited,
+                    )
+                )
+        if len(translations) > 1:
+            translations = list(dict.fromkeys(translations))
+        return translations
+
+    def _fallback(
+        self,
+        group: _Group,
+        code: str,
+        system: str,
+        version: typing.Optional[str],
+        target_system: typing.Optional[str],
+        dependencies: typing.Mapping[str, typing.FrozenSet[_Key]],
+        visited: typing.Set[typing.Optional[str]],
+    ) -> typing.List[Translation]:
+        """``unmapped`` of a group: ``use-source-code`` (R4B/STU3
+        ``provided``), ``fixed`` or ``other-map``."""
+        unmapped = typing.cast(_Unmapped, group.unmapped)
+        if unmapped.mode in ("use-source-code", "provided"):
+            return [
+                Translation(
+                    system=group.target,
+                    version=group.target_version,
+                    code=code,
+                    display=None,
+                    relationship=unmapped.relationship,
+                    source=group.url,
+                )
+            ]
+        if unmapped.mode == "fixed":
+            return [
+                Translation(
+                    system=group.target,
+                    version=group.target_version,
+                    code=unmapped.code,
+                    display=unmapped.display,
+                    relationship=unmapped.relationship,
+                    source=group.url,
+                )
+            ]
+        if unmapped.mode == "other-map" and unmapped.other_map not in visited:
+            # a chain of maps, never the same one twice
+            return self._translate(
+                code,
+                system,
+                version,
+                unmapped.other_map,
+                target_system,
+                dependencies,
+                visited | {group.url},
+            )
+        return []
+
+    def translate_many(
+        self,
+        codings: typing.Iterable[_CodingLike],
+        *,
+        url: typing.Optional[str] = None,
+        target_system: typing.Optional[str] = None,
+        dependencies: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+    ) -> typing.List[typing.List[Translation]]:
+        """``translate`` of every ``Coding`` (or ``(system, code)``) of a
+        batch, in order; each distinct coding is translated once, equal
+        codings share the same result list."""
+        if url is not None:
+            url = _canonical(url)[0]
+            if url not in self._urls:
+                raise ValueError(f"Unknown ConceptMap {url}")
+        keys = {
+            attribute: _keys(value) for attribute, value in (dependencies or {}).items()
+        }
+        done: typing.Dict[typing.Tuple[typing.Any, ...], typing.List[Translation]] = (
+            dict()
+        )
+        results: typing.List[typing.List[Translation]] = list()
+        for coding in codings:
+            if isinstance(coding, tuple):
+                key: typing.Tuple[typing.Any, ...] = (coding[0], coding[1], None)
+            else:
+                key = (coding.system, coding.code, coding.version)
+            try:
+                results.append(done[key])
+                continue
+            except KeyError:
+                pass
+            system, code, version = key
+            if system is None or code is None:
+                translations: typing.List[Translation] = []
+            else:
+                translations = self._translate(
+                    code, system, version, url, target_system, keys, set()
+                )
+            done[key] = translations
+            results.append(translations)
+        return results
+
+
+__all__ = ["NO_MATCH", "ConceptMapTranslator", "Translation"]
@@ -0,0 +1,235 @@
+from __future__ import annotations as _annotations
+
+import base64
+import decimal
+import typing
+import uuid
+from functools import lru_cache
+from importlib import import_module
+
+from fhir_core import types as fhir_core_types
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+from fhir_core.types import FhirBase, FhirElementOrResourceBase
+from pydantic_core import SchemaValidator, core_schema
+
+from ..fhirabstractmodel import get_field_item_type
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+_Builder = typing.Callable[[typing.Any], typing.Any]
+# the plain parsers behind the FHIR date/time types, without the patterns
+_parse_date = SchemaValidator(core_schema.date_schema()).validate_python
+_parse_datetime = SchemaValidator(core_schema.datetime_schema()).validate_python
+_parse_time = SchemaValidator(core_schema.time_schema()).validate_python
+
+
+def _to_date(value: typing.Any) -> typing.Any:
+    """Partial dates (``2018``, ``1973-06``) stay strings, like validation does."""
+    if isinstance(value, str) and len(value) == 10:
+        return _parse_date(value)
+    return value
+
+
+def _to_datetime(value: typing.Any) -> typing.Any:
+    """ """
+    if not isinstance(value, str):
+        return value
+    if "T" in value:
+        try:
+            return _parse_datetime(value)
+        except ValueError:
+            # leap second and alike, kept as they came
+            return value
+    return _to_date(value)
+
+
+def _to_time(value: typing.Any) -> typing.Any:
+    """ """
+    if isinstance(value, str):
+        return _parse_time(value)
+    return value
+
+
+def _to_decimal(value: typing.Any) -> typing.Any:
+    """Floats go through ``str``, so that ``1.0`` stays ``Decimal("1.0")``."""
+    if isinstance(value, (int, float, str)):
+        return decimal.Decimal(str(value))
+    return value
+
+
+def _to_bytes(value: typing.Any) -> typing.Any:
+    """ """
+    if isinstance(value, str):
+        return base64.b64decode(value)
+    return value
+
+
+def _to_int(value: typing.Any) -> typing.Any:
+    """``integer64`` is a string in JSON."""
+    if isinstance(value, str):
+        return int(value)
+    return value
+
+
+def _to_uuid(value: typing.Any) -> typing.Any:
+    """``urn:uuid:`` prefix is accepted."""
+    if isinstance(value, str):
+        return uuid.UUID(value)
+    return value
+
+
+# most specific first, ``Instant`` is a ``DateTime`` is a ``Date``
+_PRIMITIVE_BUILDERS: typing.Tuple[typing.Tuple[type, _Builder], ...] = (
+    (fhir_core_types.Instant, _to_datetime),
+    (fhir_core_types.DateTime, _to_datetime),
+    (fhir_core_types.Date, _to_date),
+    (fhir_core_types.Time, _to_time),
+    (fhir_core_types.Decimal, _to_decimal),
+    (fhir_core_types.Base64Binary, _to_bytes),
+    (fhir_core_types.Integer64, _to_int),
+)
+
+
+def _primitive_builder(annotation: typing.Any) -> typing.Optional[_Builder]:
+    """``None`` when the value can be taken as it is (str, bool, int ...)."""
+    # ``UuidType`` is ``Annotated[UUID, ...]``
+    if getattr(annotation, "__origin__", annotation) is uuid.UUID:
+        return _to_uuid
+    for metadata in getattr(annotation, "__metadata__", ()):
+        for klass, builder in _PRIMITIVE_BUILDERS:
+            if isinstance(metadata, klass):
+                return builder
+    return None
+
+
+def _model_builder(fhir_type: typing.Type[FhirBase]) -> _Builder:
+    """ """
+    model_klass = fhir_type.get_model_klass()
+    if not issubclass(fhir_type, FhirElementOrResourceBase):
+        return lambda value: construct_trusted(model_klass, value)
+
+    # ``ResourceType`` and ``ElementType``, the actual class is named by the
+    # value's ``resourceType``, looked up in the same release package.
+    package = import_module(model_klass.__module__.rsplit(".", 1)[0])
+
+    def build(value: typing.Any) -> typing.Any:
+        klass = model_klass
+        if isinstance(value, dict) and "resourceType" in value:
+            klass = package.get_fhir_model_class(value["resourceType"])
+        return construct_trusted(klass, value)
+
+    return build
+
+
+def _field_builder(annotation: typing.Any) -> typing.Optional[_Builder]:
+    """Builder for a field value out of its annotation, ``None`` for as is."""
+    item_type, is_list = get_field_item_type(annotation)
+    if item_type is None:
+        # i.e. ``fhir_comments: str | List[str]``
+        return None
+    if is_list:
+        # the items of primitive extension lists are ``X | None``
+        item_builder = _field_builder(item_type)
+        if item_builder is None:
+            return None
+        # nulls are positional placeholders in primitive extension lists
+        return lambda values: [
+            None if value is None else item_builder(value) for value in values
+        ]
+    if isinstance(item_type, type) and issubclass(item_type, FhirBase):
+        return _model_builder(item_type)
+    return _primitive_builder(item_type)
+
+
+class _ConstructionPlan(typing.NamedTuple):
+    """ """
+
+    # ``{alias or name: (field name, builder)}``
+    fields: typing.Dict[str, typing.Tuple[str, typing.Optional[_Builder]]]
+    # ``None`` when defaults must be computed per instance (default factory)
+    defaults: typing.Optional[typing.Dict[str, typing.Any]]
+    # instances can be created without ``model_construct``
+    plain: bool
+
+
+@lru_cache(maxsize=None)
+def _construction_plan(
+    model_klass: typing.Type[FHIRAbstractModel],
+) -> _ConstructionPlan:
+    """Everything ``construct_trusted`` needs to know about a model class,
+    computed once from the field metadata of the generated module."""
+    fields: typing.Dict[str, typing.Tuple[str, typing.Optional[_Builder]]] = dict()
+    has_factory = False
+    for name, field_info in model_klass.model_fields.items():
+        entry = (name, _field_builder(field_info.annotation))
+        fields[name] = entry
+        if field_info.alias:
+            fields[field_info.alias] = entry
+        has_factory = has_factory or field_info.default_factory is not None
+
+    defaults = None
+    if not has_factory:
+        defaults = {
+            name: field_info.default
+            for name, field_info in model_klass.model_fields.items()
+        }
+    plain = (
+        defaults is not None
+        and not model_klass.__private_attributes__
+        and not model_klass.__pydantic_post_init__
+    )
+    return _ConstructionPlan(fields, defaults, plain)
+
+
+def construct_trusted(
+    model_klass: typing.Type[FHIRAbstractModel], data: typing.Dict[str, typing.Any]
+) -> FHIRAbstractModel:
+    """Build a model instance out of already validated data (i.e. loaded from
+    our own storage), without validation.
+
+    Unlike ``model_construct``, nested values become their proper model classes
+    (``HumanName``, ``Identifier``, ``Reference`` ..., contained resources by
+    ``resourceType``) and primitives their Python types (``date``,
+    ``datetime``, ``Decimal`` ...). Patterns, enums, required and choice
+    (``value[x]``) rules are not checked; invalid input gives an invalid
+    instance. Unknown keys are still refused with ``ValueError``.
+
+    >>> patient = construct_trusted(Patient, json.loads(row))
+    """
+    plan = _construction_plan(model_klass)
+    values = dict()
+    for key, value in data.items():
+        try:
+            name, builder = plan.fields[key]
+        except KeyError:
+            if key == "resourceType":
+                if value != model_klass.__resource_type__:
+                    raise ValueError(
+                        f"{model_klass.__name__} expects resource type "
+                        f"``{model_klass.__resource_type__}``, but got ``{value}``."
+                    )
+                continue
+            raise ValueError(
+                f"``{key}`` is not a field of {model_klass.__module__}."
+                f"{model_klass.__name__}"
+            )
+        if builder is not None and value is not None:
+            value = builder(value)
+        values[name] = value
+
+    if not plan.plain:
+        return model_klass.model_construct(_fields_set=set(values), **values)
+
+    # the same as ``BaseModel.model_construct``, less the per field lookups
+    instance = model_klass.__new__(model_klass)
+    instance_dict = dict(plan.defaults)  # type: ignore[arg-type]
+    instance_dict.update(values)
+    object.__setattr__(instance, "__dict__", instance_dict)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+__all__ = ["construct_trusted"]
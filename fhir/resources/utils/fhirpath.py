@@ -0,0 +1,1533 @@
+"""FHIRPath (https://hl7.org/fhirpath/) over model instances.
+
+Expressions are parsed and compiled once into a tree of closures
+(``compile_fhirpath`` is cached); evaluation navigates the models through
+their element metadata (``get_fhir_metadata``), no ``model_dump`` involved.
+
+>>> expression = compile_fhirpath("Observation.value.ofType(Quantity).value")
+>>> expression.evaluate(observation)
+[Decimal('185')]
+>>> expression.evaluate_many(observations)
+[[Decimal('185')], [], ...]
+
+Supported: the path, index, arithmetic, string, comparison, equality,
+equivalence, type (``is``, ``as``), collection, boolean and ``implies``
+operators; date, time and quantity literals; the functions of FHIRPath N1
+(existence, filtering and projection, subsetting, combining, conversion,
+string, math, tree navigation, utility) and the FHIR additions
+``extension()``, ``hasValue()``, ``getValue()``, ``resolve()`` and
+``htmlChecks()``. Choice elements navigate polymorphically: ``value`` is
+whichever ``value[x]`` is set, ``value.ofType(Quantity)`` (or ``value as
+Quantity``) is ``valueQuantity``.
+
+Dates and date times of different precision compare (``=``, ``<`` ...) to
+empty when they are equal as far as the less precise one goes.
+
+Primitive values are plain Python values, their ``id`` and ``extension``
+are not reachable. Not supported: quantity arithmetic and unit conversion,
+date/time arithmetic, ``memberOf()``, ``conformsTo()`` and the ``%vs-``/
+``%ext-`` environment variables; they raise ``ValueError``, as do operands
+of the wrong type (``'a' + 1``).
+"""
+
+from __future__ import annotations as _annotations
+
+import datetime
+import decimal
+import math
+import re
+import typing
+from functools import lru_cache
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+_Collection = typing.List[typing.Any]
+# compiled node: (input collection, environment) -> output collection
+_Node = typing.Callable[[_Collection, "_Environment"], _Collection]
+
+_TOKEN = re.compile(
+    r"""
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/)
+    |(?P<datetime>@\d{4}(?:-\d{2}(?:-\d{2})?)?
+        (?:T(?:\d{2}(?::\d{2}(?::\d{2}(?:\.\d+)?)?)?)?
+        (?:Z|[+-]\d{2}:\d{2})?)?)
+    |(?P<time>@T\d{2}(?::\d{2}(?::\d{2}(?:\.\d+)?)?)?)
+    |(?P<number>\d+(?:\.\d+)?)
+    |(?P<string>'(?:[^'\\]|\\.)*')
+    |(?P<delimited>`(?:[^`\\]|\\.)*`)
+    |(?P<special>\$(?:this|index|total))
+    |(?P<variable>%(?:[A-Za-z_][A-Za-z0-9_\-]*|'(?:[^'\\]|\\.)*'|`(?:[^`\\]|\\.)*`))
+    |(?P<identifier>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<operator><=|>=|!=|!~|[|.\[\](),=~<>+\-*/&{}])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_ESCAPES = {
+    "'": "'",
+    '"': '"',
+    "`": "`",
+    "r": "\r",
+    "n": "\n",
+    "t": "\t",
+    "f": "\f",
+    "\\": "\\",
+    "/": "/",
+}
+_CALENDAR_UNITS = {
+    "year",
+    "years",
+    "month",
+    "months",
+    "week",
+    "weeks",
+    "day",
+    "days",
+    "hour",
+    "hours",
+    "minute",
+    "minutes",
+    "second",
+    "seconds",
+    "millisecond",
+    "milliseconds",
+}
+# left binding power of the infix operators, lowest first
+_INFIX = {
+    "implies": 1,
+    "or": 2,
+    "xor": 2,
+    "and": 3,
+    "in": 4,
+    "contains": 4,
+    "=": 5,
+    "~": 5,
+    "!=": 5,
+    "!~": 5,
+    "<": 6,
+    ">": 6,
+    "<=": 6,
+    ">=": 6,
+    "|": 7,
+    "is": 8,
+    "as": 8,
+    "+": 9,
+    "-": 9,
+    "&": 9,
+    "*": 10,
+    "/": 10,
+    "div": 10,
+    "mod": 10,
+}
+_UNARY = 11
+_ENVIRONMENT = {
+    "ucum": "http://unitsofmeasure.org",
+    "sct": "http://snomed.info/sct",
+    "loinc": "http://loinc.org",
+}
+_PYTHON_TYPES = (
+    (bool, "boolean"),
+    (int, "integer"),
+    (decimal.Decimal, "decimal"),
+    (float, "decimal"),
+    (str, "string"),
+    (datetime.datetime, "datetime"),
+    (datetime.date, "date"),
+    (datetime.time, "time"),
+    (bytes, "base64binary"),
+)
+# the FHIR primitive types a Python ``str`` may stand for
+_STRING_TYPES = {
+    "string",
+    "code",
+    "id",
+    "uri",
+    "url",
+    "canonical",
+    "oid",
+    "uuid",
+    "markdown",
+    "xhtml",
+    "date",
+    "datetime",
+    "instant",
+    "time",
+}
+_MISSING = object()
+
+
+class Quantity(typing.NamedTuple):
+    """A quantity literal, ``10 'mg'`` or ``4 days``."""
+
+    value: decimal.Decimal
+    unit: str
+
+
+class _Environment:
+    """Evaluation state shared by the nodes of one evaluation."""
+
+    __slots__ = ("variables", "resolver", "index", "total")
+
+    def __init__(
+        self,
+        variables: typing.Dict[str, _Collection],
+        resolver: typing.Optional[typing.Callable[[str], typing.Any]],
+    ):
+        self.variables = variables
+        self.resolver = resolver
+        self.index: typing.Optional[int] = None
+        self.total: _Collection = []
+
+
+# --- parsing ---------------------------------------------------------------
+
+
+def _unescape(text: str) -> str:
+    """ """
+    if "\\" not in text:
+        return text
+    out = []
+    chars = iter(text)
+    for char in chars:
+        if char != "\\":
+            out.append(char)
+            continue
+        char = next(chars, "")
+        if char == "u":
+            out.append(chr(int("".join(next(chars) for _ in range(4)), 16)))
+        else:
+            out.append(_ESCAPES.get(char, char))
+    return "".join(out)
+
+
+def _tokenize(expression: str) -> typing.List[typing.Tuple[str, str]]:
+    """``[(kind, text), ...]``"""
+    tokens = []
+    position = 0
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if match is None:
+            raise ValueError(
+                f"Invalid FHIRPath ``{expression}``, unexpected character at "
+                f"{position}: ``{expression[position:position + 10]}``"
+            )
+        position = match.end()
+        kind = match.lastgroup
+        if kind != "space":
+            tokens.append((kind, match.group()))  # type: ignore[arg-type]
+    tokens.append(("end", ""))
+    return tokens
+
+
+class _Parser:
+    """Pratt parser, into a tuple tree: ``(kind, ...)``."""
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.position = 0
+
+    def peek(self) -> typing.Tuple[str, str]:
+        return self.tokens[self.position]
+
+    def next(self) -> typing.Tuple[str, str]:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def expect(self, text: str) -> None:
+        kind, value = self.next()
+        if value != text or kind in ("string", "delimited"):
+            self.error(f"expected ``{text}``, got ``{value}``")
+
+    def error(self, message: str) -> typing.NoReturn:
+        raise ValueError(f"Invalid FHIRPath ``{self.expression}``: {message}")
+
+    def parse(self) -> tuple:
+        node = self.expression_(0)
+        if self.peek()[0] != "end":
+            self.error(f"unexpected ``{self.peek()[1]}``")
+        return node
+
+    def expression_(self, min_power: int) -> tuple:
+        node = self.prefix()
+        while True:
+            kind, value = self.peek()
+            if kind not in ("operator", "identifier"):
+                break
+            power = _INFIX.get(value)
+            if power is None or power <= min_power:
+                break
+            self.next()
+            if value in ("is", "as"):
+                node = ("type_op", value, node, self.type_specifier())
+            else:
+                node = ("binary", value, node, self.expression_(power))
+        return node
+
+    def type_specifier(self) -> str:
+        kind, value = self.next()
+        if kind not in ("identifier", "delimited"):
+            self.error(f"expected a type, got ``{value}``")
+        name = value.strip("`")
+        # ``FHIR.Quantity``, ``System.String``
+        if self.peek()[1] == "." and self.tokens[self.position + 1][0] in (
+            "identifier",
+            "delimited",
+        ):
+            self.next()
+            name = self.next()[1].strip("`")
+        return name
+
+    def prefix(self) -> tuple:
+        kind, value = self.peek()
+        if kind == "operator" and value in ("+", "-"):
+            self.next()
+            return self.postfix(("unary", value, self.expression_(_UNARY)))
+        return self.postfix(self.term())
+
+    def postfix(self, node: tuple) -> tuple:
+        while True:
+            kind, value = self.peek()
+            if kind != "operator" or value not in (".", "["):
+                return node
+            self.next()
+            if value == "[":
+                index = self.expression_(0)
+                self.expect("]")
+                node = ("indexer", node, index)
+                continue
+            kind, name = self.next()
+            if kind not in ("identifier", "delimited"):
+                self.error(f"expected a name after ``.``, got ``{name}``")
+            if kind == "delimited":
+                name = _unescape(name[1:-1])
+            if kind == "identifier" and self.peek()[1] == "(":
+                node = ("invoke", node, name, self.arguments(name))
+            else:
+                node = ("member", node, name)
+
+    def arguments(self, name: str) -> typing.List[tuple]:
+        self.expect("(")
+        arguments: typing.List[tuple] = []
+        if self.peek()[1] == ")":
+            self.next()
+            return arguments
+        while True:
+            if name in ("ofType", "is", "as"):
+                arguments.append(("type", self.type_specifier()))
+            else:
+                arguments.append(self.expression_(0))
+            kind, value = self.next()
+            if value == ")":
+                return arguments
+            if value != ",":
+                self.error(f"expected ``,`` or ``)``, got ``{value}``")
+
+    def term(self) -> tuple:
+        kind, value = self.next()
+        if kind == "number":
+            unit = self.quantity_unit()
+            if unit is not None:
+                return ("literal", Quantity(decimal.Decimal(value), unit))
+            if "." in value:
+                return ("literal", decimal.Decimal(value))
+            return ("literal", int(value))
+        if kind == "string":
+            return ("literal", _unescape(value[1:-1]))
+        if kind == "datetime":
+            return ("literal", _parse_datetime_literal(value[1:]))
+        if kind == "time":
+            return ("literal", datetime.time.fromisoformat(value[2:]))
+        if kind == "special":
+            return ("special", value[1:])
+        if kind == "variable":
+            name = value[1:]
+            if name[0] in "'`":
+                name = _unescape(name[1:-1])
+            return ("variable", name)
+        if kind == "delimited":
+            return ("member", None, _unescape(value[1:-1]))
+        if kind == "identifier":
+            if value in ("true", "false"):
+                return ("literal", value == "true")
+            if self.peek()[1] == "(":
+                return ("invoke", None, value, self.arguments(value))
+            return ("member", None, value)
+        if value == "(":
+            node = self.expression_(0)
+            self.expect(")")
+            return node
+        if value == "{":
+            self.expect("}")
+            return ("empty",)
+        self.error(f"unexpected ``{value or 'end of expression'}``")
+
+    def quantity_unit(self) -> typing.Optional[str]:
+        kind, value = self.peek()
+        if kind == "string":
+            self.next()
+            return _unescape(value[1:-1])
+        if kind == "identifier" and value in _CALENDAR_UNITS:
+            self.next()
+            return value
+        return None
+
+
+def _parse_datetime_literal(value: str) -> typing.Any:
+    """Full dates and date times become ``date``/``datetime``, partial ones
+    (``@2018``, ``@2018-03``, ``@2018-03-01T10``) stay strings, the way the
+    models keep them."""
+    if "T" not in value:
+        return datetime.date.fromisoformat(value) if len(value) == 10 else value
+    date_part, time_part = value.split("T", 1)
+    if len(date_part) != 10 or len(re.split(r"[Z+-]", time_part)[0]) < 5:
+        return value.rstrip("T")
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# --- model navigation ------------------------------------------------------
+
+
+@lru_cache(maxsize=None)
+def _type_names(klass: type) -> typing.FrozenSet[str]:
+    """Lower case FHIR type names of a value class, base types included."""
+    if issubclass(klass, FHIRAbstractModel):
+        names = {klass.get_resource_type().lower()}
+        for base in klass.__mro__:
+            if (
+                isinstance(base, type)
+                and issubclass(base, FHIRAbstractModel)
+                and base.__name__ != "FHIRAbstractModel"
+            ):
+                names.add(base.__name__.lower())
+        return frozenset(names)
+    for python_type, name in _PYTHON_TYPES:
+        if issubclass(klass, python_type):
+            if name == "string":
+                return frozenset(_STRING_TYPES)
+            if name == "datetime":
+                return frozenset(("datetime", "instant"))
+            return frozenset((name,))
+    return frozenset()
+
+
+def _is_type(value: typing.Any, type_name: str) -> bool:
+    """ """
+    return type_name.lower() in _type_names(value.__class__)
+
+
+@lru_cache(maxsize=None)
+def _member_spec(
+    klass: type, name: str
+) -> typing.Tuple[typing.Optional[str], typing.Tuple[str, ...]]:
+    """``(field name, ())`` of an element, ``(None, choice fields)`` of a
+    choice element (``value`` of ``value[x]``), ``(None, ())`` when unknown."""
+    metadata = klass.get_fhir_metadata()  # type: ignore[attr-defined]
+    field_key = metadata.alias_index.get(name)
+    if field_key is not None:
+        return field_key, ()
+    if name in metadata.one_of_many:
+        return None, metadata.one_of_many[name][0]
+    return None, ()
+
+
+@lru_cache(maxsize=None)
+def _choice_field(klass: type, name: str, type_name: str) -> typing.Optional[str]:
+    """Field of the choice element ``name`` for a type, i.e. ``valueQuantity``
+    for ``("value", "Quantity")``; ``None`` when ``name`` is no choice or the
+    type is not one of its types."""
+    field_key, choices = _member_spec(klass, name)
+    if field_key is not None or not choices:
+        return None
+    wanted = (name + type_name).lower()
+    for field in choices:
+        if field.lower() == wanted:
+            return field
+    return None
+
+
+def _get(item: typing.Any, field_key: str) -> typing.Any:
+    """Field value, pending fields of lazy models included."""
+    value = item.__dict__.get(field_key, _MISSING)
+    if value is _MISSING:
+        value = getattr(item, field_key, None)
+    return value
+
+
+def _navigate(items: _Collection, name: str) -> _Collection:
+    """``items.name``"""
+    out: _Collection = []
+    for item in items:
+        if not isinstance(item, FHIRAbstractModel):
+            continue
+        field_key, choices = _member_spec(item.__class__, name)
+        if field_key is not None:
+            value = _get(item, field_key)
+        elif choices:
+            value = None
+            for field in choices:
+                value = _get(item, field)
+                if value is not None:
+                    break
+        else:
+            continue
+        if value is None:
+            continue
+        if isinstance(value, list):
+            out.extend(v for v in value if v is not None)
+        else:
+            out.append(value)
+    return out
+
+
+def _children(item: typing.Any) -> _Collection:
+    """ """
+    if not isinstance(item, FHIRAbstractModel):
+        return []
+    out: _Collection = []
+    for element in item.get_fhir_metadata().elements:  # type: ignore[attr-defined]
+        value = _get(item, element.field_key)
+        if value is None:
+            continue
+        if isinstance(value, list):
+            out.extend(v for v in value if v is not None)
+        else:
+            out.append(value)
+    return out
+
+
+# --- values ----------------------------------------------------------------
+
+
+def _singleton(collection: _Collection, what: str) -> typing.Any:
+    """ """
+    if len(collection) > 1:
+        raise ValueError(f"FHIRPath: {what} expects a single item, got {collection}")
+    return collection[0] if collection else None
+
+
+def _boolean(collection: _Collection) -> typing.Optional[bool]:
+    """Singleton evaluation of a collection as boolean, ``None`` for empty."""
+    if not collection:
+        return None
+    value = _singleton(collection, "boolean evaluation")
+    if isinstance(value, bool):
+        return value
+    return True
+
+
+# a partial date or date time, as kept by the models (``2018-03``,
+# ``2018-03-01T10``)
+_PARTIAL_DATE_TIME = re.compile(
+    r"^(\d{4})(?:-(\d{2})(?:-(\d{2})(?:T(\d{2})(?::(\d{2}))?)?)?)?$"
+)
+# the precision of two date (time) values differs, the comparison is empty
+_UNKNOWN = object()
+
+
+def _date_key(
+    value: typing.Any, utc: bool = False
+) -> typing.Optional[typing.Tuple[typing.Any, ...]]:
+    """Components of a date or date time down to its precision (seconds and
+    their fraction are one), ``None`` for anything else."""
+    if isinstance(value, datetime.datetime):
+        if utc and value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc)
+        return (
+            value.year,
+            value.month,
+            value.day,
+            value.hour,
+            value.minute,
+            (value.second, value.microsecond),
+        )
+    if isinstance(value, datetime.date):
+        return value.year, value.month, value.day
+    if isinstance(value, str):
+        match = _PARTIAL_DATE_TIME.match(value)
+        if match is not None:
+            return tuple(int(part) for part in match.groups() if part is not None)
+    return None
+
+
+def _date_keys(left: typing.Any, right: typing.Any) -> typing.Any:
+    """``(left, right)`` as comparable date keys, ``_UNKNOWN`` when they are
+    equal as far as the less precise one goes, ``None`` when they are not
+    both dates or date times (two strings are dates only when one of them
+    has a precision the other lacks)."""
+    if isinstance(left, str) and isinstance(right, str):
+        if len(left) == len(right):
+            return None
+    # time zones line up between date times only
+    utc = isinstance(left, datetime.datetime) and isinstance(right, datetime.datetime)
+    left_key, right_key = _date_key(left, utc), _date_key(right, utc)
+    if left_key is None or right_key is None:
+        return None
+    if len(left_key) == len(right_key):
+        return left_key, right_key
+    common = min(len(left_key), len(right_key))
+    if left_key[:common] == right_key[:common]:
+        return _UNKNOWN
+    return left_key[:common], right_key[:common]
+
+
+def _comparable(
+    left: typing.Any, right: typing.Any
+) -> typing.Tuple[typing.Any, typing.Any]:
+    """Line up values of different Python types standing for the same FHIR
+    type (partial dates are strings, full ones ``date``)."""
+    if isinstance(left, Quantity) or isinstance(right, Quantity):
+        return _quantity(left), _quantity(right)
+    if isinstance(left, str) != isinstance(right, str):
+        if isinstance(left, (datetime.date, datetime.time)):
+            left = left.isoformat()
+        if isinstance(right, (datetime.date, datetime.time)):
+            right = right.isoformat()
+    elif isinstance(left, datetime.datetime) != isinstance(right, datetime.datetime):
+        if isinstance(left, datetime.datetime):
+            left = left.date()
+        elif isinstance(right, datetime.datetime):
+            right = right.date()
+    return left, right
+
+
+def _quantity(value: typing.Any) -> typing.Any:
+    """``Quantity`` model (or literal) into ``(value, unit)``."""
+    if isinstance(value, Quantity):
+        return value.value, value.unit
+    if isinstance(value, FHIRAbstractModel) and _is_type(value, "Quantity"):
+        return value.value, value.code or value.unit  # type: ignore[attr-defined]
+    return value
+
+
+def _equals(left: typing.Any, right: typing.Any) -> typing.Optional[bool]:
+    """``None`` for dates (times) of different precision."""
+    dates = _date_keys(left, right)
+    if dates is _UNKNOWN:
+        return None
+    if dates is not None:
+        return dates[0] == dates[1]
+    left, right = _comparable(left, right)
+    if isinstance(left, bool) != isinstance(right, bool):
+        return False
+    return left == right
+
+
+def _equivalent(left: typing.Any, right: typing.Any) -> bool:
+    """ """
+    if isinstance(left, str) and isinstance(right, str):
+        return " ".join(left.lower().split()) == " ".join(right.lower().split())
+    if isinstance(left, (decimal.Decimal, float)) or isinstance(
+        right, (decimal.Decimal, float)
+    ):
+        # to the precision of the least precise
+        left, right = decimal.Decimal(str(left)), decimal.Decimal(str(right))
+        exponent = max(left.as_tuple().exponent, right.as_tuple().exponent)
+        quantum = decimal.Decimal(1).scaleb(exponent)  # type: ignore[arg-type]
+        return left.quantize(quantum) == right.quantize(quantum)
+    return _equals(left, right) is True
+
+
+def _distinct(collection: _Collection) -> _Collection:
+    """ """
+    out: _Collection = []
+    for item in collection:
+        if not any(_equals(item, seen) for seen in out):
+            out.append(item)
+    return out
+
+
+def _contains(collection: _Collection, value: typing.Any) -> bool:
+    """ """
+    return any(_equals(item, value) for item in collection)
+
+
+def _string(value: typing.Any) -> typing.Optional[str]:
+    """``toString()``"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, decimal.Decimal, float)):
+        return str(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, Quantity):
+        return f"{value.value} '{value.unit}'"
+    return None
+
+
+def _integer(value: typing.Any) -> typing.Optional[int]:
+    """``toInteger()``"""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and re.fullmatch(r"[+-]?\d+", value):
+        return int(value)
+    return None
+
+
+def _decimal(value: typing.Any) -> typing.Optional[decimal.Decimal]:
+    """``toDecimal()``"""
+    if isinstance(value, bool):
+        return decimal.Decimal(int(value))
+    if isinstance(value, (int, decimal.Decimal, float)):
+        return decimal.Decimal(str(value))
+    if isinstance(value, str) and re.fullmatch(r"[+-]?\d+(\.\d+)?", value):
+        return decimal.Decimal(value)
+    return None
+
+
+def _to_boolean(value: typing.Any) -> typing.Optional[bool]:
+    """``toBoolean()``"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, decimal.Decimal)) and value in (0, 1):
+        return value == 1
+    if isinstance(value, str):
+        lowered = value.lower()
+        if lowered in ("true", "t", "yes", "y", "1", "1.0"):
+            return True
+        if lowered in ("false", "f", "no", "n", "0", "0.0"):
+            return False
+    return None
+
+
+# --- compiling -------------------------------------------------------------
+
+
+def _compile(node: tuple, root: bool = True) -> _Node:
+    """Compile a parse tree node.
+
+    root: the node is evaluated against the context item(s), a leading
+        capitalized identifier may name the context type (``Patient.name``).
+    """
+    kind = node[0]
+    if kind == "literal":
+        result = [node[1]]
+        return lambda focus, env: list(result)
+    if kind == "empty":
+        return lambda focus, env: []
+    if kind == "special":
+        name = node[1]
+        if name == "this":
+            return lambda focus, env: focus
+        if name == "index":
+            return lambda focus, env: [] if env.index is None else [env.index]
+        return lambda focus, env: list(env.total)
+    if kind == "variable":
+        return _compile_variable(node[1])
+    if kind == "member":
+        return _compile_member(node)
+    if kind == "indexer":
+        base = _compile(node[1])
+        index = _compile(node[2])
+
+        def indexer(focus, env):
+            items = base(focus, env)
+            position = _singleton(index(focus, env), "indexer")
+            if position is None or not 0 <= position < len(items):
+                return []
+            return [items[position]]
+
+        return indexer
+    if kind == "invoke":
+        return _compile_invoke(node)
+    if kind == "unary":
+        operand = _compile(node[2])
+        if node[1] == "+":
+            return operand
+
+        def negate(focus, env):
+            value = _singleton(operand(focus, env), "unary -")
+            if value is None:
+                return []
+            if isinstance(value, Quantity):
+                return [Quantity(-value.value, value.unit)]
+            return [-value]
+
+        return negate
+    if kind == "type_op":
+        return _compile_type_operator(node[1], node[2], node[3])
+    if kind == "binary":
+        return _compile_binary(node[1], _compile(node[2]), _compile(node[3]))
+    raise ValueError(f"FHIRPath: unknown node {node!r}")  # pragma: no cover
+
+
+def _compile_variable(name: str) -> _Node:
+    """ """
+    if name in _ENVIRONMENT:
+        value = [_ENVIRONMENT[name]]
+        return lambda focus, env: list(value)
+
+    def variable(focus, env):
+        try:
+            return list(env.variables[name])
+        except KeyError:
+            raise ValueError(f"FHIRPath: unknown variable ``%{name}``")
+
+    return variable
+
+
+def _compile_member(node: tuple) -> _Node:
+    """``base.name`` or ``name``."""
+    _, base_node, name = node
+    if base_node is not None:
+        base = _compile(base_node)
+        return lambda focus, env: _navigate(base(focus, env), name)
+    if name[:1].isupper():
+        # ``Patient`` in ``Patient.name`` filters the context by type
+        lowered = name.lower()
+
+        def type_or_member(focus, env):
+            typed = [
+                item
+                for item in focus
+                if isinstance(item, FHIRAbstractModel)
+                and lowered in _type_names(item.__class__)
+            ]
+            return typed or _navigate(focus, name)
+
+        return type_or_member
+    return lambda focus, env: _navigate(focus, name)
+
+
+def _typed(base_node: typing.Optional[tuple], type_name: str) -> _Node:
+    """``base.ofType(T)``; a choice element is resolved to its field for that
+    type (``value.ofType(Quantity)`` -> ``valueQuantity``)."""
+    if base_node is not None and base_node[0] == "member":
+        _, parent_node, name = base_node
+        parent = _compile(parent_node) if parent_node is not None else None
+        lowered = type_name.lower()
+
+        def choice_or_filter(focus, env):
+            items = parent(focus, env) if parent is not None else focus
+            out: _Collection = []
+            for item in items:
+                if not isinstance(item, FHIRAbstractModel):
+                    continue
+                field = _choice_field(item.__class__, name, type_name)
+                if field is not None:
+                    value = _get(item, field)
+                    if value is not None:
+                        out.append(value)
+                    continue
+                out.extend(
+                    value
+                    for value in _navigate([item], name)
+                    if lowered in _type_names(value.__class__)
+                )
+            return out
+
+        return choice_or_filter
+
+    base = _compile(base_node) if base_node is not None else None
+
+    def filter_type(focus, env):
+        items = base(focus, env) if base is not None else focus
+        return [item for item in items if _is_type(item, type_name)]
+
+    return filter_type
+
+
+def _compile_type_operator(operator: str, base_node: tuple, type_name: str) -> _Node:
+    """``x is T``, ``x as T``"""
+    typed = _typed(base_node, type_name)
+    if operator == "as":
+        return typed
+    base = _compile(base_node)
+
+    def is_type(focus, env):
+        items = base(focus, env)
+        if not items:
+            return []
+        _singleton(items, "is")
+        return [bool(typed(focus, env))]
+
+    return is_type
+
+
+def _number(value: typing.Any) -> typing.Any:
+    """``int`` or ``Decimal`` of a number (floats through ``str``), else
+    ``None``."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, float):
+        return decimal.Decimal(str(value))
+    if isinstance(value, (int, decimal.Decimal)):
+        return value
+    return None
+
+
+def _arithmetic(operator: str, left: typing.Any, right: typing.Any) -> typing.Any:
+    """ """
+    if isinstance(left, Quantity) or isinstance(right, Quantity):
+        raise ValueError("FHIRPath: quantity arithmetic is not supported")
+    if operator == "+" and isinstance(left, str) and isinstance(right, str):
+        return left + right
+    numbers = _number(left), _number(right)
+    if None in numbers:
+        if any(
+            isinstance(value, (datetime.date, datetime.time))
+            or (isinstance(value, str) and _date_key(value) is not None)
+            for value in (left, right)
+        ):
+            raise ValueError("FHIRPath: date/time arithmetic is not supported")
+        raise ValueError(
+            f"FHIRPath: ``{operator}`` is not defined for {left!r} and {right!r}"
+        )
+    left, right = numbers
+    if operator == "+":
+        return left + right
+    if operator == "-":
+        return left - right
+    if operator == "*":
+        return left * right
+    if operator == "/":
+        if right == 0:
+            return None
+        return decimal.Decimal(str(left)) / decimal.Decimal(str(right))
+    if operator == "div":
+        if right == 0:
+            return None
+        return int(left // right)
+    if operator == "mod":
+        if right == 0:
+            return None
+        return left % right
+    raise ValueError(f"FHIRPath: unknown operator ``{operator}``")  # pragma: no cover
+
+
+def _compile_binary(operator: str, left: _Node, right: _Node) -> _Node:
+    """ """
+    if operator == "|":
+        return lambda focus, env: _distinct(left(focus, env) + right(focus, env))
+
+    if operator in ("and", "or", "xor", "implies"):
+
+        def logical(focus, env):
+            a = _boolean(left(focus, env))
+            if operator == "and":
+                if a is False:
+                    return [False]
+                b = _boolean(right(focus, env))
+                if b is False:
+                    return [False]
+                return [True] if a and b else []
+            if operator == "or":
+                if a is True:
+                    return [True]
+                b = _boolean(right(focus, env))
+                if b is True:
+                    return [True]
+                return [False] if a is False and b is False else []
+            if operator == "implies":
+                if a is False:
+                    return [True]
+                b = _boolean(right(focus, env))
+                if b is True:
+                    return [True]
+                return [False] if a is True and b is False else []
+            b = _boolean(right(focus, env))
+            return [] if a is None or b is None else [a != b]
+
+        return logical
+
+    if operator in ("=", "!="):
+
+        def equality(focus, env):
+            a, b = left(focus, env), right(focus, env)
+            if not a or not b:
+                return []
+            if len(a) != len(b):
+                return [operator != "="]
+            results = list(map(_equals, a, b))
+            if None in results and False not in results:
+                return []
+            result = all(results)
+            return [result if operator == "=" else not result]
+
+        return equality
+
+    if operator in ("~", "!~"):
+
+        def equivalence(focus, env):
+            a, b = left(focus, env), right(focus, env)
+            result = len(a) == len(b) and all(
+                any(_equivalent(x, y) for y in b) for x in a
+            )
+            return [result if operator == "~" else not result]
+
+        return equivalence
+
+    if operator in ("<", ">", "<=", ">="):
+
+        def comparison(focus, env):
+            a = _singleton(left(focus, env), operator)
+            b = _singleton(right(focus, env), operator)
+            if a is None or b is None:
+                return []
+            dates = _date_keys(a, b)
+            if dates is _UNKNOWN:
+                return []
+            if dates is not None:
+                a, b = dates
+            else:
+                a, b = _comparable(a, b)
+                if isinstance(a, tuple) or isinstance(b, tuple):
+                    # quantities, ``(value, unit)``
+                    if (
+                        not (isinstance(a, tuple) and isinstance(b, tuple))
+                        or a[1] != b[1]
+                    ):
+                        return []
+                    a, b = a[0], b[0]
+            try:
+                if operator == "<":
+                    return [a < b]
+                if operator == ">":
+                    return [a > b]
+                if operator == "<=":
+                    return [a <= b]
+                return [a >= b]
+            except TypeError:
+                raise ValueError(f"FHIRPath: cannot compare {a!r} and {b!r}")
+
+        return comparison
+
+    if operator in ("in", "contains"):
+
+        def membership(focus, env):
+            a, b = left(focus, env), right(focus, env)
+            if operator == "contains":
+                a, b = b, a
+            if not a:
+                return []
+            return [_contains(b, _singleton(a, operator))]
+
+        return membership
+
+    if operator == "&":
+
+        def concatenate(focus, env):
+            a = _singleton(left(focus, env), "&")
+            b = _singleton(right(focus, env), "&")
+            return [(a or "") + (b or "")]
+
+        return concatenate
+
+    def arithmetic(focus, env):
+        a = _singleton(left(focus, env), operator)
+        b = _singleton(right(focus, env), operator)
+        if a is None or b is None:
+            return []
+        result = _arithmetic(operator, a, b)
+        return [] if result is None else [result]
+
+    return arithmetic
+
+
+# --- functions -------------------------------------------------------------
+
+# functions taking expressions evaluated per input item
+_LAMBDA_FUNCTIONS = {
+    "where",
+    "select",
+    "all",
+    "exists",
+    "repeat",
+    "aggregate",
+    "iif",
+    "trace",
+}
+
+
+def _per_item(
+    argument: _Node, items: _Collection, env: _Environment
+) -> typing.Iterator[typing.Tuple[typing.Any, _Collection]]:
+    """``(item, argument evaluated with $this = item)``"""
+    saved = env.index
+    try:
+        for index, item in enumerate(items):
+            env.index = index
+            yield item, argument([item], env)
+    finally:
+        env.index = saved
+
+
+def _compile_invoke(node: tuple) -> _Node:
+    """``base.name(arguments)`` or ``name(arguments)``."""
+    _, base_node, name, argument_nodes = node
+    if name in ("ofType", "as"):
+        if len(argument_nodes) != 1:
+            raise ValueError(f"FHIRPath: {name}() expects a type")
+        return _typed(base_node, argument_nodes[0][1])
+    if name == "is":
+        if len(argument_nodes) != 1:
+            raise ValueError("FHIRPath: is() expects a type")
+        return _compile_type_operator(
+            "is", base_node or ("special", "this"), argument_nodes[0][1]
+        )
+
+    base = _compile(base_node) if base_node is not None else None
+    arguments = [_compile(argument) for argument in argument_nodes]
+    try:
+        function, arity = _FUNCTIONS[name]
+    except KeyError:
+        raise ValueError(f"FHIRPath: unknown function ``{name}()``")
+    if not arity[0] <= len(arguments) <= arity[1]:
+        raise ValueError(f"FHIRPath: wrong number of arguments for ``{name}()``")
+
+    if name in _LAMBDA_FUNCTIONS:
+
+        def invoke_lambda(focus, env):
+            items = base(focus, env) if base is not None else focus
+            return function(items, env, *arguments)
+
+        return invoke_lambda
+
+    def invoke(focus, env):
+        items = base(focus, env) if base is not None else focus
+        # the arguments are evaluated against the input of the expression
+        values = [argument(focus, env) for argument in arguments]
+        return function(items, env, *values)
+
+    return invoke
+
+
+def _string_function(
+    func: typing.Callable[..., typing.Any],
+) -> typing.Callable[..., _Collection]:
+    """A function of a single string input and singleton arguments."""
+
+    def wrapper(items, env, *arguments):
+        value = _singleton(items, "string function")
+        if value is None:
+            return []
+        if not isinstance(value, str):
+            raise ValueError(f"FHIRPath: string expected, got {value!r}")
+        values = []
+        for argument in arguments:
+            argument_value = _singleton(argument, "argument")
+            if argument_value is None:
+                return []
+            values.append(argument_value)
+        result = func(value, *values)
+        if result is None:
+            return []
+        return result if isinstance(result, list) else [result]
+
+    return wrapper
+
+
+def _math_function(
+    func: typing.Callable[..., typing.Any],
+) -> typing.Callable[..., _Collection]:
+    """ """
+
+    def wrapper(items, env, *arguments):
+        value = _singleton(items, "math function")
+        if value is None:
+            return []
+        values = [_singleton(argument, "argument") for argument in arguments]
+        result = func(value, *values)
+        return [] if result is None else [result]
+
+    return wrapper
+
+
+def _convert(
+    converter: typing.Callable[[typing.Any], typing.Any], test: bool
+) -> typing.Callable[..., _Collection]:
+    """``toX()`` or, with ``test``, ``convertsToX()``."""
+
+    def wrapper(items, env):
+        value = _singleton(items, "conversion")
+        if value is None:
+            return []
+        result = converter(value)
+        if test:
+            return [result is not None]
+        return [] if result is None else [result]
+
+    return wrapper
+
+
+def _fn_where(items, env, criteria):
+    return [
+        item for item, result in _per_item(criteria, items, env) if _boolean(result)
+    ]
+
+
+def _fn_select(items, env, projection):
+    out: _Collection = []
+    for _, result in _per_item(projection, items, env):
+        out.extend(result)
+    return out
+
+
+def _fn_repeat(items, env, projection):
+    out: _Collection = []
+    queue = list(items)
+    while queue:
+        found = _fn_select(queue, env, projection)
+        queue = []
+        for item in found:
+            if not any(item is seen or _equals(item, seen) for seen in out):
+                out.append(item)
+                queue.append(item)
+    return out
+
+
+def _fn_all(items, env, criteria):
+    return [all(_boolean(result) for _, result in _per_item(criteria, items, env))]
+
+
+def _fn_exists(items, env, criteria=None):
+    if criteria is not None:
+        items = _fn_where(items, env, criteria)
+    return [bool(items)]
+
+
+def _fn_aggregate(items, env, aggregator, init=None):
+    saved = env.total
+    try:
+        env.total = init([], env) if init is not None else []
+        for _, result in _per_item(aggregator, items, env):
+            env.total = result
+        return env.total
+    finally:
+        env.total = saved
+
+
+def _fn_iif(items, env, criterion, true_result, otherwise=None):
+    if _boolean(criterion(items, env)):
+        return true_result(items, env)
+    return otherwise(items, env) if otherwise is not None else []
+
+
+def _fn_trace(items, env, name, projection=None):
+    return items
+
+
+def _fn_index(items, position, what):
+    value = _singleton(position, what)
+    return 0 if value is None else value
+
+
+def _fn_single(items, env):
+    return [_singleton(items, "single()")] if items else []
+
+
+def _fn_boolean_all(expected: bool, every: bool) -> typing.Callable[..., _Collection]:
+    def wrapper(items, env):
+        results = [item is expected for item in items if isinstance(item, bool)]
+        return [all(results) if every else any(results)]
+
+    return wrapper
+
+
+def _fn_extension(items, env, url):
+    url = _singleton(url, "extension()")
+    out: _Collection = []
+    for item in _navigate(items, "extension"):
+        if item.url == url:
+            out.append(item)
+    return out
+
+
+def _fn_has_value(items, env):
+    return [
+        len(items) == 1
+        and not isinstance(items[0], FHIRAbstractModel)
+        and items[0] is not None
+    ]
+
+
+def _fn_get_value(items, env):
+    if len(items) == 1 and not isinstance(items[0], FHIRAbstractModel):
+        return list(items)
+    return []
+
+
+def _fn_resolve(items, env):
+    out: _Collection = []
+    resource = _singleton(env.variables.get("resource", []), "%resource")
+    for item in items:
+        reference = item
+        if isinstance(item, FHIRAbstractModel):
+            reference = item.__dict__.get("reference")
+        if not isinstance(reference, str):
+            continue
+        if reference.startswith("#") and resource is not None:
+            for contained in resource.__dict__.get("contained") or ():
+                if contained.id == reference[1:]:
+                    out.append(contained)
+            continue
+        if env.resolver is not None:
+            target = env.resolver(reference)
+            if target is not None:
+                out.append(target)
+    return out
+
+
+def _fn_descendants(items, env):
+    out: _Collection = []
+    queue = list(items)
+    while queue:
+        children: _Collection = []
+        for item in queue:
+            children.extend(_children(item))
+        out.extend(children)
+        queue = children
+    return out
+
+
+def _fn_substring(value, start, length=None):
+    if start < 0 or start >= len(value):
+        return None
+    if length is None:
+        return value[start:]
+    return value[start : start + length]
+
+
+def _fn_unsupported(name: str) -> typing.Callable[..., _Collection]:
+    def wrapper(items, env, *arguments):
+        raise ValueError(f"FHIRPath: ``{name}()`` is not supported")
+
+    return wrapper
+
+
+def _round(value, precision=None):
+    exponent = decimal.Decimal(1).scaleb(-(precision or 0))
+    return decimal.Decimal(str(value)).quantize(
+        exponent, rounding=decimal.ROUND_HALF_UP
+    )
+
+
+# name: (function, (min arguments, max arguments))
+_FUNCTIONS: typing.Dict[
+    str, typing.Tuple[typing.Callable[..., _Collection], typing.Tuple[int, int]]
+] = {
+    # existence
+    "empty": (lambda items, env: [not items], (0, 0)),
+    "exists": (_fn_exists, (0, 1)),
+    "all": (_fn_all, (1, 1)),
+    "allTrue": (_fn_boolean_all(True, True), (0, 0)),
+    "anyTrue": (_fn_boolean_all(True, False), (0, 0)),
+    "allFalse": (_fn_boolean_all(False, True), (0, 0)),
+    "anyFalse": (_fn_boolean_all(False, False), (0, 0)),
+    "subsetOf": (
+        lambda items, env, other: [all(_contains(other, i) for i in items)],
+        (1, 1),
+    ),
+    "supersetOf": (
+        lambda items, env, other: [all(_contains(items, i) for i in other)],
+        (1, 1),
+    ),
+    "count": (lambda items, env: [len(items)], (0, 0)),
+    "distinct": (lambda items, env: _distinct(items), (0, 0)),
+    "isDistinct": (lambda items, env: [len(_distinct(items)) == len(items)], (0, 0)),
+    # filtering and projection
+    "where": (_fn_where, (1, 1)),
+    "select": (_fn_select, (1, 1)),
+    "repeat": (_fn_repeat, (1, 1)),
+    # subsetting
+    "single": (_fn_single, (0, 0)),
+    "first": (lambda items, env: items[:1], (0, 0)),
+    "last": (lambda items, env: items[-1:], (0, 0)),
+    "tail": (lambda items, env: items[1:], (0, 0)),
+    "skip": (
+        lambda items, env, n: items[max(_fn_index(items, n, "skip"), 0) :],
+        (1, 1),
+    ),
+    "take": (
+        lambda items, env, n: items[: max(_fn_index(items, n, "take"), 0)],
+        (1, 1),
+    ),
+    "intersect": (
+        lambda items, env, other: [i for i in _distinct(items) if _contains(other, i)],
+        (1, 1),
+    ),
+    "exclude": (
+        lambda items, env, other: [i for i in items if not _contains(other, i)],
+        (1, 1),
+    ),
+    # combining
+    "union": (lambda items, env, other: _distinct(items + other), (1, 1)),
+    "combine": (lambda items, env, other: items + other, (1, 1)),
+    # conversion
+    "iif": (_fn_iif, (2, 3)),
+    "toBoolean": (_convert(_to_boolean, False), (0, 0)),
+    "convertsToBoolean": (_convert(_to_boolean, True), (0, 0)),
+    "toInteger": (_convert(_integer, False), (0, 0)),
+    "convertsToInteger": (_convert(_integer, True), (0, 0)),
+    "toDecimal": (_convert(_decimal, False), (0, 0)),
+    "convertsToDecimal": (_convert(_decimal, True), (0, 0)),
+    "toString": (_convert(_string, False), (0, 0)),
+    "convertsToString": (_convert(_string, True), (0, 0)),
+    # string
+    "indexOf": (_string_function(lambda value, sub: value.find(sub)), (1, 1)),
+    "substring": (_string_function(_fn_substring), (1, 2)),
+    "startsWith": (_string_function(lambda value, s: value.startswith(s)), (1, 1)),
+    "endsWith": (_string_function(lambda value, s: value.endswith(s)), (1, 1)),
+    "contains": (_string_function(lambda value, s: s in value), (1, 1)),
+    "upper": (_string_function(str.upper), (0, 0)),
+    "lower": (_string_function(str.lower), (0, 0)),
+    "replace": (_string_function(lambda value, a, b: value.replace(a, b)), (2, 2)),
+    "matches": (
+        _string_function(lambda value, regex: re.search(regex, value) is not None),
+        (1, 1),
+    ),
+    "replaceMatches": (
+        _string_function(lambda value, regex, sub: re.sub(regex, sub, value)),
+        (2, 2),
+    ),
+    "length": (_string_function(len), (0, 0)),
+    "toChars": (_string_function(list), (0, 0)),
+    "trim": (_string_function(str.strip), (0, 0)),
+    "split": (_string_function(lambda value, sep: value.split(sep)), (1, 1)),
+    "join": (
+        lambda items, env, sep=None: [
+            (_singleton(sep, "join()") if sep else "").join(str(item) for item in items)
+        ],
+        (0, 1),
+    ),
+    # math
+    "abs": (_math_function(abs), (0, 0)),
+    "ceiling": (_math_function(math.ceil), (0, 0)),
+    "floor": (_math_function(math.floor), (0, 0)),
+    "truncate": (_math_function(math.trunc), (0, 0)),
+    "round": (_math_function(_round), (0, 1)),
+    "sqrt": (
+        _math_function(
+            lambda value: None if value < 0 else decimal.Decimal(str(value)).sqrt()
+        ),
+        (0, 0),
+    ),
+    # tree navigation
+    "children": (
+        lambda items, env: [child for item in items for child in _children(item)],
+        (0, 0),
+    ),
+    "descendants": (_fn_descendants, (0, 0)),
+    # utility
+    "trace": (_fn_trace, (1, 2)),
+    "now": (
+        lambda items, env: [datetime.datetime.now(datetime.timezone.utc)],
+        (0, 0),
+    ),
+    "today": (lambda items, env: [datetime.date.today()], (0, 0)),
+    "timeOfDay": (lambda items, env: [datetime.datetime.now().time()], (0, 0)),
+    "aggregate": (_fn_aggregate, (1, 2)),
+    # boolean
+    "not": (
+        lambda items, env: [] if _boolean(items) is None else [not _boolean(items)],
+        (0, 0),
+    ),
+    # FHIR
+    "extension": (_fn_extension, (1, 1)),
+    "hasValue": (_fn_has_value, (0, 0)),
+    "getValue": (_fn_get_value, (0, 0)),
+    "resolve": (_fn_resolve, (0, 0)),
+    "htmlChecks": (lambda items, env: [True], (0, 0)),
+    "memberOf": (_fn_unsupported("memberOf"), (1, 1)),
+    "conformsTo": (_fn_unsupported("conformsTo"), (1, 1)),
+    "subsumes": (_fn_unsupported("subsumes"), (1, 1)),
+    "subsumedBy": (_fn_unsupported("subsumedBy"), (1, 1)),
+}
+
+
+# --- public ----------------------------------------------------------------
+
+
+class FHIRPathExpression:
+    """A compiled FHIRPath expression, see ``compile_fhirpath``."""
+
+    __slots__ = ("expression", "_node")
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self._node = _compile(_Parser(expression).parse())
+
+    def __repr__(self) -> str:
+        return f"FHIRPathExpression({self.expression!r})"
+
+    def evaluate(
+        self,
+        resource: typing.Any,
+        *,
+        context: typing.Any = None,
+        variables: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+        resolver: typing.Optional[typing.Callable[[str], typing.Any]] = None,
+    ) -> _Collection:
+        """Evaluate against a resource (``%resource``), returns the result
+        collection as a list.
+
+        context: the focus when it is not the resource itself (``%context``),
+            i.e. the element an invariant is defined on.
+        variables: more ``%name`` environment variables, a value or a list.
+        resolver: ``reference string -> resource or None``, used by
+            ``resolve()`` for non-contained references, i.e.
+            ``BundleIndex(bundle).resolve``.
+        """
+        environment = self._environment(resource, context, variables, resolver)
+        focus = [resource if context is None else context]
+        return self._node(focus, environment)
+
+    def evaluate_many(
+        self,
+        resources: typing.Iterable[typing.Any],
+        *,
+        variables: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+        resolver: typing.Optional[typing.Callable[[str], typing.Any]] = None,
+    ) -> typing.List[_Collection]:
+        """``evaluate`` of every resource, one result collection each."""
+        environment = self._environment(None, None, variables, resolver)
+        node = self._node
+        results = []
+        for resource in resources:
+            focus = [resource]
+            environment.variables["resource"] = focus
+            environment.variables["rootResource"] = focus
+            environment.variables["context"] = focus
+            results.append(node(focus, environment))
+        return results
+
+    def evaluate_boolean(self, resource: typing.Any, **kwargs) -> typing.Optional[bool]:
+        """Singleton boolean evaluation of the result, ``None`` for empty; the
+        way invariants (``ElementDefinition.constraint``) are checked."""
+        return _boolean(self.evaluate(resource, **kwargs))
+
+    @staticmethod
+    def _environment(resource, context, variables, resolver) -> _Environment:
+        """ """
+        values: typing.Dict[str, _Collection] = dict()
+        for name, value in (variables or {}).items():
+            values[name] = list(value) if isinstance(value, (list, tuple)) else [value]
+        values["resource"] = values["rootResource"] = [resource]
+        values["context"] = [resource if context is None else context]
+        return _Environment(values, resolver)
+
+
+@lru_cache(maxsize=1024)
+def compile_fhirpath(expression: str) -> FHIRPathExpression:
+    """Parse and compile an expression, cached; raises ``ValueError`` for an
+    invalid one."""
+    return FHIRPathExpression(expression)
+
+
+def evaluate(resource: typing.Any, expression: str, **kwargs) -> _Collection:
+    """Shortcut for ``compile_fhirpath(expression).evaluate(resource, ...)``.
+
+    >>> evaluate(patient, "name.where(use = 'official').given.first()")
+    ['Peter']
+    """
+    return compile_fhirpath(expression).evaluate(resource, **kwargs)
+
+
+__all__ = ["FHIRPathExpression", "Quantity", "compile_fhirpath", "evaluate"]
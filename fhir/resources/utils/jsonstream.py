@@ -0,0 +1,197 @@
+from __future__ import annotations as _annotations
+
+import json
+import re
+import typing
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# characters that matter while skipping over an object or array
+_STRUCTURE = re.compile(rb'["\[\]{}]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb"[,\]}\s]")
+_NON_WHITESPACE = re.compile(rb"[^ \t\r\n]")
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+class JSONStreamScanner:
+    """Incremental scanner over a JSON document that is read from a binary
+    (or text) stream in chunks.
+
+    Nothing is decoded here, values are handed out as raw ``bytes`` so that
+    they can go straight into ``model_validate_json``. Once a value is handed
+    out it is dropped from the buffer, so memory is bounded by the largest
+    single value (plus one chunk), not by the size of the document.
+    """
+
+    def __init__(
+        self, stream: typing.IO[typing.Any], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        """ """
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._pos = 0
+        self._eof = False
+        self._started = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer, ``False`` at the end of stream."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        if not chunk:
+            self._eof = True
+            return False
+        if not self._started:
+            self._started = True
+            if chunk.startswith(_UTF8_BOM):
+                chunk = chunk[len(_UTF8_BOM) :]
+        self._buffer += chunk
+        return True
+
+    def _release(self) -> None:
+        """Forget everything that has been consumed already."""
+        if self._pos:
+            del self._buffer[: self._pos]
+            self._pos = 0
+
+    def _unexpected_end(self) -> ValueError:
+        """ """
+        return ValueError("Unexpected end of JSON stream.")
+
+    def peek(self) -> typing.Optional[int]:
+        """Skip whitespace and return the next byte (without consuming it),
+        ``None`` at the end of stream."""
+        while True:
+            match = _NON_WHITESPACE.search(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return self._buffer[self._pos]
+            self._pos = len(self._buffer)
+            self._release()
+            if not self._fill():
+                return None
+
+    def expect(self, char: bytes) -> None:
+        """Consume ``char`` or fail."""
+        found = self.peek()
+        if found is None:
+            raise self._unexpected_end()
+        if found != char[0]:
+            raise ValueError(
+                f"Invalid JSON, expected {char.decode()!r} " f"but got {chr(found)!r}."
+            )
+        self._pos += 1
+
+    def _skip_string(self) -> None:
+        """``_pos`` is right after the opening quote."""
+        while True:
+            match = _STRING_SPECIAL.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    raise self._unexpected_end()
+                continue
+            if self._buffer[match.start()] == 0x22:  # closing quote
+                self._pos = match.end()
+                return
+            # backslash, the escaped character may be in the next chunk
+            while match.end() >= len(self._buffer):
+                if not self._fill():
+                    raise self._unexpected_end()
+            self._pos = match.end() + 1
+
+    def _skip_container(self) -> None:
+        """``_pos`` is right after the opening ``{`` or ``[``."""
+        depth = 1
+        while depth:
+            match = _STRUCTURE.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    raise self._unexpected_end()
+                continue
+            char = self._buffer[match.start()]
+            self._pos = match.end()
+            if char == 0x22:
+                self._skip_string()
+            elif char in (0x7B, 0x5B):
+                depth += 1
+            else:
+                depth -= 1
+
+    def _skip_scalar(self) -> None:
+        """numbers, ``true``, ``false`` and ``null``"""
+        while True:
+            match = _SCALAR_END.search(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return
+            if not self._fill():
+                self._pos = len(self._buffer)
+                return
+
+    def read_value(self) -> bytes:
+        """Consume the next JSON value and return its raw bytes."""
+        first = self.peek()
+        if first is None:
+            raise self._unexpected_end()
+        start = self._pos
+        self._pos += 1
+        if first in (0x7B, 0x5B):
+            self._skip_container()
+        elif first == 0x22:
+            self._skip_string()
+        else:
+            self._skip_scalar()
+        value = bytes(self._buffer[start : self._pos])
+        self._release()
+        return value
+
+    def read_key(self) -> str:
+        """Consume an object member's name and the following colon."""
+        if self.peek() != 0x22:
+            raise ValueError("Invalid JSON, object member name is expected.")
+        key = self.read_value()
+        self.expect(b":")
+        if b"\\" in key:
+            return json.loads(key)
+        return key[1:-1].decode("utf-8")
+
+    def iter_object_members(self) -> typing.Iterator[str]:
+        """Yield the member names of the next JSON object.
+
+        The caller must consume each member's value (``read_value``,
+        ``iter_array_items`` ...) before asking for the next name.
+        """
+        self.expect(b"{")
+        if self.peek() == 0x7D:
+            self._pos += 1
+            return
+        while True:
+            yield self.read_key()
+            separator = self.peek()
+            self.expect(b"}" if separator == 0x7D else b",")
+            if separator == 0x7D:
+                return
+
+    def iter_array_items(self) -> typing.Iterator[bytes]:
+        """Yield the raw bytes of every item of the next JSON array."""
+        self.expect(b"[")
+        if self.peek() == 0x5D:
+            self._pos += 1
+            return
+        while True:
+            yield self.read_value()
+            separator = self.peek()
+            self.expect(b"]" if separator == 0x5D else b",")
+            if separator == 0x5D:
+                return
+
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "JSONStreamScanner"]
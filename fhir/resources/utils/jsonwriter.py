@@ -0,0 +1,318 @@
+"""FHIR JSON written from a per class emit plan, with a pluggable encoder.
+
+``model_dump_json`` goes through pydantic's ``model_serializer`` and a
+``model_dump`` call for every nested element. Here the elements of each
+class (``elements_sequence`` order, JSON names, ``birthDate``/
+``_birthDate`` pairs, summary flags) are compiled once into a ``JSONPlan``;
+a walk over the plan turns a model into plain ``dict``/``list`` values that
+the backend encodes in one call:
+
+>>> data = json_dumps(bundle)  # bytes
+>>> data = json_dumps(bundle, backend="orjson", indent=2)
+>>> with open("bundle.json", "wb") as fp:
+...     json_dump(bundle, fp)
+
+The output is byte for byte that of ``model_dump_json``. Values whose
+encoding differs between the backends and pydantic (floats below ``1e-4``
+or from ``1e16`` on, integers beyond 64 bits) make the whole document go
+through ``model_dump_json`` of ``fhir_core`` instead.
+
+Backends are ``json`` (standard library) and ``orjson`` when it's
+installed, the default; more can be added to ``JSON_BACKENDS``.
+"""
+
+from __future__ import annotations as _annotations
+
+import decimal
+import json
+import typing
+import uuid
+from functools import lru_cache
+
+from fhir_core import fhirabstractmodel
+from fhir_core.fhirabstractmodel import FHIR_COMMENTS_FIELD_NAME, FHIRAbstractModel
+from fhir_core.utils import get_base64_encoder
+from pydantic.fields import FieldInfo
+from pydantic_core import to_jsonable_python
+
+try:
+    import orjson  # type: ignore
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    orjson = None
+    HAS_ORJSON = False
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+_Backend = typing.Callable[[typing.Any, typing.Optional[int]], bytes]
+# ``orjson.JSONEncodeError`` (a ``TypeError``): integers beyond 64 bits
+_ENCODE_ERRORS: typing.Tuple[typing.Type[Exception], ...] = (
+    (orjson.JSONEncodeError,) if HAS_ORJSON else ()
+)
+_COMPACT_ENCODER = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), check_circular=False
+)
+
+
+_PRIMITIVE, _COMPLEX, _EXTENSION, _COMMENTS = range(4)
+# ``(position, kind, JSON name, is_summary, field_info)``
+_JSONEntry = typing.Tuple[int, int, str, bool, typing.Optional[FieldInfo]]
+
+
+class JSONPlan(typing.NamedTuple):
+    """What ``_fhir_iter`` works out for every instance, once per class.
+
+    fields: ``(position, kind, JSON name, is_summary, field_info)`` by field
+        name; the position is that of ``elements_sequence``, the
+        ``_birthDate`` extension right after ``birthDate``, ``fhir_comments``
+        last.
+    """
+
+    resource_type: typing.Optional[str]
+    fields: typing.Dict[str, _JSONEntry]
+
+
+class _Fallback(Exception):
+    """A value the backends would not write like pydantic does."""
+
+
+@lru_cache(maxsize=None)
+def get_json_plan(klass: typing.Type[FHIRAbstractModel]) -> JSONPlan:
+    """ """
+    resource_type = klass.__resource_type__ if klass.has_resource_base() else None
+    fields: typing.Dict[str, _JSONEntry] = dict()
+    position = 0
+    for element in klass.get_fhir_metadata().elements:
+        name = element.alias or element.field_key
+        if element.is_primitive:
+            fields[element.field_key] = (
+                position,
+                _PRIMITIVE,
+                name,
+                element.is_summary,
+                element.field_info,
+            )
+            if element.ext_key is not None:
+                fields[element.ext_key] = (
+                    position + 1,
+                    _EXTENSION,
+                    element.ext_alias or element.ext_key,
+                    False,
+                    None,
+                )
+        else:
+            fields[element.field_key] = (
+                position,
+                _COMPLEX,
+                name,
+                element.is_summary,
+                None,
+            )
+        position += 2
+    fields[FHIR_COMMENTS_FIELD_NAME] = (
+        position,
+        _COMMENTS,
+        FHIR_COMMENTS_FIELD_NAME,
+        False,
+        None,
+    )
+    return JSONPlan(resource_type, fields)
+
+
+def _float(value: float) -> float:
+    """Within the range ``repr`` and pydantic write the same."""
+    if value and not 1e-4 <= abs(value) < 1e16:
+        raise _Fallback(value)
+    return value
+
+
+def _primitive(value: typing.Any, field_info: FieldInfo) -> typing.Any:
+    """See ``fhir_core.fhirabstractmodel.FHIRAbstractModel.
+    _serialize_primitive_value``"""
+    kind = type(value)
+    if kind is str or kind is bool or kind is int:
+        return value
+    if kind is list:
+        return [
+            None if item is None else _primitive(item, field_info) for item in value
+        ]
+    if kind is float:
+        return _float(value)
+    if kind is decimal.Decimal:
+        exp = value.as_tuple().exponent
+        if (
+            value.is_finite()
+            and value == value.to_integral_value()
+            and isinstance(exp, int)
+            and exp >= 0
+        ):
+            return int(value)
+        return _float(float(value))
+    if kind is uuid.UUID:
+        return f"urn:uuid:{value}"
+    if isinstance(value, (bytes, bytearray)):
+        encoder = get_base64_encoder(field_info)
+        if encoder:
+            value = encoder.encode(value)
+    value = to_jsonable_python(value)
+    if type(value) is float:
+        _float(value)
+    return value
+
+
+def _complex(
+    value: typing.Any, exclude_comments: bool, summary_only: bool
+) -> typing.Any:
+    """ """
+    if type(value) is list:
+        return [
+            None if item is None else _complex(item, exclude_comments, summary_only)
+            for item in value
+        ]
+    if isinstance(value, FHIRAbstractModel):
+        return model_data(value, exclude_comments, summary_only)
+    raise _Fallback(value)
+
+
+def model_data(
+    model: FHIRAbstractModel,
+    exclude_comments: bool = False,
+    summary_only: bool = False,
+) -> typing.Dict[str, typing.Any]:
+    """``model_dump(mode="json")`` out of the plan of the class; raises
+    ``_Fallback`` for values not written like pydantic does."""
+    plan = get_json_plan(model.__class__)
+    fields = plan.fields
+    data: typing.Dict[str, typing.Any] = dict()
+    if plan.resource_type is not None:
+        data["resourceType"] = plan.resource_type
+    # a few of the fields have values, sorting those beats walking them all
+    present = sorted(
+        [
+            (fields[key], value)
+            for key, value in model.__dict__.items()
+            if value is not None and key in fields
+        ]
+    )
+    for (_, kind, name, summary, info), value in present:
+        if kind == _PRIMITIVE:
+            if summary or not summary_only:
+                data[name] = _primitive(value, info)
+        elif kind == _COMPLEX:
+            if summary or not summary_only:
+                data[name] = _complex(value, exclude_comments, summary_only)
+        elif summary_only:
+            continue
+        elif kind == _EXTENSION:
+            value = _complex(value, exclude_comments, summary_only)
+            if len(value) > 0:
+                data[name] = value
+        elif not exclude_comments:
+            data[name] = to_jsonable_python(value)
+    return data
+
+
+def _json_backend(data: typing.Any, indent: typing.Optional[int]) -> bytes:
+    """The standard library ``json``, its C encoder when compact."""
+    if indent is None:
+        return _COMPACT_ENCODER.encode(data).encode("utf-8")
+    return json.dumps(
+        data,
+        ensure_ascii=False,
+        indent=indent,
+        separators=(",", ": "),
+        check_circular=False,
+    ).encode("utf-8")
+
+
+def _orjson_backend(data: typing.Any, indent: typing.Optional[int]) -> bytes:
+    """``orjson``, it indents by two spaces only."""
+    if indent is None:
+        return orjson.dumps(data)
+    if indent == 2:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return _json_backend(data, indent)
+
+
+JSON_BACKENDS: typing.Dict[str, _Backend] = {"json": _json_backend}
+if HAS_ORJSON:
+    JSON_BACKENDS["orjson"] = _orjson_backend
+DEFAULT_JSON_BACKEND = "orjson" if HAS_ORJSON else "json"
+
+
+def set_default_json_backend(name: str) -> None:
+    """The backend of ``json_dumps`` without ``backend``, and so of
+    ``model_dump_json``."""
+    global DEFAULT_JSON_BACKEND
+    if name not in JSON_BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend ``{name}``, expected one of {list(JSON_BACKENDS)}"
+        )
+    DEFAULT_JSON_BACKEND = name
+
+
+def json_dumps(
+    model: FHIRAbstractModel,
+    *,
+    indent: typing.Optional[int] = None,
+    exclude_comments: bool = False,
+    summary_only: bool = False,
+    backend: typing.Optional[str] = None,
+) -> bytes:
+    """UTF-8 JSON of ``model``, the same as ``model_dump_json``."""
+    encode = JSON_BACKENDS[backend or DEFAULT_JSON_BACKEND]
+    try:
+        return encode(model_data(model, exclude_comments, summary_only), indent)
+    except (_Fallback, *_ENCODE_ERRORS):
+        return _fallback(model, indent, exclude_comments, summary_only)
+
+
+def _fallback(
+    model: FHIRAbstractModel,
+    indent: typing.Optional[int],
+    exclude_comments: bool,
+    summary_only: bool,
+) -> bytes:
+    """ """
+    return fhirabstractmodel.FHIRAbstractModel.model_dump_json(
+        model,
+        indent=indent,
+        exclude_comments=exclude_comments,
+        summary_only=summary_only,
+    ).encode("utf-8")
+
+
+def json_dump(
+    model: FHIRAbstractModel,
+    fp: typing.IO[bytes],
+    *,
+    indent: typing.Optional[int] = None,
+    exclude_comments: bool = False,
+    summary_only: bool = False,
+    backend: typing.Optional[str] = None,
+) -> None:
+    """``json_dumps`` to the binary stream ``fp``."""
+    fp.write(
+        json_dumps(
+            model,
+            indent=indent,
+            exclude_comments=exclude_comments,
+            summary_only=summary_only,
+            backend=backend,
+        )
+    )
+
+
+__all__ = [
+    "DEFAULT_JSON_BACKEND",
+    "HAS_ORJSON",
+    "JSONPlan",
+    "JSON_BACKENDS",
+    "get_json_plan",
+    "json_dump",
+    "json_dumps",
+    "model_data",
+    "set_default_json_backend",
+]
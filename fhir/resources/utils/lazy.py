@@ -0,0 +1,246 @@
+from __future__ import annotations as _annotations
+
+import io
+import json
+import typing
+from functools import lru_cache
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+from pydantic import PrivateAttr
+from pydantic.fields import FieldInfo
+
+from ..fhirabstractmodel import get_field_model_klass
+from .jsonstream import JSONStreamScanner
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+_PENDING = "_lazy_pending"
+
+
+def _restore_lazy(
+    model_klass: typing.Type[FHIRAbstractModel], state: typing.Dict[str, typing.Any]
+) -> FHIRAbstractModel:
+    """Unpickle a lazy instance, the lazy class itself is not importable."""
+    klass = get_lazy_model_class(model_klass)
+    instance = klass.__new__(klass)
+    instance.__setstate__(state)
+    return instance
+
+
+@lru_cache(maxsize=None)
+def get_lazy_fields(
+    model_klass: typing.Type[FHIRAbstractModel],
+) -> typing.Dict[str, typing.Tuple[str, typing.Type[FHIRAbstractModel]]]:
+    """The list of ``BackboneElement`` fields of a model, these are the ones
+    kept as raw JSON by ``model_validate_json_lazy``.
+
+    Returns ``{alias: (field name, item model class)}``.
+    """
+    fields = dict()
+    for name, field_info in model_klass.model_fields.items():
+        item_klass, is_list = get_field_model_klass(field_info.annotation)
+        if item_klass is None or not is_list:
+            continue
+        if any(klass.__name__ == "BackboneElement" for klass in item_klass.__mro__):
+            fields[field_info.alias or name] = (name, item_klass)
+    return fields
+
+
+class LazyFieldsMixin:
+    """Validates pending ``BackboneElement`` lists on first attribute access.
+
+    Pending fields are missing from the instance ``__dict__``, so the normal
+    attribute lookup fails over to ``__getattr__``, which validates the raw
+    JSON slice and caches the result in ``__dict__``. Anything that looks at
+    the whole instance (serialization, comparison, ``repr``) materializes
+    every pending field first.
+    """
+
+    def __getattr__(self, item: str) -> typing.Any:
+        """ """
+        if not item.startswith("_"):
+            try:
+                pending = object.__getattribute__(self, "__pydantic_private__")[
+                    _PENDING
+                ]
+            except (AttributeError, KeyError, TypeError):
+                pending = None
+            if pending and item in pending:
+                return self._materialize_field(item)
+        return super().__getattr__(item)  # type: ignore[misc]
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        """An assigned field is no longer pending, ``materialize`` must not
+        bring the raw JSON back over it."""
+        self._drop_pending(name)
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """ """
+        if self._drop_pending(name):
+            # never materialized, nothing in ``__dict__`` to delete
+            self.__dict__[name] = None
+        super().__delattr__(name)
+
+    def _drop_pending(self, name: str) -> bool:
+        """Forget the raw JSON of a pending field, ``True`` if it was."""
+        try:
+            private = object.__getattribute__(self, "__pydantic_private__")
+            pending = private[_PENDING]
+        except (AttributeError, KeyError, TypeError):
+            return False
+        if not pending or name not in pending:
+            return False
+        # copies of this instance share the mapping, so never change it in place
+        private[_PENDING] = {k: v for k, v in pending.items() if k != name}
+        return True
+
+    def _materialize_field(self, name: str) -> typing.List[FHIRAbstractModel]:
+        """ """
+        pending = self.__pydantic_private__[_PENDING]  # type: ignore[attr-defined]
+        raw, item_klass = pending[name]
+        scanner = JSONStreamScanner(io.BytesIO(raw))
+        value = [item_klass.model_validate_json(i) for i in scanner.iter_array_items()]
+        self.__dict__[name] = value
+        self._drop_pending(name)
+        return value
+
+    @property
+    def pending_fields(self) -> typing.List[str]:
+        """Names of the fields that are not validated yet."""
+        return list(self.__pydantic_private__[_PENDING])  # type: ignore[attr-defined]
+
+    def materialize(self) -> None:
+        """Validate every pending field."""
+        for name in self.pending_fields:
+            self._materialize_field(name)
+
+    def _fhir_iter(self, *args, **kwargs):
+        """ """
+        self.materialize()
+        return super()._fhir_iter(*args, **kwargs)  # type: ignore[misc]
+
+    def model_dump_json(self, *args, **kwargs):
+        """ """
+        self.materialize()
+        return super().model_dump_json(*args, **kwargs)  # type: ignore[misc]
+
+    def model_dump_xml(self, *args, **kwargs):
+        """ """
+        self.materialize()
+        return super().model_dump_xml(*args, **kwargs)  # type: ignore[misc]
+
+    def __repr_args__(self):
+        """ """
+        self.materialize()
+        return super().__repr_args__()  # type: ignore[misc]
+
+    def __reduce_ex__(self, protocol: typing.SupportsIndex):
+        """ """
+        return _restore_lazy, (
+            self.__class__.__eager_model_class__,  # type: ignore[attr-defined]
+            self.__getstate__(),  # type: ignore[attr-defined]
+        )
+
+    def __eq__(self, other: typing.Any) -> bool:
+        """Equal to another lazy instance or to the eagerly validated model
+        with the same field values."""
+        self.materialize()
+        if isinstance(other, LazyFieldsMixin):
+            other.materialize()
+        if not isinstance(other, FHIRAbstractModel):
+            return NotImplemented
+        if (
+            self.__class__.get_resource_type()  # type: ignore[attr-defined]
+            != other.__class__.get_resource_type()
+        ):
+            return False
+        # ``__dict__`` may hold more than fields (serialization flags)
+        return all(
+            self.__dict__.get(name) == other.__dict__.get(name)
+            for name in other.__class__.model_fields
+        )
+
+
+@lru_cache(maxsize=None)
+def get_lazy_model_class(
+    model_klass: typing.Type[FHIRAbstractModel],
+) -> typing.Type[FHIRAbstractModel]:
+    """Subclass of ``model_klass`` (same name and module) that is able to hold
+    pending fields; ``isinstance`` checks against ``model_klass`` still hold.
+
+    Required lazy fields are optional here, they are left out of the eagerly
+    validated part; ``model_validate_json_lazy`` checks they are given.
+    """
+    annotations: typing.Dict[str, typing.Any] = {_PENDING: typing.Dict[str, typing.Any]}
+    namespace: typing.Dict[str, typing.Any] = {
+        "__module__": model_klass.__module__,
+        "__qualname__": model_klass.__qualname__,
+        "__eager_model_class__": model_klass,
+        "__annotations__": annotations,
+        _PENDING: PrivateAttr(default_factory=dict),
+    }
+    for name, _ in get_lazy_fields(model_klass).values():
+        field_info = model_klass.model_fields[name]
+        if field_info.is_required():
+            annotations[name] = typing.Optional[field_info.annotation]
+            namespace[name] = FieldInfo.merge_field_infos(field_info, default=None)
+    return type(  # type: ignore[return-value]
+        model_klass.__name__, (LazyFieldsMixin, model_klass), namespace
+    )
+
+
+def model_validate_json_lazy(
+    model_klass: typing.Type[FHIRAbstractModel], data: typing.Union[str, bytes]
+) -> FHIRAbstractModel:
+    """Validate raw JSON, but keep the lists of ``BackboneElement``
+    (``ExplanationOfBenefit.item``, ``Questionnaire.item`` ...) as raw JSON
+    until first access, when only that subtree is validated.
+
+    Everything else is validated right away. Errors inside a pending subtree
+    are raised on its first access.
+
+    >>> eob = model_validate_json_lazy(ExplanationOfBenefit, data)
+    >>> eob.status  # validated already
+    >>> eob.item  # validated now, then cached
+    """
+    lazy_fields = get_lazy_fields(model_klass)
+    if not lazy_fields:
+        return model_klass.model_validate_json(data)
+
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    eager = []
+    pending = {}
+    scanner = JSONStreamScanner(io.BytesIO(data))
+    for key in scanner.iter_object_members():
+        raw = scanner.read_value()
+        if key in lazy_fields and raw[:1] == b"[":
+            name, item_klass = lazy_fields[key]
+            pending[name] = (raw, item_klass)
+        else:
+            eager.append(json.dumps(key).encode("utf-8") + b":" + raw)
+    if scanner.peek() is not None:
+        raise ValueError("Invalid JSON, unexpected data after the top level object.")
+    for name, _ in lazy_fields.values():
+        if name not in pending and model_klass.model_fields[name].is_required():
+            # missing or invalid, let the eager validation report it
+            return model_klass.model_validate_json(data)
+
+    instance = get_lazy_model_class(model_klass).model_validate_json(
+        b"{" + b",".join(eager) + b"}"
+    )
+    for name in pending:
+        del instance.__dict__[name]
+    instance.__pydantic_fields_set__.update(pending)
+    instance.__pydantic_private__[_PENDING] = pending  # type: ignore[index]
+    return instance
+
+
+__all__ = [
+    "LazyFieldsMixin",
+    "get_lazy_fields",
+    "get_lazy_model_class",
+    "model_validate_json_lazy",
+]
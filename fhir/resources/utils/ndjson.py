@@ -0,0 +1,212 @@
+from __future__ import annotations as _annotations
+
+import collections
+import io
+import os
+import typing
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+
+from . import DEFAULT_FHIR_RELEASE, parse_resource
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+class NDJSONResult(typing.NamedTuple):
+    """Outcome of a single NDJSON line, either ``resource`` or ``error`` is set."""
+
+    lineno: int
+    resource: typing.Optional[FHIRAbstractModel]
+    error: typing.Optional[Exception]
+
+
+def validate_batch(
+    batch: typing.Sequence[typing.Tuple[int, typing.Union[str, bytes]]],
+    fhir_release: str = DEFAULT_FHIR_RELEASE,
+) -> typing.List[NDJSONResult]:
+    """Validate ``(lineno, line)`` pairs, a failing line never stops the batch.
+
+    Module level, so that it can be sent to a worker process.
+    """
+    results = []
+    for lineno, line in batch:
+        try:
+            resource = parse_resource(line, fhir_release)
+        except ValueError as exc:
+            # pydantic's ValidationError and json's JSONDecodeError included
+            results.append(NDJSONResult(lineno, None, exc))
+        else:
+            results.append(NDJSONResult(lineno, resource, None))
+    return results
+
+
+class NDJSONReader:
+    """Read a FHIR Bulk Data NDJSON file (one resource per line).
+
+    Lines are validated in batches of ``batch_size``, in this process or, with
+    ``max_workers``, in a process pool. Results always come back in file order
+    and every line produces a ``NDJSONResult``; invalid lines carry the error
+    instead of aborting the whole file. Blank lines are skipped.
+
+    >>> with NDJSONReader("Patient.ndjson", max_workers=4) as reader:
+    ...     for result in reader:
+    ...         if result.error is not None:
+    ...             print(result.lineno, result.error)
+    """
+
+    def __init__(
+        self,
+        source: typing.Union[str, os.PathLike, typing.IO[typing.Any]],
+        *,
+        fhir_release: str = DEFAULT_FHIR_RELEASE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: typing.Optional[int] = None,
+    ):
+        """
+        source: path of a NDJSON file, or a binary or text stream.
+        max_workers: size of the process pool, ``None`` or ``0`` validates
+            in this process.
+        """
+        self._owned_stream: typing.Optional[typing.IO[bytes]] = None
+        if isinstance(source, (str, os.PathLike)):
+            source = self._owned_stream = open(source, "rb")
+        self._stream = source
+        self.fhir_release = fhir_release
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+
+    def __enter__(self) -> "NDJSONReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying file, when this reader has opened it."""
+        if self._owned_stream is not None:
+            self._owned_stream.close()
+            self._owned_stream = None
+
+    def iter_batches(
+        self,
+    ) -> typing.Iterator[typing.List[typing.Tuple[int, typing.Union[str, bytes]]]]:
+        """``(lineno, line)`` pairs, ``batch_size`` at a time."""
+        batch = []
+        for lineno, line in enumerate(self._stream, 1):
+            if not line.strip():
+                continue
+            batch.append((lineno, line))
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def __iter__(self) -> typing.Iterator[NDJSONResult]:
+        """ """
+        if not self.max_workers:
+            for batch in self.iter_batches():
+                yield from validate_batch(batch, self.fhir_release)
+            return
+
+        # a couple of batches in flight per worker keeps the pool busy while
+        # bounding memory; the queue is drained in submission order.
+        max_pending = self.max_workers * 2
+        pending: typing.Deque[Future] = collections.deque()
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for batch in self.iter_batches():
+                    pending.append(
+                        executor.submit(validate_batch, batch, self.fhir_release)
+                    )
+                    if len(pending) >= max_pending:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def iter_resources(self) -> typing.Iterator[FHIRAbstractModel]:
+        """Valid resources only, the first invalid line raises its error."""
+        for result in self:
+            if result.error is not None:
+                raise result.error
+            yield result.resource  # type: ignore[misc]
+
+
+class NDJSONWriter:
+    """Write resources as NDJSON, one compact JSON document per line.
+
+    Lines are collected in a single reusable buffer that is written out
+    whenever it grows past ``buffer_size`` (and on ``flush``/``close``).
+    """
+
+    def __init__(
+        self,
+        target: typing.Union[str, os.PathLike, typing.IO[typing.Any]],
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        exclude_comments: bool = False,
+    ):
+        """
+        target: path of the NDJSON file, or a binary or text stream.
+        """
+        self._owned_stream: typing.Optional[typing.IO[bytes]] = None
+        if isinstance(target, (str, os.PathLike)):
+            target = self._owned_stream = open(target, "wb")
+        self._stream = target
+        self._is_text = isinstance(target, io.TextIOBase)
+        self._buffer = bytearray()
+        self.buffer_size = buffer_size
+        self.exclude_comments = exclude_comments
+
+    def __enter__(self) -> "NDJSONWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, resource: FHIRAbstractModel) -> None:
+        """ """
+        self._buffer += resource.model_dump_json(
+            exclude_comments=self.exclude_comments
+        ).encode("utf-8")
+        self._buffer += b"\n"
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, resources: typing.Iterable[FHIRAbstractModel]) -> None:
+        """ """
+        for resource in resources:
+            self.write(resource)
+
+    def flush(self) -> None:
+        """ """
+        if not self._buffer:
+            return
+        if self._is_text:
+            self._stream.write(self._buffer.decode("utf-8"))
+        else:
+            self._stream.write(self._buffer)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Flush, and close the underlying file when this writer has opened it."""
+        self.flush()
+        if self._owned_stream is not None:
+            self._owned_stream.close()
+            self._owned_stream = None
+
+
+__all__ = [
+    "NDJSONResult",
+    "NDJSONReader",
+    "NDJSONWriter",
+    "validate_batch",
+]
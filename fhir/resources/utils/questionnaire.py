@@ -0,0 +1,504 @@
+"""``Questionnaire`` items indexed once by ``linkId``, with the ``enableWhen``
+dependencies as a graph from the questions to the items they enable, so a
+changed answer re-evaluates only the items that depend on it.
+
+>>> index = QuestionnaireIndex(questionnaire)
+>>> state = index.state(response)  # or ``index.state()``, nothing answered
+>>> state.set_answers("smoker", [True])
+{'packs-per-day', 'years-smoked'}
+>>> state.is_enabled("packs-per-day")
+True
+>>> index.validate_response(response)
+[ResponseIssue(link_id='age', message='...')]
+
+Answers are kept per ``linkId``: the answers of every repetition of a
+repeating group count for the ``enableWhen`` of any of them. Works for R5,
+R4B and STU3 (``hasAnswer``, ``option``, ``enableWhen`` without
+``enableBehavior`` is ``any`` there).
+"""
+
+from __future__ import annotations as _annotations
+
+import typing
+from collections import deque
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+
+from ..fhirabstractmodel import get_choice_element, get_choice_value
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+# item type -> the ``value[x]`` types of its answers
+_ANSWER_TYPES: typing.Dict[str, typing.FrozenSet[str]] = {
+    "boolean": frozenset(("Boolean",)),
+    "decimal": frozenset(("Decimal",)),
+    "integer": frozenset(("Integer",)),
+    "date": frozenset(("Date",)),
+    "dateTime": frozenset(("DateTime",)),
+    "time": frozenset(("Time",)),
+    "string": frozenset(("String",)),
+    "text": frozenset(("String",)),
+    "url": frozenset(("Uri",)),
+    "coding": frozenset(("Coding",)),
+    "choice": frozenset(("Coding",)),
+    "open-choice": frozenset(("Coding", "String")),
+    "attachment": frozenset(("Attachment",)),
+    "reference": frozenset(("Reference",)),
+    "quantity": frozenset(("Quantity",)),
+}
+_NO_ANSWERS = ("group", "display")
+
+
+class ResponseIssue(typing.NamedTuple):
+    """ """
+
+    link_id: typing.Optional[str]
+    message: str
+
+
+class _Condition(typing.NamedTuple):
+    """An ``enableWhen``: ``exists`` (``hasAnswer``) or a comparison."""
+
+    question: str
+    operator: str
+    answer: typing.Any
+
+
+def _value_key(value: typing.Any) -> typing.Any:
+    """Comparable, hashable form of an answer value: ``(system, code)`` of a
+    ``Coding``, the value of a ``Quantity``, the ``reference`` of a
+    ``Reference``, the value itself for primitives."""
+    if not isinstance(value, FHIRAbstractModel):
+        return value
+    type_name = value.get_resource_type()
+    if type_name == "Coding":
+        return value.system, value.code
+    if type_name == "Quantity":
+        return value.value
+    if type_name == "Reference":
+        return value.reference
+    if type_name == "Attachment":
+        return value.url
+    return value
+
+
+def _answer_value(answer: typing.Any) -> typing.Any:
+    """Value of a ``QuestionnaireResponseItemAnswer`` or a plain value."""
+    if isinstance(answer, FHIRAbstractModel) and answer.get_resource_type().endswith(
+        "Answer"
+    ):
+        return get_choice_value(answer, "value")
+    return answer
+
+
+def _matches(operator: str, answer: typing.Any, expected: typing.Any) -> bool:
+    """One answer against an ``enableWhen`` answer (both value keys)."""
+    if isinstance(expected, tuple) and isinstance(answer, tuple):
+        # a Coding without system matches on the code
+        system, code = expected
+        equal = answer[1] == code and (system is None or answer[0] == system)
+        if operator == "=":
+            return equal
+        if operator == "!=":
+            return not equal
+        return False
+    if operator == "=":
+        return answer == expected
+    if operator == "!=":
+        return answer != expected
+    try:
+        if operator == ">":
+            return answer > expected
+        if operator == "<":
+            return answer < expected
+        if operator == ">=":
+            return answer >= expected
+        return answer <= expected
+    except TypeError:
+        return False
+
+
+class QuestionnaireIndex:
+    """The items of a ``Questionnaire`` by ``linkId`` (with their parent and
+    children), the ``enableWhen`` conditions compiled per item and the
+    reverse graph: question ``linkId`` -> items with a condition on it."""
+
+    def __init__(self, questionnaire: FHIRAbstractModel):
+        self.url: typing.Optional[str] = questionnaire.url
+        self.items: typing.Dict[str, FHIRAbstractModel] = dict()
+        self._parent: typing.Dict[str, typing.Optional[str]] = dict()
+        self._children: typing.Dict[typing.Optional[str], typing.List[str]] = dict()
+        self._conditions: typing.Dict[
+            str, typing.Tuple[bool, typing.Tuple[_Condition, ...]]
+        ] = dict()
+        self.dependents: typing.Dict[str, typing.List[str]] = dict()
+        # linkId -> (allowed answer types, option keys or None, open options)
+        self._answers: typing.Dict[
+            str,
+            typing.Tuple[
+                typing.Optional[typing.FrozenSet[str]],
+                typing.Optional[typing.FrozenSet[typing.Any]],
+                bool,
+            ],
+        ] = dict()
+
+        stack: typing.List[typing.Tuple[FHIRAbstractModel, typing.Optional[str]]] = [
+            (item, None) for item in reversed(questionnaire.item or ())
+        ]
+        while stack:
+            item, parent = stack.pop()
+            link_id = item.linkId
+            if link_id in self.items:
+                raise ValueError(f"Duplicate linkId ``{link_id}`` in {self.url}")
+            self.items[link_id] = item
+            self._parent[link_id] = parent
+            self._children.setdefault(parent, []).append(link_id)
+            self._compile(link_id, item)
+            stack.extend((child, link_id) for child in reversed(item.item or ()))
+
+        for link_id, (_, conditions) in self._conditions.items():
+            for condition in conditions:
+                if condition.question not in self.items:
+                    raise ValueError(
+                        f"enableWhen of ``{link_id}`` refers to the unknown "
+                        f"question ``{condition.question}``"
+                    )
+                dependents = self.dependents.setdefault(condition.question, [])
+                if link_id not in dependents:
+                    dependents.append(link_id)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, link_id: str) -> bool:
+        return link_id in self.items
+
+    def _compile(self, link_id: str, item: FHIRAbstractModel) -> None:
+        """ """
+        conditions = list()
+        for enable_when in item.enableWhen or ():
+            answer = get_choice_value(enable_when, "answer")
+            operator = getattr(enable_when, "operator", None)
+            if operator is None:
+                # STU3: ``hasAnswer`` or an answer to be equal to
+                has_answer = getattr(enable_when, "hasAnswer", None)
+                operator, answer = (
+                    ("exists", has_answer) if has_answer is not None else ("=", answer)
+                )
+            conditions.append(
+                _Condition(
+                    enable_when.question,
+                    operator,
+                    answer if operator == "exists" else _value_key(answer),
+                )
+            )
+        if conditions:
+            behavior = getattr(item, "enableBehavior", None)
+            if behavior is None:
+                # STU3 repetitions are ``any``, R4B/R5 need the element
+                behavior = "all" if hasattr(item, "enableBehavior") else "any"
+            self._conditions[link_id] = (behavior == "any", tuple(conditions))
+
+        options = getattr(item, "answerOption", None) or getattr(item, "option", None)
+        option_keys = None
+        option_types: typing.Set[str] = set()
+        if options:
+            option_keys = set()
+            for option in options:
+                element = get_choice_element(option, "value")
+                if element is None:
+                    continue
+                option_types.add(element[0][len("value") :])
+                option_keys.add(_value_key(element[1]))
+        allowed = _ANSWER_TYPES.get(item.type)
+        if allowed is not None and item.type in ("choice", "open-choice"):
+            allowed = allowed | option_types
+        constraint = getattr(item, "answerConstraint", None)
+        open_options = item.type == "open-choice" or constraint in (
+            "optionsOrType",
+            "optionsOrString",
+        )
+        if constraint == "optionsOrString" and allowed is not None:
+            allowed = allowed | {"String"}
+        self._answers[link_id] = (
+            allowed,
+            frozenset(option_keys) if option_keys is not None else None,
+            open_options,
+        )
+
+    def get_item(self, link_id: str) -> typing.Optional[FHIRAbstractModel]:
+        """ """
+        return self.items.get(link_id)
+
+    def parent(self, link_id: str) -> typing.Optional[str]:
+        """``linkId`` of the parent item, ``None`` at the top level."""
+        return self._parent.get(link_id)
+
+    def children(self, link_id: typing.Optional[str]) -> typing.List[str]:
+        """``linkId`` of the child items, the top level ones for ``None``."""
+        return list(self._children.get(link_id, ()))
+
+    def state(
+        self, response: typing.Optional[FHIRAbstractModel] = None
+    ) -> "EnableWhenState":
+        """Enabled items of a ``QuestionnaireResponse``, updated answer by
+        answer afterwards."""
+        return EnableWhenState(self, _collect_answers(response))
+
+    def validate_response(
+        self, response: FHIRAbstractModel
+    ) -> typing.List[ResponseIssue]:
+        """Issues of a ``QuestionnaireResponse``, in one walk of its items:
+        unknown ``linkId``, item at the wrong place, answers to groups or
+        display items, answer types, more than one answer (or repetition) of
+        a non repeating item, answers not among the options, ``maxLength``,
+        answers to disabled items and required enabled items left out."""
+        issues: typing.List[ResponseIssue] = list()
+        answers: typing.Dict[str, typing.List[typing.Any]] = dict()
+        present: typing.Set[str] = set()
+        # (response item, parent linkId)
+        stack = [(item, None) for item in reversed(response.item or ())]
+        while stack:
+            response_item, parent = stack.pop()
+            link_id = response_item.linkId
+            item = self.items.get(link_id)
+            if item is None:
+                issues.append(ResponseIssue(link_id, "Unknown linkId"))
+                continue
+            if self._parent[link_id] != parent:
+                issues.append(
+                    ResponseIssue(
+                        link_id,
+                        f"Item belongs under ``{self._parent[link_id]}``, "
+                        f"not ``{parent}``",
+                    )
+                )
+            present.add(link_id)
+            self._check_answers(link_id, item, response_item, issues)
+            values = answers.setdefault(link_id, [])
+            nested: typing.List[FHIRAbstractModel] = list(response_item.item or ())
+            for answer in response_item.answer or ():
+                values.append(_answer_value(answer))
+                nested.extend(answer.item or ())
+            # a non repeating item once per parent
+            seen: typing.Set[str] = set()
+            for child in nested:
+                if child.linkId in seen and child.linkId in self.items:
+                    if not self.items[child.linkId].repeats:
+                        issues.append(
+                            ResponseIssue(child.linkId, "Item does not repeat")
+                        )
+                seen.add(child.linkId)
+            stack.extend((child, link_id) for child in reversed(nested))
+
+        state = EnableWhenState(self, answers)
+        for link_id, item in self.items.items():
+            enabled = state.is_enabled(link_id)
+            if not enabled and answers.get(link_id):
+                issues.append(ResponseIssue(link_id, "Answer to a disabled item"))
+            elif enabled and item.required and link_id not in present:
+                parent = self._parent[link_id]
+                # required within a group that is there at all
+                if parent is None or parent in present:
+                    issues.append(ResponseIssue(link_id, "Required item missing"))
+        return issues
+
+    def _check_answers(
+        self,
+        link_id: str,
+        item: FHIRAbstractModel,
+        response_item: FHIRAbstractModel,
+        issues: typing.List[ResponseIssue],
+    ) -> None:
+        """ """
+        answers = response_item.answer or ()
+        if not answers:
+            return
+        if item.type in _NO_ANSWERS:
+            issues.append(ResponseIssue(link_id, f"No answer allowed ({item.type})"))
+            return
+        if len(answers) > 1 and not item.repeats:
+            issues.append(ResponseIssue(link_id, "Only one answer allowed"))
+        allowed, options, open_options = self._answers[link_id]
+        for answer in answers:
+            element = get_choice_element(answer, "value")
+            if element is None:
+                continue
+            value_type = element[0][len("value") :]
+            if allowed is not None and value_type not in allowed:
+                issues.append(
+                    ResponseIssue(
+                        link_id,
+                        f"Answer of type {value_type} to an item of type "
+                        f"{item.type}",
+                    )
+                )
+                continue
+            value = element[1]
+            if options is not None:
+                key = _value_key(value)
+                if key not in options and not (
+                    isinstance(key, tuple) and (None, key[1]) in options
+                ):
+                    if not open_options or value_type == "Coding":
+                        issues.append(
+                            ResponseIssue(link_id, f"{key!r} is not an answer option")
+                        )
+                        continue
+            if (
+                item.maxLength is not None
+                and isinstance(value, str)
+                and len(value) > item.maxLength
+            ):
+                issues.append(
+                    ResponseIssue(link_id, f"Longer than {item.maxLength} characters")
+                )
+
+
+def _collect_answers(
+    response: typing.Optional[FHIRAbstractModel],
+) -> typing.Dict[str, typing.List[typing.Any]]:
+    """Answer values of a response by ``linkId``, nested items included."""
+    answers: typing.Dict[str, typing.List[typing.Any]] = dict()
+    if response is None:
+        return answers
+    stack = list(response.item or ())
+    while stack:
+        response_item = stack.pop()
+        for answer in response_item.answer or ():
+            answers.setdefault(response_item.linkId, []).append(_answer_value(answer))
+            stack.extend(answer.item or ())
+        stack.extend(response_item.item or ())
+    return answers
+
+
+class EnableWhenState:
+    """Which items are enabled for a set of answers. An item is enabled when
+    its ``enableWhen`` hold and its parent is enabled; the answers of a
+    disabled item count as not given.
+
+    ``set_answers`` re-evaluates the items that depend on the changed
+    question, and further only the ones whose enabled state changed on the
+    way: the rest of the questionnaire is never looked at.
+    """
+
+    def __init__(
+        self,
+        index: QuestionnaireIndex,
+        answers: typing.Optional[
+            typing.Mapping[str, typing.Sequence[typing.Any]]
+        ] = None,
+    ):
+        self.index = index
+        self._answers: typing.Dict[str, typing.List[typing.Any]] = dict()
+        for link_id, values in (answers or {}).items():
+            keys = [_value_key(_answer_value(value)) for value in values]
+            if keys:
+                self._answers[link_id] = keys
+        self._enabled: typing.Dict[str, bool] = {
+            link_id: True for link_id in index.items
+        }
+        # every item with a condition, parents before children
+        self._update(deque(index._conditions))
+
+    def is_enabled(self, link_id: str) -> bool:
+        """ """
+        return self._enabled[link_id]
+
+    def enabled(self) -> typing.List[str]:
+        """``linkId`` of every enabled item, in questionnaire order."""
+        return [link_id for link_id, on in self._enabled.items() if on]
+
+    def answers(self, link_id: str) -> typing.List[typing.Any]:
+        """Answer values of an item (``(system, code)`` for a ``Coding``)."""
+        return list(self._answers.get(link_id, ()))
+
+    def set_answers(
+        self, link_id: str, values: typing.Sequence[typing.Any]
+    ) -> typing.Set[str]:
+        """Replace the answers of an item (plain values, ``Coding``,
+        ``Quantity``, ``QuestionnaireResponseItemAnswer``, an empty list to
+        clear them); the ``linkId`` of the items whose enabled state changed."""
+        if link_id not in self.index.items:
+            raise ValueError(f"Unknown linkId ``{link_id}``")
+        keys = [_value_key(_answer_value(value)) for value in values]
+        previous = self._answers.get(link_id)
+        if keys:
+            self._answers[link_id] = keys
+        else:
+            self._answers.pop(link_id, None)
+        if not self._enabled[link_id]:
+            # answers of a disabled item do not count
+            return set()
+        try:
+            return self._update(deque(self.index.dependents.get(link_id, ())))
+        except ValueError:
+            # the state stays as it was before the call
+            if previous is None:
+                self._answers.pop(link_id, None)
+            else:
+                self._answers[link_id] = previous
+            raise
+
+    def _evaluate(self, link_id: str) -> bool:
+        """The ``enableWhen`` of an item alone."""
+        compiled = self.index._conditions.get(link_id)
+        if compiled is None:
+            return True
+        any_of, conditions = compiled
+        for condition in conditions:
+            question = condition.question
+            values = self._answers.get(question) if self._enabled[question] else None
+            if condition.operator == "exists":
+                result = bool(values) is bool(condition.answer)
+            elif not values:
+                result = False
+            else:
+                result = any(
+                    _matches(condition.operator, value, condition.answer)
+                    for value in values
+                )
+            if result is any_of:
+                return result
+        return not any_of
+
+    def _update(self, queue: typing.Deque[str]) -> typing.Set[str]:
+        """Re-evaluate the queued items, and the items affected by each
+        change, to a fixpoint. The enabled states are left unchanged when
+        they do not settle."""
+        index = self.index
+        enabled = self._enabled
+        before = dict(enabled)
+        changed: typing.Set[str] = set()
+        queued = set(queue)
+        # without a cycle, an item flips at most once per step along the
+        # longest dependency path, which is shorter than the item count
+        flips: typing.Dict[str, int] = dict()
+        while queue:
+            link_id = queue.popleft()
+            queued.discard(link_id)
+            parent = index._parent[link_id]
+            value = (parent is None or enabled[parent]) and self._evaluate(link_id)
+            if value is enabled[link_id]:
+                continue
+            flips[link_id] = flips.get(link_id, 0) + 1
+            if flips[link_id] > len(index.items):
+                self._enabled = before
+                raise ValueError(
+                    f"enableWhen of {index.url} do not settle (cycle through "
+                    f"``{link_id}``)"
+                )
+            enabled[link_id] = value
+            changed ^= {link_id}
+            affected = index._children.get(link_id, [])
+            if link_id in self._answers:
+                affected = affected + index.dependents.get(link_id, [])
+            for other in affected:
+                if other not in queued:
+                    queued.add(other)
+                    queue.append(other)
+        return changed
+
+
+__all__ = ["EnableWhenState", "QuestionnaireIndex", "ResponseIssue"]
@@ -0,0 +1,154 @@
+from __future__ import annotations as _annotations
+
+import typing
+from functools import lru_cache
+from importlib import import_module
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+
+from ..fhirabstractmodel import get_field_model_klass
+from . import DEFAULT_FHIR_RELEASE, FHIR_RELEASES
+from .lazy import LazyFieldsMixin
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+_Targets = typing.Optional[typing.Tuple[str, ...]]
+
+
+@lru_cache(maxsize=None)
+def get_reference_walk(
+    model_klass: typing.Type[FHIRAbstractModel],
+) -> typing.Tuple[typing.Tuple[str, bool, bool], ...]:
+    """Every complex field of a model, i.e. the ones that may hold a
+    ``Reference`` once extensions are taken into account.
+
+    Returns ``((field name, is list, is Reference), ...)``.
+    """
+    walk = list()
+    for name, field_info in model_klass.model_fields.items():
+        klass, is_list = get_field_model_klass(field_info.annotation)
+        if klass is None:
+            continue
+        walk.append((name, is_list, klass.get_resource_type() == "Reference"))
+    return tuple(walk)
+
+
+@lru_cache(maxsize=None)
+def _reference_paths_module(package: str) -> typing.Any:
+    """The generated ``reference_paths`` module of a release package."""
+    return import_module(f"{package}.reference_paths")
+
+
+@lru_cache(maxsize=None)
+def get_reference_fields(
+    model_klass: typing.Type[FHIRAbstractModel],
+) -> typing.Tuple[typing.Tuple[str, str, bool, str, _Targets], ...]:
+    """The generated ``REFERENCE_FIELDS`` entry of a model class, empty when
+    nothing inside the class leads to a ``Reference``."""
+    module = _reference_paths_module(model_klass.__module__.rsplit(".", 1)[0])
+    return module.REFERENCE_FIELDS.get(model_klass.__name__, ())
+
+
+def get_reference_paths(
+    resource_type: str, fhir_release: str = DEFAULT_FHIR_RELEASE
+) -> typing.Tuple[typing.Tuple[str, _Targets], ...]:
+    """FHIR paths of the ``Reference`` and ``CodeableReference`` elements of
+    a resource type, with their allowed target types, i.e.
+    ``("Observation.performer[*]", ("Practitioner", ...))``.
+
+    Recursive elements (``Questionnaire.item.item``) are listed once.
+    """
+    module = _reference_paths_module(FHIR_RELEASES[fhir_release])
+    return module.REFERENCE_PATHS.get(resource_type, ())
+
+
+def iter_reference_elements(
+    obj: FHIRAbstractModel,
+) -> typing.Iterator[typing.Tuple[str, FHIRAbstractModel, _Targets]]:
+    """``(FHIR path, Reference, allowed target types)`` of every reference of a
+    resource, the ones of contained resources included, extensions left out.
+
+    Only the fields listed in the generated ``reference_paths`` tables are
+    visited. Paths are the ones of ``get_reference_paths``; for a
+    ``CodeableReference`` it is the path of the ``CodeableReference``, for
+    contained resources it starts at their own resource type.
+
+    >>> list(iter_reference_elements(observation))
+    [('Observation.subject', Reference(...), ('Patient', 'Group', ...))]
+    """
+    if isinstance(obj, LazyFieldsMixin):
+        obj.materialize()
+    stack = [(obj, obj.get_resource_type())]
+    while stack:
+        current, path = stack.pop()
+        values = current.__dict__
+        children = list()
+        for name, element, is_list, kind, targets in get_reference_fields(
+            current.__class__
+        ):
+            value = values.get(name)
+            if value is None:
+                continue
+            element_path = f"{path}.{element}[*]" if is_list else f"{path}.{element}"
+            for item in value if is_list else (value,):
+                if kind == "reference":
+                    yield element_path, item, targets
+                elif kind == "codeable":
+                    item = item.reference
+                    if item is None:
+                        continue
+                    yield element_path, item, targets
+                elif kind == "resource":
+                    children.append((item, item.get_resource_type()))
+                    continue
+                # ``Reference.identifier.assigner`` is a reference as well
+                children.append((item, element_path))
+        stack.extend(reversed(children))
+
+
+def iter_references(
+    obj: FHIRAbstractModel, *, extensions: bool = False
+) -> typing.Iterator[FHIRAbstractModel]:
+    """Every ``Reference`` of a resource or element, the ones of contained
+    resources included. The references of an element come in field order,
+    before the nested ones.
+
+    extensions: include the references inside extensions (``valueReference``);
+        every complex element is visited then, not only the ones the
+        generated ``reference_paths`` tables lead to.
+
+    >>> [ref.reference for ref in iter_references(observation)]
+    ['Patient/example', 'Practitioner/f005']
+    """
+    if not extensions:
+        for _, reference, _ in iter_reference_elements(obj):
+            yield reference
+        return
+
+    if isinstance(obj, LazyFieldsMixin):
+        obj.materialize()
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        values = current.__dict__
+        children = list()
+        for name, is_list, is_reference in get_reference_walk(current.__class__):
+            value = values.get(name)
+            if value is None:
+                continue
+            for item in value if is_list else (value,):
+                if is_reference:
+                    yield item
+                # ``Reference`` itself has ``extension`` and ``identifier``
+                children.append(item)
+        stack.extend(reversed(children))
+
+
+__all__ = [
+    "get_reference_fields",
+    "get_reference_paths",
+    "get_reference_walk",
+    "iter_reference_elements",
+    "iter_references",
+]
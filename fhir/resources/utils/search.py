@@ -0,0 +1,590 @@
+"""Search index rows out of resources, following the ``expression`` of the
+``SearchParameter`` definitions (https://hl7.org/fhir/search.html).
+
+>>> indexer = SearchIndexer.from_definitions("definitions.json.zip", "R5")
+>>> indexer.extract(patient)
+[TokenIndex(name='gender', system=None, code='male'),
+ StringIndex(name='family', value='Chalmers', normalized='chalmers'), ...]
+>>> for rows in indexer.extract_many(resources):
+...     ...
+
+The ``SearchParameter`` definitions of a release are part of the FHIR
+specification downloads, ``definitions.json.zip`` (``search-parameters.json``
+inside), any other Bundle or list of ``SearchParameter`` works too.
+"""
+
+from __future__ import annotations as _annotations
+
+import calendar
+import datetime
+import decimal
+import os
+import re
+import typing
+import unicodedata
+import zipfile
+from collections import defaultdict
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+
+from . import DEFAULT_FHIR_RELEASE, get_fhir_model_class
+from .bundle import BundleReader, _parse_url
+from .construct import _parse_datetime
+from .fhirpath import FHIRPathExpression, _type_names, compile_fhirpath
+from .lazy import LazyFieldsMixin
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+_UTC = datetime.timezone.utc
+DATE_MIN = datetime.datetime.min.replace(tzinfo=_UTC)
+DATE_MAX = datetime.datetime.max.replace(tzinfo=_UTC)
+_PARTIAL_DATE = re.compile(r"^(\d{4})(?:-(\d{2}))?(?:-(\d{2}))?$")
+_LEADING_NAME = re.compile(r"\s*\(*\s*([A-Za-z_][A-Za-z0-9_]*)")
+_CURRENCY_SYSTEM = "urn:iso:std:iso:4217"
+
+
+class TokenIndex(typing.NamedTuple):
+    """``token``: ``system|code`` of a ``Coding``, ``CodeableConcept``,
+    ``Identifier`` (``system|value``), ``ContactPoint`` (value) or a code,
+    boolean or id (no system)."""
+
+    name: str
+    system: typing.Optional[str]
+    code: str
+
+
+class StringIndex(typing.NamedTuple):
+    """``string``; ``normalized`` is the value without accents, case folded,
+    for the default (case and accent insensitive) matching."""
+
+    name: str
+    value: str
+    normalized: str
+
+
+class ReferenceIndex(typing.NamedTuple):
+    """``reference``; ``url`` is the reference as written, ``resource_type``,
+    ``id`` and ``version`` are filled in for RESTful references, ``version``
+    for versioned canonicals (``url|version``) too."""
+
+    name: str
+    resource_type: typing.Optional[str]
+    id: typing.Optional[str]
+    version: typing.Optional[str]
+    url: str
+
+
+class DateIndex(typing.NamedTuple):
+    """``date``: the time range a value stands for, in UTC, both ends
+    included; ``2016-05`` is ``2016-05-01T00:00:00`` to
+    ``2016-05-31T23:59:59.999999``, open ends of a ``Period`` are
+    ``DATE_MIN``/``DATE_MAX``."""
+
+    name: str
+    low: datetime.datetime
+    high: datetime.datetime
+
+
+class QuantityIndex(typing.NamedTuple):
+    """``quantity``: ``Quantity`` (and its specializations), ``Money``
+    (currency as ``code``) or a number."""
+
+    name: str
+    value: decimal.Decimal
+    system: typing.Optional[str]
+    code: typing.Optional[str]
+    unit: typing.Optional[str]
+
+
+class NumberIndex(typing.NamedTuple):
+    """``number``"""
+
+    name: str
+    value: decimal.Decimal
+
+
+class UriIndex(typing.NamedTuple):
+    """``uri``"""
+
+    name: str
+    uri: str
+
+
+SearchIndexRow = typing.Union[
+    TokenIndex,
+    StringIndex,
+    ReferenceIndex,
+    DateIndex,
+    QuantityIndex,
+    NumberIndex,
+    UriIndex,
+]
+# one compiled search parameter: (code, row factory, expression)
+_Extractor = typing.Tuple[
+    str,
+    typing.Callable[[str, typing.Any], typing.Iterator[SearchIndexRow]],
+    FHIRPathExpression,
+]
+
+
+def _type_of(value: typing.Any) -> typing.Optional[str]:
+    """ """
+    if isinstance(value, FHIRAbstractModel):
+        return value.get_resource_type()
+    return None
+
+
+def _tokens(name: str, value: typing.Any) -> typing.Iterator[SearchIndexRow]:
+    """ """
+    if isinstance(value, bool):
+        yield TokenIndex(name, None, "true" if value else "false")
+        return
+    if isinstance(value, (str, int, decimal.Decimal)):
+        yield TokenIndex(name, None, str(value))
+        return
+    kind = _type_of(value)
+    if kind == "Coding":
+        if value.code is not None:
+            yield TokenIndex(name, value.system, value.code)
+    elif kind == "CodeableConcept":
+        for coding in value.coding or ():
+            if coding.code is not None:
+                yield TokenIndex(name, coding.system, coding.code)
+    elif kind == "CodeableReference":
+        if value.concept is not None:
+            yield from _tokens(name, value.concept)
+    elif kind == "Identifier":
+        if value.value is not None:
+            yield TokenIndex(name, value.system, value.value)
+    elif kind == "ContactPoint":
+        if value.value is not None:
+            yield TokenIndex(name, None, value.value)
+
+
+def _normalize(value: str) -> str:
+    """ """
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+_STRING_FIELDS = {
+    "HumanName": ("family", "given", "prefix", "suffix", "text"),
+    "Address": ("line", "city", "district", "state", "postalCode", "country", "text"),
+}
+
+
+def _strings(name: str, value: typing.Any) -> typing.Iterator[SearchIndexRow]:
+    """ """
+    if isinstance(value, str):
+        yield StringIndex(name, value, _normalize(value))
+        return
+    for field in _STRING_FIELDS.get(_type_of(value) or "", ()):
+        part = getattr(value, field)
+        if part is None:
+            continue
+        for item in part if isinstance(part, list) else (part,):
+            yield StringIndex(name, item, _normalize(item))
+
+
+def _reference_row(name: str, reference: str) -> SearchIndexRow:
+    """ """
+    if reference.startswith("#"):
+        return ReferenceIndex(name, None, None, None, reference)
+    url, _, canonical_version = reference.partition("|")
+    _, path, version = _parse_url(url)
+    if path is None:
+        return ReferenceIndex(name, None, None, canonical_version or None, reference)
+    resource_type, resource_id = path.split("/")
+    return ReferenceIndex(
+        name, resource_type, resource_id, version or canonical_version or None, url
+    )
+
+
+def _references(name: str, value: typing.Any) -> typing.Iterator[SearchIndexRow]:
+    """ """
+    if isinstance(value, str):
+        yield _reference_row(name, value)
+        return
+    kind = _type_of(value)
+    if kind == "CodeableReference":
+        value = value.reference
+        kind = _type_of(value)
+    if kind == "Reference":
+        if value.reference is not None:
+            yield _reference_row(name, value.reference)
+    elif (
+        kind is not None
+        and "resource" in _type_names(value.__class__)
+        and value.id is not None
+    ):
+        # a resource, ``Bundle.entry[0].resource``
+        resource_type = value.get_resource_type()
+        yield ReferenceIndex(
+            name, resource_type, value.id, None, f"{resource_type}/{value.id}"
+        )
+
+
+def _to_utc(value: datetime.datetime) -> datetime.datetime:
+    """ """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=_UTC)
+    return value.astimezone(_UTC)
+
+
+def _date_range(
+    value: typing.Any,
+) -> typing.Optional[typing.Tuple[datetime.datetime, datetime.datetime]]:
+    """ """
+    if isinstance(value, datetime.datetime):
+        low = _to_utc(value)
+        if value.microsecond:
+            return low, low
+        return low, low + datetime.timedelta(microseconds=999999)
+    if isinstance(value, datetime.date):
+        return (
+            datetime.datetime.combine(value, datetime.time.min, _UTC),
+            datetime.datetime.combine(value, datetime.time.max, _UTC),
+        )
+    if isinstance(value, str):
+        match = _PARTIAL_DATE.match(value)
+        if match is None:
+            if "T" not in value:
+                return None
+            # pydantic's parser, ``datetime.fromisoformat`` takes neither
+            # ``Z`` nor other than 3 or 6 fraction digits before Python 3.11
+            try:
+                return _date_range(_parse_datetime(value))
+            except ValueError:
+                return None
+        year, month, day = match.groups()
+        first_month = int(month or 1)
+        last_month = int(month or 12)
+        first_day = int(day or 1)
+        last_day = int(day or calendar.monthrange(int(year), last_month)[1])
+        return (
+            datetime.datetime(int(year), first_month, first_day, tzinfo=_UTC),
+            datetime.datetime.combine(
+                datetime.date(int(year), last_month, last_day),
+                datetime.time.max,
+                _UTC,
+            ),
+        )
+    kind = _type_of(value)
+    if kind == "Period":
+        start = _date_range(value.start) if value.start is not None else None
+        end = _date_range(value.end) if value.end is not None else None
+        if start is None and end is None:
+            return None
+        return (
+            start[0] if start is not None else DATE_MIN,
+            end[1] if end is not None else DATE_MAX,
+        )
+    if kind == "Timing":
+        ranges = [_date_range(event) for event in value.event or ()]
+        ranges = [r for r in ranges if r is not None]
+        if not ranges:
+            return None
+        return min(r[0] for r in ranges), max(r[1] for r in ranges)
+    return None
+
+
+def _dates(name: str, value: typing.Any) -> typing.Iterator[SearchIndexRow]:
+    """ """
+    date_range = _date_range(value)
+    if date_range is not None:
+        yield DateIndex(name, *date_range)
+
+
+def _quantities(name: str, value: typing.Any) -> typing.Iterator[SearchIndexRow]:
+    """ """
+    if isinstance(value, (int, decimal.Decimal)) and not isinstance(value, bool):
+        yield QuantityIndex(name, decimal.Decimal(value), None, None, None)
+        return
+    if not isinstance(value, FHIRAbstractModel):
+        return
+    # ``Age``, ``Duration`` ... are ``Quantity``; ``SampledData`` has no value
+    names = _type_names(value.__class__)
+    if ("quantity" not in names and "money" not in names) or value.value is None:
+        return
+    if "quantity" in names:
+        yield QuantityIndex(
+            name, decimal.Decimal(value.value), value.system, value.code, value.unit
+        )
+    else:
+        yield QuantityIndex(
+            name,
+            decimal.Decimal(value.value),
+            _CURRENCY_SYSTEM,
+            value.currency,
+            value.currency,
+        )
+
+
+def _numbers(name: str, value: typing.Any) -> typing.Iterator[SearchIndexRow]:
+    """ """
+    if isinstance(value, (int, decimal.Decimal)) and not isinstance(value, bool):
+        yield NumberIndex(name, decimal.Decimal(value))
+
+
+def _uris(name: str, value: typing.Any) -> typing.Iterator[SearchIndexRow]:
+    """ """
+    if isinstance(value, str):
+        yield UriIndex(name, value)
+
+
+# SearchParameter.type: rows out of the values of its expression;
+# ``composite`` and ``special`` have no such rows.
+ROW_FACTORIES: typing.Dict[
+    str, typing.Callable[[str, typing.Any], typing.Iterator[SearchIndexRow]]
+] = {
+    "token": _tokens,
+    "string": _strings,
+    "reference": _references,
+    "date": _dates,
+    "quantity": _quantities,
+    "number": _numbers,
+    "uri": _uris,
+}
+
+
+def _split_union(expression: str) -> typing.List[str]:
+    """Top level ``|`` operands of an expression."""
+    parts = []
+    depth = 0
+    start = 0
+    quote = None
+    position = 0
+    while position < len(expression):
+        char = expression[position]
+        if quote is not None:
+            if char == "\\":
+                position += 1
+            elif char == quote:
+                quote = None
+        elif char in "'`":
+            quote = char
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            parts.append(expression[start:position].strip())
+            start = position + 1
+        position += 1
+    parts.append(expression[start:].strip())
+    return parts
+
+
+def _expression_for(expression: str, type_names: typing.FrozenSet[str]) -> str:
+    """A parameter expression shared by several resource types
+    (``Patient.name | Practitioner.name``) reduced to the operands about one
+    of them."""
+    parts = []
+    for part in _split_union(expression):
+        match = _LEADING_NAME.match(part)
+        if match is not None:
+            leading = match.group(1)
+            if leading[:1].isupper() and leading.lower() not in type_names:
+                continue
+        parts.append(part)
+    return " | ".join(parts)
+
+
+def load_search_parameters(
+    source: typing.Union[str, os.PathLike],
+    fhir_release: str = DEFAULT_FHIR_RELEASE,
+) -> typing.List[FHIRAbstractModel]:
+    """``SearchParameter`` resources out of a Bundle JSON file
+    (``search-parameters.json``) or a zip archive holding one
+    (``definitions.json.zip``)."""
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            names = [
+                name
+                for name in archive.namelist()
+                if os.path.basename(name) == "search-parameters.json"
+            ]
+            if not names:
+                raise ValueError(f"No search-parameters.json in {source}")
+            with archive.open(names[0]) as stream:
+                return _search_parameters(stream, fhir_release)
+    return _search_parameters(source, fhir_release)
+
+
+def _search_parameters(
+    source: typing.Any, fhir_release: str
+) -> typing.List[FHIRAbstractModel]:
+    """ """
+    with BundleReader(source, fhir_release=fhir_release) as reader:
+        return [
+            resource
+            for resource in reader.iter_resources()
+            if resource is not None
+            and resource.get_resource_type() == "SearchParameter"
+        ]
+
+
+class SearchIndexer:
+    """Turns resources into search index rows (``TokenIndex``, ``StringIndex``,
+    ``ReferenceIndex``, ``DateIndex``, ``QuantityIndex``, ``NumberIndex``,
+    ``UriIndex``), one per value of a search parameter expression.
+
+    The parameters of a resource type (its own, plus the ones of
+    ``Resource`` and ``DomainResource``) are compiled once, on the first
+    resource of that type; the operands of an expression about other types
+    are dropped then. ``composite`` and ``special`` parameters, as well as
+    expressions ``fhir.resources.utils.fhirpath`` can not compile, are left
+    out and listed in ``skipped``.
+
+    ``resolve()`` of an expression (``subject.where(resolve() is Patient)``)
+    gives an empty model of the type the reference points to, so that
+    ``is``, ``ofType()`` work on references without fetching anything.
+    """
+
+    def __init__(
+        self,
+        search_parameters: typing.Iterable[FHIRAbstractModel],
+        fhir_release: str = DEFAULT_FHIR_RELEASE,
+    ):
+        """
+        search_parameters: ``SearchParameter`` resources
+        fhir_release: ``R5``, ``R4B`` or ``STU3``
+        """
+        self.fhir_release = fhir_release
+        self.skipped: typing.Dict[typing.Tuple[str, str], str] = dict()
+        self._by_base: typing.Dict[str, typing.List[typing.Tuple[str, str, str]]] = (
+            defaultdict(list)
+        )
+        for parameter in search_parameters:
+            if parameter.code is None or parameter.expression is None:
+                continue
+            for base in parameter.base or ():
+                self._by_base[base.lower()].append(
+                    (parameter.code, parameter.type, parameter.expression)
+                )
+        self._extractors: typing.Dict[str, typing.Tuple[_Extractor, ...]] = dict()
+        self._targets: typing.Dict[str, typing.Optional[FHIRAbstractModel]] = dict()
+
+    @classmethod
+    def from_definitions(
+        cls,
+        source: typing.Union[str, os.PathLike],
+        fhir_release: str = DEFAULT_FHIR_RELEASE,
+    ) -> "SearchIndexer":
+        """See ``load_search_parameters``."""
+        return cls(load_search_parameters(source, fhir_release), fhir_release)
+
+    def get_extractors(self, resource_type: str) -> typing.Tuple[_Extractor, ...]:
+        """Compiled ``(code, row factory, expression)`` of the parameters of a
+        resource type."""
+        try:
+            return self._extractors[resource_type]
+        except KeyError:
+            pass
+        klass = get_fhir_model_class(resource_type, self.fhir_release)
+        type_names = _type_names(klass)
+        extractors = []
+        for type_name in sorted(type_names):
+            for code, param_type, expression in self._by_base.get(type_name, ()):
+                factory = ROW_FACTORIES.get(param_type)
+                if factory is None:
+                    self.skipped[(resource_type, code)] = f"{param_type} parameter"
+                    continue
+                expression = _expression_for(expression, type_names)
+                if not expression:
+                    continue
+                try:
+                    compiled = compile_fhirpath(expression)
+                except ValueError as exc:
+                    self.skipped[(resource_type, code)] = str(exc)
+                    continue
+                extractors.append((code, factory, compiled))
+        self._extractors[resource_type] = tuple(extractors)
+        return self._extractors[resource_type]
+
+    def _resolve(self, reference: str) -> typing.Optional[FHIRAbstractModel]:
+        """Empty model of the type a reference points to."""
+        try:
+            return self._targets[reference]
+        except KeyError:
+            pass
+        target = None
+        _, path, _ = _parse_url(reference.partition("|")[0])
+        if path is not None:
+            try:
+                klass = get_fhir_model_class(path.split("/")[0], self.fhir_release)
+            except (ValueError, LookupError, AttributeError):
+                pass
+            else:
+                target = klass.model_construct()
+        if len(self._targets) < 10000:
+            self._targets[reference] = target
+        return target
+
+    def extract(self, resource: FHIRAbstractModel) -> typing.List[SearchIndexRow]:
+        """Index rows of a resource, in parameter order."""
+        if isinstance(resource, LazyFieldsMixin):
+            resource.materialize()
+        rows: typing.List[SearchIndexRow] = []
+        for code, factory, compiled in self.get_extractors(
+            resource.get_resource_type()
+        ):
+            try:
+                values = compiled.evaluate(resource, resolver=self._resolve)
+            except ValueError:
+                continue
+            for value in values:
+                rows.extend(factory(code, value))
+        return rows
+
+    def extract_many(
+        self, resources: typing.Iterable[FHIRAbstractModel]
+    ) -> typing.List[typing.List[SearchIndexRow]]:
+        """``extract`` of a batch of resources, rows per resource in input
+        order. Resources are grouped by type, every parameter expression is
+        evaluated over a whole group at once."""
+        resources = list(resources)
+        results: typing.List[typing.List[SearchIndexRow]] = [[] for _ in resources]
+        groups: typing.Dict[str, typing.List[int]] = defaultdict(list)
+        for position, resource in enumerate(resources):
+            if isinstance(resource, LazyFieldsMixin):
+                resource.materialize()
+            groups[resource.get_resource_type()].append(position)
+
+        for resource_type, positions in groups.items():
+            group = [resources[position] for position in positions]
+            for code, factory, compiled in self.get_extractors(resource_type):
+                try:
+                    collections = compiled.evaluate_many(group, resolver=self._resolve)
+                except ValueError:
+                    # one bad resource, the others still get their rows
+                    collections = []
+                    for resource in group:
+                        try:
+                            collections.append(
+                                compiled.evaluate(resource, resolver=self._resolve)
+                            )
+                        except ValueError:
+                            collections.append([])
+                for position, values in zip(positions, collections):
+                    rows = results[position]
+                    for value in values:
+                        rows.extend(factory(code, value))
+        return results
+
+
+__all__ = [
+    "DATE_MAX",
+    "DATE_MIN",
+    "DateIndex",
+    "NumberIndex",
+    "QuantityIndex",
+    "ReferenceIndex",
+    "SearchIndexRow",
+    "SearchIndexer",
+    "StringIndex",
+    "TokenIndex",
+    "UriIndex",
+    "load_search_parameters",
+]
@@ -0,0 +1,460 @@
+from __future__ import annotations as _annotations
+
+import bisect
+import datetime
+import threading
+import typing
+from urllib.parse import parse_qsl
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+
+from .bundle import _parse_url
+from .references import iter_reference_elements
+from .search import _date_range, _to_utc
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+_Keys = typing.FrozenSet[str]
+_Query = typing.Union[str, typing.Mapping[str, typing.Union[str, typing.List[str]]]]
+# wildcard part of an index key, ``identifier=|123``/``identifier=system|``
+_ANY = "*"
+_EMPTY: _Keys = frozenset()
+_PREFIXES = ("eq", "ne", "gt", "lt", "ge", "le", "sa", "eb")
+_LAST_KEY = "\U0010ffff"
+_SHARDS = 64
+_INDEXES = ("identifier", "reference", "tag")
+
+
+def _resource_key(resource: FHIRAbstractModel) -> str:
+    """``Type/id``"""
+    if resource.id is None:
+        raise ValueError(
+            f"{resource.get_resource_type()} without ``id`` can not be stored."
+        )
+    return f"{resource.get_resource_type()}/{resource.id}"
+
+
+def _reference_target(reference: str) -> str:
+    """``Type/id`` of a RESTful reference, any other kept as it is."""
+    _, path, _ = _parse_url(reference)
+    return path if path is not None else reference
+
+
+def _last_updated(resource: FHIRAbstractModel) -> typing.Optional[datetime.datetime]:
+    """ """
+    meta = getattr(resource, "meta", None)
+    if meta is None or meta.lastUpdated is None:
+        return None
+    return _to_utc(meta.lastUpdated)
+
+
+def _index_entries(
+    resource: FHIRAbstractModel,
+) -> typing.Dict[str, typing.Set[typing.Tuple[str, str]]]:
+    """Secondary index keys of a resource, per index."""
+    identifiers = set()
+    for identifier in getattr(resource, "identifier", None) or ():
+        if identifier.value is None:
+            continue
+        system = identifier.system or ""
+        identifiers.update(
+            ((system, identifier.value), (_ANY, identifier.value), (system, _ANY))
+        )
+    references = set()
+    resource_type = resource.get_resource_type()
+    for path, reference, _ in iter_reference_elements(resource):
+        if reference.reference is None or reference.reference.startswith("#"):
+            continue
+        target = _reference_target(reference.reference)
+        # ``Observation.subject`` -> ``subject``, contained ones left out
+        if path.startswith(resource_type + "."):
+            element = path.split(".", 2)[1].split("[", 1)[0]
+            references.add((element, target))
+        references.add((_ANY, target))
+    tags = set()
+    meta = getattr(resource, "meta", None)
+    for tag in (meta.tag if meta is not None else None) or ():
+        if tag.code is None:
+            continue
+        system = tag.system or ""
+        tags.update(((system, tag.code), (_ANY, tag.code), (system, _ANY)))
+    return {"identifier": identifiers, "reference": references, "tag": tags}
+
+
+_Shards = typing.Tuple[typing.Dict[typing.Any, typing.Any], ...]
+
+
+def _shard(key: typing.Any) -> int:
+    """ """
+    return hash(key) & (_SHARDS - 1)
+
+
+class _Snapshot:
+    """Immutable state of a ``ResourceStore``; replaced as a whole on every
+    write, never changed once published.
+
+    The tables are split in ``_SHARDS`` dictionaries, a write copies the
+    shards it changes only and shares the others with the previous snapshot.
+    """
+
+    __slots__ = ("resources", "indexes", "last_updated", "types", "size")
+
+    def __init__(
+        self,
+        resources: _Shards,
+        indexes: typing.Dict[str, _Shards],
+        last_updated: typing.List[typing.Tuple[datetime.datetime, str]],
+        types: typing.FrozenSet[str],
+        size: int,
+    ):
+        # key -> (insertion sequence, resource)
+        self.resources = resources
+        # index key -> frozenset of keys
+        self.indexes = indexes
+        # sorted ``(meta.lastUpdated, key)``
+        self.last_updated = last_updated
+        self.types = types
+        self.size = size
+
+    def get(self, key: str) -> typing.Optional[typing.Tuple[int, FHIRAbstractModel]]:
+        """ """
+        return self.resources[_shard(key)].get(key)
+
+    def ordered(
+        self, keys: typing.Optional[typing.Iterable[str]] = None
+    ) -> typing.List[FHIRAbstractModel]:
+        """Resources of the keys (all by default), in insertion order."""
+        if keys is None:
+            items = [item for shard in self.resources for item in shard.values()]
+        else:
+            items = [item for item in map(self.get, keys) if item is not None]
+        items.sort(key=_sequence)
+        return [resource for _, resource in items]
+
+
+def _sequence(item: typing.Tuple[int, FHIRAbstractModel]) -> int:
+    """ """
+    return item[0]
+
+
+class _ShardWriter:
+    """Copy-on-write changes to the shards of one table."""
+
+    __slots__ = ("shards", "copied")
+
+    def __init__(self, shards: _Shards):
+        self.shards = list(shards)
+        self.copied: typing.Set[int] = set()
+
+    def writable(self, key: typing.Any) -> typing.Dict[typing.Any, typing.Any]:
+        """ """
+        position = _shard(key)
+        if position not in self.copied:
+            self.shards[position] = dict(self.shards[position])
+            self.copied.add(position)
+        return self.shards[position]
+
+    def get(self, key: typing.Any, default: typing.Any = None) -> typing.Any:
+        """ """
+        return self.shards[_shard(key)].get(key, default)
+
+    def freeze(self) -> _Shards:
+        """ """
+        return tuple(self.shards)
+
+
+class ResourceStore:
+    """In-memory store of resources keyed by ``Type/id``, with secondary
+    indexes for identifiers, reference targets, ``meta.tag`` and
+    ``meta.lastUpdated`` and basic FHIR search over them.
+
+    >>> store = ResourceStore()
+    >>> store.put_many(practitioners)
+    >>> store.search("Practitioner", identifier="http://hl7.org/fhir/sid/us-npi|1234")
+    [Practitioner(...)]
+    >>> store.search("Observation", {"subject": "Patient/1", "_lastUpdated": "gt2024"})
+
+    Writes are copy-on-write: they are serialized, build a new snapshot of the
+    store, sharing the unchanged parts of the current one, and publish it with
+    a single assignment. Reads (``get``, ``search``) work on the snapshot
+    current when they start and never wait for a writer. Stored resources are
+    shared with the readers, do not change them once stored; ``put`` a changed
+    copy instead. A write costs about the size of the index entries it
+    touches, load many resources with one ``put_many``.
+
+    Search parameters:
+
+    - ``_id``: ``id`` (``,`` separated for any of).
+    - ``identifier``: ``system|value``, ``value``, ``|value`` (no system),
+      ``system|``.
+    - ``_tag``: like ``identifier``, on ``system|code``.
+    - ``_lastUpdated``: ``[prefix]date``, prefixes ``eq`` (default), ``ne``,
+      ``gt``, ``lt``, ``ge``, ``le``, ``sa``, ``eb``.
+    - ``subject``, ``performer`` ... any element of type ``Reference`` (or
+      ``CodeableReference``) by its element name: ``Type/id`` or an
+      absolute URL. ``_reference`` matches any reference of the resource.
+
+    Comma separated values are or-ed, repeated parameters (a list as value)
+    are and-ed. Results come in insertion order; a replaced resource keeps
+    its place.
+    """
+
+    def __init__(self, resources: typing.Iterable[FHIRAbstractModel] = ()):
+        self._lock = threading.Lock()
+        self._sequence = 0
+        empty = tuple(dict() for _ in range(_SHARDS))
+        self._snapshot = _Snapshot(
+            empty, {name: empty for name in _INDEXES}, [], frozenset(), 0
+        )
+        self.put_many(resources)
+
+    def __len__(self) -> int:
+        return self._snapshot.size
+
+    def __contains__(self, key: str) -> bool:
+        return self._snapshot.get(key) is not None
+
+    def __iter__(self) -> typing.Iterator[FHIRAbstractModel]:
+        return iter(self._snapshot.ordered())
+
+    def get(self, key: str) -> typing.Optional[FHIRAbstractModel]:
+        """Resource by ``Type/id``."""
+        item = self._snapshot.get(key)
+        return item[1] if item is not None else None
+
+    def put(self, resource: FHIRAbstractModel) -> str:
+        """Add or replace a resource, returns its key."""
+        return self.put_many([resource])[0]
+
+    def put_many(
+        self, resources: typing.Iterable[FHIRAbstractModel]
+    ) -> typing.List[str]:
+        """Add or replace resources in one write, returns their keys. Of
+        several versions of the same key the last one is kept."""
+        resources = list(resources)
+        if not resources:
+            return []
+        keys = [_resource_key(resource) for resource in resources]
+        with self._lock:
+            self._write(zip(keys, resources), ())
+        return keys
+
+    def remove(self, key: str) -> bool:
+        """Remove a resource by ``Type/id``, ``False`` when unknown."""
+        with self._lock:
+            if self._snapshot.get(key) is None:
+                return False
+            self._write((), (key,))
+        return True
+
+    def _write(
+        self,
+        puts: typing.Iterable[typing.Tuple[str, FHIRAbstractModel]],
+        removes: typing.Iterable[str],
+    ) -> None:
+        """Build and publish the next snapshot; the lock is held."""
+        # versions of the same key in one batch (a history Bundle): the last
+        # one wins, indexes are diffed against the current snapshot only once
+        latest = dict(puts)
+        current = self._snapshot
+        resources = _ShardWriter(current.resources)
+        size = current.size
+        types = set(current.types)
+        added: typing.Dict[
+            str, typing.Dict[typing.Tuple[str, str], typing.Set[str]]
+        ] = {name: dict() for name in _INDEXES}
+        removed: typing.Dict[
+            str, typing.Dict[typing.Tuple[str, str], typing.Set[str]]
+        ] = {name: dict() for name in _INDEXES}
+        dates_removed: typing.List[typing.Tuple[datetime.datetime, str]] = []
+        dates_added: typing.List[typing.Tuple[datetime.datetime, str]] = []
+
+        def unindex(key: str) -> typing.Optional[int]:
+            item = resources.get(key)
+            if item is None:
+                return None
+            sequence, old = item
+            for name, entries in _index_entries(old).items():
+                for entry in entries:
+                    removed[name].setdefault(entry, set()).add(key)
+            date = _last_updated(old)
+            if date is not None:
+                dates_removed.append((date, key))
+            return sequence
+
+        for key in removes:
+            if unindex(key) is not None:
+                del resources.writable(key)[key]
+                size -= 1
+        for key, resource in latest.items():
+            sequence = unindex(key)
+            if sequence is None:
+                sequence = self._sequence
+                self._sequence += 1
+                size += 1
+            resources.writable(key)[key] = (sequence, resource)
+            types.add(resource.get_resource_type())
+            for name, entries in _index_entries(resource).items():
+                for entry in entries:
+                    added[name].setdefault(entry, set()).add(key)
+            date = _last_updated(resource)
+            if date is not None:
+                dates_added.append((date, key))
+
+        indexes = dict()
+        for name in _INDEXES:
+            index = _ShardWriter(current.indexes[name])
+            plus, minus = added[name], removed[name]
+            for entry in set(plus) | set(minus):
+                adds = plus.get(entry, _EMPTY)
+                drops = minus.get(entry, _EMPTY)
+                if adds == drops:
+                    # a replaced resource, same index entry as before
+                    continue
+                keys = (index.get(entry, _EMPTY) - (drops - adds)) | adds
+                if keys:
+                    index.writable(entry)[entry] = frozenset(keys)
+                elif index.get(entry) is not None:
+                    del index.writable(entry)[entry]
+            indexes[name] = index.freeze()
+
+        last_updated = current.last_updated
+        if len(dates_added) + len(dates_removed) > len(last_updated) // 8:
+            drops = set(dates_removed)
+            last_updated = sorted(
+                [item for item in last_updated if item not in drops] + dates_added
+            )
+        elif dates_added or dates_removed:
+            last_updated = list(last_updated)
+            for item in dates_removed:
+                del last_updated[bisect.bisect_left(last_updated, item)]
+            for item in dates_added:
+                bisect.insort(last_updated, item)
+        self._snapshot = _Snapshot(
+            resources.freeze(), indexes, last_updated, frozenset(types), size
+        )
+
+    def search(
+        self,
+        resource_type: typing.Optional[str] = None,
+        params: typing.Optional[_Query] = None,
+        **kwargs: typing.Union[str, typing.List[str]],
+    ) -> typing.List[FHIRAbstractModel]:
+        """Resources matching every search parameter, see the class doc.
+
+        params: mapping or query string (``identifier=x|1&_lastUpdated=gt2024``)
+        """
+        snapshot = self._snapshot
+        conditions: typing.List[typing.Tuple[str, str]] = []
+        if isinstance(params, str):
+            conditions.extend(parse_qsl(params, keep_blank_values=True))
+        elif params is not None:
+            conditions.extend(_flatten(params))
+        conditions.extend(_flatten(kwargs))
+
+        candidates = [
+            _match(snapshot, resource_type, name, value.split(","))
+            for name, value in conditions
+        ]
+        if not candidates:
+            resources = snapshot.ordered()
+            if resource_type is None:
+                return resources
+            return [r for r in resources if r.get_resource_type() == resource_type]
+        candidates.sort(key=len)
+        keys = candidates[0]
+        for other in candidates[1:]:
+            if not keys:
+                break
+            keys = keys & other
+        if resource_type is not None:
+            prefix = resource_type + "/"
+            keys = [key for key in keys if key.startswith(prefix)]
+        return snapshot.ordered(keys)
+
+
+def _flatten(
+    params: typing.Mapping[str, typing.Union[str, typing.List[str]]],
+) -> typing.Iterator[typing.Tuple[str, str]]:
+    """ """
+    for name, value in params.items():
+        for item in value if isinstance(value, (list, tuple)) else (value,):
+            yield name, item
+
+
+def _system_value(value: str) -> typing.Tuple[str, str]:
+    """``system|value`` into an index key."""
+    if "|" not in value:
+        return _ANY, value
+    system, _, value = value.partition("|")
+    return system, value or _ANY
+
+
+def _match(
+    snapshot: _Snapshot,
+    resource_type: typing.Optional[str],
+    name: str,
+    values: typing.List[str],
+) -> _Keys:
+    """Keys matching any of the values of a search parameter."""
+    if name == "_lastUpdated":
+        keys: typing.Set[str] = set()
+        for value in values:
+            keys.update(_match_date(snapshot.last_updated, value))
+        return frozenset(keys)
+    if name == "_id":
+        types = [resource_type] if resource_type is not None else snapshot.types
+        return frozenset(
+            key
+            for key in (f"{t}/{value}" for t in types for value in values)
+            if snapshot.get(key) is not None
+        )
+    if name == "identifier":
+        shards = snapshot.indexes["identifier"]
+        entries = [_system_value(value) for value in values]
+    elif name == "_tag":
+        shards = snapshot.indexes["tag"]
+        entries = [_system_value(value) for value in values]
+    elif name.startswith("_") and name != "_reference":
+        raise ValueError(f"Unsupported search parameter ``{name}``")
+    else:
+        shards = snapshot.indexes["reference"]
+        element = _ANY if name == "_reference" else name
+        entries = [(element, _reference_target(value)) for value in values]
+    found = [shards[_shard(entry)].get(entry, _EMPTY) for entry in entries]
+    if len(found) == 1:
+        return found[0]
+    return frozenset().union(*found)
+
+
+def _match_date(
+    last_updated: typing.List[typing.Tuple[datetime.datetime, str]], value: str
+) -> typing.List[str]:
+    """Keys of a ``_lastUpdated`` value, through the sorted dates."""
+    prefix = value[:2] if value[:2] in _PREFIXES else "eq"
+    if value[:2] in _PREFIXES:
+        value = value[2:]
+    date_range = _date_range(value)
+    if date_range is None:
+        raise ValueError(f"Invalid _lastUpdated value ``{value}``")
+    low, high = date_range
+    # ``(date, key)`` items compare against a bare ``(date,)`` as expected
+    start = bisect.bisect_left(last_updated, (low,))
+    end = bisect.bisect_right(last_updated, (high, _LAST_KEY))
+    if prefix == "eq":
+        items = last_updated[start:end]
+    elif prefix == "ne":
+        items = last_updated[:start] + last_updated[end:]
+    elif prefix in ("gt", "sa"):
+        items = last_updated[end:]
+    elif prefix in ("lt", "eb"):
+        items = last_updated[:start]
+    elif prefix == "ge":
+        items = last_updated[start:]
+    else:
+        items = last_updated[:end]
+    return [key for _, key in items]
+
+
+__all__ = ["ResourceStore"]
@@ -0,0 +1,760 @@
+"""Local terminology: ``CodeSystem`` hierarchies indexed once, ``ValueSet``
+compose definitions expanded against them, expansions memoized.
+
+>>> expander = ValueSetExpander(code_systems, value_sets)
+>>> expander.expand("http://example.org/fhir/ValueSet/vital-signs")
+ValueSetExpansion(...)
+>>> expander.validate_code(
+...     "http://example.org/fhir/ValueSet/vital-signs", "8867-4", "http://loinc.org"
+... )
+True
+
+Works for R5, R4B and STU3 resources, the compose and ``CodeSystem`` elements
+involved are the same.
+"""
+
+from __future__ import annotations as _annotations
+
+import bisect
+import datetime
+import itertools
+import re
+import sys
+import typing
+import uuid
+from collections import OrderedDict
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+
+from ..fhirabstractmodel import get_choice_value
+from . import DEFAULT_FHIR_RELEASE, get_fhir_model_class
+from .construct import construct_trusted
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+_Member = typing.Tuple[str, str]
+# concept properties that flag a concept, ``abstract`` and ``inactive``
+_NOT_SELECTABLE = ("notSelectable", "abstract")
+_INACTIVE_STATUS = ("retired", "inactive", "deprecated")
+_PARENT_PROPERTY = "http://hl7.org/fhir/concept-properties#parent"
+_CHILD_PROPERTY = "http://hl7.org/fhir/concept-properties#child"
+_MAX_POSITION = sys.maxsize
+
+
+def _property_value(prop: FHIRAbstractModel) -> typing.Any:
+    """ """
+    value = get_choice_value(prop, "value")
+    if isinstance(value, FHIRAbstractModel):
+        # ``valueCoding``
+        return getattr(value, "code", None)
+    return value
+
+
+def _as_string(value: typing.Any) -> str:
+    """Property values compared to filter values (always strings)."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+class CodeSystemIndex:
+    """The concepts of a ``CodeSystem`` indexed once: code to concept,
+    definition order, parents, children and an interval numbering of the
+    hierarchy, so ``is_a`` (``$subsumes``) is a comparison of two numbers and
+    the descendants of a code are a slice of the numbered codes.
+
+    The hierarchy is the nesting of ``CodeSystem.concept`` together with the
+    ``parent``/``child`` concept properties
+    (``http://hl7.org/fhir/concept-properties#parent``). Codes are numbered
+    in pre-order along a spanning tree, the descendants of a code are the
+    codes numbered inside its interval; a code that has more than one parent
+    adds its interval to the ones of its other ancestors (merged, a
+    polyhierarchy costs a few intervals per code, a tree exactly one).
+    """
+
+    def __init__(self, code_system: FHIRAbstractModel):
+        self.url: typing.Optional[str] = code_system.url
+        self.version: typing.Optional[str] = code_system.version
+        self.case_sensitive = code_system.caseSensitive is not False
+        self.concepts: typing.Dict[str, FHIRAbstractModel] = dict()
+        self._order: typing.Dict[str, int] = dict()
+        self._parents: typing.Dict[str, typing.List[str]] = dict()
+        self._children: typing.Dict[str, typing.List[str]] = dict()
+        self._properties: typing.Dict[str, typing.Dict[str, typing.List[str]]] = dict()
+
+        stack = [(concept, None) for concept in reversed(code_system.concept or ())]
+        while stack:
+            concept, parent = stack.pop()
+            code = concept.code
+            if code not in self.concepts:
+                self.concepts[code] = concept
+                self._order[code] = len(self._order)
+                if concept.property:
+                    self._properties[code] = self._concept_properties(concept)
+                if concept.concept:
+                    for child in reversed(concept.concept):
+                        stack.append((child, code))
+            if parent is not None:
+                self._add_edge(parent, code)
+        parent_properties, child_properties = self._hierarchy_properties(code_system)
+        for code, properties in self._properties.items():
+            for name in parent_properties:
+                for parent in properties.get(name, ()):
+                    self._add_edge(parent, code)
+            for name in child_properties:
+                for child in properties.get(name, ()):
+                    self._add_edge(code, child)
+
+        self._folded = (
+            {code.lower(): code for code in reversed(self.concepts)}
+            if not self.case_sensitive
+            else {}
+        )
+        self._abstract = frozenset(
+            code
+            for code, properties in self._properties.items()
+            if any("true" in properties.get(name, ()) for name in _NOT_SELECTABLE)
+        )
+        self._inactive = frozenset(
+            code
+            for code, properties in self._properties.items()
+            if "true" in properties.get("inactive", ())
+            or any(
+                status in _INACTIVE_STATUS for status in properties.get("status", ())
+            )
+        )
+
+        # code -> pre-order number; codes by number; end (exclusive) of the
+        # interval of every number
+        self._position: typing.Dict[str, int] = dict()
+        self._numbered: typing.List[str] = list()
+        self._end: typing.List[int] = list()
+        # merged intervals of the codes whose descendants are not exactly
+        # their own interval (polyhierarchy only)
+        self._intervals: typing.Dict[str, typing.List[typing.Tuple[int, int]]] = dict()
+        self._number()
+
+    def _add_edge(self, parent: str, child: str) -> None:
+        """ """
+        if parent not in self.concepts or child not in self.concepts:
+            return
+        parents = self._parents.setdefault(child, [])
+        if parent in parents or parent == child:
+            return
+        parents.append(parent)
+        self._children.setdefault(parent, []).append(child)
+
+    @staticmethod
+    def _hierarchy_properties(
+        code_system: FHIRAbstractModel,
+    ) -> typing.Tuple[typing.Set[str], typing.Set[str]]:
+        """Property codes that are parent and child links."""
+        parents, children = {"parent"}, {"child"}
+        for prop in code_system.property or ():
+            if prop.uri == _PARENT_PROPERTY:
+                parents.add(prop.code)
+            elif prop.uri == _CHILD_PROPERTY:
+                children.add(prop.code)
+        return parents, children
+
+    def _number(self) -> None:
+        """Pre-order numbering along a spanning tree (depth first, children
+        in definition order), then the intervals of the polyhierarchy."""
+        position = self._position
+        numbered = self._numbered
+        end = self._end
+        children_of = self._children
+        finished: typing.List[str] = list()
+        shared = cyclic = False
+        on_stack: typing.Set[str] = set()
+        # roots first; codes only reachable through a cycle afterwards
+        roots = [code for code in self.concepts if code not in self._parents]
+        for root in itertools.chain(roots, self.concepts):
+            if root in position:
+                continue
+            position[root] = len(numbered)
+            numbered.append(root)
+            end.append(0)
+            stack = [(root, iter(children_of.get(root, ())))]
+            on_stack.add(root)
+            while stack:
+                code, children = stack[-1]
+                for child in children:
+                    if child in position:
+                        shared = True
+                        cyclic = cyclic or child in on_stack
+                        continue
+                    position[child] = len(numbered)
+                    numbered.append(child)
+                    end.append(0)
+                    stack.append((child, iter(children_of.get(child, ()))))
+                    on_stack.add(child)
+                    break
+                else:
+                    stack.pop()
+                    on_stack.discard(code)
+                    end[position[code]] = len(numbered)
+                    finished.append(code)
+        if not shared:
+            return
+
+        # children are finished before their parents, one pass is enough;
+        # on a cycle a parent may be finished first, so again until nothing
+        # changes (every code on a cycle ends up with the intervals of all)
+        while self._merge_intervals(finished) and cyclic:
+            pass
+
+    def _merge_intervals(self, finished: typing.List[str]) -> bool:
+        """One pass of the polyhierarchy intervals over the codes in finishing
+        order, ``True`` when any changed."""
+        position = self._position
+        end = self._end
+        intervals = self._intervals
+        changed = False
+        for code in finished:
+            start = position[code]
+            spans = [(start, end[start])]
+            for child in self._children.get(code, ()):
+                if child in intervals:
+                    spans.extend(intervals[child])
+                    continue
+                child_start = position[child]
+                if not start <= child_start < end[start]:
+                    spans.append((child_start, end[child_start]))
+            if len(spans) == 1:
+                continue
+            spans.sort()
+            merged = [spans[0]]
+            for low, high in spans[1:]:
+                last_low, last_high = merged[-1]
+                if low <= last_high:
+                    if high > last_high:
+                        merged[-1] = (last_low, high)
+                else:
+                    merged.append((low, high))
+            if merged != [(start, end[start])] and intervals.get(code) != merged:
+                intervals[code] = merged
+                changed = True
+        return changed
+
+    @staticmethod
+    def _concept_properties(
+        concept: FHIRAbstractModel,
+    ) -> typing.Dict[str, typing.List[str]]:
+        """ """
+        properties: typing.Dict[str, typing.List[str]] = dict()
+        for prop in concept.property or ():
+            value = _property_value(prop)
+            if prop.code is not None and value is not None:
+                properties.setdefault(prop.code, []).append(_as_string(value))
+        return properties
+
+    def __contains__(self, code: str) -> bool:
+        return self.lookup(code) is not None
+
+    def __len__(self) -> int:
+        return len(self.concepts)
+
+    def lookup(self, code: str) -> typing.Optional[str]:
+        """The code as defined, honoring ``caseSensitive``; ``None`` when
+        unknown."""
+        if code in self.concepts:
+            return code
+        if not self.case_sensitive:
+            return self._folded.get(code.lower())
+        return None
+
+    def display(self, code: str) -> typing.Optional[str]:
+        """ """
+        concept = self.concepts.get(code)
+        return concept.display if concept is not None else None
+
+    def parents(self, code: str) -> typing.List[str]:
+        """ """
+        return list(self._parents.get(code, ()))
+
+    def children(self, code: str) -> typing.List[str]:
+        """ """
+        return list(self._children.get(code, ()))
+
+    def ancestors(self, code: str) -> typing.FrozenSet[str]:
+        """Every ancestor of a code, the code itself left out."""
+        found: typing.Set[str] = set()
+        stack = list(self._parents.get(code, ()))
+        while stack:
+            parent = stack.pop()
+            if parent not in found:
+                found.add(parent)
+                stack.extend(self._parents.get(parent, ()))
+        found.discard(code)
+        return frozenset(found)
+
+    def iter_descendants(self, code: str) -> typing.Iterator[str]:
+        """Every descendant of a code, the code itself left out, in the order
+        of the numbering: slices of the numbered codes."""
+        start = self._position.get(code)
+        if start is None:
+            return
+        numbered = self._numbered
+        for low, high in self._intervals.get(code) or ((start, self._end[start]),):
+            for position in range(low, high):
+                if position != start:
+                    yield numbered[position]
+
+    def descendants(self, code: str) -> typing.FrozenSet[str]:
+        """Every descendant of a code, the code itself left out."""
+        start = self._position.get(code)
+        if start is None:
+            return frozenset()
+        intervals = self._intervals.get(code)
+        if intervals is None:
+            return frozenset(self._numbered[start + 1 : self._end[start]])
+        found = set()
+        for low, high in intervals:
+            found.update(self._numbered[low:high])
+        found.discard(code)
+        return frozenset(found)
+
+    def is_a(self, code: str, ancestor: str) -> bool:
+        """``code`` is ``ancestor`` or one of its descendants."""
+        position = self._position.get(code)
+        start = self._position.get(ancestor)
+        if position is None or start is None:
+            return False
+        if start <= position < self._end[start]:
+            return True
+        intervals = self._intervals.get(ancestor)
+        if intervals is None:
+            return False
+        # the interval that starts at or before ``position``
+        index = bisect.bisect_right(intervals, (position, _MAX_POSITION)) - 1
+        return index >= 0 and position < intervals[index][1]
+
+    def subsumes(self, code_a: str, code_b: str) -> str:
+        """``$subsumes`` outcome of two codes of this code system:
+        ``equivalent``, ``subsumes`` (``code_a`` subsumes ``code_b``),
+        ``subsumed-by`` or ``not-subsumed``."""
+        a, b = self.lookup(code_a), self.lookup(code_b)
+        for code, given in ((a, code_a), (b, code_b)):
+            if code is None:
+                raise ValueError(f"Unknown code ``{given}`` in {self.url}")
+        if a == b:
+            return "equivalent"
+        if self.is_a(b, a):  # type: ignore[arg-type]
+            return "subsumes"
+        if self.is_a(a, b):  # type: ignore[arg-type]
+            return "subsumed-by"
+        return "not-subsumed"
+
+    def properties(self, code: str) -> typing.Dict[str, typing.List[str]]:
+        """Property values of a concept, as strings."""
+        return self._properties.get(code, {})
+
+    def is_abstract(self, code: str) -> bool:
+        """``notSelectable`` concept."""
+        return code in self._abstract
+
+    def is_inactive(self, code: str) -> bool:
+        """``inactive`` concept, or of status retired, inactive, deprecated."""
+        return code in self._inactive
+
+    def ordered(self, codes: typing.Iterable[str]) -> typing.List[str]:
+        """Codes in definition order."""
+        return sorted(codes, key=self._order.__getitem__)
+
+    def filter(self, prop: str, op: str, value: str) -> typing.Set[str]:
+        """Codes matching a ``ValueSet.compose.include.filter``.
+
+        Hierarchy operators (``is-a``, ``descendent-of``, ``is-not-a``,
+        ``generalizes``, ``child-of``, ``descendent-leaf``) take the property
+        ``concept`` (or any other name, the hierarchy is the one indexed);
+        ``=``, ``in``, ``not-in``, ``regex`` and ``exists`` look at the
+        concept properties, ``code``/``concept`` and ``display`` included.
+        """
+        if op in ("is-a", "descendent-of", "is-not-a", "generalizes", "child-of"):
+            code = self.lookup(value)
+            if code is None:
+                return set() if op != "is-not-a" else set(self.concepts)
+            if op == "is-a":
+                return {code} | self.descendants(code)
+            if op == "descendent-of":
+                return set(self.descendants(code))
+            if op == "is-not-a":
+                return set(self.concepts) - self.descendants(code) - {code}
+            if op == "generalizes":
+                return {code} | self.ancestors(code)
+            return set(self._children.get(code, ()))
+        if op == "descendent-leaf":
+            code = self.lookup(value)
+            if code is None:
+                return set()
+            return {c for c in self.descendants(code) if c not in self._children}
+        if op in ("=", "in", "not-in"):
+            values = {value} if op == "=" else {v.strip() for v in value.split(",")}
+            matched = {
+                code
+                for code in self.concepts
+                if not values.isdisjoint(self._values(code, prop))
+            }
+            return matched if op != "not-in" else set(self.concepts) - matched
+        if op == "regex":
+            pattern = re.compile(value)
+            return {
+                code
+                for code in self.concepts
+                if any(pattern.fullmatch(v) for v in self._values(code, prop))
+            }
+        if op == "exists":
+            expected = value == "true"
+            return {
+                code
+                for code in self.concepts
+                if bool(self._values(code, prop)) is expected
+            }
+        raise ValueError(f"Unsupported ValueSet filter operator ``{op}``")
+
+    def _values(self, code: str, prop: str) -> typing.List[str]:
+        """ """
+        if prop in ("code", "concept"):
+            return [code]
+        if prop == "display":
+            display = self.display(code)
+            return [display] if display is not None else []
+        if prop == "parent":
+            return self._parents.get(code, [])
+        if prop == "child":
+            return self._children.get(code, [])
+        return self._properties.get(code, {}).get(prop, [])
+
+
+class ExpandedValueSet:
+    """The members of an expanded ``ValueSet``: ``(system, code)`` pairs in
+    expansion order, each membership check a set lookup."""
+
+    __slots__ = ("url", "version", "contains", "members", "_codes", "_expansion")
+
+    def __init__(
+        self,
+        url: typing.Optional[str],
+        version: typing.Optional[str],
+        contains: typing.List[typing.Dict[str, typing.Any]],
+    ):
+        self.url = url
+        self.version = version
+        # ``ValueSetExpansionContains`` items as dicts
+        self.contains = contains
+        self.members: typing.FrozenSet[_Member] = frozenset(
+            (item["system"], item["code"]) for item in contains
+        )
+        self._codes: typing.FrozenSet[str] = frozenset(
+            item["code"] for item in contains
+        )
+        self._expansion: typing.Dict[str, FHIRAbstractModel] = dict()
+
+    def __len__(self) -> int:
+        return len(self.contains)
+
+    def __contains__(self, member: typing.Union[str, _Member]) -> bool:
+        if isinstance(member, tuple):
+            return member in self.members
+        return member in self._codes
+
+    def to_expansion(
+        self, fhir_release: str = DEFAULT_FHIR_RELEASE
+    ) -> FHIRAbstractModel:
+        """``ValueSetExpansion`` model, built once per release."""
+        try:
+            return self._expansion[fhir_release]
+        except KeyError:
+            pass
+        klass = get_fhir_model_class("ValueSetExpansion", fhir_release)
+        # the items are valid by construction
+        self._expansion[fhir_release] = construct_trusted(
+            klass,
+            {
+                "identifier": f"urn:uuid:{uuid.uuid4()}",
+                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "total": len(self.contains),
+                "contains": self.contains or None,
+            },
+        )
+        return self._expansion[fhir_release]
+
+
+class ValueSetExpander:
+    """Expands ``ValueSet.compose`` (``include``/``exclude`` with ``concept``,
+    ``filter`` and ``valueSet`` imports) against indexed ``CodeSystem``
+    resources; expansions are kept in an LRU cache keyed by canonical URL and
+    version.
+
+    >>> expander = ValueSetExpander([code_system], [value_set], fhir_release="R4B")
+    >>> expander.validate_code(value_set.url, "8867-4", "http://loinc.org")
+
+    Adding code systems or value sets clears the cache. A ``ValueSet`` that
+    already has an ``expansion`` and no ``compose`` expands to it.
+    """
+
+    def __init__(
+        self,
+        code_systems: typing.Iterable[FHIRAbstractModel] = (),
+        value_sets: typing.Iterable[FHIRAbstractModel] = (),
+        *,
+        fhir_release: str = DEFAULT_FHIR_RELEASE,
+        cache_size: int = 512,
+    ):
+        """
+        fhir_release: release of the ``ValueSetExpansion`` models ``expand``
+            returns.
+        cache_size: number of expansions kept.
+        """
+        self.fhir_release = fhir_release
+        self.cache_size = cache_size
+        self._code_systems: typing.Dict[
+            str, typing.Dict[typing.Optional[str], CodeSystemIndex]
+        ] = dict()
+        self._value_sets: typing.Dict[
+            str, typing.Dict[typing.Optional[str], FHIRAbstractModel]
+        ] = dict()
+        self._cache: typing.OrderedDict[
+            typing.Tuple[str, typing.Optional[str]], ExpandedValueSet
+        ] = OrderedDict()
+        for code_system in code_systems:
+            self.add_code_system(code_system)
+        for value_set in value_sets:
+            self.add_value_set(value_set)
+
+    def add_code_system(
+        self, code_system: typing.Union[FHIRAbstractModel, CodeSystemIndex]
+    ) -> CodeSystemIndex:
+        """ """
+        if not isinstance(code_system, CodeSystemIndex):
+            code_system = CodeSystemIndex(code_system)
+        if code_system.url is None:
+            raise ValueError("CodeSystem without ``url`` can not be added.")
+        versions = self._code_systems.setdefault(code_system.url, dict())
+        versions[code_system.version] = code_system
+        self._cache.clear()
+        return code_system
+
+    def add_value_set(self, value_set: FHIRAbstractModel) -> None:
+        """ """
+        if value_set.url is None:
+            raise ValueError("ValueSet without ``url`` can not be added.")
+        versions = self._value_sets.setdefault(value_set.url, dict())
+        versions[value_set.version] = value_set
+        self._cache.clear()
+
+    def get_code_system(
+        self, url: str, version: typing.Optional[str] = None
+    ) -> typing.Optional[CodeSystemIndex]:
+        """Indexed code system by canonical URL, the given version or, without
+        version, the last one added."""
+        return self._latest(self._code_systems.get(url), version)
+
+    def get_value_set(
+        self, url: str, version: typing.Optional[str] = None
+    ) -> typing.Optional[FHIRAbstractModel]:
+        """ """
+        return self._latest(self._value_sets.get(url), version)
+
+    @staticmethod
+    def _latest(versions: typing.Optional[typing.Dict], version: typing.Optional[str]):
+        """ """
+        if not versions:
+            return None
+        if version is not None:
+            return versions.get(version)
+        return versions[next(reversed(versions))]
+
+    def expand(
+        self,
+        value_set: typing.Union[str, FHIRAbstractModel],
+        version: typing.Optional[str] = None,
+    ) -> FHIRAbstractModel:
+        """``ValueSetExpansion`` of a ``ValueSet`` resource or canonical URL
+        (``url|version`` accepted)."""
+        return self.get_expansion(value_set, version).to_expansion(self.fhir_release)
+
+    def get_expansion(
+        self,
+        value_set: typing.Union[str, FHIRAbstractModel],
+        version: typing.Optional[str] = None,
+    ) -> ExpandedValueSet:
+        """Like ``expand``, the members only, no model built."""
+        return self._expand(value_set, version, ())
+
+    def validate_code(
+        self,
+        value_set: typing.Union[str, FHIRAbstractModel],
+        code: str,
+        system: typing.Optional[str] = None,
+        version: typing.Optional[str] = None,
+    ) -> bool:
+        """``$validate-code``: the code (of the system, when given) is a member
+        of the value set. A set lookup once the expansion is cached."""
+        expansion = self._expand(value_set, version, ())
+        if system is None:
+            return code in expansion
+        return (system, code) in expansion.members
+
+    def _expand(
+        self,
+        value_set: typing.Union[str, FHIRAbstractModel],
+        version: typing.Optional[str],
+        seen: typing.Tuple[str, ...],
+    ) -> ExpandedValueSet:
+        """ """
+        if isinstance(value_set, str):
+            url, _, pinned = value_set.partition("|")
+            version = pinned or version
+            resource = self.get_value_set(url, version)
+            if resource is None:
+                raise ValueError(f"Unknown ValueSet ``{value_set}``")
+            value_set = resource
+        url = value_set.url
+        key = (url, value_set.version) if url is not None else None
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+            if url in seen:
+                raise ValueError(f"ValueSet ``{url}`` imports itself.")
+            seen = seen + (url,)
+
+        expansion = ExpandedValueSet(
+            url, value_set.version, self._compose(value_set, seen)
+        )
+        if key is not None:
+            self._cache[key] = expansion
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return expansion
+
+    def _compose(
+        self, value_set: FHIRAbstractModel, seen: typing.Tuple[str, ...]
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """``contains`` items of a value set."""
+        compose = value_set.compose
+        if compose is None:
+            if value_set.expansion is None:
+                raise ValueError(
+                    f"ValueSet ``{value_set.url}`` has neither compose nor expansion."
+                )
+            return _flatten_contains(value_set.expansion.contains or ())
+
+        items: typing.Dict[_Member, typing.Dict[str, typing.Any]] = dict()
+        for include in compose.include or ():
+            for item in self._include(include, seen):
+                items.setdefault((item["system"], item["code"]), item)
+        excluded: typing.Set[_Member] = set()
+        for exclude in compose.exclude or ():
+            excluded.update(
+                (item["system"], item["code"]) for item in self._include(exclude, seen)
+            )
+        active_only = compose.inactive is False
+        return [
+            item
+            for member, item in items.items()
+            if member not in excluded and not (active_only and item.get("inactive"))
+        ]
+
+    def _include(
+        self, include: FHIRAbstractModel, seen: typing.Tuple[str, ...]
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """Items of one ``include`` (or ``exclude``): the system part
+        intersected with every imported value set."""
+        imported = [
+            self._expand(canonical, None, seen) for canonical in include.valueSet or ()
+        ]
+        system = include.system
+        if system is None:
+            if not imported:
+                return []
+            first, rest = imported[0], imported[1:]
+            return [
+                item
+                for item in first.contains
+                if all(
+                    (item["system"], item["code"]) in other.members for other in rest
+                )
+            ]
+
+        code_system = self.get_code_system(system, include.version)
+        if include.concept:
+            items = []
+            for concept in include.concept:
+                code = concept.code
+                if code_system is not None:
+                    code = code_system.lookup(code) or code
+                items.append(
+                    self._item(
+                        system, include.version, code, concept.display, code_system
+                    )
+                )
+        else:
+            if code_system is None:
+                raise ValueError(f"Can not expand, unknown CodeSystem ``{system}``")
+            codes: typing.Optional[typing.Set[str]] = None
+            for flt in include.filter or ():
+                matched = code_system.filter(flt.property, flt.op, flt.value)
+                codes = matched if codes is None else codes & matched
+            if codes is None:
+                codes = set(code_system.concepts)
+            items = [
+                self._item(system, include.version, code, None, code_system)
+                for code in code_system.ordered(codes)
+            ]
+        for other in imported:
+            items = [
+                item
+                for item in items
+                if (item["system"], item["code"]) in other.members
+            ]
+        return items
+
+    @staticmethod
+    def _item(
+        system: str,
+        version: typing.Optional[str],
+        code: str,
+        display: typing.Optional[str],
+        code_system: typing.Optional[CodeSystemIndex],
+    ) -> typing.Dict[str, typing.Any]:
+        """A ``ValueSetExpansionContains`` as dict."""
+        item: typing.Dict[str, typing.Any] = {"system": system, "code": code}
+        if code_system is not None:
+            version = version or code_system.version
+            display = display or code_system.display(code)
+            if code_system.is_abstract(code):
+                item["abstract"] = True
+            if code_system.is_inactive(code):
+                item["inactive"] = True
+        if version is not None:
+            item["version"] = version
+        if display is not None:
+            item["display"] = display
+        return item
+
+
+def _flatten_contains(
+    contains: typing.Iterable[FHIRAbstractModel],
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Items of an existing (possibly nested) expansion."""
+    items = []
+    stack = list(reversed(list(contains)))
+    while stack:
+        item = stack.pop()
+        if item.code is not None:
+            entry = {"system": item.system, "code": item.code}
+            for name in ("version", "display", "abstract", "inactive"):
+                value = getattr(item, name)
+                if value is not None:
+                    entry[name] = value
+            items.append(entry)
+        stack.extend(reversed(item.contains or ()))
+    return items
+
+
+__all__ = ["CodeSystemIndex", "ExpandedValueSet", "ValueSetExpander"]
@@ -0,0 +1,169 @@
+from __future__ import annotations as _annotations
+
+import typing
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+
+from .bundle import BundleIndex
+from .references import iter_references
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+
+class TransactionGraph:
+    """Dependencies between the entries of a ``transaction`` (or ``batch``)
+    ``Bundle``: an entry depends on every other entry its resource refers to
+    (``urn:uuid:...`` placeholders, ``fullUrl`` or ``Type/id``, resolved by
+    ``BundleIndex``).
+
+    >>> graph = TransactionGraph(bundle)
+    >>> for position in graph.topological_order():
+    ...     entry = bundle.entry[position]
+    ...     server_ids[entry.fullUrl] = assign_id(entry)  # "Patient/123"
+    >>> graph.rewrite_references(server_ids)
+
+    Entries are referred to by their position in ``Bundle.entry``. Building
+    the graph and every operation on it are linear in the number of entries
+    plus references.
+    """
+
+    def __init__(
+        self, bundle: FHIRAbstractModel, index: typing.Optional[BundleIndex] = None
+    ):
+        """index: ``BundleIndex`` of the ``bundle``, built when not given."""
+        self.bundle = bundle
+        self.index = index if index is not None else BundleIndex(bundle)
+        entries = bundle.entry or []
+        position_of = {
+            id(entry.resource): position
+            for position, entry in enumerate(entries)
+            if entry.resource is not None
+        }
+        # position -> positions it depends on, without duplicates
+        self.dependencies: typing.List[typing.List[int]] = [[] for _ in entries]
+        # ``(Reference, position of the target entry)``, for rewriting
+        self._references: typing.List[typing.Tuple[FHIRAbstractModel, int]] = []
+
+        resolve = self.index.resolve
+        for position, entry in enumerate(entries):
+            if entry.resource is None:
+                continue
+            targets = dict()
+            for reference in iter_references(entry.resource, extensions=True):
+                # local (``#id``, ``#``) references stay as they are
+                if not reference.reference or reference.reference[0] == "#":
+                    continue
+                target = resolve(reference, entry)
+                if target is None:
+                    continue
+                target_position = position_of.get(id(target))
+                if target_position is None:
+                    continue
+                self._references.append((reference, target_position))
+                if target_position != position:
+                    targets[target_position] = None
+            self.dependencies[position] = list(targets)
+
+    def __len__(self) -> int:
+        return len(self.dependencies)
+
+    def strongly_connected_components(self) -> typing.List[typing.List[int]]:
+        """Groups of entries that depend on each other (a reference cycle),
+        single entries otherwise. Dependencies come before the entries that
+        depend on them, so this is a processing order where cycles are kept
+        together.
+
+        Tarjan's algorithm, iterative so that long reference chains don't hit
+        the recursion limit.
+        """
+        dependencies = self.dependencies
+        count = len(dependencies)
+        index_of = [-1] * count
+        low = [0] * count
+        on_stack = [False] * count
+        stack: typing.List[int] = []
+        components: typing.List[typing.List[int]] = []
+        counter = 0
+
+        for root in range(count):
+            if index_of[root] != -1:
+                continue
+            # (node, position of the next dependency to visit)
+            work = [(root, 0)]
+            while work:
+                node, next_child = work[-1]
+                if next_child == 0:
+                    index_of[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                children = dependencies[node]
+                if next_child < len(children):
+                    work[-1] = (node, next_child + 1)
+                    child = children[next_child]
+                    if index_of[child] == -1:
+                        work.append((child, 0))
+                    elif on_stack[child]:
+                        low[node] = min(low[node], index_of[child])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    component.reverse()
+                    components.append(component)
+        return components
+
+    def cycles(self) -> typing.List[typing.List[int]]:
+        """The strongly connected components with more than one entry."""
+        return [c for c in self.strongly_connected_components() if len(c) > 1]
+
+    def topological_order(self) -> typing.List[int]:
+        """Entry positions, every entry after the ones it depends on.
+
+        Raises ``ValueError`` when entries refer to each other in a cycle, see
+        ``strongly_connected_components`` for an order that allows cycles.
+        """
+        order = list()
+        for component in self.strongly_connected_components():
+            if len(component) > 1:
+                entries = self.bundle.entry
+                urls = [entries[position].fullUrl for position in component]
+                raise ValueError(
+                    f"Transaction entries refer to each other in a cycle: {urls}"
+                )
+            order.append(component[0])
+        return order
+
+    def rewrite_references(self, assigned: typing.Mapping[str, str]) -> int:
+        """Replace the references to placeholder entries, once the server has
+        assigned their ids.
+
+        assigned: ``{entry fullUrl: new reference}``, i.e.
+            ``{"urn:uuid:61eb...": "Patient/123"}``.
+
+        Returns the number of references rewritten. Each reference is matched
+        to its target entry when the graph is built, so this is a single pass
+        over the references whatever their original form was.
+        """
+        entries = self.bundle.entry
+        rewritten = 0
+        for reference, target in self._references:
+            new_reference = assigned.get(entries[target].fullUrl)
+            if new_reference is None or reference.reference == new_reference:
+                continue
+            reference.reference = new_reference
+            rewritten += 1
+        return rewritten
+
+
+__all__ = ["TransactionGraph"]
@@ -0,0 +1,850 @@
+"""FHIR XML (https://www.hl7.org/fhir/xml.html) written straight from the
+models and read straight into them.
+
+The writer walks ``get_fhir_metadata().elements`` (``elements_sequence``
+order) and emits text, no ``Node``/``lxml`` tree is built on the way; the
+reader turns lxml ``iterparse`` events into the input of a single
+``model_validate`` call.
+
+>>> data = xml_dumps(patient, pretty_print=True)
+>>> patient = xml_loads(data, Patient)
+>>> resource = xml_loads(data, fhir_release="R4B")  # class from the root tag
+>>> with open("bundle.xml", "wb") as fp:
+...     xml_dump(bundle, fp)
+
+Primitive extensions (``_birthDate``) are written as the ``id`` attribute
+and ``extension`` children of the primitive element, ``Element.id`` and
+``Extension.url`` as attributes, ``fhir_comments`` as XML comments in front
+of the element they belong to.
+"""
+
+from __future__ import annotations as _annotations
+
+import base64
+import datetime
+import decimal
+import io
+import os
+import typing
+import uuid
+from functools import lru_cache
+from importlib import import_module
+
+from fhir_core.fhirabstractmodel import FHIR_COMMENTS_FIELD_NAME, FHIRAbstractModel
+from fhir_core.utils import determine_version_prefix_from_class, get_fhir_type_name
+from lxml import etree  # type: ignore
+
+from . import DEFAULT_FHIR_RELEASE, FHIR_RELEASES
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+FHIR_NS = "http://hl7.org/fhir"
+XHTML_NS = "http://www.w3.org/1999/xhtml"
+_XHTML_PREFIX = "{" + XHTML_NS + "}"
+XML_DECLARATION = "<?xml version='1.0' encoding='utf-8'?>"
+# flush to the stream of ``xml_dump`` every that many parts
+_FLUSH_PARTS = 4096
+
+_PRIMITIVE, _XHTML, _COMPLEX, _RESOURCE = range(4)
+_ATTRIBUTE_ESCAPES = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "\n": "&#10;",
+        "\r": "&#13;",
+        "\t": "&#9;",
+    }
+)
+_XMLSource = typing.Union[str, os.PathLike, typing.IO[bytes]]
+
+
+class XMLElement(typing.NamedTuple):
+    """How one element of a model class is written and read."""
+
+    name: str
+    field_key: str
+    kind: int
+    is_list: bool
+    is_summary: bool
+    # primitives: the ``_name`` extension sibling
+    ext_key: typing.Optional[str]
+    ext_alias: typing.Optional[str]
+    # complex types: the model class of the field
+    klass: typing.Optional[typing.Type[FHIRAbstractModel]]
+
+
+class XMLPlan(typing.NamedTuple):
+    """Per class table: child elements in order, elements by XML name and
+    the elements that are XML attributes (``id`` of elements, ``url`` of
+    ``Extension``)."""
+
+    elements: typing.Tuple[XMLElement, ...]
+    by_name: typing.Mapping[str, XMLElement]
+    attributes: typing.Tuple[XMLElement, ...]
+
+
+@lru_cache(maxsize=None)
+def get_xml_plan(klass: typing.Type[FHIRAbstractModel]) -> XMLPlan:
+    """``XMLPlan`` of a model class, built from ``get_fhir_metadata`` once."""
+    prefix = determine_version_prefix_from_class(klass)
+    is_resource = klass.has_resource_base()
+    is_extension = klass.get_resource_type() == "Extension"
+    elements = list()
+    attributes = list()
+    for element in klass.get_fhir_metadata().elements:  # type: ignore[attr-defined]
+        model_klass = element.model_klass
+        if element.is_primitive:
+            type_name = get_fhir_type_name(element.field_info, prefix=prefix)
+            kind = _XHTML if type_name == "xhtml" else _PRIMITIVE
+        else:
+            kind = (
+                _RESOURCE if model_klass.get_resource_type() == "Resource" else _COMPLEX
+            )
+        xml_element = XMLElement(
+            name=element.name,
+            field_key=element.field_key,
+            kind=kind,
+            is_list=element.is_list,
+            is_summary=element.is_summary,
+            ext_key=element.ext_key if element.ext_alias else None,
+            ext_alias=element.ext_alias,
+            klass=model_klass,
+        )
+        if (element.name == "id" and not is_resource) or (
+            element.name == "url" and is_extension
+        ):
+            attributes.append(xml_element)
+        else:
+            elements.append(xml_element)
+    return XMLPlan(
+        elements=tuple(elements),
+        by_name={element.name: element for element in elements + attributes},
+        attributes=tuple(attributes),
+    )
+
+
+def _xml_value(value: typing.Any) -> str:
+    """Text of a primitive value, the way the JSON serializer writes it."""
+    if type(value) is str:
+        return value
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, decimal.Decimal):
+        # xs:decimal has no exponent
+        return format(value, "f")
+    if isinstance(value, datetime.datetime):
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, uuid.UUID):
+        return f"urn:uuid:{value}"
+    return str(value)
+
+
+class _Writer:
+    """Text parts of the document, with the state of the start tag that is
+    still open (``>`` or ``/>`` is only known with the first child)."""
+
+    __slots__ = ("parts", "pretty", "comments", "summary_only", "open", "stream")
+
+    def __init__(
+        self,
+        pretty: bool,
+        comments: bool,
+        summary_only: bool,
+        stream: typing.Optional[typing.IO[bytes]] = None,
+    ):
+        self.parts: typing.List[str] = list()
+        self.pretty = pretty
+        self.comments = comments and not summary_only
+        self.summary_only = summary_only
+        self.open = False
+        self.stream = stream
+
+    def child(self) -> None:
+        """Close the open start tag of the parent."""
+        if self.open:
+            self.parts.append(">\n" if self.pretty else ">")
+            self.open = False
+
+    def end(self, tag: str, pad: str) -> None:
+        """ """
+        if self.open:
+            self.parts.append("/>\n" if self.pretty else "/>")
+            self.open = False
+        else:
+            self.parts.append(f"{pad}</{tag}>\n" if self.pretty else f"</{tag}>")
+        if self.stream is not None and len(self.parts) > _FLUSH_PARTS:
+            self.flush()
+
+    def flush(self) -> None:
+        """ """
+        if self.stream is not None:
+            self.stream.write("".join(self.parts).encode("utf-8"))
+            self.parts.clear()
+
+    def write_comments(self, comments: typing.Any, pad: str) -> None:
+        """ """
+        if isinstance(comments, str):
+            comments = (comments,)
+        for comment in comments:
+            if "--" in comment or comment.endswith("-"):
+                raise ValueError(
+                    f"XML comments can't contain '--' or end with '-': {comment!r}"
+                )
+            self.child()
+            self.parts.append(
+                f"{pad}<!--{comment}-->\n" if self.pretty else f"<!--{comment}-->"
+            )
+
+    def write_model(
+        self,
+        model: FHIRAbstractModel,
+        tag: str,
+        depth: int,
+        root_attributes: str = "",
+    ) -> None:
+        """Element ``tag`` with the content of a model."""
+        parts = self.parts
+        values = model.__dict__
+        pad = "  " * depth if self.pretty else ""
+        if self.comments:
+            comments = values.get(FHIR_COMMENTS_FIELD_NAME)
+            if comments:
+                self.write_comments(comments, pad)
+        self.child()
+        plan = get_xml_plan(model.__class__)
+        attributes = root_attributes
+        for element in plan.attributes:
+            value = values.get(element.field_key)
+            if value is not None:
+                attributes += (
+                    f' {element.name}="'
+                    f'{_xml_value(value).translate(_ATTRIBUTE_ESCAPES)}"'
+                )
+        parts.append(f"{pad}<{tag}{attributes}")
+        self.open = True
+
+        summary_only = self.summary_only
+        depth += 1
+        for element in plan.elements:
+            if summary_only and not element.is_summary:
+                continue
+            value = values.get(element.field_key)
+            kind = element.kind
+            if kind is _PRIMITIVE:
+                ext = (
+                    values.get(element.ext_key)
+                    if element.ext_key is not None and not summary_only
+                    else None
+                )
+                if value is None and ext is None:
+                    continue
+                if element.is_list:
+                    values_ = value or ()
+                    exts = ext or ()
+                    for index in range(max(len(values_), len(exts))):
+                        self.write_primitive(
+                            element.name,
+                            values_[index] if index < len(values_) else None,
+                            exts[index] if index < len(exts) else None,
+                            depth,
+                        )
+                else:
+                    self.write_primitive(element.name, value, ext, depth)
+            elif value is None:
+                continue
+            elif kind is _COMPLEX:
+                if element.is_list:
+                    for item in value:
+                        self.write_model(item, element.name, depth)
+                else:
+                    self.write_model(value, element.name, depth)
+            elif kind is _RESOURCE:
+                for item in value if element.is_list else (value,):
+                    self.child()
+                    inner = "  " * depth if self.pretty else ""
+                    parts.append(f"{inner}<{element.name}")
+                    self.open = True
+                    self.write_model(item, item.get_resource_type(), depth + 1)
+                    self.end(element.name, inner)
+            else:
+                self.write_xhtml(value, depth)
+        self.end(tag, pad)
+
+    def write_primitive(
+        self,
+        tag: str,
+        value: typing.Any,
+        ext: typing.Optional[FHIRAbstractModel],
+        depth: int,
+    ) -> None:
+        """``<tag id=".." value="..">`` with the extensions as children."""
+        attributes = ""
+        extensions = None
+        pad = "  " * depth if self.pretty else ""
+        if ext is not None:
+            ext_values = ext.__dict__
+            if self.comments:
+                comments = ext_values.get(FHIR_COMMENTS_FIELD_NAME)
+                if comments:
+                    self.write_comments(comments, pad)
+            if ext_values.get("id") is not None:
+                attributes = f' id="{ext_values["id"].translate(_ATTRIBUTE_ESCAPES)}"'
+            extensions = ext_values.get("extension")
+        if value is None and not attributes and not extensions:
+            return
+        if value is not None:
+            attributes += f' value="{_xml_value(value).translate(_ATTRIBUTE_ESCAPES)}"'
+        self.child()
+        self.parts.append(f"{pad}<{tag}{attributes}")
+        self.open = True
+        for extension in extensions or ():
+            self.write_model(extension, "extension", depth + 1)
+        self.end(tag, pad)
+
+    def write_xhtml(self, value: str, depth: int) -> None:
+        """The narrative ``div``, in the XHTML namespace."""
+        div = etree.fromstring(value)
+        if etree.QName(div).namespace != XHTML_NS:
+            raise ValueError(f"Narrative div must be in the {XHTML_NS} namespace")
+        self.child()
+        pad = "  " * depth if self.pretty else ""
+        text = etree.tostring(div, encoding="unicode", with_tail=False)
+        self.parts.append(f"{pad}{text}\n" if self.pretty else text)
+
+
+def _write(
+    model: FHIRAbstractModel,
+    writer: _Writer,
+    xml_declaration: bool,
+) -> None:
+    """ """
+    if xml_declaration:
+        writer.parts.append(XML_DECLARATION + "\n")
+    writer.write_model(
+        model, model.get_resource_type(), 0, root_attributes=f' xmlns="{FHIR_NS}"'
+    )
+
+
+def xml_dumps(
+    model: FHIRAbstractModel,
+    *,
+    pretty_print: bool = False,
+    xml_declaration: bool = True,
+    exclude_comments: bool = False,
+    summary_only: bool = False,
+) -> bytes:
+    """FHIR XML of a resource (or of any element, with its type as tag)."""
+    writer = _Writer(pretty_print, not exclude_comments, summary_only)
+    _write(model, writer, xml_declaration)
+    return "".join(writer.parts).encode("utf-8")
+
+
+def xml_dump(
+    model: FHIRAbstractModel,
+    fp: typing.IO[bytes],
+    *,
+    pretty_print: bool = False,
+    xml_declaration: bool = True,
+    exclude_comments: bool = False,
+    summary_only: bool = False,
+) -> None:
+    """Write the FHIR XML of a model to a binary stream, chunk by chunk."""
+    writer = _Writer(pretty_print, not exclude_comments, summary_only, stream=fp)
+    _write(model, writer, xml_declaration)
+    writer.flush()
+
+
+class _Frame:
+    """One open element of the document being read."""
+
+    __slots__ = ("plan", "element", "data", "value", "ext_lists")
+
+    def __init__(
+        self,
+        plan: typing.Optional[XMLPlan],
+        element: typing.Optional[XMLElement],
+        data: typing.Optional[typing.Dict[str, typing.Any]],
+        value: typing.Any = None,
+    ):
+        self.plan = plan
+        self.element = element
+        self.data = data
+        self.value = value
+        # primitive lists with extensions, padded to their length at the end
+        self.ext_lists: typing.Optional[typing.List[XMLElement]] = None
+
+
+def _local_name(tag: str) -> str:
+    """ """
+    return tag.rpartition("}")[2]
+
+
+def _add_comments(
+    data: typing.Dict[str, typing.Any], comments: typing.List[str]
+) -> None:
+    """ """
+    data[FHIR_COMMENTS_FIELD_NAME] = comments[0] if len(comments) == 1 else comments
+
+
+class XMLModelBuilder:
+    """Input data of ``model_validate`` out of lxml ``start``/``end``/
+    ``comment`` events (``iterparse`` or ``iterwalk``): element names are
+    the JSON names already, primitive values are the strings pydantic
+    parses anyway, the primitive extensions go to ``_name`` next to them.
+
+    ``feed`` returns the data of the root element once it has ended.
+    """
+
+    def __init__(
+        self,
+        klass: typing.Optional[typing.Type[FHIRAbstractModel]] = None,
+        *,
+        fhir_release: str = DEFAULT_FHIR_RELEASE,
+    ):
+        self.klass = klass
+        if klass is not None:
+            self._package = import_module(klass.__module__.rsplit(".", 1)[0])
+        else:
+            self._package = import_module(FHIR_RELEASES[fhir_release])
+        # ``FHIRPrimitiveExtension``: the ``extension`` children of primitive
+        # elements are read like those of any element
+        self._ext_plan = get_xml_plan(self.model_class("FHIRPrimitiveExtension"))
+        self._stack: typing.List[_Frame] = list()
+        self._comments: typing.List[str] = list()
+        # depth inside of a narrative ``div``
+        self._xhtml = 0
+
+    def model_class(self, resource_type: str) -> typing.Type[FHIRAbstractModel]:
+        """ """
+        return self._package.get_fhir_model_class(resource_type)
+
+    def start_root(self, tag: str) -> typing.Dict[str, typing.Any]:
+        """ """
+        name = _local_name(tag)
+        klass = self.klass
+        if klass is None or klass.get_resource_type() in ("Resource", "DomainResource"):
+            klass = self.model_class(name)
+        elif klass.has_resource_base() and klass.get_resource_type() != name:
+            raise ValueError(
+                f"Expected a {klass.get_resource_type()} element, got ``{name}``"
+            )
+        self.klass = klass
+        data: typing.Dict[str, typing.Any] = dict()
+        if klass.has_resource_base():
+            data["resourceType"] = name
+        self._stack.append(_Frame(get_xml_plan(klass), None, data))
+        return data
+
+    def feed(self, event: str, node: typing.Any) -> typing.Optional[typing.Dict]:
+        """ """
+        if self._xhtml:
+            if event == "start":
+                self._xhtml += 1
+            elif event == "end":
+                self._xhtml -= 1
+                if self._xhtml == 0:
+                    self._end_xhtml(node)
+            return None
+        if event == "start":
+            self._start(node)
+        elif event == "end":
+            return self._end()
+        elif event == "comment":
+            self._comments.append(node.text or "")
+        return None
+
+    def _start(self, node: typing.Any) -> None:
+        """ """
+        stack = self._stack
+        tag = node.tag
+        if not stack:
+            data = self.start_root(tag)
+            self._attributes(stack[-1].plan, node, data)
+            if self._comments:
+                _add_comments(data, self._comments)
+                self._comments = list()
+            return
+        parent = stack[-1]
+        if parent.plan is None:
+            # the resource inside of ``contained``, ``entry.resource`` ...
+            name = _local_name(tag)
+            klass = self.model_class(name)
+            data = {"resourceType": name}
+            if self._comments:
+                _add_comments(data, self._comments)
+                self._comments = list()
+            parent.value = data
+            stack.append(_Frame(get_xml_plan(klass), None, data))
+            return
+        if tag.startswith(_XHTML_PREFIX):
+            self._xhtml = 1
+            return
+        name = _local_name(tag)
+        element = parent.plan.by_name.get(name)
+        if element is None:
+            raise ValueError(f"Unknown element ``{name}`` in {self._path()}")
+        kind = element.kind
+        if kind is _PRIMITIVE:
+            ext: typing.Dict[str, typing.Any] = dict()
+            attrib = node.attrib
+            if "id" in attrib:
+                ext["id"] = attrib["id"]
+            if self._comments:
+                _add_comments(ext, self._comments)
+                self._comments = list()
+            stack.append(_Frame(self._ext_plan, element, ext, attrib.get("value")))
+            return
+        if kind is _RESOURCE:
+            stack.append(_Frame(None, element, None))
+            return
+        data = dict()
+        plan = get_xml_plan(element.klass)
+        self._attributes(plan, node, data)
+        if self._comments:
+            _add_comments(data, self._comments)
+            self._comments = list()
+        stack.append(_Frame(plan, element, data))
+
+    @staticmethod
+    def _attributes(plan: XMLPlan, node: typing.Any, data: typing.Dict) -> None:
+        """``id``/``url`` attributes."""
+        for element in plan.attributes:
+            value = node.get(element.name)
+            if value is not None:
+                data[element.name] = value
+
+    def _path(self) -> str:
+        """ """
+        names = [self.klass.get_resource_type() if self.klass else ""]
+        names.extend(
+            frame.element.name for frame in self._stack if frame.element is not None
+        )
+        return ".".join(names)
+
+    def _end(self) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """ """
+        self._comments = list()
+        frame = self._stack.pop()
+        element = frame.element
+        if frame.ext_lists is not None:
+            for list_element in frame.ext_lists:
+                exts = frame.data[list_element.ext_alias]
+                exts.extend([None] * (len(frame.data[list_element.name]) - len(exts)))
+        if not self._stack:
+            return frame.data
+        parent = self._stack[-1]
+        if parent.plan is None:
+            # end of the resource inside of a wrapper, its value is set
+            return None
+        data = parent.data
+        if element.kind is _PRIMITIVE:
+            value, ext = frame.value, frame.data
+            if element.is_list:
+                values = data.setdefault(element.name, [])
+                values.append(value)
+                if ext:
+                    exts = data.get(element.ext_alias)
+                    if exts is None:
+                        exts = data[element.ext_alias] = []
+                        if parent.ext_lists is None:
+                            parent.ext_lists = []
+                        parent.ext_lists.append(element)
+                    exts.extend([None] * (len(values) - 1 - len(exts)))
+                    exts.append(ext)
+            else:
+                if value is not None:
+                    data[element.name] = value
+                if ext:
+                    data[element.ext_alias] = ext
+            return None
+        value = frame.value if element.kind is _RESOURCE else frame.data
+        if element.is_list:
+            data.setdefault(element.name, []).append(value)
+        else:
+            data[element.name] = value
+        return None
+
+    def _end_xhtml(self, node: typing.Any) -> None:
+        """ """
+        frame = self._stack[-1]
+        frame.data[_local_name(node.tag)] = etree.tostring(
+            node, encoding="unicode", with_tail=False
+        )
+        self._comments = list()
+
+    def build(self, data: typing.Dict[str, typing.Any], **kwargs) -> FHIRAbstractModel:
+        """The model out of the data of the root element."""
+        assert self.klass is not None
+        return self.klass.model_validate(data, **kwargs)
+
+
+def _source(source: _XMLSource) -> typing.Any:
+    """A path or binary stream for ``iterparse``."""
+    if isinstance(source, os.PathLike):
+        return os.fspath(source)
+    return source
+
+
+def _build(
+    builder: XMLModelBuilder, events: typing.Iterable, **kwargs
+) -> FHIRAbstractModel:
+    """ """
+    feed = builder.feed
+    for event, node in events:
+        data = feed(event, node)
+        if data is not None:
+            return builder.build(data, **kwargs)
+        if event == "end" and not builder._xhtml:
+            # the element is in the data now
+            node.clear()
+    raise ValueError("No FHIR element found in the XML document")
+
+
+def xml_loads(
+    data: typing.Union[str, bytes, bytearray],
+    klass: typing.Optional[typing.Type[FHIRAbstractModel]] = None,
+    *,
+    fhir_release: str = DEFAULT_FHIR_RELEASE,
+    xmlparser: typing.Optional[etree.XMLParser] = None,
+    strict: typing.Optional[bool] = None,
+    context: typing.Any = None,
+) -> FHIRAbstractModel:
+    """Model of a FHIR XML document; the class is taken from the root
+    element when ``klass`` is not given.
+
+    xmlparser: custom ``lxml.etree.XMLParser`` (i.e. with an XSD
+        ``schema``), the document is then parsed by it first.
+    """
+    builder = XMLModelBuilder(klass, fhir_release=fhir_release)
+    if xmlparser is None:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        events = etree.iterparse(
+            io.BytesIO(data),
+            events=("start", "end", "comment"),
+        )
+        return _build(builder, events, strict=strict, context=context)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    root = etree.fromstring(data, parser=xmlparser)
+    # comments in front of the root are not part of the walk
+    leading = list()
+    previous = root.getprevious()
+    while previous is not None:
+        if isinstance(previous, etree._Comment):
+            leading.insert(0, ("comment", previous))
+        previous = previous.getprevious()
+    events = etree.iterwalk(root, events=("start", "end", "comment"))
+    return _build(builder, leading + list(events), strict=strict, context=context)
+
+
+def xml_load(
+    source: _XMLSource,
+    klass: typing.Optional[typing.Type[FHIRAbstractModel]] = None,
+    *,
+    fhir_release: str = DEFAULT_FHIR_RELEASE,
+    schema: typing.Optional[etree.XMLSchema] = None,
+    strict: typing.Optional[bool] = None,
+    context: typing.Any = None,
+) -> FHIRAbstractModel:
+    """Model of a FHIR XML file (path or binary stream), read incrementally.
+
+    schema: ``lxml.etree.XMLSchema`` the document is validated against
+        while it's read.
+    """
+    builder = XMLModelBuilder(klass, fhir_release=fhir_release)
+    kwargs = {"schema": schema} if schema is not None else {}
+    events = etree.iterparse(
+        _source(source),
+        events=("start", "end", "comment"),
+        **kwargs,
+    )
+    return _build(builder, events, strict=strict, context=context)
+
+
+_NEW, _ENTRIES, _DONE = "new", "entries", "done"
+_ENTRY_TAG = "{" + FHIR_NS + "}entry"
+_RESOURCE_TAG = "{" + FHIR_NS + "}resource"
+
+
+class XMLBundleReader:
+    """Read an XML ``Bundle`` entry by entry: the document goes through
+    ``iterparse`` and every ``entry`` element is dropped from the tree once
+    its ``BundleEntry`` model is made, memory is bounded by the largest
+    entry, not by the size of the document.
+
+    >>> with XMLBundleReader("message.xml", fhir_release="STU3") as reader:
+    ...     reader.bundle.type
+    ...     for resource in reader.iter_resources():
+    ...         print(resource.relative_path())
+
+    Like ``fhir.resources.utils.bundle.BundleReader`` the reader is single
+    pass, ``bundle`` holds every element except ``entry``; those after the
+    entries (``signature``) are only part of it once iteration has finished.
+    """
+
+    def __init__(
+        self,
+        source: _XMLSource,
+        *,
+        fhir_release: str = DEFAULT_FHIR_RELEASE,
+        xsd_dir: typing.Optional[typing.Union[str, os.PathLike]] = None,
+        strict: typing.Optional[bool] = None,
+        context: typing.Any = None,
+    ):
+        """
+        source: path of an XML file or a binary stream.
+        fhir_release: ``R5``, ``R4B`` or ``STU3``
+        xsd_dir: directory of the FHIR schemas (``<type>.xsd``, as in
+            ``fhir-all-xsd.zip`` of the release), the resource of every entry
+            is validated against the schema of its type before it's read.
+        """
+        self._owned_stream: typing.Optional[typing.IO[bytes]] = None
+        if isinstance(source, (str, os.PathLike)):
+            source = self._owned_stream = open(source, "rb")
+        self._events = iter(etree.iterparse(source, events=("start", "end", "comment")))
+        self._builder = XMLModelBuilder(
+            import_module(FHIR_RELEASES[fhir_release]).get_fhir_model_class("Bundle")
+        )
+        self._entry_klass = self._builder.model_class("BundleEntry")
+        self._xsd_dir = xsd_dir
+        self._schemas: typing.Dict[str, etree.XMLSchema] = dict()
+        self._kwargs = {"strict": strict, "context": context}
+        self._header: typing.Dict[str, typing.Any] = dict()
+        self._state = _NEW
+        self._iterated = False
+        self._bundle: typing.Optional[FHIRAbstractModel] = None
+
+    def __enter__(self) -> "XMLBundleReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying file, when this reader has opened it."""
+        if self._owned_stream is not None:
+            self._owned_stream.close()
+            self._owned_stream = None
+
+    def _read(self) -> typing.Optional[typing.Any]:
+        """Feed the events up to the end of the next ``entry`` and return its
+        element, ``None`` at the start of the first one or the end of the
+        document."""
+        builder = self._builder
+        feed, stack = builder.feed, builder._stack
+        # without schemas the elements can go as soon as they are in the data
+        clear = self._xsd_dir is None
+        for event, node in self._events:
+            data = feed(event, node)
+            if data is not None:
+                self._header = data
+                self._state = _DONE
+                self._bundle = None
+                return None
+            if len(stack) == 1:
+                self._header = stack[0].data
+                if event == "end" and node.tag == _ENTRY_TAG:
+                    return node
+            elif (
+                event == "start"
+                and self._state == _NEW
+                and len(stack) == 2
+                and node.tag == _ENTRY_TAG
+            ):
+                self._state = _ENTRIES
+                return None
+            elif clear and event == "end" and not builder._xhtml:
+                node.clear()
+        raise ValueError("No FHIR element found in the XML document")
+
+    @property
+    def bundle(self) -> FHIRAbstractModel:
+        """``Bundle`` without entries (``type``, ``total``, ``link`` ...)."""
+        if self._state == _NEW:
+            self._read()
+        if self._bundle is None:
+            self._bundle = self._builder.build(
+                {key: value for key, value in self._header.items() if key != "entry"},
+                **self._kwargs,
+            )
+        return self._bundle
+
+    def _schema(self, resource_type: str) -> etree.XMLSchema:
+        """ """
+        schema = self._schemas.get(resource_type)
+        if schema is None:
+            path = os.path.join(
+                os.fspath(self._xsd_dir), f"{resource_type.lower()}.xsd"
+            )
+            if not os.path.exists(path):
+                raise ValueError(f"No XML schema for ``{resource_type}``: {path}")
+            schema = self._schemas[resource_type] = etree.XMLSchema(file=path)
+        return schema
+
+    def _validate_xsd(self, entry: typing.Any, index: int) -> None:
+        """The resource of ``entry`` against the schema of its type."""
+        resource = entry.find(_RESOURCE_TAG)
+        if resource is not None:
+            for node in resource.iterchildren("*"):
+                resource_type = _local_name(node.tag)
+                schema = self._schema(resource_type)
+                if not schema.validate(node):
+                    raise ValueError(
+                        f"Bundle.entry[{index}].resource ({resource_type}) "
+                        f"is not valid: {schema.error_log.last_error}"
+                    )
+
+    def __iter__(self) -> typing.Iterator[FHIRAbstractModel]:
+        """Validated ``BundleEntry`` models, one at a time."""
+        if self._iterated:
+            raise RuntimeError("XMLBundleReader can be iterated only once.")
+        self._iterated = True
+        validate = self._entry_klass.model_validate
+        index = 0
+        while self._state != _DONE:
+            node = self._read()
+            if node is None:
+                continue
+            if self._xsd_dir is not None:
+                self._validate_xsd(node, index)
+            data = self._header["entry"].pop()
+            if not self._header["entry"]:
+                del self._header["entry"]
+            # the entry and everything in front of it is read
+            node.clear()
+            parent = node.getparent()
+            while node.getprevious() is not None:
+                del parent[0]
+            index += 1
+            yield validate(data, **self._kwargs)
+
+    def iter_resources(self) -> typing.Iterator[typing.Optional[FHIRAbstractModel]]:
+        """``BundleEntry.resource`` of every entry."""
+        for entry in self:
+            yield entry.resource
+
+
+__all__ = [
+    "FHIR_NS",
+    "XHTML_NS",
+    "XMLBundleReader",
+    "XMLElement",
+    "XMLModelBuilder",
+    "XMLPlan",
+    "get_xml_plan",
+    "xml_dump",
+    "xml_dumps",
+    "xml_load",
+    "xml_loads",
+]
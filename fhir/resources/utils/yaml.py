@@ -0,0 +1,232 @@
+"""FHIR resources as YAML, through the *safe* loader and dumper of PyYAML:
+the libyaml (C) ones when PyYAML is built with it (``HAS_LIBYAML``), the
+pure Python ones otherwise. A YAML document never constructs anything but
+plain values before ``model_validate``.
+
+>>> data = yaml_dumps(patient, indent=2)
+>>> patient = yaml_loads(data, Patient)
+>>> resource = yaml_loads(data, fhir_release="R4B")  # class from resourceType
+
+Multi-document streams (``---`` separated) are read one document at a time,
+a directory of fixtures can be kept in one file:
+
+>>> with open("fixtures.yaml", "w") as fp:
+...     yaml_dump_all(resources, fp)
+>>> for resource in yaml_load_all("fixtures.yaml", fhir_release="R4B"):
+...     print(resource.relative_path())
+"""
+
+from __future__ import annotations as _annotations
+
+import datetime
+import decimal
+import os
+import typing
+from collections import OrderedDict
+from importlib import import_module
+
+import yaml
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+from pydantic_core import Url
+
+from . import DEFAULT_FHIR_RELEASE, FHIR_RELEASES
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+
+    HAS_LIBYAML = True
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+    HAS_LIBYAML = False
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+_YAMLSource = typing.Union[str, os.PathLike, typing.IO[typing.Any]]
+
+
+class FHIRYAMLLoader(_SafeLoader):
+    """Safe loader, ``CSafeLoader`` if available."""
+
+
+class FHIRYAMLDumper(_SafeDumper):
+    """Safe dumper, ``CSafeDumper`` if available, knowing the Python values
+    of ``model_dump`` (``Decimal``, ``Url``, ``time`` ...)."""
+
+    def represent_decimal(self, data: decimal.Decimal) -> yaml.Node:
+        """ """
+        return self.represent_float(float(data))
+
+    def represent_datetime(self, data: datetime.datetime) -> yaml.Node:
+        """Issue #96, ``T`` separated ISO format."""
+        return self.represent_scalar(
+            "tag:yaml.org,2002:timestamp", data.isoformat(sep="T")
+        )
+
+    def represent_time(self, data: datetime.time) -> yaml.Node:
+        """FHIR ``time``, there is no YAML type for it."""
+        return self.represent_str(data.isoformat())
+
+    def represent_url(self, data: Url) -> yaml.Node:
+        """ """
+        return self.represent_str(str(data))
+
+
+FHIRYAMLDumper.add_representer(decimal.Decimal, FHIRYAMLDumper.represent_decimal)
+FHIRYAMLDumper.add_representer(datetime.datetime, FHIRYAMLDumper.represent_datetime)
+FHIRYAMLDumper.add_representer(datetime.time, FHIRYAMLDumper.represent_time)
+FHIRYAMLDumper.add_representer(Url, FHIRYAMLDumper.represent_url)
+# no ``python/object/apply:collections.OrderedDict`` tag
+FHIRYAMLDumper.add_representer(OrderedDict, FHIRYAMLDumper.represent_dict)
+
+
+def _model_class(
+    data: typing.Any,
+    klass: typing.Optional[typing.Type[FHIRAbstractModel]],
+    fhir_release: str,
+) -> typing.Type[FHIRAbstractModel]:
+    """``klass`` or the class of ``resourceType``."""
+    if klass is not None and klass.get_resource_type() not in (
+        "Resource",
+        "DomainResource",
+    ):
+        return klass
+    if not isinstance(data, dict) or "resourceType" not in data:
+        raise ValueError("YAML document without ``resourceType``")
+    if klass is not None:
+        package = import_module(klass.__module__.rsplit(".", 1)[0])
+    else:
+        package = import_module(FHIR_RELEASES[fhir_release])
+    return package.get_fhir_model_class(data["resourceType"])
+
+
+def _dump_data(
+    model: FHIRAbstractModel,
+    exclude_comments: bool,
+    summary_only: bool,
+    pydantic_kwargs: typing.Dict[str, typing.Any],
+) -> typing.Any:
+    """ """
+    return model.model_dump(
+        exclude_comments=exclude_comments,
+        summary_only=summary_only,
+        **pydantic_kwargs,
+    )
+
+
+def yaml_dumps(
+    model: FHIRAbstractModel,
+    *,
+    indent: typing.Optional[int] = None,
+    exclude_comments: bool = False,
+    summary_only: bool = False,
+    **pydantic_kwargs,
+) -> str:
+    """YAML of ``model``, the same as ``model_dump_yaml``."""
+    data = _dump_data(model, exclude_comments, summary_only, pydantic_kwargs)
+    try:
+        return yaml.dump(
+            data,
+            Dumper=FHIRYAMLDumper,
+            indent=indent,
+            sort_keys=False,
+        )
+    except yaml.YAMLError as exc:
+        raise ValueError(f"YAMLError: {exc}")
+
+
+def yaml_dump_all(
+    models: typing.Iterable[FHIRAbstractModel],
+    fp: typing.Optional[typing.IO[str]] = None,
+    *,
+    indent: typing.Optional[int] = None,
+    exclude_comments: bool = False,
+    summary_only: bool = False,
+    **pydantic_kwargs,
+) -> typing.Optional[str]:
+    """One YAML document per model, to the text stream ``fp`` or returned
+    as ``str``. ``models`` is consumed lazily."""
+    documents = (
+        _dump_data(model, exclude_comments, summary_only, pydantic_kwargs)
+        for model in models
+    )
+    try:
+        return yaml.dump_all(
+            documents,
+            fp,
+            Dumper=FHIRYAMLDumper,
+            indent=indent,
+            sort_keys=False,
+            explicit_start=True,
+        )
+    except yaml.YAMLError as exc:
+        raise ValueError(f"YAMLError: {exc}")
+
+
+def yaml_loads(
+    data: typing.Union[str, bytes, bytearray],
+    klass: typing.Optional[typing.Type[FHIRAbstractModel]] = None,
+    *,
+    fhir_release: str = DEFAULT_FHIR_RELEASE,
+    strict: typing.Optional[bool] = None,
+    context: typing.Any = None,
+) -> FHIRAbstractModel:
+    """Model of a YAML document; the class is taken from ``resourceType``
+    when ``klass`` is not given."""
+    if isinstance(data, bytearray):
+        data = bytes(data)
+    try:
+        value = yaml.load(data, Loader=FHIRYAMLLoader)
+    except yaml.YAMLError as exc:
+        # ensure Pydantic compatible error handling
+        raise ValueError(f"YAMLError: {exc}")
+    return _model_class(value, klass, fhir_release).model_validate(
+        value, strict=strict, context=context
+    )
+
+
+def yaml_load_all(
+    source: _YAMLSource,
+    klass: typing.Optional[typing.Type[FHIRAbstractModel]] = None,
+    *,
+    fhir_release: str = DEFAULT_FHIR_RELEASE,
+    strict: typing.Optional[bool] = None,
+    context: typing.Any = None,
+) -> typing.Iterator[FHIRAbstractModel]:
+    """Model of every document of a multi-document YAML file (path or
+    stream), parsed and validated one document at a time. Empty documents
+    are skipped."""
+    owned: typing.Optional[typing.IO[bytes]] = None
+    if isinstance(source, (str, os.PathLike)):
+        source = owned = open(source, "rb")
+    try:
+        documents = yaml.load_all(source, Loader=FHIRYAMLLoader)
+        while True:
+            try:
+                value = next(documents)
+            except StopIteration:
+                return
+            except yaml.YAMLError as exc:
+                raise ValueError(f"YAMLError: {exc}")
+            if value is None:
+                continue
+            yield _model_class(value, klass, fhir_release).model_validate(
+                value, strict=strict, context=context
+            )
+    finally:
+        if owned is not None:
+            owned.close()
+
+
+__all__ = [
+    "FHIRYAMLDumper",
+    "FHIRYAMLLoader",
+    "HAS_LIBYAML",
+    "yaml_dump_all",
+    "yaml_dumps",
+    "yaml_load_all",
+    "yaml_loads",
+]
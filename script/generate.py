@@ -9,6 +9,7 @@
 import ast
 from distutils.version import StrictVersion
 import configparser
+import importlib
 import pathlib
 import requests
 import os
@@ -105,6 +106,239 @@ def update_pytest_fixture(version):
             f"pytest_plugins = ['fhir.resources.{version}.tests.fixtures']\n")
 
 
+FHIRTYPES_REGISTRY_TAIL = '''
+# ``FhirElementOrResourceBase`` looks up contained resources in
+# ``FHIR_TYPES_MAPS``, so every type is registered (keyed the same way
+# ``create_fhir_type`` does) before any of them is created.
+for _name, _model_klass in (
+    *_FHIR_ELEMENT_OR_RESOURCE_TYPES.items(),
+    *_FHIR_TYPES.items(),
+):
+    _key = determine_version_prefix(_model_klass) + _name
+    FHIR_TYPES_MAPS.setdefault(_key, _model_klass)
+del _name, _model_klass, _key
+
+
+def __getattr__(name: str) -> typing.Type[FhirBase]:
+    """Create the requested complex type on first use and keep it as a module
+    attribute, so later lookups never come back here."""
+    if name in _FHIR_TYPES:
+        klass = create_fhir_type(name, _FHIR_TYPES[name])
+    elif name in _FHIR_ELEMENT_OR_RESOURCE_TYPES:
+        klass = create_fhir_element_or_resource_type(
+            name, _FHIR_ELEMENT_OR_RESOURCE_TYPES[name]
+        )
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # another thread may have won the race; the first created type is kept.
+    return globals().setdefault(name, klass)
+
+
+def __dir__() -> typing.List[str]:
+    """ """
+    return sorted(set(globals()) | set(__all__))
+
+
+'''
+
+
+def write_fhirtypes_registry(fhirtypes_file):
+    """Rewrite a freshly generated ``fhirtypes.py`` (one ``create_fhir_type`` call
+    per complex type, all executed at import) into the static name -> model
+    registry that creates each type on first access."""
+    tree = ast.parse(fhirtypes_file.read_text(encoding='utf-8'))
+    primitives = None
+    all_names = None
+    registries = {'create_fhir_type': {}, 'create_fhir_element_or_resource_type': {}}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module == 'fhir_core.types':
+            primitives = [a.name for a in node.names if not a.name.startswith('create_')]
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
+            klass_name, model_klass = (arg.value for arg in node.value.args)
+            registries[node.value.func.id][klass_name] = model_klass
+        elif isinstance(node, ast.Assign) and node.targets[0].id == '__all__':
+            all_names = [elt.value for elt in node.value.elts]
+
+    if not registries['create_fhir_type']:
+        # already in registry form
+        return
+
+    def _table(name, items):
+        lines = [f'{name}: typing.Dict[str, str] = {{\n']
+        for klass_name, model_klass in items.items():
+            line = f'    "{klass_name}": "{model_klass}",\n'
+            if len(line) > 89:
+                line = f'    "{klass_name}": (\n        "{model_klass}"\n    ),\n'
+            lines.append(line)
+        lines.append('}\n')
+        return ''.join(lines)
+
+    source = [
+        'from __future__ import annotations as _annotations\n\nimport typing\n\n',
+        'from fhir_core.constraints import FHIR_TYPES_MAPS\n',
+        'from fhir_core.types import (\n',
+        ''.join(f'    {name},\n' for name in sorted(primitives + ['FhirBase'])),
+        '    create_fhir_element_or_resource_type,\n    create_fhir_type,\n)\n',
+        'from fhir_core.utils import determine_version_prefix\n\n',
+        '__author__ = "Md Nazrul Islam"\n__email__ = "email2nazrul@gmail.com"\n\n',
+        '# Complex types are created on first attribute access (see ``__getattr__``),\n',
+        '# so importing this module does not build all of them up front.\n',
+        _table(
+            '_FHIR_ELEMENT_OR_RESOURCE_TYPES',
+            registries['create_fhir_element_or_resource_type'],
+        ),
+        '\n',
+        _table('_FHIR_TYPES', registries['create_fhir_type']),
+        FHIRTYPES_REGISTRY_TAIL,
+        '__all__ = [  # noqa: F822\n',
+        ''.join(f'    "{name}",\n' for name in all_names),
+        ']\n',
+    ]
+    fhirtypes_file.write_text(''.join(source), encoding='utf-8')
+
+
+def use_local_abstract_model(module_file):
+    """Generated root models derive from ``fhir_core``'s ``FHIRAbstractModel``,
+    switch them over to ``fhir.resources.fhirabstractmodel`` (precomputed
+    per class metadata tables)."""
+    source = module_file.read_text(encoding='utf-8')
+    source = source.replace(
+        'from fhir_core import fhirabstractmodel\nfrom pydantic import ConfigDict\n',
+        'from pydantic import ConfigDict\n\nfrom . import fhirabstractmodel\n',
+    )
+    module_file.write_text(source, encoding='utf-8')
+
+
+REFERENCE_PATHS_HEAD = '''from __future__ import annotations as _annotations
+
+import typing
+
+__author__ = "Md Nazrul Islam"
+__email__ = "email2nazrul@gmail.com"
+
+# Generated by ``script/generate.py``, see ``write_reference_paths``.
+#
+# The fields of every model class that lead to a ``Reference``, extensions
+# left out: ``{class name: ((field name, element name, is list, kind, target
+# types), ...)}``. ``kind`` is one of ``reference``, ``codeable`` (a
+# ``CodeableReference``), ``resource`` (a resource of any type, i.e.
+# ``contained``) or ``element`` (a complex element with references inside).
+ReferenceField = typing.Tuple[
+    str, str, bool, str, typing.Optional[typing.Tuple[str, ...]]
+]
+'''
+
+
+def _reference_field_kinds(model_klass):
+    """``(field name, element name, is list, kind, targets, item class)`` of
+    every complex field of a model class, extensions left out."""
+    from fhir_core.types import FhirBase, FhirElementOrResourceBase
+    from fhir.resources.fhirabstractmodel import get_field_item_type
+
+    fields = []
+    for name, field_info in model_klass.model_fields.items():
+        arg, is_list = get_field_item_type(field_info.annotation)
+        if not (isinstance(arg, type) and issubclass(arg, FhirBase)):
+            continue
+        item_klass = arg.get_model_klass()
+        type_name = item_klass.get_resource_type()
+        if type_name in ('Extension', 'FHIRPrimitiveExtension'):
+            continue
+        targets = None
+        if issubclass(arg, FhirElementOrResourceBase):
+            kind = 'resource'
+        elif type_name in ('Reference', 'CodeableReference'):
+            kind = 'reference' if type_name == 'Reference' else 'codeable'
+            extra = field_info.json_schema_extra or {}
+            if 'enum_reference_types' in extra:
+                targets = tuple(extra['enum_reference_types'])
+        else:
+            kind = 'element'
+        fields.append(
+            (name, field_info.alias or name, is_list, kind, targets, item_klass)
+        )
+    return fields
+
+
+def write_reference_paths(package, target_file):
+    """Write the ``reference_paths.py`` module of a release package: per model
+    class the fields that lead to a ``Reference`` (``REFERENCE_FIELDS``, what
+    ``fhir.resources.utils.references.iter_references`` walks) and per
+    resource the FHIR paths of its ``Reference`` and ``CodeableReference``
+    elements with their target types (``REFERENCE_PATHS``)."""
+    if str(SRC_BASE_PATH.parents[1]) not in sys.path:
+        sys.path.insert(0, str(SRC_BASE_PATH.parents[1]))
+    fhirtypes = importlib.import_module(f'{package}.fhirtypes')
+    classes = {}
+    for dotted in fhirtypes._FHIR_TYPES.values():
+        module, klass_name = dotted.rsplit('.', 1)
+        classes[klass_name] = getattr(importlib.import_module(module), klass_name)
+    fields = {name: _reference_field_kinds(klass) for name, klass in classes.items()}
+
+    # a class leads to a reference when one of its fields does, to a fixpoint
+    relevant = set()
+    changed = True
+    while changed:
+        changed = False
+        for name, klass_fields in fields.items():
+            if name in relevant:
+                continue
+            for _, _, _, kind, _, item_klass in klass_fields:
+                if kind != 'element' or item_klass.__name__ in relevant:
+                    relevant.add(name)
+                    changed = True
+                    break
+    tables = {
+        name: [
+            field[:5]
+            for field in fields[name]
+            if field[3] != 'element' or field[5].__name__ in relevant
+        ]
+        for name in classes
+        if name in relevant
+    }
+
+    def _paths(klass_name, path, seen):
+        """Recursive elements (``Questionnaire.item.item``) are cut short."""
+        for _, element, is_list, kind, targets in tables.get(klass_name, ()):
+            element_path = f'{path}.{element}' + ('[*]' if is_list else '')
+            if kind in ('reference', 'codeable'):
+                yield element_path, targets
+            if kind in ('element', 'reference', 'codeable'):
+                child = next(
+                    f[5].__name__ for f in fields[klass_name] if f[1] == element
+                )
+                if kind == 'element' and child not in seen:
+                    yield from _paths(child, element_path, seen | {child})
+
+    def _tuple(items, indent):
+        return (
+            '(\n'
+            + ''.join(f'{indent}    {item!r},\n' for item in items)
+            + f'{indent})'
+        )
+
+    source = [REFERENCE_PATHS_HEAD, '\nREFERENCE_FIELDS: typing.Dict[str, typing.Tuple[ReferenceField, ...]] = {\n']
+    for name in sorted(tables):
+        source.append(f'    {name!r}: {_tuple(tables[name], "    ")},\n')
+    source.append('}\n\n# {resource type: ((FHIR path, target types), ...)}\n')
+    source.append(
+        'REFERENCE_PATHS: typing.Dict[\n'
+        '    str, typing.Tuple[typing.Tuple[str, typing.Optional[typing.Tuple[str, ...]]], ...]\n'
+        '] = {\n'
+    )
+    for name in sorted(classes):
+        klass = classes[name]
+        if not klass.has_resource_base() or klass.get_resource_type() != name:
+            continue
+        paths = list(_paths(name, name, {name}))
+        if paths:
+            source.append(f'    {name!r}: {_tuple(paths, "    ")},\n')
+    source.append('}\n\n__all__ = ["REFERENCE_FIELDS", "REFERENCE_PATHS"]\n')
+    target_file.write_text(''.join(source), encoding='utf-8')
+    subprocess.check_call(['black', '-q', str(target_file)])
+
+
 def main():
     """ """
     if str(PARSER_BASE_PATH) not in sys.path:
@@ -118,6 +352,9 @@ def main():
         sys.stderr.write(str(exc) + '\n')
         return 1
 
+    write_fhirtypes_registry(SRC_BASE_PATH / 'fhirtypes.py')
+    use_local_abstract_model(SRC_BASE_PATH / 'base.py')
+    write_reference_paths('fhir.resources', SRC_BASE_PATH / 'reference_paths.py')
     return 0
 
 
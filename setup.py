@@ -28,6 +28,8 @@ yaml_requirements = ["PyYAML>=5.4.1"]
 
 xml_requirements = ["lxml"]
 
+json_requirements = ["orjson"]
+
 test_requirements = [
     "coverage",
     "pytest>5.4.0;python_version>='3.6'",
@@ -110,14 +112,16 @@ setup(
     extras_require={
         "yaml": yaml_requirements,
         "xml": xml_requirements,
+        "json": json_requirements,
         "test": (
             test_requirements
             + setup_requirements
             + yaml_requirements
             + xml_requirements
+            + json_requirements
         ),
         "dev": (test_requirements + development_requirements),
-        "all": (yaml_requirements + xml_requirements),
+        "all": (yaml_requirements + xml_requirements + json_requirements),
     },
     url="https://github.com/nazrulworld/fhir.resources",
     version="8.0.0b4.dev0",
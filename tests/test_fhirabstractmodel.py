@@ -0,0 +1,132 @@
+import pytest
+from fhir_core.fhirabstractmodel import FHIRAbstractModel as CoreFHIRAbstractModel
+from pydantic import ValidationError
+
+from fhir.resources.composition import Composition
+from fhir.resources.extension import Extension
+from fhir.resources.fhirabstractmodel import (
+    FHIRAbstractModel,
+    get_choice_element,
+    get_choice_value,
+    get_field_item_type,
+    get_field_model_klass,
+)
+from fhir.resources.humanname import HumanName
+from fhir.resources.observation import Observation
+from fhir.resources.patient import Patient
+from fhir.resources.R4B.patient import Patient as R4BPatient
+from fhir.resources.reference import Reference
+from fhir.resources.STU3.fhirprimitiveextension import FHIRPrimitiveExtension
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_metadata_tables():
+    """ """
+    for klass in (Patient, R4BPatient, FHIRPrimitiveExtension):
+        assert issubclass(klass, FHIRAbstractModel)
+        assert issubclass(klass, CoreFHIRAbstractModel)
+
+    metadata = Extension.get_fhir_metadata()
+    assert metadata is Extension.get_fhir_metadata()
+    assert [e.name for e in metadata.elements] == Extension.elements_sequence()
+    ((prefix, (fields, required)),) = metadata.one_of_many.items()
+    assert prefix == "value" and not required and len(fields) == 54
+    assert isinstance(fields, tuple)
+    assert metadata.choice_index["valueQuantity"] == "value"
+    assert set(metadata.choice_index) == set(fields)
+    with pytest.raises(TypeError):
+        metadata.alias_index["url"] = "x"  # type: ignore[index]
+
+    (required,) = Observation.get_fhir_metadata().required
+    assert required == ("status", "status__ext", "status")
+    birth_date = next(e for e in Patient.get_fhir_metadata().elements if e.is_primitive)
+    assert birth_date.ext_key == f"{birth_date.field_key}__ext"
+
+
+def test_field_types():
+    """ """
+    fields = Patient.model_fields
+    assert get_field_model_klass(fields["name"].annotation) == (HumanName, True)
+    assert get_field_model_klass(fields["managingOrganization"].annotation) == (
+        Reference,
+        False,
+    )
+    assert get_field_model_klass(fields["birthDate"].annotation) == (None, False)
+    assert get_field_item_type(fields["fhir_comments"].annotation) == (None, False)
+    assert get_field_item_type(fields["active"].annotation) == (bool, False)
+    # required lists are a bare ``List[X]``
+    author = Composition.model_fields["author"].annotation
+    assert get_field_model_klass(author) == (Reference, True)
+
+    elements = {e.name: e for e in Patient.get_fhir_metadata().elements}
+    assert (elements["name"].model_klass, elements["name"].is_list) == (
+        HumanName,
+        True,
+    )
+    assert elements["contained"].model_klass.get_resource_type() == "Resource"
+    assert elements["birthDate"].model_klass is None
+    assert not elements["birthDate"].is_list
+
+
+def test_validators():
+    """ """
+    with pytest.raises(ValidationError, match="got multiple"):
+        Extension.model_validate({"url": "x", "valueString": "a", "valueCode": "b"})
+    with pytest.raises(ValidationError, match="'status' is required"):
+        Observation.model_validate({"code": {"text": "x"}})
+    # the required primitive may be replaced by an extension
+    observation = Observation.model_validate(
+        {
+            "code": {"text": "x"},
+            "_status": {"extension": [{"url": "x", "valueString": "y"}]},
+        }
+    )
+    assert observation.status is None
+
+    with pytest.raises(ValidationError) as exc_info:
+        Patient.model_validate({"identifier": [{}], "name": [None], "contact": [None]})
+    # in field order, not in input order
+    assert [error["loc"] for error in exc_info.value.errors()] == [
+        ("contact",),
+        ("name",),
+    ]
+    # nulls in primitive lists are positional placeholders
+    patient = Patient.model_validate(
+        {"name": [{"given": ["a", None], "_given": [None, {"id": "g2"}]}]}
+    )
+    assert patient.model_dump()["name"][0] == {
+        "given": ["a", None],
+        "_given": [None, {"id": "g2"}],
+    }
+
+
+def test_choice_elements():
+    """ """
+    extension = Extension.model_validate(
+        {"url": "x", "valueQuantity": {"value": 1, "unit": "mg"}}
+    )
+    name, value = get_choice_element(extension, "value")
+    assert name == "valueQuantity" and value is extension.valueQuantity
+    assert get_choice_value(extension, "value") is extension.valueQuantity
+    assert get_choice_value(Extension(url="x"), "value") is None
+    with pytest.raises(ValueError, match="no choice element"):
+        get_choice_value(extension, "effective")
+
+    # the choice made by assignment is checked as well
+    extension.valueQuantity = None
+    extension.valueString = "a"
+    assert get_choice_element(extension, "value") == ("valueString", "a")
+    with pytest.raises(ValidationError, match="got multiple"):
+        extension.valueCode = "b"
+
+    observation = Observation.model_validate(
+        {
+            "status": "final",
+            "code": {"text": "x"},
+            "effectiveDateTime": "2020-01-01",
+            "valueString": "a",
+        }
+    )
+    assert get_choice_value(observation, "value") == "a"
+    assert get_choice_element(observation, "effective")[0] == "effectiveDateTime"
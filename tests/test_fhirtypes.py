@@ -0,0 +1,63 @@
+import importlib
+
+import pytest
+from fhir_core.constraints import FHIR_TYPES_MAPS
+from fhir_core.utils import determine_version_prefix
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+@pytest.mark.parametrize(
+    "package", ["fhir.resources", "fhir.resources.R4B", "fhir.resources.STU3"]
+)
+def test_fhirtypes_are_created_on_first_access(package):
+    """ """
+    fhirtypes = importlib.import_module(f"{package}.fhirtypes")
+    prefix = determine_version_prefix(package + ".")
+    # every type is known to fhir_core before any of them is built.
+    assert FHIR_TYPES_MAPS[f"{prefix}PatientType"] == f"{package}.patient.Patient"
+    assert FHIR_TYPES_MAPS[f"{prefix}ResourceType"] == f"{package}.resource.Resource"
+
+    patient_type = fhirtypes.PatientType
+    assert "PatientType" in vars(fhirtypes)
+    assert fhirtypes.PatientType is patient_type
+    assert patient_type.get_model_klass().__module__ == f"{package}.patient"
+    assert "HumanNameType" in dir(fhirtypes)
+
+    with pytest.raises(AttributeError):
+        fhirtypes.NotExistingType
+
+
+@pytest.mark.parametrize(
+    "package", ["fhir.resources", "fhir.resources.R4B", "fhir.resources.STU3"]
+)
+def test_contained_resource_without_explicit_type_access(package):
+    """``contained`` is resolved through ``FHIR_TYPES_MAPS`` only."""
+    Patient = importlib.import_module(f"{package}.patient").Patient
+
+    patient = Patient.model_validate(
+        {
+            "resourceType": "Patient",
+            "id": "p1",
+            "contained": [{"resourceType": "Organization", "id": "o1"}],
+            "managingOrganization": {"reference": "#o1"},
+        }
+    )
+    assert patient.contained[0].__class__.__name__ == "Organization"
+    assert patient.contained[0].__module__ == f"{package}.organization"
+
+
+@pytest.mark.parametrize(
+    "package", ["fhir.resources", "fhir.resources.R4B", "fhir.resources.STU3"]
+)
+def test_get_fhir_model_class_from_registry(package):
+    """ """
+    get_fhir_model_class = importlib.import_module(package).get_fhir_model_class
+    klass = get_fhir_model_class("Bundle")
+    assert klass.__module__ == f"{package}.bundle"
+    assert klass.get_resource_type() == "Bundle"
+    assert get_fhir_model_class("Resource").__module__ == f"{package}.resource"
+
+    for name in ("String", "NotExisting"):
+        with pytest.raises(ValueError):
+            get_fhir_model_class(name)
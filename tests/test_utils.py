@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from fhir.resources.utils import parse_resource, sniff_resource_type
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_sniff_resource_type():
+    """ """
+    data = (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    assert sniff_resource_type(data) == "Patient"
+    assert sniff_resource_type(data.decode()) == "Patient"
+
+    # the contained resource comes first, it must not be picked up
+    late = json.dumps(
+        {
+            "id": "p1",
+            "contained": [{"resourceType": "Organization", "id": "o1"}],
+            "resourceType": "Patient",
+        }
+    )
+    assert sniff_resource_type(late) == "Patient"
+
+    for invalid in ('{"id": "p1"}', '{"resourceType": 1}', "[]", '{"id": '):
+        with pytest.raises(ValueError):
+            sniff_resource_type(invalid)
+
+
+@pytest.mark.parametrize("fhir_release", ["R5", "R4B", "STU3"])
+def test_parse_resource(fhir_release):
+    """ """
+    data = (STATIC_PATH / "Observation.json").read_bytes()
+    resource = parse_resource(data, fhir_release)
+    assert resource.get_resource_type() == "Observation"
+    assert resource.id == "2minute-apgar-score"
+    assert fhir_release in resource.__module__ or fhir_release == "R5"
+
+    from_dict = parse_resource(json.loads(data), fhir_release)
+    assert from_dict.model_dump() == resource.model_dump()
+
+    with pytest.raises(ValueError):
+        parse_resource(data, "R2")
+    with pytest.raises(ValueError):
+        parse_resource({"id": "no-type"}, fhir_release)
@@ -0,0 +1,288 @@
+import json
+import zipfile
+
+import pytest
+from pydantic import ValidationError
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.bindings import (
+    CodeIndex,
+    CodeValidator,
+    disable_code_validation,
+    enable_code_validation,
+    get_enum_values,
+    load_required_bindings,
+)
+from fhir.resources.utils.terminology import ValueSetExpander
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+STATUS = "http://hl7.org/fhir/ValueSet/observation-status"
+CATEGORY = "http://example.org/fhir/ValueSet/category"
+INTERPRETATION = "http://example.org/fhir/ValueSet/interpretation"
+SYSTEM = "http://example.org/fhir/CodeSystem/local"
+
+
+@pytest.fixture(autouse=True)
+def no_code_validation():
+    """ """
+    yield
+    disable_code_validation()
+
+
+def structure_definition(type_name, *elements, derivation="specialization"):
+    """ """
+    return {
+        "fullUrl": f"http://hl7.org/fhir/StructureDefinition/{type_name}",
+        "resource": {
+            "resourceType": "StructureDefinition",
+            "id": type_name,
+            "derivation": derivation,
+            "snapshot": {"element": [{"path": type_name}, *elements]},
+        },
+    }
+
+
+def element(path, types, value_set, strength="required", stu3=False):
+    """ """
+    binding = {"strength": strength}
+    if stu3:
+        binding["valueSetReference"] = {"reference": value_set}
+    else:
+        binding["valueSet"] = value_set + "|5.0.0"
+    return {
+        "path": path,
+        "type": [{"code": code} for code in types],
+        "binding": binding,
+    }
+
+
+def make_profiles(stu3=False):
+    """ """
+    return {
+        "resourceType": "Bundle",
+        "type": "collection",
+        "entry": [
+            structure_definition(
+                "Observation",
+                element("Observation.status", ["code"], STATUS, stu3=stu3),
+                element(
+                    "Observation.category", ["CodeableConcept"], CATEGORY, stu3=stu3
+                ),
+                element(
+                    "Observation.value[x]",
+                    ["Quantity", "CodeableConcept", "string"],
+                    INTERPRETATION,
+                    stu3=stu3,
+                ),
+                element(
+                    "Observation.component.interpretation",
+                    ["CodeableConcept"],
+                    INTERPRETATION,
+                    stu3=stu3,
+                ),
+                element("Observation.code", ["CodeableConcept"], CATEGORY, "example"),
+                element("Observation.unknown", ["code"], STATUS, stu3=stu3),
+            ),
+            structure_definition(
+                "Observation",
+                element("Observation.code", ["CodeableConcept"], CATEGORY),
+                derivation="constraint",
+            ),
+        ],
+    }
+
+
+def make_code_index(release):
+    """ """
+    expander = ValueSetExpander(
+        value_sets=[
+            get_fhir_model_class("ValueSet", release).model_validate(
+                {
+                    "resourceType": "ValueSet",
+                    "url": CATEGORY,
+                    "status": "active",
+                    "compose": {
+                        "include": [
+                            {"system": SYSTEM, "concept": [{"code": "vital"}]},
+                        ]
+                    },
+                }
+            )
+        ],
+        fhir_release=release,
+    )
+    codes = CodeIndex()
+    codes.add(STATUS, [(None, "final"), (None, "amended")])
+    codes.add_expansion(expander.get_expansion(CATEGORY))
+    value_set = get_fhir_model_class("ValueSet", release).model_validate(
+        {
+            "resourceType": "ValueSet",
+            "url": INTERPRETATION,
+            "status": "active",
+            "expansion": {
+                "identifier": "urn:uuid:0c9e8f1c-4c4a-4a33-9d5f-6c7c0d0b2a11",
+                "timestamp": "2024-10-10T10:00:00+02:00",
+                "contains": [
+                    {"abstract": True, "contains": [{"system": SYSTEM, "code": "H"}]},
+                    {"system": SYSTEM, "code": "L"},
+                ],
+            },
+        }
+    )
+    codes.add_expansion(value_set)
+    return codes
+
+
+def observation(**kwargs):
+    """ """
+    data = {
+        "resourceType": "Observation",
+        "status": "final",
+        "code": {"text": "anything"},
+    }
+    data.update(kwargs)
+    return data
+
+
+def coded(*codes, text=None):
+    """ """
+    data = {"coding": [{"system": SYSTEM, "code": code} for code in codes]}
+    if text is not None:
+        data["text"] = text
+    return data
+
+
+@pytest.mark.parametrize("release", ["R5", "R4B", "STU3"])
+def test_enum_values(release):
+    """ """
+    patient_klass = get_fhir_model_class("Patient", release)
+    enums = get_enum_values(patient_klass)
+    assert enums["gender"] == {"male", "female", "other", "unknown"}
+    # open lists (``... | amended +``) are not enforced
+    assert "status" not in get_enum_values(get_fhir_model_class("Observation", release))
+
+    data = {
+        "resourceType": "Patient",
+        "gender": "M",
+        "link": [{"other": {"reference": "Patient/1"}, "type": "seealso"}],
+    }
+    patient = patient_klass.model_validate(data)
+    enable_code_validation()
+    with pytest.raises(ValidationError) as exc_info:
+        patient_klass.model_validate(data)
+    error = exc_info.value.errors()[0]
+    assert error["type"] == "enum"
+    assert error["loc"] == ("gender",)
+    assert error["input"] == "M"
+    data["gender"] = "male"
+    assert patient_klass.model_validate(data).gender == "male"
+    data["link"][0]["type"] = "bad"
+    with pytest.raises(ValidationError) as exc_info:
+        patient_klass.model_validate(data)
+    assert exc_info.value.errors()[0]["loc"] == ("link", 0, "type")
+
+    # not validated models, every error at once
+    disable_code_validation()
+    with pytest.raises(ValidationError) as exc_info:
+        CodeValidator(fhir_release=release).validate(patient)
+    assert [error["loc"] for error in exc_info.value.errors()] == [("gender",)]
+    CodeValidator(fhir_release=release, enums=False).validate(patient)
+
+
+@pytest.mark.parametrize("release", ["R5", "R4B"])
+def test_enum_values_etc(release):
+    """``text/cql | text/fhirpath | application/x-fhir-query | etc.`` is open."""
+    klass = get_fhir_model_class("Expression", release)
+    assert "language" not in get_enum_values(klass)
+    enable_code_validation()
+    expression = klass.model_validate({"language": "text/cql-expression"})
+    assert expression.language == "text/cql-expression"
+
+
+@pytest.mark.parametrize("release", ["R5", "R4B", "STU3"])
+def test_required_bindings(tmp_path, release):
+    """ """
+    path = tmp_path / "profiles-resources.json"
+    path.write_text(json.dumps(make_profiles(stu3=release == "STU3")))
+    archive = tmp_path / "definitions.json.zip"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.write(path, "profiles-resources.json")
+    bindings = load_required_bindings(archive, release)
+    assert bindings == load_required_bindings(path, release)
+    assert bindings == {
+        "Observation.status": STATUS,
+        "Observation.category": CATEGORY,
+        "Observation.value[x]": INTERPRETATION,
+        "Observation.component.interpretation": INTERPRETATION,
+        "Observation.unknown": STATUS,
+    }
+
+    validator = CodeValidator(make_code_index(release), bindings, fhir_release=release)
+    assert validator.skipped == ["Observation.unknown"]
+    klass = get_fhir_model_class("Observation", release)
+    enable_code_validation(validator)
+
+    def interpretation(*codes):
+        # a single ``CodeableConcept`` in STU3
+        return coded(*codes) if release == "STU3" else [coded(*codes)]
+
+    interpretation_loc = ("component", 0, "interpretation")
+    if release != "STU3":
+        interpretation_loc += (0,)
+    valid = observation(
+        category=[coded("vital")],
+        valueCodeableConcept=coded("other", "H"),
+        component=[{"code": {"text": "x"}, "interpretation": interpretation("L")}],
+    )
+    klass.model_validate(valid)
+
+    for changes, loc in (
+        ({"status": "preliminary"}, ("status",)),
+        ({"category": [coded("vital"), coded("lab")]}, ("category", 1)),
+        ({"category": [{"text": "vital signs"}]}, ("category", 0)),
+        ({"valueCodeableConcept": coded("A")}, ("valueCodeableConcept",)),
+        (
+            {
+                "component": [
+                    {"code": {"text": "x"}, "interpretation": interpretation("A")}
+                ]
+            },
+            interpretation_loc,
+        ),
+    ):
+        with pytest.raises(ValidationError) as exc_info:
+            klass.model_validate({**valid, **changes})
+        (error,) = exc_info.value.errors()
+        assert error["type"] == "code_not_in_value_set"
+        assert error["loc"] == loc
+
+    # value sets without expansion are not checked, nor are other bindings
+    disable_code_validation()
+    unchecked = CodeValidator(CodeIndex(), bindings, fhir_release=release)
+    unchecked.validate(klass.model_validate({**valid, "status": "preliminary"}))
+    validator.validate(klass.model_validate({**valid, "code": coded("lab")}))
+
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("search-parameters.json", "{}")
+    with pytest.raises(ValueError):
+        load_required_bindings(archive, release)
+
+
+def test_code_index():
+    """ """
+    codes = CodeIndex()
+    codes.add(STATUS + "|5.0.0", [(SYSTEM, "final"), (None, "amended")])
+    assert len(codes) == 1
+    assert codes.has_value_set(STATUS)
+    assert codes.contains(STATUS, "final")
+    assert codes.contains(STATUS, "final", SYSTEM)
+    assert not codes.contains(STATUS, "final", "http://other")
+    assert codes.contains(STATUS, "amended")
+    assert not codes.contains(CATEGORY, "final")
+    with pytest.raises(ValueError):
+        codes.add_expansion(
+            get_fhir_model_class("ValueSet").model_validate(
+                {"resourceType": "ValueSet", "url": CATEGORY, "status": "active"}
+            )
+        )
@@ -0,0 +1,166 @@
+import io
+import json
+
+import pytest
+
+from fhir.resources.bundle import Bundle
+from fhir.resources.R4B.bundle import Bundle as R4BBundle
+from fhir.resources.STU3.bundle import Bundle as STU3Bundle
+from fhir.resources.utils.bundle import BundleIndex, BundleReader, iter_bundle_entries
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def make_bundle(count, resource_type="Bundle"):
+    """ """
+    observation = json.loads((STATIC_PATH / "Observation.json").read_text())
+    entries = []
+    for idx in range(count):
+        observation["id"] = f"obs-{idx}"
+        entries.append(
+            {
+                "fullUrl": f"http://example.org/Observation/obs-{idx}",
+                "resource": dict(observation),
+                "search": {"mode": "match"},
+            }
+        )
+    return {
+        "resourceType": resource_type,
+        "id": "search-1",
+        "type": "searchset",
+        "total": count,
+        "link": [{"relation": "self", "url": "http://example.org/Observation"}],
+        "entry": entries,
+        "signature": {
+            "type": [{"system": "urn:iso-astm:E1762-95:2013", "code": "1.2.840"}],
+            "when": "2024-01-01T00:00:00Z",
+            "who": {"reference": "Practitioner/1"},
+            "data": "dGVzdA==",
+        },
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1024, 64 * 1024])
+def test_bundle_reader_yields_same_entries(chunk_size):
+    """ """
+    data = json.dumps(make_bundle(25), indent=2).encode()
+    expected = Bundle.model_validate_json(data)
+
+    reader = BundleReader(io.BytesIO(data), chunk_size=chunk_size)
+    assert reader.bundle.type == "searchset"
+    assert reader.bundle.total == 25
+    assert reader.bundle.link[0].relation == "self"
+    assert reader.bundle.entry is None
+
+    entries = list(reader)
+    assert len(entries) == 25
+    assert [e.model_dump() for e in entries] == [e.model_dump() for e in expected.entry]
+    # members after ``entry`` are known once iteration is done
+    assert reader.bundle.signature.who.reference == "Practitioner/1"
+
+
+def test_bundle_reader_from_file_and_text_stream(tmp_path):
+    """ """
+    path = tmp_path / "bundle.json"
+    path.write_text(json.dumps(make_bundle(3)))
+
+    resources = [e.resource.id for e in iter_bundle_entries(path)]
+    assert resources == ["obs-0", "obs-1", "obs-2"]
+
+    with open(path, "r") as fp:
+        reader = BundleReader(fp, fhir_release="R4B", chunk_size=50)
+        resources = list(reader.iter_resources())
+    assert resources[0].__module__ == "fhir.resources.R4B.observation"
+    assert [r.id for r in resources] == ["obs-0", "obs-1", "obs-2"]
+
+
+def test_bundle_reader_without_entries():
+    """ """
+    data = make_bundle(0)
+    del data["entry"]
+    reader = BundleReader(io.StringIO(json.dumps(data)))
+    assert list(reader) == []
+    assert reader.bundle.total == 0
+
+
+def test_bundle_reader_errors():
+    """ """
+    reader = BundleReader(io.BytesIO(json.dumps(make_bundle(1, "Patient")).encode()))
+    with pytest.raises(ValueError):
+        list(reader)
+
+    truncated = json.dumps(make_bundle(2)).encode()[:-300]
+    with pytest.raises(ValueError):
+        list(BundleReader(io.BytesIO(truncated)))
+
+
+def make_transaction():
+    """ """
+    return {
+        "resourceType": "Bundle",
+        "type": "transaction",
+        "entry": [
+            {
+                "fullUrl": "urn:uuid:61ebe359-bfdc-4613-8bf2-c5e300945f0a",
+                "resource": {
+                    "resourceType": "Patient",
+                    "contained": [{"resourceType": "Organization", "id": "org"}],
+                    "managingOrganization": {"reference": "#org"},
+                },
+                "request": {"method": "POST", "url": "Patient"},
+            },
+            {
+                "fullUrl": "http://example.org/fhir/Practitioner/1",
+                "resource": {
+                    "resourceType": "Practitioner",
+                    "id": "1",
+                    "meta": {"versionId": "2"},
+                },
+                "request": {"method": "PUT", "url": "Practitioner/1"},
+            },
+            {
+                "fullUrl": "http://other.org/fhir/Practitioner/1",
+                "resource": {"resourceType": "Practitioner", "id": "1"},
+                "request": {"method": "PUT", "url": "Practitioner/1"},
+            },
+            {
+                "fullUrl": "http://example.org/fhir/Organization/o1",
+                "resource": {"resourceType": "Organization", "id": "o1"},
+                "request": {"method": "PUT", "url": "Organization/o1"},
+            },
+        ],
+    }
+
+
+@pytest.mark.parametrize("bundle_klass", [Bundle, R4BBundle, STU3Bundle])
+def test_bundle_index(bundle_klass):
+    """ """
+    bundle = bundle_klass.model_validate(make_transaction())
+    patient, practitioner, other, organization = (e.resource for e in bundle.entry)
+    index = BundleIndex(bundle)
+
+    resolve = index.resolve
+    assert resolve("urn:uuid:61ebe359-bfdc-4613-8bf2-c5e300945f0a") is patient
+    assert resolve("http://example.org/fhir/Practitioner/1") is practitioner
+    assert resolve("http://example.org/fhir/Practitioner/1/_history/2") is practitioner
+    assert resolve("http://example.org/fhir/Practitioner/1/_history/1") is None
+    assert resolve("http://example.org/fhir/Patient/1") is None
+    # relative: against the base of the referring entry, else when unique
+    assert resolve("Practitioner/1", bundle.entry[3]) is practitioner
+    assert resolve("Practitioner/1", bundle.entry[2]) is other
+    assert resolve("Practitioner/1") is None
+    assert resolve("Practitioner/1/_history/2") is practitioner
+    assert resolve("Organization/o1", bundle.entry[0]) is organization
+    # local
+    assert resolve(patient.managingOrganization, patient) is patient.contained[0]
+    assert resolve("#org", bundle.entry[0]) is patient.contained[0]
+    assert resolve("#", patient.contained[0]) is patient
+    assert resolve("#org") is None
+    assert index.resolve_many(["Organization/o1", "#org", None], patient) == [
+        organization,
+        patient.contained[0],
+        None,
+    ]
+    assert "Organization/o1" in index and "Organization/o2" not in index
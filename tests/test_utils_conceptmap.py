@@ -0,0 +1,302 @@
+import pytest
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.bindings import CodeIndex
+from fhir.resources.utils.conceptmap import NO_MATCH, ConceptMapTranslator
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+LAB = "http://example.org/fhir/CodeSystem/lab"
+LOINC = "http://loinc.org"
+SPECIMEN = "http://example.org/fhir/CodeSystem/specimen"
+MAP = "http://example.org/fhir/ConceptMap/lab-to-loinc"
+FALLBACK = "http://example.org/fhir/ConceptMap/lab-fallback"
+
+# R5 relationship, R4B/STU3 equivalence
+EQUIVALENT = {"R5": "equivalent", "R4B": "equivalent", "STU3": "equivalent"}
+NARROWER = {
+    "R5": "source-is-narrower-than-target",
+    "R4B": "wider",
+    "STU3": "wider",
+}
+UNRELATED = {"R5": "not-related-to", "R4B": "disjoint", "STU3": "disjoint"}
+
+
+def target(release, code, relationship, depends_on=None, **kwargs):
+    """ """
+    key = "relationship" if release == "R5" else "equivalence"
+    data = {"code": code, "display": code.upper(), key: relationship[release]}
+    if depends_on is not None:
+        attribute, system, code = depends_on
+        if release == "R5":
+            item = {"attribute": attribute}
+            if system:
+                item["valueCoding"] = {"system": system, "code": code}
+            else:
+                item["valueCode"] = code
+        else:
+            item = (
+                {"property": attribute, "system": system}
+                if system
+                else {"property": attribute}
+            )
+            item["value" if release == "R4B" else "code"] = code
+        data["dependsOn"] = [item]
+    data.update(kwargs)
+    return data
+
+
+def make_concept_map(release):
+    """ """
+    source, version = LAB, "2"
+    group = {"target": LOINC}
+    if release == "R5":
+        group["source"] = f"{source}|{version}"
+    else:
+        group["source"] = source
+        group["sourceVersion"] = version
+    group["element"] = [
+        {"code": "GLU", "target": [target(release, "2345-7", EQUIVALENT)]},
+        {
+            "code": "NA",
+            "target": [
+                target(release, "2951-2", NARROWER, ("specimen", SPECIMEN, "serum")),
+                target(release, "2955-3", NARROWER, ("specimen", None, "urine")),
+            ],
+        },
+        {"code": "K", "target": [target(release, "none", UNRELATED)]},
+    ]
+    if release == "R5":
+        group["element"].append({"code": "CL", "noMap": True})
+        group["unmapped"] = {"mode": "other-map", "otherMap": f"{FALLBACK}|1"}
+    else:
+        group["unmapped"] = {"mode": "other-map", "url": FALLBACK}
+    fallback = {
+        "source": LAB,
+        "target": LOINC,
+        "element": [{"code": "HB", "target": [target(release, "718-7", EQUIVALENT)]}],
+        "unmapped": {"mode": "fixed", "code": "unknown", "display": "Unknown"},
+    }
+    klass = get_fhir_model_class("ConceptMap", release)
+    return [
+        klass.model_validate(
+            {
+                "resourceType": "ConceptMap",
+                "url": MAP,
+                "status": "active",
+                "group": [group],
+            }
+        ),
+        klass.model_validate(
+            {
+                "resourceType": "ConceptMap",
+                "url": FALLBACK,
+                "status": "active",
+                "group": [
+                    fallback,
+                    {
+                        "source": SPECIMEN,
+                        "target": SPECIMEN,
+                        "element": [
+                            {
+                                "code": "plasma",
+                                "target": [target(release, "serum", EQUIVALENT)],
+                            }
+                        ],
+                        "unmapped": {
+                            "mode": "use-source-code" if release == "R5" else "provided"
+                        },
+                    },
+                ],
+            }
+        ),
+    ]
+
+
+@pytest.mark.parametrize("release", ["R5", "R4B", "STU3"])
+def test_translate(release):
+    """ """
+    translator = ConceptMapTranslator(make_concept_map(release))
+    assert len(translator) == (6 if release == "R5" else 5)
+
+    glucose, unknown = translator.translate("GLU", LAB)
+    assert (glucose.system, glucose.code, glucose.display) == (
+        LOINC,
+        "2345-7",
+        "2345-7",
+    )
+    assert glucose.relationship == "equivalent"
+    assert glucose.source == MAP
+    # the fallback map has no element for the code, its ``unmapped`` applies
+    assert (unknown.code, unknown.source) == ("unknown", FALLBACK)
+    assert translator.translate("GLU", LAB, url=MAP) == [glucose]
+    assert translator.translate("GLU", LAB, version="2", url=MAP) == [glucose]
+    assert translator.translate("GLU", LAB, target_system=LOINC) == [glucose, unknown]
+    assert translator.translate("GLU", LAB, target_system=SPECIMEN) == []
+    assert translator.translate("GLU", "http://other") == []
+
+    # dependsOn: with a system, only (system, code) matches
+    assert translator.translate("NA", LAB, url=MAP) == []
+    assert [
+        t.code
+        for t in translator.translate(
+            "NA", LAB, url=MAP, dependencies={"specimen": "serum"}
+        )
+    ] == []
+    assert [
+        t.code
+        for t in translator.translate(
+            "NA", LAB, url=MAP, dependencies={"specimen": (SPECIMEN, "serum")}
+        )
+    ] == ["2951-2"]
+    coding = get_fhir_model_class("Coding", release)(system=SPECIMEN, code="urine")
+    assert [
+        t.code
+        for t in translator.translate(
+            "NA", LAB, url=MAP, dependencies={"specimen": [coding]}
+        )
+    ] == ["2955-3"]
+
+    (unrelated,) = translator.translate("K", LAB, url=MAP)
+    assert unrelated.relationship in NO_MATCH
+
+    # unmapped: other-map, then that map's own unmapped
+    (hemoglobin,) = translator.translate("HB", LAB)
+    assert (hemoglobin.code, hemoglobin.source) == ("718-7", FALLBACK)
+    (fixed,) = translator.translate("XYZ", LAB)
+    assert fixed == unknown
+    assert (fixed.code, fixed.display) == ("unknown", "Unknown")
+    assert translator.translate("XYZ", LAB, url=MAP) == [fixed]
+    (provided,) = translator.translate("serum", SPECIMEN)
+    assert (provided.system, provided.code) == (SPECIMEN, "serum")
+    assert [t.code for t in translator.translate("plasma", SPECIMEN)] == ["serum"]
+    if release == "R5":
+        assert translator.translate("CL", LAB, url=MAP) == []
+        assert translator.translate("CL", LAB) == [fixed]
+
+    with pytest.raises(ValueError):
+        translator.translate("GLU", LAB, url="http://example.org/unknown")
+
+
+@pytest.mark.parametrize("release", ["R5", "R4B", "STU3"])
+def test_translate_many(release):
+    """ """
+    translator = ConceptMapTranslator(make_concept_map(release))
+    coding = get_fhir_model_class("Coding", release)
+    batch = [
+        coding(system=LAB, code="GLU"),
+        coding(system=LAB, code="GLU", version="1"),
+        (LAB, "HB"),
+        coding(code="GLU"),
+        coding(system=LAB, code="GLU"),
+    ]
+    results = translator.translate_many(batch)
+    assert [[t.code for t in result] for result in results] == [
+        ["2345-7", "unknown"],
+        # another version of the source system, the fallback map has none
+        ["unknown"],
+        ["718-7"],
+        [],
+        ["2345-7", "unknown"],
+    ]
+    assert results[0] is results[4]
+    assert translator.translate_many(
+        [(LAB, "NA")], url=MAP, dependencies={"specimen": "urine"}
+    )
+    assert translator.translate_many([(LAB, "XYZ")], url=MAP) == [
+        translator.translate("XYZ", LAB)
+    ]
+
+
+def test_depends_on_value_set():
+    """ """
+    concept_map = get_fhir_model_class("ConceptMap").model_validate(
+        {
+            "resourceType": "ConceptMap",
+            "url": MAP,
+            "status": "active",
+            "group": [
+                {
+                    "source": LAB,
+                    "target": LOINC,
+                    "element": [
+                        {
+                            "code": "NA",
+                            "target": [
+                                {
+                                    "code": "2951-2",
+                                    "relationship": "equivalent",
+                                    "dependsOn": [
+                                        {
+                                            "attribute": "specimen",
+                                            "valueSet": "http://example.org/blood",
+                                        }
+                                    ],
+                                    "product": [
+                                        {"attribute": "unit", "valueCode": "mmol/L"}
+                                    ],
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+    )
+    dependencies = {"specimen": (SPECIMEN, "serum")}
+    translator = ConceptMapTranslator([concept_map])
+    assert translator.translate("NA", LAB, dependencies=dependencies) == []
+    codes = CodeIndex()
+    codes.add("http://example.org/blood", [(SPECIMEN, "serum")])
+    translator = ConceptMapTranslator([concept_map], code_index=codes)
+    (sodium,) = translator.translate("NA", LAB, dependencies=dependencies)
+    assert sodium.product == (("unit", "mmol/L"),)
+
+
+def test_unmapped_per_group():
+    """``unmapped`` of a group applies to the codes that group has no
+    element for, whatever the other groups map."""
+    other = "http://example.org/fhir/CodeSystem/other"
+    concept_map = get_fhir_model_class("ConceptMap").model_validate(
+        {
+            "resourceType": "ConceptMap",
+            "url": MAP,
+            "status": "active",
+            "group": [
+                {
+                    "source": LAB,
+                    "target": LOINC,
+                    "element": [
+                        {
+                            "code": "A",
+                            "target": [{"code": "1", "relationship": "equivalent"}],
+                        }
+                    ],
+                },
+                {
+                    "source": LAB,
+                    "target": other,
+                    "element": [
+                        {
+                            "code": "B",
+                            "target": [{"code": "2", "relationship": "equivalent"}],
+                        }
+                    ],
+                    "unmapped": {
+                        "mode": "fixed",
+                        "code": "unk",
+                        "relationship": "related-to",
+                    },
+                },
+            ],
+        }
+    )
+    translator = ConceptMapTranslator([concept_map])
+    assert [(t.system, t.code) for t in translator.translate("A", LAB)] == [
+        (LOINC, "1"),
+        (other, "unk"),
+    ]
+    assert [t.code for t in translator.translate("A", LAB, target_system=other)] == [
+        "unk"
+    ]
+    assert [t.code for t in translator.translate("B", LAB)] == ["2"]
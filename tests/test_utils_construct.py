@@ -0,0 +1,86 @@
+import datetime
+import decimal
+import json
+
+import pytest
+
+from fhir.resources.attachment import Attachment
+from fhir.resources.humanname import HumanName
+from fhir.resources.organization import Organization
+from fhir.resources.patient import Patient
+from fhir.resources.R4B.observation import Observation as R4BObservation
+from fhir.resources.utils import parse_resource
+from fhir.resources.utils.construct import construct_trusted
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_construct_trusted_nested_types():
+    """ """
+    data = {
+        "resourceType": "Patient",
+        "id": "p1",
+        "birthDate": "1973-06-12",
+        "deceasedDateTime": "2015-02-07T13:28:17.239+02:00",
+        "name": [
+            {"family": "Doe", "given": ["John", None], "_given": [None, {"id": "g2"}]}
+        ],
+        "contained": [{"resourceType": "Organization", "id": "o1", "name": "Acme"}],
+        "_gender": {"extension": [{"url": "http://example.org", "valueDecimal": 1.0}]},
+    }
+    patient = construct_trusted(Patient, data)
+
+    assert isinstance(patient.name[0], HumanName)
+    assert isinstance(patient.contained[0], Organization)
+    assert patient.birthDate == datetime.date(1973, 6, 12)
+    assert patient.deceasedDateTime.tzinfo is not None
+    assert patient.gender__ext.extension[0].valueDecimal == decimal.Decimal("1.0")
+    assert patient.model_fields_set == {
+        "id",
+        "birthDate",
+        "deceasedDateTime",
+        "name",
+        "contained",
+        "gender__ext",
+    }
+
+    validated = Patient.model_validate(data)
+    assert patient == validated
+    assert patient.model_dump_json() == validated.model_dump_json()
+
+    # nothing is checked, but unknown fields are refused
+    assert construct_trusted(Patient, {"gender": "wrong"}).gender == "wrong"
+    with pytest.raises(ValueError):
+        construct_trusted(Patient, {"unknown": 1})
+    with pytest.raises(ValueError):
+        construct_trusted(Patient, {"resourceType": "Organization"})
+
+
+def test_construct_trusted_integer64():
+    """``integer64`` is a JSON string, built into an ``int``."""
+    data = {"contentType": "text/plain", "size": "9007199254740993"}
+    attachment = construct_trusted(Attachment, data)
+    validated = Attachment.model_validate(data)
+    assert attachment.size == validated.size == 9007199254740993
+    assert attachment.model_dump_json() == validated.model_dump_json()
+    assert construct_trusted(Attachment, {"size": 5}).size == 5
+
+
+@pytest.mark.parametrize("fhir_release", ["R5", "R4B"])
+def test_construct_trusted_identical_output(fhir_release):
+    """ """
+    for name in ("Patient-with-ext.json", "Observation.json"):
+        data = json.loads((STATIC_PATH / name).read_text())
+        validated = parse_resource(data, fhir_release)
+        trusted = parse_resource(json.dumps(data), fhir_release, trusted=True)
+        assert type(trusted) is type(validated)
+        assert trusted == validated
+        assert trusted.model_dump_json() == validated.model_dump_json()
+
+    observation = construct_trusted(
+        R4BObservation,
+        {"status": "final", "code": {"text": "x"}, "valueQuantity": {"value": 1.5}},
+    )
+    assert observation.valueQuantity.value == decimal.Decimal("1.5")
@@ -0,0 +1,210 @@
+import datetime
+import decimal
+
+import pytest
+
+from fhir.resources.bundle import Bundle
+from fhir.resources.observation import Observation
+from fhir.resources.patient import Patient
+from fhir.resources.R4B.observation import Observation as R4BObservation
+from fhir.resources.STU3.observation import Observation as STU3Observation
+from fhir.resources.utils.bundle import BundleIndex
+from fhir.resources.utils.fhirpath import compile_fhirpath, evaluate
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+@pytest.fixture(scope="module")
+def observation():
+    """ """
+    return Observation.model_validate_json(
+        (STATIC_PATH / "Observation.json").read_bytes()
+    )
+
+
+@pytest.fixture(scope="module")
+def patient():
+    """ """
+    return Patient.model_validate_json(
+        (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    )
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("Observation.status", ["final"]),
+        ("Patient.status", []),
+        ("code.coding.where(system = %loinc).code", ["9273-4"]),
+        ("component.code.coding.code.count()", [5]),
+        ("value.ofType(Quantity).value", [decimal.Decimal("5")]),
+        ("(value as Quantity).code", ["{score}"]),
+        ("value is Quantity", [True]),
+        ("value.ofType(string)", []),
+        ("value.value > 4 and value.value <= 5", [True]),
+        ("effective.ofType(dateTime) > @2016-01-01", [True]),
+        ("subject.resolve().gender", ["male"]),
+        ("meta.exists().not()", [False]),
+    ],
+)
+def test_fhirpath_observation(observation, expression, expected):
+    """ """
+    assert evaluate(observation, expression) == expected
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("name.given", ["Peter", "James", "Jim"]),
+        ("name.where(use = 'official').given.first()", ["Peter"]),
+        ("name.select(given.first())", ["Peter", "Jim"]),
+        ("name[0].family.upper()", ["CHALMERS"]),
+        ("name.given.join(',')", ["Peter,James,Jim"]),
+        ("telecom.exists(system = 'phone')", [True]),
+        ("telecom.all(value.exists())", [False]),
+        ("birthDate.toString()", ["1974-12"]),
+        ("birthDate > @1974-01", [True]),
+        ("multipleBirth", [3]),
+        ("deceased.exists() implies false", [False]),
+        ("gender ~ 'MALE'", [True]),
+        ("gender = 'MALE'", [False]),
+        ("extension.url.count()", [2]),
+        ("extension('http://example.org/x').exists()", [False]),
+        ("children().count() > 5", [True]),
+    ],
+)
+def test_fhirpath_patient(patient, expression, expected):
+    """ """
+    assert evaluate(patient, expression) == expected
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("1 + 2 * 3", [7]),
+        ("(1 + 2) * 3", [9]),
+        ("7 / 2", [decimal.Decimal("3.5")]),
+        ("7 div 2", [3]),
+        ("7 mod 2", [1]),
+        ("-(1 + 1)", [-2]),
+        ("2.5.round()", [decimal.Decimal("3")]),
+        ("'a' & {} & 'b'", ["ab"]),
+        ("(1 | 2 | 2).count()", [2]),
+        ("(1 | 2).combine(2).count()", [3]),
+        ("(1 | 2 | 3).where($this > 1)", [2, 3]),
+        ("(1 | 2 | 3).aggregate($this + $total, 0)", [6]),
+        ("(1 | 2 | 3).select($index)", [0, 1, 2]),
+        ("2 in (1 | 2)", [True]),
+        ("(1 | 2) contains 3", [False]),
+        ("{} = 1", []),
+        ("{}.empty()", [True]),
+        ("true and {}", []),
+        ("false and {}", [False]),
+        ("true or {}", [True]),
+        ("true xor true", [False]),
+        ("{} implies false", []),
+        ("iif(1 > 2, 'a', 'b')", ["b"]),
+        ("'abcdef'.substring(2, 3)", ["cde"]),
+        ("'a,b'.split(',').last()", ["b"]),
+        ("'abc'.matches('^a.c$')", [True]),
+        ("'1.50'.toDecimal() ~ 1.5", [True]),
+        ("'x'.convertsToInteger()", [False]),
+        ("10 'mg' = 10 'mg'", [True]),
+        ("5 'mg' < 10 'mg'", [True]),
+        ("@2020-01-01T10:00:00Z > @2020-01-01T09:00:00Z", [True]),
+        ("@2020-01-01T10:00:00+02:00 = @2020-01-01T08:00:00Z", [True]),
+        # different precision: empty unless the common part decides
+        ("@2020 < @2020-01-01", []),
+        ("@2019 < @2020-01-01", [True]),
+        ("@2020-01 = @2020-01-15", []),
+        ("@2020-01 = @2020-02-15", [False]),
+        ("@2012-04-15T15:00:00 > @2012-04-15", []),
+        ("@2020 ~ @2020-01", [False]),
+        ("'a' + 'b'", ["ab"]),
+        ("@T10:30", [datetime.time(10, 30)]),
+        ("%ucum", ["http://unitsofmeasure.org"]),
+        ("`a b`.exists()", [False]),
+        ("1 // comment\n + /* block */ 1", [2]),
+    ],
+)
+def test_fhirpath_operators(patient, expression, expected):
+    """ """
+    assert evaluate(patient, expression) == expected
+
+
+def test_fhirpath_api(observation, patient):
+    """ """
+    expression = compile_fhirpath("value.ofType(Quantity).value")
+    assert compile_fhirpath("value.ofType(Quantity).value") is expression
+    assert expression.evaluate_many([observation, patient, observation]) == [
+        [decimal.Decimal("5")],
+        [],
+        [decimal.Decimal("5")],
+    ]
+    assert compile_fhirpath("status = 'final'").evaluate_boolean(observation) is True
+    assert evaluate(patient, "%resource.gender") == ["male"]
+    assert evaluate(patient, "%max > 2", variables={"max": 3}) == [True]
+    assert evaluate(patient, "given.count()", context=patient.name[0]) == [2]
+
+    bundle = Bundle.model_validate(
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [
+                {"fullUrl": "http://x.org/fhir/Patient/1", "resource": patient},
+                {
+                    "fullUrl": "http://x.org/fhir/Observation/2",
+                    "resource": {
+                        "resourceType": "Observation",
+                        "status": "final",
+                        "code": {"text": "x"},
+                        "subject": {"reference": "Patient/1"},
+                    },
+                },
+            ],
+        }
+    )
+    index = BundleIndex(bundle)
+    context = bundle.entry[1]
+    assert evaluate(
+        bundle.entry[1].resource,
+        "subject.resolve().name.family",
+        resolver=lambda reference: index.resolve(reference, context),
+    ) == ["Chalmers"]
+
+    for invalid in ("name.", "name.where(", "1 +", "'open", "name.unknown()"):
+        with pytest.raises(ValueError):
+            compile_fhirpath(invalid)
+    with pytest.raises(ValueError, match="single item"):
+        evaluate(patient, "name.given > 'a'")
+    with pytest.raises(ValueError, match="unknown variable"):
+        evaluate(patient, "%missing")
+    for invalid in ("'a' + 1", "1 + 'a'", "true * 2"):
+        with pytest.raises(ValueError, match="not defined"):
+            evaluate(patient, invalid)
+    for invalid in ("birthDate + 1", "birthDate - 1"):
+        with pytest.raises(ValueError, match="date/time arithmetic"):
+            evaluate(patient, invalid)
+
+
+@pytest.mark.parametrize("klass", [R4BObservation, STU3Observation])
+def test_fhirpath_releases(klass):
+    """ """
+    observation = klass.model_validate(
+        {
+            "resourceType": "Observation",
+            "status": "final",
+            "code": {"coding": [{"system": "http://loinc.org", "code": "x"}]},
+            "valueQuantity": {"value": 5, "code": "mg"},
+            "component": [
+                {"code": {"text": "a"}, "valueString": "y"},
+                {"code": {"text": "b"}, "valueQuantity": {"value": 1, "code": "h"}},
+            ],
+        }
+    )
+    assert evaluate(observation, "Observation.value.ofType(Quantity).code") == ["mg"]
+    assert evaluate(observation, "component.value.count()") == [2]
+    assert evaluate(observation, "component.value.ofType(Quantity).code") == ["h"]
+    assert evaluate(observation, "component.where(value is string).code.text") == ["a"]
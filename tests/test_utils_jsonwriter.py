@@ -0,0 +1,118 @@
+import io
+
+import pytest
+from fhir_core import fhirabstractmodel
+
+from fhir.resources.R4B.binary import Binary
+from fhir.resources.R4B.bundle import Bundle
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+from fhir.resources.utils import jsonwriter
+from fhir.resources.utils.jsonwriter import (
+    JSON_BACKENDS,
+    get_json_plan,
+    json_dump,
+    json_dumps,
+    set_default_json_backend,
+)
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+OPTIONS = [
+    {},
+    {"indent": 2},
+    {"indent": 4},
+    {"exclude_comments": True},
+    {"summary_only": True},
+]
+
+
+def pydantic_json(model, **kwargs):
+    """``model_dump_json`` as it was, through pydantic's serializer."""
+    return fhirabstractmodel.FHIRAbstractModel.model_dump_json(model, **kwargs)
+
+
+def example_models():
+    """ """
+    patient = Patient.model_validate_json(
+        (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    )
+    observation = Observation.model_validate_json(
+        (STATIC_PATH / "Observation.json").read_bytes()
+    )
+    values = Observation.model_validate(
+        {
+            "resourceType": "Observation",
+            "status": "final",
+            "_status": {"extension": [{"url": "http://e.org", "valueString": "é"}]},
+            "code": {"text": 'tab\t"quote"\u0001  '},
+            "effectiveDateTime": "2020-01-01T05:03:02.123+05:00",
+            "issued": "2020-01-01T00:00:00Z",
+            "valueQuantity": {"value": "1.50", "_value": {"id": "v"}},
+            "component": [
+                {"code": {"text": "time"}, "valueTime": "09:00:00"},
+                {"code": {"text": "integer"}, "valueInteger": 3},
+                {"code": {"text": "small"}, "valueQuantity": {"value": "0.00001"}},
+                {"code": {"text": "large"}, "valueQuantity": {"value": "1E+30"}},
+            ],
+        }
+    )
+    names = Patient.model_validate(
+        {
+            "resourceType": "Patient",
+            "name": [{"given": ["a", None, "c"], "_given": [None, {"id": "x"}, None]}],
+            "birthDate": "1970",
+            "contained": [{"resourceType": "Patient", "id": "p2", "active": True}],
+        }
+    )
+    binary = Binary(contentType="text/plain", data=b"aGVsbG8=")
+    return [patient, observation, values, names, binary]
+
+
+@pytest.mark.parametrize("backend", sorted(JSON_BACKENDS))
+def test_json_dumps_identical_output(backend):
+    """ """
+    for model in example_models():
+        for kwargs in OPTIONS:
+            expected = pydantic_json(model, **kwargs)
+            assert json_dumps(model, backend=backend, **kwargs) == expected.encode()
+            assert model.model_dump_json(**kwargs) == expected
+
+    bundle = Bundle(
+        type="collection", entry=[{"resource": model} for model in example_models()]
+    )
+    fp = io.BytesIO()
+    json_dump(bundle, fp, backend=backend, indent=2)
+    assert fp.getvalue() == pydantic_json(bundle, indent=2).encode()
+
+
+def test_json_plan_and_backends():
+    """ """
+    plan = get_json_plan(Patient)
+    assert plan.resource_type == "Patient"
+    fields = plan.fields
+    assert fields["birthDate"][0] < fields["address"][0]
+    # ``_birthDate`` right after ``birthDate``
+    assert fields["birthDate__ext"][0] == fields["birthDate"][0] + 1
+    assert fields["birthDate__ext"][2] == "_birthDate"
+    assert get_json_plan(Patient) is plan
+
+    patient = example_models()[0]
+    # other pydantic parameters still go through pydantic
+    assert patient.model_dump_json(exclude={"id"}) == pydantic_json(
+        patient, exclude={"id"}
+    )
+
+    with pytest.raises(ValueError):
+        set_default_json_backend("simdjson")
+    default = jsonwriter.DEFAULT_JSON_BACKEND
+    JSON_BACKENDS["custom"] = lambda data, indent: b"{}"
+    try:
+        set_default_json_backend("custom")
+        assert json_dumps(patient) == b"{}"
+    finally:
+        set_default_json_backend(default)
+        del JSON_BACKENDS["custom"]
+    assert patient.model_dump_json() == pydantic_json(patient)
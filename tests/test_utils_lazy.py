@@ -0,0 +1,132 @@
+import copy
+import json
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from fhir.resources.appointment import Appointment
+from fhir.resources.explanationofbenefit import ExplanationOfBenefit
+from fhir.resources.R4B.questionnaire import Questionnaire, QuestionnaireItem
+from fhir.resources.utils import parse_resource
+from fhir.resources.utils.lazy import get_lazy_fields, model_validate_json_lazy
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def make_eob(items=5):
+    """ """
+    money = {"value": 125.5, "currency": "USD"}
+    code = {"coding": [{"system": "http://example.org", "code": "1205"}]}
+    return {
+        "resourceType": "ExplanationOfBenefit",
+        "id": "EB3500",
+        "status": "active",
+        "type": code,
+        "use": "claim",
+        "patient": {"reference": "Patient/pat1"},
+        "created": "2014-08-16",
+        "outcome": "complete",
+        "insurance": [{"focal": True, "coverage": {"reference": "Coverage/9"}}],
+        "item": [
+            {
+                "sequence": idx + 1,
+                "productOrService": code,
+                "net": money,
+                "detail": [{"sequence": 1, "productOrService": code}],
+            }
+            for idx in range(items)
+        ],
+    }
+
+
+def test_lazy_fields():
+    """ """
+    assert {"item", "insurance", "total"} <= set(get_lazy_fields(ExplanationOfBenefit))
+    # not a BackboneElement
+    assert "identifier" not in get_lazy_fields(ExplanationOfBenefit)
+    assert set(get_lazy_fields(Questionnaire)) == {"item"}
+    # required lists are a bare ``List[X]``
+    assert "participant" in get_lazy_fields(Appointment)
+
+
+def test_model_validate_json_lazy():
+    """ """
+    data = json.dumps(make_eob())
+    eager = ExplanationOfBenefit.model_validate_json(data)
+    eob = model_validate_json_lazy(ExplanationOfBenefit, data)
+
+    assert isinstance(eob, ExplanationOfBenefit)
+    assert eob.status == "active"
+    assert sorted(eob.pending_fields) == ["insurance", "item"]
+    assert eob.model_fields_set == eager.model_fields_set
+
+    assert eob.item[4].detail[0].sequence == 1
+    assert eob.pending_fields == ["insurance"]
+    # cached
+    assert eob.item is eob.item
+
+    # copies and pickles stay lazy, serialization materializes
+    for other in (copy.copy(eob), copy.deepcopy(eob), pickle.loads(pickle.dumps(eob))):
+        assert other.pending_fields == ["insurance"]
+        assert other == eager
+    assert eob.model_dump_json() == eager.model_dump_json()
+    assert eob.pending_fields == []
+
+    resource = parse_resource(data, lazy=True)
+    assert resource.pending_fields and resource == eager
+
+
+def test_model_validate_json_lazy_errors():
+    """ """
+    data = make_eob()
+    data["item"][1]["sequence"] = "first"
+    eob = model_validate_json_lazy(ExplanationOfBenefit, json.dumps(data))
+    assert eob.status == "active"
+    with pytest.raises(ValidationError):
+        eob.item
+    assert eob.insurance[0].focal is True
+
+    # eagerly validated part still fails at once
+    data["status"] = 1
+    with pytest.raises(ValidationError):
+        model_validate_json_lazy(ExplanationOfBenefit, json.dumps(data))
+
+
+def test_model_validate_json_lazy_assignment():
+    """ """
+    data = json.dumps(
+        {
+            "resourceType": "Questionnaire",
+            "status": "active",
+            "item": [{"linkId": "old", "type": "string"}],
+        }
+    )
+    questionnaire = model_validate_json_lazy(Questionnaire, data)
+    assert questionnaire.pending_fields == ["item"]
+    questionnaire.item = [QuestionnaireItem(linkId="new", type="boolean")]
+    assert questionnaire.pending_fields == []
+    dumped = questionnaire.model_dump_json()
+    assert '"new"' in dumped and '"old"' not in dumped
+
+    questionnaire = model_validate_json_lazy(Questionnaire, data)
+    del questionnaire.item
+    assert questionnaire.pending_fields == []
+    assert "item" not in json.loads(questionnaire.model_dump_json())
+
+
+def test_model_validate_json_lazy_required():
+    """ """
+    data = {
+        "resourceType": "Appointment",
+        "status": "booked",
+        "participant": [{"actor": {"reference": "Patient/1"}, "status": "accepted"}],
+    }
+    appointment = model_validate_json_lazy(Appointment, json.dumps(data))
+    assert appointment.pending_fields == ["participant"]
+    assert appointment == Appointment.model_validate(data)
+    assert appointment.participant[0].actor.reference == "Patient/1"
+
+    del data["participant"]
+    with pytest.raises(ValidationError):
+        model_validate_json_lazy(Appointment, json.dumps(data))
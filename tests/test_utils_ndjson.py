@@ -0,0 +1,87 @@
+import io
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from fhir.resources.observation import Observation
+from fhir.resources.patient import Patient
+from fhir.resources.utils.ndjson import NDJSONReader, NDJSONWriter
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def make_ndjson(count):
+    """Patients and Observations interleaved, every 10th line invalid."""
+    patient = json.loads((STATIC_PATH / "Patient-with-ext.json").read_text())
+    observation = json.loads((STATIC_PATH / "Observation.json").read_text())
+    lines = []
+    for idx in range(count):
+        if idx % 10 == 9:
+            lines.append(json.dumps({"resourceType": "Patient", "gender": 1}))
+            continue
+        resource = dict(observation if idx % 2 else patient)
+        resource["id"] = f"res-{idx}"
+        lines.append(json.dumps(resource))
+    return "\n".join(lines) + "\n"
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_ndjson_reader_keeps_order_and_reports_errors(max_workers):
+    """ """
+    data = make_ndjson(40).encode()
+    reader = NDJSONReader(io.BytesIO(data), batch_size=7, max_workers=max_workers)
+    results = list(reader)
+
+    assert [r.lineno for r in results] == list(range(1, 41))
+    for idx, result in enumerate(results):
+        if idx % 10 == 9:
+            assert result.resource is None
+            assert isinstance(result.error, ValidationError)
+            continue
+        assert result.error is None
+        assert result.resource.id == f"res-{idx}"
+        assert isinstance(result.resource, Observation if idx % 2 else Patient)
+
+
+def test_ndjson_reader_bad_lines():
+    """ """
+    data = io.StringIO(
+        '{"resourceType": "Patient", "id": "p1"}\n'
+        "\n"
+        "{not json\n"
+        '{"id": "no-type"}\n'
+        '{"resourceType": "NotExisting"}\n'
+    )
+    results = list(NDJSONReader(data, fhir_release="STU3"))
+    assert [r.lineno for r in results] == [1, 3, 4, 5]
+    assert results[0].resource.__module__ == "fhir.resources.STU3.patient"
+    assert all(isinstance(r.error, ValueError) for r in results[1:])
+
+    with pytest.raises(ValueError):
+        list(NDJSONReader(io.StringIO("{not json\n")).iter_resources())
+
+
+def test_ndjson_writer_round_trip(tmp_path):
+    """ """
+    resources = [r.resource for r in NDJSONReader(io.BytesIO(make_ndjson(20).encode()))]
+    resources = [r for r in resources if r is not None]
+
+    path = tmp_path / "export.ndjson"
+    with NDJSONWriter(path, buffer_size=1024) as writer:
+        writer.write_many(resources)
+
+    lines = path.read_bytes().splitlines()
+    assert len(lines) == len(resources)
+    assert lines[0].decode() == resources[0].model_dump_json()
+    with NDJSONReader(path) as reader:
+        assert [r.model_dump() for r in reader.iter_resources()] == [
+            r.model_dump() for r in resources
+        ]
+
+    text = io.StringIO()
+    with NDJSONWriter(text) as writer:
+        writer.write(resources[1])
+    assert text.getvalue() == resources[1].model_dump_json() + "\n"
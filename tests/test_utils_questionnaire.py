@@ -0,0 +1,288 @@
+import pytest
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.questionnaire import QuestionnaireIndex
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+SNOMED = "http://snomed.info/sct"
+
+
+def enable_when(release, question, operator, **answer):
+    """ """
+    if release == "STU3":
+        if operator == "exists":
+            return {"question": question, "hasAnswer": answer["answerBoolean"]}
+        assert operator == "="
+        return {"question": question, **answer}
+    return {"question": question, "operator": operator, **answer}
+
+
+def choice(release):
+    """ """
+    return "choice" if release == "STU3" else "coding"
+
+
+def make_questionnaire(release):
+    """ """
+    options = "option" if release == "STU3" else "answerOption"
+    items = [
+        {"linkId": "age", "type": "integer", "required": True},
+        {
+            "linkId": "smoker",
+            "type": "boolean",
+            "enableWhen": [enable_when(release, "age", "exists", answerBoolean=True)],
+        },
+        {
+            "linkId": "smoking",
+            "type": "group",
+            "enableWhen": [enable_when(release, "smoker", "=", answerBoolean=True)],
+            "item": [
+                {"linkId": "packs", "type": "decimal", "required": True},
+                {"linkId": "brand", "type": "string", "maxLength": 5},
+            ],
+        },
+        {
+            "linkId": "status",
+            "type": choice(release),
+            options: [
+                {"valueCoding": {"system": SNOMED, "code": "married"}},
+                {"valueCoding": {"system": SNOMED, "code": "single"}},
+            ],
+        },
+        {
+            "linkId": "partner",
+            "type": "string",
+            "enableWhen": [
+                enable_when(release, "status", "=", answerCoding={"code": "married"}),
+                enable_when(release, "age", "exists", answerBoolean=False),
+            ],
+        },
+        {"linkId": "note", "type": "display", "text": "Thank you"},
+    ]
+    if release != "STU3":
+        items[4]["enableBehavior"] = "any"
+        items.append(
+            {
+                "linkId": "senior",
+                "type": "boolean",
+                "enableWhen": [enable_when(release, "age", ">=", answerInteger=65)],
+            }
+        )
+    return get_fhir_model_class("Questionnaire", release).model_validate(
+        {"resourceType": "Questionnaire", "status": "active", "item": items}
+    )
+
+
+def make_response(release, items):
+    """ """
+    data = {"resourceType": "QuestionnaireResponse", "status": "completed"}
+    if release == "R5":
+        data["questionnaire"] = "http://example.org/fhir/Questionnaire/smoking"
+    data["item"] = items
+    return get_fhir_model_class("QuestionnaireResponse", release).model_validate(data)
+
+
+@pytest.mark.parametrize("release", ["R5", "R4B", "STU3"])
+def test_enable_when_state(release):
+    """ """
+    index = QuestionnaireIndex(make_questionnaire(release))
+    assert index.parent("packs") == "smoking"
+    assert index.children("smoking") == ["packs", "brand"]
+    assert sorted(index.dependents["age"]) == sorted(
+        ["smoker", "partner"] + (["senior"] if release != "STU3" else [])
+    )
+
+    state = index.state()
+    assert not state.is_enabled("smoker")
+    assert not state.is_enabled("packs")
+    # "age" not answered: partner enabled through its second condition
+    assert state.is_enabled("partner")
+
+    assert state.set_answers("age", [40]) == {"smoker", "partner"}
+    assert state.set_answers("smoker", [True]) == {"smoking", "packs", "brand"}
+    assert state.is_enabled("packs")
+    coding = get_fhir_model_class("Coding", release)
+    assert state.set_answers("status", [coding(system=SNOMED, code="married")]) == {
+        "partner"
+    }
+    if release != "STU3":
+        assert not state.is_enabled("senior")
+        assert state.set_answers("age", [70]) == {"senior"}
+
+    # disabling "smoker" hides the answers it was given
+    assert state.set_answers("age", []) == {
+        "smoker",
+        "smoking",
+        "packs",
+        "brand",
+    } | ({"senior"} if release != "STU3" else set())
+    assert state.answers("smoker") == [True]
+    assert state.set_answers("smoker", [False]) == set()
+    assert state.set_answers("age", [30]) == {"smoker"}
+    assert "packs" not in state.enabled()
+
+    with pytest.raises(ValueError):
+        state.set_answers("unknown", [1])
+
+
+@pytest.mark.parametrize("release", ["R5", "R4B", "STU3"])
+def test_state_from_response(release):
+    """ """
+    index = QuestionnaireIndex(make_questionnaire(release))
+    response = make_response(
+        release,
+        [
+            {"linkId": "age", "answer": [{"valueInteger": 20}]},
+            {"linkId": "smoker", "answer": [{"valueBoolean": True}]},
+        ],
+    )
+    state = index.state(response)
+    assert state.is_enabled("packs")
+    assert not state.is_enabled("partner")
+
+
+@pytest.mark.parametrize("release", ["R5", "R4B", "STU3"])
+def test_validate_response(release):
+    """ """
+    index = QuestionnaireIndex(make_questionnaire(release))
+    valid = make_response(
+        release,
+        [
+            {"linkId": "age", "answer": [{"valueInteger": 20}]},
+            {"linkId": "smoker", "answer": [{"valueBoolean": True}]},
+            {
+                "linkId": "smoking",
+                "item": [
+                    {"linkId": "packs", "answer": [{"valueDecimal": 0.5}]},
+                    {"linkId": "brand", "answer": [{"valueString": "Acme"}]},
+                ],
+            },
+            {
+                "linkId": "status",
+                "answer": [{"valueCoding": {"system": SNOMED, "code": "single"}}],
+            },
+        ],
+    )
+    assert index.validate_response(valid) == []
+
+    invalid = make_response(
+        release,
+        [
+            {"linkId": "smoker", "answer": [{"valueString": "yes"}]},
+            {
+                "linkId": "smoking",
+                "item": [{"linkId": "brand", "answer": [{"valueString": "Acme Ltd"}]}],
+            },
+            {
+                "linkId": "status",
+                "answer": [
+                    {"valueCoding": {"system": SNOMED, "code": "divorced"}},
+                    {"valueCoding": {"system": SNOMED, "code": "single"}},
+                ],
+            },
+            {"linkId": "packs", "answer": [{"valueDecimal": 1}]},
+            {"linkId": "note", "answer": [{"valueString": "thanks"}]},
+            {"linkId": "extra", "answer": [{"valueString": "?"}]},
+        ],
+    )
+    issues = index.validate_response(invalid)
+    by_link_id = dict()
+    for issue in issues:
+        by_link_id.setdefault(issue.link_id, []).append(issue.message)
+    assert by_link_id["age"] == ["Required item missing"]
+    assert "Answer of type String to an item of type boolean" in by_link_id["smoker"]
+    assert "Longer than 5 characters" in by_link_id["brand"]
+    # "age" not answered: smoker and its group are disabled
+    assert "Answer to a disabled item" in by_link_id["brand"]
+    assert by_link_id["status"][0] == "Only one answer allowed"
+    assert "is not an answer option" in by_link_id["status"][1]
+    assert by_link_id["packs"][0] == "Item belongs under ``smoking``, not ``None``"
+    assert by_link_id["note"] == ["No answer allowed (display)"]
+    assert by_link_id["extra"] == ["Unknown linkId"]
+
+
+def test_invalid_questionnaire():
+    """ """
+    klass = get_fhir_model_class("Questionnaire")
+    duplicate = klass.model_validate(
+        {
+            "resourceType": "Questionnaire",
+            "status": "active",
+            "item": [
+                {"linkId": "a", "type": "string"},
+                {
+                    "linkId": "g",
+                    "type": "group",
+                    "item": [{"linkId": "a", "type": "string"}],
+                },
+            ],
+        }
+    )
+    with pytest.raises(ValueError):
+        QuestionnaireIndex(duplicate)
+
+    # enabled as long as it has no answer: never settles once answered
+    cycle = klass.model_validate(
+        {
+            "resourceType": "Questionnaire",
+            "status": "active",
+            "item": [
+                {
+                    "linkId": "a",
+                    "type": "boolean",
+                    "enableWhen": [
+                        {"question": "a", "operator": "exists", "answerBoolean": False}
+                    ],
+                },
+            ],
+        }
+    )
+    state = QuestionnaireIndex(cycle).state()
+    with pytest.raises(ValueError):
+        state.set_answers("a", [True])
+    assert state.enabled() == ["a"]
+    assert state.answers("a") == []
+
+
+def test_enable_when_fan_in():
+    """Many items enabled by the same questions settle, no false cycle."""
+    klass = get_fhir_model_class("Questionnaire")
+    questions = [f"q{number}" for number in range(10)]
+    items = [{"linkId": "trigger", "type": "boolean"}]
+    items.extend(
+        {
+            "linkId": link_id,
+            "type": "boolean",
+            "enableWhen": [enable_when("R5", "trigger", "=", answerBoolean=True)],
+        }
+        for link_id in questions
+    )
+    items.extend(
+        {
+            "linkId": f"any{number}",
+            "type": "string",
+            "enableBehavior": "any",
+            "enableWhen": [
+                enable_when("R5", link_id, "exists", answerBoolean=False)
+                for link_id in questions
+            ],
+        }
+        for number in range(10)
+    )
+    index = QuestionnaireIndex(
+        klass.model_validate(
+            {"resourceType": "Questionnaire", "status": "active", "item": items}
+        )
+    )
+    state = index.state()
+    assert state.enabled() == ["trigger"] + [f"any{number}" for number in range(10)]
+    assert state.set_answers("trigger", [True]) == set(questions)
+    assert state.enabled() == list(index.items)
+    for link_id in questions:
+        state.set_answers(link_id, [True])
+    assert state.enabled() == ["trigger"] + questions
+    assert state.set_answers("trigger", [False]) == set(questions) | {
+        f"any{number}" for number in range(10)
+    }
+    assert state.enabled() == ["trigger"] + [f"any{number}" for number in range(10)]
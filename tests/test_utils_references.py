@@ -0,0 +1,175 @@
+import json
+
+import pytest
+
+from fhir.resources.bundle import Bundle
+from fhir.resources.codeableconcept import CodeableConcept
+from fhir.resources.medicationrequest import MedicationRequest
+from fhir.resources.observation import Observation
+from fhir.resources.provenance import Provenance
+from fhir.resources.questionnaireresponse import QuestionnaireResponse
+from fhir.resources.R4B.observation import Observation as R4BObservation
+from fhir.resources.STU3.observation import Observation as STU3Observation
+from fhir.resources.utils.references import (
+    get_reference_fields,
+    get_reference_paths,
+    iter_reference_elements,
+    iter_references,
+)
+
+from .fixtures import STATIC_PATH
+from .test_utils_transaction import make_transaction, uuid_ref
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_reference_tables():
+    """ """
+    paths = dict(get_reference_paths("Observation"))
+    assert paths["Observation.subject"][:2] == ("Patient", "Group")
+    assert paths["Observation.identifier[*].assigner"] == ("Organization",)
+    assert "Observation.component[*].valueReference" in paths
+    assert dict(get_reference_paths("MedicationRequest"))[
+        "MedicationRequest.medication"
+    ] == ("Medication",)
+    assert "Observation.subject" in dict(get_reference_paths("Observation", "STU3"))
+    assert get_reference_paths("Unknown") == ()
+    # nothing leads to a reference
+    assert get_reference_fields(CodeableConcept) == ()
+    assert get_reference_fields(Observation)[0][:4] == (
+        "contained",
+        "contained",
+        True,
+        "resource",
+    )
+
+
+@pytest.mark.parametrize(
+    "klass,release",
+    [(Observation, "R5"), (R4BObservation, "R4B"), (STU3Observation, "STU3")],
+)
+def test_iter_reference_elements(klass, release):
+    """ """
+    observation = klass.model_validate_json(
+        (STATIC_PATH / "Observation.json").read_bytes()
+    )
+    observation.identifier = [{"value": "1", "assigner": {"reference": "Org/1"}}]
+    elements = [
+        (path, reference.reference)
+        for path, reference, _ in iter_reference_elements(observation)
+    ]
+    assert ("Observation.performer[*]", "Practitioner/example") in elements
+    assert ("Observation.identifier[*].assigner", "Org/1") in elements
+    assert ("Observation.subject", "#newborn") in elements
+    known = dict(get_reference_paths("Observation", release))
+    for path, _, targets in iter_reference_elements(observation):
+        assert known[path] == targets
+
+
+def test_iter_references_codeable_and_nested():
+    """ """
+    request = MedicationRequest.model_validate(
+        {
+            "status": "active",
+            "intent": "order",
+            "subject": {"reference": "Patient/1"},
+            "medication": {"reference": {"reference": "Medication/1"}},
+        }
+    )
+    assert [
+        (path, ref.reference, targets)
+        for path, ref, targets in iter_reference_elements(request)
+    ] == [
+        ("MedicationRequest.medication", "Medication/1", ("Medication",)),
+        ("MedicationRequest.subject", "Patient/1", ("Patient", "Group")),
+    ]
+
+    # recursive items, any depth
+    response = QuestionnaireResponse.model_validate(
+        {
+            "status": "completed",
+            "questionnaire": "http://example.org/Questionnaire/q",
+            "item": [
+                {
+                    "linkId": "1",
+                    "item": [
+                        {
+                            "linkId": "1.1",
+                            "answer": [{"valueReference": {"reference": "Patient/1"}}],
+                        }
+                    ],
+                }
+            ],
+        }
+    )
+    ((path, reference, targets),) = iter_reference_elements(response)
+    assert path == "QuestionnaireResponse.item[*].item[*].answer[*].valueReference"
+    assert reference.reference == "Patient/1" and targets == ("Resource",)
+
+
+def test_iter_references_extensions():
+    """ """
+    bundle = Bundle.model_validate(make_transaction())
+    observation = bundle.entry[0].resource
+    # performer, subject, then the nested ones
+    references = iter_references(observation, extensions=True)
+    assert [ref.reference for ref in references] == [
+        uuid_ref(1)["reference"],
+        "#p",
+        uuid_ref(1)["reference"],
+        # in the extension of the contained resource
+        uuid_ref(2)["reference"],
+    ]
+    assert [ref.reference for ref in iter_references(observation)] == [
+        uuid_ref(1)["reference"],
+        "#p",
+        uuid_ref(1)["reference"],
+    ]
+    assert list(iter_references(bundle.entry[1].resource.managingOrganization)) == []
+    assert json.loads(observation.model_dump_json())["subject"] == uuid_ref(1)
+
+    # a required list (``Provenance.target``) item by item
+    provenance = Provenance.model_validate(
+        {
+            "resourceType": "Provenance",
+            "target": [{"reference": "Patient/1"}, {"reference": "Patient/2"}],
+            "recorded": "2024-01-01T00:00:00Z",
+            "agent": [{"who": {"reference": "Practitioner/1"}}],
+        }
+    )
+    assert [ref.reference for ref in iter_references(provenance, extensions=True)] == [
+        "Patient/1",
+        "Patient/2",
+        "Practitioner/1",
+    ]
+
+
+def test_iter_references_required_list():
+    """ """
+    # ``Provenance.target`` and ``agent`` are required lists (bare ``List[X]``)
+    provenance = Provenance.model_validate(
+        {
+            "resourceType": "Provenance",
+            "target": [{"reference": "Patient/1"}, {"reference": "Patient/2"}],
+            "recorded": "2024-01-01T00:00:00Z",
+            "agent": [{"who": {"reference": "Practitioner/1"}}],
+        }
+    )
+    assert [ref.reference for ref in iter_references(provenance)] == [
+        "Patient/1",
+        "Patient/2",
+        "Practitioner/1",
+    ]
+    paths = dict(get_reference_paths("Provenance"))
+    assert "Provenance.target[*]" in paths
+    assert "Provenance.agent[*].who" in paths
+    assert "Provenance.target" not in paths
+    assert [
+        (path, ref.reference)
+        for path, ref, targets in iter_reference_elements(provenance)
+        if paths[path] == targets
+    ] == [
+        ("Provenance.target[*]", "Patient/1"),
+        ("Provenance.target[*]", "Patient/2"),
+        ("Provenance.agent[*].who", "Practitioner/1"),
+    ]
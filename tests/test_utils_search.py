@@ -0,0 +1,244 @@
+import datetime
+import decimal
+import json
+import zipfile
+
+import pytest
+
+from fhir.resources.bundle import Bundle
+from fhir.resources.observation import Observation
+from fhir.resources.patient import Patient
+from fhir.resources.R4B.bundle import Bundle as R4BBundle
+from fhir.resources.R4B.observation import Observation as R4BObservation
+from fhir.resources.STU3.bundle import Bundle as STU3Bundle
+from fhir.resources.STU3.observation import Observation as STU3Observation
+from fhir.resources.utils.search import (
+    DATE_MAX,
+    DateIndex,
+    QuantityIndex,
+    ReferenceIndex,
+    SearchIndexer,
+    StringIndex,
+    TokenIndex,
+    UriIndex,
+    load_search_parameters,
+)
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+UTC = datetime.timezone.utc
+
+
+def search_parameter(code, param_type, base, expression):
+    """ """
+    return {
+        "fullUrl": f"http://hl7.org/fhir/SearchParameter/{code}",
+        "resource": {
+            "resourceType": "SearchParameter",
+            "url": f"http://hl7.org/fhir/SearchParameter/{code}",
+            "name": code,
+            "status": "active",
+            "description": code,
+            "code": code,
+            "base": base,
+            "type": param_type,
+            "expression": expression,
+        },
+    }
+
+
+def make_definitions():
+    """A few of the base SearchParameter definitions."""
+    return {
+        "resourceType": "Bundle",
+        "type": "collection",
+        "entry": [
+            search_parameter("_id", "token", ["Resource"], "Resource.id"),
+            search_parameter("_profile", "uri", ["Resource"], "Resource.meta.profile"),
+            search_parameter(
+                "family",
+                "string",
+                ["Patient", "Practitioner"],
+                "Patient.name.family | Practitioner.name.family",
+            ),
+            search_parameter("name", "string", ["Patient"], "Patient.name"),
+            search_parameter("gender", "token", ["Patient"], "Patient.gender"),
+            search_parameter("birthdate", "date", ["Patient"], "Patient.birthDate"),
+            search_parameter("identifier", "token", ["Patient"], "Patient.identifier"),
+            search_parameter("code", "token", ["Observation"], "Observation.code"),
+            search_parameter(
+                "date",
+                "date",
+                ["Observation"],
+                "Observation.effective.ofType(dateTime) "
+                "| Observation.effective.ofType(Period)",
+            ),
+            search_parameter(
+                "patient",
+                "reference",
+                ["Observation", "Patient"],
+                "Observation.subject.where(resolve() is Patient) "
+                "| Patient.link.other",
+            ),
+            search_parameter(
+                "subject", "reference", ["Observation"], "Observation.subject"
+            ),
+            search_parameter(
+                "value-quantity",
+                "quantity",
+                ["Observation"],
+                "(Observation.value as Quantity) | (Observation.value as SampledData)",
+            ),
+            search_parameter(
+                "combo-code-value-quantity",
+                "composite",
+                ["Observation"],
+                "Observation | Observation.component",
+            ),
+            search_parameter("broken", "token", ["Observation"], "Observation.("),
+        ],
+    }
+
+
+def make_observation(subject="Patient/123"):
+    """ """
+    return {
+        "resourceType": "Observation",
+        "id": "o1",
+        "meta": {"profile": ["http://example.org/StructureDefinition/x"]},
+        "status": "final",
+        "code": {
+            "coding": [
+                {"system": "http://loinc.org", "code": "8302-2"},
+                {"system": "http://snomed.info/sct", "code": "50373000"},
+            ]
+        },
+        "subject": {"reference": subject},
+        "effectivePeriod": {"start": "2016-05", "end": "2016-05-18T10:00:00+02:00"},
+        "valueQuantity": {
+            "value": 185,
+            "unit": "cm",
+            "system": "http://unitsofmeasure.org",
+            "code": "cm",
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "bundle_klass,observation_klass,release",
+    [
+        (Bundle, Observation, "R5"),
+        (R4BBundle, R4BObservation, "R4B"),
+        (STU3Bundle, STU3Observation, "STU3"),
+    ],
+)
+def test_search_indexer(bundle_klass, observation_klass, release):
+    """ """
+    definitions = bundle_klass.model_validate(make_definitions())
+    indexer = SearchIndexer(
+        [entry.resource for entry in definitions.entry], fhir_release=release
+    )
+    observation = observation_klass.model_validate(make_observation())
+    rows = indexer.extract(observation)
+    assert set(rows) == {
+        TokenIndex("_id", None, "o1"),
+        UriIndex("_profile", "http://example.org/StructureDefinition/x"),
+        TokenIndex("code", "http://loinc.org", "8302-2"),
+        TokenIndex("code", "http://snomed.info/sct", "50373000"),
+        DateIndex(
+            "date",
+            datetime.datetime(2016, 5, 1, tzinfo=UTC),
+            datetime.datetime(2016, 5, 18, 8, 0, 0, 999999, tzinfo=UTC),
+        ),
+        ReferenceIndex("patient", "Patient", "123", None, "Patient/123"),
+        ReferenceIndex("subject", "Patient", "123", None, "Patient/123"),
+        QuantityIndex(
+            "value-quantity",
+            decimal.Decimal("185"),
+            "http://unitsofmeasure.org",
+            "cm",
+            "cm",
+        ),
+    }
+    assert set(indexer.skipped) == {
+        ("Observation", "combo-code-value-quantity"),
+        ("Observation", "broken"),
+    }
+
+    # ``where(resolve() is Patient)``
+    group = observation_klass.model_validate(make_observation("Group/1"))
+    assert {row.name for row in indexer.extract(group)} & {
+        "patient",
+        "subject",
+    } == {"subject"}
+
+    assert indexer.extract_many([observation, group, observation]) == [
+        indexer.extract(observation),
+        indexer.extract(group),
+        indexer.extract(observation),
+    ]
+
+
+def test_search_indexer_patient():
+    """ """
+    definitions = Bundle.model_validate(make_definitions())
+    indexer = SearchIndexer([entry.resource for entry in definitions.entry])
+    patient = Patient.model_validate_json(
+        (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    )
+    patient.name[0].family = "Chalmérs"
+    rows = indexer.extract(patient)
+    assert TokenIndex("gender", None, "male") in rows
+    assert TokenIndex("identifier", "urn:oid:1.2.36.146.595.217.0.1", "12345") in rows
+    assert StringIndex("family", "Chalmérs", "chalmers") in rows
+    assert StringIndex("name", "Jim", "jim") in rows
+    assert (
+        DateIndex(
+            "birthdate",
+            datetime.datetime(1974, 12, 1, tzinfo=UTC),
+            datetime.datetime(1974, 12, 31, 23, 59, 59, 999999, tzinfo=UTC),
+        )
+        in rows
+    )
+    # ``Practitioner.name.family`` is no part of the Patient extractor
+    (family,) = [
+        e for code, _, e in indexer.get_extractors("Patient") if code == "family"
+    ]
+    assert family.expression == "Patient.name.family"
+
+    # open ended period
+    observation = Observation.model_validate(make_observation())
+    observation.effectivePeriod.end = None
+    (row,) = [row for row in indexer.extract(observation) if row.name == "date"]
+    assert row.high == DATE_MAX
+
+    # ``value-quantity`` also selects ``SampledData``, no row for it
+    data = make_observation()
+    del data["valueQuantity"]
+    data["valueSampledData"] = {
+        "origin": {"value": 0},
+        "dimensions": 1,
+        "intervalUnit": "ms",
+        "data": "1 2 3",
+    }
+    rows = indexer.extract(Observation.model_validate(data))
+    assert not [row for row in rows if row.name == "value-quantity"]
+
+
+def test_load_search_parameters(tmp_path):
+    """ """
+    path = tmp_path / "search-parameters.json"
+    path.write_text(json.dumps(make_definitions()))
+    assert len(load_search_parameters(path)) == 14
+    archive = tmp_path / "definitions.json.zip"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.write(path, "search-parameters.json")
+    indexer = SearchIndexer.from_definitions(archive, "R4B")
+    assert indexer.fhir_release == "R4B"
+    assert indexer.get_extractors("Patient")
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("profiles-types.json", "{}")
+    with pytest.raises(ValueError):
+        load_search_parameters(archive)
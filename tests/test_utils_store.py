@@ -0,0 +1,215 @@
+import threading
+
+import pytest
+
+from fhir.resources.appointment import Appointment
+from fhir.resources.observation import Observation
+from fhir.resources.practitioner import Practitioner
+from fhir.resources.provenance import Provenance
+from fhir.resources.R4B.practitioner import Practitioner as R4BPractitioner
+from fhir.resources.STU3.practitioner import Practitioner as STU3Practitioner
+from fhir.resources.utils.store import ResourceStore
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+NPI = "http://hl7.org/fhir/sid/us-npi"
+
+
+def make_practitioner(klass, number, last_updated="2024-01-01T00:00:00Z"):
+    """ """
+    return klass.model_validate(
+        {
+            "resourceType": "Practitioner",
+            "id": f"p{number}",
+            "meta": {
+                "lastUpdated": last_updated,
+                "tag": [{"system": "http://example.org/tags", "code": "hot"}],
+            },
+            "identifier": [
+                {"system": NPI, "value": str(number)},
+                {"value": f"local-{number}"},
+            ],
+        }
+    )
+
+
+def make_observation(number, subject):
+    """ """
+    return Observation.model_validate(
+        {
+            "resourceType": "Observation",
+            "id": f"o{number}",
+            "status": "final",
+            "code": {"text": "x"},
+            "subject": {"reference": subject},
+            "performer": [{"reference": "Practitioner/p1"}],
+        }
+    )
+
+
+@pytest.mark.parametrize("klass", [Practitioner, R4BPractitioner, STU3Practitioner])
+def test_resource_store(klass):
+    """ """
+    store = ResourceStore(
+        [
+            make_practitioner(klass, 1, "2024-01-01T00:00:00Z"),
+            make_practitioner(klass, 2, "2024-02-01T12:00:00+02:00"),
+            make_practitioner(klass, 3, "2024-03-01T00:00:00Z"),
+        ]
+    )
+    assert len(store) == 3
+    assert "Practitioner/p2" in store
+    assert store.get("Practitioner/p2").id == "p2"
+
+    def ids(*args, **kwargs):
+        return [resource.id for resource in store.search(*args, **kwargs)]
+
+    assert ids("Practitioner") == ["p1", "p2", "p3"]
+    assert ids("Practitioner", _id="p3,p1,p9") == ["p1", "p3"]
+    assert ids(_id="p2") == ["p2"]
+    assert ids("Practitioner", identifier=f"{NPI}|2") == ["p2"]
+    assert ids("Practitioner", identifier="2") == ["p2"]
+    assert ids("Practitioner", identifier="|local-3") == ["p3"]
+    assert ids("Practitioner", identifier=f"{NPI}|") == ["p1", "p2", "p3"]
+    assert ids("Practitioner", identifier=f"{NPI}|1,{NPI}|3") == ["p1", "p3"]
+    assert ids("Practitioner", identifier=["1", f"{NPI}|2"]) == []
+    assert ids("Practitioner", _tag="hot") == ["p1", "p2", "p3"]
+    assert ids("Practitioner", _lastUpdated="gt2024-01-01") == ["p2", "p3"]
+    assert ids("Practitioner", _lastUpdated="2024-02") == ["p2"]
+    assert ids("Practitioner", _lastUpdated="2024-02-01T10:00:00Z") == ["p2"]
+    # not an ISO format of ``datetime.fromisoformat`` before Python 3.11
+    assert ids("Practitioner", _lastUpdated="2024-02-01T10:00:00.0Z") == ["p2"]
+    assert ids("Practitioner", _lastUpdated="le2024-02-01") == ["p1", "p2"]
+    assert ids("Practitioner", _lastUpdated="ne2024-02") == ["p1", "p3"]
+    assert ids(
+        "Practitioner", f"identifier={NPI}|2,{NPI}|3&_lastUpdated=ge2024-03-01"
+    ) == ["p3"]
+    assert ids("Organization") == []
+    with pytest.raises(ValueError, match="Unsupported"):
+        store.search("Practitioner", _sort="name")
+
+    # copy on write, a replaced resource is re-indexed
+    before = store.search("Practitioner", identifier="2")
+    store.put(make_practitioner(klass, 2, "2025-01-01T00:00:00Z"))
+    assert ids("Practitioner", _lastUpdated="gt2024-12-31") == ["p2"]
+    assert ids("Practitioner", _lastUpdated="2024-02") == []
+    assert store.search("Practitioner", identifier="2")[0] is not before[0]
+    assert store.remove("Practitioner/p2") is True
+    assert store.remove("Practitioner/p2") is False
+    assert ids("Practitioner", identifier="2") == []
+    assert ids("Practitioner", _tag="http://example.org/tags|") == ["p1", "p3"]
+
+    with pytest.raises(ValueError, match="without ``id``"):
+        store.put(klass.model_validate({"resourceType": "Practitioner"}))
+
+
+def test_resource_store_references():
+    """ """
+    store = ResourceStore()
+    store.put_many(
+        [
+            make_observation(1, "Patient/1"),
+            make_observation(2, "http://example.org/fhir/Patient/2"),
+            make_observation(3, "Group/1"),
+        ]
+    )
+
+    def ids(**kwargs):
+        return [resource.id for resource in store.search("Observation", **kwargs)]
+
+    assert ids(subject="Patient/1") == ["o1"]
+    assert ids(subject="Patient/2") == ["o2"]
+    assert ids(subject="http://other.org/Patient/1,Group/1") == ["o1", "o3"]
+    assert ids(performer="Practitioner/p1") == ["o1", "o2", "o3"]
+    assert ids(subject="Practitioner/p1") == []
+    assert ids(_reference="Group/1") == ["o3"]
+
+
+def test_resource_store_concurrent_readers():
+    """Readers see complete snapshots while a writer keeps replacing them."""
+    store = ResourceStore([make_practitioner(Practitioner, 0)])
+    errors = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            for resource in store.search("Practitioner", _tag="hot"):
+                found = store.search("Practitioner", _id=resource.id)
+                if found and found[0].id != resource.id:  # pragma: no cover
+                    errors.append(resource.id)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for number in range(1, 200):
+        store.put(make_practitioner(Practitioner, number))
+    done.set()
+    for reader in readers:
+        reader.join()
+    assert errors == []
+    assert len(store.search("Practitioner", identifier=f"{NPI}|")) == 200
+    # moved within the sorted ``meta.lastUpdated`` of a large store
+    store.put(make_practitioner(Practitioner, 5, "2025-06-01T00:00:00Z"))
+    assert [r.id for r in store.search(_lastUpdated="ge2025")] == ["p5"]
+    assert len(store.search(_lastUpdated="lt2025")) == 199
+
+
+def test_resource_store_required_list_references():
+    """References under required lists (``Appointment.participant``,
+    ``Provenance.target``)."""
+    appointment = Appointment.model_validate(
+        {
+            "resourceType": "Appointment",
+            "id": "a1",
+            "status": "booked",
+            "participant": [
+                {"actor": {"reference": "Patient/1"}, "status": "accepted"},
+                {"actor": {"reference": "Practitioner/p1"}, "status": "accepted"},
+            ],
+        }
+    )
+    provenance = Provenance.model_validate(
+        {
+            "resourceType": "Provenance",
+            "id": "v1",
+            "target": [{"reference": "Appointment/a1"}],
+            "recorded": "2024-01-01T00:00:00Z",
+            "agent": [{"who": {"reference": "Practitioner/p1"}}],
+        }
+    )
+    store = ResourceStore()
+    store.put(appointment)
+    store.put(provenance)
+
+    def ids(*args, **kwargs):
+        return [resource.id for resource in store.search(*args, **kwargs)]
+
+    assert ids("Appointment", participant="Patient/1") == ["a1"]
+    assert ids("Appointment", participant="Practitioner/p1") == ["a1"]
+    assert ids("Provenance", target="Appointment/a1") == ["v1"]
+    assert ids("Provenance", agent="Practitioner/p1") == ["v1"]
+    assert ids(_reference="Practitioner/p1") == ["a1", "v1"]
+
+
+def test_resource_store_versions_in_one_batch():
+    """Two versions of one resource in a ``put_many`` (a history Bundle)."""
+    store = ResourceStore(
+        [
+            make_practitioner(Practitioner, 1, "2024-01-01T00:00:00Z"),
+            make_practitioner(Practitioner, 1, "2024-01-02T00:00:00Z"),
+        ]
+    )
+    assert len(store) == 1
+    assert [r.id for r in store.search("Practitioner", identifier=f"{NPI}|1")] == ["p1"]
+    assert [r.id for r in store.search(_lastUpdated="2024-01-02")] == ["p1"]
+    assert store.search(_lastUpdated="2024-01-01") == []
+    assert len(store._snapshot.last_updated) == 1
+    store.put_many(
+        [
+            make_practitioner(Practitioner, 1, "2024-01-03T00:00:00Z"),
+            make_practitioner(Practitioner, 1, "2024-01-04T00:00:00Z"),
+        ]
+    )
+    assert [r.id for r in store.search(_tag="hot")] == ["p1"]
+    assert [r.id for r in store.search(_lastUpdated="2024-01-04")] == ["p1"]
+    assert len(store._snapshot.last_updated) == 1
@@ -0,0 +1,428 @@
+import random
+
+import pytest
+
+from fhir.resources.utils import get_fhir_model_class
+from fhir.resources.utils.terminology import CodeSystemIndex, ValueSetExpander
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+SYSTEM = "http://example.org/fhir/CodeSystem/observations"
+BASE = "http://example.org/fhir/ValueSet/"
+LOINC = "http://loinc.org"
+
+
+def concept(code, *children, **properties):
+    """ """
+    data = {"code": code, "display": code.upper()}
+    if children:
+        data["concept"] = list(children)
+    if properties:
+        data["property"] = [
+            {
+                "code": name,
+                "valueBoolean" if isinstance(value, bool) else "valueCode": value,
+            }
+            for name, value in properties.items()
+        ]
+    return data
+
+
+def make_code_system():
+    """ """
+    return {
+        "resourceType": "CodeSystem",
+        "url": SYSTEM,
+        "version": "1",
+        "status": "active",
+        "content": "complete",
+        "caseSensitive": False,
+        "concept": [
+            concept(
+                "vital",
+                concept("bp", concept("sbp"), concept("dbp")),
+                concept("hr"),
+                concept("temp", status="retired"),
+                notSelectable=True,
+            ),
+            concept(
+                "lab", concept("glucose", group="chem"), concept("na", group="chem")
+            ),
+        ],
+    }
+
+
+def value_set(name, compose=None, **kwargs):
+    """ """
+    data = {"resourceType": "ValueSet", "url": BASE + name, "status": "active"}
+    if compose is not None:
+        data["compose"] = compose
+    data.update(kwargs)
+    return data
+
+
+def make_value_sets():
+    """ """
+    return [
+        value_set("all", {"include": [{"system": SYSTEM}]}),
+        value_set(
+            "bp",
+            {"include": [{"system": SYSTEM, "filter": [is_a("BP")]}]},
+        ),
+        value_set(
+            "vitals-no-bp",
+            {
+                "include": [
+                    {
+                        "system": SYSTEM,
+                        "filter": [
+                            {
+                                "property": "concept",
+                                "op": "descendent-of",
+                                "value": "vital",
+                            }
+                        ],
+                    }
+                ],
+                "exclude": [{"system": SYSTEM, "filter": [is_a("bp")]}],
+            },
+        ),
+        value_set(
+            "import",
+            {
+                "include": [
+                    {"valueSet": [BASE + "vitals-no-bp"]},
+                    {
+                        "system": LOINC,
+                        "concept": [{"code": "8867-4", "display": "Heart rate"}],
+                    },
+                ]
+            },
+        ),
+        value_set(
+            "chem",
+            {
+                "include": [
+                    {
+                        "system": SYSTEM,
+                        "filter": [{"property": "group", "op": "=", "value": "chem"}],
+                    }
+                ]
+            },
+        ),
+        value_set(
+            "regex",
+            {
+                "include": [
+                    {
+                        "system": SYSTEM,
+                        "filter": [{"property": "code", "op": "regex", "value": ".bp"}],
+                    }
+                ]
+            },
+        ),
+        value_set(
+            "intersection",
+            {"include": [{"valueSet": [BASE + "all", BASE + "bp"]}]},
+        ),
+        value_set("active", {"inactive": False, "include": [{"system": SYSTEM}]}),
+        value_set(
+            "expanded",
+            expansion={
+                "identifier": "urn:uuid:4ab8b8f2-8a4b-4c07-9b71-0a9f0e0e2b2c",
+                "timestamp": "2024-01-01T00:00:00Z",
+                "contains": [
+                    {
+                        "system": LOINC,
+                        "code": "85353-1",
+                        "contains": [{"system": LOINC, "code": "8867-4"}],
+                    }
+                ],
+            },
+        ),
+        value_set("loop", {"include": [{"valueSet": [BASE + "loop"]}]}),
+        value_set("unknown", {"include": [{"system": "http://example.org/other"}]}),
+    ]
+
+
+def is_a(code):
+    """ """
+    return {"property": "concept", "op": "is-a", "value": code}
+
+
+@pytest.mark.parametrize("release", ["R5", "R4B", "STU3"])
+def test_value_set_expander(release):
+    """ """
+    code_system = get_fhir_model_class("CodeSystem", release).model_validate(
+        make_code_system()
+    )
+    value_set_klass = get_fhir_model_class("ValueSet", release)
+    expander = ValueSetExpander(
+        [code_system],
+        [value_set_klass.model_validate(vs) for vs in make_value_sets()],
+        fhir_release=release,
+        cache_size=4,
+    )
+
+    def codes(name):
+        return [item["code"] for item in expander.get_expansion(BASE + name).contains]
+
+    assert codes("all") == [
+        "vital",
+        "bp",
+        "sbp",
+        "dbp",
+        "hr",
+        "temp",
+        "lab",
+        "glucose",
+        "na",
+    ]
+    assert codes("bp") == ["bp", "sbp", "dbp"]
+    assert codes("vitals-no-bp") == ["hr", "temp"]
+    assert codes("import") == ["hr", "temp", "8867-4"]
+    assert codes("chem") == ["glucose", "na"]
+    assert codes("regex") == ["sbp", "dbp"]
+    assert codes("intersection") == ["bp", "sbp", "dbp"]
+    assert codes("active") == [
+        "vital",
+        "bp",
+        "sbp",
+        "dbp",
+        "hr",
+        "lab",
+        "glucose",
+        "na",
+    ]
+    assert codes("expanded") == ["85353-1", "8867-4"]
+    with pytest.raises(ValueError, match="imports itself"):
+        expander.get_expansion(BASE + "loop")
+    with pytest.raises(ValueError, match="unknown CodeSystem"):
+        expander.get_expansion(BASE + "unknown")
+    with pytest.raises(ValueError, match="Unknown ValueSet"):
+        expander.get_expansion(BASE + "missing")
+
+    expansion = expander.expand(BASE + "import")
+    assert expansion.__class__ is get_fhir_model_class("ValueSetExpansion", release)
+    assert expansion.total == 3
+    assert [(c.system, c.code, c.display) for c in expansion.contains] == [
+        (SYSTEM, "hr", "HR"),
+        (SYSTEM, "temp", "TEMP"),
+        (LOINC, "8867-4", "Heart rate"),
+    ]
+    assert expansion.contains[0].version == "1"
+    assert expansion.contains[1].inactive is True
+    assert expander.expand(BASE + "all").contains[0].abstract is True
+    # cached, keyed by url and version
+    assert expander.expand(BASE + "import|") is expansion
+    assert expander.get_expansion(BASE + "bp") is expander.get_expansion(BASE + "bp")
+
+    assert expander.validate_code(BASE + "bp", "sbp", SYSTEM) is True
+    assert expander.validate_code(BASE + "bp", "sbp") is True
+    assert expander.validate_code(BASE + "bp", "sbp", LOINC) is False
+    assert expander.validate_code(BASE + "bp", "hr") is False
+
+    # a new definition clears the cache
+    expander.add_value_set(
+        value_set_klass.model_validate(
+            value_set("bp", {"include": [{"system": SYSTEM, "filter": [is_a("hr")]}]})
+        )
+    )
+    assert codes("bp") == ["hr"]
+
+
+def test_code_system_index():
+    """ """
+    code_system = get_fhir_model_class("CodeSystem").model_validate(make_code_system())
+    index = CodeSystemIndex(code_system)
+    assert len(index) == 9
+    assert "BP" in index and index.lookup("BP") == "bp"
+    assert index.is_a("sbp", "vital") and index.is_a("bp", "bp")
+    assert not index.is_a("vital", "sbp")
+    assert index.ancestors("sbp") == {"bp", "vital"}
+    assert index.descendants("vital") == {"bp", "sbp", "dbp", "hr", "temp"}
+    assert index.parents("sbp") == ["bp"]
+    assert index.children("bp") == ["sbp", "dbp"]
+    assert index.filter("concept", "generalizes", "dbp") == {"dbp", "bp", "vital"}
+    assert index.filter("concept", "child-of", "vital") == {"bp", "hr", "temp"}
+    assert index.filter("concept", "descendent-leaf", "vital") == {
+        "sbp",
+        "dbp",
+        "hr",
+        "temp",
+    }
+    assert index.filter("concept", "is-not-a", "vital") == {"lab", "glucose", "na"}
+    assert index.filter("code", "in", "hr, na, x") == {"hr", "na"}
+    assert index.filter("group", "exists", "true") == {"glucose", "na"}
+    assert index.filter("parent", "=", "lab") == {"glucose", "na"}
+    with pytest.raises(ValueError, match="Unsupported"):
+        index.filter("concept", "unknown-op", "x")
+
+
+def test_code_system_subsumption():
+    """ """
+    # nesting, ``parent`` properties and a custom child property together:
+    # a -> b -> d, a -> c -> d (d has two parents), c -> e, f -> e, g alone
+    data = {
+        "resourceType": "CodeSystem",
+        "url": SYSTEM,
+        "status": "active",
+        "content": "complete",
+        "property": [
+            {
+                "code": "subtype",
+                "uri": "http://hl7.org/fhir/concept-properties#child",
+                "type": "code",
+            }
+        ],
+        "concept": [
+            concept("a", concept("b", concept("d")), concept("c", subtype="e")),
+            concept("e", parent="f"),
+            concept("f"),
+            concept("g"),
+        ],
+    }
+    data["concept"][0]["concept"][1]["property"].append(
+        {"code": "subtype", "valueCode": "d"}
+    )
+    index = CodeSystemIndex(get_fhir_model_class("CodeSystem").model_validate(data))
+    assert index.parents("d") == ["b", "c"]
+    assert index.parents("e") == ["c", "f"]
+    assert index.children("c") == ["e", "d"]
+    assert index.descendants("a") == {"b", "c", "d", "e"}
+    assert index.descendants("c") == {"d", "e"}
+    assert index.descendants("f") == {"e"}
+    assert sorted(index.iter_descendants("c")) == ["d", "e"]
+    assert list(index.iter_descendants("b")) == ["d"]
+    assert list(index.iter_descendants("unknown")) == []
+    assert index.ancestors("e") == {"a", "c", "f"}
+    assert index.is_a("d", "c") and index.is_a("e", "f") and index.is_a("e", "a")
+    assert not index.is_a("e", "b") and not index.is_a("g", "a")
+    assert not index.is_a("a", "unknown")
+    assert index.subsumes("a", "d") == "subsumes"
+    assert index.subsumes("e", "c") == "subsumed-by"
+    assert index.subsumes("b", "b") == "equivalent"
+    assert index.subsumes("b", "c") == "not-subsumed"
+    with pytest.raises(ValueError):
+        index.subsumes("a", "unknown")
+    assert index.filter("concept", "is-a", "c") == {"c", "d", "e"}
+    assert index.filter("concept", "descendent-leaf", "a") == {"d", "e"}
+
+    # a cycle through properties: every code of it subsumes the others
+    data["concept"].append(concept("x", concept("y"), parent="y"))
+    index = CodeSystemIndex(get_fhir_model_class("CodeSystem").model_validate(data))
+    assert index.is_a("x", "y") and index.is_a("y", "x")
+
+
+def test_code_system_intervals():
+    """The interval numbering against a plain walk, on a random DAG."""
+    rng = random.Random(7)
+    codes = [f"c{number}" for number in range(300)]
+    concepts = []
+    for number, code in enumerate(codes):
+        parents = (
+            {codes[rng.randrange(number)] for _ in range(rng.choice((0, 1, 1, 2, 3)))}
+            if number
+            else set()
+        )
+        concepts.append(
+            {
+                "code": code,
+                "property": [
+                    {"code": "parent", "valueCode": p} for p in sorted(parents)
+                ]
+                or None,
+            }
+        )
+    index = CodeSystemIndex(
+        get_fhir_model_class("CodeSystem").model_validate(
+            {
+                "resourceType": "CodeSystem",
+                "url": SYSTEM,
+                "status": "active",
+                "content": "complete",
+                "concept": [
+                    {key: value for key, value in item.items() if value is not None}
+                    for item in concepts
+                ],
+            }
+        )
+    )
+    for code in codes:
+        expected = set()
+        stack = list(index.children(code))
+        while stack:
+            child = stack.pop()
+            if child not in expected:
+                expected.add(child)
+                stack.extend(index.children(child))
+        assert index.descendants(code) == expected
+        assert sorted(index.iter_descendants(code)) == sorted(expected)
+        for other in codes:
+            assert index.is_a(other, code) is (other == code or other in expected)
+
+
+def test_code_system_cycles():
+    """Codes on a cycle of ``parent`` properties subsume each other, and the
+    numbering still matches a plain walk on a random graph with cycles."""
+
+    def make_index(parents_of):
+        return CodeSystemIndex(
+            get_fhir_model_class("CodeSystem").model_validate(
+                {
+                    "resourceType": "CodeSystem",
+                    "url": SYSTEM,
+                    "status": "active",
+                    "content": "complete",
+                    "concept": [
+                        {
+                            "code": code,
+                            **(
+                                {
+                                    "property": [
+                                        {"code": "parent", "valueCode": p}
+                                        for p in parents
+                                    ]
+                                }
+                                if parents
+                                else {}
+                            ),
+                        }
+                        for code, parents in parents_of.items()
+                    ],
+                }
+            )
+        )
+
+    # a <-> b <-> c
+    index = make_index({"a": ["b"], "b": ["a", "c"], "c": ["b"]})
+    assert index.descendants("a") == {"b", "c"}
+    assert index.descendants("b") == {"a", "c"}
+    assert index.descendants("c") == {"a", "b"}
+    assert sorted(index.iter_descendants("c")) == ["a", "b"]
+    assert index.ancestors("a") == {"b", "c"}
+    for code_a in "abc":
+        for code_b in "abc":
+            assert index.is_a(code_a, code_b)
+    assert index.subsumes("c", "a") == "subsumes"
+    assert index.subsumes("a", "c") == "subsumes"
+
+    rng = random.Random(11)
+    codes = [f"c{number}" for number in range(200)]
+    parents_of = {
+        code: sorted({rng.choice(codes) for _ in range(rng.choice((0, 1, 1, 2)))})
+        for code in codes
+    }
+    index = make_index(parents_of)
+    for code in codes:
+        expected = set()
+        stack = list(index.children(code))
+        while stack:
+            child = stack.pop()
+            if child not in expected:
+                expected.add(child)
+                stack.extend(index.children(child))
+        expected.discard(code)
+        assert index.descendants(code) == expected
+        assert sorted(index.iter_descendants(code)) == sorted(expected)
+        assert all(index.is_a(child, code) for child in expected)
@@ -0,0 +1,110 @@
+import pytest
+
+from fhir.resources.bundle import Bundle
+from fhir.resources.R4B.bundle import Bundle as R4BBundle
+from fhir.resources.STU3.bundle import Bundle as STU3Bundle
+from fhir.resources.utils.references import iter_references
+from fhir.resources.utils.transaction import TransactionGraph
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def entry(number, resource):
+    """ """
+    return {
+        "fullUrl": f"urn:uuid:00000000-0000-0000-0000-{number:012d}",
+        "resource": resource,
+        "request": {"method": "POST", "url": resource["resourceType"]},
+    }
+
+
+def uuid_ref(number):
+    """ """
+    return {"reference": f"urn:uuid:00000000-0000-0000-0000-{number:012d}"}
+
+
+def make_transaction():
+    """Observation (0) -> Patient (1) -> Organization (2) <-> Organization (3)"""
+    return {
+        "resourceType": "Bundle",
+        "type": "transaction",
+        "entry": [
+            entry(
+                0,
+                {
+                    "resourceType": "Observation",
+                    "status": "final",
+                    "code": {"text": "x"},
+                    "subject": uuid_ref(1),
+                    "performer": [uuid_ref(1), {"reference": "#p"}],
+                    "contained": [
+                        {
+                            "resourceType": "Practitioner",
+                            "id": "p",
+                            "extension": [
+                                {
+                                    "url": "http://example.org",
+                                    "valueReference": uuid_ref(2),
+                                }
+                            ],
+                        }
+                    ],
+                },
+            ),
+            entry(1, {"resourceType": "Patient", "managingOrganization": uuid_ref(2)}),
+            entry(2, {"resourceType": "Organization", "partOf": uuid_ref(3)}),
+            entry(3, {"resourceType": "Organization", "partOf": uuid_ref(2)}),
+        ],
+    }
+
+
+@pytest.mark.parametrize("bundle_klass", [Bundle, R4BBundle, STU3Bundle])
+def test_transaction_graph(bundle_klass):
+    """ """
+    bundle = bundle_klass.model_validate(make_transaction())
+    graph = TransactionGraph(bundle)
+    assert graph.dependencies == [[1, 2], [2], [3], [2]]
+    assert graph.strongly_connected_components() == [[2, 3], [1], [0]]
+    assert graph.cycles() == [[2, 3]]
+    with pytest.raises(ValueError, match="cycle"):
+        graph.topological_order()
+
+    # no more cycle
+    bundle.entry[3].resource.partOf = None
+    graph = TransactionGraph(bundle)
+    assert graph.topological_order() == [3, 2, 1, 0]
+
+    assigned = {
+        bundle.entry[1].fullUrl: "Patient/101",
+        bundle.entry[2].fullUrl: "Organization/102",
+    }
+    assert graph.rewrite_references(assigned) == 4
+    observation = bundle.entry[0].resource
+    references = iter_references(observation, extensions=True)
+    assert [ref.reference for ref in references] == [
+        "Patient/101",
+        "#p",
+        "Patient/101",
+        "Organization/102",
+    ]
+    assert bundle.entry[1].resource.managingOrganization.reference == (
+        "Organization/102"
+    )
+    assert graph.rewrite_references(assigned) == 0
+
+
+def test_transaction_graph_long_chain():
+    """No recursion, whatever the length of a reference chain."""
+    count = 5000
+    entries = [entry(0, {"resourceType": "Organization"})]
+    for number in range(1, count):
+        entries.append(
+            entry(
+                number, {"resourceType": "Organization", "partOf": uuid_ref(number - 1)}
+            )
+        )
+    bundle = Bundle.model_validate(
+        {"resourceType": "Bundle", "type": "transaction", "entry": entries}
+    )
+    graph = TransactionGraph(bundle)
+    assert graph.topological_order() == list(range(count))
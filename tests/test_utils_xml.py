@@ -0,0 +1,210 @@
+import io
+
+import lxml.etree
+import pytest
+
+from fhir.resources.R4B.bundle import Bundle as R4BBundle
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+from fhir.resources.STU3.bundle import Bundle
+from fhir.resources.utils.xml import (
+    XMLBundleReader,
+    xml_dump,
+    xml_dumps,
+    xml_load,
+    xml_loads,
+)
+
+from .fixtures import FHIR_XSD_DIR, STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def xml_parser(name):
+    """Parser validating against one of the R4 schemas."""
+    schema = lxml.etree.XMLSchema(file=str(FHIR_XSD_DIR / f"{name}.xsd"))
+    return lxml.etree.XMLParser(schema=schema)
+
+
+@pytest.mark.parametrize(
+    "klass,file_name",
+    [(Patient, "Patient-with-ext.json"), (Observation, "Observation.json")],
+)
+def test_xml_round_trip(klass, file_name):
+    """ """
+    model = klass.model_validate_json((STATIC_PATH / file_name).read_bytes())
+    data = model.model_dump_xml(pretty_print=True)
+    assert data.startswith(b"<?xml version='1.0' encoding='utf-8'?>\n<")
+    # XSD valid, read back the same
+    resource_type = klass.get_resource_type().lower()
+    lxml.etree.fromstring(data, parser=xml_parser(resource_type))
+    fp = io.BytesIO()
+    xml_dump(model, fp, pretty_print=True)
+    assert fp.getvalue() == data
+
+    again = klass.model_validate_xml(data)
+    assert klass.model_validate_xml(xml_dumps(model)) == again
+    # lxml writes ``"`` in the narratives unescaped
+    for resource in (model, again, *(model.contained or ()), *(again.contained or ())):
+        if "text" in type(resource).model_fields:
+            resource.text = None
+    assert again == model
+
+
+def test_xml_primitive_extensions_and_comments():
+    """ """
+    patient = Patient.model_validate_json(
+        (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    )
+    data = xml_dumps(patient, pretty_print=True).decode()
+    assert '  <!--This is comment for Gender-->\n  <gender value="male"/>' in data
+    assert '<family value="du Marché">\n' in data
+    # ``given`` extension only on the second of three
+    assert '<given value="Denise">\n' in data
+    assert '<given value="Marie"/>' in data
+    assert "<extension url=" in data
+    assert "comment" not in xml_dumps(patient, exclude_comments=True).decode()
+
+    name = xml_loads(data, Patient).contact[0].name
+    assert name.given == ["Bénédicte", "Denise", "Marie"]
+    assert name.given__ext[0] is None and name.given__ext[2] is None
+    assert name.given__ext[1].extension[0].valueCode == "MID"
+
+    # the same elements as the JSON summary
+    summary = xml_loads(xml_dumps(patient, summary_only=True), Patient)
+    assert summary == Patient.model_validate_json(
+        patient.model_dump_json(summary_only=True)
+    )
+
+
+def test_xml_narrative_decimals_and_ids():
+    """What differs from the writer before: the narrative ``div`` as given,
+    decimals written exactly, primitive extension ids kept."""
+    patient = Patient.model_validate(
+        {
+            "resourceType": "Patient",
+            "text": {
+                "status": "generated",
+                "div": '<div xmlns="http://www.w3.org/1999/xhtml">'
+                "<p>Hi <b>there</b></p></div>",
+            },
+            "birthDate": "2000-01-01",
+            "_birthDate": {
+                "id": "b",
+                "extension": [{"url": "http://example.org/e", "valueString": "v"}],
+            },
+        }
+    )
+    data = xml_dumps(patient, pretty_print=True).decode()
+    assert (
+        "  <text>\n"
+        '    <status value="generated"/>\n'
+        '    <div xmlns="http://www.w3.org/1999/xhtml"><p>Hi <b>there</b></p></div>\n'
+        "  </text>\n"
+    ) in data
+    assert '<birthDate id="b" value="2000-01-01">\n' in data
+    assert xml_loads(data, Patient).birthDate__ext.id == "b"
+
+    values = [
+        Observation.model_validate_json(
+            '{"resourceType": "Observation", "status": "final", '
+            '"code": {"text": "t"}, "valueQuantity": {"value": %s}}' % value
+        )
+        for value in ("100", "5.0", "1e-07", "0.1")
+    ]
+    assert [
+        xml_dumps(observation).decode().split("<valueQuantity>")[1].split("/>")[0]
+        for observation in values
+    ] == [
+        '<value value="100"',
+        '<value value="5.0"',
+        '<value value="0.0000001"',
+        '<value value="0.1"',
+    ]
+
+
+def test_xml_read_file():
+    """ """
+    expected = Patient.model_validate_json(
+        (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    )
+    path = STATIC_PATH / "Patient-with-ext.xml"
+    patient = Patient.model_validate_xml(
+        path.read_bytes(), xmlparser=xml_parser("patient")
+    )
+    assert patient.gender__ext.fhir_comments == "This is comment for Gender"
+    assert patient.address[0].fhir_comments == "This is comment for Address.No 1"
+    assert xml_load(path, Patient) == patient
+    # the narratives differ in their escaping only
+    for model in (patient, expected):
+        model.text = model.contained[1].text = None
+    assert patient == expected
+
+    schema = lxml.etree.XMLSchema(file=str(FHIR_XSD_DIR / "patient.xsd"))
+    with path.open("rb") as fp:
+        assert xml_load(fp, schema=schema, fhir_release="R4B").text is not None
+
+
+def test_xml_resource_class_from_root():
+    """ """
+    data = (STATIC_PATH / "STU3-Bundle-Issue-144.xml").read_bytes()
+    bundle = xml_loads(data, fhir_release="STU3")
+    assert isinstance(bundle, Bundle)
+    assert [entry.resource.get_resource_type() for entry in bundle.entry] == [
+        "MessageHeader",
+        "Practitioner",
+        "OperationOutcome",
+    ]
+    assert xml_loads(data, Bundle) == bundle
+    assert Bundle.model_validate_xml(bundle.model_dump_xml()) == bundle
+
+    with pytest.raises(ValueError):
+        xml_loads(data, Patient)
+    with pytest.raises(ValueError):
+        xml_loads(
+            '<Patient xmlns="http://hl7.org/fhir"><colour value="red"/></Patient>',
+            Patient,
+        )
+
+
+def test_xml_bundle_reader():
+    """ """
+    path = STATIC_PATH / "STU3-Bundle-Issue-144.xml"
+    expected = xml_load(path, fhir_release="STU3")
+    with XMLBundleReader(path, fhir_release="STU3") as reader:
+        assert reader.bundle.type == "message"
+        assert reader.bundle.entry is None
+        assert list(reader) == expected.entry
+        with pytest.raises(RuntimeError):
+            list(reader)
+    assert reader.bundle == expected.model_copy(update={"entry": None})
+
+    with path.open("rb") as fp:
+        resources = list(XMLBundleReader(fp, fhir_release="STU3").iter_resources())
+    assert [resource.id for resource in resources] == [
+        entry.resource.id for entry in expected.entry
+    ]
+
+    # the schemas are R4: the STU3 ``MessageHeader.event`` is not valid
+    reader = XMLBundleReader(path, fhir_release="STU3", xsd_dir=FHIR_XSD_DIR)
+    with pytest.raises(ValueError, match=r"entry\[0\]\.resource \(MessageHeader\)"):
+        next(iter(reader))
+    with pytest.raises(ValueError):
+        XMLBundleReader(STATIC_PATH / "Patient-with-ext.xml").bundle
+
+
+def test_xml_bundle_reader_xsd():
+    """ """
+    patient = Patient.model_validate_json(
+        (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    )
+    observation = Observation.model_validate_json(
+        (STATIC_PATH / "Observation.json").read_bytes()
+    )
+    entries = [{"resource": resource} for resource in (patient, observation) * 3]
+    bundle = R4BBundle(type="collection", entry=entries)
+    fp = io.BytesIO(xml_dumps(bundle))
+    with XMLBundleReader(fp, fhir_release="R4B", xsd_dir=FHIR_XSD_DIR) as reader:
+        resources = list(reader.iter_resources())
+        assert reader.bundle.type == "collection"
+    assert [resource.id for resource in resources] == [patient.id, observation.id] * 3
@@ -0,0 +1,84 @@
+import io
+
+import pytest
+from fhir_core.yaml_utils import yaml_dumps as core_yaml_dumps
+
+from fhir.resources.R4B.binary import Binary
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+from fhir.resources.R4B.practitionerrole import PractitionerRole
+from fhir.resources.utils.yaml import (
+    yaml_dump_all,
+    yaml_dumps,
+    yaml_load_all,
+    yaml_loads,
+)
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+@pytest.mark.parametrize(
+    "klass,file_name",
+    [(Patient, "Patient-with-ext.json"), (Observation, "Observation.json")],
+)
+def test_yaml_round_trip(klass, file_name):
+    """ """
+    model = klass.model_validate_json((STATIC_PATH / file_name).read_bytes())
+    data = model.model_dump_yaml(indent=2)
+    # the same document as before, with the safe dumper
+    assert data == core_yaml_dumps(
+        model.model_dump(), indent=2, sort_keys=False, return_bytes=False
+    )
+    assert klass.model_validate_yaml(data) == model
+    assert klass.model_validate_yaml(data.encode()) == model
+    assert yaml_loads(data, fhir_release="R4B") == model
+
+    binary = Binary(contentType="text/plain", data=b"aGVsbG8=")
+    assert yaml_loads(yaml_dumps(binary), Binary) == binary
+    role = PractitionerRole.model_validate(
+        {
+            "resourceType": "PractitionerRole",
+            "availableTime": [{"availableStartTime": "09:00:00"}],
+        }
+    )
+    assert "availableStartTime: 09:00:00" in role.model_dump_yaml()
+    assert PractitionerRole.model_validate_yaml(role.model_dump_yaml()) == role
+
+
+def test_yaml_safe_loader():
+    """ """
+    with pytest.raises(ValueError, match="YAMLError"):
+        Patient.model_validate_yaml(
+            "resourceType: Patient\nid: !!python/object/apply:os.getcwd []\n"
+        )
+    with pytest.raises(ValueError):
+        yaml_loads("id: example\n")
+
+
+def test_yaml_multi_document(tmp_path):
+    """ """
+    patient = Patient.model_validate_json(
+        (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    )
+    observation = Observation.model_validate_json(
+        (STATIC_PATH / "Observation.json").read_bytes()
+    )
+    resources = [patient, observation, patient]
+    data = yaml_dump_all(iter(resources))
+    assert data.count("---\n") == 3
+
+    path = tmp_path / "fixtures.yaml"
+    with path.open("w") as fp:
+        yaml_dump_all(resources, fp, indent=2)
+        # an empty document is skipped
+        fp.write("---\n")
+    assert list(yaml_load_all(path, fhir_release="R4B")) == resources
+    assert list(yaml_load_all(io.StringIO(data), fhir_release="R4B")) == resources
+    assert next(yaml_load_all(io.BytesIO(data.encode()), Patient)) == patient
+
+    with pytest.raises(ValueError):
+        list(yaml_load_all(io.StringIO(data), Patient))
+    with pytest.raises(ValueError, match="YAMLError"):
+        list(yaml_load_all(io.StringIO(data + "---\n: [\n")))